@@ -8,7 +8,9 @@ CALCULATOR_TEMPLATE_PATH = TEMPLATE_PATH.joinpath('calculator')
 
 import os
 import json
+import threading
 from io import StringIO
+from collections import OrderedDict
 
 from flask import send_file, Response, request, jsonify, render_template_string
 from swixknife.localization import sezimal_locale
@@ -72,9 +74,43 @@ def api_calculator_style() -> Response:
     return send_file('static/css/calculator.css', mimetype='text/css', as_attachment=False)
 
 
+#
+# Each calculator page sends its own session id, and keeps
+# its own SezimalCalculator here, so each key pressed only prepares
+# the end of the expression that changed
+#
+_CALCULATOR_SESSIONS = OrderedDict()
+_CALCULATOR_SESSIONS_LOCK = threading.Lock()
+_CALCULATOR_SESSIONS_MAX = 1_296
+
+
+def _calculator_session(session: str) -> tuple[SezimalCalculator, threading.Lock]:
+    if not session:
+        return SezimalCalculator(), threading.Lock()
+
+    with _CALCULATOR_SESSIONS_LOCK:
+        if session in _CALCULATOR_SESSIONS:
+            _CALCULATOR_SESSIONS.move_to_end(session)
+            return _CALCULATOR_SESSIONS[session]
+
+        _CALCULATOR_SESSIONS[session] = SezimalCalculator(), threading.Lock()
+
+        if len(_CALCULATOR_SESSIONS) > _CALCULATOR_SESSIONS_MAX:
+            _CALCULATOR_SESSIONS.popitem(last=False)
+
+        return _CALCULATOR_SESSIONS[session]
+
+
 @app.route('/calculator/process', methods=['POST'])
 def api_calculator_process() -> dict:
     dados = json.loads(request.data.decode('utf-8'))
+    calculator, lock = _calculator_session(dados.get('session'))
+
+    with lock:
+        return _calculator_process(calculator, dados)
+
+
+def _calculator_process(calculator: SezimalCalculator, dados: dict) -> dict:
     dados['base'] = int(dados['base'])
     dados['places'] = int(dados['places'])
     dados['grouping'] = int(dados['grouping'])
@@ -83,7 +119,6 @@ def api_calculator_process() -> dict:
     dados['spellout'] = dados['spellout'] == 'true'
     dados['currency_mode'] = dados['currency_mode'] == 'true'
 
-    calculator = SezimalCalculator()
     calculator.locale = dados['locale']
     calculator.grouping_digits = dados['grouping']
     calculator.currency_mode = dados['currency_mode']
@@ -111,6 +146,12 @@ def api_calculator_process() -> dict:
 
     # calculator.debug = True
 
+    #
+    # As a new calculator would be, for the keys that
+    # don’t change the expression below
+    #
+    calculator.expression = '0'
+
     if not dados['value']:
         calculator.expression = dados['expression']
     elif dados['value'] == '=':
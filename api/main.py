@@ -1,4 +1,5 @@
 
+import os
 import pathlib
 
 TEMPLATE_PATH = pathlib.Path(__file__).parent.resolve().joinpath('template')
@@ -70,6 +71,17 @@ from digits import *
 from today import *
 from shastadari import *
 
+#
+# The calendar events stored beforehand, by store_calendar_events.py,
+# which itself doesn’t need them
+#
+if os.environ.get('SEZIMAL_PRELOAD_CALENDAR_EVENTS', '1') != '0':
+    preload_calendar_events()
+
+if os.environ.get('SEZIMAL_PRELOAD_SPELLOUT_PROGRAMS', '1') != '0':
+    from swixknife.text import preload_spellout_programs
+    preload_spellout_programs()
+
 from  locale_detection import browser_preferred_locale
 
 
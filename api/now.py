@@ -85,7 +85,7 @@ def api_short_now(locale: str = None, time_zone: str = None) -> str:
 
         url = _manifest_url('now', locale, time_zone)
         print('pegou', cookie)
-        locale = sezimal_locale(locale)
+        locale = sezimal_locale(locale).copy()
         locale.DEFAULT_TIME_ZONE = time_zone
         locale.HOUR_FORMAT = hour_format
         locale.DEFAULT_HEMISPHERE = hemisphere
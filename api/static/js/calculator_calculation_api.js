@@ -1,6 +1,12 @@
 
 const per_symbols = ['%', '‰', '‱', '󱹰', '󱹱', '󱹲', '󱹳', '󱹴', '󱹵'];
 
+//
+// The server keeps the calculator of each page,
+// so it only has to prepare what changed in the expression
+//
+const calculator_session = (window.crypto && crypto.randomUUID) ? crypto.randomUUID() : Date.now().toString(36) + Math.random().toString(36).slice(2);
+
 function button_click(button) {
     update_calculation(button.value);
 };
@@ -53,6 +59,7 @@ function update_calculation(value = '') {
         niftimal: localStorage.getItem('sezimal-calculator-niftimal'),
         expression: document.getElementById('expression').innerHTML,
         value: value,
+        session: calculator_session,
     };
 
     if (localStorage.getItem('sezimal-calculator-base') == 14) {
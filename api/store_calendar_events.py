@@ -0,0 +1,31 @@
+#!/usr/bin/python3
+
+import argparse
+import os
+
+parser = argparse.ArgumentParser(description='Stores the calendar events of a span of years, for the server to load when it starts')
+parser.add_argument('-l', '--locale', dest='itens', nargs='+', help='Locales and time zones, as locale|time zone, e.g. pt-BR|America/Sao_Paulo')
+parser.add_argument('-y', '--years', dest='year_range', nargs=2, help='First and last + 1 sezimal years, e.g. 213_212 213_221')
+parser.add_argument('-b', '--base', dest='bases', nargs='+', type=int, help='Bases, among 10, 14 and 20')
+parser.add_argument('-p', '--processes', dest='processes', type=int, help='Number of processes; all the CPUs by default')
+
+
+if __name__ == '__main__':
+    arguments = parser.parse_args()
+
+    #
+    # main has to be imported first, as the server does,
+    # since today imports the app from it
+    #
+    os.environ['SEZIMAL_PRELOAD_CALENDAR_EVENTS'] = '0'
+
+    import main
+    from today import _create_store_events
+    from swixknife import SezimalInteger
+
+    if arguments.year_range:
+        year_range = [SezimalInteger(year) for year in arguments.year_range]
+    else:
+        year_range = None
+
+    _create_store_events(arguments.itens, year_range, arguments.bases, arguments.processes)
@@ -1,10 +1,11 @@
 
 import json
-import pathlib
 import urllib
 import uuid
 import threading
 
+from concurrent.futures import ProcessPoolExecutor
+
 from flask import redirect, Response, request, render_template, jsonify
 from main import app, sitemapper, sezimal_render_template
 from  locale_detection import browser_preferred_locale
@@ -16,6 +17,7 @@ from swixknife.date_time.seasons_colors import weekly_season_colors
 from swixknife.date_time.sun_moon import list_sun_moon
 from swixknife.functions import SezimalList, SezimalDictionary, SezimalRange
 from swixknife.date_time.calendar import other_calendar_date_to_ordinal_date
+from swixknife.date_time.calendar_cache import CalendarCache
 from swixknife.weather import SezimalWeather
 from swixknife.units import sezimal_to_decimal_unit
 
@@ -628,33 +630,18 @@ class SezimalEvent:
         return ''
 
 
-def _write_calendar_cache(locale: str, cache_key: str, events: SezimalDictionary) -> None:
-    file_path = pathlib.Path.home().joinpath(f'.sezimal/{locale}/')
-    file_path.mkdir(parents=True, exist_ok=True)
-    file_path = file_path.joinpath(f"{cache_key.replace('|', '_').replace('/', '_')}.json")
-
-    text = str(events)
+CALENDAR_CACHE = CalendarCache(event_class=SezimalEvent)
 
-    for i in range(0, 62):
-        text = text.replace(f" == Decimal('{i}')", '')
 
-    open(file_path, 'w').write(text)
+def _write_calendar_cache(locale: str, cache_key: str, events: SezimalDictionary) -> None:
+    CALENDAR_CACHE.write(locale, cache_key, events)
 
 
 def _read_calendar_cache(locale: str, cache_key: str, only_check: bool = False) -> SezimalDictionary | None | bool:
-    file_path = pathlib.Path.home().joinpath(
-        f".sezimal/{locale}/{cache_key.replace('|', '_').replace('/', '_')}.json"
-    )
-
-    if not file_path.is_file():
-        return False
-
     if only_check:
-        return True
+        return CALENDAR_CACHE.exists(locale, cache_key)
 
-    text = open(file_path, 'r').read()
-
-    return eval(text)
+    return CALENDAR_CACHE.read(locale, cache_key) or False
 
 
 def _limit_holidays(events, show_holidays):
@@ -1006,11 +993,11 @@ def sezimal_calendar_route() -> Response:
 @sitemapper.include(lastmod='2025-02-19', changefreq='weekly', priority=0.8)
 @app.route('/en/shastadari/calendar')
 def sezimal_calendar_en_route() -> Response:
-    locale = sezimal_locale(browser_preferred_locale())
+    locale = sezimal_locale(browser_preferred_locale()).copy()
 
     if locale.LANG != 'en':
         hemisphere = locale.DEFAULT_HEMISPHERE
-        locale = sezimal_locale('en-gb')
+        locale = sezimal_locale('en-gb').copy()
         locale.DEFAULT_HEMISPHERE = hemisphere
 
     locale.calendar_displayed = 'SYM'
@@ -1042,11 +1029,11 @@ def sezimal_calendar_en_route() -> Response:
 @sitemapper.include(lastmod='2025-02-19', changefreq='weekly', priority=0.8)
 @app.route('/pt/xastadári/calendário')
 def sezimal_calendar_pt_route() -> Response:
-    locale = sezimal_locale(browser_preferred_locale())
+    locale = sezimal_locale(browser_preferred_locale()).copy()
 
     if locale.LANG != 'pt':
         hemisphere = locale.DEFAULT_HEMISPHERE
-        locale = sezimal_locale('pt-br')
+        locale = sezimal_locale('pt-br').copy()
         locale.DEFAULT_HEMISPHERE = hemisphere
 
     locale.calendar_displayed = 'SYM'
@@ -1078,11 +1065,11 @@ def sezimal_calendar_pt_route() -> Response:
 @sitemapper.include(lastmod='2025-02-19', changefreq='weekly', priority=0.8)
 @app.route('/bz/xastadari/kalendaryu')
 def sezimal_calendar_bz_route() -> Response:
-    locale = sezimal_locale(browser_preferred_locale())
+    locale = sezimal_locale(browser_preferred_locale()).copy()
 
     if locale.LANG != 'bz':
         hemisphere = locale.DEFAULT_HEMISPHERE
-        locale = sezimal_locale('bz-br')
+        locale = sezimal_locale('bz-br').copy()
         locale.DEFAULT_HEMISPHERE = hemisphere
 
     locale.calendar_displayed = 'SYM'
@@ -1570,6 +1557,7 @@ def _prepare_locale_from_cookie():
 
 
 def _prepare_locale(locale, dados):
+    locale = locale.copy()
     base = int(dados['base'])
     format_token = dados['format_token']
 
@@ -1758,7 +1746,7 @@ def now_icon(when: str = None, size: str = None) -> str:
     if 'sezimal' in request.cookies:
         locale = _prepare_locale_from_cookie()
     else:
-        locale = sezimal_locale(browser_preferred_locale())
+        locale = sezimal_locale(browser_preferred_locale()).copy()
         locale.base = 10
 
     text = open('static/img/now-icon.svg').read()
@@ -1775,7 +1763,7 @@ def now_manifest() -> str:
     if 'sezimal' in request.cookies:
         locale = _prepare_locale_from_cookie()
     else:
-        locale = sezimal_locale(browser_preferred_locale())
+        locale = sezimal_locale(browser_preferred_locale()).copy()
         locale.base = 10
 
     now = SezimalDateTime.now(time_zone=locale.DEFAULT_TIME_ZONE)
@@ -1794,7 +1782,7 @@ def now_service_js() -> Response:
     if 'sezimal' in request.cookies:
         locale = _prepare_locale_from_cookie()
     else:
-        locale = sezimal_locale(browser_preferred_locale())
+        locale = sezimal_locale(browser_preferred_locale()).copy()
         locale.base = 10
 
     now = SezimalDateTime.now(time_zone=locale.DEFAULT_TIME_ZONE)
@@ -1817,7 +1805,7 @@ def today_icon(when: str = None, size: str = None) -> str:
         locale = _prepare_locale_from_cookie()
         base = locale.base
     else:
-        locale = sezimal_locale(browser_preferred_locale())
+        locale = sezimal_locale(browser_preferred_locale()).copy()
         locale.base = 10
         base = 10
 
@@ -1872,7 +1860,7 @@ def today_manifest() -> str:
     if 'sezimal' in request.cookies:
         locale = _prepare_locale_from_cookie()
     else:
-        locale = sezimal_locale(browser_preferred_locale())
+        locale = sezimal_locale(browser_preferred_locale()).copy()
         locale.base = 10
 
     now = SezimalDateTime.now(time_zone=locale.DEFAULT_TIME_ZONE)
@@ -1891,7 +1879,7 @@ def today_service_js() -> Response:
     if 'sezimal' in request.cookies:
         locale = _prepare_locale_from_cookie()
     else:
-        locale = sezimal_locale(browser_preferred_locale())
+        locale = sezimal_locale(browser_preferred_locale()).copy()
         locale.base = 10
 
     now = SezimalDateTime.now(time_zone=locale.DEFAULT_TIME_ZONE)
@@ -2040,11 +2028,11 @@ def sezimal_day_count_calendar_route() -> Response:
 @sitemapper.include(lastmod='2025-02-19', changefreq='weekly', priority=0.8)
 @app.route('/en/shastadari/day-count-calendar')
 def sezimal_day_count_calendar_en_route() -> Response:
-    locale = sezimal_locale(browser_preferred_locale())
+    locale = sezimal_locale(browser_preferred_locale()).copy()
 
     if locale.LANG != 'en':
         hemisphere = locale.DEFAULT_HEMISPHERE
-        locale = sezimal_locale('en-gb')
+        locale = sezimal_locale('en-gb').copy()
         locale.DEFAULT_HEMISPHERE = hemisphere
 
     locale.calendar_displayed = 'DCC'
@@ -2075,11 +2063,11 @@ def sezimal_day_count_calendar_en_route() -> Response:
 @sitemapper.include(lastmod='2025-02-19', changefreq='weekly', priority=0.8)
 @app.route('/pt/xastadári/calendário-quantos-dias')
 def sezimal_day_count_calendar_pt_route() -> Response:
-    locale = sezimal_locale(browser_preferred_locale())
+    locale = sezimal_locale(browser_preferred_locale()).copy()
 
     if locale.LANG != 'pt':
         hemisphere = locale.DEFAULT_HEMISPHERE
-        locale = sezimal_locale('pt-br')
+        locale = sezimal_locale('pt-br').copy()
         locale.DEFAULT_HEMISPHERE = hemisphere
 
     locale.calendar_displayed = 'DCC'
@@ -2110,11 +2098,11 @@ def sezimal_day_count_calendar_pt_route() -> Response:
 @sitemapper.include(lastmod='2025-02-19', changefreq='weekly', priority=0.8)
 @app.route('/bz/xastadari/kalendaryu-kwantus-dias')
 def sezimal_day_count_calendar_bz_route() -> Response:
-    locale = sezimal_locale(browser_preferred_locale())
+    locale = sezimal_locale(browser_preferred_locale()).copy()
 
     if locale.LANG != 'bz':
         hemisphere = locale.DEFAULT_HEMISPHERE
-        locale = sezimal_locale('bz-br')
+        locale = sezimal_locale('bz-br').copy()
         locale.DEFAULT_HEMISPHERE = hemisphere
 
     locale.calendar_displayed = 'DCC'
@@ -2195,7 +2183,7 @@ def sezimal_day_count_calendar_bz_route() -> Response:
     )
 
 
-def _create_store_events(itens: list = None, year_range: list = None, bases: list = None):
+def _create_store_events(itens: list = None, year_range: list = None, bases: list = None, processes: int = None):
     if year_range is None:
         year_range = (213_212, 213_221)
 
@@ -2257,85 +2245,100 @@ def _create_store_events(itens: list = None, year_range: list = None, bases: lis
     if bases is None:
         bases = (10, 14, 20)
 
+    jobs = []
+
     for item in itens:
         loc, tz = item.split('|')
 
         #
         # DCC is only sezimal
         #
-        base = 10
-        locale = sezimal_locale(loc)
-        locale.base = base
-        locale.DEFAULT_TIME_ZONE = tz
-        locale.format_token = ''
-        locale.calendar_displayed = 'DCC'
-
         for year in SezimalRange(*year_range):
-            context = {
-                'base': locale.base,
-                'format_token': locale.format_token,
-            }
+            jobs.append((loc, tz, 'DCC', 10, '', '24h', '%H:%M:%S', str(year)))
 
-            locale.ISO_TIME_FORMAT = '%H:%M:%S'
-            locale.HOUR_FORMAT = '24h'
+        for calendar in ('SYM', 'ISO', 'DCC'):
+            for base in bases:
+                if base == 10:
+                    format_token = ''
+                    hour_formats = (('24h', None),)
 
-            print('vai fazer', item, year, base, 'DCC', locale.format_token)
-            _calendar_events(locale, year, context, only_check=True)
+                elif base == 14:
+                    format_token = '9'
+                    locale = sezimal_locale(loc).copy()
+                    locale.to_decimal_base()
 
+                    if locale.ISO_TIME_FORMAT[:2] == '%I':
+                        hour_formats = (('12h', None), ('24h', '%H:%M:%S'))
+                    else:
+                        hour_formats = ((None, None),)
 
-        for calendar in ('SYM', 'ISO', 'DCC'):
-            locale = sezimal_locale(loc)
-            locale.DEFAULT_TIME_ZONE = tz
-            locale.calendar_displayed = calendar
+                elif base == 20:
+                    format_token = '↋'
+                    hour_formats = (('24h', None),)
 
-            for base in bases:
-                locale.base = base
+                if calendar == 'DCC':
+                    format_token = 'c' + format_token
 
                 for year in SezimalRange(*year_range):
-                    if base == 10:
-                        locale.format_token = ''
-                        locale.HOUR_FORMAT = '24h'
+                    for hour_format, iso_time_format in hour_formats:
+                        jobs.append((loc, tz, calendar, base, format_token, hour_format, iso_time_format, str(year)))
 
-                    elif base == 14:
-                        locale = sezimal_locale(loc)
-                        locale.DEFAULT_TIME_ZONE = tz
-                        locale.calendar_displayed = calendar
-                        locale.base = base
-                        locale.format_token = '9'
-                        locale.to_decimal_base()
+    #
+    # Each year is independent of the others, so they’re spread
+    # over all the CPUs; the events are written to the calendar cache,
+    # to be read back by the server when it starts
+    #
+    if processes == 1:
+        for job in jobs:
+            _store_events_job(job)
 
-                        if locale.ISO_TIME_FORMAT[:2] == '%I':
-                            locale.HOUR_FORMAT = '12h'
+        return
 
-                    elif base == 20:
-                        locale.format_token = '↋'
-                        locale.to_dozenal_base()
-                        locale.HOUR_FORMAT = '24h'
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for _ in executor.map(_store_events_job, jobs, chunksize=4):
+            pass
 
-                    if calendar == 'DCC':
-                        locale.format_token = 'c' + locale.format_token
 
-                    context = {
-                        'base': locale.base,
-                        'format_token': locale.format_token,
-                    }
+def _store_events_job(job: tuple) -> None:
+    loc, tz, calendar, base, format_token, hour_format, iso_time_format, year = job
+
+    locale = sezimal_locale(loc).copy()
+    locale.DEFAULT_TIME_ZONE = tz
+    locale.calendar_displayed = calendar
+    locale.base = base
+    locale.format_token = format_token
+
+    if base == 14:
+        locale.to_decimal_base()
+    elif base == 20:
+        locale.to_dozenal_base()
 
-                    print('vai fazer', item, year, base, calendar, locale.format_token)
-                    if calendar == 'ISO':
-                        _calendar_events(locale, (year - 200_000).decimal, context, only_check=True)
+    if iso_time_format:
+        locale.ISO_TIME_FORMAT = iso_time_format
 
-                        if locale.ISO_TIME_FORMAT[:2] == '%I':
-                            locale.ISO_TIME_FORMAT = '%H:%M:%S'
-                            locale.HOUR_FORMAT = '24h'
-                            _calendar_events(locale, (year - 200_000).decimal, context, only_check=True)
+    if hour_format:
+        locale.HOUR_FORMAT = hour_format
 
-                    else:
-                        _calendar_events(locale, year, context, only_check=True)
+    context = {
+        'base': locale.base,
+        'format_token': locale.format_token,
+    }
+
+    year = SezimalInteger(year)
 
-                        if locale.ISO_TIME_FORMAT[:2] == '%I':
-                            locale.ISO_TIME_FORMAT = '%H:%M:%S'
-                            locale.HOUR_FORMAT = '24h'
-                            _calendar_events(locale, year, context, only_check=True)
+    if calendar == 'ISO':
+        _calendar_events(locale, (year - 200_000).decimal, context, only_check=True)
+    else:
+        _calendar_events(locale, year, context, only_check=True)
+
+
+def preload_calendar_events(locales: list = None) -> None:
+    #
+    # Fills EVENTS_CACHE with all the events already stored
+    # in the calendar cache, so no request has to build them
+    #
+    for cache_key, events in CALENDAR_CACHE.read_all(locales):
+        EVENTS_CACHE[cache_key] = events
 
 
 def _create_store_events_br():
@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+
+#
+# Micro-benchmark of the cost of creating a Sezimal
+# from the most common shapes of input
+#
+# python3 misc/benchmarks/sezimal_construction.py
+#
+
+import timeit
+
+from decimal import Decimal
+
+from swixknife import Sezimal, SezimalInteger
+from swixknife.base import validate_clean_sezimal, validate_clean_decimal
+
+
+INPUTS = (
+    ('int', 'Sezimal(12345)'),
+    ('str integer', "Sezimal('12345')"),
+    ('str fraction', "Sezimal('123.45')"),
+    ('str negative', "Sezimal('-0.012')"),
+    ('str grouped', "Sezimal('213_214.012_345')"),
+    ('SezimalInteger', "SezimalInteger('213214')"),
+    ('Sezimal', 'Sezimal(SEZIMAL)'),
+    ('Decimal', "Sezimal(Decimal('3.14'))"),
+    ('float', 'Sezimal(3.14)'),
+    ('exponent', "Sezimal('1.2e3')"),
+    ('recurring', "Sezimal('0.1..23')"),
+    ('constant', "Sezimal('π')"),
+    ('validate sezimal', "validate_clean_sezimal('123.45')"),
+    ('validate decimal', "validate_clean_decimal('123.45')"),
+)
+
+NAMESPACE = {
+    'Sezimal': Sezimal,
+    'SezimalInteger': SezimalInteger,
+    'Decimal': Decimal,
+    'SEZIMAL': Sezimal('123.45'),
+    'validate_clean_sezimal': validate_clean_sezimal,
+    'validate_clean_decimal': validate_clean_decimal,
+}
+
+
+if __name__ == '__main__':
+    for name, statement in INPUTS:
+        timer = timeit.Timer(statement, globals=NAMESPACE)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=5, number=number)) / number
+
+        print(f'{name:<20} {best * 1_000_000:8.2f} µs')
@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+
+#
+# Benchmark of creating and sorting lots of dates
+#
+# python3 misc/benchmarks/sezimal_date.py
+#
+
+import random
+import time
+
+from decimal import Decimal
+
+from swixknife import SezimalDate, SezimalInteger
+
+
+TOTAL_DATES = 100_000
+
+
+def _timed(name: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f'{name:<35} {time.perf_counter() - start:8.3f} s')
+    return result
+
+
+if __name__ == '__main__':
+    random.seed(1)
+
+    first_date = SezimalDate(213_000, 1, 1)
+    ordinal_dates = [
+        first_date.ordinal_date + SezimalInteger(Decimal(random.randrange(6 ** 6)))
+        for _ in range(TOTAL_DATES)
+    ]
+    year_month_days = [
+        (date.year, date.month, date.day)
+        for date in map(SezimalDate.from_ordinal_date, ordinal_dates[:1_000])
+    ] * (TOTAL_DATES // 1_000)
+
+    _timed('SezimalDate(year, month, day)', lambda: [SezimalDate(*ymd) for ymd in year_month_days])
+    dates = _timed('SezimalDate.from_ordinal_date', lambda: [SezimalDate.from_ordinal_date(od) for od in ordinal_dates])
+    _timed('sorted', lambda: sorted(dates))
+    _timed('set', lambda: set(dates))
+    _timed('next(days=1)', lambda: [date.next(days=1) for date in dates[:10_000]])
+    _timed('gregorian_date (first access)', lambda: [date.gregorian_date for date in dates])
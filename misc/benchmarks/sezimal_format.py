@@ -0,0 +1,33 @@
+#!/usr/bin/python3
+
+#
+# Benchmark of formatting dates and times with the locales’ formats
+#
+# python3 misc/benchmarks/sezimal_format.py
+#
+
+import time
+
+from swixknife import SezimalDateTime
+from swixknife.localization import sezimal_locale
+
+
+TOTAL_FORMATS = 1_000
+
+
+def _timed(name: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f'{name:<35} {time.perf_counter() - start:8.3f} s')
+    return result
+
+
+if __name__ == '__main__':
+    date_time = SezimalDateTime(213_214, 14, 33, 13, 45, 32, time_zone='UTC')
+
+    for lang in ('en', 'pt', 'fa'):
+        locale = sezimal_locale(lang)
+
+        _timed(f'{lang} date format', lambda: [date_time.date.format(locale.DATE_LONG_FORMAT, locale) for _ in range(TOTAL_FORMATS)])
+        _timed(f'{lang} time format', lambda: [date_time.time.format(locale.TIME_FORMAT, locale) for _ in range(TOTAL_FORMATS)])
+        _timed(f'{lang} date and time format', lambda: [date_time.format(locale.DATE_TIME_LONG_FORMAT, locale) for _ in range(TOTAL_FORMATS)])
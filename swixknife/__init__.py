@@ -26,3 +26,4 @@ from .date_time import *
 from .text import *
 from .calculator import *
 from .units import *
+from .sezimal_array import *
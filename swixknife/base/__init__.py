@@ -11,11 +11,14 @@ from .validation import (
     validate_clean_niftimal,
     validate_clean_dozenal,
 )
-from .context import sezimal_context, SezimalContext
+from .context import (
+    sezimal_context, SezimalContext,
+    get_sezimal_context, set_sezimal_context,
+)
 from .decimal_sezimal_conversion import decimal_to_sezimal
 from .sezimal_decimal_conversion import sezimal_to_decimal
 from .sezimal_niftimal_conversion import sezimal_to_niftimal, niftimal_to_sezimal
-from .sezimal_dozenal_conversion import sezimal_to_dozenal, dozenal_to_sezimal
+from .sezimal_dozenal_conversion import sezimal_to_dozenal, dozenal_to_sezimal, dozenal_to_niftimal, niftimal_to_dozenal
 from .decimal_dozenal_conversion import decimal_to_dozenal
 from .dozenal_decimal_conversion import dozenal_to_decimal
 from .digit_conversion import (
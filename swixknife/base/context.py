@@ -1,6 +1,10 @@
 
 
 from typing import TypeVar
+from contextlib import contextmanager
+from contextvars import ContextVar
+import threading
+from decimal import localcontext
 
 Sezimal = TypeVar('Sezimal', bound='Sezimal')
 SezimalInteger = TypeVar('SezimalInteger', bound='SezimalInteger')
@@ -201,5 +205,93 @@ class SezimalContext:
         # self.fractions_use_decimal = self._regular_fractions_use_decimal
         self.using_ultra_precision = False
 
+    def copy(self) -> 'SezimalContext':
+        #
+        # A plain copy of all the attributes, without going through
+        # the precision setters again
+        #
+        context = SezimalContext.__new__(SezimalContext)
+        context.__dict__.update(self.__dict__)
+        return context
 
-sezimal_context = SezimalContext()
+    @contextmanager
+    def local(self, **attributes):
+        #
+        # Works like decimal.localcontext: inside the with block,
+        # sezimal_context is a copy of this context, with the
+        # attributes given changed; it’s seen only by the current
+        # thread or asyncio task, and it’s discarded at the end,
+        # along with the decimal precision it sets
+        #
+        #   with sezimal_context.local(precision=100):
+        #       ...
+        #
+        context = self.copy()
+
+        for name in attributes:
+            if not (hasattr(SezimalContext, name) or name in context.__dict__):
+                raise AttributeError(f'SezimalContext has no attribute {name!r}')
+
+        with localcontext():
+            token = _CURRENT_CONTEXT.set(context)
+
+            try:
+                for name, value in attributes.items():
+                    setattr(context, name, value)
+
+                yield context
+
+            finally:
+                _CURRENT_CONTEXT.reset(token)
+
+
+_MAIN_CONTEXT = SezimalContext()
+_CURRENT_CONTEXT = ContextVar('sezimal_context')
+
+
+def get_sezimal_context() -> SezimalContext:
+    try:
+        return _CURRENT_CONTEXT.get()
+
+    except LookupError:
+        pass
+
+    #
+    # The main thread works on the default context itself;
+    # any other thread starts with a copy of it, as it is
+    # at that moment, so changes there stay in that thread
+    #
+    if threading.current_thread() is threading.main_thread():
+        context = _MAIN_CONTEXT
+    else:
+        context = _MAIN_CONTEXT.copy()
+        context.decimal_precision = context.decimal_precision
+
+    _CURRENT_CONTEXT.set(context)
+    return context
+
+
+def set_sezimal_context(context: SezimalContext):
+    _CURRENT_CONTEXT.set(context)
+    context.decimal_precision = context.decimal_precision
+
+
+class _SezimalContextProxy:
+    #
+    # sezimal_context is imported everywhere as a module global,
+    # so it stays one object, that forwards everything to the
+    # context of the current thread or asyncio task
+    #
+    __slots__ = []
+
+    def __getattribute__(self, name: str):
+        return getattr(_CURRENT_CONTEXT.get(None) or get_sezimal_context(), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(_CURRENT_CONTEXT.get(None) or get_sezimal_context(), name, value)
+
+    def __repr__(self) -> str:
+        return f'<sezimal_context {get_sezimal_context()!r}>'
+
+
+sezimal_context = _SezimalContextProxy()
@@ -6,170 +6,154 @@ SezimalInteger = TypeVar('SezimalInteger', bound='SezimalInteger')
 SezimalFraction = TypeVar('SezimalFraction', bound='SezimalFraction')
 
 
-from decimal import Decimal, localcontext, getcontext
+from decimal import Decimal
 
 from .validation import validate_clean_sezimal, validate_clean_dozenal, validate_clean_decimal
-from .sezimal_decimal_conversion import sezimal_to_decimal
-from .decimal_sezimal_conversion import decimal_to_sezimal
+from .sezimal_niftimal_conversion import sezimal_to_niftimal, niftimal_to_sezimal
 from .context import sezimal_context
 
 
+SEZIMAL_DIGITS = '012345'
 DOZENAL_DIGITS = '0123456789↊↋'
 
 
-def sezimal_to_dozenal(number: int | float | Decimal | str | Sezimal | SezimalInteger | SezimalFraction, dozenal_precision: int = None) -> str:
-    if type(number) == Decimal:
-        number = validate_clean_decimal(str(number))
-    else:
-        number = sezimal_to_decimal(number)
+#
+# The conversions are done exactly, with integers only:
+# the number is taken as a ratio of two integers,
+# scaled by a power of the new base, and rounded only once,
+# at the precision asked for;
+# every sezimal fraction has an exact dozenal form, with at most
+# as many digits (1 / 6 = 2 / 12), and every dozenal fraction
+# has an exact sezimal form, with twice as many digits
+# (1 / 12 = 3 / 36)
+#
+def _integer_to_digits(number: int, base: int, digits: str) -> str:
+    if number < base:
+        return digits[number]
 
-    if dozenal_precision is None:
-        dozenal_precision = sezimal_context.dozenal_precision_decimal
+    converted = []
 
-    if number.startswith('-'):
-        negative = True
-        number = number[1:]
-    else:
-        negative = False
+    while number:
+        number, digit = divmod(number, base)
+        converted.append(digits[digit])
 
-    if '.' in number:
-        integer, fraction = number.split('.')
-    else:
-        integer = number
-        fraction = ''
-
-    dozenal_integer = _decimal_integer_to_dozenal(integer)
-    dozenal_fraction = _decimal_fraction_to_dozenal(fraction, dozenal_precision)
+    return ''.join(reversed(converted))
 
-    dozenal = dozenal_integer
 
-    if dozenal_fraction:
-        dozenal += '.' + dozenal_fraction
+def _ratio_to_base(numerator: int, denominator: int, base: int, digits: str, precision: int, has_fraction: bool) -> str:
+    if not has_fraction:
+        return _integer_to_digits(numerator // denominator, base, digits)
 
-    if negative:
-        dozenal = '-' + dozenal
+    scale = base ** precision
+    scaled, remainder = divmod(numerator * scale, denominator)
 
-    return dozenal
+    #
+    # Rounds half up, except when it’s exactly half,
+    # and the last digit kept is even
+    #
+    if remainder * 2 > denominator or (remainder * 2 == denominator and scaled % 2):
+        scaled += 1
 
+    integer, fraction = divmod(scaled, scale)
 
-def _decimal_integer_to_dozenal(integer: str | int) -> str:
-    if not integer:
-        return ''
+    integer = _integer_to_digits(integer, base, digits)
 
-    dozenal = []
+    if precision:
+        fraction = _integer_to_digits(fraction, base, digits).rjust(precision, '0').rstrip('0')
+    else:
+        fraction = ''
 
-    integer = int(integer)
+    return integer + '.' + (fraction or '0')
 
-    while integer:
-        dozenal.append(DOZENAL_DIGITS[integer % 12])
-        integer //= 12
 
-    return ''.join(reversed(dozenal or '0'))
+def _split_number(number: str) -> tuple[bool, str, str]:
+    if number.startswith('-'):
+        negative = True
+        number = number[1:]
+    else:
+        negative = False
 
+    if '.' in number:
+        integer, fraction = number.split('.')
+    else:
+        integer = number
+        fraction = ''
 
-def _decimal_fraction_to_dozenal(fraction: str | Decimal, dozenal_precision: int = None) -> str:
-    if not fraction:
-        return ''
+    return negative, integer or '0', fraction
 
-    decimal_precision = len(fraction)
 
+def sezimal_to_dozenal(number: int | float | Decimal | str | Sezimal | SezimalInteger | SezimalFraction, dozenal_precision: int = None) -> str:
     if dozenal_precision is None:
-        dozenal_precision = 36
-
-    fraction = Decimal('0.' + fraction)
-    dozenal_fraction = ''
-
-    with localcontext() as context:
-        # context.prec = dozenal_precision * 2
+        dozenal_precision = sezimal_context.dozenal_precision_decimal
 
-        for i in range(dozenal_precision):
-            fraction *= 12
-            digit = int(fraction % 12)
-            dozenal_fraction += DOZENAL_DIGITS[digit]
-            fraction -= digit
+    if type(number).__name__ in ('Sezimal', 'SezimalInteger'):
+        negative = number._sign == -1
+        numerator = number._mantissa
+        denominator = 6 ** number._precision
+        has_fraction = number._precision > 0
 
-            if fraction <= 0:
-                break
+    elif type(number).__name__ == 'SezimalFraction':
+        fraction_numerator, fraction_denominator = number.numerator, number.denominator
+        negative = fraction_numerator._sign != fraction_denominator._sign
+        numerator = fraction_numerator._mantissa * 6 ** fraction_denominator._precision
+        denominator = fraction_denominator._mantissa * 6 ** fraction_numerator._precision
+        has_fraction = numerator % denominator != 0
 
-    #
-    # Let’s adjust for recurring ↋s at the end of fractional parts
-    #
-    while dozenal_fraction.endswith('↋↋↋)'):
-        dozenal_fraction = dozenal_fraction[:-4]
-        size = len(dozenal_fraction)
-        dozenal_fraction = _decimal_integer_to_dozenal(int(dozenal_fraction.replace('↊', 'A').replace('↋', 'B'), 12) + 1)
-        dozenal_fraction = dozenal_fraction.zfill(size)
-
-    #
-    # Remove trailing zeroes
-    #
-    dozenal_fraction = dozenal_fraction[::-1]
+    else:
+        if type(number) == Decimal:
+            negative, integer, fraction = _split_number(validate_clean_decimal(str(number)))
+            base = 10
+        else:
+            negative, integer, fraction = _split_number(validate_clean_sezimal(number))
+            base = 6
 
-    while dozenal_fraction and dozenal_fraction[0] == '0':
-        dozenal_fraction = dozenal_fraction[1:]
+        numerator = int(integer + fraction, base)
+        denominator = base ** len(fraction)
+        has_fraction = bool(fraction)
 
-    dozenal_fraction = dozenal_fraction[::-1]
+    dozenal = _ratio_to_base(numerator, denominator, 12, DOZENAL_DIGITS, dozenal_precision, has_fraction)
 
-    if not dozenal_fraction:
-        dozenal_fraction = '0'
+    if negative:
+        dozenal = '-' + dozenal
 
-    return dozenal_fraction
+    return dozenal
 
 
 def dozenal_to_sezimal(number: str, sezimal_precision: int = None) -> str:
-    number = validate_clean_dozenal(str(number))
-
-    number = number.replace('↊', 'A').replace('↋', 'B')
-
-    if number.startswith('-'):
-        negative = True
-        number = number[1:]
-    else:
-        negative = False
-
-    if '.' in number:
-        integer, fraction = number.split('.')
+    if sezimal_precision is None:
+        sezimal_precision = sezimal_context.sezimal_precision_decimal
     else:
-        integer = number
-        fraction = ''
+        sezimal_precision = int(sezimal_precision)
 
-    decimal_integer = str(int(integer, 12))
-    decimal_fraction = _dozenal_fraction_to_decimal(fraction, 36)
+    number = validate_clean_dozenal(str(number))
+    number = number.replace('↊', 'A').replace('↋', 'B')
 
-    decimal = decimal_integer
+    negative, integer, fraction = _split_number(number)
 
-    if decimal_fraction:
-        decimal += '.' + decimal_fraction
+    sezimal = _ratio_to_base(
+        int(integer + fraction, 12), 12 ** len(fraction),
+        6, SEZIMAL_DIGITS, sezimal_precision, bool(fraction),
+    )
 
     if negative:
-        decimal = '-' + decimal
-
-    sezimal = decimal_to_sezimal(decimal, sezimal_precision)
+        sezimal = '-' + sezimal
 
     return sezimal
 
 
-def _dozenal_fraction_to_decimal(fraction: str, decimal_precision: int = None) -> str:
-    if not fraction:
-        return ''
-
-    if decimal_precision is None:
-        decimal_precision = getcontext().prec
-
-    with localcontext() as context:
-        context.prec = decimal_precision * 2
+def dozenal_to_niftimal(number: str, niftimal_precision: int = None, sezimal_digits: bool = False) -> str:
+    if niftimal_precision is None:
+        sezimal_precision = sezimal_context.sezimal_precision_decimal
+    else:
+        sezimal_precision = int(niftimal_precision) * 2
 
-        decimal_fraction = Decimal('0')
+    return sezimal_to_niftimal(dozenal_to_sezimal(number, sezimal_precision), sezimal_digits=sezimal_digits)
 
-        i = -1
-        for d in fraction:
-            decimal_fraction += int(d, 12) * (Decimal('12') ** i)
-            i -= 1
 
-    decimal_fraction = validate_clean_decimal(decimal_fraction)
-    decimal_fraction = decimal_fraction.split('.')[-1]
+def niftimal_to_dozenal(number: str, dozenal_precision: int = None) -> str:
+    number = str(number)
 
-    if len(decimal_fraction) > decimal_precision:
-        decimal_fraction = decimal_fraction[:decimal_precision]
+    if number.startswith('-'):
+        return '-' + sezimal_to_dozenal(niftimal_to_sezimal(number[1:]), dozenal_precision)
 
-    return decimal_fraction
+    return sezimal_to_dozenal(niftimal_to_sezimal(number), dozenal_precision)
@@ -157,6 +157,14 @@ _VALID_NIFTIMAL_FORMAT = re.compile(r'''^[+-]?[0-9A-Za-z]{1,}\.{0,2}([Ee][+-][0-
 
 _VALID_DOZENAL_FORMAT = re.compile(r'''^[+-]?[0-9↊↋ABab]{1,}\.{0,2}([Ee][+-]?[0-9↊↋ABab]{1,})?$|^[+-]?[0-9↊↋ABab]*\.[0-9↊↋ABab]{1,}([Ee][+-]?[0-9↊↋ABab]{1,})?$|^[+-]?[0-9↊↋ABab]*\.\.[0-9↊↋ABab]{1,}(\.\.\.$)?$|^[+-]?[0-9↊↋ABab]*\.[0-9↊↋ABab]{1,}\.\.[0-9↊↋ABab]{1,}(\.\.\.$)?$|^[ΦφΠπΤτ]$''')
 
+#
+# Plain numerals, already in their canonical form
+# (no leading zeros, no recurring marks, exponents or constants),
+# are returned as they are, without going through the full cleaning
+#
+_PLAIN_SEZIMAL_FORMAT = re.compile(r'''-?(?:0|[1-5][0-5]*)(?:\.[0-5]+)?''')
+_PLAIN_DECIMAL_FORMAT = re.compile(r'''-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?''')
+
 
 def validate_clean_sezimal(number: int | float | str | Decimal | Sezimal | SezimalInteger | SezimalFraction, double_precision: bool = False) -> str:
     if type(number) == SezimalFraction:
@@ -164,6 +172,15 @@ def validate_clean_sezimal(number: int | float | str | Decimal | Sezimal | Sezim
 
     cleaned_number = str(number)
 
+    if _PLAIN_SEZIMAL_FORMAT.fullmatch(cleaned_number):
+        return cleaned_number
+
+    if '_' in cleaned_number:
+        plain_number = cleaned_number.replace('_', '')
+
+        if _PLAIN_SEZIMAL_FORMAT.fullmatch(plain_number):
+            return plain_number
+
     # cleaned_number = sezimal_to_default_digits(cleaned_number)
     cleaned_number = cleaned_number.translate(_SEZIMAL_CONSTANTS)
     cleaned_number = cleaned_number.translate(_CLEAN_SPACES)
@@ -200,8 +217,20 @@ def validate_clean_sezimal(number: int | float | str | Decimal | Sezimal | Sezim
 
 
 def validate_clean_decimal(number: int | float | str | Decimal) -> str:
+    if type(number) == int:
+        return str(number)
+
     number = str(number)
 
+    if _PLAIN_DECIMAL_FORMAT.fullmatch(number):
+        return number
+
+    if '_' in number:
+        plain_number = number.replace('_', '')
+
+        if _PLAIN_DECIMAL_FORMAT.fullmatch(plain_number):
+            return plain_number
+
     cleaned_number = number.translate(_DECIMAL_CONSTANTS)
     cleaned_number = cleaned_number.translate(_CLEAN_SPACES)
 
@@ -19,6 +19,7 @@ from ..functions.trigonometry import *
 from ..localization import SezimalLocale, sezimal_locale
 
 from .operations import *
+from .expression import compile_expression, evaluate_expression
 
 
 class SezimalCalculator:
@@ -42,6 +43,9 @@ class SezimalCalculator:
         self.angle_as_fraction = False
         self.debug = False
         self.currency_mode = False
+        self._prepared_settings = None
+        self._prepared_steps = []
+        self._spellout_parts = {}
         self.expression = expression
 
     @property
@@ -161,24 +165,39 @@ class SezimalCalculator:
             if not part:
                 continue
 
-            if self.unit and part.replace('.', '').isdigit():
-                spellout += sezimal_spellout(f'SH-{self.unit} {part}', lang, self.sezimal_punctuation) + ' '
-            elif self.unit and part.replace('/', '').replace('⁄', '').isdigit():
-                spellout += sezimal_spellout(f'SH-{self.unit} {part}', lang, self.sezimal_punctuation) + ' '
-            else:
-                if self.currency_mode:
-                    try:
-                        part = SezimalDecimalUnit(part)
-                        spellout += sezimal_spellout(part.unit, lang, self.sezimal_punctuation) + '; '
-                        spellout += sezimal_spellout(part.subunit, lang, self.sezimal_punctuation) + ' '
-                        continue
-                    except:
-                        pass
+            #
+            # The parts already spelled out, for the expression
+            # before the last key, are reused
+            #
+            key = (part, lang, self.sezimal_punctuation, self.unit, self.currency_mode)
+
+            if key not in self._spellout_parts:
+                if len(self._spellout_parts) >= 1_296:
+                    self._spellout_parts.clear()
 
-                spellout += sezimal_spellout(part, lang, self.sezimal_punctuation) + ' '
+                self._spellout_parts[key] = self._spellout_part(part, lang)
+
+            spellout += self._spellout_parts[key]
 
         return spellout.strip()
 
+    def _spellout_part(self, part: str, lang: str) -> str:
+        if self.unit and part.replace('.', '').isdigit():
+            return sezimal_spellout(f'SH-{self.unit} {part}', lang, self.sezimal_punctuation) + ' '
+
+        if self.unit and part.replace('/', '').replace('⁄', '').isdigit():
+            return sezimal_spellout(f'SH-{self.unit} {part}', lang, self.sezimal_punctuation) + ' '
+
+        if self.currency_mode:
+            try:
+                part = SezimalDecimalUnit(part)
+                return sezimal_spellout(part.unit, lang, self.sezimal_punctuation) + '; ' \
+                    + sezimal_spellout(part.subunit, lang, self.sezimal_punctuation) + ' '
+            except:
+                pass
+
+        return sezimal_spellout(part, lang, self.sezimal_punctuation) + ' '
+
     def _determine_precision(self, number: str, max_precision: SezimalInteger, result: bool = False) -> SezimalInteger:
         number = str(number)
 
@@ -438,16 +457,6 @@ class SezimalCalculator:
             text = _OPERATOR[o]
             exp = exp.replace(o, text)
 
-        parenthesis_opened = 0
-        trigonometry_opened = 0
-
-        prepared_expression = ''
-        display = ''
-        decimal_display = ''
-        niftimal_display = ''
-        sezimal_expression = ''
-        decimal_expression = ''
-
         parts = exp.split()
 
         if parts and parts[-1] == '__PLUS_MINUS__':
@@ -465,290 +474,349 @@ class SezimalCalculator:
             else:
                 parts[-1] = '-' + parts[-1]
 
-        previous_part = ''
+        settings = self._prepare_settings()
 
-        for part in parts:
-            part = part.strip()
+        if settings != self._prepared_settings:
+            self._prepared_settings = settings
+            self._prepared_steps = []
 
-            if not part:
-                continue
+        #
+        # Each part is prepared from the state left by the parts
+        # before it, so the parts the expression shares with the one
+        # prepared before (usually all of them, but the last one or two,
+        # as the expression grows one key at a time) aren’t
+        # prepared again, the state after them is just picked up
+        #
+        steps = self._prepared_steps
+        reused = 0
 
-            if part in _IN_PREPARED_EXPRESSION_OPERATION:
-                prepared_expression += _IN_PREPARED_EXPRESSION_OPERATION[part]
+        while reused < len(steps) and reused < len(parts) and steps[reused][0] == parts[reused]:
+            reused += 1
 
-                if part in _PER_OPERATIONS:
-                    sezimal_expression += f'{_NICE_OPERATION[part]} '
-                    decimal_expression += f'{_NICE_OPERATION[part]} '
-                elif part in _NO_SPACE_OPERATIONS:
-                    sezimal_expression += f'{_IN_EXPRESSION_OPERATION[part]}'
-                    decimal_expression += f'{_IN_EXPRESSION_OPERATION[part]}'
-                else:
-                    sezimal_expression += f' {_IN_EXPRESSION_OPERATION[part]} '
-                    decimal_expression += f' {_IN_EXPRESSION_OPERATION[part]} '
-
-                #
-                # Deals with negative numbers
-                #
-                if part == '__SUBTRACT__':
-                    if previous_part == '':
-                        display += ' −'
-                        decimal_display += ' −'
-                        niftimal_display += ' −'
+        del steps[reused:]
 
-                    elif previous_part in _IN_PREPARED_EXPRESSION_OPERATION:
-                        if previous_part.strip() in _PER_OPERATIONS:
-                            display += _NICE_OPERATION[part]
-                            decimal_display += _NICE_OPERATION[part]
-                            niftimal_display += _NICE_OPERATION[part]
-                        else:
-                            display += ' −'
-                            decimal_display += ' −'
-                            niftimal_display += ' −'
+        if reused:
+            state = steps[-1][1]
+        else:
+            state = ('', '', '', '', '', '', 0, 0, '')
 
-                    else:
-                        display += _NICE_OPERATION[part]
-                        decimal_display += _NICE_OPERATION[part]
-                        niftimal_display += _NICE_OPERATION[part]
+        for part in parts[reused:]:
+            state = self._prepare_part(part, state)
+            steps.append((part, state))
 
-                else:
-                    display += _NICE_OPERATION[part]
-                    decimal_display += _NICE_OPERATION[part]
-                    niftimal_display += _NICE_OPERATION[part]
+        prepared_expression, display, decimal_display, niftimal_display, \
+            sezimal_expression, decimal_expression, \
+            parenthesis_opened, trigonometry_opened, previous_part = state
 
-                previous_part = part
+        for i in range(parenthesis_opened):
+            prepared_expression += ')'
 
-                if self.decimal:
-                    for symbol, expression_text, niftimal_text, sd_niftimal_text in _PER_OPERATIONS_DECIMAL_TO_SEZIMAL:
-                        display_text = expression_text.replace('/', '÷')
-                        display_text = display_text.replace('_', self.locale.GROUP_SEPARATOR)
+        if self.sezimal_digits:
+            display = display.replace('lbin', 'log󱹊')
+            display = display.replace('lsez', 'log󱹉󱹈')
+            display = display.replace('ldec', 'log󱹉󱹌')
+        else:
+            display = display.replace('lbin', 'log₂')
+            display = display.replace('lsez', 'log₁₀')
+            display = display.replace('ldec', 'log₁₄')
 
-                        display = display.replace(symbol, display_text)
-                        sezimal_expression = sezimal_expression.replace(symbol, expression_text)
+        display = display.replace('ln', 'logₑ')
+        display = display.replace('sqrt', '√')
+        display = display.replace('cbrt', '∛')
 
-                        if self.sezimal_digits:
-                            niftimal_display = niftimal_display.replace(symbol, sd_niftimal_text)
-                        else:
-                            niftimal_display = niftimal_display.replace(symbol, niftimal_text)
+        decimal_display = decimal_display.replace('lbin', 'log₂')
+        decimal_display = decimal_display.replace('ln', 'logₑ')
+        decimal_display = decimal_display.replace('lsez', 'log₆')
+        decimal_display = decimal_display.replace('ldec', 'log₁₀')
+        decimal_display = decimal_display.replace('sqrt', '√')
+        decimal_display = decimal_display.replace('cbrt', '∛')
 
-                else:
-                    for symbol, expression_text in _PER_OPERATIONS_SEZIMAL_TO_DECIMAL:
-                        display_text = expression_text.replace('/', '÷')
-                        display_text = display_text.replace('_', self.locale.GROUP_SEPARATOR)
+        self._prepared_expression = prepared_expression
+        self._display = display
+        self._decimal_display = decimal_display
+        self._niftimal_display = niftimal_display
 
-                        decimal_display = decimal_display.replace(symbol, display_text)
-                        decimal_expression = decimal_expression.replace(symbol, expression_text)
+        sezimal_expression = sezimal_expression.replace('**', '^')
+        decimal_expression = decimal_expression.replace('**', '^')
+        sezimal_expression = sezimal_expression.replace('* *', '^')
+        decimal_expression = decimal_expression.replace('* *', '^')
 
-                if part in _TRIGONOMETRIC_FUNCTION:
-                    trigonometry_opened += 1
-                    parenthesis_opened += 1
+        self._sezimal_expression = sezimal_expression
+        self._decimal_expression = decimal_expression
 
-                if (not parenthesis_opened) and part == '__LEFT_PARENTHESIS__':
-                    parenthesis_opened += 1
-                elif parenthesis_opened and part == '__RIGHT_PARENTHESIS__':
-                    parenthesis_opened -= 1
+        if self.decimal:
+            self._expression = self._decimal_expression
+        else:
+            self._expression = self._sezimal_expression
 
-                    if trigonometry_opened > 0:
-                        trigonometry_opened -= 1
+    def _prepare_settings(self) -> tuple:
+        #
+        # Everything, besides the expression itself,
+        # that changes how its parts are prepared
+        #
+        return (
+            self.decimal, self._sezimal_precision, self._decimal_precision,
+            self.locale.LANGUAGE_TAG if self.locale else '',
+            self.sezimal_digits, self.sezimal_punctuation,
+            self.regularized_digits, self.regularized_letter_digits,
+            self.grouping_digits, self.suffix, self.decimal_suffix,
+            str(self.factor), self.unit, self.decimal_unit, self.unit_as_fraction,
+            self.angle, self.decimal_angle, self.angle_as_fraction,
+            self.currency_mode,
+        )
+
+    def _prepare_part(self, part: str, state: tuple) -> tuple:
+        prepared_expression, display, decimal_display, niftimal_display, \
+            sezimal_expression, decimal_expression, \
+            parenthesis_opened, trigonometry_opened, previous_part = state
+
+        part = part.strip()
+
+        if not part:
+            return prepared_expression, display, decimal_display, niftimal_display, \
+                sezimal_expression, decimal_expression, \
+                parenthesis_opened, trigonometry_opened, previous_part
+
+        if part in _IN_PREPARED_EXPRESSION_OPERATION:
+            prepared_expression += _IN_PREPARED_EXPRESSION_OPERATION[part]
+
+            if part in _PER_OPERATIONS:
+                sezimal_expression += f'{_NICE_OPERATION[part]} '
+                decimal_expression += f'{_NICE_OPERATION[part]} '
+            elif part in _NO_SPACE_OPERATIONS:
+                sezimal_expression += f'{_IN_EXPRESSION_OPERATION[part]}'
+                decimal_expression += f'{_IN_EXPRESSION_OPERATION[part]}'
+            else:
+                sezimal_expression += f' {_IN_EXPRESSION_OPERATION[part]} '
+                decimal_expression += f' {_IN_EXPRESSION_OPERATION[part]} '
 
-                continue
+            #
+            # Deals with negative numbers
+            #
+            if part == '__SUBTRACT__':
+                if previous_part == '':
+                    display += ' −'
+                    decimal_display += ' −'
+                    niftimal_display += ' −'
+
+                elif previous_part in _IN_PREPARED_EXPRESSION_OPERATION:
+                    if previous_part.strip() in _PER_OPERATIONS:
+                        display += _NICE_OPERATION[part]
+                        decimal_display += _NICE_OPERATION[part]
+                        niftimal_display += _NICE_OPERATION[part]
+                    else:
+                        display += ' −'
+                        decimal_display += ' −'
+                        niftimal_display += ' −'
 
-            if part == '.' or part == ';':
-                continue
+                else:
+                    display += _NICE_OPERATION[part]
+                    decimal_display += _NICE_OPERATION[part]
+                    niftimal_display += _NICE_OPERATION[part]
+
+            else:
+                display += _NICE_OPERATION[part]
+                decimal_display += _NICE_OPERATION[part]
+                niftimal_display += _NICE_OPERATION[part]
 
             previous_part = part
 
-            if part in _CONSTANTS:
-                prepared_expression += part
-                display += part
-                decimal_display += part
-                niftimal_display += part
-                sezimal_expression += part
-                decimal_expression += part
-
-            elif self.decimal:
-                if '⁄' in part:
-                    if part.endswith('⁄'):
-                        number = Decimal(part[:-1])
-                        prepared_expression += f"Decimal('{number}')"
+            if self.decimal:
+                for symbol, expression_text, niftimal_text, sd_niftimal_text in _PER_OPERATIONS_DECIMAL_TO_SEZIMAL:
+                    display_text = expression_text.replace('/', '÷')
+                    display_text = display_text.replace('_', self.locale.GROUP_SEPARATOR)
+
+                    display = display.replace(symbol, display_text)
+                    sezimal_expression = sezimal_expression.replace(symbol, expression_text)
+
+                    if self.sezimal_digits:
+                        niftimal_display = niftimal_display.replace(symbol, sd_niftimal_text)
                     else:
-                        num, den = part.split('⁄')
-                        number = Decimal(num) / Decimal(den)
-                        prepared_expression += f"Decimal('{number}')"
-                elif part.endswith('..'):
-                    number = Decimal(validate_clean_decimal(part[:-2]))
-                    prepared_expression += f"Decimal('{number}')"
-                elif part.endswith('.'):
-                    number = Decimal(validate_clean_decimal(part[:-1]))
-                    prepared_expression += f"Decimal('{number}')"
-                elif part.endswith(';'):
-                    number = Decimal(validate_clean_decimal(part[:-1]))
+                        niftimal_display = niftimal_display.replace(symbol, niftimal_text)
+
+            else:
+                for symbol, expression_text in _PER_OPERATIONS_SEZIMAL_TO_DECIMAL:
+                    display_text = expression_text.replace('/', '÷')
+                    display_text = display_text.replace('_', self.locale.GROUP_SEPARATOR)
+
+                    decimal_display = decimal_display.replace(symbol, display_text)
+                    decimal_expression = decimal_expression.replace(symbol, expression_text)
+
+            if part in _TRIGONOMETRIC_FUNCTION:
+                trigonometry_opened += 1
+                parenthesis_opened += 1
+
+            if (not parenthesis_opened) and part == '__LEFT_PARENTHESIS__':
+                parenthesis_opened += 1
+            elif parenthesis_opened and part == '__RIGHT_PARENTHESIS__':
+                parenthesis_opened -= 1
+
+                if trigonometry_opened > 0:
+                    trigonometry_opened -= 1
+
+            return prepared_expression, display, decimal_display, niftimal_display, \
+                sezimal_expression, decimal_expression, \
+                parenthesis_opened, trigonometry_opened, previous_part
+
+        if part == '.' or part == ';':
+            return prepared_expression, display, decimal_display, niftimal_display, \
+                sezimal_expression, decimal_expression, \
+                parenthesis_opened, trigonometry_opened, previous_part
+
+        previous_part = part
+
+        if part in _CONSTANTS:
+            prepared_expression += part
+            display += part
+            decimal_display += part
+            niftimal_display += part
+            sezimal_expression += part
+            decimal_expression += part
+
+        elif self.decimal:
+            if '⁄' in part:
+                if part.endswith('⁄'):
+                    number = Decimal(part[:-1])
                     prepared_expression += f"Decimal('{number}')"
                 else:
-                    number = Decimal(validate_clean_decimal(part))
+                    num, den = part.split('⁄')
+                    number = Decimal(num) / Decimal(den)
                     prepared_expression += f"Decimal('{number}')"
+            elif part.endswith('..'):
+                number = Decimal(validate_clean_decimal(part[:-2]))
+                prepared_expression += f"Decimal('{number}')"
+            elif part.endswith('.'):
+                number = Decimal(validate_clean_decimal(part[:-1]))
+                prepared_expression += f"Decimal('{number}')"
+            elif part.endswith(';'):
+                number = Decimal(validate_clean_decimal(part[:-1]))
+                prepared_expression += f"Decimal('{number}')"
+            else:
+                number = Decimal(validate_clean_decimal(part))
+                prepared_expression += f"Decimal('{number}')"
 
-                decimal_display += self._format_decimal(part, display=True, part=part)
-                decimal_expression += self._format_decimal(part, part=part)
-
-                if trigonometry_opened and self.angle and self.decimal_angle:
-                    if self.angle.endswith('mdl'):
-                        number = decimal_to_sezimal_unit(number, self.decimal_angle, self.angle, return_fraction=self.angle_as_fraction)
-                    else:
-                        number = decimal_to_decimal_unit(number, self.decimal_angle, self.angle, return_fraction=self.angle_as_fraction)
-
-                    if not self.angle_as_fraction:
-                        number = round(number, self._sezimal_precision)
+            decimal_display += self._format_decimal(part, display=True, part=part)
+            decimal_expression += self._format_decimal(part, part=part)
 
-                elif self.unit and self.decimal_unit:
-                    number = decimal_to_sezimal_unit(number, self.decimal_unit, self.unit, return_fraction=self.unit_as_fraction)
+            if trigonometry_opened and self.angle and self.decimal_angle:
+                if self.angle.endswith('mdl'):
+                    number = decimal_to_sezimal_unit(number, self.decimal_angle, self.angle, return_fraction=self.angle_as_fraction)
+                else:
+                    number = decimal_to_decimal_unit(number, self.decimal_angle, self.angle, return_fraction=self.angle_as_fraction)
 
-                    if not self.unit_as_fraction:
-                        number = round(number, self._sezimal_precision)
+                if not self.angle_as_fraction:
+                    number = round(number, self._sezimal_precision)
 
-                elif self.currency_mode:
-                    number = SezimalDecimalUnit(number)
+            elif self.unit and self.decimal_unit:
+                number = decimal_to_sezimal_unit(number, self.decimal_unit, self.unit, return_fraction=self.unit_as_fraction)
 
-                elif self.factor:
-                    number *= self.factor
+                if not self.unit_as_fraction:
                     number = round(number, self._sezimal_precision)
 
-                else:
-                    number = Sezimal(number)
+            elif self.currency_mode:
+                number = SezimalDecimalUnit(number)
 
-                display += self._format_sezimal(number, display=True)
-                niftimal_display += self._format_niftimal(number)
-                sezimal_expression += self._format_sezimal(number)
+            elif self.factor:
+                number *= self.factor
+                number = round(number, self._sezimal_precision)
 
             else:
-                cleaned_part = part
+                number = Sezimal(number)
 
-                if '⁄' in part:
-                    if part.endswith('⁄'):
-                        cleaned_part = part[:-1]
-                        number = Sezimal(part[:-1])
-                        prepared_expression += f"Sezimal('{number}')"
-                    else:
-                        number = SezimalFraction(part)
-                        prepared_expression += f"SezimalFraction('{number}')"
-                elif part.endswith('..'):
-                    cleaned_part = part[:-2]
-                    number = Sezimal(part[:-2])
-                    prepared_expression += f"Sezimal('{number}')"
-                elif part.endswith('.'):
+            display += self._format_sezimal(number, display=True)
+            niftimal_display += self._format_niftimal(number)
+            sezimal_expression += self._format_sezimal(number)
+
+        else:
+            cleaned_part = part
+
+            if '⁄' in part:
+                if part.endswith('⁄'):
                     cleaned_part = part[:-1]
                     number = Sezimal(part[:-1])
                     prepared_expression += f"Sezimal('{number}')"
-                elif self.currency_mode:
-                    number = SezimalDecimalUnit(part)
-
-                    if part[-1] == ';':
-                        prepared_expression += f"SezimalDecimalUnit('{number};')"
-                    else:
-                        prepared_expression += f"SezimalDecimalUnit('{number}')"
-
-                    cleaned_part = str(number.sezimal)
                 else:
-                    number = Sezimal(part)
-                    prepared_expression += f"Sezimal('{number}')"
-
-                if self.currency_mode:
-                    display += self._format_sezimal(number, display=True, part=part)
-                    niftimal_display += self._format_niftimal(cleaned_part, part=part)
-                    sezimal_expression += self._format_sezimal(number, part=part)
+                    number = SezimalFraction(part)
+                    prepared_expression += f"SezimalFraction('{number}')"
+            elif part.endswith('..'):
+                cleaned_part = part[:-2]
+                number = Sezimal(part[:-2])
+                prepared_expression += f"Sezimal('{number}')"
+            elif part.endswith('.'):
+                cleaned_part = part[:-1]
+                number = Sezimal(part[:-1])
+                prepared_expression += f"Sezimal('{number}')"
+            elif self.currency_mode:
+                number = SezimalDecimalUnit(part)
+
+                if part[-1] == ';':
+                    prepared_expression += f"SezimalDecimalUnit('{number};')"
                 else:
-                    display += self._format_sezimal(part, display=True, part=part)
-                    niftimal_display += self._format_niftimal(cleaned_part, part=part)
-                    sezimal_expression += self._format_sezimal(part, part=part)
+                    prepared_expression += f"SezimalDecimalUnit('{number}')"
 
-                if trigonometry_opened and self.angle and self.decimal_angle:
-                    if self.angle.endswith('mdl'):
-                        number = sezimal_to_decimal_unit(number, self.angle, self.decimal_angle, return_fraction=self.angle_as_fraction)
-                    else:
-                        number = decimal_to_decimal_unit(number, self.angle, self.decimal_angle, return_fraction=self.angle_as_fraction)
-
-                    if not self.angle_as_fraction:
-                        with localcontext() as context:
-                            context.prec = int(self._decimal_precision)
-                            number = round(number.decimal, int(self._decimal_precision))
+                cleaned_part = str(number.sezimal)
+            else:
+                number = Sezimal(part)
+                prepared_expression += f"Sezimal('{number}')"
 
-                elif self.unit and self.decimal_unit:
-                    number = sezimal_to_decimal_unit(number, self.unit, self.decimal_unit, return_fraction=self.unit_as_fraction)
+            if self.currency_mode:
+                display += self._format_sezimal(number, display=True, part=part)
+                niftimal_display += self._format_niftimal(cleaned_part, part=part)
+                sezimal_expression += self._format_sezimal(number, part=part)
+            else:
+                display += self._format_sezimal(part, display=True, part=part)
+                niftimal_display += self._format_niftimal(cleaned_part, part=part)
+                sezimal_expression += self._format_sezimal(part, part=part)
 
-                    if not self.unit_as_fraction:
-                        try:
-                            number = round(number.decimal, int(self._decimal_precision))
-                        except:
-                            number = number.decimal
+            if trigonometry_opened and self.angle and self.decimal_angle:
+                if self.angle.endswith('mdl'):
+                    number = sezimal_to_decimal_unit(number, self.angle, self.decimal_angle, return_fraction=self.angle_as_fraction)
+                else:
+                    number = decimal_to_decimal_unit(number, self.angle, self.decimal_angle, return_fraction=self.angle_as_fraction)
 
-                elif self.currency_mode:
-                    number = number.decimal
+                if not self.angle_as_fraction:
+                    with localcontext() as context:
+                        context.prec = int(self._decimal_precision)
+                        number = round(number.decimal, int(self._decimal_precision))
 
-                elif self.factor:
-                    number /= self.factor
+            elif self.unit and self.decimal_unit:
+                number = sezimal_to_decimal_unit(number, self.unit, self.decimal_unit, return_fraction=self.unit_as_fraction)
 
+                if not self.unit_as_fraction:
                     try:
                         number = round(number.decimal, int(self._decimal_precision))
                     except:
                         number = number.decimal
 
-                else:
-                    number = number.decimal
-
-                decimal_display += self._format_decimal(number, display=True)
-                decimal_expression += self._format_decimal(number)
+            elif self.currency_mode:
+                number = number.decimal
 
-        for i in range(parenthesis_opened):
-            prepared_expression += ')'
-
-        if self.sezimal_digits:
-            display = display.replace('lbin', 'log󱹊')
-            display = display.replace('lsez', 'log󱹉󱹈')
-            display = display.replace('ldec', 'log󱹉󱹌')
-        else:
-            display = display.replace('lbin', 'log₂')
-            display = display.replace('lsez', 'log₁₀')
-            display = display.replace('ldec', 'log₁₄')
-
-        display = display.replace('ln', 'logₑ')
-        display = display.replace('sqrt', '√')
-        display = display.replace('cbrt', '∛')
-
-        decimal_display = decimal_display.replace('lbin', 'log₂')
-        decimal_display = decimal_display.replace('ln', 'logₑ')
-        decimal_display = decimal_display.replace('lsez', 'log₆')
-        decimal_display = decimal_display.replace('ldec', 'log₁₀')
-        decimal_display = decimal_display.replace('sqrt', '√')
-        decimal_display = decimal_display.replace('cbrt', '∛')
+            elif self.factor:
+                number /= self.factor
 
-        self._prepared_expression = prepared_expression
-        self._display = display
-        self._decimal_display = decimal_display
-        self._niftimal_display = niftimal_display
+                try:
+                    number = round(number.decimal, int(self._decimal_precision))
+                except:
+                    number = number.decimal
 
-        sezimal_expression = sezimal_expression.replace('**', '^')
-        decimal_expression = decimal_expression.replace('**', '^')
-        sezimal_expression = sezimal_expression.replace('* *', '^')
-        decimal_expression = decimal_expression.replace('* *', '^')
+            else:
+                number = number.decimal
 
-        self._sezimal_expression = sezimal_expression
-        self._decimal_expression = decimal_expression
+            decimal_display += self._format_decimal(number, display=True)
+            decimal_expression += self._format_decimal(number)
 
-        if self.decimal:
-            self._expression = self._decimal_expression
-        else:
-            self._expression = self._sezimal_expression
+        return prepared_expression, display, decimal_display, niftimal_display, \
+            sezimal_expression, decimal_expression, \
+            parenthesis_opened, trigonometry_opened, previous_part
 
     def eval_expression(self):
         if not self.expression:
             return
 
         if self.debug:
-            #
-            # Take care of the mod to % operator change
-            #
-            sezimal_context.use_ultra_precision()
-            response = eval(self._prepared_expression.replace('mod', '%'))
-            sezimal_context.back_to_regular_precision()
+            with sezimal_context.local():
+                sezimal_context.use_ultra_precision()
+                response = evaluate_expression(compile_expression(self._prepared_expression), self)
 
             if self.decimal:
                 if type(response) == Sezimal:
@@ -764,7 +832,7 @@ class SezimalCalculator:
 
         else:
             try:
-                response = eval(self._prepared_expression)
+                response = evaluate_expression(compile_expression(self._prepared_expression), self)
 
                 if self.decimal:
                     if type(response) != DecimalFraction:
@@ -0,0 +1,231 @@
+
+__all__ = ('compile_expression', 'evaluate_expression')
+
+import re
+
+from decimal import Decimal
+from functools import lru_cache
+from operator import add, sub, mul, truediv, mod, pow, neg, pos
+
+from ..sezimal import Sezimal, SezimalFraction, SezimalDecimalUnit
+from .operations import _IN_PREPARED_EXPRESSION_OPERATION, e, π, τ, φ
+
+
+#
+# The prepared expression is a tiny subset of Python:
+# numbers, as Sezimal('…'), SezimalFraction('…'),
+# SezimalDecimalUnit('…') or Decimal('…'), the constants,
+# the calculator’s own functions, as self.ln( … ),
+# the arithmetic operators, parenthesis and .factorial();
+# it’s parsed into a tree of tuples, following Python’s own
+# precedence, and the tree is evaluated directly,
+# so no text sent to the calculator ever reaches eval
+#
+_NUMBER_CLASS = {
+    'Sezimal': Sezimal,
+    'SezimalFraction': SezimalFraction,
+    'SezimalDecimalUnit': SezimalDecimalUnit,
+    'Decimal': Decimal,
+}
+
+_CONSTANT_VALUE = {
+    'e': e,
+    'π': π,
+    'τ': τ,
+    'φ': φ,
+}
+
+_FUNCTIONS = frozenset(
+    text[5:].rstrip('(')
+    for text in _IN_PREPARED_EXPRESSION_OPERATION.values()
+    if text.startswith('self.')
+)
+
+_BINARY_OPERATION = {
+    '+': add,
+    '-': sub,
+    '*': mul,
+    '/': truediv,
+    '%': mod,
+    'mod': mod,
+    '**': pow,
+}
+
+_TOKEN = re.compile(r'''
+    \s*(?:
+        (?P<number>(?P<number_class>Sezimal|SezimalFraction|SezimalDecimalUnit|Decimal)\('(?P<number_text>[^']*)'\))
+        | self\.(?P<function>[A-Za-z]+)
+        | (?P<factorial>\.factorial\(\))
+        | (?P<operator>\*\*|[-+*/%()]|mod)
+        | (?P<constant>[eπτφ])
+    )
+''', re.VERBOSE)
+
+
+def _tokenize(text: str) -> list[tuple[str, object]]:
+    tokens = []
+    position = 0
+    text = text.rstrip()
+
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+
+        if not match:
+            raise ValueError(f'Invalid expression {text}')
+
+        position = match.end()
+
+        if match['number']:
+            tokens.append(('value', _NUMBER_CLASS[match['number_class']](match['number_text'])))
+
+        elif match['function']:
+            if match['function'] not in _FUNCTIONS:
+                raise ValueError(f'Invalid function {match["function"]}')
+
+            tokens.append(('function', match['function']))
+
+        elif match['factorial']:
+            tokens.append(('factorial', None))
+
+        elif match['operator']:
+            tokens.append(('operator', match['operator']))
+
+        else:
+            tokens.append(('value', _CONSTANT_VALUE[match['constant']]))
+
+    return tokens
+
+
+class _ExpressionParser:
+    #
+    # Recursive descent, one method per precedence level,
+    # from the loosest to the tightest:
+    # + -, * / mod, unary + -, **, !, and the operands;
+    # parenthesis left open at the end are closed,
+    # as the calculator always did for the first one
+    #
+    def __init__(self, tokens: list[tuple[str, object]]):
+        self.tokens = tokens
+        self.position = 0
+
+    def _peek(self) -> tuple[str, object]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+
+        return (None, None)
+
+    def _is_operator(self, *operators: str) -> bool:
+        kind, value = self._peek()
+        return kind == 'operator' and value in operators
+
+    def _close_parenthesis(self):
+        if self._is_operator(')'):
+            self.position += 1
+        elif self.position < len(self.tokens):
+            raise ValueError('Missing )')
+
+    def parse(self) -> tuple:
+        tree = self._sum()
+
+        if self.position < len(self.tokens):
+            raise ValueError('Invalid expression')
+
+        return tree
+
+    def _sum(self) -> tuple:
+        tree = self._product()
+
+        while self._is_operator('+', '-'):
+            operator = self.tokens[self.position][1]
+            self.position += 1
+            tree = ('binary', _BINARY_OPERATION[operator], tree, self._product())
+
+        return tree
+
+    def _product(self) -> tuple:
+        tree = self._unary()
+
+        while self._is_operator('*', '/', '%', 'mod'):
+            operator = self.tokens[self.position][1]
+            self.position += 1
+            tree = ('binary', _BINARY_OPERATION[operator], tree, self._unary())
+
+        return tree
+
+    def _unary(self) -> tuple:
+        if self._is_operator('-'):
+            self.position += 1
+            return ('unary', neg, self._unary())
+
+        if self._is_operator('+'):
+            self.position += 1
+            return ('unary', pos, self._unary())
+
+        return self._power()
+
+    def _power(self) -> tuple:
+        tree = self._factorial()
+
+        if self._is_operator('**'):
+            self.position += 1
+            #
+            # Right associative, and the exponent may be negative
+            #
+            tree = ('binary', pow, tree, self._unary())
+
+        return tree
+
+    def _factorial(self) -> tuple:
+        tree = self._operand()
+
+        while self._peek()[0] == 'factorial':
+            self.position += 1
+            tree = ('factorial', tree)
+
+        return tree
+
+    def _operand(self) -> tuple:
+        kind, value = self._peek()
+        self.position += 1
+
+        if kind == 'value':
+            return ('value', value)
+
+        if kind == 'function':
+            if not self._is_operator('('):
+                raise ValueError(f'Missing ( after {value}')
+
+            self.position += 1
+            tree = ('function', value, self._sum())
+            self._close_parenthesis()
+            return tree
+
+        if kind == 'operator' and value == '(':
+            tree = self._sum()
+            self._close_parenthesis()
+            return tree
+
+        raise ValueError('Invalid expression')
+
+
+@lru_cache(maxsize=1_296)
+def compile_expression(prepared_expression: str) -> tuple:
+    return _ExpressionParser(_tokenize(prepared_expression)).parse()
+
+
+def evaluate_expression(tree: tuple, calculator):
+    kind = tree[0]
+
+    if kind == 'value':
+        return tree[1]
+
+    if kind == 'binary':
+        return tree[1](evaluate_expression(tree[2], calculator), evaluate_expression(tree[3], calculator))
+
+    if kind == 'unary':
+        return tree[1](evaluate_expression(tree[2], calculator))
+
+    if kind == 'factorial':
+        return evaluate_expression(tree[1], calculator).factorial()
+
+    return getattr(calculator, tree[1])(evaluate_expression(tree[2], calculator))
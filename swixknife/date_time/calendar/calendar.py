@@ -1,6 +1,9 @@
 
 import os
+import io
+import re
 
+from functools import lru_cache
 from typing import TypeVar
 
 Self = TypeVar('Self', bound='SezimalCalendar')
@@ -47,6 +50,79 @@ TERMINAL_COLOR_RESET = '\x1b[0m'
 TERMINAL_COLOR_START = '\x1b['
 TERMINAL_COLOR_END = 'm'
 
+#
+# Every month in the Symmetry454 calendar starts on a Monday,
+# and has either 4 or 5 weeks (44 or 55 days),
+# so there are only two month grids for each first weekday,
+# built once and shared by all months of all years
+#
+_FIRST_WEEKDAY_BLANK_DAYS = {
+    WEEKDAY_MONDAY: 0,
+    WEEKDAY_SUNDAY: 1,
+    WEEKDAY_SATURDAY: 2,
+    WEEKDAY_FRIDAY: 3,
+    WEEKDAY_THURSDAY: 4,
+    WEEKDAY_WEDNESDAY: 5,
+    WEEKDAY_TUESDAY: 6,
+}
+
+
+@lru_cache(maxsize=1_296)
+def _month_grid(first_weekday: str, is_long_month: bool) -> tuple[tuple[SezimalInteger | int, ...], ...]:
+    days = [0] * _FIRST_WEEKDAY_BLANK_DAYS[first_weekday]
+
+    if is_long_month:
+        days += list(SezimalRange(1, 100))
+    else:
+        days += list(SezimalRange(1, 45))
+
+    days += [0] * (-len(days) % 7)
+
+    return tuple(tuple(days[i:i + 7]) for i in range(0, len(days), 7))
+
+
+#
+# The templates mark each part of the calendar with tags,
+# [Sd_01]1[Ed_01], that are later replaced by colors,
+# or simply removed, all at once
+#
+_TEMPLATE_TAG = re.compile(r'\[[SE](Y|[A-Za-z]_[0-9]{2})\]')
+
+_CLEARED_TAGS = frozenset(
+    ['Y', 'd_00', 'q_30', 'Q_30']
+    + [f'M_{month}' for month in ('01', '02', '03', '04', '05', '10', '11', '12', '13', '14', '15', '20')]
+    + [f'W_{weekday}' for weekday in ('01', '02', '03', '04', '05', '10', '11')]
+    + [f'{tag}_{str(day).zfill(2)}' for day in SezimalRange(1, 100) for tag in ('h', 'H', 'f', 'F', 'e', 'E', 'a', 'A', 'd', 'D')]
+)
+
+
+#
+# Day formats showing only the day of the month,
+# in any base and digits
+#
+_DAY_NUMBER_FORMAT = re.compile(f'^{RTL_MARKER}?#[9↋@]?[!?]?-?d{LTR_MARKER}?$')
+
+
+@lru_cache(maxsize=1_296)
+def _shared_day_texts(locale: SezimalLocale, day_format: str) -> dict:
+    #
+    # The shared locale instances can’t be changed, so the day numbers
+    # they format are kept for all the calendars using them,
+    # of any year
+    #
+    return {}
+
+
+def _replace_template_tags(calendar: str, tags: dict[str, str]) -> str:
+    return _TEMPLATE_TAG.sub(lambda match: tags.get(match[0][1:-1], match[0]), calendar)
+
+
+def _clear_template_tag(match: re.Match) -> str:
+    if match[1] in _CLEARED_TAGS:
+        return ''
+
+    return match[0]
+
 
 class SezimalCalendar:
     __slots__ = (
@@ -56,6 +132,7 @@ class SezimalCalendar:
         '_use_rtl', '_hemisphere',
         '_holidays', '_events',
         '_holidays_other_calendar', '_events_other_calendar',
+        '_week_header_template', '_day_cells', '_day_texts',
     )
     def __new__(
         cls,
@@ -215,6 +292,14 @@ class SezimalCalendar:
         self._time_format = time_format or locale.TIME_FORMAT
         self._date_format = date_format or locale.DATE_FORMAT
 
+        self._week_header_template = None
+        self._day_cells = {}
+
+        if locale._shared:
+            self._day_texts = _shared_day_texts(locale, day_format)
+        else:
+            self._day_texts = {}
+
         self._prepare_holiday_events()
 
         return self
@@ -235,40 +320,8 @@ class SezimalCalendar:
         return self._first_weekday
 
     def _weeks(self, month: SezimalInteger, year: SezimalInteger = None) -> list[list[int]]:
-        weeks = []
-
-        if self.first_weekday == WEEKDAY_MONDAY:
-            weeks += [[]]
-        elif self.first_weekday == WEEKDAY_SUNDAY:
-            weeks += [[0]]
-        elif self.first_weekday == WEEKDAY_SATURDAY:
-            weeks += [[0, 0]]
-        elif self.first_weekday == WEEKDAY_FRIDAY:
-            weeks += [[0, 0, 0]]
-        elif self.first_weekday == WEEKDAY_THURSDAY:
-            weeks += [[0, 0, 0, 0]]
-        elif self.first_weekday == WEEKDAY_WEDNESDAY:
-            weeks += [[0, 0, 0, 0, 0]]
-        elif self.first_weekday == WEEKDAY_TUESDAY:
-            weeks += [[0, 0, 0, 0, 0, 0]]
-
         date = self.date_time.date.replace(month=month, year=year)
-
-        if date.is_long_month:
-            days = SezimalInteger(55)
-        else:
-            days = SezimalInteger(44)
-
-        for day in SezimalRange(1, days + 1):
-            if len(weeks[-1]) == 7:
-                weeks += [[]]
-
-            weeks[-1].append(day)
-
-        if len(weeks[-1]) < 7:
-            weeks[-1] += [0 for i in range(7 - len(weeks[-1]))]
-
-        return weeks
+        return [list(week) for week in _month_grid(self.first_weekday, date.is_long_month)]
 
     def _week_header(self) -> list[str]:
         if self.first_weekday == WEEKDAY_MONDAY:
@@ -349,9 +402,90 @@ class SezimalCalendar:
 
         return header
 
-    def _month_template(self, month: SezimalInteger = None, year: SezimalInteger = None, with_year: bool = True) -> str:
+    def _day_width(self) -> int:
+        if self._day_format in ('#-dY', '#dY', '#!-dY', '#!dY', '#?-dY', '#?dY'):
+            return 4
+
+        return 3
+
+    def _week_header_line(self) -> str:
+        if self._week_header_template is not None:
+            return self._week_header_template
+
+        width = self._day_width()
+        header = self._week_header()
+
+        if self.locale.RTL and self._use_rtl:
+            header = header[::-1]
+
+        line = ' '.join(header)
+
+        for weekday, tag in (
+            (WEEKDAY_MONDAY, '01'),
+            (WEEKDAY_TUESDAY, '02'),
+            (WEEKDAY_WEDNESDAY, '03'),
+            (WEEKDAY_THURSDAY, '04'),
+            (WEEKDAY_FRIDAY, '05'),
+            (WEEKDAY_SATURDAY, '10'),
+            (WEEKDAY_SUNDAY, '11'),
+        ):
+            name = self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[WEEKDAYS.index(weekday)], 0, width)
+
+            if self.locale.RTL:
+                name = f'{RTL_MARKER}{name}{LTR_MARKER}'
+
+            line = line.replace(weekday, f'[SW_{tag}]' + self.locale.rjust(name, width) + f'[EW_{tag}]')
+
+        self._week_header_template = line + '\n'
+        return self._week_header_template
+
+    def _day_text(self, month: SezimalInteger, day: SezimalInteger) -> str:
+        #
+        # Most day formats show only the number of the day,
+        # the same in every month, so it’s formatted only once
+        #
+        if _DAY_NUMBER_FORMAT.match(self._day_format) and day in self._day_texts:
+            return self._day_texts[day]
+
+        date = SezimalDate(self.date_time.year, month, day)
+        text = self.locale.rjust(date.format(self._day_format, locale=self.locale), self._day_width())
+
+        if _DAY_NUMBER_FORMAT.match(self._day_format):
+            self._day_texts[day] = text
+
+        return text
+
+    def _day_cell(self, month: SezimalInteger, day: SezimalInteger) -> str:
+        month_text = str(month).zfill(2)
+        day_text = str(day).zfill(2)
+        key = f'{month_text}-{day_text}'
+
+        if key in self._day_cells:
+            return self._day_cells[key]
+
         today = self.date_time.date
 
+        if key in self._holidays_other_calendar:
+            tag = 'f'
+        elif key in self._events_other_calendar:
+            tag = 'a'
+        elif key in self._holidays:
+            tag = 'h'
+        elif key in self._events:
+            tag = 'e'
+        elif day_text == '30' and month_text in ('02', '05', '12', '15'):
+            tag = 'q'
+        else:
+            tag = 'd'
+
+        if key == f'{str(today.month).zfill(2)}-{str(today.day).zfill(2)}':
+            tag = tag.upper()
+
+        cell = f'[S{tag}_{day_text}]' + self._day_text(month, day) + f'[E{tag}_{day_text}]'
+        self._day_cells[key] = cell
+        return cell
+
+    def _write_month_template(self, output: io.StringIO, month: SezimalInteger = None, year: SezimalInteger = None, with_year: bool = True) -> None:
         if not month:
             month = self.date_time.month
 
@@ -359,92 +493,31 @@ class SezimalCalendar:
             year = self.date_time.year
 
         date = SezimalDate(year, month, 30)
-
-        calendar = ''
-
-        if self._day_format in ('#-dY', '#dY', '#!-dY', '#!dY', '#?-dY', '#?dY'):
-            width = 4
-        else:
-            width = 3
+        width = self._day_width()
 
         if with_year:
             header = date.format(self._month_year_format, locale=self.locale)
         else:
             header = date.format(self._month_format, locale=self.locale)
 
-        calendar += f'[SM_{str(month).zfill(2)}]' + self.locale.center(header, (SezimalInteger(11) * width) + 10) + f'[EM_{str(month).zfill(2)}]\n'
-
-        header = self._week_header()
-
-        if self.locale.RTL and self._use_rtl:
-            header = header[::-1]
-            calendar += ' '.join(header) + '\n'
-        else:
-            calendar += ' '.join(header) + '\n'
+        output.write(f'[SM_{str(month).zfill(2)}]' + self.locale.center(header, (SezimalInteger(11) * width) + 10) + f'[EM_{str(month).zfill(2)}]\n')
+        output.write(self._week_header_line())
 
-        if self.locale.RTL:
-            monday =    f'{RTL_MARKER}{self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[0], 0, width)}{LTR_MARKER}'
-            tuesday =   f'{RTL_MARKER}{self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[1], 0, width)}{LTR_MARKER}'
-            wednesday = f'{RTL_MARKER}{self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[2], 0, width)}{LTR_MARKER}'
-            thursday =  f'{RTL_MARKER}{self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[3], 0, width)}{LTR_MARKER}'
-            friday =    f'{RTL_MARKER}{self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[4], 0, width)}{LTR_MARKER}'
-            saturday =  f'{RTL_MARKER}{self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[5], 0, width)}{LTR_MARKER}'
-            sunday =    f'{RTL_MARKER}{self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[6], 0, width)}{LTR_MARKER}'
+        empty_day = f'[Sd_00]{"".ljust(width)}[Ed_00]'
 
-        else:
-            monday =    self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[0], 0, width)
-            tuesday =   self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[1], 0, width)
-            wednesday = self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[2], 0, width)
-            thursday =  self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[3], 0, width)
-            friday =    self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[4], 0, width)
-            saturday =  self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[5], 0, width)
-            sunday =    self.locale.slice(self.locale.WEEKDAY_ABBREVIATED_NAME[6], 0, width)
-
-        calendar = calendar.replace(WEEKDAY_MONDAY,    '[SW_01]' + self.locale.rjust(monday, width) + '[EW_01]')
-        calendar = calendar.replace(WEEKDAY_TUESDAY,   '[SW_02]' + self.locale.rjust(tuesday, width) + '[EW_02]')
-        calendar = calendar.replace(WEEKDAY_WEDNESDAY, '[SW_03]' + self.locale.rjust(wednesday, width) + '[EW_03]')
-        calendar = calendar.replace(WEEKDAY_THURSDAY,  '[SW_04]' + self.locale.rjust(thursday, width) + '[EW_04]')
-        calendar = calendar.replace(WEEKDAY_FRIDAY,    '[SW_05]' + self.locale.rjust(friday, width) + '[EW_05]')
-        calendar = calendar.replace(WEEKDAY_SATURDAY,  '[SW_10]' + self.locale.rjust(saturday, width) + '[EW_10]')
-        calendar = calendar.replace(WEEKDAY_SUNDAY,    '[SW_11]' + self.locale.rjust(sunday, width) + '[EW_11]')
-
-        for week in self._weeks(month, year):
+        for week in _month_grid(self.first_weekday, date.is_long_month):
             if self.locale.RTL and self._use_rtl:
                 week = week[::-1]
 
-            for day in week:
-                if day == 0:
-                    calendar += f'[Sd_00]{"".ljust(width)}[Ed_00] '
-                    continue
-
-                date = SezimalDate(today.year, month, day)
-                key = date.format('#m-#d')
-
-                if key in self._holidays_other_calendar:
-                    tag = 'f'
-                elif key in self._events_other_calendar:
-                    tag = 'a'
-                elif key in self._holidays:
-                    tag = 'h'
-                elif key in self._events:
-                    tag = 'e'
-                elif date.day == 30 and date.month in (2, 5, 12, 15):
-                    tag = 'q'
-                else:
-                    tag = 'd'
-
-                if date == today:
-                    tag = tag.upper()
+            output.write(' '.join(self._day_cell(month, day) if day else empty_day for day in week))
+            output.write('\n')
 
-                calendar += f'[S{tag}_{str(day).zfill(2)}]' + self.locale.rjust(date.format(self._day_format, locale=self.locale), width) + f'[E{tag}_{str(day).zfill(2)}] '
-
-            calendar = calendar[:-1] + '\n'
-
-        return calendar
-
-    def _quarter_template(self, month: SezimalInteger = None, with_year: bool = True) -> str:
-        today = self.date_time.date
+    def _month_template(self, month: SezimalInteger = None, year: SezimalInteger = None, with_year: bool = True) -> str:
+        output = io.StringIO()
+        self._write_month_template(output, month, year, with_year)
+        return output.getvalue()
 
+    def _write_quarter_template(self, output: io.StringIO, month: SezimalInteger = None, with_year: bool = True) -> None:
         if not month:
             month = self.date_time.month
 
@@ -457,77 +530,60 @@ class SezimalCalendar:
         third_month_calendar = self._month_template(third_month_date.month, third_month_date.year, with_year=with_year)
 
         if self._locale.RTL and self._use_rtl:
-            calendar = self._merge_lines(second_month_calendar, first_month_calendar)
-            calendar = self._merge_lines(third_month_calendar, calendar)
+            self._write_merged_lines(output, third_month_calendar, self._merge_lines(second_month_calendar, first_month_calendar))
         else:
-            calendar = self._merge_lines(first_month_calendar, second_month_calendar)
-            calendar = self._merge_lines(calendar, third_month_calendar)
+            self._write_merged_lines(output, self._merge_lines(first_month_calendar, second_month_calendar), third_month_calendar)
 
-        return calendar
+    def _quarter_template(self, month: SezimalInteger = None, with_year: bool = True) -> str:
+        output = io.StringIO()
+        self._write_quarter_template(output, month, with_year)
+        return output.getvalue()
 
-    def _merge_lines(self, calendar_1: str, calendar_2: str) -> str:
+    def _write_merged_lines(self, output: io.StringIO, calendar_1: str, calendar_2: str) -> None:
         lines_1 = calendar_1.splitlines()
         lines_2 = calendar_2.splitlines()
 
-        max_line_size_1 = 0
-        max_line_size_2 = 0
-
-        for line in lines_1:
-            cleaned_line = self._clear_template(line)
-
-            if max_line_size_1 < self.locale.len(cleaned_line):
-                max_line_size_1 = self.locale.len(cleaned_line)
-
-        for line in lines_2:
-            cleaned_line = self._clear_template(line)
-
-            if max_line_size_2 < self.locale.len(cleaned_line):
-                max_line_size_2 = self.locale.len(cleaned_line)
+        max_line_size_1 = max((self.locale.len(self._clear_template(line)) for line in lines_1), default=0)
+        max_line_size_2 = max((self.locale.len(self._clear_template(line)) for line in lines_2), default=0)
 
         amount_lines_1 = len(lines_1)
         amount_lines_2 = len(lines_2)
 
-        calendar = ''
-
         for i in range(max(amount_lines_1, amount_lines_2)):
             if i >= amount_lines_1:
                 line_1 = self.locale.ljust('', max_line_size_1)
             else:
-                # line_1 = lines_1[i]
                 line_1 = self.locale.ljust(lines_1[i], max_line_size_1)
 
             if i >= amount_lines_2:
                 line_2 = self.locale.ljust('', max_line_size_2)
             else:
-                # line_2 = lines_2[i]
                 line_2 = self.locale.ljust(lines_2[i], max_line_size_2)
 
-            calendar += line_1 + '  ' + line_2 + '\n'
+            output.write(line_1 + '  ' + line_2 + '\n')
 
-        return calendar
+    def _merge_lines(self, calendar_1: str, calendar_2: str) -> str:
+        output = io.StringIO()
+        self._write_merged_lines(output, calendar_1, calendar_2)
+        return output.getvalue()
+
+    def _write_year_template(self, output: io.StringIO) -> None:
+        output.write('\n[SY]' + self.locale.center(self.date_time.format(self._year_format, self.locale), 222) + '[EY]\n\n')
+        self._write_quarter_template(output, 1, with_year=False)
+        output.write('\n')
+        self._write_quarter_template(output, 4, with_year=False)
+        output.write('\n')
+        self._write_quarter_template(output, 11, with_year=False)
+        output.write('\n')
+        self._write_quarter_template(output, 14, with_year=False)
 
     def _year_template(self) -> str:
-        calendar = '\n[SY]' + self.locale.center(self.date_time.format(self._year_format, self.locale), 222) + '[EY]\n\n'
-        calendar += self._quarter_template(1, with_year=False)
-        calendar += '\n' + self._quarter_template(4, with_year=False)
-        calendar += '\n' + self._quarter_template(11, with_year=False)
-        calendar += '\n' + self._quarter_template(14, with_year=False)[:-1]
-        return calendar
+        output = io.StringIO()
+        self._write_year_template(output)
+        return output.getvalue()[:-1]
 
     def _clear_template(self, calendar: str) -> str:
-        for tag in (
-            'Y', 'd_00', 'q_30', 'Q_30',
-            'M_01', 'M_02', 'M_03', 'M_04', 'M_05', 'M_10',
-            'M_11', 'M_12', 'M_13', 'M_14', 'M_15', 'M_20',
-            'W_01', 'W_02', 'W_03', 'W_04', 'W_05', 'W_10', 'W_11',
-        ):
-            calendar = calendar.replace(f'[S{tag}]', '').replace(f'[E{tag}]', '')
-
-        for day in SezimalRange(1, 100):
-            for tag in ('h', 'H', 'f', 'F', 'e', 'E', 'a', 'A', 'd', 'D'):
-                calendar = calendar.replace(f'[S{tag}_{str(day).zfill(2)}]', '').replace(f'[E{tag}_{str(day).zfill(2)}]', '')
-
-        return calendar
+        return _TEMPLATE_TAG.sub(_clear_template_tag, calendar)
 
     def month(self, month: SezimalInteger = None, year: SezimalInteger = None,
               include_time: bool = True, include_events: bool = True,
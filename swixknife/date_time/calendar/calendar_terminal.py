@@ -1,6 +1,7 @@
 
 
 from .calendar import *
+from .calendar import _replace_template_tags
 from ..date import SezimalDate
 from ..date_time import SezimalDateTime
 from ..sun_moon import list_sun_moon
@@ -40,20 +41,30 @@ class SezimalCalendarTerminal(SezimalCalendar):
     COLOR_TODAY = TERMINAL_COLOR_START + '38;5;233;48;5;231' + TERMINAL_COLOR_END
 
     def _color_template(self, calendar: str) -> str:
-        calendar = calendar.replace('[SY]', self.COLOR_YEAR)
-        calendar = calendar.replace('[EY]', TERMINAL_COLOR_RESET)
+        return _replace_template_tags(calendar, self._template_colors())
 
-        calendar = calendar.replace('[Sd_00]', '').replace('[Ed_00]', '')
-
-        calendar = self._color_month_season(calendar)
-        calendar = self._color_weekday(calendar, self._locale.DAY_OF_REST, self.COLOR_DAY_OF_REST, self.COLOR_DAY_OF_REST_MARKED)
-        calendar = self._color_weekday(calendar, self._locale.OPTIONAL_DAY_OF_REST, self.COLOR_OPTIONAL_DAY_OF_REST, self.COLOR_OPTIONAL_DAY_OF_REST_MARKED)
-        calendar = self._color_midquarter_day(calendar)
-        calendar = self._color_holidays_events(calendar)
-        calendar = self._color_holidays_events_other_calendar(calendar)
+    def _template_colors(self) -> dict[str, str]:
+        #
+        # What each tag is replaced by; the first color given to a tag
+        # is the one kept, so the order below sets which color wins
+        # when a day is, e.g., both a holiday and a day of rest
+        #
+        colors = {
+            'SY': self.COLOR_YEAR,
+            'EY': TERMINAL_COLOR_RESET,
+            'Sd_00': '',
+            'Ed_00': '',
+        }
+
+        self._color_month_season(colors)
+        self._color_weekday(colors, self._locale.DAY_OF_REST, self.COLOR_DAY_OF_REST, self.COLOR_DAY_OF_REST_MARKED)
+        self._color_weekday(colors, self._locale.OPTIONAL_DAY_OF_REST, self.COLOR_OPTIONAL_DAY_OF_REST, self.COLOR_OPTIONAL_DAY_OF_REST_MARKED)
+        self._color_midquarter_day(colors)
+        self._color_holidays_events(colors)
+        self._color_holidays_events_other_calendar(colors)
 
         for weekday in WEEKDAYS:
-            calendar = self._color_weekday(calendar, weekday, '', self.COLOR_TODAY)
+            self._color_weekday(colors, weekday, '', self.COLOR_TODAY)
 
         # if self._locale.IDEOGRAPHIC:
             # calendar = calendar.replace('\ufe0f', ' \ufe0f')
@@ -62,56 +73,34 @@ class SezimalCalendarTerminal(SezimalCalendar):
             # calendar = calendar.replace('(', '（')
             # calendar = calendar.replace(')', '）')
 
-        return calendar
+        return colors
+
+    def _set_tag_color(self, colors: dict[str, str], tag: str, color: str) -> None:
+        colors.setdefault(f'S{tag}', color)
+        colors.setdefault(f'E{tag}', TERMINAL_COLOR_RESET if color else '')
 
-    def _color_month_season(self, calendar: str) -> str:
+    def _color_month_season(self, colors: dict[str, str]) -> None:
         if self._hemisphere == 'N':
-            calendar = calendar.replace('[SM_01]', self.COLOR_WINTER).replace('[EM_01]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_02]', self.COLOR_WINTER).replace('[EM_02]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_03]', self.COLOR_SPRING).replace('[EM_03]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_04]', self.COLOR_SPRING).replace('[EM_04]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_05]', self.COLOR_SPRING).replace('[EM_05]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_10]', self.COLOR_SUMMER).replace('[EM_10]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_11]', self.COLOR_SUMMER).replace('[EM_11]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_12]', self.COLOR_SUMMER).replace('[EM_12]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_13]', self.COLOR_AUTUMN).replace('[EM_13]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_14]', self.COLOR_AUTUMN).replace('[EM_14]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_15]', self.COLOR_AUTUMN).replace('[EM_15]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_20]', self.COLOR_WINTER).replace('[EM_20]', TERMINAL_COLOR_RESET)
+            dec_feb, mar_may, jun_aug, sep_nov = self.COLOR_WINTER, self.COLOR_SPRING, self.COLOR_SUMMER, self.COLOR_AUTUMN
 
         elif self._hemisphere == 'S':
-            calendar = calendar.replace('[SM_01]', self.COLOR_SUMMER).replace('[EM_01]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_02]', self.COLOR_SUMMER).replace('[EM_02]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_03]', self.COLOR_AUTUMN).replace('[EM_03]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_04]', self.COLOR_AUTUMN).replace('[EM_04]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_05]', self.COLOR_AUTUMN).replace('[EM_05]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_10]', self.COLOR_WINTER).replace('[EM_10]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_11]', self.COLOR_WINTER).replace('[EM_11]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_12]', self.COLOR_WINTER).replace('[EM_12]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_13]', self.COLOR_SPRING).replace('[EM_13]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_14]', self.COLOR_SPRING).replace('[EM_14]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_15]', self.COLOR_SPRING).replace('[EM_15]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_20]', self.COLOR_SUMMER).replace('[EM_20]', TERMINAL_COLOR_RESET)
+            dec_feb, mar_may, jun_aug, sep_nov = self.COLOR_SUMMER, self.COLOR_AUTUMN, self.COLOR_WINTER, self.COLOR_SPRING
 
         else:
-            calendar = calendar.replace('[SM_01]', self.COLOR_SUMMER).replace('[EM_01]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_02]', self.COLOR_SUMMER).replace('[EM_02]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_03]', self.COLOR_SUMMER).replace('[EM_03]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_04]', self.COLOR_SUMMER).replace('[EM_04]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_05]', self.COLOR_SUMMER).replace('[EM_05]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_10]', self.COLOR_SUMMER).replace('[EM_10]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_11]', self.COLOR_SUMMER).replace('[EM_11]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_12]', self.COLOR_SUMMER).replace('[EM_12]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_13]', self.COLOR_SUMMER).replace('[EM_13]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_14]', self.COLOR_SUMMER).replace('[EM_14]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_15]', self.COLOR_SUMMER).replace('[EM_15]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace('[SM_20]', self.COLOR_SUMMER).replace('[EM_20]', TERMINAL_COLOR_RESET)
-
-        return calendar
-
-    def _color_weekday(self, calendar: str, weekday: str, color: str, color_marked: str) -> str:
+            dec_feb = mar_may = jun_aug = sep_nov = self.COLOR_SUMMER
+
+        for month, color in (
+            ('01', dec_feb), ('02', dec_feb),
+            ('03', mar_may), ('04', mar_may), ('05', mar_may),
+            ('10', jun_aug), ('11', jun_aug), ('12', jun_aug),
+            ('13', sep_nov), ('14', sep_nov), ('15', sep_nov),
+            ('20', dec_feb),
+        ):
+            self._set_tag_color(colors, f'M_{month}', color)
+
+    def _color_weekday(self, colors: dict[str, str], weekday: str, color: str, color_marked: str) -> None:
         if not weekday:
-            return calendar
+            return
 
         #
         # Days of rest
@@ -138,46 +127,29 @@ class SezimalCalendarTerminal(SezimalCalendar):
             days = ['01', '12', '23', '34', '45']
             weekday_tag = 'W_01'
 
-        if color:
-            calendar = calendar.replace(f'[S{weekday_tag}]', color).replace(f'[E{weekday_tag}]', TERMINAL_COLOR_RESET)
-        else:
-            calendar = calendar.replace(f'[S{weekday_tag}]', '').replace(f'[E{weekday_tag}]', '')
+        self._set_tag_color(colors, weekday_tag, color)
 
         for day in days:
-            if color:
-                calendar = calendar.replace(f'[Sd_{day}]', color).replace(f'[Ed_{day}]', TERMINAL_COLOR_RESET)
-            else:
-                calendar = calendar.replace(f'[Sd_{day}]', '').replace(f'[Ed_{day}]', '')
-
-            if color_marked:
-                calendar = calendar.replace(f'[SD_{day}]', color_marked).replace(f'[ED_{day}]', TERMINAL_COLOR_RESET)
-            else:
-                calendar = calendar.replace(f'[SD_{day}]', '').replace(f'[ED_{day}]', '')
-
-        return calendar
+            self._set_tag_color(colors, f'd_{day}', color)
+            self._set_tag_color(colors, f'D_{day}', color_marked)
 
-    def _color_midquarter_day(self, calendar: str) -> str:
-        calendar = calendar.replace('[Sq_30]', self.COLOR_MIDQUARTER).replace('[Eq_30]', TERMINAL_COLOR_RESET)
-        calendar = calendar.replace('[SQ_30]', self.COLOR_MIDQUARTER_MARKED).replace('[EQ_30]', TERMINAL_COLOR_RESET)
-        return calendar
+    def _color_midquarter_day(self, colors: dict[str, str]) -> None:
+        self._set_tag_color(colors, 'q_30', self.COLOR_MIDQUARTER)
+        self._set_tag_color(colors, 'Q_30', self.COLOR_MIDQUARTER_MARKED)
 
-    def _color_holidays_events(self, calendar: str) -> str:
+    def _color_holidays_events(self, colors: dict[str, str]) -> None:
         for day in SezimalRange(1, 100):
-            calendar = calendar.replace(f'[Sh_{str(day).zfill(2)}]', self.COLOR_HOLIDAY).replace(f'[Eh_{str(day).zfill(2)}]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace(f'[SH_{str(day).zfill(2)}]', self.COLOR_HOLIDAY_MARKED).replace(f'[EH_{str(day).zfill(2)}]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace(f'[Se_{str(day).zfill(2)}]', self.COLOR_EVENT).replace(f'[Ee_{str(day).zfill(2)}]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace(f'[SE_{str(day).zfill(2)}]', self.COLOR_EVENT_MARKED).replace(f'[EE_{str(day).zfill(2)}]', TERMINAL_COLOR_RESET)
-
-        return calendar
+            self._set_tag_color(colors, f'h_{str(day).zfill(2)}', self.COLOR_HOLIDAY)
+            self._set_tag_color(colors, f'H_{str(day).zfill(2)}', self.COLOR_HOLIDAY_MARKED)
+            self._set_tag_color(colors, f'e_{str(day).zfill(2)}', self.COLOR_EVENT)
+            self._set_tag_color(colors, f'E_{str(day).zfill(2)}', self.COLOR_EVENT_MARKED)
 
-    def _color_holidays_events_other_calendar(self, calendar: str) -> str:
+    def _color_holidays_events_other_calendar(self, colors: dict[str, str]) -> None:
         for day in SezimalRange(1, 100):
-            calendar = calendar.replace(f'[Sf_{str(day).zfill(2)}]', self.COLOR_HOLIDAY_OTHER_CALENDAR).replace(f'[Ef_{str(day).zfill(2)}]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace(f'[SF_{str(day).zfill(2)}]', self.COLOR_HOLIDAY_OTHER_CALENDAR_MARKED).replace(f'[EF_{str(day).zfill(2)}]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace(f'[Sa_{str(day).zfill(2)}]', self.COLOR_EVENT_OTHER_CALENDAR).replace(f'[Ea_{str(day).zfill(2)}]', TERMINAL_COLOR_RESET)
-            calendar = calendar.replace(f'[SA_{str(day).zfill(2)}]', self.COLOR_EVENT_OTHER_CALENDAR_MARKED).replace(f'[EA_{str(day).zfill(2)}]', TERMINAL_COLOR_RESET)
-
-        return calendar
+            self._set_tag_color(colors, f'f_{str(day).zfill(2)}', self.COLOR_HOLIDAY_OTHER_CALENDAR)
+            self._set_tag_color(colors, f'F_{str(day).zfill(2)}', self.COLOR_HOLIDAY_OTHER_CALENDAR_MARKED)
+            self._set_tag_color(colors, f'a_{str(day).zfill(2)}', self.COLOR_EVENT_OTHER_CALENDAR)
+            self._set_tag_color(colors, f'A_{str(day).zfill(2)}', self.COLOR_EVENT_OTHER_CALENDAR_MARKED)
 
     def month(self, month: SezimalInteger = None, year: SezimalInteger = None,
               include_time: bool = True, include_events: bool = True,
@@ -0,0 +1,206 @@
+
+__all__ = ('CalendarCache', 'CALENDAR_CACHE_VERSION')
+
+import json
+import os
+import pathlib
+import tempfile
+
+from ..sezimal import Sezimal, SezimalInteger
+from ..functions import SezimalDictionary, SezimalList
+from .date import SezimalDate
+from .time import SezimalTime
+from .date_time import SezimalDateTime
+
+
+#
+# Bump it whenever the layout of the files, or of the events
+# stored in them, changes; files from other versions are simply
+# not found anymore, since the version is part of the file name
+#
+CALENDAR_CACHE_VERSION = 1
+
+CALENDAR_CACHE_DIRECTORY = pathlib.Path.home().joinpath('.sezimal')
+
+
+def _date_fields(date: SezimalDate | SezimalDateTime) -> list[str]:
+    return [str(date.year), str(date.month), str(date.day)]
+
+
+def _time_fields(time: SezimalTime | SezimalDateTime) -> list[str]:
+    return [
+        str(time.uta), str(time.posha), str(time.agrima),
+        str(time.anuga), str(time.boda), str(time.shaditiboda),
+        str(time.time_zone),
+    ]
+
+
+class CalendarCache:
+    #
+    # On disk cache of the calendar events of a whole year
+    # (holidays, seasons and moon phases), one JSON file per year
+    # and locale, under ~/.sezimal/<locale>/;
+    # the numbers, dates and times are stored as tagged values,
+    # {"SezimalDate": ["213214", "14", "33"]}, so reading them back
+    # needs no eval, and only the event_class given
+    # is ever created from the file;
+    # the files are written to a temporary file first, and then
+    # moved over the old one, so other processes sharing the same
+    # directory see either the whole old file or the whole new one
+    #
+    def __init__(self, event_class: type = None, directory: str | pathlib.Path = CALENDAR_CACHE_DIRECTORY):
+        self.event_class = event_class
+        self.directory = pathlib.Path(directory)
+
+    def file_path(self, locale: str, cache_key: str) -> pathlib.Path:
+        file_name = cache_key.replace('|', '_').replace('/', '_')
+        return self.directory.joinpath(locale, f'{file_name}.v{CALENDAR_CACHE_VERSION}.json')
+
+    def _encode(self, value):
+        type_name = type(value).__name__
+
+        if type_name in ('SezimalDictionary', 'dict', 'OrderedDict'):
+            return {'SezimalDictionary': [[self._encode(key), self._encode(item)] for key, item in value.items()]}
+
+        elif type_name in ('SezimalList', 'list', 'tuple'):
+            return [self._encode(item) for item in value]
+
+        elif type_name in ('Sezimal', 'SezimalInteger'):
+            return {type_name: str(value)}
+
+        elif type_name == 'SezimalDate':
+            return {type_name: _date_fields(value)}
+
+        elif type_name == 'SezimalTime':
+            return {type_name: _time_fields(value)}
+
+        elif type_name == 'SezimalDateTime':
+            return {type_name: _date_fields(value) + _time_fields(value)}
+
+        elif self.event_class is not None and type(value) == self.event_class:
+            return {'event': {name: self._encode(item) for name, item in vars(value).items()}}
+
+        elif value is None or type_name in ('str', 'bool', 'int', 'float'):
+            return value
+
+        raise TypeError(f'A {type_name} can’t be stored in the calendar cache')
+
+    def _decode(self, value):
+        if type(value) == list:
+            return SezimalList([self._decode(item) for item in value])
+
+        if type(value) != dict:
+            return value
+
+        (type_name, fields), = value.items()
+
+        if type_name == 'SezimalDictionary':
+            return SezimalDictionary([(self._decode(key), self._decode(item)) for key, item in fields])
+
+        elif type_name == 'SezimalInteger':
+            return SezimalInteger(fields)
+
+        elif type_name == 'Sezimal':
+            return Sezimal(fields)
+
+        elif type_name == 'SezimalDate':
+            return SezimalDate(*fields)
+
+        elif type_name == 'SezimalTime':
+            return SezimalTime(*fields[:-1], time_zone=fields[-1])
+
+        elif type_name == 'SezimalDateTime':
+            return SezimalDateTime(*fields[:-1], time_zone=fields[-1])
+
+        elif type_name == 'event' and self.event_class is not None:
+            #
+            # The event is created without calling __init__,
+            # which would make up a new id, and parse the dates again
+            #
+            event = self.event_class.__new__(self.event_class)
+            event.__dict__.update({name: self._decode(item) for name, item in fields.items()})
+            return event
+
+        raise ValueError(f'Unknown value {type_name} in the calendar cache')
+
+    def exists(self, locale: str, cache_key: str) -> bool:
+        return self.file_path(locale, cache_key).is_file()
+
+    def _load(self, file_path: pathlib.Path, cache_key: str = None) -> tuple[str, SezimalDictionary] | None:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+
+        except (OSError, ValueError):
+            return None
+
+        if type(data) != dict \
+            or data.get('version') != CALENDAR_CACHE_VERSION \
+            or (cache_key is not None and data.get('key') != cache_key):
+            return None
+
+        try:
+            return data['key'], self._decode(data['events'])
+
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def read(self, locale: str, cache_key: str) -> SezimalDictionary | None:
+        loaded = self._load(self.file_path(locale, cache_key), cache_key)
+
+        if loaded is None:
+            return None
+
+        return loaded[1]
+
+    def write(self, locale: str, cache_key: str, events: SezimalDictionary) -> None:
+        file_path = self.file_path(locale, cache_key)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            'version': CALENDAR_CACHE_VERSION,
+            'key': cache_key,
+            'events': self._encode(events),
+        }
+
+        handle, temporary_path = tempfile.mkstemp(dir=file_path.parent, prefix='.', suffix='.tmp')
+
+        try:
+            with os.fdopen(handle, 'w', encoding='utf-8') as file:
+                json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
+
+            os.chmod(temporary_path, 0o644)
+            os.replace(temporary_path, file_path)
+
+        except BaseException:
+            pathlib.Path(temporary_path).unlink(missing_ok=True)
+            raise
+
+    def _locale_directories(self, locales: list[str] = None) -> list[pathlib.Path]:
+        if locales:
+            return [self.directory.joinpath(locale) for locale in locales]
+
+        if not self.directory.is_dir():
+            return []
+
+        return [path for path in self.directory.iterdir() if path.is_dir()]
+
+    def read_all(self, locales: list[str] = None):
+        #
+        # All the events stored, as (cache_key, events),
+        # for all the locales, or only the ones asked for
+        #
+        for directory in self._locale_directories(locales):
+            for file_path in sorted(directory.glob(f'*.v{CALENDAR_CACHE_VERSION}.json')):
+                loaded = self._load(file_path)
+
+                if loaded is not None:
+                    yield loaded
+
+    def invalidate(self, locale: str, cache_key: str) -> None:
+        self.file_path(locale, cache_key).unlink(missing_ok=True)
+
+    def clear(self, locales: list[str] = None) -> None:
+        for directory in self._locale_directories(locales):
+            for file_path in directory.glob(f'*.v{CALENDAR_CACHE_VERSION}.json'):
+                file_path.unlink(missing_ok=True)
@@ -33,19 +33,23 @@ from ..base import decimal_format, sezimal_format, \
     default_niftimal_to_sezimal_digits, default_niftimal_to_regularized_digits, \
     default_niftimal_to_niftimal_digits
 from .gregorian_functions import ordinal_date_to_gregorian_year_month_day, \
-    gregorian_year_month_day_to_iso_year_week_day
+    gregorian_year_month_day_to_iso_year_week_day, \
+    _ord2ymd, _ymd2ord, _ord2iso, _iso2ord
 from ..units import sezimal_to_decimal_unit
 from .date_time_delta import SezimalDateTimeDelta
 from ..localization import sezimal_locale, DEFAULT_LOCALE, SezimalLocale
 from .sezimal_functions import *
+from .sezimal_functions import _ISO_YEAR_DIFF, _is_leap, _integer, _sezimal_integer, \
+    _year_month_day_to_ordinal, _ordinal_to_year_month_day
 from .format_tokens import DATE_NUMBER_FORMAT_TOKENS, \
     YEAR_NUMBER_FORMAT_TOKENS, DATE_TEXT_FORMAT_TOKEN, \
-    ISO_DATE_NUMBER_FORMAT_TOKENS
+    ISO_DATE_NUMBER_FORMAT_TOKENS, compile_date_format
 from .dcc_functions import \
     ordinal_date_to_year_month_day as ordinal_date_to_dcc_year_month_day, \
     year_month_day_to_ordinal_date as dcc_year_month_day_to_ordinal_date, \
     is_leap as dcc_is_leap, is_long_year as dcc_is_long_year, \
-    is_short_year as dcc_is_short_year
+    is_short_year as dcc_is_short_year, \
+    _ordinal_date_to_year_month_day as _ordinal_date_to_dcc_year_month_day
 
 
 try:
@@ -70,7 +74,8 @@ except:
 class SezimalDate:
     __slots__ = (
         '_year', '_month', '_day', '_hashcode', '_gregorian_date',
-        '_is_leap', '_ordinal_date', '_weekday',
+        '_gregorian_year_month_day', '_iso_year_week_day',
+        '_is_leap', '_ordinal_date', '_ordinal', '_weekday',
         '_day_in_year', '_day_in_week', '_week_in_year',
         '_quarter', '_day_in_quarter', '_week_in_quarter', '_month_in_quarter',
         '_dcc_date'
@@ -84,7 +89,7 @@ class SezimalDate:
         ) -> Self:
         if month is None:
             if type(year) in (_datetime.date, _datetime.datetime):
-                return cls.from_ordinal_date(Decimal(year.toordinal()))
+                return cls._from_ordinal(year.toordinal())
 
             elif type(year).__name__ in ('SezimalDate', 'SezimalDateTime', 'SezimalTime'):
                 return cls.from_ordinal_date(year.ordinal_date)
@@ -93,9 +98,14 @@ class SezimalDate:
                 if VALID_DATE_STRING.match(year):
                     year, month, day = year.split('-')
 
-        year = SezimalInteger(year)
-        month = SezimalInteger(month)
-        day = SezimalInteger(day)
+        if type(year) != SezimalInteger:
+            year = SezimalInteger(year)
+
+        if type(month) != SezimalInteger:
+            month = SezimalInteger(month)
+
+        if type(day) != SezimalInteger:
+            day = SezimalInteger(day)
 
         check_date_fields(year, month, day)
 
@@ -103,35 +113,77 @@ class SezimalDate:
         self._year = year
         self._month = month
         self._day = day
-        self._ordinal_date = year_month_day_to_ordinal(year, month, day)
+        self._ordinal = _year_month_day_to_ordinal(int(year), int(month), int(day))
+        self._ordinal_date = _sezimal_integer(self._ordinal)
+        self._hashcode = -1
+
+        return self
+
+    @classmethod
+    def _from_ordinal(cls, ordinal_date: int) -> Self:
+        year, month, day, *fields = _ordinal_to_year_month_day(ordinal_date)
 
-        y, m, d, diy, wiy, q, diq, wiq, miq = ordinal_to_year_month_day(self._ordinal_date)
+        self = object.__new__(cls)
+        self._year = _sezimal_integer(year)
+        self._month = _sezimal_integer(month)
+        self._day = _sezimal_integer(day)
+        self._ordinal = ordinal_date
+        self._ordinal_date = _sezimal_integer(ordinal_date)
+        self._hashcode = -1
 
-        self._day_in_year = diy
-        self._week_in_year = wiy
-        self._quarter = q
-        self._day_in_quarter = diq
-        self._week_in_quarter = wiq
-        self._month_in_quarter = miq
+        return self
 
-        self._weekday = day % SezimalInteger(11)
+    def __getattr__(self, name: str):
+        #
+        # Only the year, month, day and ordinal date are set
+        # when the date is created; all the other fields are
+        # calculated the first time they’re needed
+        #
+        if name in ('_day_in_year', '_week_in_year', '_quarter', '_day_in_quarter', '_week_in_quarter', '_month_in_quarter'):
+            y, m, d, diy, wiy, q, diq, wiq, miq = _ordinal_to_year_month_day(self._ordinal)
 
-        if self._weekday == 0:
-            self._weekday = SezimalInteger(11)
+            self._day_in_year = _sezimal_integer(diy)
+            self._week_in_year = _sezimal_integer(wiy)
+            self._quarter = _sezimal_integer(q)
+            self._day_in_quarter = _sezimal_integer(diq)
+            self._week_in_quarter = _sezimal_integer(wiq)
+            self._month_in_quarter = _sezimal_integer(miq)
 
-        self._hashcode = -1
-        self._is_leap = is_leap(year - ISO_YEAR_DIFF)
+        elif name == '_weekday':
+            self._weekday = _sezimal_integer(int(self._day) % 7 or 7)
 
-        gregorian_date = ordinal_date_to_gregorian_year_month_day(int(self._ordinal_date.decimal))
+        elif name == '_is_leap':
+            self._is_leap = _is_leap(int(self._year) - _ISO_YEAR_DIFF)
 
-        if gregorian_date[0] >= 1 and gregorian_date[0] <= 9_999:
-            self._gregorian_date = _datetime.date(*gregorian_date)
-        else:
-            self._gregorian_date = gregorian_date
+        elif name == '_gregorian_year_month_day':
+            self._gregorian_year_month_day = _ord2ymd(self._ordinal)
 
-        self._dcc_date = ordinal_date_to_dcc_year_month_day(self._ordinal_date)
+        elif name == '_iso_year_week_day':
+            self._iso_year_week_day = _ord2iso(self._ordinal)
 
-        return self
+        elif name == '_gregorian_date':
+            #
+            # The datetime.date is created only when it’s really needed,
+            # for strftime and the like; the Gregorian and ISO fields
+            # are all calculated with plain ints
+            #
+            gregorian_date = self._gregorian_year_month_day
+
+            if gregorian_date[0] >= 1 and gregorian_date[0] <= 9_999:
+                self._gregorian_date = _datetime.date(*gregorian_date)
+            else:
+                self._gregorian_date = gregorian_date
+
+        elif name == '_dcc_date':
+            self._dcc_date = tuple(
+                _sezimal_integer(field)
+                for field in _ordinal_date_to_dcc_year_month_day(self._ordinal)
+            )
+
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        return object.__getattribute__(self, name)
 
     # Additional constructors
 
@@ -139,8 +191,7 @@ class SezimalDate:
     def from_timestamp(cls, timestamp) -> Self:
         "Construct a date from a POSIX timestamp (like time.time())."
         y, m, d, hh, mm, ss, weekday, jday, dst = _time.localtime(timestamp)
-        x = _datetime.date(y, m, d)
-        return cls.from_ordinal_date(Decimal(x.toordinal()))
+        return cls._from_ordinal(_ymd2ord(y, m, d))
 
     @property
     def timestamp(self) -> float:
@@ -160,17 +211,15 @@ class SezimalDate:
 
     @classmethod
     def from_ordinal_date(cls, ordinal_date) -> Self:
-        ordinal_date = SezimalInteger(ordinal_date)
-        y, m, d, *x = ordinal_to_year_month_day(ordinal_date)
-        return cls(y, m, d)
+        return cls._from_ordinal(_integer(ordinal_date))
 
     @classmethod
     def from_iso_format(cls, date_string) -> Self:
-        return cls.from_ordinal_date(_datetime.date.fromisoformat(date_string).toordinal())
+        return cls._from_ordinal(_datetime.date.fromisoformat(date_string).toordinal())
 
     @classmethod
     def from_iso_calendar(cls, year, week, day) -> Self:
-        return cls.from_ordinal_date(_datetime.date.fromisocalendar(year, week, day).toordinal())
+        return cls._from_ordinal(_iso2ord(int(year), int(week), int(day)))
 
     def __repr__(self) -> str:
         return f'{self.__class__.__qualname__}({self.year.formatted_number}, {self.month}, {self.day})'
@@ -461,16 +510,17 @@ class SezimalDate:
             fmt = locale.DATE_FORMAT
 
         fmt = fmt.replace('##', '__HASHTAG__')
+        format_tokens = compile_date_format(fmt)
 
         #
         # Astronomical formats: seasons and moon phases
         #
-        fmt = self._apply_season_format(fmt, locale=locale, time_zone=time_zone)
+        fmt = self._apply_season_format(fmt, locale=locale, time_zone=time_zone, format_tokens=format_tokens)
 
         #
         # Day Count Calendar formats
         #
-        fmt = self._apply_dcc_formats(fmt, locale=locale)
+        fmt = self._apply_dcc_formats(fmt, locale=locale, format_tokens=format_tokens)
 
         #
         # Locale’s date separator
@@ -518,7 +568,7 @@ class SezimalDate:
         # Let’s deal first with the numeric formats
         #
         for regex, token, base, zero, character, value_name, \
-            size, size_niftimal, size_decimal in DATE_NUMBER_FORMAT_TOKENS:
+            size, size_niftimal, size_decimal in format_tokens['date_number']:
             if not regex.findall(fmt):
                 continue
 
@@ -537,7 +587,7 @@ class SezimalDate:
         #
         # Formatted year number
         #
-        for regex, token, base, separator, character, value_name in YEAR_NUMBER_FORMAT_TOKENS:
+        for regex, token, base, separator, character, value_name in format_tokens['year_number']:
             if not regex.findall(fmt):
                 continue
 
@@ -680,7 +730,7 @@ class SezimalDate:
             fmt = fmt.replace('%%', '__PERCENT__')
 
             for regex, token, base, zero, character, value_name, \
-                size_decimal, size_niftimal, size_sezimal in ISO_DATE_NUMBER_FORMAT_TOKENS:
+                size_decimal, size_niftimal, size_sezimal in format_tokens['iso_date_number']:
                 if not regex.findall(fmt):
                     continue
 
@@ -733,28 +783,19 @@ class SezimalDate:
 
     @classmethod
     def from_gregorian(cls, year: int | Decimal, month: int | Decimal, day: int | Decimal) -> Self:
-        return cls.from_ordinal_date(gregorian_year_month_day_to_ordinal_date(int(year), int(month), int(day)))
+        return cls._from_ordinal(_ymd2ord(int(year), int(month), int(day)))
 
     @property
     def gregorian_year(self) -> Decimal:
-        if type(self._gregorian_date) in (list, tuple):
-            return Decimal(self._gregorian_date[0])
-
-        return Decimal(self.gregorian_date.year)
+        return Decimal(self._gregorian_year_month_day[0])
 
     @property
     def gregorian_month(self) -> Decimal:
-        if type(self._gregorian_date) in (list, tuple):
-            return Decimal(self._gregorian_date[1])
-
-        return Decimal(self.gregorian_date.month)
+        return Decimal(self._gregorian_year_month_day[1])
 
     @property
     def gregorian_day(self) -> Decimal:
-        if type(self._gregorian_date) in (list, tuple):
-            return Decimal(self._gregorian_date[2])
-
-        return Decimal(self.gregorian_date.day)
+        return Decimal(self._gregorian_year_month_day[2])
 
     @property
     def gregorian_is_leap(self) -> bool:
@@ -767,9 +808,7 @@ class SezimalDate:
 
     @property
     def gregorian_day_in_year(self) -> int:
-        last_years_last_ordinal_date = gregorian_year_month_day_to_ordinal_date(self.gregorian_year - 1, 12, 31)
-
-        return int(self.ordinal_date - last_years_last_ordinal_date)
+        return self._ordinal - _ymd2ord(self._gregorian_year_month_day[0] - 1, 12, 31)
 
     @property
     def gregorian_total_days_in_year(self) -> int:
@@ -779,34 +818,16 @@ class SezimalDate:
         return 365
 
     @property
-    def iso_year(self) -> int:
-        y, w, d = gregorian_year_month_day_to_iso_year_week_day(
-            self.gregorian_year,
-            self.gregorian_month,
-            self.gregorian_day,
-        )
-
-        return y
+    def iso_year(self) -> Decimal:
+        return Decimal(self._iso_year_week_day[0])
 
     @property
     def iso_week(self) -> int:
-        y, w, d = gregorian_year_month_day_to_iso_year_week_day(
-            self.gregorian_year,
-            self.gregorian_month,
-            self.gregorian_day,
-        )
-
-        return w
+        return self._iso_year_week_day[1]
 
     @property
     def iso_weekday(self) -> int:
-        y, w, d = gregorian_year_month_day_to_iso_year_week_day(
-            self.gregorian_year,
-            self.gregorian_month,
-            self.gregorian_day,
-        )
-
-        return d
+        return self._iso_year_week_day[2]
 
     @property
     def iso_total_weeks_in_year(self) -> int:
@@ -933,7 +954,7 @@ class SezimalDate:
 
         if day > 44:
             if (month not in (2, 5, 12, 15)) \
-                or (month == 20 and not _is_leap(year)):
+                or (month == 20 and not is_leap(SezimalInteger(year) - ISO_YEAR_DIFF)):
                 day -= 11
 
         return type(self)(year, month, day)
@@ -959,8 +980,8 @@ class SezimalDate:
         if type(other) != SezimalDate:
             other = SezimalDate(other)
 
-        this_ordinal = self.toordinal()
-        other_ordinal = other.toordinal()
+        this_ordinal = self._ordinal
+        other_ordinal = other._ordinal
 
         if this_ordinal == other_ordinal:
             return 0
@@ -971,7 +992,7 @@ class SezimalDate:
 
     def __hash__(self):
         if self._hashcode == -1:
-            self._hashcode = hash(self._getstate())
+            self._hashcode = hash(self._ordinal)
 
         return self._hashcode
 
@@ -11,7 +11,7 @@ from .dcc_functions import \
     is_leap, is_long_year, is_short_year
 from .format_tokens import DCC_DATE_NUMBER_FORMAT_TOKENS, \
     DCC_YEAR_NUMBER_FORMAT_TOKENS, \
-    DCC_DATE_TEXT_FORMAT_TOKEN
+    DCC_DATE_TEXT_FORMAT_TOKEN, compile_date_format
 
 
 from . import date
@@ -370,7 +370,10 @@ def dcc_next(self,
 date.SezimalDate.dcc_next = dcc_next
 
 
-def _apply_dcc_formats(self, fmt: str = None, locale: str | SezimalLocale = None) -> str:
+def _apply_dcc_formats(self, fmt: str = None, locale: str | SezimalLocale = None, format_tokens: dict[str, tuple] = None) -> str:
+    if format_tokens is None:
+        format_tokens = compile_date_format(fmt)
+
     for token, value, count in (
         ('dY', 'dcc_day_in_year', 'DCC_DAY_IN_YEAR_COUNT'),
         ('dW', 'dcc_weekday', 'DCC_DAY_IN_WEEK_COUNT'),
@@ -401,7 +404,7 @@ def _apply_dcc_formats(self, fmt: str = None, locale: str | SezimalLocale = None
     # Let’s deal first with the numeric formats
     #
     for regex, token, base, zero, character, value_name, \
-        size, size_niftimal, size_decimal in DCC_DATE_NUMBER_FORMAT_TOKENS:
+        size, size_niftimal, size_decimal in format_tokens['dcc_date_number']:
         if not regex.findall(fmt):
             continue
 
@@ -420,7 +423,7 @@ def _apply_dcc_formats(self, fmt: str = None, locale: str | SezimalLocale = None
     #
     # Formatted year number
     #
-    for regex, token, base, separator, character, value_name in DCC_YEAR_NUMBER_FORMAT_TOKENS:
+    for regex, token, base, separator, character, value_name in format_tokens['dcc_year_number']:
         if not regex.findall(fmt):
             continue
 
@@ -27,10 +27,17 @@ from .time import SezimalTime
 from ..sezimal import Sezimal, SezimalInteger, SezimalFraction
 from ..localization import sezimal_locale, DEFAULT_LOCALE, SezimalLocale
 from .sezimal_functions import *
+from .sezimal_functions import _time_zone_info, _timestamps_to_local_microseconds, \
+    _microseconds_to_agrima_units, _agrima_units_to_time_fields
+from .format_tokens import compile_time_format
+from ..sezimal import _integer_to_sezimal_digits
+
+
+_TWO_SEZIMAL_DIGITS = tuple(f'{first}{second}' for first in range(6) for second in range(6))
 
 
 class SezimalDateTime:
-    __slots__ = '_date', '_time', '_iso_date_time'
+    __slots__ = '_date', '_time', '_iso_date_time', '_iso_time_zone'
 
     def __new__(
         cls,
@@ -106,8 +113,19 @@ class SezimalDateTime:
         else:
             self._time = SezimalTime(uta=uta, posha=posha, agrima=agrima, anuga=anuga, boda=boda, shaditiboda=shaditiboda, day=0, time_zone=time_zone)
 
+        #
+        # The datetime.datetime is only created when it’s first used
+        #
+        self._iso_time_zone = time_zone
+
+        return self
+
+    def __getattr__(self, name: str):
+        if name != '_iso_date_time':
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
         if type(self._date.gregorian_date) == _datetime.date:
-            if time_zone:
+            if self._iso_time_zone:
                 self._iso_date_time = _datetime.datetime.combine(self._date.gregorian_date, self._time.iso_time, ZoneInfo(self.time_zone))
             else:
                 self._iso_date_time = _datetime.datetime.combine(self._date.gregorian_date, self._time.iso_time)
@@ -124,7 +142,7 @@ class SezimalDateTime:
                 self._time._iso_time.tzinfo,
             )
 
-        return self
+        return self._iso_date_time
 
     def __repr__(self) -> str:
         return f'{self.__class__.__qualname__}(year={self.year.formatted_number}, month={self.month}, day={self.day}, uta={self.uta}, posha={self.posha}, agrima={self.agrima}, anuga={self.anuga}, boda={self.boda}, shaditiboda={self.shaditiboda}, time_zone={self.time_zone})'
@@ -407,8 +425,15 @@ class SezimalDateTime:
         fmt = fmt.replace('##', '_|_HASHTAG_|_')
         fmt = fmt.replace('%%', '_|_PERCENT_|_')
 
+        #
+        # The time tokens are compiled from the format as it is now,
+        # not after the date’s values have been filled in,
+        # so the compiled format is the same for every date
+        #
+        time_format_tokens = compile_time_format(fmt)
+
         fmt = self._date.format(fmt, locale=locale, skip_strftime=True, time_zone=self.time_zone)
-        fmt = self._time.format(fmt, locale=locale, skip_strftime=True)
+        fmt = self._time.format(fmt, locale=locale, skip_strftime=True, format_tokens=time_format_tokens)
 
         if type(self.iso_date_time) != tuple and '%' in fmt:
             fmt = self.iso_date_time.strftime(fmt)
@@ -455,6 +480,52 @@ class SezimalDateTime:
 
         return cls(year=date, uta=time, time_zone=time_zone)
 
+    @classmethod
+    def from_timestamps(cls, timestamps, time_zone: str | ZoneInfo = None):
+        #
+        # Many timestamps at once, from a list, an array,
+        # or a generator reading a log file; the date times
+        # are yielded as the timestamps come, the time zone offsets
+        # are looked up once a day, and the dates are shared
+        #
+        time_zone, time_zone_info = _time_zone_info(time_zone)
+        dates = {}
+
+        for ordinal_date, microseconds, utc_offset, dst_offset in _timestamps_to_local_microseconds(timestamps, time_zone_info):
+            if ordinal_date not in dates:
+                if len(dates) >= 1_296:
+                    dates.clear()
+
+                dates[ordinal_date] = SezimalDate._from_ordinal(ordinal_date)
+
+            self = object.__new__(cls)
+            self._date = dates[ordinal_date]
+            self._time = SezimalTime._from_microseconds(microseconds, time_zone, time_zone_info, utc_offset, dst_offset)
+            self._iso_time_zone = time_zone
+
+            yield self
+
+    @classmethod
+    def isoformat_timestamps(cls, timestamps, time_zone: str | ZoneInfo = None):
+        #
+        # The same strings isoformat would return for each
+        # of the from_timestamps, without creating them
+        #
+        time_zone, time_zone_info = _time_zone_info(time_zone)
+        dates = {}
+
+        for ordinal_date, microseconds, utc_offset, dst_offset in _timestamps_to_local_microseconds(timestamps, time_zone_info):
+            if ordinal_date not in dates:
+                if len(dates) >= 1_296:
+                    dates.clear()
+
+                dates[ordinal_date] = SezimalDate._from_ordinal(ordinal_date).format('#y-#m-#d')
+
+            uta, posha, agrima, anuga, boda, shaditiboda = _agrima_units_to_time_fields(_microseconds_to_agrima_units(microseconds))
+
+            yield f'{dates[ordinal_date]} {_TWO_SEZIMAL_DIGITS[uta]}:{_TWO_SEZIMAL_DIGITS[posha]}:{_TWO_SEZIMAL_DIGITS[agrima]}.' \
+                f'{_TWO_SEZIMAL_DIGITS[anuga]}{_TWO_SEZIMAL_DIGITS[boda]}{_integer_to_sezimal_digits(shaditiboda).zfill(8)} {time_zone}'
+
     @property
     def iso_date_time(self):
         return self._iso_date_time
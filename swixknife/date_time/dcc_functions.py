@@ -4,7 +4,9 @@
 # Year starts roughly at the week of the March Equinox
 #
 
-from ..sezimal import SezimalInteger, SezimalFraction
+from functools import lru_cache
+
+from ..sezimal import Sezimal, SezimalInteger, SezimalFraction
 
 
 #
@@ -52,13 +54,54 @@ DAYS_IN_LONG_YEAR = SezimalInteger('1410')  # 366_d
 DAYS_IN_SHORT_YEAR = SezimalInteger('1400')  # 360_d
 
 
-def is_leap(year: SezimalInteger) -> bool:
-    is_leap = (
-        (SHORT_YEARS_IN_FULL_CYCLE * ((year - HOLOCENE_EPOCH) + CYCLE_FACTOR))
-        % YEARS_IN_FULL_CYCLE
-    ) < SHORT_YEARS_IN_FULL_CYCLE
+#
+# The calendar arithmetic is all done with plain ints;
+# SezimalInteger is used only on the public functions,
+# for the arguments and the returned values
+#
+_LEAP_EPOCH = int(LEAP_EPOCH)
+_HOLOCENE_EPOCH = int(HOLOCENE_EPOCH)
+_CYCLE_FACTOR = int(CYCLE_FACTOR)
+_YEARS_IN_FULL_CYCLE = int(YEARS_IN_FULL_CYCLE)
+_SHORT_YEARS_IN_FULL_CYCLE = int(SHORT_YEARS_IN_FULL_CYCLE)
+_DAYS_IN_FULL_CYCLE = int(DAYS_IN_FULL_CYCLE)
+_YEARS_IN_SUB_CYCLE = int(YEARS_IN_SUB_CYCLE)
+_DAYS_IN_SUB_CYCLE = int(DAYS_IN_SUB_CYCLE)
+_YEARS_IN_CYCLE = int(YEARS_IN_CYCLE)
+_DAYS_IN_CYCLE = int(DAYS_IN_CYCLE)
+_DAYS_IN_LONG_YEAR = int(DAYS_IN_LONG_YEAR)
+_DAYS_IN_SHORT_YEAR = int(DAYS_IN_SHORT_YEAR)
+
+
+def _integer(number: str | int | SezimalInteger) -> int:
+    if isinstance(number, Sezimal):
+        return int(number)
+
+    return int(SezimalInteger(number))
+
 
-    return is_leap
+def _truncated_divmod(dividend: int, divisor: int) -> tuple[int, int]:
+    #
+    # Same as SezimalInteger’s // and %: the quotient is truncated,
+    # and the remainder has the sign of the dividend
+    #
+    quotient, remainder = divmod(abs(dividend), divisor)
+
+    if dividend < 0:
+        return -quotient, -remainder
+
+    return quotient, remainder
+
+
+def _is_leap(year: int) -> bool:
+    return _truncated_divmod(
+        _SHORT_YEARS_IN_FULL_CYCLE * ((year - _HOLOCENE_EPOCH) + _CYCLE_FACTOR),
+        _YEARS_IN_FULL_CYCLE,
+    )[1] < _SHORT_YEARS_IN_FULL_CYCLE
+
+
+def is_leap(year: SezimalInteger) -> bool:
+    return _is_leap(_integer(year))
 
 
 def is_long_year(year: SezimalInteger) -> bool:
@@ -69,122 +112,131 @@ def is_short_year(year: SezimalInteger) -> bool:
     return is_leap(year)
 
 
-def _ordinal_to_year(ordinal_date: SezimalInteger) -> SezimalInteger:
-    ordinal_date -= LEAP_EPOCH
+def _ordinal_to_year_int(ordinal_date: int) -> int:
+    ordinal_date -= _LEAP_EPOCH
 
-    full_cycles = ordinal_date // DAYS_IN_FULL_CYCLE
+    full_cycles = _truncated_divmod(ordinal_date, _DAYS_IN_FULL_CYCLE)[0]
 
     if ordinal_date < 0:
         full_cycles = abs(full_cycles - 1)
-        ordinal_date += full_cycles * DAYS_IN_FULL_CYCLE
-        year = full_cycles * YEARS_IN_FULL_CYCLE * -1
+        ordinal_date += full_cycles * _DAYS_IN_FULL_CYCLE
+        year = full_cycles * _YEARS_IN_FULL_CYCLE * -1
     else:
-        ordinal_date -= full_cycles * DAYS_IN_FULL_CYCLE
-        year = full_cycles * YEARS_IN_FULL_CYCLE
+        ordinal_date -= full_cycles * _DAYS_IN_FULL_CYCLE
+        year = full_cycles * _YEARS_IN_FULL_CYCLE
 
-    sub_cycles = ordinal_date // DAYS_IN_SUB_CYCLE
+    sub_cycles = ordinal_date // _DAYS_IN_SUB_CYCLE
 
     if sub_cycles == 5:
         sub_cycles -= 1
 
-    ordinal_date -= sub_cycles * DAYS_IN_SUB_CYCLE
-    year += sub_cycles * YEARS_IN_SUB_CYCLE
+    ordinal_date -= sub_cycles * _DAYS_IN_SUB_CYCLE
+    year += sub_cycles * _YEARS_IN_SUB_CYCLE
 
-    cycles = ordinal_date // DAYS_IN_CYCLE
-    ordinal_date -= cycles * DAYS_IN_CYCLE
-    year += cycles * YEARS_IN_CYCLE
+    cycles = ordinal_date // _DAYS_IN_CYCLE
+    ordinal_date -= cycles * _DAYS_IN_CYCLE
+    year += cycles * _YEARS_IN_CYCLE
 
     #
     # The first year of each cycle is always short
     #
-    if ordinal_date >= DAYS_IN_SHORT_YEAR:
+    if ordinal_date >= _DAYS_IN_SHORT_YEAR:
         year += 1
-        ordinal_date -= DAYS_IN_SHORT_YEAR
+        ordinal_date -= _DAYS_IN_SHORT_YEAR
 
     #
     # The remaining years are always long
     #
-    if ordinal_date >= DAYS_IN_LONG_YEAR:
-        long_years = ordinal_date // DAYS_IN_LONG_YEAR
-        ordinal_date -= long_years * DAYS_IN_LONG_YEAR
-        year += long_years
+    if ordinal_date >= _DAYS_IN_LONG_YEAR:
+        year += ordinal_date // _DAYS_IN_LONG_YEAR
 
-    return SezimalInteger(year + HOLOCENE_EPOCH)
+    return year + _HOLOCENE_EPOCH
 
 
-def _year_to_ordinal_first_day(year) -> SezimalInteger:
-    year -= HOLOCENE_EPOCH
+@lru_cache(maxsize=1_296)
+def _year_to_ordinal_first_day_int(year: int) -> int:
+    year -= _HOLOCENE_EPOCH
 
-    full_cycles = year // YEARS_IN_FULL_CYCLE
+    full_cycles = _truncated_divmod(year, _YEARS_IN_FULL_CYCLE)[0]
 
     if year < 0:
         full_cycles = abs(full_cycles - 1)
-        ordinal_date = full_cycles * DAYS_IN_FULL_CYCLE * -1
-        year += full_cycles * YEARS_IN_FULL_CYCLE
+        ordinal_date = full_cycles * _DAYS_IN_FULL_CYCLE * -1
+        year += full_cycles * _YEARS_IN_FULL_CYCLE
     else:
-        ordinal_date = full_cycles * DAYS_IN_FULL_CYCLE
-        year -= full_cycles * YEARS_IN_FULL_CYCLE
+        ordinal_date = full_cycles * _DAYS_IN_FULL_CYCLE
+        year -= full_cycles * _YEARS_IN_FULL_CYCLE
 
-    sub_cycles = year // YEARS_IN_SUB_CYCLE
+    sub_cycles = year // _YEARS_IN_SUB_CYCLE
 
     if sub_cycles == 5:
         sub_cycles -= 1
 
-    ordinal_date += sub_cycles * DAYS_IN_SUB_CYCLE
-    year -= sub_cycles * YEARS_IN_SUB_CYCLE
+    ordinal_date += sub_cycles * _DAYS_IN_SUB_CYCLE
+    year -= sub_cycles * _YEARS_IN_SUB_CYCLE
 
-    cycles = year // YEARS_IN_CYCLE
-    year -= cycles * YEARS_IN_CYCLE
-    ordinal_date += cycles * DAYS_IN_CYCLE
+    cycles = year // _YEARS_IN_CYCLE
+    year -= cycles * _YEARS_IN_CYCLE
+    ordinal_date += cycles * _DAYS_IN_CYCLE
 
     #
     # The first year of the cycle is always short
     #
     if year >= 1:
-        ordinal_date += DAYS_IN_SHORT_YEAR
+        ordinal_date += _DAYS_IN_SHORT_YEAR
         year -= 1
 
-    ordinal_date += year * DAYS_IN_LONG_YEAR
-
-    ordinal_date += LEAP_EPOCH
+    ordinal_date += year * _DAYS_IN_LONG_YEAR
 
-    return SezimalInteger(ordinal_date)
+    return ordinal_date + _LEAP_EPOCH
 
 
-def ordinal_date_to_year_month_day(ordinal_date) -> (SezimalInteger, SezimalInteger, SezimalInteger, SezimalInteger, SezimalInteger, SezimalInteger):
+def _ordinal_date_to_year_month_day(ordinal_date: int) -> tuple[int, int, int, int, int, int]:
     #
     # First, we find the year corresponding to the ordinal date
     #
-    year = _ordinal_to_year(ordinal_date)
+    year = _ordinal_to_year_int(ordinal_date)
 
     #
     # We remove all days prior to the start of the year
     #
-    ordinal_date -= _year_to_ordinal_first_day(year)
-
-    day_in_year = SezimalInteger(ordinal_date)
-    week_in_year = day_in_year // 10
+    day_in_year = ordinal_date - _year_to_ordinal_first_day_int(year)
+    week_in_year = _truncated_divmod(day_in_year, 6)[0]
 
-    month = day_in_year // 100
-    day = day_in_year % 100
+    month, day = _truncated_divmod(day_in_year, 36)
 
-    day_in_week = day % 10
+    day_in_week = _truncated_divmod(day, 6)[1]
 
     return year, month, day, day_in_year, week_in_year, day_in_week
 
 
+def _ordinal_to_year(ordinal_date: SezimalInteger) -> SezimalInteger:
+    return SezimalInteger._from_mantissa(_ordinal_to_year_int(_integer(ordinal_date)), 0)
+
+
+def _year_to_ordinal_first_day(year) -> SezimalInteger:
+    return SezimalInteger._from_mantissa(_year_to_ordinal_first_day_int(_integer(year)), 0)
+
+
+def ordinal_date_to_year_month_day(ordinal_date) -> (SezimalInteger, SezimalInteger, SezimalInteger, SezimalInteger, SezimalInteger, SezimalInteger):
+    return tuple(
+        SezimalInteger._from_mantissa(field, 0)
+        for field in _ordinal_date_to_year_month_day(_integer(ordinal_date))
+    )
+
+
 def year_month_day_to_ordinal_date(year, month, day) -> SezimalInteger:
-    ordinal_date = _year_to_ordinal_first_day(year)
-    ordinal_date += month * 100
-    ordinal_date += day
-    return SezimalInteger(ordinal_date)
+    ordinal_date = _year_to_ordinal_first_day_int(_integer(year))
+    ordinal_date += _integer(month) * 36
+    ordinal_date += _integer(day)
+    return SezimalInteger._from_mantissa(ordinal_date, 0)
 
 
 def year_week_weekday_to_ordinal_date(year, week, weekday) -> SezimalInteger:
-    ordinal_date = _year_to_ordinal_first_day(year)
-    ordinal_date += week * 10
-    ordinal_date += weekday
-    return SezimalInteger(ordinal_date)
+    ordinal_date = _year_to_ordinal_first_day_int(_integer(year))
+    ordinal_date += _integer(week) * 6
+    ordinal_date += _integer(weekday)
+    return SezimalInteger._from_mantissa(ordinal_date, 0)
 
 
 def mean_tropical_year(date):
@@ -1,4 +1,5 @@
 
+from functools import lru_cache
 from itertools import product
 import re
 
@@ -264,3 +265,48 @@ DCC_YEAR_NUMBER_FORMAT_TOKENS = tuple(
 DCC_DATE_TEXT_FORMAT_TOKEN = re.compile(
     r'&(?P<base>Z|9|↋|c|c9|c↋)?(?P<size>@|1|2|3)?(?P<case>\!|\?|\>)?(?P<month_week_term>M|W|T)'
 )
+
+
+def _used_tokens(tokens: tuple, fmt: str) -> tuple:
+    return tuple(token for token in tokens if token[0].search(fmt))
+
+
+#
+# Trying each one of the thousands of token regexes above
+# on every call was most of the time spent formatting;
+# a format string is compiled once into the tokens it actually uses,
+# still in the order they’re applied, and formatting only tries those;
+# the tokens are matched again on each call, since a token can
+# be used up by one that comes before it
+#
+@lru_cache(maxsize=1_296)
+def compile_date_format(fmt: str) -> dict[str, tuple]:
+    #
+    # The locale’s DCC counts (&dC, &wYC etc.) are replaced by
+    # more DCC tokens, so in that case all of them are tried
+    #
+    if '&' in fmt and 'C' in fmt:
+        dcc_date_number_tokens = DCC_DATE_NUMBER_FORMAT_TOKENS
+        dcc_year_number_tokens = DCC_YEAR_NUMBER_FORMAT_TOKENS
+    else:
+        dcc_date_number_tokens = _used_tokens(DCC_DATE_NUMBER_FORMAT_TOKENS, fmt)
+        dcc_year_number_tokens = _used_tokens(DCC_YEAR_NUMBER_FORMAT_TOKENS, fmt)
+
+    return {
+        'season_moon_text': _used_tokens(SEASON_MOON_TEXT_FORMAT_TOKENS, fmt),
+        'season_moon_time': _used_tokens(SEASON_MOON_TIME_FORMAT_TOKENS, fmt),
+        'dcc_date_number': dcc_date_number_tokens,
+        'dcc_year_number': dcc_year_number_tokens,
+        'date_number': _used_tokens(DATE_NUMBER_FORMAT_TOKENS, fmt),
+        'year_number': _used_tokens(YEAR_NUMBER_FORMAT_TOKENS, fmt),
+        'iso_date_number': _used_tokens(ISO_DATE_NUMBER_FORMAT_TOKENS, fmt),
+    }
+
+
+@lru_cache(maxsize=1_296)
+def compile_time_format(fmt: str) -> dict[str, tuple]:
+    return {
+        'time_number': _used_tokens(TIME_NUMBER_FORMAT_TOKENS, fmt),
+        'time_zone_offset': _used_tokens(TIME_ZONE_OFFSET_FORMAT_TOKENS, fmt),
+        'iso_time_number': _used_tokens(ISO_TIME_NUMBER_FORMAT_TOKENS, fmt),
+    }
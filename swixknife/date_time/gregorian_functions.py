@@ -1,8 +1,19 @@
 
 
-__all__ = ('gregorian_year_month_day_to_ordinal_date', 'ordinal_date_to_gregorian_year_month_day')
-
-from decimal import Decimal
+__all__ = (
+    'gregorian_year_month_day_to_ordinal_date', 'ordinal_date_to_gregorian_year_month_day',
+    'gregorian_year_month_day_to_iso_year_week_day', 'ordinal_date_to_iso_year_week_day',
+    'iso_year_week_day_to_ordinal_date',
+    'ordinal_date_to_gregorian_holocene_year_month_day', 'gregorian_holocene_year_month_day_to_ordinal_date',
+    'ordinal_dates_to_gregorian_year_month_day', 'gregorian_year_month_day_to_ordinal_dates',
+    'ordinal_dates_to_iso_year_week_day',
+    'ordinal_dates_to_gregorian_holocene_year_month_day', 'gregorian_holocene_year_month_day_to_ordinal_dates',
+)
+
+try:
+    import numpy
+except:
+    numpy = None
 
 from ..sezimal import SezimalInteger
 
@@ -144,64 +155,252 @@ def _ord2ymd(n):
     return year, month, n+1
 
 
+def _isoweek1monday(year):
+    "year -> ordinal of the Monday starting the first ISO week of year."
+    first_day = _days_before_year(year) + 1
+    first_weekday = (first_day + 6) % 7
+    week1monday = first_day - first_weekday
+
+    if first_weekday > 3:
+        week1monday += 7
+
+    return week1monday
+
+def _ord2iso(n):
+    "ordinal -> (ISO year, week, weekday), considering 01-Jan-0001 as day 1."
+    year = _ord2ymd(n)[0]
+    week1monday = _isoweek1monday(year)
+    week, day = divmod(n - week1monday, 7)
+
+    if week < 0:
+        year -= 1
+        week1monday = _isoweek1monday(year)
+        week, day = divmod(n - week1monday, 7)
+
+    elif week >= 52:
+        if n >= _isoweek1monday(year + 1):
+            year += 1
+            week = 0
+
+    return year, week + 1, day + 1
+
+def _iso2ord(year, week, day):
+    "ISO year, week, weekday -> ordinal, considering 01-Jan-0001 as day 1."
+    if not 1 <= week <= 52:
+        if week != 53 or _isoweek1monday(year + 1) - _isoweek1monday(year) != 53 * 7:
+            raise ValueError(f'Invalid week: {week}')
+
+    if not 1 <= day <= 7:
+        raise ValueError(f'Invalid weekday: {day} (range is [1, 7])')
+
+    return _isoweek1monday(year) + (week - 1) * 7 + day - 1
+
+
+#
+# Holocene years are the Gregorian years plus 10_000
+#
+HOLOCENE_YEAR_DIFF = 10_000
+
+
 def ordinal_date_to_gregorian_year_month_day(ordinal_date):
     if type(ordinal_date).__name__ in ('Sezimal', 'SezimalInteger', 'SezimalFraction'):
         ordinal_date = int(ordinal_date.decimal)
 
     year, month, day = _ord2ymd(ordinal_date)
 
-    # year = SezimalInteger(Decimal(year))
-    # month = SezimalInteger(Decimal(month))
-    # day = SezimalInteger(Decimal(day))
-
     return year, month, day
 
 
 def gregorian_year_month_day_to_ordinal_date(year, month, day):
-    # if type(year).__name__ in ('Sezimal', 'SezimalInteger', 'SezimalFraction'):
-    #     year = int(year.decimal)
+    ordinal_date = _ymd2ord(int(year), int(month), int(day))
+
+    ordinal_date = SezimalInteger._from_mantissa(ordinal_date, 0)
+
+    return ordinal_date
+
+
+def gregorian_year_to_iso_first_monday_ordinal_date(year):
+    return _isoweek1monday(int(year))
+
+
+def gregorian_year_month_day_to_iso_year_week_day(year, month, day):
+    iso_year, week, day = _ord2iso(_ymd2ord(int(year), int(month), int(day)))
+
     #
-    # if type(month).__name__ in ('Sezimal', 'SezimalInteger', 'SezimalFraction'):
-    #     month = int(month.decimal)
+    # The ISO year is returned in the same type as the year given
     #
-    # if type(day).__name__ in ('Sezimal', 'SezimalInteger', 'SezimalFraction'):
-    #     day = int(day.decimal)
+    return year + (iso_year - int(year)), week, day
 
-    ordinal_date = _ymd2ord(year, month, day)
 
-    ordinal_date = SezimalInteger(Decimal(ordinal_date))
+def ordinal_date_to_iso_year_week_day(ordinal_date):
+    if type(ordinal_date).__name__ in ('Sezimal', 'SezimalInteger', 'SezimalFraction'):
+        ordinal_date = int(ordinal_date.decimal)
 
-    return ordinal_date
+    return _ord2iso(ordinal_date)
 
 
-def gregorian_year_to_iso_first_monday_ordinal_date(year):
-    first_monday = gregorian_year_month_day_to_ordinal_date(year, 1, 1).decimal
-    first_weekday = (first_monday + 6) % 7
-    first_monday -= first_weekday
+def iso_year_week_day_to_ordinal_date(year, week, day):
+    return _iso2ord(int(year), int(week), int(day))
 
-    if first_weekday > 3:
-        first_monday += 7
 
-    return first_monday
+def ordinal_date_to_gregorian_holocene_year_month_day(ordinal_date):
+    year, month, day = ordinal_date_to_gregorian_year_month_day(ordinal_date)
+    return year + HOLOCENE_YEAR_DIFF, month, day
 
 
-def gregorian_year_month_day_to_iso_year_week_day(year, month, day):
-    first_monday = gregorian_year_to_iso_first_monday_ordinal_date(year)
-    ordinal_date = gregorian_year_month_day_to_ordinal_date(year, month, day).decimal
+def gregorian_holocene_year_month_day_to_ordinal_date(year, month, day):
+    return _ymd2ord(int(year) - HOLOCENE_YEAR_DIFF, int(month), int(day))
 
-    week, day = divmod(ordinal_date - first_monday, 7)
 
-    if week < 0:
-        year -= 1
-        first_monday = gregorian_year_to_iso_first_monday_ordinal_date(year)
-        week, day = divmod(ordinal_date - first_monday, 7)
+#
+# Bulk conversions, over whole columns of ordinal dates,
+# years, months and days, given as lists, tuples or NumPy
+# integer arrays, and returned the same way, as lists
+# or as arrays; with NumPy, the arithmetic above is done
+# over the whole arrays at once
+#
+def _is_array(values) -> bool:
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+def _integers(values) -> list[int]:
+    return [int(value) for value in values]
+
+
+if numpy is not None:
+    _DAYS_IN_MONTH_ARRAY = numpy.array([0] + _DAYS_IN_MONTH[1:], dtype=numpy.int64)
+    _DAYS_BEFORE_MONTH_ARRAY = numpy.array([0] + _DAYS_BEFORE_MONTH[1:], dtype=numpy.int64)
+
+
+def _array_is_leap(years):
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+
+def _array_days_before_year(years):
+    y = years - 1
+    return y * 365 + y // 4 - y // 100 + y // 400
+
+
+def _array_ord2ymd(ordinal_dates):
+    n = numpy.asarray(ordinal_dates, dtype=numpy.int64) - 1
+    n400, n = numpy.divmod(n, _DI400Y)
+    n100, n = numpy.divmod(n, _DI100Y)
+    n4, n = numpy.divmod(n, _DI4Y)
+    n1, n = numpy.divmod(n, 365)
+
+    years = n400 * 400 + 1 + n100 * 100 + n4 * 4 + n1
+    leap = (n1 == 3) & ((n4 != 24) | (n100 == 3))
+
+    months = (n + 50) >> 5
+    months = numpy.clip(months, 1, 12)
+    preceding = _DAYS_BEFORE_MONTH_ARRAY[months] + ((months > 2) & leap)
+    too_large = preceding > n
+    months = months - too_large
+    preceding = numpy.where(too_large, _DAYS_BEFORE_MONTH_ARRAY[months] + ((months > 2) & leap), preceding)
+    days = n - preceding + 1
+
+    #
+    # The last day of a 4 or 400 years cycle
+    #
+    last_day = (n1 == 4) | (n100 == 4)
+    years = numpy.where(last_day, years - 1, years)
+    months = numpy.where(last_day, 12, months)
+    days = numpy.where(last_day, 31, days)
+
+    return years, months, days
+
+
+def _array_ymd2ord(years, months, days):
+    years = numpy.asarray(years, dtype=numpy.int64)
+    months = numpy.asarray(months, dtype=numpy.int64)
+    days = numpy.asarray(days, dtype=numpy.int64)
+
+    if numpy.any((months < 1) | (months > 12)):
+        raise ValueError('month must be in 1..12')
+
+    leap = _array_is_leap(years)
+
+    if numpy.any((days < 1) | (days > _DAYS_IN_MONTH_ARRAY[months] + ((months == 2) & leap))):
+        raise ValueError('day is out of range for month')
+
+    return _array_days_before_year(years) + _DAYS_BEFORE_MONTH_ARRAY[months] + ((months > 2) & leap) + days
+
+
+def _array_isoweek1monday(years):
+    first_days = _array_days_before_year(years) + 1
+    first_weekdays = (first_days + 6) % 7
+    return first_days - first_weekdays + numpy.where(first_weekdays > 3, 7, 0)
+
+
+def _array_ord2iso(ordinal_dates):
+    n = numpy.asarray(ordinal_dates, dtype=numpy.int64)
+    years = _array_ord2ymd(n)[0]
+
+    #
+    # The ISO year is either the Gregorian year,
+    # the one before it, or the one after it
+    #
+    years = numpy.where(n < _array_isoweek1monday(years), years - 1, years)
+    years = numpy.where(n >= _array_isoweek1monday(years + 1), years + 1, years)
+
+    weeks, days = numpy.divmod(n - _array_isoweek1monday(years), 7)
+
+    return years, weeks + 1, days + 1
+
+
+def ordinal_dates_to_gregorian_year_month_day(ordinal_dates) -> tuple[list[int], list[int], list[int]]:
+    if _is_array(ordinal_dates):
+        return _array_ord2ymd(ordinal_dates)
+
+    years, months, days = [], [], []
+
+    for ordinal_date in _integers(ordinal_dates):
+        year, month, day = _ord2ymd(ordinal_date)
+        years.append(year)
+        months.append(month)
+        days.append(day)
+
+    return years, months, days
+
+
+def gregorian_year_month_day_to_ordinal_dates(years, months, days) -> list[int]:
+    if _is_array(years) or _is_array(months) or _is_array(days):
+        return _array_ymd2ord(years, months, days)
+
+    return [
+        _ymd2ord(year, month, day)
+        for year, month, day in zip(_integers(years), _integers(months), _integers(days))
+    ]
+
+
+def ordinal_dates_to_iso_year_week_day(ordinal_dates) -> tuple[list[int], list[int], list[int]]:
+    if _is_array(ordinal_dates):
+        return _array_ord2iso(ordinal_dates)
+
+    years, weeks, days = [], [], []
+
+    for ordinal_date in _integers(ordinal_dates):
+        year, week, day = _ord2iso(ordinal_date)
+        years.append(year)
+        weeks.append(week)
+        days.append(day)
+
+    return years, weeks, days
+
+
+def ordinal_dates_to_gregorian_holocene_year_month_day(ordinal_dates) -> tuple[list[int], list[int], list[int]]:
+    years, months, days = ordinal_dates_to_gregorian_year_month_day(ordinal_dates)
+
+    if _is_array(years):
+        return years + HOLOCENE_YEAR_DIFF, months, days
+
+    return [year + HOLOCENE_YEAR_DIFF for year in years], months, days
 
-    elif week >= 52:
-        if ordinal_date >= gregorian_year_to_iso_first_monday_ordinal_date(year + 1):
-            year += 1
-            week = 0
 
-    week += 1
-    day += 1
+def gregorian_holocene_year_month_day_to_ordinal_dates(years, months, days) -> list[int]:
+    if _is_array(years):
+        years = years - HOLOCENE_YEAR_DIFF
+    else:
+        years = [year - HOLOCENE_YEAR_DIFF for year in _integers(years)]
 
-    return year, int(week), int(day)
+    return gregorian_year_month_day_to_ordinal_dates(years, months, days)
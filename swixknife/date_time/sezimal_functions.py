@@ -2,6 +2,7 @@
 
 import time as _time
 import datetime as _datetime
+import math as _math
 from zoneinfo import ZoneInfo
 import re
 
@@ -11,7 +12,13 @@ try:
 except:
     tzlocal = None
 
+try:
+    import numpy as _numpy
+except:
+    _numpy = None
+
 from decimal import Decimal
+from functools import lru_cache
 
 from ..base import sezimal_context
 from ..sezimal import Sezimal, SezimalInteger, SezimalFraction
@@ -161,36 +168,106 @@ for days_in_month in DAYS_IN_MONTH[1:]:
 
 del days_before_month, days_in_month
 
+#
+# The calendar arithmetic is all done with plain ints;
+# SezimalInteger is used only on the public functions,
+# for the arguments and the returned values
+#
+_ISO_YEAR_DIFF = int(ISO_YEAR_DIFF)
+_LEAP_FACTOR_INT = int(_LEAP_FACTOR)
+_DAYS_IN_MONTH = [int(days) for days in DAYS_IN_MONTH]
+_DAYS_BEFORE_MONTH = [int(days) for days in DAYS_BEFORE_MONTH]
+
 
-def is_leap(year):
+def _integer(number: str | int | Decimal | Sezimal | SezimalInteger) -> int:
+    if isinstance(number, Sezimal):
+        return int(number)
+
+    return int(SezimalInteger(number))
+
+
+def _sezimal_integer(number: int) -> SezimalInteger:
+    return SezimalInteger._from_mantissa(number, 0)
+
+
+def _is_leap(year: int) -> bool:
     if year <= 0:
         year = abs(year) + 1
 
-    leap = year
-    leap *= SezimalInteger('124')  # 52_dec
-    leap += _LEAP_FACTOR  # 146_dec or 221_dec, see prior constant definition
+    return (year * 52 + _LEAP_FACTOR_INT) % 293 < 52
+
+
+@lru_cache(maxsize=1_296)
+def _year_start(year: int) -> tuple[int, bool]:
+    "year -> (number of days before January 1st of year, is leap)."
+    previous_year = year - 1
+    days_before_year = 364 * previous_year + 7 * ((52 * previous_year + _LEAP_FACTOR_INT) // 293)
+
+    return days_before_year, _is_leap(year)
+
+
+def _month_days(year: int, month: int) -> int:
+    if month == 12 and _year_start(year)[1]:
+        return 35
+
+    return _DAYS_IN_MONTH[month]
+
 
+def _year_month_day_to_ordinal(year: int, month: int, day: int) -> int:
+    year -= _ISO_YEAR_DIFF
+
+    days_before_year, leap = _year_start(year)
+
+    return days_before_year + _DAYS_BEFORE_MONTH[month] + day
+
+
+def _ordinal_to_year_month_day(ordinal_date: int) -> tuple[int, int, int, int, int, int, int, int, int]:
     #
-    # The modulo is much faster using Decimal
+    # The year estimate uses the mean year of the cycle,
+    # 365 + 71/293 days, and is at most one year off
     #
-    leap = leap.decimal
-    leap %= SezimalInteger('1_205').decimal  # 293_dec
+    year = -((1 - ordinal_date) * 293 // 107_016)
 
-    is_leap = leap < SezimalInteger('124').decimal  # 52_dec
+    days_before_year, leap = _year_start(year)
 
-    return is_leap
+    if ordinal_date <= days_before_year:
+        year -= 1
+        days_before_year, leap = _year_start(year)
 
+    elif ordinal_date - days_before_year > 364:
+        days_before_next_year, next_leap = _year_start(year + 1)
 
-def _days_before_year(year):
-    "year -> number of days before January 1st of year."
-    year -= SezimalInteger('1')
+        if ordinal_date > days_before_next_year:
+            year += 1
+            days_before_year = days_before_next_year
+
+    day_in_year = ordinal_date - days_before_year
+    week_in_year = (day_in_year + 6) // 7
+    quarter = (4 * week_in_year + 52) // 53
+    day_in_quarter = day_in_year - 91 * (quarter - 1)
+    week_in_quarter = (day_in_quarter + 6) // 7
+    month_in_quarter = (2 * week_in_quarter + 8) // 9
+    month = 3 * (quarter - 1) + month_in_quarter
+
+    #
+    # The day is in the leap week
+    #
+    if month == 13:
+        month = 12
+
+    day = day_in_year - _DAYS_BEFORE_MONTH[month]
 
-    dby = SezimalInteger('1_404').decimal * year.decimal
-    weeks = (SezimalInteger('124').decimal * year.decimal) + _LEAP_FACTOR.decimal
-    weeks *= SezimalInteger(1).decimal / SezimalInteger('1_205').decimal
-    dby += SezimalInteger('11').decimal * floor(weeks).decimal
+    return year + _ISO_YEAR_DIFF, month, day, day_in_year, week_in_year, quarter, day_in_quarter, week_in_quarter, month_in_quarter
 
-    return dby
+
+def is_leap(year):
+    return _is_leap(_integer(year))
+
+
+def _days_before_year(year):
+    "year -> number of days before January 1st of year."
+    days_before_year, leap = _year_start(_integer(year))
+    return Decimal(days_before_year)
 
 
 def _days_in_month(year, month):
@@ -212,19 +289,15 @@ def _days_before_month(month):
 
 def year_month_day_to_ordinal(year, month, day):
     "year, month, day -> ordinal, considering 01-Jan-0001 as day 1."
-    assert 1 <= month <= 20, f'month must be in 1..20: {month}'
-
-    year -= ISO_YEAR_DIFF
+    year, month, day = _integer(year), _integer(month), _integer(day)
 
-    days_in_month = _days_in_month(year, month)
+    assert 1 <= month <= 12, f'month must be in 1..20: {_sezimal_integer(month)}'
 
-    assert 1 <= day <= days_in_month, f'day must be in 1..{days_in_month}: {day}, month {month}, year {year + ISO_YEAR_DIFF}'
+    days_in_month = _month_days(year - _ISO_YEAR_DIFF, month)
 
-    ordinal_date = _days_before_year(year)
-    ordinal_date += _days_before_month(month)
-    ordinal_date += day
+    assert 1 <= day <= days_in_month, f'day must be in 1..{_sezimal_integer(days_in_month)}: {_sezimal_integer(day)}, month {_sezimal_integer(month)}, year {_sezimal_integer(year)}'
 
-    return SezimalInteger(ordinal_date)
+    return _sezimal_integer(_year_month_day_to_ordinal(year, month, day))
 
 
 def _first_day_year(year):
@@ -239,76 +312,27 @@ def _ordinal_to_year(ordinal_date):
 
 
 def ordinal_to_year_month_day(ordinal_date):
-    #
-    # First, we find the year corresponding to the ordinal date
-    #
-    year = _ordinal_to_year(ordinal_date)
-
-    first_day_year = _first_day_year(year)
-
-    #
-    # We now check if the year is correct
-    # The start of the year is either on the year or we must increment the year
-    #
-    if ordinal_date > first_day_year:
-        #
-        # Check if the ordinal date informed may be
-        # on the leap week of December or the next year
-        #
-        if ordinal_date - first_day_year >= SezimalInteger('1_404'):
-            first_day_next_year = _first_day_year(year + SezimalInteger('1'))
-
-            #
-            # If the given ordinal date is after the next year’s first day,
-            # then it is on the next year
-            #
-            if ordinal_date >= first_day_next_year:
-                year += SezimalInteger('1')
-                first_day_year = first_day_next_year
-
-    #
-    # The year estimate is too far in the future, go back 1 year
-    #
-    elif first_day_year > ordinal_date:
-        year -= SezimalInteger('1')
-        first_day_year = _first_day_year(year)
-
-    day_in_year = SezimalInteger(ordinal_date - first_day_year + SezimalInteger('1'))
-    week_in_year = SezimalInteger(ceil(day_in_year.decimal / SezimalInteger('11').decimal))
-    quarter = SezimalInteger(ceil((SezimalInteger('4').decimal / SezimalInteger('125').decimal) *  week_in_year))
-    day_in_quarter = SezimalInteger(day_in_year - (SezimalInteger('231') * (quarter - SezimalInteger('1'))))
-    week_in_quarter = SezimalInteger(ceil(day_in_quarter.decimal / SezimalInteger('11').decimal))
-    month_in_quarter = SezimalInteger(ceil((SezimalInteger('2').decimal / SezimalInteger('13').decimal) * week_in_quarter))
-    month = SezimalInteger((SezimalInteger('3') * (quarter - SezimalInteger('1'))) + month_in_quarter)
-
-    #
-    # The day is in the leap week
-    #
-    if month == SezimalInteger('21'):
-        month = SezimalInteger('20')
-
-    day = SezimalInteger(day_in_year - _days_before_month(month))
-
-    year += ISO_YEAR_DIFF
-
-    return year, month, day, day_in_year, week_in_year, quarter, day_in_quarter, week_in_quarter, month_in_quarter
+    return tuple(
+        _sezimal_integer(field)
+        for field in _ordinal_to_year_month_day(_integer(ordinal_date))
+    )
 
 
 def check_date_fields(year, month, day):
     # if not MINYEAR <= year <= MAXYEAR:
     #     raise ValueError(f'Year must be in {MINYEAR}..{MAXYEAR}', year)
 
-    if not 1 <= month <= 20:
-        raise ValueError('Month must be in 1..20', month)
+    month_number = _integer(month)
 
-    year -= ISO_YEAR_DIFF
+    if not 1 <= month_number <= 12:
+        raise ValueError('Month must be in 1..20', month)
 
-    days_in_month = _days_in_month(year, month)
+    days_in_month = _month_days(_integer(year) - _ISO_YEAR_DIFF, month_number)
 
-    if not 1 <= day <= days_in_month:
-        raise ValueError(f'Day must be in 1..{days_in_month} for month {year + ISO_YEAR_DIFF}-{str(month).zfill(2)}', day)
+    if not 1 <= _integer(day) <= days_in_month:
+        raise ValueError(f'Day must be in 1..{_sezimal_integer(days_in_month)} for month {year}-{str(month).zfill(2)}', day)
 
-    return year, month, day
+    return year - ISO_YEAR_DIFF, month, day
 
 
 def system_time_zone():
@@ -392,6 +416,244 @@ def tz_days_offset(time_zone: str | ZoneInfo = 'UTC', base_gregorian_date: str |
     return total_agrimas / 1_000_000, total_agrimas_dst / 1_000_000
 
 
+#
+# Bulk conversion of timestamps, for logs and the like:
+# the timestamps are taken as whole microseconds, rounded
+# the same way datetime.fromtimestamp does it, and the time
+# of the day is kept as an int count of 1 / 1_000_000_000_000
+# agrima (the shaditiboda), so only ints are used until
+# the SezimalDateTime, or the string, is actually built;
+# 1 second is 0.54_dec agrima, so 1 microsecond is
+# 459_165_024 / 390_625 (both decimal) of those units
+#
+_POSIX_EPOCH = int(POSIX_EPOCH)
+_SECONDS_PER_DAY = 86_400
+_MICROSECONDS_PER_DAY = 86_400_000_000
+_AGRIMA_UNITS_PER_MICROSECOND = (459_165_024, 390_625)
+
+
+def _time_zone_info(time_zone: str | ZoneInfo = None) -> tuple[str, ZoneInfo]:
+    if not time_zone:
+        time_zone = system_time_zone()
+
+    if isinstance(time_zone, ZoneInfo):
+        return str(time_zone), time_zone
+
+    return time_zone, ZoneInfo(time_zone)
+
+
+def _timestamp_microseconds(timestamp: int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction) -> int:
+    if type(timestamp).__name__ in ('Sezimal', 'SezimalInteger', 'SezimalFraction'):
+        timestamp = timestamp.decimal
+
+    if type(timestamp).__name__ in ('int', 'int64', 'int32', 'uint64', 'uint32'):
+        return int(timestamp) * 1_000_000
+
+    fraction, seconds = _math.modf(float(timestamp))
+    return int(seconds) * 1_000_000 + round(fraction * 1_000_000)
+
+
+def _utc_offset_seconds(time_zone: ZoneInfo, seconds: int) -> tuple[int, int]:
+    date_time = _datetime.datetime.fromtimestamp(seconds, time_zone)
+    return int(date_time.utcoffset().total_seconds()), int(date_time.dst().total_seconds())
+
+
+@lru_cache(maxsize=1_296)
+def _seconds_to_agrimas(seconds: int) -> Sezimal:
+    return decimal_to_sezimal_unit(Decimal(seconds), 's', 'agm')
+
+
+def _microseconds_to_agrima_units(microseconds: int) -> int:
+    numerator, denominator = _AGRIMA_UNITS_PER_MICROSECOND
+    return (microseconds * numerator * 2 + denominator) // (denominator * 2)
+
+
+def _agrima_units_to_time_fields(agrima_units: int) -> tuple[int, int, int, int, int, int]:
+    agrima_units, shaditiboda = divmod(agrima_units, 1_679_616)
+    agrima_units, boda = divmod(agrima_units, 36)
+    agrima_units, anuga = divmod(agrima_units, 36)
+    agrima_units, agrima = divmod(agrima_units, 36)
+    uta, posha = divmod(agrima_units, 36)
+
+    return uta, posha, agrima, anuga, boda, shaditiboda
+
+
+class _TimeZoneOffsets:
+    #
+    # The UTC and DST offsets of a time zone, in seconds,
+    # looked up once for each UTC day: when the day starts
+    # and ends with the same offsets, there was no transition
+    # in it, and all of its timestamps share them;
+    # only the timestamps of the days with a transition
+    # are looked up one by one
+    #
+    __slots__ = ('time_zone', '_day_offsets')
+
+    def __init__(self, time_zone: ZoneInfo):
+        self.time_zone = time_zone
+        self._day_offsets = {}
+
+    def day_offsets(self, day: int) -> tuple[int, int] | None:
+        if day in self._day_offsets:
+            return self._day_offsets[day]
+
+        offsets = _utc_offset_seconds(self.time_zone, day * _SECONDS_PER_DAY)
+
+        if offsets != _utc_offset_seconds(self.time_zone, day * _SECONDS_PER_DAY + _SECONDS_PER_DAY - 1):
+            offsets = None
+
+        self._day_offsets[day] = offsets
+
+        return offsets
+
+    def offsets(self, seconds: int) -> tuple[int, int]:
+        offsets = self.day_offsets(seconds // _SECONDS_PER_DAY)
+
+        if offsets is None:
+            return _utc_offset_seconds(self.time_zone, seconds)
+
+        return offsets
+
+
+def _timestamps_to_local_microseconds(timestamps, time_zone: ZoneInfo):
+    #
+    # (ordinal date, microseconds into the day, UTC offset, DST offset)
+    # for each timestamp, as they come
+    #
+    offsets = _TimeZoneOffsets(time_zone)
+
+    for timestamp in timestamps:
+        microseconds = _timestamp_microseconds(timestamp)
+        utc_offset, dst_offset = offsets.offsets(microseconds // 1_000_000)
+        ordinal_date, microseconds = divmod(microseconds + utc_offset * 1_000_000, _MICROSECONDS_PER_DAY)
+
+        yield ordinal_date + _POSIX_EPOCH, microseconds, utc_offset, dst_offset
+
+
+def _is_array(values) -> bool:
+    return _numpy is not None and isinstance(values, _numpy.ndarray)
+
+
+if _numpy is not None:
+    _DAYS_BEFORE_MONTH_ARRAY = _numpy.array([0] + _DAYS_BEFORE_MONTH[1:], dtype=_numpy.int64)
+
+
+def _array_year_start(years):
+    previous_years = years - 1
+    return 364 * previous_years + 7 * ((52 * previous_years + _LEAP_FACTOR_INT) // 293)
+
+
+def _array_ordinal_to_year_month_day(ordinal_dates):
+    #
+    # The same steps of _ordinal_to_year_month_day,
+    # for a whole array at once
+    #
+    years = -((1 - ordinal_dates) * 293 // 107_016)
+    days_before_year = _array_year_start(years)
+
+    previous_year = ordinal_dates <= days_before_year
+    years = _numpy.where(previous_year, years - 1, years)
+    days_before_year = _numpy.where(previous_year, _array_year_start(years), days_before_year)
+
+    days_before_next_year = _array_year_start(years + 1)
+    next_year = ordinal_dates > days_before_next_year
+    years = _numpy.where(next_year, years + 1, years)
+    days_before_year = _numpy.where(next_year, days_before_next_year, days_before_year)
+
+    day_in_year = ordinal_dates - days_before_year
+    quarter = (4 * ((day_in_year + 6) // 7) + 52) // 53
+    day_in_quarter = day_in_year - 91 * (quarter - 1)
+    month_in_quarter = (2 * ((day_in_quarter + 6) // 7) + 8) // 9
+
+    #
+    # Month 13 is the leap week
+    #
+    months = _numpy.minimum(3 * (quarter - 1) + month_in_quarter, 12)
+    days = day_in_year - _DAYS_BEFORE_MONTH_ARRAY[months]
+
+    return years + _ISO_YEAR_DIFF, months, days
+
+
+def _array_timestamps_to_local_microseconds(timestamps, time_zone: ZoneInfo):
+    timestamps = _numpy.ravel(timestamps)
+
+    if timestamps.dtype.kind in 'iu':
+        microseconds = timestamps.astype(_numpy.int64) * 1_000_000
+    else:
+        fractions, seconds = _numpy.modf(timestamps.astype(_numpy.float64))
+        microseconds = seconds.astype(_numpy.int64) * 1_000_000 + _numpy.round(fractions * 1_000_000).astype(_numpy.int64)
+
+    seconds = microseconds // 1_000_000
+
+    #
+    # The offsets are looked up once for each different day
+    #
+    offsets = _TimeZoneOffsets(time_zone)
+    days, day_index = _numpy.unique(seconds // _SECONDS_PER_DAY, return_inverse=True)
+    day_offsets = [offsets.day_offsets(int(day)) for day in days]
+
+    utc_offsets = _numpy.array([day[0] if day else 0 for day in day_offsets], dtype=_numpy.int64)[day_index]
+    dst_offsets = _numpy.array([day[1] if day else 0 for day in day_offsets], dtype=_numpy.int64)[day_index]
+    transition = _numpy.array([day is None for day in day_offsets], dtype=bool)[day_index]
+
+    for index in _numpy.flatnonzero(transition):
+        utc_offsets[index], dst_offsets[index] = offsets.offsets(int(seconds[index]))
+
+    ordinal_dates, microseconds = _numpy.divmod(microseconds + utc_offsets * 1_000_000, _MICROSECONDS_PER_DAY)
+
+    return ordinal_dates + _POSIX_EPOCH, microseconds, utc_offsets, dst_offsets
+
+
+def _array_microseconds_to_agrima_units(microseconds):
+    #
+    # Split, so the products stay well inside int64
+    #
+    numerator, denominator = _AGRIMA_UNITS_PER_MICROSECOND
+    whole, remainder = _numpy.divmod(microseconds, denominator)
+    return whole * numerator + (remainder * numerator * 2 + denominator) // (denominator * 2)
+
+
+def _array_agrima_units_to_time_fields(agrima_units):
+    agrima_units, shaditiboda = _numpy.divmod(agrima_units, 1_679_616)
+    agrima_units, boda = _numpy.divmod(agrima_units, 36)
+    agrima_units, anuga = _numpy.divmod(agrima_units, 36)
+    agrima_units, agrima = _numpy.divmod(agrima_units, 36)
+    uta, posha = _numpy.divmod(agrima_units, 36)
+
+    return uta, posha, agrima, anuga, boda, shaditiboda
+
+
+def timestamps_to_date_time_fields(timestamps, time_zone: str | ZoneInfo = None):
+    """
+    The year, month, day, uta, posha, agrima, anuga, boda
+    and shaditiboda of many timestamps, as plain ints;
+    for a NumPy array, a tuple of nine int64 arrays is returned,
+    for anything else (lists, generators, files being read),
+    the tuples are yielded one by one, as the timestamps come
+    """
+    time_zone, time_zone_info = _time_zone_info(time_zone)
+
+    if _is_array(timestamps):
+        ordinal_dates, microseconds, utc_offsets, dst_offsets = _array_timestamps_to_local_microseconds(timestamps, time_zone_info)
+        years, months, days = _array_ordinal_to_year_month_day(ordinal_dates)
+        return (years, months, days) + _array_agrima_units_to_time_fields(_array_microseconds_to_agrima_units(microseconds))
+
+    return _timestamps_to_date_time_fields(timestamps, time_zone_info)
+
+
+def _timestamps_to_date_time_fields(timestamps, time_zone: ZoneInfo):
+    year_month_day = {}
+
+    for ordinal_date, microseconds, utc_offset, dst_offset in _timestamps_to_local_microseconds(timestamps, time_zone):
+        if ordinal_date not in year_month_day:
+            if len(year_month_day) >= 1_296:
+                year_month_day.clear()
+
+            year_month_day[ordinal_date] = _ordinal_to_year_month_day(ordinal_date)[:3]
+
+        yield year_month_day[ordinal_date] + _agrima_units_to_time_fields(_microseconds_to_agrima_units(microseconds))
+
+
 def mars_sol(julian_day: Sezimal) -> Sezimal:
     #
     # Ref. https://en.wikipedia.org/wiki/Timekeeping_on_Mars#Mars_Sol_Date
@@ -448,40 +710,39 @@ def mars_sol(julian_day: Sezimal) -> Sezimal:
 # Leap seconds to TAI “time zone”
 # Date in Python ordinal date, seconds to add
 #
-sezimal_context.use_ultra_precision()
-
-_TAI_LEAP_SECONDS = {
-    736_330: Sezimal('31.5..514_02'),     # 213200-20-44 - ISO-2017-01-01 - 37 s
-    735_780: Sezimal('31.2..35_01'),      # 213155-11-03 - ISO-2015-07-01 - 36 s
-    734_685: Sezimal('30.5..2'),          # 213152-10-44 - ISO-2012-07-01 - 35 s
-    733_408: Sezimal('30..205_43'),       # 213145-01-04 - ISO-2009-01-01 - 34 s
-    732_312: Sezimal('25.4..530_41'),     # 213141-20-44 - ISO-2006-01-01 - 33 s
-    729_755: Sezimal('25..140_25'),       # 213130-20-53 - ISO-1999-01-01 - 32 s
-    729_206: Sezimal('24.4..235_01'),     # 213125-11-02 - ISO-1997-07-01 - 31 s
-    728_659: Sezimal('24..1'),            # 213124-01-01 - ISO-1996-01-01 - 30 s
-    728_110: Sezimal('23.3..543_20...'),  # 213122-10-42 - ISO-1994-07-01 - 29 s
-    727_745: Sezimal('23..041_53'),       # 213121-10-41 - ISO-1993-07-01 - 28 s
-    727_380: Sezimal('22.3..251_40...'),  # 213120-11-03 - ISO-1992-07-01 - 27 s
-    726_833: Sezimal('22..012_35'),       # 213115-01-02 - ISO-1991-01-01 - 26 s
-    726_468: Sezimal('21.3'),             # 213114-01-01 - ISO-1990-01-01 - 25 s
-    725_737: Sezimal('20..543_20'),       # 213111-20-53 - ISO-1988-01-01 - 24 s
-    724_823: Sezimal('20.2..304_15'),     # 213105-11-01 - ISO-1985-07-01 - 23 s
-    724_092: Sezimal('15.5..140_25'),     # 213103-10-42 - ISO-1983-07-01 - 22 s
-    723_727: Sezimal('15.2..012_35'),     # 213102-10-41 - ISO-1982-07-01 - 21 s
-    723_362: Sezimal('14..4'),            # 213101-11-03 - ISO-1981-07-01 - 20 s
-    722_815: Sezimal('14.1..320_54'),     # 213100-01-02 - ISO-1980-01-01 - 19 s
-    722_450: Sezimal('13..415_30...'),    # 213055-01-01 - ISO-1979-01-01 - 18 s
-    722_085: Sezimal('13.1..025_14'),     # 213053-20-44 - ISO-1978-01-01 - 17 s
-    721_720: Sezimal('12..350_12'),       # 213052-20-43 - ISO-1977-01-01 - 16 s
-    721_354: Sezimal('12.0..3'),          # 213051-20-52 - ISO-1976-01-01 - 15 s
-    720_989: Sezimal('11..320_54'),       # 213051-01-03 - ISO-1975-01-01 - 14 s
-    720_624: Sezimal('11.0..041_53'),     # 213050-01-02 - ISO-1974-01-01 - 13 s
-    720_259: Sezimal('10..251_40...'),    # 213045-01-01 - ISO-1973-01-01 - 12 s
-    720_075:  Sezimal('5.5..350_12'),     # 213044-10-43 - ISO-1972-07-01 - 11 s
-    719_893:  Sezimal('5..2'),            # 213043-20-43 - ISO-1972-01-01 - 10 s
-}
-
-sezimal_context.back_to_regular_precision()
+with sezimal_context.local():
+    sezimal_context.use_ultra_precision()
+
+    _TAI_LEAP_SECONDS = {
+        736_330: Sezimal('31.5..514_02'),     # 213200-20-44 - ISO-2017-01-01 - 37 s
+        735_780: Sezimal('31.2..35_01'),      # 213155-11-03 - ISO-2015-07-01 - 36 s
+        734_685: Sezimal('30.5..2'),          # 213152-10-44 - ISO-2012-07-01 - 35 s
+        733_408: Sezimal('30..205_43'),       # 213145-01-04 - ISO-2009-01-01 - 34 s
+        732_312: Sezimal('25.4..530_41'),     # 213141-20-44 - ISO-2006-01-01 - 33 s
+        729_755: Sezimal('25..140_25'),       # 213130-20-53 - ISO-1999-01-01 - 32 s
+        729_206: Sezimal('24.4..235_01'),     # 213125-11-02 - ISO-1997-07-01 - 31 s
+        728_659: Sezimal('24..1'),            # 213124-01-01 - ISO-1996-01-01 - 30 s
+        728_110: Sezimal('23.3..543_20...'),  # 213122-10-42 - ISO-1994-07-01 - 29 s
+        727_745: Sezimal('23..041_53'),       # 213121-10-41 - ISO-1993-07-01 - 28 s
+        727_380: Sezimal('22.3..251_40...'),  # 213120-11-03 - ISO-1992-07-01 - 27 s
+        726_833: Sezimal('22..012_35'),       # 213115-01-02 - ISO-1991-01-01 - 26 s
+        726_468: Sezimal('21.3'),             # 213114-01-01 - ISO-1990-01-01 - 25 s
+        725_737: Sezimal('20..543_20'),       # 213111-20-53 - ISO-1988-01-01 - 24 s
+        724_823: Sezimal('20.2..304_15'),     # 213105-11-01 - ISO-1985-07-01 - 23 s
+        724_092: Sezimal('15.5..140_25'),     # 213103-10-42 - ISO-1983-07-01 - 22 s
+        723_727: Sezimal('15.2..012_35'),     # 213102-10-41 - ISO-1982-07-01 - 21 s
+        723_362: Sezimal('14..4'),            # 213101-11-03 - ISO-1981-07-01 - 20 s
+        722_815: Sezimal('14.1..320_54'),     # 213100-01-02 - ISO-1980-01-01 - 19 s
+        722_450: Sezimal('13..415_30...'),    # 213055-01-01 - ISO-1979-01-01 - 18 s
+        722_085: Sezimal('13.1..025_14'),     # 213053-20-44 - ISO-1978-01-01 - 17 s
+        721_720: Sezimal('12..350_12'),       # 213052-20-43 - ISO-1977-01-01 - 16 s
+        721_354: Sezimal('12.0..3'),          # 213051-20-52 - ISO-1976-01-01 - 15 s
+        720_989: Sezimal('11..320_54'),       # 213051-01-03 - ISO-1975-01-01 - 14 s
+        720_624: Sezimal('11.0..041_53'),     # 213050-01-02 - ISO-1974-01-01 - 13 s
+        720_259: Sezimal('10..251_40...'),    # 213045-01-01 - ISO-1973-01-01 - 12 s
+        720_075:  Sezimal('5.5..350_12'),     # 213044-10-43 - ISO-1972-07-01 - 11 s
+        719_893:  Sezimal('5..2'),            # 213043-20-43 - ISO-1972-01-01 - 10 s
+    }
 
 
 def _tai_offset(base_gregorian_date: _datetime.datetime | _datetime.date) -> SezimalInteger:
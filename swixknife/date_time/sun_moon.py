@@ -1,17 +1,13 @@
 
-import sqlite3
-
-import pathlib
-
-DB_NAME = pathlib.Path.joinpath(pathlib.Path(__file__).parent.resolve(), 'sun_moon.db')
-
 from .date import SezimalDate
 from .date_time import SezimalDateTime
 from .sezimal_functions import system_time_zone, tz_days_offset, ZoneInfo
 from ..sezimal import SezimalInteger, Sezimal
 from ..localization import SezimalLocale
 from ..functions import SezimalRange
-from .format_tokens import SEASON_MOON_TEXT_FORMAT_TOKENS, SEASON_MOON_TIME_FORMAT_TOKENS
+from .format_tokens import SEASON_MOON_TEXT_FORMAT_TOKENS, SEASON_MOON_TIME_FORMAT_TOKENS, \
+    compile_date_format
+from .sun_moon_store import sun_moon_store, DB_NAME
 
 
 NORTHERN_HEMISPHERE = 'N'
@@ -21,9 +17,6 @@ SOUTHERN_EQUATOR_HEMISPHERE = 'SE'
 
 
 def _sun_moon_search(self, sun_moon: str, hemisphere: str = '', only_four: bool = False, nearest: bool = False, time_zone: str | ZoneInfo = None):
-    connection = sqlite3.connect(DB_NAME)
-    cursor = connection.cursor()
-
     if not time_zone:
         time_zone = system_time_zone()
 
@@ -32,67 +25,17 @@ def _sun_moon_search(self, sun_moon: str, hemisphere: str = '', only_four: bool
     search_start = self.as_days - days_offset
     search_end = search_start + Sezimal('0.555_555_555_555_555_555')
 
-    sql = f'''
-select
-    sm.name,
-    sm.date_time_as_days
-
-from
-    sun_moon sm
-'''
-
     if nearest:
-        sql += f'''
-where
-    sm.date_time_as_days <= '{str(search_end)}'
-    and sm.sun_moon = '{sun_moon}'
-'''
-
-        if only_four and sun_moon == 'sun':
-            sql += f'''
-    and sm.name not like '%cross%'
-'''
-        elif only_four and sun_moon == 'moon':
-            sql += f'''
-    and sm.name not like '%waxing%'
-    and sm.name not like '%waning%'
-'''
-
-        sql += '''
-order by
-    sm.date desc
-
-limit 1
-'''
+        res = sun_moon_store.latest(search_end, sun_moon=sun_moon, only_four=only_four)
     else:
-        sql += f'''
-where
-    sm.date_time_as_days >= '{str(search_start)}'
-    and sm.date_time_as_days <= '{str(search_end)}'
-    and sm.sun_moon = '{sun_moon}'
-'''
-
-        if only_four and sun_moon == 'sun':
-            sql += f'''
-    and sm.name not like '%cross%'
-'''
-        elif only_four and sun_moon == 'moon':
-            sql += f'''
-    and sm.name not like '%waxing%'
-    and sm.name not like '%waning%'
-'''
-
-    sql += ';'
-
-    res = cursor.execute(sql)
-    res = res.fetchone()
-    connection.close()
+        res = sun_moon_store.events(search_start, search_end, sun_moon=sun_moon, only_four=only_four)
+        res = res[0] if res else None
 
     if res is None:
         return '', None
 
-    name = res[0]
-    date_time = SezimalDateTime.from_days(Sezimal(res[1]), time_zone='UTC')
+    sun_moon, name, date_time_as_days = res
+    date_time = SezimalDateTime.from_days(Sezimal(date_time_as_days), time_zone='UTC')
 
     if sun_moon == 'sun' and hemisphere:
         if hemisphere == NORTHERN_HEMISPHERE:
@@ -230,8 +173,11 @@ def _moon_time(self, fmt: str, locale: SezimalLocale, four_phases: bool = False,
     return moon_phase_date_time.format(fmt, locale)
 
 
-def _apply_season_format(self, fmt: str, locale: SezimalLocale, time_zone: str | ZoneInfo = None, season_moon_time_format: str = None) -> str:
-    for regex, base, hemisphere, number, case, season_moon in SEASON_MOON_TEXT_FORMAT_TOKENS:
+def _apply_season_format(self, fmt: str, locale: SezimalLocale, time_zone: str | ZoneInfo = None, season_moon_time_format: str = None, format_tokens: dict[str, tuple] = None) -> str:
+    if format_tokens is None:
+        format_tokens = compile_date_format(fmt)
+
+    for regex, base, hemisphere, number, case, season_moon in format_tokens['season_moon_text']:
         if not regex.findall(fmt):
             continue
 
@@ -282,7 +228,7 @@ def _apply_season_format(self, fmt: str, locale: SezimalLocale, time_zone: str |
 
         fmt = regex.sub(text, fmt)
 
-    for regex, base, number, season_moon in SEASON_MOON_TIME_FORMAT_TOKENS:
+    for regex, base, number, season_moon in format_tokens['season_moon_time']:
         if not regex.findall(fmt):
             continue
 
@@ -321,9 +267,6 @@ SezimalDate._apply_season_format = _apply_season_format
 
 
 def list_sun_moon(year: SezimalInteger, month: SezimalInteger = None, time_zone: str | ZoneInfo = None, only_sun: bool = False, only_moon: bool = False, event: str = None, only_four: bool = False) -> list[str]:
-    connection = sqlite3.connect(DB_NAME)
-    cursor = connection.cursor()
-
     if not time_zone:
         time_zone = system_time_zone()
 
@@ -343,37 +286,17 @@ def list_sun_moon(year: SezimalInteger, month: SezimalInteger = None, time_zone:
         days_offset, days_offset_dst = tz_days_offset(time_zone, date_end.gregorian_isoformat)
         search_end = date_end.as_days - days_offset + Sezimal('0.555_555_555_555_555_555')
 
-    sql = f'''
-select
-    sm.sun_moon,
-    sm.name,
-    sm.date_time_as_days
-
-from
-    sun_moon sm
-
-where
-    sm.date_time_as_days >= '{search_start}'
-    and sm.date_time_as_days <= '{search_end}'
-    {"and sm.sun_moon = 'sun'" if only_sun else ''}
-    {"""and sm.sun_moon = 'sun'
-        and sm.name not like '%cross%'""" if only_sun and only_four else ''}
-    {"and sm.sun_moon = 'moon'" if only_moon else ''}
-    {"""and sm.sun_moon = 'moon'
-        and sm.name not like '%waxing%'
-        and sm.name not like '%waning%'""" if only_moon and only_four else ''}
-    {f"and sm.name = '{event}'" if event else ''}
-
-order by
-    sm.date_time_as_days;
-'''
-
-    res = cursor.execute(sql)
-    res = res.fetchall()
-    connection.close()
+    if only_sun:
+        sun_moon = 'sun'
+    elif only_moon:
+        sun_moon = 'moon'
+    else:
+        sun_moon = ''
 
-    if res is None:
-        return []
+    res = sun_moon_store.events(
+        search_start, search_end,
+        sun_moon=sun_moon, only_four=only_four and bool(sun_moon), event=event,
+    )
 
     events = []
 
@@ -0,0 +1,214 @@
+
+__all__ = ('SezimalSun', 'calculate_sun_moon_year', 'SUN_EVENTS', 'MOON_QUARTERS')
+
+from zoneinfo import ZoneInfo
+from decimal import Decimal
+
+from ..sezimal import Sezimal, SezimalInteger
+from .date import SezimalDate
+from .date_time import SezimalDateTime
+from .sezimal_functions import system_time_zone
+from .gregorian_functions import gregorian_year_month_day_to_ordinal_date
+from .sun_moon_db.astronomy import Seasons, SearchMoonQuarter, NextMoonQuarter, Time
+
+
+SUN_EVENTS = (
+    'february_cross_quarter',
+    'march_equinox',
+    'may_cross_quarter',
+    'june_solstice',
+    'august_cross_quarter',
+    'september_equinox',
+    'november_cross_quarter',
+    'december_solstice',
+)
+
+#
+# The name of each moon quarter, and of the cross-quarter
+# right before it
+#
+MOON_QUARTERS = (
+    ('new', 'waning_crescent'),
+    ('first_quarter', 'waxing_crescent'),
+    ('full', 'waxing_gibbous'),
+    ('third_quarter', 'waning_gibbous'),
+)
+
+
+def _middle_date_time(first_date, second_date, time_zone) -> SezimalDateTime:
+    cross_quarter = first_date.at_time_zone('UTC').as_days.decimal
+    cross_quarter += (second_date.at_time_zone('UTC').as_days.decimal - first_date.at_time_zone('UTC').as_days.decimal) / 2
+    return SezimalDateTime.from_days(cross_quarter, time_zone='UTC').at_time_zone(time_zone)
+
+
+def _astronomy_date_to_date(ad: Time) -> SezimalDateTime:
+    date, time = str(ad).split('T')
+    time = time.replace('Z', '')
+
+    if date.startswith('-'):
+        _, year, month, day = date.split('-')
+        year = '-' + str(int(year))
+
+    else:
+        year, month, day = date.split('-')
+
+    ordinal_date = gregorian_year_month_day_to_ordinal_date(int(year), int(month), int(day))
+
+    hour, minute, second = time.split(':')
+
+    #
+    # The fraction of the second comes in milliseconds
+    #
+    if '.' in second:
+        second, fraction = second.split('.')
+    else:
+        fraction = '0'
+
+    seconds = Decimal(hour) * 60 * 60
+    seconds += Decimal(minute) * 60
+    seconds += Decimal(second)
+    seconds += Decimal('0.' + fraction)
+
+    agrima = seconds * Sezimal('1_000') / Sezimal('1_504')
+    agrima /= 1_000_000
+
+    ordinal_date += agrima
+
+    date = SezimalDateTime.from_days(ordinal_date, 'UTC')
+
+    return date
+
+
+def _moon_quarter_date_time(moon_quarter) -> SezimalDateTime:
+    #
+    # Not through datetime, the quarters of the years
+    # before 1 CE or after 9999 CE are out of its range
+    #
+    return _astronomy_date_to_date(moon_quarter.time)
+
+
+class SezimalSun:
+    def __new__(cls, year: int | SezimalInteger, time_zone: str | ZoneInfo = None):
+        date = SezimalDate(year, 11, 1)
+
+        self = object.__new__(cls)
+
+        time_zone = time_zone or system_time_zone()
+
+        self._year = year
+        self._time_zone = str(time_zone)
+
+        previous_year_seasons = Seasons(date.gregorian_year - 1)
+        this_year_seasons = Seasons(date.gregorian_year)
+
+        self._previous_december_solstice = \
+            _astronomy_date_to_date(previous_year_seasons.dec_solstice)
+        self._march_equinox = \
+            _astronomy_date_to_date(this_year_seasons.mar_equinox)
+        self._june_solstice = \
+            _astronomy_date_to_date(this_year_seasons.jun_solstice)
+        self._september_equinox = \
+            _astronomy_date_to_date(this_year_seasons.sep_equinox)
+        self._december_solstice = \
+            _astronomy_date_to_date(this_year_seasons.dec_solstice)
+
+        #
+        # Cross-quarters
+        #
+        self._february_cross_quarter = _middle_date_time(self._previous_december_solstice, self._march_equinox, time_zone)
+        self._may_cross_quarter = _middle_date_time(self._march_equinox, self._june_solstice, time_zone)
+        self._august_cross_quarter = _middle_date_time(self._june_solstice, self._september_equinox, time_zone)
+        self._november_cross_quarter = _middle_date_time(self._september_equinox, self._december_solstice, time_zone)
+
+        return self
+
+    def __repr__(self) -> str:
+        return f"SezimalSun(year={self.year}, time_zone='{self.time_zone}')"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    @property
+    def year(self) -> SezimalInteger:
+        return self._year
+
+    @property
+    def time_zone(self) -> str:
+        return self._time_zone
+
+    @property
+    def february_cross_quarter(self) -> SezimalDateTime:
+        return self._february_cross_quarter
+
+    @property
+    def march_equinox(self) -> SezimalDateTime:
+        return self._march_equinox
+
+    @property
+    def may_cross_quarter(self) -> SezimalDateTime:
+        return self._may_cross_quarter
+
+    @property
+    def june_solstice(self) -> SezimalDateTime:
+        return self._june_solstice
+
+    @property
+    def august_cross_quarter(self) -> SezimalDateTime:
+        return self._august_cross_quarter
+
+    @property
+    def september_equinox(self) -> SezimalDateTime:
+        return self._september_equinox
+
+    @property
+    def november_cross_quarter(self) -> SezimalDateTime:
+        return self._november_cross_quarter
+
+    @property
+    def december_solstice(self) -> SezimalDateTime:
+        return self._december_solstice
+
+
+def _moon_phases(year: int | SezimalInteger) -> list[tuple[SezimalDateTime, str]]:
+    #
+    # The search starts a few days before the year, so the first
+    # quarter found is always in the year before, and the
+    # cross-quarter right after it is never missed
+    #
+    first_day = SezimalDate(year, 1, 1)
+    time = Time.Make(first_day.gregorian_year, first_day.gregorian_month, first_day.gregorian_day, 0, 0, 0).AddDays(-10)
+    moon_quarter = SearchMoonQuarter(time)
+    previous_date = _moon_quarter_date_time(moon_quarter)
+
+    phases = []
+
+    while previous_date.year <= year:
+        moon_quarter = NextMoonQuarter(moon_quarter)
+        date = _moon_quarter_date_time(moon_quarter)
+        quarter, cross_quarter = MOON_QUARTERS[moon_quarter.quarter]
+
+        phases.append((_middle_date_time(previous_date, date, 'UTC'), cross_quarter))
+        phases.append((date, quarter))
+
+        previous_date = date
+
+    return phases
+
+
+def calculate_sun_moon_year(year: int | SezimalInteger) -> list[tuple[str, str, str, str]]:
+    #
+    # All the seasons and moon phases of a year, in UTC,
+    # as (date, sun_moon, name, date_time_as_days),
+    # the same columns the sun_moon database has
+    #
+    year = SezimalInteger(year)
+    sun = SezimalSun(year, time_zone='UTC')
+
+    events = [(getattr(sun, name), 'sun', name) for name in SUN_EVENTS]
+    events += [(date, 'moon', name) for date, name in _moon_phases(year)]
+
+    return [
+        (str(date.date), sun_moon, name, str(date.as_days))
+        for date, sun_moon, name in sorted(events, key=lambda event: event[0].as_days)
+        if date.year == year
+    ]
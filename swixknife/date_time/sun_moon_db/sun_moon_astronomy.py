@@ -9,141 +9,15 @@ from decimal import Decimal
 from swixknife import Sezimal, SezimalInteger, SezimalRange, SezimalLocale, \
     SezimalDate, SezimalTime, SezimalDateTime
 from swixknife.date_time.sezimal_functions import system_time_zone
-from swixknife.date_time.gregorian_functions import gregorian_year_month_day_to_ordinal_date
+from swixknife.date_time.sun_moon_store import _days_key
+from swixknife.date_time.sun_moon_calculation import SezimalSun, _middle_date_time
+from swixknife.date_time.sun_moon_db.astronomy import SearchMoonQuarter, Time
 
 import datetime as _datetime
 
-
-from astronomy import Seasons, SearchMoonQuarter, Time
-
 import sqlite3
 
 
-def _middle_date_time(first_date, second_date, time_zone) -> SezimalDateTime:
-    cross_quarter = first_date.at_time_zone('UTC').as_days.decimal
-    cross_quarter += (second_date.at_time_zone('UTC').as_days.decimal - first_date.at_time_zone('UTC').as_days.decimal) / 2
-    return SezimalDateTime.from_days(cross_quarter, time_zone='UTC').at_time_zone(time_zone)
-
-
-def _astronomy_date_to_date(ad: Time) -> SezimalDateTime:
-    date, time = str(ad).split('T')
-    time = time.replace('Z', '')
-
-    if date.startswith('-'):
-        _, year, month, day = date.split('-')
-        year = '-' + str(int(year))
-
-    else:
-        year, month, day = date.split('-')
-
-    ordinal_date = gregorian_year_month_day_to_ordinal_date(int(year), int(month), int(day))
-
-    hour, minute, second = time.split(':')
-
-    if '.' in second:
-        second, microsecond = second.split('.')
-    else:
-        microsecond = '0'
-
-    seconds = Decimal(hour) * 60 * 60
-    seconds += Decimal(minute) * 60
-    seconds += Decimal(second)
-    seconds += Decimal(microsecond) / 1_000_000
-
-    agrima = seconds * Sezimal('1_000') / Sezimal('1_504')
-    agrima /= 1_000_000
-
-    ordinal_date += agrima
-
-    date = SezimalDateTime.from_days(ordinal_date, 'UTC')
-
-    return date
-
-
-class SezimalSun:
-    def __new__(cls, year: int | SezimalInteger, time_zone: str | ZoneInfo = None):
-        date = SezimalDate(year, 11, 1)
-
-        self = object.__new__(cls)
-
-        time_zone = time_zone or system_time_zone()
-
-        self._year = year
-        self._time_zone = str(time_zone)
-
-        previous_year_seasons = Seasons(date.gregorian_year - 1)
-        this_year_seasons = Seasons(date.gregorian_year)
-
-        # next_year_seasons = Seasons(date.gregorian_year + 1)
-
-        self._previous_december_solstice = \
-            _astronomy_date_to_date(previous_year_seasons.dec_solstice)
-        self._march_equinox = \
-            _astronomy_date_to_date(this_year_seasons.mar_equinox)
-        self._june_solstice = \
-            _astronomy_date_to_date(this_year_seasons.jun_solstice)
-        self._september_equinox = \
-            _astronomy_date_to_date(this_year_seasons.sep_equinox)
-        self._december_solstice = \
-            _astronomy_date_to_date(this_year_seasons.dec_solstice)
-
-        #
-        # Cross-quarters
-        #
-        self._february_cross_quarter = _middle_date_time(self._previous_december_solstice, self._march_equinox, time_zone)
-        self._may_cross_quarter = _middle_date_time(self._march_equinox, self._june_solstice, time_zone)
-        self._august_cross_quarter = _middle_date_time(self._june_solstice, self._september_equinox, time_zone)
-        self._november_cross_quarter = _middle_date_time(self._september_equinox, self._december_solstice, time_zone)
-
-        return self
-
-    def __repr__(self) -> str:
-        return f"SezimalSun(year={self.year}, time_zone='{self.time_zone}')"
-
-    def __str__(self) -> str:
-        return self.__repr__()
-
-    @property
-    def year(self) -> SezimalInteger:
-        return self._year
-
-    @property
-    def time_zone(self) -> str:
-        return self._time_zone
-
-    @property
-    def february_cross_quarter(self) -> SezimalDateTime:
-        return self._february_cross_quarter
-
-    @property
-    def march_equinox(self) -> SezimalDateTime:
-        return self._march_equinox
-
-    @property
-    def may_cross_quarter(self) -> SezimalDateTime:
-        return self._may_cross_quarter
-
-    @property
-    def june_solstice(self) -> SezimalDateTime:
-        return self._june_solstice
-
-    @property
-    def august_cross_quarter(self) -> SezimalDateTime:
-        return self._august_cross_quarter
-
-    @property
-    def september_equinox(self) -> SezimalDateTime:
-        return self._september_equinox
-
-    @property
-    def november_cross_quarter(self) -> SezimalDateTime:
-        return self._november_cross_quarter
-
-    @property
-    def december_solstice(self) -> SezimalDateTime:
-        return self._december_solstice
-
-
 MOONS = {}
 
 
@@ -207,9 +81,10 @@ def calculate_moon_phases(year_start: int | SezimalInteger, year_finish: int | S
 if __name__ == '__main__':
     connection = sqlite3.connect('./sun_moon.db')
     cursor = connection.cursor()
-    cursor.execute('create table if not exists sun_moon(date text, sun_moon text, name text, date_time_as_days text);')
+    cursor.execute('create table if not exists sun_moon(date text, sun_moon text, name text, date_time_as_days text, date_time_as_days_key integer);')
     cursor.execute('create unique index if not exists sun_moon_pk_index on sun_moon(date, sun_moon, name);')
     cursor.execute('create unique index if not exists sun_moon_desc_pk_index on sun_moon(date desc, sun_moon, name);')
+    cursor.execute('create index if not exists sun_moon_days_key_index on sun_moon(sun_moon, date_time_as_days_key);')
 
     SPAN = SezimalInteger(300)
     MIN_YEAR = 131_400 - SPAN
@@ -238,13 +113,15 @@ insert or ignore into sun_moon (
     date,
     sun_moon,
     name,
-    date_time_as_days
+    date_time_as_days,
+    date_time_as_days_key
 )
 values (
     '{str(date.date)}',
     'sun',
     '{field}',
-    '{str(date.as_days)}'
+    '{str(date.as_days)}',
+    {_days_key(date.as_days)}
 );
 '''
             cursor.execute('begin transaction;')
@@ -268,13 +145,15 @@ insert or ignore into sun_moon (
     date,
     sun_moon,
     name,
-    date_time_as_days
+    date_time_as_days,
+    date_time_as_days_key
 )
 values (
     '{str(date.date)}',
     'moon',
     '{name}',
-    '{str(date.as_days)}'
+    '{str(date.as_days)}',
+    {_days_key(date.as_days)}
 );
 '''
         cursor.execute('begin transaction;')
@@ -283,4 +162,5 @@ values (
 
     print('Done moon')
 
+    connection.execute('vacuum;')
     connection.close()
@@ -0,0 +1,462 @@
+
+__all__ = ('SunMoonStore', 'sun_moon_store', 'migrate_sun_moon_db', 'SunMoonCache')
+
+import sqlite3
+import threading
+import pathlib
+
+from bisect import bisect_left, bisect_right
+
+from ..sezimal import Sezimal
+from .sezimal_functions import _ordinal_to_year_month_day, _year_month_day_to_ordinal, \
+    _sezimal_integer
+
+
+DB_NAME = pathlib.Path.joinpath(pathlib.Path(__file__).parent.resolve(), 'sun_moon.db')
+
+CACHE_NAME = pathlib.Path.home().joinpath('.sezimal', 'sun_moon_cache.db')
+
+#
+# date_time_as_days is stored as text, so comparing it in SQL
+# is slow, and only right while all the days have the same number
+# of digits; the key column holds the same value as an integer,
+# counting 24 (16_dec) sezimal places of a day (about 30 nanoseconds);
+# that fits in an sqlite integer only up to about 8950 CE, fine for
+# the bundled database, but not for the years calculated, so the
+# cache keeps the keys as text
+#
+DAYS_KEY_PLACES = 24
+DAYS_KEY_PLACES_DECIMAL = int(str(DAYS_KEY_PLACES), 6)
+DAYS_KEY_UNIT = 6 ** DAYS_KEY_PLACES_DECIMAL
+
+
+def _days_key(days: str | Sezimal) -> int:
+    days = str(days).replace('_', '')
+
+    if '.' in days:
+        integer, fraction = days.split('.')
+    else:
+        integer, fraction = days, ''
+
+    fraction = fraction[:DAYS_KEY_PLACES_DECIMAL].ljust(DAYS_KEY_PLACES_DECIMAL, '0')
+
+    return int(integer + fraction, 6)
+
+
+def _key_year(key: int) -> int:
+    return _ordinal_to_year_month_day(key // DAYS_KEY_UNIT)[0]
+
+
+def _year_key(year: int) -> int:
+    return _year_month_day_to_ordinal(year, 1, 1) * DAYS_KEY_UNIT
+
+
+def migrate_sun_moon_db(db_name: str | pathlib.Path = DB_NAME):
+    #
+    # Adds and fills the numeric key column, and its index,
+    # to a database created before it existed;
+    # it’s safe to run more than once
+    #
+    connection = sqlite3.connect(db_name)
+    columns = [column[1] for column in connection.execute('pragma table_info(sun_moon);')]
+
+    with connection:
+        if 'date_time_as_days_key' not in columns:
+            connection.execute('alter table sun_moon add column date_time_as_days_key integer;')
+
+        connection.create_function('days_key', 1, _days_key, deterministic=True)
+        connection.execute('''
+update sun_moon set
+    date_time_as_days_key = days_key(date_time_as_days)
+
+where
+    date_time_as_days_key is null;
+''')
+        connection.execute('''
+create index if not exists sun_moon_days_key_index
+    on sun_moon(sun_moon, date_time_as_days_key);
+''')
+
+    connection.execute('vacuum;')
+    connection.close()
+
+
+class SunMoonCache:
+    #
+    # Write through cache of the years out of the span of the
+    # bundled database, calculated the first time they’re asked for;
+    # it’s an sqlite database as well, in WAL mode, so any number of
+    # processes can read it while another one writes to it;
+    # a year’s events are written in the same transaction that marks
+    # the year as done, so a year is either all there or not there at all,
+    # and two processes calculating the same year at the same time
+    # simply write the same rows;
+    # the key is text here, the years calculated can be far
+    # enough in the future (or the past) for it to overflow an integer,
+    # so the events are sorted after reading them
+    #
+    TIMEOUT = 60
+
+    SQL_CREATE = '''
+create table if not exists sun_moon(
+    year integer,
+    date text,
+    sun_moon text,
+    name text,
+    date_time_as_days text,
+    date_time_as_days_key text
+);
+create unique index if not exists sun_moon_pk_index
+    on sun_moon(date, sun_moon, name);
+create index if not exists sun_moon_year_index
+    on sun_moon(year);
+create table if not exists sun_moon_year(
+    year integer primary key
+);
+'''
+
+    SQL_YEAR = '''
+select
+    smy.year
+
+from
+    sun_moon_year smy
+
+where
+    smy.year = ?;
+'''
+
+    SQL_YEAR_EVENTS = '''
+select
+    sm.date_time_as_days_key,
+    sm.sun_moon,
+    sm.name,
+    sm.date_time_as_days
+
+from
+    sun_moon sm
+
+where
+    sm.year = ?;
+'''
+
+    SQL_INSERT_EVENT = '''
+insert or ignore into sun_moon (
+    year,
+    date,
+    sun_moon,
+    name,
+    date_time_as_days,
+    date_time_as_days_key
+)
+values (?, ?, ?, ?, ?, ?);
+'''
+
+    SQL_INSERT_YEAR = '''
+insert or ignore into sun_moon_year (
+    year
+)
+values (?);
+'''
+
+    def __init__(self, db_name: str | pathlib.Path = CACHE_NAME):
+        self.db_name = db_name
+        self._local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        db_name = pathlib.Path(self.db_name)
+        db_name.parent.mkdir(parents=True, exist_ok=True)
+
+        #
+        # Autocommit, so the transactions are only the ones begun here
+        #
+        connection = sqlite3.connect(db_name, timeout=self.TIMEOUT, isolation_level=None)
+        connection.execute('pragma journal_mode = wal;')
+        connection.executescript(self.SQL_CREATE)
+
+        return connection
+
+    def read(self, year: int) -> list[tuple[int, str, str, str]] | None:
+        #
+        # The events of the year, as (date_time_as_days_key, sun_moon,
+        # name, date_time_as_days), or None if it wasn’t calculated yet
+        #
+        if self.connection.execute(self.SQL_YEAR, (year,)).fetchone() is None:
+            return None
+
+        return sorted(
+            (int(key), sun_moon, name, days)
+            for key, sun_moon, name, days in self.connection.execute(self.SQL_YEAR_EVENTS, (year,))
+        )
+
+    def write(self, year: int, events: list[tuple[str, str, str, str]]) -> None:
+        #
+        # events as (date, sun_moon, name, date_time_as_days)
+        #
+        connection = self.connection
+        connection.execute('begin immediate;')
+
+        try:
+            connection.executemany(
+                self.SQL_INSERT_EVENT,
+                [
+                    (year, date, sun_moon, name, days, str(_days_key(days)))
+                    for date, sun_moon, name, days in events
+                ],
+            )
+            connection.execute(self.SQL_INSERT_YEAR, (year,))
+
+        except BaseException:
+            connection.execute('rollback;')
+            raise
+
+        connection.execute('commit;')
+
+    def clear(self) -> None:
+        connection = self.connection
+        connection.execute('begin immediate;')
+        connection.execute('delete from sun_moon_year;')
+        connection.execute('delete from sun_moon;')
+        connection.execute('commit;')
+
+
+class SunMoonStore:
+    #
+    # Read only access to the seasons and moon phases database;
+    # each thread gets its own connection, opened once and reused,
+    # and the events are read one whole year at a time, and kept
+    # in memory, so most searches don’t touch the database at all;
+    # the years out of the database span are calculated when needed,
+    # and kept in the cache, shared by all the processes
+    #
+    SQL_SPAN = '''
+select
+    min(sm.date_time_as_days_key),
+    max(sm.date_time_as_days_key)
+
+from
+    sun_moon sm;
+'''
+
+    SQL_YEAR_EVENTS = '''
+select
+    sm.date_time_as_days_key,
+    sm.sun_moon,
+    sm.name,
+    sm.date_time_as_days
+
+from
+    sun_moon sm
+
+where
+    sm.sun_moon in ('sun', 'moon')
+    and sm.date_time_as_days_key >= ?
+    and sm.date_time_as_days_key < ?
+
+order by
+    sm.date_time_as_days_key;
+'''
+
+    def __init__(self, db_name: str | pathlib.Path = DB_NAME, cache_name: str | pathlib.Path | None = CACHE_NAME):
+        self.db_name = db_name
+        self.cache = SunMoonCache(cache_name) if cache_name else None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._first_year = None
+        self._last_year = None
+        self._events = {}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        #
+        # The database is never changed here, it may well be
+        # in a read only install; the one shipped already has the key
+        #
+        uri = pathlib.Path(self.db_name).resolve().as_uri() + '?mode=ro'
+        connection = sqlite3.connect(uri, uri=True)
+        columns = [column[1] for column in connection.execute('pragma table_info(sun_moon);')]
+
+        if 'date_time_as_days_key' not in columns:
+            connection.close()
+            raise ValueError(f'The database {self.db_name} has no date_time_as_days_key column, run migrate_sun_moon_db on it first')
+
+        return connection
+
+    def _load_span(self):
+        if self._first_year is not None:
+            return
+
+        with self._lock:
+            if self._first_year is not None:
+                return
+
+            first_key, last_key = self.connection.execute(self.SQL_SPAN).fetchone()
+
+            #
+            # The database holds whole years, so the span is
+            # from the year of its first event to the year of its last
+            #
+            if first_key is None:
+                self._last_year = -1
+                self._first_year = 0
+            else:
+                self._last_year = _key_year(last_key)
+                self._first_year = _key_year(first_key)
+
+    def _calculated_year_events(self, year: int) -> list[tuple[int, str, str, str]]:
+        #
+        # The astronomy module is only imported here, the first
+        # time a year out of the database span is asked for;
+        # if the cache can’t be used (a read only home, say),
+        # or fails for any other reason, the year is still
+        # calculated, and kept only in memory
+        #
+        events = None
+
+        if self.cache is not None:
+            try:
+                events = self.cache.read(year)
+            except Exception:
+                pass
+
+        if events is not None:
+            return events
+
+        from .sun_moon_calculation import calculate_sun_moon_year
+
+        calculated = calculate_sun_moon_year(_sezimal_integer(year))
+
+        if self.cache is not None:
+            try:
+                self.cache.write(year, calculated)
+            except Exception:
+                pass
+
+        return [
+            (_days_key(days), sun_moon, name, days)
+            for date, sun_moon, name, days in calculated
+        ]
+
+    def _year_events(self, year: int) -> tuple:
+        year_events = self._events.get(year)
+
+        if year_events is not None:
+            return year_events
+
+        #
+        # Each thread has its own connection, so the year is read,
+        # or calculated, without holding the lock; two threads
+        # asking for the same new year at the same time may both
+        # calculate it, and the first one to finish is kept
+        #
+        if self._first_year <= year <= self._last_year:
+            events = self.connection.execute(
+                self.SQL_YEAR_EVENTS,
+                (_year_key(year), _year_key(year + 1)),
+            ).fetchall()
+        else:
+            events = self._calculated_year_events(year)
+
+        year_events = (
+            [key for key, sun_moon, name, days in events],
+            [(sun_moon, name, days) for key, sun_moon, name, days in events],
+        )
+
+        with self._lock:
+            return self._events.setdefault(year, year_events)
+
+    @staticmethod
+    def _wanted(sun_moon: str, name: str, only_sun_moon: str, only_four: bool, event: str) -> bool:
+        if only_sun_moon and sun_moon != only_sun_moon:
+            return False
+
+        if event and name != event:
+            return False
+
+        if only_four:
+            if sun_moon == 'sun' and 'cross' in name:
+                return False
+
+            if sun_moon == 'moon' and ('waxing' in name or 'waning' in name):
+                return False
+
+        return True
+
+    def events(self, start: str | Sezimal, end: str | Sezimal, sun_moon: str = '', only_four: bool = False, event: str = '') -> list[tuple[str, str, str]]:
+        #
+        # All the events from start to end (both included),
+        # in order, as (sun_moon, name, date_time_as_days)
+        #
+        self._load_span()
+
+        start_key = _days_key(start)
+        end_key = _days_key(end)
+
+        if end_key < start_key:
+            return []
+
+        events = []
+
+        for year in range(_key_year(start_key), _key_year(end_key) + 1):
+            keys, year_events = self._year_events(year)
+
+            for i in range(bisect_left(keys, start_key), bisect_right(keys, end_key)):
+                if self._wanted(*year_events[i][:2], sun_moon, only_four, event):
+                    events.append(year_events[i])
+
+        return events
+
+    def latest(self, end: str | Sezimal, sun_moon: str = '', only_four: bool = False, event: str = '') -> tuple[str, str, str] | None:
+        #
+        # The last event up to end (included), or None;
+        # every event happens about once a year, but not always
+        # inside every calendar year, the one at the end of the
+        # year before can fall at the start of the year itself,
+        # so the search goes back two whole years, and no further,
+        # not to calculate the years missing on the way
+        #
+        self._load_span()
+
+        end_key = _days_key(end)
+        year = _key_year(end_key)
+
+        for year in range(year, year - 3, -1):
+            keys, year_events = self._year_events(year)
+
+            for i in range(bisect_right(keys, end_key) - 1, -1, -1):
+                if self._wanted(*year_events[i][:2], sun_moon, only_four, event):
+                    return year_events[i]
+
+        return None
+
+    def clear_cache(self):
+        #
+        # Only the events kept in memory; the years
+        # calculated stay in the cache
+        #
+        with self._lock:
+            self._events = {}
+            self._first_year = None
+            self._last_year = None
+
+
+sun_moon_store = SunMoonStore()
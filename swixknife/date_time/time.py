@@ -31,9 +31,11 @@ from ..base import sezimal_format, sezimal_to_niftimal, default_to_sezimal_digit
     decimal_to_sezimal
 from ..localization import sezimal_locale, DEFAULT_LOCALE, SezimalLocale
 from .sezimal_functions import *
+from .sezimal_functions import _sezimal_integer, _seconds_to_agrimas, \
+    _microseconds_to_agrima_units, _agrima_units_to_time_fields
 from .format_tokens import TIME_NUMBER_FORMAT_TOKENS, \
     TIME_ZONE_OFFSET_FORMAT_TOKENS, ISO_TIME_NUMBER_FORMAT_TOKENS, \
-    DAY_FRACTION_FORMAT_TOKEN
+    DAY_FRACTION_FORMAT_TOKEN, compile_time_format
 
 
 class SezimalTime:
@@ -328,12 +330,15 @@ class SezimalTime:
 
         return value
 
-    def format(self, fmt: str = None, locale: str | SezimalLocale = None, skip_strftime: bool = False) -> str:
+    def format(self, fmt: str = None, locale: str | SezimalLocale = None, skip_strftime: bool = False, format_tokens: dict[str, tuple] = None) -> str:
         if not fmt:
             return fmt
 
         fmt = fmt.replace('##', '__HASHTAG__')
 
+        if format_tokens is None:
+            format_tokens = compile_time_format(fmt)
+
         if locale:
             if isinstance(locale, SezimalLocale):
                 lang = locale.LANG
@@ -349,7 +354,7 @@ class SezimalTime:
             fmt = locale.TIME_FORMAT
 
         for regex, token, base, zero, character, value_name, \
-            size, size_niftimal, size_decimal in TIME_NUMBER_FORMAT_TOKENS:
+            size, size_niftimal, size_decimal in format_tokens['time_number']:
             if not regex.findall(fmt):
                 continue
 
@@ -365,7 +370,7 @@ class SezimalTime:
 
             fmt = regex.sub(value, fmt)
 
-        for regex, token, base, colon in TIME_ZONE_OFFSET_FORMAT_TOKENS:
+        for regex, token, base, colon in format_tokens['time_zone_offset']:
             if not regex.findall(fmt):
                 continue
 
@@ -561,7 +566,7 @@ class SezimalTime:
             fmt = fmt.replace('%%', '___PERCENT___')
 
             for regex, token, base, zero, character, value_name, \
-                size_decimal, size_niftimal, size_sezimal in ISO_TIME_NUMBER_FORMAT_TOKENS:
+                size_decimal, size_niftimal, size_sezimal in format_tokens['iso_time_number']:
                 if not regex.findall(fmt):
                     continue
 
@@ -698,6 +703,36 @@ class SezimalTime:
         agrimas = Sezimal(days) * 1_000_000
         return cls(agrima=agrimas, time_zone=time_zone)
 
+    @classmethod
+    def _from_microseconds(cls, microseconds: int, time_zone: str, time_zone_info: ZoneInfo, utc_offset: int, dst_offset: int) -> Self:
+        #
+        # Used by the bulk timestamp conversion: the microseconds
+        # into the day and the offsets are already known,
+        # so the fields are split with plain ints
+        #
+        agrima_units = _microseconds_to_agrima_units(microseconds)
+        uta, posha, agrima, anuga, boda, shaditiboda = _agrima_units_to_time_fields(agrima_units)
+
+        self = object.__new__(cls)
+        self._day = _sezimal_integer(0)
+        self._uta = _sezimal_integer(uta)
+        self._posha = _sezimal_integer(posha)
+        self._agrima = _sezimal_integer(agrima)
+        self._anuga = _sezimal_integer(anuga)
+        self._boda = _sezimal_integer(boda)
+        self._shaditiboda = Sezimal._from_mantissa(shaditiboda, 0)
+        self._total_agrimas = Sezimal._from_mantissa(agrima_units, 12)
+        self._time_zone = time_zone
+        self._time_zone_offset = _seconds_to_agrimas(utc_offset)
+        self._dst_offset = _seconds_to_agrimas(dst_offset)
+
+        seconds, microsecond = divmod(microseconds, 1_000_000)
+        minutes, second = divmod(seconds, 60)
+        hour, minute = divmod(minutes, 60)
+        self._iso_time = _datetime.time(hour, minute, second, microsecond, tzinfo=time_zone_info)
+
+        return self
+
     def replace(self,
         uta: str | int | float | Decimal | Sezimal | SezimalInteger = None,
         posha: str | int | float | Decimal | Sezimal | SezimalInteger = None,
@@ -6,7 +6,7 @@ __all__ = (
 )
 
 
-from decimal import Decimal, localcontext, getcontext
+from decimal import Decimal, localcontext
 from fractions import Fraction as DecimalFraction
 
 from typing import TypeVar
@@ -26,8 +26,6 @@ from .base import validate_clean_dozenal, \
     sezimal_context
 
 
-getcontext().prec = sezimal_context.decimal_precision
-
 from . import _sezimal_maps
 
 #
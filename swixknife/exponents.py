@@ -32,25 +32,19 @@ def sezimal_exponent_to_decimal_exponent(exponent: str | int | SezimalInteger) -
     if exponent in _SEZIMAL_EXPONENT_TO_DECIMAL_EXPONENT:
         return _SEZIMAL_EXPONENT_TO_DECIMAL_EXPONENT[exponent]
 
-    _precision = sezimal_context.precision
+    with sezimal_context.local(precision=max(sezimal_context.precision, 120)):
+        exponent_six = Sezimal(10) ** exponent
 
-    if _precision < 120:
-        sezimal_context.precision = 120
+        exponent_ten = SezimalInteger(0)
 
-    exponent_six = Sezimal(10) ** exponent
-
-    exponent_ten = SezimalInteger(0)
-
-    if exponent > 0:
-        while exponent_six / (Sezimal(14) ** exponent_ten) > 1:
-            exponent_ten += 1
-    else:
-        while exponent_six * (Sezimal(14) ** exponent_ten) < 1:
-            exponent_ten += 1
-
-        exponent_ten *= -1
+        if exponent > 0:
+            while exponent_six / (Sezimal(14) ** exponent_ten) > 1:
+                exponent_ten += 1
+        else:
+            while exponent_six * (Sezimal(14) ** exponent_ten) < 1:
+                exponent_ten += 1
 
-    sezimal_context.precision = _precision
+            exponent_ten *= -1
 
     return exponent_ten
 
@@ -64,24 +58,18 @@ def decimal_exponent_to_sezimal_exponent(exponent: str | int | SezimalInteger) -
     if exponent in _DECIMAL_EXPONENT_TO_SEZIMAL_EXPONENT:
         return _DECIMAL_EXPONENT_TO_SEZIMAL_EXPONENT[exponent]
 
-    _precision = sezimal_context.precision
-
-    if _precision < 120:
-        sezimal_context.precision = 120
-
-    exponent_ten = Sezimal(14) ** exponent
-    exponent_six = SezimalInteger(0)
+    with sezimal_context.local(precision=max(sezimal_context.precision, 120)):
+        exponent_ten = Sezimal(14) ** exponent
+        exponent_six = SezimalInteger(0)
 
-    if exponent > 0:
-        while exponent_ten / (Sezimal(10) ** exponent_six) > 1:
-            exponent_six += 1
-    else:
-        while exponent_ten * (Sezimal(10) ** exponent_six) < 1:
-            exponent_six += 1
-
-        exponent_six *= -1
+        if exponent > 0:
+            while exponent_ten / (Sezimal(10) ** exponent_six) > 1:
+                exponent_six += 1
+        else:
+            while exponent_ten * (Sezimal(10) ** exponent_six) < 1:
+                exponent_six += 1
 
-    sezimal_context.precision = _precision
+            exponent_six *= -1
 
     return exponent_six
 
@@ -90,22 +78,16 @@ def sezimal_exponent_to_factor(sezimal_exponent: str | int | SezimalInteger, ret
     if type(sezimal_exponent) != SezimalInteger:
         sezimal_exponent = SezimalInteger(sezimal_exponent)
 
-    _precision = sezimal_context.precision
-
-    if _precision < 120:
-        sezimal_context.precision = 120
-
-    if sezimal_exponent in _SEZIMAL_EXPONENT_FACTOR:
-        sezimal_factor = _SEZIMAL_EXPONENT_FACTOR[sezimal_exponent]
-    elif sezimal_exponent < 0:
-        sezimal_factor = SezimalFraction(1, SezimalInteger(10) ** abs(sezimal_exponent))
-    else:
-        sezimal_factor = SezimalFraction(SezimalInteger(10) ** sezimal_exponent, 1)
-
-    if not return_fraction:
-        sezimal_factor = sezimal_factor.sezimal
+    with sezimal_context.local(precision=max(sezimal_context.precision, 120)):
+        if sezimal_exponent in _SEZIMAL_EXPONENT_FACTOR:
+            sezimal_factor = _SEZIMAL_EXPONENT_FACTOR[sezimal_exponent]
+        elif sezimal_exponent < 0:
+            sezimal_factor = SezimalFraction(1, SezimalInteger(10) ** abs(sezimal_exponent))
+        else:
+            sezimal_factor = SezimalFraction(SezimalInteger(10) ** sezimal_exponent, 1)
 
-    sezimal_context.precision = _precision
+        if not return_fraction:
+            sezimal_factor = sezimal_factor.sezimal
 
     return sezimal_factor
 
@@ -114,22 +96,16 @@ def decimal_exponent_to_factor(decimal_exponent: str | int | SezimalInteger, ret
     if type(decimal_exponent) != SezimalInteger:
         decimal_exponent = SezimalInteger(decimal_exponent)
 
-    _precision = sezimal_context.precision
-
-    if _precision < 120:
-        sezimal_context.precision = 120
-
-    if decimal_exponent in _DECIMAL_EXPONENT_FACTOR:
-        decimal_factor = _DECIMAL_EXPONENT_FACTOR[decimal_exponent]
-    elif decimal_exponent < 0:
-        decimal_factor = SezimalFraction(1, SezimalInteger(14) ** abs(decimal_exponent))
-    else:
-        decimal_factor = SezimalFraction(SezimalInteger(14) ** decimal_exponent, 1)
-
-    if not return_fraction:
-        decimal_factor = decimal_factor.sezimal
+    with sezimal_context.local(precision=max(sezimal_context.precision, 120)):
+        if decimal_exponent in _DECIMAL_EXPONENT_FACTOR:
+            decimal_factor = _DECIMAL_EXPONENT_FACTOR[decimal_exponent]
+        elif decimal_exponent < 0:
+            decimal_factor = SezimalFraction(1, SezimalInteger(14) ** abs(decimal_exponent))
+        else:
+            decimal_factor = SezimalFraction(SezimalInteger(14) ** decimal_exponent, 1)
 
-    sezimal_context.precision = _precision
+        if not return_fraction:
+            decimal_factor = decimal_factor.sezimal
 
     return decimal_factor
 
@@ -145,17 +121,11 @@ def sezimal_exponent_to_decimal_exponent_factor(sezimal_exponent: str | int | Se
 
     decimal_factor = decimal_exponent_to_factor(decimal_exponent, True)
 
-    _precision = sezimal_context.precision
-
-    if _precision < 120:
-        sezimal_context.precision = 120
-
-    factor = sezimal_factor / decimal_factor
-
-    if not return_fraction:
-        factor = factor.sezimal
+    with sezimal_context.local(precision=max(sezimal_context.precision, 120)):
+        factor = sezimal_factor / decimal_factor
 
-    sezimal_context.precision = _precision
+        if not return_fraction:
+            factor = factor.sezimal
 
     return factor
 
@@ -171,17 +141,11 @@ def decimal_exponent_to_sezimal_exponent_factor(decimal_exponent: str | int | Se
 
     sezimal_factor = sezimal_exponent_to_factor(sezimal_exponent, True)
 
-    _precision = sezimal_context.precision
+    with sezimal_context.local(precision=max(sezimal_context.precision, 120)):
+        factor = decimal_factor / sezimal_factor
 
-    if _precision < 120:
-        sezimal_context.precision = 120
-
-    factor = decimal_factor / sezimal_factor
-
-    if not return_fraction:
-        factor = factor.sezimal
-
-    sezimal_context.precision = _precision
+        if not return_fraction:
+            factor = factor.sezimal
 
     return factor
 
@@ -474,20 +438,14 @@ def binary_exponent_to_factor(binary_exponent: str | int | SezimalInteger, retur
     if binary_exponent <= 0:
         raise ValueError(f'Invalid binary exponent {binary_exponent}')
 
-    _precision = sezimal_context.precision
-
-    if _precision < 120:
-        sezimal_context.precision = 120
-
-    if binary_exponent in _BINARY_EXPONENT_FACTOR:
-        binary_factor = _BINARY_EXPONENT_FACTOR[binary_exponent]
-    else:
-        binary_factor = SezimalFraction(SezimalInteger(4_424) ** binary_exponent, 1)
-
-    if not return_fraction:
-        binary_factor = binary_factor.sezimal
+    with sezimal_context.local(precision=max(sezimal_context.precision, 120)):
+        if binary_exponent in _BINARY_EXPONENT_FACTOR:
+            binary_factor = _BINARY_EXPONENT_FACTOR[binary_exponent]
+        else:
+            binary_factor = SezimalFraction(SezimalInteger(4_424) ** binary_exponent, 1)
 
-    sezimal_context.precision = _precision
+        if not return_fraction:
+            binary_factor = binary_factor.sezimal
 
     return binary_factor
 
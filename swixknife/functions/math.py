@@ -25,33 +25,27 @@ def gcd(
     number_1: str | int | float | Decimal | Sezimal | SezimalInteger,
     number_2: str | int | float | Decimal | Sezimal | SezimalInteger,
 ) -> SezimalInteger:
-    using_ultra_precision = sezimal_context.using_ultra_precision
-    precision = sezimal_context.precision
-
-    if not using_ultra_precision:
+    with sezimal_context.local():
         sezimal_context.use_ultra_precision()
 
-    number_1 = Sezimal(number_1)
-    number_2 = Sezimal(number_2)
-    gcd = SezimalInteger(1)
-
-    while True:
-        x = number_1.decimal
-        y = number_2.decimal
+        number_1 = Sezimal(number_1)
+        number_2 = Sezimal(number_2)
+        gcd = SezimalInteger(1)
 
-        while y:
-            x, y = y, x % y
+        while True:
+            x = number_1.decimal
+            y = number_2.decimal
 
-        x = abs(x)
-        gcd *= x
+            while y:
+                x, y = y, x % y
 
-        if x == 1 or x == 0:
-            break
+            x = abs(x)
+            gcd *= x
 
-        number_1 = SezimalInteger(number_1.decimal / x)
-        number_2 = SezimalInteger(number_2.decimal / x)
+            if x == 1 or x == 0:
+                break
 
-    if not using_ultra_precision:
-        sezimal_context.back_to_regular_precision()
+            number_1 = SezimalInteger(number_1.decimal / x)
+            number_2 = SezimalInteger(number_2.decimal / x)
 
     return gcd
@@ -1,51 +1,117 @@
 
 
-from ..sezimal import SezimalInteger
+from ..sezimal import Sezimal, SezimalInteger
 from ..dozenal import DozenalInteger
 
 
+def _range_int(number: int | SezimalInteger) -> int:
+    #
+    # Plain ints have their digits read as sezimal,
+    # as everywhere else
+    #
+    if type(number) == int:
+        number = SezimalInteger(str(number))
+
+    elif type(number) != SezimalInteger:
+        number = SezimalInteger(number)
+
+    return int(number)
+
+
 class SezimalRange:
+    #
+    # The bounds are kept as plain ints, in a built-in range,
+    # which does all the work: length, containment, indexing
+    # and reversing take constant time, and the SezimalIntegers
+    # are created only as they’re iterated over or asked for
+    #
+    __slots__ = ('_range',)
+
     def __init__(self, start: int | SezimalInteger, stop: int | SezimalInteger = None, step: int | SezimalInteger = None):
         if stop is None:
             stop = start
-            start = SezimalInteger(0)
+            start = 0
 
         if step is None:
-            step = SezimalInteger(1)
+            step = 1
+
+        step = _range_int(step)
 
         if step == 0:
             raise ValueError('Cannot create a range with step 0')
 
-        self.start = SezimalInteger(start)
-        self.stop = SezimalInteger(stop)
-        self.step = SezimalInteger(step)
+        self._range = range(_range_int(start), _range_int(stop), step)
+
+    @classmethod
+    def _from_range(cls, int_range: range):
+        self = cls.__new__(cls)
+        self._range = int_range
+        return self
+
+    @property
+    def start(self) -> SezimalInteger:
+        return SezimalInteger._from_mantissa(self._range.start, 0)
+
+    @property
+    def stop(self) -> SezimalInteger:
+        return SezimalInteger._from_mantissa(self._range.stop, 0)
+
+    @property
+    def step(self) -> SezimalInteger:
+        return SezimalInteger._from_mantissa(self._range.step, 0)
 
     def __repr__(self):
         return f'SezimalRange({self.start}, {self.stop}, {self.step})'
 
     def __iter__(self):
-        if self.start == self.stop:
-            return []
+        for value in self._range:
+            yield SezimalInteger._from_mantissa(value, 0)
 
-        if self.step > 0:
-            if self.start > self.stop:
-                return []
+    def __reversed__(self):
+        for value in reversed(self._range):
+            yield SezimalInteger._from_mantissa(value, 0)
 
-            x = SezimalInteger(str(self.start))
+    def __len__(self) -> int:
+        return len(self._range)
 
-            while x < self.stop:
-                yield SezimalInteger(x)
-                x += self.step
+    def __contains__(self, value) -> bool:
+        try:
+            if type(value) != int:
+                value = Sezimal(value)
 
-        else:
-            if self.start < self.stop:
-                return []
+                if not value.is_integer():
+                    return False
 
-            x = SezimalInteger(str(self.start))
+            return _range_int(value) in self._range
 
-            while x > self.stop:
-                yield SezimalInteger(x)
-                x += self.step
+        except ValueError:
+            return False
+
+    def __getitem__(self, key: int | SezimalInteger | slice) -> SezimalInteger:
+        if type(key) == slice:
+            start, stop, step = key.start, key.stop, key.step
+
+            if start is not None:
+                start = _range_int(start)
+
+            if stop is not None:
+                stop = _range_int(stop)
+
+            if step is not None:
+                step = _range_int(step)
+
+            return SezimalRange._from_range(self._range[start:stop:step])
+
+        return SezimalInteger._from_mantissa(self._range[_range_int(key)], 0)
+
+    def __eq__(self, other) -> bool:
+        if type(other) != SezimalRange:
+            return NotImplemented
+
+        return self._range == other._range
+
+    def __hash__(self):
+        return hash(self._range)
 
 
 class DozenalRange:
@@ -13,80 +13,461 @@ from typing import TypeVar
 Dozenal = TypeVar('Dozenal', bound='Dozenal')
 DozenalInteger = TypeVar('DozenalInteger', bound='DozenalInteger')
 DozenalFraction = TypeVar('DozenalFraction', bound='DozenalFraction')
-SympyRational = TypeVar('SympyRational', bound='Rational')
 
 
-try:
-    import sympy
-except:
-    sympy = None
-    import math
-
 from decimal import Decimal
+from functools import lru_cache
+from math import gcd, isqrt
 
 from ..sezimal import Sezimal, SezimalInteger, SezimalFraction
-from ..constants import *
 from ..base import sezimal_context
 from ..units import sezimal_to_sezimal_unit, decimal_to_sezimal_unit
 
 
-def _angle_to_mandala_fraction(angle, unit: str = 'mdl') -> SezimalFraction | SympyRational:
-    if not unit:
-        unit = 'mdl'
+#
+# All the functions take the angle in mandalas (turns),
+# as an exact ratio of two ints, and, as they always did,
+# apply the function to angle × 2π;
+# the values are calculated with ints only, in fixed point,
+# with a few guard bits over the precision in the context:
+# sin and cos reduce the angle exactly to the first octant,
+# where the Taylor series converges fast, and use the symmetries
+# to get the other seven; π comes from Machin’s formula,
+# ln 2 from the atanh series, and the hyperbolic and inverse
+# functions are built from exp, ln and atan;
+# each result is calculated twice, the second time with more
+# guard bits, until both round to the same sezimal digits
+#
+_GUARD_BITS = 32
+
+
+def _sezimal_ratio(number: Sezimal | SezimalInteger | SezimalFraction) -> tuple[int, int]:
+    if type(number).__name__ == 'SezimalFraction':
+        numerator, denominator = number.numerator, number.denominator
+        ratio_numerator = numerator._mantissa * 6 ** denominator._precision
+        ratio_denominator = denominator._mantissa * 6 ** numerator._precision
+
+    else:
+        ratio_numerator = number._mantissa
+        ratio_denominator = 6 ** number._precision
+
+    if number._sign == -1:
+        ratio_numerator = -ratio_numerator
+
+    common = gcd(ratio_numerator, ratio_denominator)
 
+    return ratio_numerator // common, ratio_denominator // common
+
+
+@lru_cache(maxsize=1_296)
+def _unit_to_mandala_ratio(angle: Sezimal | SezimalInteger | SezimalFraction, unit: str) -> tuple[int, int]:
     if unit.endswith('mdl'):
         angle = sezimal_to_sezimal_unit(angle, unit, 'mdl', return_fraction=True)
     else:
         angle = decimal_to_sezimal_unit(angle, unit, 'mdl', return_fraction=True)
 
-    if sympy:
-        num = sympy.Integer(str(angle.numerator.decimal))
-        den = sympy.Integer(str(angle.denominator.decimal))
-        return sympy.Rational(num, den)
+    return _sezimal_ratio(angle)
 
-    return angle
 
+def _angle_to_mandala_ratio(angle, unit: str = 'mdl') -> tuple[int, int]:
+    if not unit:
+        unit = 'mdl'
 
-def _sympy_to_sezimal(result) -> Sezimal:
-    return round(
-        Sezimal(Decimal(str(result.evalf(n=sezimal_context.decimal_precision + 4)))),
-        sezimal_context.sezimal_precision,
-    )
+    if type(angle).__name__ not in ('Sezimal', 'SezimalInteger', 'SezimalFraction'):
+        angle = Sezimal(angle)
 
+    if unit == 'mdl':
+        return _sezimal_ratio(angle)
 
-def _float_to_sezimal(result: float) -> Sezimal:
-    return round(
-        Sezimal(Decimal(str(result))),
-        sezimal_context.sezimal_precision,
-    )
+    #
+    # The unit conversion to fractions loses the sign,
+    # so only the absolute value goes through it
+    #
+    if angle < 0:
+        numerator, denominator = _unit_to_mandala_ratio(abs(angle), unit)
+        return -numerator, denominator
 
+    return _unit_to_mandala_ratio(angle, unit)
+
+
+def _domain_error():
+    return ValueError('math domain error')
+
+
+#
+# Fixed point constants and series, as ints scaled by 2 ** bits
+#
+def _arctan_inverse(x: int, bits: int) -> int:
+    term = (1 << bits) // x
+    total = term
+    x_squared = x * x
+    n = 1
+    sign = 1
+
+    while term:
+        term //= x_squared
+        n += 2
+        sign = -sign
+        total += sign * (term // n)
+
+    return total
+
+
+def _arctanh_inverse(x: int, bits: int) -> int:
+    term = (1 << bits) // x
+    total = term
+    x_squared = x * x
+    n = 1
+
+    while term:
+        term //= x_squared
+        n += 2
+        total += term // n
+
+    return total
 
-def sin(
-    angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
-    unit: str = 'mdl',
-) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
 
-    if sympy:
-        result = _sympy_to_sezimal(sympy.sin(angle * (sympy.pi * 2)))
+@lru_cache(maxsize=36)
+def _pi(bits: int) -> int:
+    pi = 4 * (4 * _arctan_inverse(5, bits + 16) - _arctan_inverse(239, bits + 16))
+    return pi >> 16
+
+
+@lru_cache(maxsize=36)
+def _ln2(bits: int) -> int:
+    return (2 * _arctanh_inverse(3, bits + 16)) >> 16
+
+
+def _divide(numerator: int, denominator: int, bits: int) -> int:
+    if not denominator:
+        raise _domain_error()
+
+    return (numerator << bits) // denominator
+
+
+def _sin_cos_series(x: int, bits: int) -> tuple[int, int]:
+    x_squared = (x * x) >> bits
+
+    sin = 0
+    term = x
+    n = 1
+
+    while term:
+        sin += term
+        next_term = ((abs(term) * x_squared) >> bits) // ((n + 1) * (n + 2))
+        term = -next_term if term > 0 else next_term
+        n += 2
+
+    cos = 0
+    term = 1 << bits
+    n = 0
+
+    while term:
+        cos += term
+        next_term = ((abs(term) * x_squared) >> bits) // ((n + 1) * (n + 2))
+        term = -next_term if term > 0 else next_term
+        n += 2
+
+    return sin, cos
+
+
+@lru_cache(maxsize=1_296)
+def _octant_sin_cos(numerator: int, denominator: int, bits: int) -> tuple[int, int]:
+    #
+    # numerator / denominator is already in [0, 1) mandala;
+    # octant is which eighth of the mandala it’s in,
+    # and the series is calculated only for the angle left
+    # from the start of the octant (or to its end, on the odd ones)
+    #
+    octant, remainder = divmod(8 * numerator, denominator)
+
+    if octant % 2:
+        remainder = denominator - remainder
+
+    if remainder:
+        sin, cos = _sin_cos_series((_pi(bits) * remainder) // (4 * denominator), bits)
     else:
-        result = _sympy_to_sezimal(math.sin(angle.decimal))
+        sin, cos = 0, 1 << bits
 
-    return result
+    if octant == 0:
+        return sin, cos
+    elif octant == 1:
+        return cos, sin
+    elif octant == 2:
+        return cos, -sin
+    elif octant == 3:
+        return sin, -cos
+    elif octant == 4:
+        return -sin, -cos
+    elif octant == 5:
+        return -cos, -sin
+    elif octant == 6:
+        return -cos, sin
 
+    return -sin, cos
 
-def arcsin(
+
+def _sin_cos(numerator: int, denominator: int, bits: int) -> tuple[int, int]:
+    numerator %= denominator
+    common = gcd(numerator, denominator)
+    return _octant_sin_cos(numerator // common, denominator // common, bits)
+
+
+def _radians(numerator: int, denominator: int, bits: int) -> int:
+    return (2 * _pi(bits) * numerator) // denominator
+
+
+def _exp(x: int, bits: int) -> int:
+    if x < 0:
+        return _divide(1 << bits, _exp(-x, bits), bits)
+
+    ln2 = _ln2(bits)
+    power, x = divmod(x, ln2)
+
+    total = 1 << bits
+    term = 1 << bits
+    n = 1
+
+    while term:
+        term = ((term * x) >> bits) // n
+        total += term
+        n += 1
+
+    return total << power
+
+
+def _ln(x: int, bits: int) -> int:
+    if x <= 0:
+        raise _domain_error()
+
+    power = x.bit_length() - 1 - bits
+
+    if power >= 0:
+        mantissa = x >> power
+    else:
+        mantissa = x << -power
+
+    one = 1 << bits
+    z = ((mantissa - one) << bits) // (mantissa + one)
+    z_squared = (z * z) >> bits
+
+    total = z
+    term = z
+    n = 1
+
+    while term:
+        term = (term * z_squared) >> bits
+        n += 2
+        total += term // n
+
+    return 2 * total + power * _ln2(bits)
+
+
+def _sqrt(x: int, bits: int) -> int:
+    if x < 0:
+        raise _domain_error()
+
+    return isqrt(x << bits)
+
+
+def _atan(x: int, bits: int) -> int:
+    one = 1 << bits
+
+    if x < 0:
+        return -_atan(-x, bits)
+
+    if x > one:
+        return _pi(bits) // 2 - _atan(_divide(one, x, bits), bits)
+
+    #
+    # Halves the angle twice, atan(x) = 2 atan(x / (1 + √(1 + x²))),
+    # so the series starts below tan(π / 16)
+    #
+    for _ in range(2):
+        x = (x << bits) // (one + isqrt(one * one + x * x))
+
+    x_squared = (x * x) >> bits
+    total = x
+    term = x
+    n = 1
+    sign = 1
+
+    while term:
+        term = (term * x_squared) >> bits
+        n += 2
+        sign = -sign
+        total += sign * (term // n)
+
+    return total * 4
+
+
+def _asin(x: int, bits: int) -> int:
+    one = 1 << bits
+
+    if abs(x) > one:
+        raise _domain_error()
+
+    if abs(x) == one:
+        return _pi(bits) // 2 if x > 0 else -(_pi(bits) // 2)
+
+    return _atan(_divide(x, _sqrt(one - ((x * x) >> bits), bits), bits), bits)
+
+
+def _acos(x: int, bits: int) -> int:
+    return _pi(bits) // 2 - _asin(x, bits)
+
+
+def _acosh(x: int, bits: int) -> int:
+    one = 1 << bits
+
+    if x < one:
+        raise _domain_error()
+
+    return _ln(x + _sqrt(((x * x) >> bits) - one, bits), bits)
+
+
+def _asinh(x: int, bits: int) -> int:
+    if x < 0:
+        return -_asinh(-x, bits)
+
+    return _ln(x + _sqrt(((x * x) >> bits) + (1 << bits), bits), bits)
+
+
+def _atanh(x: int, bits: int) -> int:
+    one = 1 << bits
+
+    if abs(x) >= one:
+        raise _domain_error()
+
+    return _ln(_divide(one + x, one - x, bits), bits) // 2
+
+
+def _inverse(numerator: int, denominator: int, bits: int) -> int:
+    return _divide(1 << bits, _radians(numerator, denominator, bits), bits)
+
+
+def _tan(numerator: int, denominator: int, bits: int) -> int:
+    sin, cos = _sin_cos(numerator, denominator, bits)
+    return _divide(sin, cos, bits)
+
+
+def _cot(numerator: int, denominator: int, bits: int) -> int:
+    sin, cos = _sin_cos(numerator, denominator, bits)
+    return _divide(cos, sin, bits)
+
+
+def _acot(numerator: int, denominator: int, bits: int) -> int:
+    if not numerator:
+        return _pi(bits) // 2
+
+    return _atan(_inverse(numerator, denominator, bits), bits)
+
+
+def _sinh_cosh(numerator: int, denominator: int, bits: int) -> tuple[int, int]:
+    x = _radians(numerator, denominator, bits)
+    exp, inverse_exp = _exp(x, bits), _exp(-x, bits)
+    return (exp - inverse_exp) // 2, (exp + inverse_exp) // 2
+
+
+def _tanh(numerator: int, denominator: int, bits: int) -> int:
+    sinh, cosh = _sinh_cosh(numerator, denominator, bits)
+    return _divide(sinh, cosh, bits)
+
+
+def _coth(numerator: int, denominator: int, bits: int) -> int:
+    sinh, cosh = _sinh_cosh(numerator, denominator, bits)
+    return _divide(cosh, sinh, bits)
+
+
+_FUNCTIONS = {
+    'sin': lambda numerator, denominator, bits: _sin_cos(numerator, denominator, bits)[0],
+    'cos': lambda numerator, denominator, bits: _sin_cos(numerator, denominator, bits)[1],
+    'tan': _tan,
+    'cot': _cot,
+    'sec': lambda numerator, denominator, bits: _divide(1 << bits, _sin_cos(numerator, denominator, bits)[1], bits),
+    'csc': lambda numerator, denominator, bits: _divide(1 << bits, _sin_cos(numerator, denominator, bits)[0], bits),
+
+    'asin': lambda numerator, denominator, bits: _asin(_radians(numerator, denominator, bits), bits),
+    'acos': lambda numerator, denominator, bits: _acos(_radians(numerator, denominator, bits), bits),
+    'atan': lambda numerator, denominator, bits: _atan(_radians(numerator, denominator, bits), bits),
+    'acot': _acot,
+    'asec': lambda numerator, denominator, bits: _acos(_inverse(numerator, denominator, bits), bits),
+    'acsc': lambda numerator, denominator, bits: _asin(_inverse(numerator, denominator, bits), bits),
+
+    'sinh': lambda numerator, denominator, bits: _sinh_cosh(numerator, denominator, bits)[0],
+    'cosh': lambda numerator, denominator, bits: _sinh_cosh(numerator, denominator, bits)[1],
+    'tanh': _tanh,
+    'coth': _coth,
+    'sech': lambda numerator, denominator, bits: _divide(1 << bits, _sinh_cosh(numerator, denominator, bits)[1], bits),
+    'csch': lambda numerator, denominator, bits: _divide(1 << bits, _sinh_cosh(numerator, denominator, bits)[0], bits),
+
+    'asinh': lambda numerator, denominator, bits: _asinh(_radians(numerator, denominator, bits), bits),
+    'acosh': lambda numerator, denominator, bits: _acosh(_radians(numerator, denominator, bits), bits),
+    'atanh': lambda numerator, denominator, bits: _atanh(_radians(numerator, denominator, bits), bits),
+    'acoth': lambda numerator, denominator, bits: _atanh(_inverse(numerator, denominator, bits), bits),
+    'asech': lambda numerator, denominator, bits: _acosh(_inverse(numerator, denominator, bits), bits),
+    'acsch': lambda numerator, denominator, bits: _asinh(_inverse(numerator, denominator, bits), bits),
+}
+
+
+def _fixed_to_mantissa(value: int, bits: int, places: int) -> int:
+    #
+    # Rounds half up, on the absolute value
+    #
+    mantissa = ((abs(value) * 6 ** places * 2 >> bits) + 1) // 2
+
+    if value < 0:
+        return -mantissa
+
+    return mantissa
+
+
+@lru_cache(maxsize=1_296)
+def _evaluate(function_name: str, numerator: int, denominator: int, places: int) -> int:
+    function = _FUNCTIONS[function_name]
+    target_bits = places * 2_585 // 1_000 + 1
+    extra_bits = _GUARD_BITS
+    previous = None
+
+    while True:
+        bits = target_bits + extra_bits
+        mantissa = _fixed_to_mantissa(function(numerator, denominator, bits), bits, places)
+
+        if mantissa == previous or extra_bits > 4_096:
+            return mantissa
+
+        previous = mantissa
+        extra_bits *= 2
+
+
+def _trigonometric(function_name: str, angle, unit: str) -> Sezimal:
+    numerator, denominator = _angle_to_mandala_ratio(angle, unit)
+    places = sezimal_context.sezimal_precision_decimal
+    mantissa = _evaluate(function_name, numerator, denominator, places)
+
+    #
+    # Exact values, like sin of 1 / 20 mandala,
+    # lose the trailing zeros
+    #
+    while places and mantissa % 6 == 0:
+        mantissa //= 6
+        places -= 1
+
+    return Sezimal._from_mantissa(mantissa, places)
+
+
+def sin(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
+    return _trigonometric('sin', angle, unit)
 
-    if sympy:
-        result = _sympy_to_sezimal(sympy.asin(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.arcsin(angle.decimal))
 
-    return result
+def arcsin(
+    angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
+    unit: str = 'mdl',
+) -> Sezimal:
+    return _trigonometric('asin', angle, unit)
 
 
 asin = arcsin
@@ -96,28 +477,14 @@ def csc(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.csc(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.csc(angle.decimal))
-
-    return result
+    return _trigonometric('csc', angle, unit)
 
 
 def arccsc(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.acsc(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.arccsc(angle.decimal))
-
-    return result
+    return _trigonometric('acsc', angle, unit)
 
 
 acsc = arccsc
@@ -127,28 +494,14 @@ def cos(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.cos(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.cos(angle.decimal))
-
-    return result
+    return _trigonometric('cos', angle, unit)
 
 
 def arccos(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.acos(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.arccos(angle.decimal))
-
-    return result
+    return _trigonometric('acos', angle, unit)
 
 
 acos = arccos
@@ -158,28 +511,14 @@ def sec(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.sec(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.sec(angle.decimal))
-
-    return result
+    return _trigonometric('sec', angle, unit)
 
 
 def arcsec(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.asec(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.arcsec(angle.decimal))
-
-    return result
+    return _trigonometric('asec', angle, unit)
 
 
 asec = arcsec
@@ -189,28 +528,14 @@ def tan(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.tan(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.tan(angle.decimal))
-
-    return result
+    return _trigonometric('tan', angle, unit)
 
 
 def arctan(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.atan(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.arctan(angle.decimal))
-
-    return result
+    return _trigonometric('atan', angle, unit)
 
 
 atan = arctan
@@ -220,28 +545,14 @@ def cot(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.cot(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.cot(angle.decimal))
-
-    return result
+    return _trigonometric('cot', angle, unit)
 
 
 def arccot(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.acot(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.arccot(angle.decimal))
-
-    return result
+    return _trigonometric('acot', angle, unit)
 
 
 acot = arccot
@@ -251,28 +562,14 @@ def sinh(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.sinh(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.sinh(angle.decimal))
-
-    return result
+    return _trigonometric('sinh', angle, unit)
 
 
 def arcsinh(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.asinh(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.arcsinh(angle.decimal))
-
-    return result
+    return _trigonometric('asinh', angle, unit)
 
 
 asinh = arcsinh
@@ -282,28 +579,14 @@ def csch(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.csch(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.csch(angle.decimal))
-
-    return result
+    return _trigonometric('csch', angle, unit)
 
 
 def arccsch(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.acsch(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.arccsch(angle.decimal))
-
-    return result
+    return _trigonometric('acsch', angle, unit)
 
 
 acsch = arccsch
@@ -313,28 +596,14 @@ def cosh(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.cosh(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.cosh(angle.decimal))
-
-    return result
+    return _trigonometric('cosh', angle, unit)
 
 
 def arccosh(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.acosh(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.arccosh(angle.decimal))
-
-    return result
+    return _trigonometric('acosh', angle, unit)
 
 
 acosh = arccosh
@@ -344,28 +613,14 @@ def sech(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.sech(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.sech(angle.decimal))
-
-    return result
+    return _trigonometric('sech', angle, unit)
 
 
 def arcsech(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.asech(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.arcsech(angle.decimal))
-
-    return result
+    return _trigonometric('asech', angle, unit)
 
 
 asech = arcsech
@@ -375,28 +630,14 @@ def tanh(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.tanh(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.tanh(angle.decimal))
-
-    return result
+    return _trigonometric('tanh', angle, unit)
 
 
 def arctanh(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.atanh(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.arctanh(angle.decimal))
-
-    return result
+    return _trigonometric('atanh', angle, unit)
 
 
 atanh = arctanh
@@ -406,28 +647,14 @@ def coth(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.coth(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.coth(angle.decimal))
-
-    return result
+    return _trigonometric('coth', angle, unit)
 
 
 def arccoth(
     angle: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction,
     unit: str = 'mdl',
 ) -> Sezimal:
-    angle = _angle_to_mandala_fraction(angle, unit)
-
-    if sympy:
-        result = _sympy_to_sezimal(sympy.acoth(angle * (sympy.pi * 2)))
-    else:
-        result = _sympy_to_sezimal(math.arccoth(angle.decimal))
-
-    return result
+    return _trigonometric('acoth', angle, unit)
 
 
 acoth = arccoth
@@ -13,6 +13,11 @@ from .lokale import SezimalLocale
 
 CURDIR = os.path.dirname(os.path.abspath(__file__))
 
+#
+# One shared instance per locale; sezimal_locale() returns
+# the same instance every time, and it can’t be changed,
+# so anyone who needs to change it has to use locale.copy()
+#
 LOCALE_CACHE = {}
 
 
@@ -83,38 +88,42 @@ def sezimal_locale(locale: str | SezimalLocale = None, force_icu=False) -> Sezim
         return _create_locale_from_icu(locale_icu)
 
     if locale_icu in LOCALE_CACHE:
-        return LOCALE_CACHE[locale_icu]()
+        return LOCALE_CACHE[locale_icu]
 
     if os.path.exists(os.path.join(CURDIR, locale_icu.lower() + '.py')):
         module = importlib.import_module('swixknife.localization.' + locale_icu.lower())
         locale_class = getattr(module, 'SezimalLocale' + locale_icu.upper())
-        LOCALE_CACHE[locale_icu] = locale_class
-        return locale_class()
+        return _shared_locale(locale_icu, locale_class)
 
     if script and country:
         language_icu = language.lower() + '_' + country.lower()
 
         if language_icu in LOCALE_CACHE:
-            return LOCALE_CACHE[language_icu]()
+            return LOCALE_CACHE[language_icu]
 
         if os.path.exists(os.path.join(CURDIR, language_icu + '.py')):
             module = importlib.import_module('swixknife.localization.' + language_icu)
             locale_class = getattr(module, 'SezimalLocale' + language_icu.upper())
-            LOCALE_CACHE[language_icu] = locale_class
-            return locale_class()
+            return _shared_locale(language_icu, locale_class)
 
     if language in LOCALE_CACHE:
-        return LOCALE_CACHE[language]()
+        return LOCALE_CACHE[language]
 
     if os.path.exists(os.path.join(CURDIR, language + '.py')):
         module = importlib.import_module('swixknife.localization.' + language)
         locale_class = getattr(module, 'SezimalLocale' + language.upper())
-        LOCALE_CACHE[language] = locale_class
-        return locale_class()
+        return _shared_locale(language, locale_class)
 
     return _create_locale_from_icu(locale_icu) or _create_locale_from_system(locale_os)
 
 
+def _shared_locale(locale: str, locale_class: type) -> SezimalLocale:
+    shared_locale = locale_class()
+    shared_locale._shared = True
+    LOCALE_CACHE[locale] = shared_locale
+    return shared_locale
+
+
 def _create_locale_from_icu(locale: str) -> SezimalLocale:
     try:
         import icu
@@ -128,7 +137,7 @@ def _create_locale_from_icu(locale: str) -> SezimalLocale:
             if locale not in icu.Locale.getAvailableLocales():
                 return None
 
-    new_locale = SezimalLocale
+    new_locale = type('SezimalLocale', (SezimalLocale,), {})
 
     loc = icu.Locale(locale)
     dfs = icu.DecimalFormatSymbols(loc)
@@ -194,13 +203,11 @@ def _create_locale_from_icu(locale: str) -> SezimalLocale:
     new_locale.DATE_TIME_FORMAT = new_locale.DATE_FORMAT + ' ' + new_locale.TIME_FORMAT
     new_locale.DATE_TIME_LONG_FORMAT = new_locale.DATE_LONG_FORMAT + ' ' + new_locale.TIME_FORMAT
 
-    LOCALE_CACHE[locale] = new_locale
-
-    return new_locale()
+    return _shared_locale(locale, new_locale)
 
 
 def _create_locale_from_system(locale: str) -> SezimalLocale:
-    new_locale = SezimalLocale
+    new_locale = type('SezimalLocale', (SezimalLocale,), {})
     new_locale.LANG = locale
     new_locale.LANGUAGE = locale
 
@@ -260,8 +267,6 @@ def _create_locale_from_system(locale: str) -> SezimalLocale:
         system_locale.nl_langinfo(system_locale.ABMON_12),
     ]
 
-    LOCALE_CACHE[locale] = new_locale
-
-    return new_locale()
+    return _shared_locale(locale, new_locale)
 
 DEFAULT_LOCALE = sezimal_locale()
@@ -3,10 +3,12 @@ from typing import TypeVar
 
 SezimalDate = TypeVar('SezimalDate', bound='SezimalDate')
 
+import copy as _copy
 import itertools
 import locale as system_locale
 
 from decimal import Decimal
+from functools import lru_cache, wraps
 
 from .constants import UNPRINTABLE_CHARACTERS, EMOJI_CHARACTERS, IDEOGRAPHIC_CHARACTERS
 from ..sezimal import Sezimal, SezimalInteger, SezimalFraction, SezimalDecimalUnit
@@ -20,6 +22,58 @@ from ..base import SEPARATOR_COMMA, SEPARATOR_UNDERSCORE, \
 from ..text import sezimal_spellout
 
 
+#
+# The formats and symbols derived from the locale’s own attributes
+# are calculated only once per instance, and forgotten
+# whenever any attribute of the instance is changed
+#
+def _derived_property(method: callable) -> property:
+    name = method.__name__
+
+    @wraps(method)
+    def derived(self):
+        derived_values = self.__dict__.get('_derived')
+
+        if derived_values is None:
+            derived_values = self.__dict__['_derived'] = {}
+
+        elif name in derived_values:
+            return derived_values[name]
+
+        value = derived_values[name] = method(self)
+        return value
+
+    return property(derived)
+
+
+@lru_cache(maxsize=1_296)
+def _collator_sort_key(lang: str, collation_rules: str, sezimal_collation_rules: str) -> callable:
+    #
+    # Let’s try ICU first
+    #
+    try:
+        import icu
+
+        if collation_rules:
+            rules = collation_rules
+
+        else:
+            loc = icu.Locale(lang)
+            col = icu.Collator.createInstance(loc)
+            rules = col.getRules()
+
+        rules += sezimal_collation_rules
+
+        collator = icu.RuleBasedCollator(rules)
+
+        return collator.getSortKey
+
+    except:
+        pass
+
+    return system_locale.strxfrm
+
+
 class SezimalLocale:
     LANG = 'en'
     LANGUAGE = 'English'
@@ -74,7 +128,7 @@ class SezimalLocale:
         'Sun',
     ]
 
-    @property
+    @_derived_property
     def WEEKDAY_SYMBOL(self) -> list[str]:
         return [self.slice(wdn, 0, 1) for wdn in self.WEEKDAY_ABBREVIATED_NAME]
 
@@ -116,11 +170,11 @@ class SezimalLocale:
     def ISO_MONTH_ABBREVIATED_NAME(self) -> list[str]:
         return self.MONTH_ABBREVIATED_NAME
 
-    @property
+    @_derived_property
     def MONTH_SYMBOL(self) -> list[str]:
         return [self.slice(month, 0, 1) for month in self.MONTH_ABBREVIATED_NAME]
 
-    @property
+    @_derived_property
     def ISO_MONTH_SYMBOL(self) -> list[str]:
         return [self.slice(month, 0, 1) for month in self.ISO_MONTH_ABBREVIATED_NAME]
 
@@ -147,17 +201,17 @@ class SezimalLocale:
     DST_SHORT_NAME = 'DST'
     DST_EMOJI = '‍\ufe0f⏰   🌞\ufe0f'
 
-    @property
+    @_derived_property
     def ISO_DATE_FORMAT(self):
         return self._to_iso_date_format(self.DATE_FORMAT)
 
-    @property
+    @_derived_property
     def ISO_DATE_LONG_FORMAT(self):
         return self._to_iso_date_format(self.DATE_LONG_FORMAT)
 
     ISO_TIME_FORMAT = '%H:%M:%S'
 
-    @property
+    @_derived_property
     def SHORT_TIME_FORMAT(self):
         if 'fD' in self.TIME_FORMAT:
             return self.TIME_FORMAT.split('.')[0] + '.0fD'
@@ -225,7 +279,7 @@ class SezimalLocale:
 
         return date_format
 
-    @property
+    @_derived_property
     def ISO_SHORT_TIME_FORMAT(self) -> str:
         ihmf = self.ISO_TIME_FORMAT
 
@@ -241,7 +295,7 @@ class SezimalLocale:
 
         return ihmf
 
-    @property
+    @_derived_property
     def DATE_ENDIANNESS(self) -> str:
         parts = self.DATE_FORMAT.split(self.DATE_SEPARATOR)
 
@@ -258,7 +312,7 @@ class SezimalLocale:
 
         return 'M'
 
-    @property
+    @_derived_property
     def YEAR_FORMAT(self) -> str:
         parts = self.DATE_FORMAT.split(self.DATE_SEPARATOR)
         yf = ''
@@ -270,11 +324,11 @@ class SezimalLocale:
 
         return yf
 
-    @property
+    @_derived_property
     def ISO_YEAR_FORMAT(self) -> str:
         return self._to_iso_date_format(self.YEAR_FORMAT)
 
-    @property
+    @_derived_property
     def YEAR_MONTH_FORMAT(self) -> str:
         parts = self.DATE_FORMAT.split(self.DATE_SEPARATOR)
 
@@ -285,11 +339,11 @@ class SezimalLocale:
 
         return self.DATE_SEPARATOR.join(parts)
 
-    @property
+    @_derived_property
     def ISO_YEAR_MONTH_FORMAT(self) -> str:
         return self._to_iso_date_format(self.YEAR_MONTH_FORMAT)
 
-    @property
+    @_derived_property
     def ISO_YEAR_TEXT_MONTH_FORMAT(self) -> str:
         return self._to_iso_date_format(self.YEAR_TEXT_MONTH_FORMAT)
 
@@ -303,11 +357,11 @@ class SezimalLocale:
         fmt = fmt.replace('#@!m', '#@M')
         return fmt
 
-    @property
+    @_derived_property
     def DATE_TEXT_SHORT_MONTH_FORMAT(self) -> str:
         return self._to_text_short_month_format(self.DATE_FORMAT)
 
-    @property
+    @_derived_property
     def ISO_DATE_TEXT_SHORT_MONTH_FORMAT(self) -> str:
         return self._to_iso_date_format(self.DATE_TEXT_SHORT_MONTH_FORMAT)
 
@@ -321,7 +375,7 @@ class SezimalLocale:
         fmt = fmt.replace('#@!m', '#M')
         return fmt
 
-    @property
+    @_derived_property
     def YEAR_TEXT_MONTH_FORMAT(self) -> str:
         df = self._to_text_month_format(self.DATE_FORMAT)
         parts = df.split(self.DATE_SEPARATOR)
@@ -333,7 +387,7 @@ class SezimalLocale:
 
         return self.DATE_SEPARATOR.join(parts)
 
-    @property
+    @_derived_property
     def YEAR_TEXT_SHORT_MONTH_FORMAT(self) -> str:
         df = self._to_text_short_month_format(self.DATE_FORMAT)
         parts = df.split(self.DATE_SEPARATOR)
@@ -345,7 +399,7 @@ class SezimalLocale:
 
         return self.DATE_SEPARATOR.join(parts)
 
-    @property
+    @_derived_property
     def MONTH_DAY_FORMAT(self) -> str:
         if self.ISO_MODE:
             return self.DATE_FORMAT
@@ -359,11 +413,11 @@ class SezimalLocale:
 
         return self.DATE_SEPARATOR.join(parts)
 
-    @property
+    @_derived_property
     def ISO_MONTH_DAY_FORMAT(self) -> str:
         return self._to_iso_date_format(self.MONTH_DAY_FORMAT)
 
-    @property
+    @_derived_property
     def TEXT_MONTH_DAY_FORMAT(self) -> str:
         df = self._to_text_month_format(self.DATE_FORMAT)
         parts = df.split(self.DATE_SEPARATOR)
@@ -376,7 +430,7 @@ class SezimalLocale:
 
         return self.DATE_SEPARATOR.join(parts)
 
-    @property
+    @_derived_property
     def ISO_TEXT_MONTH_DAY_FORMAT(self) -> str:
         return self._to_iso_date_format(self.TEXT_MONTH_DAY_FORMAT)
 
@@ -390,7 +444,7 @@ class SezimalLocale:
         fmt = fmt.replace('#@!d', '#@!-d')
         return fmt
 
-    @property
+    @_derived_property
     def TEXT_SHORT_MONTH_DAY_FORMAT(self) -> str:
         df = self._to_text_short_month_format(self.DATE_FORMAT)
         df = self._to_short_day_format(df)
@@ -403,7 +457,7 @@ class SezimalLocale:
 
         return self.DATE_SEPARATOR.join(parts)
 
-    @property
+    @_derived_property
     def ISO_TEXT_SHORT_MONTH_DAY_FORMAT(self) -> str:
         return self._to_iso_date_format(self.TEXT_SHORT_MONTH_DAY_FORMAT)
 
@@ -487,7 +541,7 @@ class SezimalLocale:
     def CURRENCY_SUBUNIT_SYMBOL_POSITION(self):
         return self.CURRENCY_UNIT_SYMBOL_POSITION
 
-    @property
+    @_derived_property
     def CURRENCY_SEPARATOR(self):
         if self.SEZIMAL_SEPARATOR == '.':
             return ';'
@@ -496,7 +550,7 @@ class SezimalLocale:
 
         return ';'
 
-    @property
+    @_derived_property
     def CURRENCY_LONG_FORMAT(self):
         if self.CURRENCY_UNIT_SYMBOL_POSITION == 'L':
             if self.CURRENCY_UNIT_SYMBOL_WITH_SPACE:
@@ -524,7 +578,7 @@ class SezimalLocale:
 
         return res
 
-    @property
+    @_derived_property
     def CURRENCY_SHORT_FORMAT(self):
         if self.CURRENCY_UNIT_SYMBOL_POSITION == 'L':
             if self.CURRENCY_UNIT_SYMBOL_WITH_SPACE:
@@ -591,6 +645,32 @@ class SezimalLocale:
 &5̆<<󱨣<<󱸅̆<<<⁵̆<<󱩇<<󱸩̆<<<₅̆<<󱩫<<󱹍̆
 '''
 
+    #
+    # The instances returned by sezimal_locale() are shared
+    # by all of its callers, so they can’t be changed;
+    # to change a locale (its base, formats, time zone etc.),
+    # change a copy of it
+    #
+    _shared = False
+
+    def __setattr__(self, name: str, value) -> None:
+        if self._shared:
+            raise AttributeError(f'The {self.LANG} locale is shared and can’t be changed; use locale.copy() to change it')
+
+        super().__setattr__(name, value)
+        self.__dict__.pop('_derived', None)
+
+    def copy(self) -> 'SezimalLocale':
+        new_locale = type(self).__new__(type(self))
+
+        for name, value in self.__dict__.items():
+            if name in ('_shared', '_derived'):
+                continue
+
+            new_locale.__dict__[name] = _copy.deepcopy(value)
+
+        return new_locale
+
     def weekday_name(self, weekday: SezimalInteger, case: str = None) -> str:
         weekday = SezimalInteger(weekday)
 
@@ -977,30 +1057,7 @@ class SezimalLocale:
 
     @property
     def sort_key(self) -> callable:
-        #
-        # Let’s try ICU first
-        #
-        try:
-            import icu
-
-            if self.COLLATION_RULES:
-                rules = self.COLLATION_RULES
-
-            else:
-                loc = icu.Locale(self.LANG)
-                col = icu.Collator.createInstance(loc)
-                rules = col.getRules()
-
-            rules += self.SEZIMAL_COLLATION_RULES
-
-            collator = icu.RuleBasedCollator(rules)
-
-            return collator.getSortKey
-
-        except:
-            pass
-
-        return system_locale.strxfrm
+        return _collator_sort_key(self.LANG, self.COLLATION_RULES, self.SEZIMAL_COLLATION_RULES)
 
     def moon_phase(self, phase_name: str) -> str:
         if (not phase_name) or (type(phase_name) != str):
@@ -1640,53 +1697,32 @@ class SezimalLocale:
         self._to_other_base(10, sezimal_digits=True)
         self._dcc_to_adc_format('!')
 
-        for i in range(len(self.DCC_TERM_ABBREVIATED_NAME)):
-            self.DCC_TERM_ABBREVIATED_NAME[i] = default_to_sezimal_digits(self.DCC_TERM_ABBREVIATED_NAME[i])
-
-        for i in range(len(self.DCC_TERM_SYMBOL)):
-            self.DCC_TERM_SYMBOL[i] = default_to_sezimal_digits(self.DCC_TERM_SYMBOL[i])
-
-        for i in range(len(self.DCC_MONTH_ABBREVIATED_NAME)):
-            self.DCC_MONTH_ABBREVIATED_NAME[i] = default_to_sezimal_digits(self.DCC_MONTH_ABBREVIATED_NAME[i])
-
-        for i in range(len(self.DCC_MONTH_SYMBOL)):
-            self.DCC_MONTH_SYMBOL[i] = default_to_sezimal_digits(self.DCC_MONTH_SYMBOL[i])
-
-        for i in range(len(self.DCC_WEEKDAY_ABBREVIATED_NAME)):
-            self.DCC_WEEKDAY_ABBREVIATED_NAME[i] = default_to_sezimal_digits(self.DCC_WEEKDAY_ABBREVIATED_NAME[i])
-
-        for i in range(len(self.DCC_WEEKDAY_SYMBOL)):
-            self.DCC_WEEKDAY_SYMBOL[i] = default_to_sezimal_digits(self.DCC_WEEKDAY_SYMBOL[i])
-
-        for key in self.DCC_YEAR_COUNT:
-            if '!' in self.DCC_YEAR_COUNT[key]:
-                continue
-
-            self.DCC_YEAR_COUNT[key] = self.DCC_YEAR_COUNT[key].replace('&', '&!')
-
-        for key in self.DCC_TERM_COUNT:
-            if '!' in self.DCC_TERM_COUNT[key]:
-                continue
-
-            self.DCC_TERM_COUNT[key] = self.DCC_TERM_COUNT[key].replace('&', '&!')
-
-        for key in self.DCC_MONTH_COUNT:
-            if '!' in self.DCC_MONTH_COUNT[key]:
-                continue
-
-            self.DCC_MONTH_COUNT[key] = self.DCC_MONTH_COUNT[key].replace('&', '&!')
-
-        for key in self.DCC_WEEK_COUNT:
-            if '!' in self.DCC_WEEK_COUNT[key]:
-                continue
-
-            self.DCC_WEEK_COUNT[key] = self.DCC_WEEK_COUNT[key].replace('&', '&!')
-
-        for key in self.DCC_DAY_COUNT:
-            if '!' in self.DCC_DAY_COUNT[key]:
-                continue
+        #
+        # The names and counts are set anew, instead of changed
+        # in place, since the lists and dictionaries
+        # belong to the locale’s class, not to this instance
+        #
+        for attr in (
+            'DCC_TERM_ABBREVIATED_NAME',
+            'DCC_TERM_SYMBOL',
+            'DCC_MONTH_ABBREVIATED_NAME',
+            'DCC_MONTH_SYMBOL',
+            'DCC_WEEKDAY_ABBREVIATED_NAME',
+            'DCC_WEEKDAY_SYMBOL',
+        ):
+            setattr(self, attr, [default_to_sezimal_digits(name) for name in getattr(self, attr)])
 
-            self.DCC_DAY_COUNT[key] = self.DCC_DAY_COUNT[key].replace('&', '&!')
+        for attr in (
+            'DCC_YEAR_COUNT',
+            'DCC_TERM_COUNT',
+            'DCC_MONTH_COUNT',
+            'DCC_WEEK_COUNT',
+            'DCC_DAY_COUNT',
+        ):
+            setattr(self, attr, {
+                key: count if '!' in count else count.replace('&', '&!')
+                for key, count in getattr(self, attr).items()
+            })
 
     def to_astronomical_names(self):
         self._dcc_to_adc_format('c')
@@ -9,8 +9,11 @@ __all__ = (
 
 from decimal import Decimal, localcontext, getcontext
 from fractions import Fraction as DecimalFraction
+from collections import OrderedDict
 
 from typing import TypeVar
+from contextlib import nullcontext
+from math import isqrt, log
 import numbers as _numbers
 
 Self = TypeVar('Self', bound='Sezimal')
@@ -31,30 +34,149 @@ from .base import validate_clean_sezimal, \
     sezimal_context
 
 
-getcontext().prec = sezimal_context.decimal_precision
-
 #
 # Operations maps/tables
 #
 from . import _sezimal_maps, _sezimal_reciprocal_map
 
-_ADDITION_MAP = _sezimal_maps.ADDITION_MAP
-_SUBTRACTION_MAP = _sezimal_maps.SUBTRACTION_MAP
-_SUBTRACTION_BORROWED = _sezimal_maps.SUBTRACTION_BORROWED
-_MULTIPLICATION_MAP = _sezimal_maps.MULTIPLICATION_MAP
 _RECIPROCAL_MAP = _sezimal_reciprocal_map.RECIPROCAL_MAP
 # _RECIPROCAL_MAP = {}
+#
+# The reciprocals calculated, kept only for the last divisors,
+# so long running sessions don’t keep all of them forever
+#
+_RECIPROCAL_CACHE = OrderedDict()
+_RECIPROCAL_CACHE_SIZE = 1_296
 _FACTORIAL = _sezimal_maps.FACTORIAL
 _EXP = {}
 _LN = {}
 
+def _cache_reciprocal(key: tuple, division: Self):
+    _RECIPROCAL_CACHE[key] = division
+
+    if len(_RECIPROCAL_CACHE) > _RECIPROCAL_CACHE_SIZE:
+        try:
+            _RECIPROCAL_CACHE.popitem(last=False)
+        except KeyError:
+            #
+            # Another thread got to it first
+            #
+            pass
+
+
+#
+# Integer engine;
+# the value of a Sezimal is kept as an unsigned integer mantissa,
+# scaled by 6 ** precision, plus the sign;
+# the digits are only generated when they’re actually needed
+# (str(), formatting, etc.)
+#
+def _sezimal_digits_chunk(number: int) -> str:
+    digits = ''
+
+    for i in range(4):
+        number, digit = divmod(number, 6)
+        digits = '012345'[digit] + digits
+
+    return digits
+
+
+_DIGITS_CHUNK = tuple(_sezimal_digits_chunk(i) for i in range(1_296))
+_POWERS_OF_SIX = tuple(6 ** i for i in range(256))
+
+#
+# Trailing ...5555 sequences cleaned by _mult_div_finalizing
+#
+_TRAILING_FIVES = (int('55555', 6), int('55554', 6), int('55553', 6))
+_TRAILING_FIVES_LONG = (
+    int('555555', 6),
+    int('555545', 6), int('555544', 6), int('555543', 6),
+    int('555535', 6), int('555534', 6), int('555533', 6),
+)
+
+
+def _power_of_six(exponent: int) -> int:
+    if exponent < 256:
+        return _POWERS_OF_SIX[exponent]
+
+    return 6 ** exponent
+
+
+def _integer_to_sezimal_digits(number: int) -> str:
+    if number < 1_296:
+        return _DIGITS_CHUNK[number].lstrip('0') or '0'
+
+    chunks = []
+
+    while number:
+        number, chunk = divmod(number, 1_296)
+        chunks.append(_DIGITS_CHUNK[chunk])
+
+    return ''.join(reversed(chunks)).lstrip('0')
+
+
+def _round_mantissa(mantissa: int, to_discard: int) -> int:
+    #
+    # Rounds half up, except when the discarded digits are
+    # exactly half, and the last kept digit is even
+    #
+    quotient, remainder = divmod(mantissa, _power_of_six(to_discard))
+    half = 3 * _power_of_six(to_discard - 1)
+
+    if remainder > half or (remainder == half and quotient % 2):
+        quotient += 1
+
+    return quotient
+
+
+def _integer_root(number: int, degree: int) -> int:
+    #
+    # The integer part of the root, by Newton’s method,
+    # starting above it, and going down until it stops
+    #
+    if degree == 2:
+        return isqrt(number)
+
+    if not number:
+        return 0
+
+    root = 1 << -(-number.bit_length() // degree)
+
+    while True:
+        next_root = ((degree - 1) * root + number // root ** (degree - 1)) // degree
+
+        if next_root >= root:
+            return root
+
+        root = next_root
+
+
+def _sezimal_places(precision: str | int | Self | IntegerSelf) -> int:
+    #
+    # Precisions are given in sezimal, and here
+    # we want the actual number of places
+    #
+    if type(precision) == int:
+        return int(str(precision), 6)
+
+    return int(SezimalInteger(precision))
+
 
 class Sezimal:
-    __slots__ = ['_value', '_sign', '_integer', '_fraction', '_precision', '_digits', 'reciprocal']
+    __slots__ = ['_value', '_sign', '_mantissa', '_precision', '_integer_digits', '_fraction_digits', 'reciprocal']
 
     def __init__(self, number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction, _internal: bool = False) -> Self:
         original_decimal = None
 
+        if type(number).__name__ in ('Sezimal', 'SezimalInteger'):
+            self._sign = number._sign
+            self._mantissa = number._mantissa
+            self._precision = number._precision
+            self._integer_digits = number._integer_digits
+            self._fraction_digits = number._fraction_digits
+            self._value = original_decimal
+            return
+
         if type(number) == Decimal:
             original_decimal = number
             cleaned_number = decimal_to_sezimal(str(number))
@@ -63,9 +185,6 @@ class Sezimal:
             original_decimal = number.decimal
             cleaned_number = decimal_to_sezimal(str(number.decimal))
 
-        elif type(number).__name__ in ('Sezimal', 'SezimalInteger'):
-            cleaned_number = str(number)
-
         elif type(number).__name__ == 'SezimalFraction':
             cleaned_number = str(number.sezimal)
 
@@ -93,19 +212,85 @@ class Sezimal:
         else:
             self._sign = 1
 
+        #
+        # decimal_to_sezimal may return the recurring digits
+        # notation, 0.1..23; only the digits before the
+        # recurring mark are kept
+        #
         if '.' in cleaned_number:
-            self._integer = str(int(cleaned_number.split('.')[0]))
-            self._fraction = cleaned_number.split('.')[1]
+            integer, fraction = cleaned_number.split('.')[0:2]
         else:
-            self._integer = str(int(cleaned_number))
-            self._fraction = ''
+            integer = cleaned_number
+            fraction = ''
 
-        self._precision = len(self._fraction)
-        self._digits = list(self._integer + self._fraction)
+        self._integer_digits = integer.lstrip('0') or '0'
+        self._fraction_digits = fraction
+        self._precision = len(fraction)
+        self._mantissa = int(self._integer_digits + fraction, 6)
         self._value = original_decimal
 
+    @classmethod
+    def _from_mantissa(cls, mantissa: int, precision: int) -> Self:
+        number = cls.__new__(cls)
+
+        if mantissa < 0:
+            number._sign = -1
+            number._mantissa = -mantissa
+        else:
+            number._sign = 1
+            number._mantissa = mantissa
+
+        number._precision = precision
+        number._integer_digits = None
+        number._fraction_digits = None
+        number._value = None
+
+        return number
+
+    def _split_digits(self):
+        digits = _integer_to_sezimal_digits(self._mantissa)
+
+        if self._precision:
+            digits = digits.rjust(self._precision + 1, '0')
+            self._integer_digits = digits[:-self._precision]
+            self._fraction_digits = digits[-self._precision:]
+        else:
+            self._integer_digits = digits
+            self._fraction_digits = ''
+
+    @property
+    def _integer(self) -> str:
+        if self._integer_digits is None:
+            self._split_digits()
+
+        return self._integer_digits
+
+    @property
+    def _fraction(self) -> str:
+        if self._fraction_digits is None:
+            self._split_digits()
+
+        return self._fraction_digits
+
+    @property
+    def _digits(self) -> list[str]:
+        return list(self._integer + self._fraction)
+
+    def _aligned_mantissas(self, other_number: Self) -> tuple[int, int, int]:
+        this = self._mantissa * self._sign
+        other = other_number._mantissa * other_number._sign
+
+        if self._precision > other_number._precision:
+            other *= _power_of_six(self._precision - other_number._precision)
+            return this, other, self._precision
+
+        if other_number._precision > self._precision:
+            this *= _power_of_six(other_number._precision - self._precision)
+
+        return this, other, other_number._precision
+
     def __str__(self) -> str:
-        if self._sign == -1 and self._integer[0] != '-':
+        if self._sign == -1:
             res = '-' + self._integer
         else:
             res = self._integer
@@ -178,7 +363,7 @@ class Sezimal:
             return niftimal_format(self)
 
     def __int__(self) -> int:
-        return int(sezimal_to_decimal(self._integer)) * self._sign
+        return self._mantissa // _power_of_six(self._precision) * self._sign
 
     def __trunc__(self) -> IntegerSelf:
         return SezimalInteger(self._integer) * self._sign
@@ -190,40 +375,15 @@ class Sezimal:
         return self._value
 
     def __compare__(self, other_number: Self) -> IntegerSelf:
-        #
-        # If the sign of both numbers are not equal,
-        # they can be compared only by their sign, unless
-        # it is 0 and -0
-        #
-        if self._sign != other_number._sign:
-            if self._value == 0 and other_number._value == 0:
-                return 0
-
-            return self._sign
-
-        #
-        # The signs are the same, let’s check the numbers
-        #
-        precision = max(self._precision, other_number._precision)
-
-        this = str(self._integer) + str(self._fraction).ljust(precision, '0')
-        other = str(other_number._integer) + str(other_number._fraction).ljust(precision, '0')
-
-        length = max(len(this), len(other))
-
-        this = this.rjust(length, '0')
-        other = other.rjust(length, '0')
+        this, other, precision = self._aligned_mantissas(other_number)
 
         if this == other:
             return 0
 
-        if self._sign == 1:
-            return 1 if this > other else -1
-        else:
-            return -1 if this > other else 1
+        return 1 if this > other else -1
 
     def __eq__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> bool:
-        if type(other_number) != Sezimal:
+        if not isinstance(other_number, Sezimal):
             other_number = Sezimal(other_number)
 
         return self.__compare__(other_number) == 0
@@ -232,7 +392,7 @@ class Sezimal:
         return not self.__eq__(other_number)
 
     def __lt__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> bool:
-        if type(other_number) != Sezimal:
+        if not isinstance(other_number, Sezimal):
             other_number = Sezimal(other_number)
 
         return self.__compare__(other_number) < 0
@@ -241,7 +401,7 @@ class Sezimal:
         return not self.__lt__(other_number)
 
     def __gt__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> bool:
-        if type(other_number) != Sezimal:
+        if not isinstance(other_number, Sezimal):
             other_number = Sezimal(other_number)
 
         return self.__compare__(other_number) > 0
@@ -253,7 +413,7 @@ class Sezimal:
         return self.decimal.__hash__()
 
     def __bool__(self) -> bool:
-        return not self == 0
+        return self._mantissa != 0
 
     def __pos__(self) -> Self:
         return Sezimal(self)
@@ -267,183 +427,22 @@ class Sezimal:
 
         return Sezimal(self * -1)
 
-    def __addition(self, other_number: Self) -> str:
-        if other_number == 0:
-            return str(self)
-
-        #
-        # Adds two values;
-        # the final sign of the operation is dealt with by the calling method: __add__ or __sub__
-        #
-        digits_a = list(self._digits)
-        digits_b = list(other_number._digits)
-
-        #
-        # Normalizes the fractional part between the two values,
-        #
-        if self._precision > other_number._precision:
-            digits_b += list('0' * (self._precision - other_number._precision))
-            final_precision = self._precision
-
-        elif other_number._precision > self._precision:
-            digits_a += list('0' * (other_number._precision - self._precision))
-            final_precision = other_number._precision
-
-        else:
-            final_precision = self._precision
-
-        digits_a = digits_a[::-1]
-        digits_b = digits_b[::-1]
-
-        adition = ''
-        carries = '0'
-
-        for i in range(max(len(digits_a), len(digits_b))):
-            if i + 1 <= len(digits_a):
-                d1 = digits_a[i]
-            else:
-                d1 = '0'
-
-            if i + 1 <= len(digits_b):
-                d2 = digits_b[i]
-            else:
-                d2 = '0'
-
-            sd = _ADDITION_MAP[d1][d2]
-            sd = _ADDITION_MAP[carries][sd]
-
-            adition += sd[-1]
-
-            if len(sd) > 1:
-                carries = sd[0]
-            else:
-                carries = '0'
-
-        if carries != '0':
-            adition += carries
-
-        if final_precision:
-            adition = adition[0:final_precision] + '.' + adition[final_precision:]
-
-        adition = adition[::-1]
-
-        return adition
-
-    def __subtraction(self, other_number: Self) -> str:
-        if other_number == 0:
-            return str(self)
-
-        #
-        # Subtracts the lesser value from the greater one;
-        # the final sign of the operation is dealt with by the calling method: __add__ or __sub__
-        #
-        digits_a = list(self._digits)
-        digits_b = list(other_number._digits)
-
-        #
-        # Normalizes the fractional part between the two values,
-        #
-        if self._precision > other_number._precision:
-            digits_b += list('0' * (self._precision - other_number._precision))
-            final_precision = self._precision
-
-        elif other_number._precision > self._precision:
-            digits_a += list('0' * (other_number._precision - self._precision))
-            final_precision = other_number._precision
-
-        else:
-            final_precision = self._precision
-
-        digits_a = digits_a[::-1]
-        digits_b = digits_b[::-1]
-
-        if abs(self) < abs(other_number):
-            d = digits_a
-            digits_a = digits_b
-            digits_b = d
-
-        subtraction = ''
-
-        i = 0
-        while i < len(digits_a):
-            d1 = digits_a[i]
-
-            if i + 1 <= len(digits_b):
-                d2 = digits_b[i]
-            else:
-                d2 = '0'
-
-            if d1 >= d2:
-                sd = _SUBTRACTION_MAP[d1][d2]
-
-            #
-            # Vay presizar enprestar 1?
-            #
-            else:
-                d1 = '1' + d1
-                sd = _SUBTRACTION_MAP[d1][d2]
-
-                #
-                # Trata u enpréstimu nus prósimus díjitus,
-                # kuydandu ki u 0 propaga u enpréstimu uma kaza
-                # pra frenti
-                #
-                if len(digits_a) >= i + 1:
-                    j = i + 1
-
-                    while j < len(digits_a):
-                        if digits_a[j] != '0':
-                            digits_a[j] = _SUBTRACTION_BORROWED[digits_a[j]]
-                            break
-
-                        else:
-                            digits_a[j] = _SUBTRACTION_BORROWED[digits_a[j]]
-                            j += 1
-
-                else:
-                    i = len(digits_a)
-
-            i += 1
-
-            subtraction += sd
-
-        if final_precision:
-            subtraction = subtraction[0:final_precision] + '.' + subtraction[final_precision:]
-
-        subtraction = subtraction[::-1]
-
-        return subtraction
-
     def __add__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> Self:
         if type(other_number).__name__ in ('SezimalDecimalUnit', 'DozenalDecimalUnit'):
             return other_number.__radd__(self)
 
-        if type(other_number) != Sezimal:
+        if not isinstance(other_number, Sezimal):
             other_number = Sezimal(other_number)
 
         #
-        # Deals with the signs, and does the adition or subtraction accordingly
+        # Adding 0 keeps the number as it is, precision included
         #
-        if self._sign == 1 and other_number._sign == 1:
-            res = self.__addition(other_number)
-
-        elif self._sign == 1 and other_number._sign == -1:
-            res = self.__subtraction(other_number)
-
-            if abs(other_number) > abs(self) and res[0] != '-':
-                res = '-' + res
-
-        elif self._sign == -1 and other_number._sign == -1:
-            res = self.__addition(other_number)
-            res = '-' + res
-
-        elif self._sign == -1 and other_number._sign == 1:
-            res = other_number.__subtraction(self)
+        if self._sign == 1 and other_number._sign == 1 and not other_number._mantissa:
+            return Sezimal._from_mantissa(self._mantissa, self._precision)
 
-            if abs(self) > abs(other_number) and res[0] != '-':
-               res = '-' + res
+        this, other, precision = self._aligned_mantissas(other_number)
 
-        return Sezimal(res, _internal=True)
+        return Sezimal._from_mantissa(this + other, precision)
 
     def __radd__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> Self:
         if type(other_number).__name__ in ('SezimalDecimalUnit', 'DozenalDecimalUnit'):
@@ -458,34 +457,18 @@ class Sezimal:
         if type(other_number).__name__ in ('SezimalDecimalUnit', 'DozenalDecimalUnit'):
             return other_number.__rsub__(self)
 
-        if type(other_number) != Sezimal:
+        if not isinstance(other_number, Sezimal):
             other_number = Sezimal(other_number)
 
         #
-        # Deals with the signs, and does the adition or subtraction accordingly
+        # Subtracting 0 keeps the number as it is, precision included
         #
-        if self._sign == 1 and other_number._sign == 1:
-            res = self.__subtraction(other_number)
-
-            if abs(other_number) > abs(self) and res[0] != '-':
-                res = '-' + res
-
-        elif self._sign == 1 and other_number._sign == -1:
-            res = self.__addition(other_number)
-
-        elif self._sign == -1 and other_number._sign == -1:
-            res = self.__subtraction(other_number)
-
-            if abs(self) > abs(other_number) and res[0] != '-':
-                res = '-' + res
+        if other_number._sign == 1 and not other_number._mantissa:
+            return Sezimal._from_mantissa(self._mantissa * self._sign, self._precision)
 
-        elif self._sign == -1 and other_number._sign == 1:
-            res = self.__addition(other_number)
+        this, other, precision = self._aligned_mantissas(other_number)
 
-            if res[0] != '-':
-                res = '-' + res
-
-        return Sezimal(res, _internal=True)
+        return Sezimal._from_mantissa(this - other, precision)
 
     def __rsub__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> Self:
         if type(other_number).__name__ in ('SezimalDecimalUnit', 'DozenalDecimalUnit'):
@@ -496,185 +479,84 @@ class Sezimal:
 
         return other_number.__sub__(self)
 
-    def __round_half_up__(self, precision: IntegerSelf, last_digit: str, next_digit: str, to_discard: str) -> Self:
-        adjust = Sezimal(0)
-
-        if next_digit == '3':
-            if to_discard.replace('0', '') != '':
-                adjust = Sezimal(f'1e-{precision}') * self._sign
-            elif last_digit in '135':
-                adjust = Sezimal(f'1e-{precision}') * self._sign
-
-        elif next_digit in '45':
-            adjust = Sezimal(f'1e-{precision}') * self._sign
-
-        return adjust
-
-    def __round_half_down__(self, precision: IntegerSelf, last_digit: str, next_digit: str, to_discard: str) -> Self:
-        adjust = Sezimal(0)
-
-        if next_digit == '3':
-            if to_discard.replace('0', '') != '':
-                adjust = Sezimal(f'1e-{precision}') * self._sign
-
-        elif next_digit in '45':
-            adjust = Sezimal(f'1e-{precision}') * self._sign
-
-        return adjust
-
     def __round__(self, precision: IntegerSelf = sezimal_context.sezimal_precision) -> Self:
-        precision = SezimalInteger(precision)
+        places = _sezimal_places(precision)
 
-        if self._precision <= int(precision):
+        if self._precision <= places:
             return self
 
-        to_round = self._integer + '.' + self._fraction[:int(precision)]
-
-        if self._sign == -1:
-            to_round = '-' + to_round
-
-        if precision == 0:
-            last_digit = self._integer[-1]
-            next_digit = self._fraction[0]
-            to_discard = self._fraction[1:]
-
-        else:
-            last_digit = self._fraction[int(precision) - 1]
-            next_digit = self._fraction[int(precision)]
-            to_discard = self._fraction[int(precision) + 1:]
-
-        adjust = self.__round_half_up__(precision, last_digit, next_digit, to_discard)
-
-        rounded = Sezimal(to_round, _internal=True) + adjust
+        mantissa = _round_mantissa(self._mantissa, self._precision - places)
 
-        if rounded._sign != self._sign:
-            rounded = Sezimal(0, _internal=True)
+        if self._sign == -1 and not mantissa:
+            return Sezimal(0, _internal=True)
 
-        return rounded
+        return Sezimal._from_mantissa(mantissa * self._sign, places)
 
     def trunc(self, precision: IntegerSelf = sezimal_context.sezimal_precision) -> Self:
         if precision is None:
             precision = 0
 
-        precision = SezimalInteger(precision)
+        places = _sezimal_places(precision)
 
-        if self._precision <= int(precision):
+        if self._precision <= places:
             return self
 
-        to_round = self._integer + '.' + self._fraction[:int(precision)]
-
-        if self._sign == -1:
-            to_round = '-' + to_round
+        mantissa = self._mantissa // _power_of_six(self._precision - places)
 
-        return Sezimal(to_round, _internal=True)
+        return Sezimal._from_mantissa(mantissa * self._sign, places)
 
     def is_integer(self) -> bool:
-        return self == self.trunc(0)
+        return self._mantissa % _power_of_six(self._precision) == 0
 
     def _mult_div_finalizing(self):
         res = round(self, sezimal_context.sezimal_precision)
 
-        if res._fraction and len(res._fraction) >= 3:
-            fives = res._fraction[::-1][3:][::-1]
-
-            if len(fives) >= 5 and fives[-5:] in ('55555', '55554', '55553'):
-                new = round(res, decimal_to_sezimal(res._precision - 4))
-                res = Sezimal(new._integer + '.' + new._fraction.ljust(res._precision, '0'))
-            elif len(fives) >= 6 and fives[-6:] in (
-                '555555',
-                '555545', '555544', '555543',
-                '555535', '555534', '555533',
-            ):
-                new = round(res, decimal_to_sezimal(res._precision - 6))
-                res = Sezimal(new._integer + '.' + new._fraction.ljust(res._precision, '0'))
-
-        return res
-
-    def __multiplication(self, other_number: Self) -> str:
-        if self == 0 or other_number == 0:
-            return '0'
-
-        if other_number == 1 or other_number == -1:
-            if self._sign == -1:
-                return str(self)[1:]
-            else:
-                return str(self)
-
         #
-        # Multiplies two values;
-        # the final sign of the operation is dealt with by the calling method: __mul__
+        # Cleans up the ...5555 left at the end of the
+        # fractional part by the limited precision;
+        # the last 3 digits are ignored
         #
-        digits_a = list(self._digits)[::-1]
-        digits_b = list(other_number._digits)[::-1]
-        final_precision = self._precision + other_number._precision
-        sums = []
-
-        i = 0
-        for d1 in digits_a:
-            carries = '0'
-            sums.append('0' * i)
-            i += 1
-
-            for d2 in digits_b:
-                md = _MULTIPLICATION_MAP[d1][d2]
-
-                if carries != '0':
-                    md = str(Sezimal(md, _internal=True) + carries)
-
-                sums[-1] += md[-1]
-
-                if len(md) != 1:
-                    carries = md[0]
-                else:
-                    carries = '0'
-
-            if carries != '0':
-                sums[-1] += carries
-
-        multiplication = Sezimal('0', _internal=True)
-
-        for s in sums:
-            if s:
-                multiplication += Sezimal(s[::-1], _internal=True)
-
-        multiplication = str(multiplication)
+        if res._precision < 8:
+            return res
 
-        if final_precision:
-            multiplication = multiplication[::-1]
+        last_digits = res._mantissa // 216
 
-            if len(multiplication) < final_precision + 1:
-                multiplication += '0' * (final_precision - len(multiplication) + 1)
+        if last_digits % 7_776 in _TRAILING_FIVES:
+            to_discard = 4
+        elif res._precision >= 9 and last_digits % 46_656 in _TRAILING_FIVES_LONG:
+            to_discard = 6
+        else:
+            return res
 
-            multiplication = multiplication[0:final_precision] + '.' + multiplication[final_precision:]
-            multiplication = multiplication[::-1]
+        mantissa = _round_mantissa(res._mantissa, to_discard) * _power_of_six(to_discard)
 
-        return multiplication
+        return Sezimal._from_mantissa(mantissa * res._sign, res._precision)
 
     def __mul__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> Self:
         if type(other_number).__name__ in ('SezimalDecimalUnit', 'DozenalDecimalUnit'):
             return other_number.__rmul__(self)
 
-        if type(other_number) != Sezimal:
+        if not isinstance(other_number, Sezimal):
             other_number = Sezimal(other_number)
 
+        if not self._mantissa or not other_number._mantissa:
+            return Sezimal._from_mantissa(0, 0)
+
         #
-        # Deals with the signs
+        # Multiplying by 1 or -1 keeps the precision
         #
-        if self._sign == 1 and other_number._sign == 1:
-            res = self.__multiplication(other_number)
-
-        elif self._sign == 1 and other_number._sign == -1:
-            res = self.__multiplication(other_number)
-            res = '-' + res
+        if other_number._mantissa == _power_of_six(other_number._precision):
+            mantissa = self._mantissa
+            precision = self._precision
 
-        elif self._sign == -1 and other_number._sign == -1:
-            res = self.__multiplication(other_number)
+        else:
+            mantissa = self._mantissa * other_number._mantissa
+            precision = self._precision + other_number._precision
 
-        elif self._sign == -1 and other_number._sign == 1:
-            res = self.__multiplication(other_number)
-            res = '-' + res
+        if self._sign != other_number._sign:
+            mantissa *= -1
 
-        return Sezimal(res, _internal=True)._mult_div_finalizing()
+        return Sezimal._from_mantissa(mantissa, precision)._mult_div_finalizing()
 
     def __rmul__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> Self:
         if type(other_number).__name__ in ('SezimalDecimalUnit', 'DozenalDecimalUnit'):
@@ -685,149 +567,79 @@ class Sezimal:
 
         return other_number.__mul__(self)
 
-    def __basic_division(self, dividend: Self, divisor: Self) -> tuple[Self]:
-        remainder = dividend
-        quotient = Sezimal('0', _internal=True)
-
-        while remainder >= divisor:
-            remainder -= divisor
-            quotient += 1
-
-        return quotient, remainder
-
-    def new_division(self, dividend: Self, divisor: Self) -> tuple[Self]:
-        if dividend < divisor:
-            return Sezimal(0, _internal=True), dividend
-
-        quotient = Sezimal('0', _internal=True)
-        remainder = Sezimal(dividend._digits[0], _internal=True)
-
-        for i in range(1, len(dividend._digits)):
-            remainder *= 10
-            remainder += Sezimal(dividend._digits[i], _internal=True)
-
-            factor = Sezimal(0, _internal=True)
-
-            while (divisor * (factor + 1)) < remainder:
-                factor += 1
-
-            quotient *= 10
-            quotient += factor
-            remainder -= divisor * factor
-
-        return quotient, remainder
-
-        # # Convert quotient and remainder to strings
-        # remainder_str = ''
-        # while remainder:
-        #     remainder_str += str(remainder % base)
-        #     remainder //= base
-        #
-        # # Return quotient and remainder as strings
-        # return quotient_str, int(remainder_str[::-1])
-
-    def __division(self, other_number: Self, max_precision: IntegerSelf = None) -> str:
+    def __division(self, other_number: Self) -> Self:
         #
-        # Divides two values;
-        # the final sign of the operation is dealt with by the calling method: __div__
+        # Divides two values in one pass, as a single integer division
+        # of the mantissas, with the precision the ultra precision allows
         #
-        if other_number == 0:
+        if not other_number._mantissa:
             raise ZeroDivisionError('Division by zero')
 
-        if self == 0:
-            return '0'
+        if not self._mantissa:
+            return Sezimal._from_mantissa(0, 0)
 
         if other_number == 1:
-            return str(self)
+            return Sezimal._from_mantissa(self._mantissa * self._sign, self._precision)
 
         if sezimal_context.fractions_use_decimal:
-            using_ultra_precision = sezimal_context.using_ultra_precision
             precision = sezimal_context.precision
 
-            if not using_ultra_precision:
+            with sezimal_context.local():
                 sezimal_context.use_ultra_precision()
-
-            res = round(Sezimal(self.decimal / other_number.decimal), precision)
-
-            if not using_ultra_precision:
-                sezimal_context.back_to_regular_precision()
+                res = round(Sezimal(self.decimal / other_number.decimal), precision)
 
             return res
 
-        negative = other_number < 0
-        check = str(other_number).replace('-', '')
+        negative = self._sign != other_number._sign
+        reciprocal_key = None
 
-        if self == 1 and check in _RECIPROCAL_MAP:
-            division = validate_clean_sezimal(_RECIPROCAL_MAP[check], double_precision=True)
-
-            if negative:
-                division = '-' + division
-
-            return division
-
-        using_ultra_precision = sezimal_context.using_ultra_precision
-        precision = sezimal_context.precision
-
-        if not using_ultra_precision:
-            sezimal_context.use_ultra_precision()
+        if self == 1:
+            reciprocal_key = (
+                str(other_number).replace('-', ''),
+                sezimal_context.sezimal_precision_decimal,
+                sezimal_context.ultra_precision,
+            )
 
-        max_precision = sezimal_context.sezimal_precision
-        max_precision = int(SezimalInteger(max_precision))
+            division = _RECIPROCAL_CACHE.get(reciprocal_key)
 
-        digits_a = list(self._digits)
-        digits_b = list(other_number._digits)
+            if division is None and reciprocal_key[0] in _RECIPROCAL_MAP:
+                division = Sezimal(validate_clean_sezimal(_RECIPROCAL_MAP[reciprocal_key[0]], double_precision=True), _internal=True)
+                _cache_reciprocal(reciprocal_key, division)
 
-        #
-        # Normalizes the fractional part between the two values,
-        #
-        if self._precision > other_number._precision:
-            digits_b += list('0' * (self._precision - other_number._precision))
-            final_precision = self._precision
+            if division is not None:
+                if negative:
+                    return Sezimal._from_mantissa(division._mantissa * -1, division._precision)
 
-        elif other_number._precision > self._precision:
-            digits_a += list('0' * (other_number._precision - self._precision))
-            final_precision = other_number._precision
+                return division
 
+        if sezimal_context.using_ultra_precision:
+            max_precision = sezimal_context.sezimal_precision_decimal
         else:
-            final_precision = self._precision
-
-        initial_precision = final_precision
-
-        dividend = Sezimal(''.join(digits_a), _internal=True)
-        divisor = Sezimal(''.join(digits_b), _internal=True)
-        quotient, remainder = self.__basic_division(dividend, divisor)
-        max_precision = max(final_precision, max_precision) * 2
-
-        sezimal_context.sezimal_precision = decimal_to_sezimal(str(max_precision))
-
-        while remainder > 0 and final_precision < max_precision:
-            dividend = remainder * 10
-            final_precision += 1
-            q, remainder = self.__basic_division(dividend, divisor)
-            quotient = Sezimal(str(quotient) + str(q), _internal=True)
-
-        division = str(quotient)
+            max_precision = _sezimal_places(sezimal_context.ultra_precision)
 
-        final_precision -= initial_precision
+        dividend, divisor, initial_precision = self._aligned_mantissas(other_number)
+        max_precision = max(initial_precision, max_precision) * 2
+        final_precision = max_precision - initial_precision
 
-        if final_precision:
-            division = division[::-1]
+        quotient, remainder = divmod(abs(dividend) * _power_of_six(final_precision), abs(divisor))
 
-            if len(division) < final_precision + 1:
-                division += '0' * (final_precision - len(division) + 1)
+        #
+        # When the division is exact, the precision is
+        # only what’s needed, without the trailing zeros
+        #
+        if not remainder:
+            while final_precision and not quotient % 6:
+                quotient //= 6
+                final_precision -= 1
 
-            division = division[0:final_precision] + '.' + division[final_precision:]
-            division = division[::-1]
+        division = Sezimal._from_mantissa(quotient, final_precision)
 
-        if self == 1:
-            _RECIPROCAL_MAP[check] = division
-            # print(f"""    '{check}': '{sezimal_format(division, sezimal_places=sezimal_context.sezimal_precision)}',""")
+        if reciprocal_key is not None:
+            _cache_reciprocal(reciprocal_key, division)
+            # print(f"""    '{reciprocal_key[0]}': '{sezimal_format(str(division), sezimal_places=sezimal_context.sezimal_precision)}',""")
 
         if negative:
-            division = '-' + division
-
-        if not using_ultra_precision:
-            sezimal_context.back_to_regular_precision()
+            return Sezimal._from_mantissa(quotient * -1, final_precision)
 
         return division
 
@@ -841,35 +653,16 @@ class Sezimal:
             if type(other_number).__name__ in ('SezimalDecimalUnit', 'DozenalDecimalUnit'):
                 return other_number.__rtruediv__(self)
 
-            if type(other_number) != Sezimal:
+            if not isinstance(other_number, Sezimal):
                 other_number = Sezimal(other_number)
 
             if other_number == 1 or other_number == -1:
                 reciprocal = other_number
             else:
-                reciprocal = Sezimal('1', _internal=True).__division(other_number)
+                reciprocal = _ONE.__division(other_number)
 
         return self * reciprocal
 
-        # #
-        # # Deals with the signs
-        # #
-        # if self._sign == 1 and other_number._sign == 1:
-        #     res = self.__division(other_number)
-        #
-        # elif self._sign == 1 and other_number._sign == -1:
-        #     res = self.__division(other_number)
-        #     res = '-' + res
-        #
-        # elif self._sign == -1 and other_number._sign == -1:
-        #     res = self.__division(other_number)
-        #
-        # elif self._sign == -1 and other_number._sign == 1:
-        #     res = self.__division(other_number)
-        #     res = '-' + res
-        #
-        # return Sezimal(res)._mult_div_finalizing()
-
     def __rtruediv__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> Self:
         if type(other_number).__name__ in ('SezimalDecimalUnit', 'DozenalDecimalUnit'):
             return other_number.__truediv__(self)
@@ -880,34 +673,31 @@ class Sezimal:
         return other_number.__truediv__(self)
 
     def __divmod__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> tuple[Self]:
-        if type(other_number) != Sezimal:
+        if not isinstance(other_number, Sezimal):
             other_number = Sezimal(other_number)
 
-        dividend = Sezimal(self._integer, _internal=True)
-        divisor = Sezimal(other_number._integer, _internal=True)
+        #
+        # Only the integer parts are considered
+        #
+        dividend = self._mantissa // _power_of_six(self._precision)
+        divisor = other_number._mantissa // _power_of_six(other_number._precision)
 
-        if divisor == 0:
+        if not divisor:
             raise ZeroDivisionError('Division by zero')
 
-        if divisor == 1:
-            return dividend, Sezimal(0, _internal=True)
-
-        quotient, remainder = self.__basic_division(dividend, divisor)
-
-        if self._sign == 1 and other_number._sign == 1:
-            pass
+        quotient, remainder = divmod(dividend, divisor)
 
-        elif self._sign == 1 and other_number._sign == -1:
+        #
+        # The quotient is negative when the signs differ,
+        # and the remainder has the sign of the dividend
+        #
+        if self._sign != other_number._sign:
             quotient *= -1
 
-        elif self._sign == -1 and other_number._sign == -1:
-            remainder *= -1
-
-        elif self._sign == -1 and other_number._sign == 1:
-            quotient *= -1
+        if self._sign == -1:
             remainder *= -1
 
-        return quotient, remainder
+        return Sezimal._from_mantissa(quotient, 0), Sezimal._from_mantissa(remainder, 0)
 
     def __floordiv__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> Self:
         if type(other_number).__name__ in ('SezimalDecimalUnit', 'DozenalDecimalUnit'):
@@ -959,25 +749,22 @@ class Sezimal:
         return _FACTORIAL[integer]
 
     def calculus_exp(self) -> Self:
-        sezimal_context.sezimal_precision_decimal += 4
-
-        result = Sezimal(1, _internal=True)
+        with sezimal_context.local(sezimal_precision_decimal=sezimal_context.sezimal_precision_decimal + 4):
+            result = Sezimal(1, _internal=True)
 
-        for i in range(1, sezimal_context.sezimal_precision_decimal + 1):
-            i = SezimalInteger(Decimal(i))
-            result += (self ** i) / i.factorial()
-
-        sezimal_context.sezimal_precision_decimal -= 4
+            for i in range(1, sezimal_context.sezimal_precision_decimal + 1):
+                i = SezimalInteger(Decimal(i))
+                result += (self ** i) / i.factorial()
 
         return result._mult_div_finalizing()
 
     def exp(self) -> Self:
         with localcontext() as context:
             context.prec = sezimal_context.decimal_precision + 3
-            sezimal_context.sezimal_precision_decimal += 4
-            result = self.decimal.exp()
-            result = Sezimal(result)
-            sezimal_context.sezimal_precision_decimal -= 4
+
+            with sezimal_context.local(sezimal_precision_decimal=sezimal_context.sezimal_precision_decimal + 4):
+                result = self.decimal.exp()
+                result = Sezimal(result)
 
         return result._mult_div_finalizing()
 
@@ -1000,10 +787,10 @@ class Sezimal:
     def ln(self) -> Self:
         with localcontext() as context:
             context.prec = sezimal_context.decimal_precision + 3
-            sezimal_context.sezimal_precision_decimal += 4
-            result = self.decimal.ln()
-            result = Sezimal(result)
-            sezimal_context.sezimal_precision_decimal -= 4
+
+            with sezimal_context.local(sezimal_precision_decimal=sezimal_context.sezimal_precision_decimal + 4):
+                result = self.decimal.ln()
+                result = Sezimal(result)
 
         return result._mult_div_finalizing()
 
@@ -1018,11 +805,7 @@ class Sezimal:
             return Sezimal(1, _internal=True) / self.__power(other_number * -1)
 
         if other_number.is_integer():
-            result = self
-
-            while other_number > 1:
-                result *= self
-                other_number -= 1
+            result = self.__integer_power(other_number._mantissa // _power_of_six(other_number._precision))
 
         else:
             result = self.ln() * other_number
@@ -1030,6 +813,62 @@ class Sezimal:
 
         return result
 
+    def __integer_power(self, exponent: int) -> Self:
+        #
+        # Exponentiation by squaring, over the mantissa;
+        # the integer part is always exact, and the fraction keeps
+        # enough places beyond the precision for the rounding at the end
+        #
+        if exponent == 1:
+            return self
+
+        if not self._mantissa:
+            return Sezimal._from_mantissa(0, 0)
+
+        sign = -1 if self._sign == -1 and exponent % 2 else 1
+
+        #
+        # Powers of 1 and -1 keep the precision,
+        # just like the multiplication does
+        #
+        if self._mantissa == _power_of_six(self._precision):
+            return Sezimal._from_mantissa(self._mantissa * sign, self._precision)
+
+        integer_digits = max(int(exponent * (log(self._mantissa, 6) - self._precision)) + 1, 0)
+        places = sezimal_context.sezimal_precision_decimal + integer_digits + exponent.bit_length() + 4
+
+        mantissa, precision = 1, 0
+        base_mantissa, base_precision = self._mantissa, self._precision
+
+        while exponent:
+            if exponent % 2:
+                mantissa *= base_mantissa
+                precision += base_precision
+
+                if precision > places:
+                    mantissa = _round_mantissa(mantissa, precision - places)
+                    precision = places
+
+            exponent //= 2
+
+            if exponent:
+                base_mantissa *= base_mantissa
+                base_precision *= 2
+
+                if base_precision > places:
+                    base_mantissa = _round_mantissa(base_mantissa, base_precision - places)
+                    base_precision = places
+
+        result = Sezimal._from_mantissa(mantissa * sign, precision)._mult_div_finalizing()
+
+        #
+        # Too small for the precision
+        #
+        if not result._mantissa:
+            return Sezimal._from_mantissa(0, 0)
+
+        return result
+
     def __power(self, other_number: Self) -> Self:
         if other_number == 0:
             return SezimalInteger(1, _internal=True)
@@ -1039,18 +878,9 @@ class Sezimal:
         # avoid loosing precision in the decimal conversion,
         #
         if other_number.is_integer():
-            result = self
-
-            negative = other_number < 0
+            result = self.__integer_power(other_number._mantissa // _power_of_six(other_number._precision))
 
-            if negative:
-                other_number *= -1
-
-            while other_number > 1:
-                result *= self
-                other_number -= 1
-
-            if negative:
+            if other_number._sign == -1:
                 return 1 / result
 
             return result
@@ -1059,12 +889,49 @@ class Sezimal:
         result = Sezimal(result)
         return result._mult_div_finalizing()
 
-    def __pow__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> Self:
+    def __pow__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction, modulo: str | int | Decimal | Self | IntegerSelf = None) -> Self:
         if type(other_number) != Sezimal:
             other_number = Sezimal(other_number)
 
+        if modulo is not None:
+            return self.__modular_power(other_number, modulo)
+
         return self.__power(other_number)
 
+    def __modular_power(self, other_number: Self, modulo: str | int | Decimal | Self | IntegerSelf) -> IntegerSelf:
+        #
+        # pow(number, exponent, modulo), without ever calculating
+        # the whole power; just like %, the remainder has the sign
+        # of the power
+        #
+        if not isinstance(modulo, Sezimal):
+            modulo = Sezimal(modulo)
+
+        if not (self.is_integer() and other_number.is_integer() and modulo.is_integer()):
+            raise TypeError('pow() 3rd argument not allowed unless all arguments are integers')
+
+        if not modulo._mantissa:
+            raise ValueError('pow() 3rd argument cannot be 0')
+
+        base = self._mantissa // _power_of_six(self._precision)
+        exponent = other_number._mantissa // _power_of_six(other_number._precision)
+        modulo = modulo._mantissa // _power_of_six(modulo._precision)
+
+        if other_number._sign == -1:
+            exponent *= -1
+
+            if self._sign == -1:
+                base *= -1
+
+            return SezimalInteger._from_mantissa(pow(base, exponent, modulo), 0)
+
+        remainder = pow(base, exponent, modulo)
+
+        if self._sign == -1 and exponent % 2:
+            remainder *= -1
+
+        return SezimalInteger._from_mantissa(remainder, 0)
+
     def __rpow__(self, other_number: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction) -> Self:
         if type(other_number) != Sezimal:
             other_number = Sezimal(other_number)
@@ -1074,38 +941,61 @@ class Sezimal:
     def log(self) -> Self:
         with localcontext() as context:
             context.prec = sezimal_context.decimal_precision + 3
-            sezimal_context.sezimal_precision_decimal += 4
-            result = self.decimal.ln() / Decimal(6).ln()
-            result = Sezimal(result)
-            sezimal_context.sezimal_precision_decimal -= 4
+
+            with sezimal_context.local(sezimal_precision_decimal=sezimal_context.sezimal_precision_decimal + 4):
+                result = self.decimal.ln() / Decimal(6).ln()
+                result = Sezimal(result)
 
         return result._mult_div_finalizing()
 
     def log2(self) -> Self:
         with localcontext() as context:
             context.prec = sezimal_context.decimal_precision + 3
-            sezimal_context.sezimal_precision_decimal += 4
-            result = self.decimal.ln() / Decimal(2).ln()
-            result = Sezimal(result)
-            sezimal_context.sezimal_precision_decimal -= 4
+
+            with sezimal_context.local(sezimal_precision_decimal=sezimal_context.sezimal_precision_decimal + 4):
+                result = self.decimal.ln() / Decimal(2).ln()
+                result = Sezimal(result)
 
         return result._mult_div_finalizing()
 
     def log14(self) -> Self:
         with localcontext() as context:
             context.prec = sezimal_context.decimal_precision + 3
-            sezimal_context.sezimal_precision_decimal += 4
-            result = self.decimal.ln() / Decimal(10).ln()
-            result = Sezimal(result)
-            sezimal_context.sezimal_precision_decimal -= 4
+
+            with sezimal_context.local(sezimal_precision_decimal=sezimal_context.sezimal_precision_decimal + 4):
+                result = self.decimal.ln() / Decimal(10).ln()
+                result = Sezimal(result)
 
         return result._mult_div_finalizing()
 
+    def __root(self, degree: int) -> Self:
+        #
+        # The root of the mantissa, scaled to a few places beyond
+        # the precision, found with integers only;
+        # an exact root keeps only the places it needs
+        #
+        places = max(sezimal_context.sezimal_precision_decimal + 4, -(-self._precision // degree))
+        radicand = self._mantissa * _power_of_six(places * degree - self._precision)
+        root = _integer_root(radicand, degree)
+
+        if root ** degree == radicand:
+            while places and not root % 6:
+                root //= 6
+                places -= 1
+
+        return Sezimal._from_mantissa(root, places)._mult_div_finalizing()
+
     def sqrt(self) -> Self:
-        return self ** Sezimal('0.3')
+        if self._sign == -1:
+            return self ** Sezimal('0.3')
+
+        return self.__root(2)
 
     def cbrt(self) -> Self:
-        return self ** Sezimal('0.2')
+        if self._sign == -1:
+            return self ** Sezimal('0.2')
+
+        return self.__root(3)
 
     def _find_gcd(self, numerator: Self, denominator: Self) -> Self:
         if denominator == 0:
@@ -1127,8 +1017,11 @@ class Sezimal:
         return numerator, denominator
 
 
+_ONE = Sezimal._from_mantissa(1, 0)
+
+
 class SezimalInteger(Sezimal):
-    __slots__ = ['_value', '_sign', '_integer', '_fraction', '_precision', '_digits']
+    __slots__ = ['_value', '_sign', '_mantissa', '_precision', '_integer_digits', '_fraction_digits']
 
     def __init__(
             self,
@@ -1142,9 +1035,11 @@ class SezimalInteger(Sezimal):
         if type(number) == Decimal:
             original_decimal = Decimal(int(number))
 
-        self._fraction = ''
-        self._precision = 0
-        self._digits = list(self._integer)
+        if self._precision:
+            self._mantissa //= _power_of_six(self._precision)
+            self._precision = 0
+
+        self._fraction_digits = ''
         self._value = original_decimal
 
     def __repr__(self) -> str:
@@ -1155,7 +1050,7 @@ class SezimalInteger(Sezimal):
 
 
 class SezimalFraction(Sezimal):
-    __slots__ = ['_value', '_sign', '_integer', '_fraction', '_precision', '_digits', '_numerator', '_denominator', '_sezimal', '_precalculated_value', '_precalculated_reciprocal']
+    __slots__ = ['_value', '_sign', '_mantissa', '_precision', '_integer_digits', '_fraction_digits', '_numerator', '_denominator', '_sezimal', '_precalculated_value', '_precalculated_reciprocal']
 
     def __init__(self, numerator: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction, denominator: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction = None, _precalculated_value: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction = None, _precalculated_reciprocal: str | int | float | Decimal | Self | IntegerSelf | FractionSelf | DecimalUnitSelf | Dozenal | DozenalInteger | DozenalFraction = None) -> Self:
         if type(numerator) == str:
@@ -1186,29 +1081,31 @@ class SezimalFraction(Sezimal):
             cleaned_denominator = validate_clean_sezimal(denominator)
 
         old_precision = sezimal_context.sezimal_precision
+        precision = old_precision
+
+        with sezimal_context.local() if sezimal_context.fractions_precision else nullcontext():
+            if sezimal_context.fractions_precision:
+                sezimal_context.sezimal_precision = sezimal_context.fractions_precision
+                precision = sezimal_context.sezimal_precision
+
+            # self._numerator, self._denominator = \
+            #     self.__simplify(
+            #         Sezimal(cleaned_numerator),
+            #         Sezimal(cleaned_denominator),
+            #     )
+            self._numerator, self._denominator = \
+                Sezimal(cleaned_numerator), \
+                Sezimal(cleaned_denominator)
+
+            if _precalculated_value is not None:
+                self._sezimal = Sezimal(_precalculated_value)
+            elif sezimal_context.fractions_use_decimal:
+                self._sezimal = Sezimal(self._numerator.decimal / self._denominator.decimal)
+            else:
+                self._sezimal = self._numerator / self._denominator
 
-        if sezimal_context.fractions_precision:
-            sezimal_context.sezimal_precision = sezimal_context.fractions_precision
-
-        # self._numerator, self._denominator = \
-        #     self.__simplify(
-        #         Sezimal(cleaned_numerator),
-        #         Sezimal(cleaned_denominator),
-        #     )
-        self._numerator, self._denominator = \
-            Sezimal(cleaned_numerator), \
-            Sezimal(cleaned_denominator)
-
-        if _precalculated_value is not None:
-            self._sezimal = Sezimal(_precalculated_value)
-        elif sezimal_context.fractions_use_decimal:
-            self._sezimal = Sezimal(self._numerator.decimal / self._denominator.decimal)
-        else:
-            self._sezimal = self._numerator / self._denominator
-
-        if old_precision != sezimal_context.sezimal_precision:
+        if old_precision != precision:
             self._sezimal = round(self._sezimal, old_precision)
-            sezimal_context.sezimal_precision = old_precision
 
         self._precalculated_value = _precalculated_value
         self._precalculated_reciprocal = _precalculated_reciprocal
@@ -1283,7 +1180,7 @@ class SezimalFraction(Sezimal):
 
         numerator = self.numerator * other_number
 
-        if numerator._fraction == '':
+        if numerator._precision == 0:
             numerator = self.numerator * other_number
             denominator = self.denominator
             numerator, denominator = self.__simplify(numerator, denominator)
@@ -1303,7 +1200,7 @@ class SezimalFraction(Sezimal):
 
         numerator = self.numerator * other_number
 
-        if numerator._fraction == '':
+        if numerator._precision == 0:
             denominator = self.denominator
             numerator, denominator = self.__simplify(numerator, denominator)
             return SezimalFraction(numerator, denominator)
@@ -1320,7 +1217,7 @@ class SezimalFraction(Sezimal):
         if type(other_number) != Sezimal:
             other_number = Sezimal(other_number)
 
-        if other_number._fraction == '':
+        if other_number._precision == 0:
             numerator = self.numerator
             denominator = self.denominator * other_number
             numerator, denominator = self.__simplify(numerator, denominator)
@@ -1338,7 +1235,7 @@ class SezimalFraction(Sezimal):
         if type(other_number) != Sezimal:
             other_number = Sezimal(other_number)
 
-        if other_number._fraction == '':
+        if other_number._precision == 0:
             numerator = self.numerator
             denominator = self.denominator * other_number
             numerator, denominator = self.__simplify(numerator, denominator)
@@ -1350,7 +1247,7 @@ class SezimalFraction(Sezimal):
         if type(other_number) != Sezimal:
             other_number = Sezimal(other_number)
 
-        if other_number._fraction == '':
+        if other_number._precision == 0:
             numerator = self.numerator ** other_number
             denominator = self.denominator ** other_number
             numerator, denominator = self.__simplify(numerator, denominator)
@@ -1374,7 +1271,7 @@ class SezimalFraction(Sezimal):
         if type(other_number) != Sezimal:
             other_number = Sezimal(other_number)
 
-        if other_number._fraction == '':
+        if other_number._precision == 0:
             numerator = self.numerator
             numerator += other_number * self.denominator
             numerator, denominator = self.__simplify(numerator, self.denominator)
@@ -1398,7 +1295,7 @@ class SezimalFraction(Sezimal):
         if type(other_number) != Sezimal:
             other_number = Sezimal(other_number)
 
-        if other_number._fraction == '':
+        if other_number._precision == 0:
             numerator = self.numerator
             numerator += other_number * self.denominator
             numerator, denominator = self.__simplify(numerator, self.denominator)
@@ -1422,7 +1319,7 @@ class SezimalFraction(Sezimal):
         if type(other_number) != Sezimal:
             other_number = Sezimal(other_number)
 
-        if other_number._fraction == '':
+        if other_number._precision == 0:
             numerator = self.numerator
             numerator -= other_number * self.denominator
             numerator, denominator = self.__simplify(numerator, self.denominator)
@@ -1446,7 +1343,7 @@ class SezimalFraction(Sezimal):
         if type(other_number) != Sezimal:
             other_number = Sezimal(other_number)
 
-        if other_number._fraction == '':
+        if other_number._precision == 0:
             numerator = other_number * self.denominator
             numerator -= self.numerator
             numerator, denominator = self.__simplify(numerator, self.denominator)
@@ -1470,14 +1367,9 @@ class SezimalFraction(Sezimal):
         if (not sezimal_context.fractions_simplify) and (not force):
             return num, den
 
-        using_ultra_precision = sezimal_context.using_ultra_precision
-        precision = sezimal_context.precision
-
-        if not using_ultra_precision:
+        with sezimal_context.local():
             sezimal_context.use_ultra_precision()
-
-        with localcontext() as context:
-            context.prec = sezimal_context.decimal_precision
+            getcontext().prec = sezimal_context.decimal_precision
 
             while True:
                 x = num.decimal
@@ -1494,9 +1386,6 @@ class SezimalFraction(Sezimal):
                 num = SezimalInteger(num.decimal / x)
                 den = SezimalInteger(den.decimal / x)
 
-        if not using_ultra_precision:
-            sezimal_context.back_to_regular_precision()
-
         return num, den
 
         # if precision:
@@ -1537,8 +1426,8 @@ class SezimalFraction(Sezimal):
 
 
 class SezimalDecimalUnit(Sezimal):
-    __slots__ = ['_value', '_sign', '_integer', '_fraction', '_precision',
-                 '_digits', '_unit', '_subunit', '_decimal_precision',
+    __slots__ = ['_value', '_sign', '_mantissa', '_precision',
+                 '_integer_digits', '_fraction_digits', '_unit', '_subunit', '_decimal_precision',
                  '_sezimal_precision', '_unit_symbol', '_subunit_symbol']
 
     def __init__(
@@ -0,0 +1,816 @@
+
+__all__ = (
+    'SezimalArray',
+)
+
+
+from decimal import Decimal
+import operator
+
+from typing import TypeVar
+
+Self = TypeVar('Self', bound='SezimalArray')
+
+try:
+    import numpy
+except:
+    numpy = None
+
+from .base import sezimal_context, default_to_sezimal_digits
+from .base.formatting import sezimal_format, _finish_formatting, \
+    SEPARATOR_DOT, SEPARATOR_UNDERSCORE, RECURRING_DIGITS_NOTATION_NONE
+from .sezimal import Sezimal, SezimalInteger, SezimalFraction, \
+    _power_of_six, _round_mantissa, _integer_to_sezimal_digits, _sezimal_places
+
+
+#
+# A SezimalArray keeps a whole column of values as signed integer
+# mantissas, all of them scaled by the same 6 ** places;
+# every operation is then done over the integers, at once,
+# without creating a Sezimal instance for each value;
+# when NumPy is available, the mantissas live in an object array
+# (the values can be much larger than an int64), and the loops
+# are done by NumPy; otherwise, it’s a plain list of ints
+#
+def _mantissa_array(mantissas: list[int]) -> list[int]:
+    if numpy is None:
+        return mantissas
+
+    return numpy.array(mantissas, dtype=object)
+
+
+def _elementwise(operation, this: list[int] | int, other: list[int] | int) -> list[int]:
+    if numpy is not None:
+        return operation(this, other)
+
+    if type(this) == int:
+        return [operation(this, o) for o in other]
+
+    if type(other) == int:
+        return [operation(t, other) for t in this]
+
+    return [operation(t, o) for t, o in zip(this, other)]
+
+
+def _divide_mantissa(numerator: int, denominator: int) -> int:
+    #
+    # Integer division, rounding half to even, just like _round_mantissa
+    #
+    if denominator < 0:
+        numerator = -numerator
+        denominator = -denominator
+
+    quotient, remainder = divmod(numerator, denominator)
+    remainder *= 2
+
+    if remainder > denominator or (remainder == denominator and quotient % 2):
+        quotient += 1
+
+    return quotient
+
+
+def _divide_mantissas(numerators: list[int], denominators: list[int] | int) -> list[int]:
+    if numpy is None:
+        return _elementwise(_divide_mantissa, numerators, denominators)
+
+    if type(denominators) == int:
+        #
+        # A single denominator can be larger than an int64,
+        # and numpy.where would try to convert it
+        #
+        if denominators < 0:
+            numerators = -numerators
+            denominators = -denominators
+
+    else:
+        negative = denominators < 0
+        numerators = numpy.where(negative, -numerators, numerators)
+        denominators = numpy.where(negative, -denominators, denominators)
+
+    #
+    # (2 * numerator + denominator) // (2 * denominator) rounds
+    # half up, with as few passes over the objects as possible;
+    # the exact halves, always few, are taken back to even after
+    #
+    numerators = numerators * 2 + denominators
+    denominators = denominators * 2
+
+    quotient = numerators // denominators
+    halves = numerators % denominators == 0
+
+    if halves.any():
+        quotient[halves] -= quotient[halves] % 2
+
+    return quotient
+
+
+def _round_mantissas(mantissas: list[int], to_discard: int) -> list[int]:
+    if numpy is None:
+        return [_round_mantissa(mantissa, to_discard) for mantissa in mantissas]
+
+    return _divide_mantissas(mantissas, _power_of_six(to_discard))
+
+
+def _rescale_mantissas(mantissas: list[int], places: int, new_places: int) -> list[int]:
+    if new_places == places:
+        return mantissas
+
+    if new_places < places:
+        return _round_mantissas(mantissas, places - new_places)
+
+    factor = _power_of_six(new_places - places)
+
+    if numpy is None:
+        return [mantissa * factor for mantissa in mantissas]
+
+    return mantissas * factor
+
+
+def _rescale_mantissa(mantissa: int, places: int, new_places: int) -> int:
+    if new_places >= places:
+        return mantissa * _power_of_six(new_places - places)
+
+    return _round_mantissa(mantissa, places - new_places)
+
+
+def _group_integer(integer: str, separator: str, grouping_digits: int) -> str:
+    #
+    # Same as base.formatting._apply_format, only without the regexes
+    #
+    size = len(integer)
+
+    if grouping_digits == 3 and size <= 4:
+        return integer
+
+    first = size % grouping_digits or grouping_digits
+
+    return separator.join(
+        [integer[:first]] + [integer[i:i + grouping_digits] for i in range(first, size, grouping_digits)]
+    )
+
+
+def _group_fraction(fraction: str, separator: str, grouping_digits: int) -> str:
+    size = len(fraction)
+
+    if grouping_digits == 3 and size <= 4:
+        return fraction
+
+    return separator.join(
+        [fraction[i:i + grouping_digits] for i in range(0, size, grouping_digits)]
+    )
+
+
+#
+# Up to 6 ** 24 the values fit an int64, and their digits can be
+# taken out by NumPy, one place at a time for the whole column,
+# instead of one value at a time; the integer and fraction parts
+# are taken apart, so each of them only has to fit by itself
+#
+_INT64_PLACES = 24
+_INT64_DECIMAL_PLACES = 18
+
+
+def _int64_parts(values, unit: int, limit: int):
+    #
+    # The integer and fraction parts of the values, as int64,
+    # or None when the integer parts don’t fit
+    #
+    if values.max() < limit:
+        values = values.astype(numpy.int64)
+        return values // unit, values % unit
+
+    integers = values // unit
+
+    if integers.max() >= limit:
+        return None
+
+    return integers.astype(numpy.int64), (values - integers * unit).astype(numpy.int64)
+
+
+def _digit_columns(values, width: int, base: int):
+    #
+    # All the digits, padded with zeros to the same width,
+    # one column for each place, as character codes
+    #
+    digits = numpy.empty((len(values), width), dtype=numpy.uint32)
+
+    for place in range(width - 1, -1, -1):
+        values, digits[:, place] = numpy.divmod(values, base)
+
+    return digits + ord('0')
+
+
+def _grouped_columns(columns: list[int], separator: str, grouping_digits: int, from_right: bool) -> list[int | str]:
+    #
+    # The same grouping of _group_integer and _group_fraction,
+    # only over the indexes of the digit columns
+    #
+    size = len(columns)
+
+    if not separator or (grouping_digits == 3 and size <= 4):
+        return columns
+
+    if from_right:
+        first = size % grouping_digits or grouping_digits
+    else:
+        first = grouping_digits
+
+    grouped = columns[:first]
+
+    for i in range(first, size, grouping_digits):
+        grouped += list(separator) + columns[i:i + grouping_digits]
+
+    return grouped
+
+
+def _format_int64_values(integers, fractions, negative, places: int,
+        sezimal_separator: str, group_separator: str,
+        fraction_group_separator: str, grouping_digits: int) -> list[str]:
+    integer_size = 1
+
+    while integer_size < _INT64_PLACES and integers.max() >= _power_of_six(integer_size):
+        integer_size += 1
+
+    digits = numpy.concatenate((
+        _digit_columns(integers, integer_size, 6),
+        _digit_columns(fractions, places, 6),
+    ), axis=1)
+    width = integer_size + places
+    layout = _grouped_columns(list(range(integer_size)), group_separator, grouping_digits, True)
+    integer_starts = [i for i, column in enumerate(layout) if type(column) == int]
+
+    if places:
+        layout += list(sezimal_separator)
+        layout += _grouped_columns(list(range(integer_size, width)), fraction_group_separator, grouping_digits, False)
+
+    characters = numpy.empty((len(integers), len(layout)), dtype=numpy.uint32)
+
+    for i, column in enumerate(layout):
+        if type(column) == int:
+            characters[:, i] = digits[:, column]
+        else:
+            characters[:, i] = ord(column)
+
+    texts = characters.view(f'<U{len(layout)}')[:, 0].tolist()
+
+    #
+    # The zeros to the left of the integer part are cut out,
+    # keeping at least one digit
+    #
+    integer_digits = numpy.ones(len(integers), dtype=numpy.int64)
+
+    for place in range(1, integer_size):
+        integer_digits += integers >= _power_of_six(place)
+
+    starts = numpy.array(integer_starts, dtype=numpy.int64)[integer_size - integer_digits].tolist()
+
+    formatted_numbers = [
+        '-' + text[start:] if is_negative else text[start:]
+        for text, start, is_negative in zip(texts, starts, negative.tolist())
+    ]
+
+    if group_separator and grouping_digits == 3 and integer_size > 4:
+        #
+        # Integers of exactly 4 digits aren’t grouped
+        #
+        for i in numpy.flatnonzero(integer_digits == 4).tolist():
+            formatted_numbers[i] = formatted_numbers[i].replace(group_separator, '', 1)
+
+    return formatted_numbers
+
+
+def _decimal_int64_values(integers, fractions, negative, decimal_places: int) -> list[str]:
+    #
+    # The texts are meant for Decimal, that doesn’t mind
+    # the zeros to the left of the integer part
+    #
+    integer_size = 1
+
+    while integer_size < _INT64_DECIMAL_PLACES and integers.max() >= 10 ** integer_size:
+        integer_size += 1
+
+    width = 1 + integer_size + bool(decimal_places) + decimal_places
+    characters = numpy.empty((len(integers), width), dtype=numpy.uint32)
+    characters[:, 0] = numpy.where(negative, ord('-'), ord('0'))
+    characters[:, 1:integer_size + 1] = _digit_columns(integers, integer_size, 10)
+
+    if decimal_places:
+        characters[:, integer_size + 1] = ord('.')
+        characters[:, integer_size + 2:] = _digit_columns(fractions, decimal_places, 10)
+
+        #
+        # The zeros to the right of the fraction are cut out,
+        # the dot too when the fraction is all zeros;
+        # NumPy drops the trailing NULs from the texts
+        #
+        fraction_zeros = numpy.zeros(len(integers), dtype=numpy.int64)
+
+        for place in range(1, decimal_places + 1):
+            fraction_zeros += fractions % 10 ** place == 0
+
+        ends = width - fraction_zeros - (fraction_zeros == decimal_places)
+        characters[numpy.arange(width) >= ends[:, None]] = 0
+
+    return characters.view(f'<U{width}')[:, 0].tolist()
+
+
+#
+# 10 ** 22 is the largest power of ten a float64 holds exactly
+#
+_FLOAT64_TEN_EXPONENTS = 22
+_POWERS_OF_TEN = None
+
+
+def _float64_decimal_ratios(values):
+    #
+    # The shortest decimal of each float (the same repr gives),
+    # as numerator / 10 ** exponent, for the whole column at once:
+    # for each exponent, from 0 up, the integer nearest
+    # to value * 10 ** exponent, or one of its neighbours
+    # (the product isn’t exact), is the numerator when it turns
+    # back into the very same float; that is only certain while
+    # the steps of 10 ** -exponent aren’t smaller than the
+    # spacing of the floats around the value, and the numerator
+    # fits a float64 exactly; the values not found by then
+    # (mostly the ones with 17 significant digits),
+    # and inf and nan, are left out, for repr to deal with
+    #
+    numerators = numpy.zeros(len(values), dtype=numpy.int64)
+    exponents = numpy.zeros(len(values), dtype=numpy.int64)
+    found = numpy.zeros(len(values), dtype=bool)
+    pending = numpy.flatnonzero(numpy.isfinite(values))
+
+    for exponent in range(_FLOAT64_TEN_EXPONENTS + 1):
+        power = 10.0 ** exponent
+        pending_values = values[pending]
+        products = pending_values * power
+
+        certain = (numpy.spacing(numpy.abs(pending_values)) * power <= 1) \
+            & (numpy.abs(products) < 2.0 ** 53 - 2)
+
+        pending = pending[certain]
+
+        if not len(pending):
+            break
+
+        pending_values = pending_values[certain]
+        nearest = numpy.rint(products[certain])
+        numerator = nearest
+        matches = numpy.zeros(len(pending), dtype=numpy.int64)
+
+        for candidate in (nearest - 1, nearest, nearest + 1):
+            match = candidate / power == pending_values
+            matches += match
+            numerator = numpy.where(match, candidate, numerator)
+
+        #
+        # Two numerators turning into the same float
+        # would be a tie, left for repr as well
+        #
+        single = matches == 1
+        numerators[pending[single]] = numerator[single]
+        exponents[pending[single]] = exponent
+        found[pending[single]] = True
+
+        pending = pending[matches == 0]
+
+    return numerators, exponents, found
+
+
+def _powers_of_ten(exponents):
+    global _POWERS_OF_TEN
+
+    if _POWERS_OF_TEN is None:
+        _POWERS_OF_TEN = numpy.array([10 ** exponent for exponent in range(_FLOAT64_TEN_EXPONENTS + 1)], dtype=object)
+
+    return _POWERS_OF_TEN[exponents]
+
+
+class SezimalArray:
+    __slots__ = ['_mantissas', '_places']
+
+    def __init__(self, numbers: list | tuple | Self = (), sezimal_places: str | int | SezimalInteger = None) -> Self:
+        #
+        # sezimal_places, like the precision everywhere else,
+        # is given in sezimal
+        #
+        if sezimal_places is None:
+            self._places = sezimal_context.sezimal_precision_decimal
+        else:
+            self._places = _sezimal_places(sezimal_places)
+
+        if type(numbers) == SezimalArray:
+            self._mantissas = _rescale_mantissas(numbers._mantissas, numbers._places, self._places)
+            return
+
+        if numpy is not None and type(numbers) == numpy.ndarray:
+            numbers = numbers.tolist()
+
+        mantissas = []
+
+        for number in numbers:
+            if type(number).__name__ in ('SezimalFraction', 'SezimalDecimalUnit'):
+                number = number.sezimal
+
+            if not isinstance(number, Sezimal):
+                number = Sezimal(number)
+
+            mantissas.append(_rescale_mantissa(number._mantissa * number._sign, number._precision, self._places))
+
+        self._mantissas = _mantissa_array(mantissas)
+
+    @classmethod
+    def _from_mantissas(cls, mantissas: list[int], places: int) -> Self:
+        array = cls.__new__(cls)
+        array._mantissas = mantissas
+        array._places = places
+        return array
+
+    @classmethod
+    def decimal_to_sezimal(cls, numbers: list | tuple, sezimal_places: str | int | SezimalInteger = None) -> Self:
+        #
+        # The decimal values are converted exactly, from their
+        # integer ratio, and rounded only once, to the places wanted;
+        # ints here are decimal ints, unlike Sezimal(int)
+        #
+        if sezimal_places is None:
+            places = sezimal_context.sezimal_precision_decimal
+        else:
+            places = _sezimal_places(sezimal_places)
+
+        power = _power_of_six(places)
+
+        if numpy is not None and type(numbers) == numpy.ndarray:
+            if numbers.dtype.kind in 'iu':
+                return cls._from_mantissas(numbers.astype(object) * power, places)
+
+            if numbers.dtype.kind == 'f':
+                return cls._from_float64(numbers.astype(numpy.float64), places)
+
+            numbers = numbers.tolist()
+
+        return cls._from_mantissas(cls._decimal_mantissas(numbers, places), places)
+
+    @staticmethod
+    def _decimal_mantissas(numbers: list | tuple, places: int) -> list[int]:
+        power = _power_of_six(places)
+        numerators = []
+        denominators = []
+
+        for number in numbers:
+            if type(number) == float:
+                #
+                # The shortest repr, so 0.1 is 1/10, as in Sezimal(0.1);
+                # its digits are read straight as the numerator,
+                # unless it’s in scientific notation, inf or nan
+                #
+                text = repr(number)
+
+                if 'e' not in text and 'n' not in text:
+                    integer, _, fraction = text.partition('.')
+                    numerators.append(int(integer + fraction) * power)
+                    denominators.append(10 ** len(fraction))
+                    continue
+
+                number = Decimal(text)
+
+            elif type(number) == int:
+                numerators.append(number * power)
+                denominators.append(1)
+                continue
+
+            elif type(number) == str:
+                number = Decimal(number.replace('_', ''))
+
+            elif type(number).__name__ in ('Sezimal', 'SezimalInteger'):
+                numerators.append(_rescale_mantissa(number._mantissa * number._sign, number._precision, places))
+                denominators.append(1)
+                continue
+
+            numerator, denominator = number.as_integer_ratio()
+            numerators.append(numerator * power)
+            denominators.append(denominator)
+
+        #
+        # All the divisions, rounding half to even, at once
+        #
+        return _divide_mantissas(_mantissa_array(numerators), _mantissa_array(denominators))
+
+    @classmethod
+    def _from_float64(cls, values, places: int) -> Self:
+        numerators, exponents, found = _float64_decimal_ratios(values)
+
+        mantissas = _divide_mantissas(
+            numerators.astype(object) * _power_of_six(places),
+            _powers_of_ten(exponents),
+        )
+
+        missing = numpy.flatnonzero(~found)
+
+        if len(missing):
+            mantissas[missing] = cls._decimal_mantissas(values[missing].tolist(), places)
+
+        return cls._from_mantissas(mantissas, places)
+
+    def sezimal_to_decimal(self, decimal_places: int = None) -> list[Decimal]:
+        if decimal_places is None:
+            #
+            # Each sezimal place is worth about 0.778 decimal places,
+            # more than that would show only the rounding error
+            #
+            decimal_places = min(sezimal_context.decimal_precision, self._places * 7 // 9)
+
+        decimal_places = int(decimal_places)
+
+        mantissas = _divide_mantissas(
+            _elementwise(operator.mul, self._mantissas, 10 ** decimal_places),
+            _power_of_six(self._places),
+        )
+
+        if numpy is not None and len(mantissas) and decimal_places < _INT64_DECIMAL_PLACES:
+            parts = _int64_parts(numpy.abs(mantissas), 10 ** decimal_places, 10 ** _INT64_DECIMAL_PLACES)
+
+            if parts is not None:
+                return [
+                    Decimal(digits)
+                    for digits in _decimal_int64_values(*parts, mantissas < 0, decimal_places)
+                ]
+
+        decimals = []
+
+        for mantissa in mantissas:
+            if mantissa < 0:
+                digits = '-' + str(-mantissa).rjust(decimal_places + 1, '0')
+            else:
+                digits = str(mantissa).rjust(decimal_places + 1, '0')
+
+            if decimal_places:
+                fraction = digits[-decimal_places:].rstrip('0')
+
+                if fraction:
+                    digits = digits[:-decimal_places] + '.' + fraction
+                else:
+                    digits = digits[:-decimal_places]
+
+            decimals.append(Decimal(digits))
+
+        return decimals
+
+    @property
+    def decimal(self) -> list[Decimal]:
+        return self.sezimal_to_decimal()
+
+    @property
+    def sezimal_places(self) -> SezimalInteger:
+        return SezimalInteger._from_mantissa(self._places, 0)
+
+    def __len__(self) -> int:
+        return len(self._mantissas)
+
+    def __iter__(self):
+        for mantissa in self._mantissas:
+            yield Sezimal._from_mantissa(int(mantissa), self._places)
+
+    def __getitem__(self, index: int | slice) -> Sezimal | Self:
+        if type(index) == slice:
+            return SezimalArray._from_mantissas(self._mantissas[index], self._places)
+
+        return Sezimal._from_mantissa(int(self._mantissas[index]), self._places)
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(str(number) for number in self) + ']'
+
+    def __repr__(self) -> str:
+        return f'SezimalArray({[str(number) for number in self]}, sezimal_places={self.sezimal_places})'
+
+    def tolist(self) -> list[Sezimal]:
+        return list(self)
+
+    def _operand(self, other_number: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Self) -> tuple[list[int] | int, int]:
+        if type(other_number) == SezimalArray:
+            if len(other_number) != len(self):
+                raise ValueError(f'Arrays with different sizes: {len(self)} and {len(other_number)}')
+
+            return other_number._mantissas, other_number._places
+
+        if type(other_number).__name__ in ('SezimalFraction', 'SezimalDecimalUnit'):
+            other_number = other_number.sezimal
+
+        if not isinstance(other_number, Sezimal):
+            other_number = Sezimal(other_number)
+
+        return other_number._mantissa * other_number._sign, other_number._precision
+
+    def _aligned(self, other_number: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Self) -> tuple[list[int], list[int] | int, int]:
+        other, other_places = self._operand(other_number)
+        places = max(self._places, other_places)
+
+        this = _rescale_mantissas(self._mantissas, self._places, places)
+
+        if type(other) == int:
+            other = _rescale_mantissa(other, other_places, places)
+        else:
+            other = _rescale_mantissas(other, other_places, places)
+
+        return this, other, places
+
+    def __add__(self, other_number: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Self) -> Self:
+        this, other, places = self._aligned(other_number)
+        return SezimalArray._from_mantissas(_elementwise(operator.add, this, other), places)
+
+    def __radd__(self, other_number: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Self) -> Self:
+        return self.__add__(other_number)
+
+    def __sub__(self, other_number: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Self) -> Self:
+        this, other, places = self._aligned(other_number)
+        return SezimalArray._from_mantissas(_elementwise(operator.sub, this, other), places)
+
+    def __rsub__(self, other_number: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Self) -> Self:
+        this, other, places = self._aligned(other_number)
+        return SezimalArray._from_mantissas(_elementwise(operator.sub, other, this), places)
+
+    def __mul__(self, other_number: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Self) -> Self:
+        other, other_places = self._operand(other_number)
+        places = max(self._places, other_places)
+
+        mantissas = _elementwise(operator.mul, self._mantissas, other)
+        mantissas = _rescale_mantissas(mantissas, self._places + other_places, places)
+
+        return SezimalArray._from_mantissas(mantissas, places)
+
+    def __rmul__(self, other_number: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Self) -> Self:
+        return self.__mul__(other_number)
+
+    def __truediv__(self, other_number: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Self) -> Self:
+        #
+        # this / 6 ** this_places ÷ other / 6 ** other_places,
+        # scaled to 6 ** places
+        #
+        other, other_places = self._operand(other_number)
+        places = max(self._places, other_places)
+
+        numerators = _elementwise(operator.mul, self._mantissas, _power_of_six(places + other_places - self._places))
+
+        return SezimalArray._from_mantissas(_divide_mantissas(numerators, other), places)
+
+    def __rtruediv__(self, other_number: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Self) -> Self:
+        other, other_places = self._operand(other_number)
+        places = max(self._places, other_places)
+
+        power = _power_of_six(places + self._places - other_places)
+
+        if type(other) == int:
+            numerators = _mantissa_array([other * power] * len(self))
+        else:
+            numerators = _elementwise(operator.mul, other, power)
+
+        return SezimalArray._from_mantissas(_divide_mantissas(numerators, self._mantissas), places)
+
+    def __neg__(self) -> Self:
+        return SezimalArray._from_mantissas(_elementwise(operator.mul, self._mantissas, -1), self._places)
+
+    def __pos__(self) -> Self:
+        return self
+
+    def __abs__(self) -> Self:
+        if numpy is None:
+            return SezimalArray._from_mantissas([abs(mantissa) for mantissa in self._mantissas], self._places)
+
+        return SezimalArray._from_mantissas(numpy.abs(self._mantissas), self._places)
+
+    def __round__(self, precision: str | int | SezimalInteger = 0) -> Self:
+        places = _sezimal_places(precision)
+
+        if self._places <= places:
+            return self
+
+        return SezimalArray._from_mantissas(_round_mantissas(self._mantissas, self._places - places), places)
+
+    def sezimal_format(self,
+            sezimal_places: str | int | Decimal | Sezimal | SezimalInteger = 2,
+            sezimal_separator: str = SEPARATOR_DOT,
+            group_separator: str = SEPARATOR_UNDERSCORE,
+            subgroup_separator: str = '',
+            fraction_group_separator: str = SEPARATOR_UNDERSCORE,
+            fraction_subgroup_separator: str = '',
+            sezimal_digits: bool = False,
+            sezimal_punctuation: bool = False,
+            typographical_negative: bool = False,
+            minimum_size: str | int | Decimal | Sezimal | SezimalInteger = 0,
+            prefix: str = '',
+            suffix: str = '',
+            positive_format: str = '{prefix}{value}{suffix}',
+            negative_format: str = '-{prefix}{value}{suffix}',
+            recurring_digits_notation: bool | str | int | Decimal | Sezimal | SezimalInteger = RECURRING_DIGITS_NOTATION_NONE,
+            grouping_digits: int = 3,
+        ) -> list[str]:
+        #
+        # Gives the same results as calling sezimal_format for each value
+        # (the fraction is cut, not rounded); only the less common options
+        # actually go through sezimal_format, one value at a time
+        #
+        if subgroup_separator or fraction_subgroup_separator or sezimal_punctuation \
+            or minimum_size or recurring_digits_notation:
+            return [
+                sezimal_format(
+                    str(number), sezimal_places, sezimal_separator,
+                    group_separator, subgroup_separator,
+                    fraction_group_separator, fraction_subgroup_separator,
+                    sezimal_digits, sezimal_punctuation, typographical_negative,
+                    minimum_size, prefix, suffix, positive_format, negative_format,
+                    recurring_digits_notation, grouping_digits,
+                )
+                for number in self
+            ]
+
+        if grouping_digits < 2 or grouping_digits > 4:
+            if grouping_digits == 1:
+                raise ValueError(f'Invalid grouping digits by each {grouping_digits} digit')
+            else:
+                raise ValueError(f'Invalid grouping digits by groups of {grouping_digits} digits')
+
+        if type(sezimal_places).__name__ == 'Decimal':
+            places = int(sezimal_places)
+        else:
+            places = _sezimal_places(sezimal_places)
+
+        if places < self._places:
+            divisor = _power_of_six(self._places - places)
+            factor = 1
+        else:
+            divisor = 1
+            factor = _power_of_six(places - self._places)
+
+        finish = prefix or suffix or typographical_negative \
+            or positive_format != '{prefix}{value}{suffix}' \
+            or negative_format != '-{prefix}{value}{suffix}'
+
+        if numpy is not None and len(self._mantissas) and places < _INT64_PLACES:
+            parts = _int64_parts(
+                numpy.abs(self._mantissas) * factor // divisor,
+                _power_of_six(places), _power_of_six(_INT64_PLACES),
+            )
+
+            if parts is not None:
+                formatted_numbers = _format_int64_values(
+                    *parts, self._mantissas < 0, places,
+                    sezimal_separator, group_separator,
+                    fraction_group_separator, grouping_digits,
+                )
+
+                if sezimal_digits:
+                    formatted_numbers = [default_to_sezimal_digits(formatted_number) for formatted_number in formatted_numbers]
+
+                if finish:
+                    formatted_numbers = [
+                        _finish_formatting(
+                            formatted_number, prefix, suffix,
+                            positive_format, negative_format, typographical_negative,
+                        )
+                        for formatted_number in formatted_numbers
+                    ]
+
+                return formatted_numbers
+
+        formatted_numbers = []
+
+        for mantissa in self._mantissas:
+            if mantissa < 0:
+                digits = _integer_to_sezimal_digits(-mantissa * factor // divisor)
+            else:
+                digits = _integer_to_sezimal_digits(mantissa * factor // divisor)
+
+            if places:
+                digits = digits.rjust(places + 1, '0')
+                integer = digits[:-places]
+                fraction = digits[-places:]
+            else:
+                integer = digits
+                fraction = ''
+
+            if group_separator:
+                integer = _group_integer(integer, group_separator, grouping_digits)
+
+            if fraction:
+                if fraction_group_separator:
+                    fraction = _group_fraction(fraction, fraction_group_separator, grouping_digits)
+
+                formatted_number = integer + sezimal_separator + fraction
+            else:
+                formatted_number = integer
+
+            if mantissa < 0:
+                formatted_number = '-' + formatted_number
+
+            if sezimal_digits:
+                formatted_number = default_to_sezimal_digits(formatted_number)
+
+            if finish:
+                formatted_number = _finish_formatting(
+                    formatted_number, prefix, suffix,
+                    positive_format, negative_format, typographical_negative,
+                )
+
+            formatted_numbers.append(formatted_number)
+
+        return formatted_numbers
@@ -7,14 +7,16 @@ import sys
 import os
 import colorama
 
+from concurrent.futures import ThreadPoolExecutor
 
 from ..localization import sezimal_locale, SezimalLocale
-from .file_info import SezimalFileInfo
+from ..date_time import SezimalDateTime
+from .file_info import SezimalFileInfo, _read_file_stat
 from .utils import sezimal_format, decimal_format, dozenal_format
 
 
 class SezimalDirectoryList:
-    def __init__(self, directory_list: list | tuple = None, locale: str | SezimalLocale = None):
+    def __init__(self, directory_list: str | list | tuple = None, locale: str | SezimalLocale = None, stat_threads: int = 0):
         self.locale = sezimal_locale(locale)
         self.show_hidden = False
         self.permissions_simplified = True
@@ -27,12 +29,36 @@ class SezimalDirectoryList:
         self.unit_steps = 3
         self.original_path = ''
 
-        if directory_list is None:
-            self._get_file_info(os.listdir('.'))
+        #
+        # On network file systems, each stat can take long enough
+        # for it to be worth it to read many of them at the same time
+        #
+        self.stat_threads = stat_threads
+
+        if directory_list is None or type(directory_list) == str:
+            self._get_file_info(self._scan_directory(directory_list))
         else:
-            self._get_file_info(directory_list)
+            self._get_file_info([(file_name, None) for file_name in directory_list])
+
+    def _scan_directory(self, directory: str = None) -> list[tuple[str, os.DirEntry]]:
+        #
+        # The current directory is listed with the bare file names,
+        # any other with the names joined to the directory’s
+        #
+        with os.scandir(directory or '.') as entries:
+            if directory:
+                return [(entry.path, entry) for entry in entries]
+
+            return [(entry.name, entry) for entry in entries]
 
-    def _get_file_info(self, dl: list | tuple = None):
+    def _read_file_stats(self, dl: list[tuple[str, os.DirEntry | None]]) -> list[tuple]:
+        if self.stat_threads and len(dl) > 1:
+            with ThreadPoolExecutor(max_workers=self.stat_threads) as executor:
+                return list(executor.map(_read_file_stat, *zip(*dl)))
+
+        return [_read_file_stat(file_name, dir_entry) for file_name, dir_entry in dl]
+
+    def _get_file_info(self, dl: list[tuple[str, os.DirEntry | None]] = None):
         self._directories = {}
         self._directory_order = []
         self._files = {}
@@ -41,8 +67,26 @@ class SezimalDirectoryList:
         if not dl:
             return
 
-        for file_name in dl:
-            file_info = SezimalFileInfo(file_name, locale=self.locale)
+        file_stats = self._read_file_stats(dl)
+
+        #
+        # All the modification times are converted at once,
+        # so the time zone offsets are looked up once a day
+        # instead of once a file
+        #
+        date_times = SezimalDateTime.from_timestamps(
+            stat_info.st_mtime
+            for stat_info, link_to, link_stat_info in file_stats
+            if stat_info is not None
+        )
+
+        for (file_name, dir_entry), file_stat in zip(dl, file_stats):
+            if file_stat[0] is None:
+                date_time = None
+            else:
+                date_time = next(date_times)
+
+            file_info = SezimalFileInfo(file_name, locale=self.locale, file_stat=file_stat, date_time=date_time)
 
             if file_info.is_directory:
                 self._directories[file_info.file_name] = file_info
@@ -88,56 +132,70 @@ class SezimalDirectoryList:
 
         return terminal.isatty()
 
-    def _prepare_lines(self, time_zone=None):
-        lines = []
+    def _format_date_time(self, file_info, time_zone=None) -> str:
+        if not file_info.date_time:
+            return ''
 
+        if time_zone:
+            return file_info.date_time.at_time_zone(time_zone).format(self.date_time_format, locale=self.locale)
+
+        return file_info.date_time.format(self.date_time_format, locale=self.locale)
+
+    def _listed_files(self):
         for file_info in self.directory_list + self.file_list:
             if file_info.is_hidden and not self.show_hidden:
                 continue
 
             file_info.locale = self.locale
+            yield file_info
+
+    def _prepare_line(self, file_info) -> dict:
+        #
+        # Everything in the line, but the date and time
+        #
+        info = {
+            'permission': file_info.permission,
+            'file_name': file_info.file_name.replace(self.original_path, ''),
+            'suffix': file_info.suffix,
+            'suffix_color': file_info.suffix_color,
+            'link_to': file_info.link_to,
+            'link_to_suffix': file_info.link_to_suffix,
+            'link_to_color': file_info.link_to_color,
+            'user': file_info.user,
+            'group': file_info.group,
+            'color': file_info.color,
+            'date_time': '',
+        }
+
+        if self.permissions_simplified:
+            info['permission'] = file_info.permission_simplified
+
+        if self.is_decimal:
+            if file_info.is_directory:
+                info['size'] = decimal_format(file_info.itens_in_directory, unit='it.', locale=self.locale)
+            else:
+                info['size'] = decimal_format(file_info.file_size, unit='atk', locale=self.locale, use_prefixes=self.use_prefixes, decimal_places=1)
 
-            info = {
-                'permission': file_info.permission,
-                'file_name': file_info.file_name.replace(self.original_path, ''),
-                'suffix': file_info.suffix,
-                'suffix_color': file_info.suffix_color,
-                'link_to': file_info.link_to,
-                'link_to_suffix': file_info.link_to_suffix,
-                'link_to_color': file_info.link_to_color,
-                'user': file_info.user,
-                'group': file_info.group,
-                'color': file_info.color,
-                'date_time': '',
-            }
-
-            if self.permissions_simplified:
-                info['permission'] = file_info.permission_simplified
-
-            if file_info.date_time:
-                if time_zone:
-                    info['date_time'] = file_info.date_time.at_time_zone(time_zone).format(self.date_time_format, locale=self.locale)
-                else:
-                    info['date_time'] = file_info.date_time.format(self.date_time_format, locale=self.locale)
-
-            if self.is_decimal:
-                if file_info.is_directory:
-                    info['size'] = decimal_format(file_info.itens_in_directory, unit='it.', locale=self.locale)
-                else:
-                    info['size'] = decimal_format(file_info.file_size, unit='atk', locale=self.locale, use_prefixes=self.use_prefixes, decimal_places=1)
-
-            elif self.is_dozenal:
-                if file_info.is_directory:
-                    info['size'] = dozenal_format(file_info.itens_in_directory, unit='it.', locale=self.locale)
-                else:
-                    info['size'] = dozenal_format(file_info.file_size, unit='atk', locale=self.locale, use_prefixes=self.use_prefixes, dozenal_places=1)
+        elif self.is_dozenal:
+            if file_info.is_directory:
+                info['size'] = dozenal_format(file_info.itens_in_directory, unit='it.', locale=self.locale)
+            else:
+                info['size'] = dozenal_format(file_info.file_size, unit='atk', locale=self.locale, use_prefixes=self.use_prefixes, dozenal_places=1)
 
+        else:
+            if file_info.is_directory:
+                info['size'] = sezimal_format(file_info.itens_in_directory, unit='it.', locale=self.locale, use_prefixes=False, sezimal_digits=self.use_sezimal_digits, sezimal_punctuation=self.use_sezimal_punctuation, unit_steps=1)
             else:
-                if file_info.is_directory:
-                    info['size'] = sezimal_format(file_info.itens_in_directory, unit='it.', locale=self.locale, use_prefixes=False, sezimal_digits=self.use_sezimal_digits, sezimal_punctuation=self.use_sezimal_punctuation, unit_steps=1)
-                else:
-                    info['size'] = sezimal_format(file_info.file_size, unit='atk', locale=self.locale, use_prefixes=self.use_prefixes, sezimal_places=1, sezimal_digits=self.use_sezimal_digits, sezimal_punctuation=self.use_sezimal_punctuation, unit_steps=self.unit_steps)
+                info['size'] = sezimal_format(file_info.file_size, unit='atk', locale=self.locale, use_prefixes=self.use_prefixes, sezimal_places=1, sezimal_digits=self.use_sezimal_digits, sezimal_punctuation=self.use_sezimal_punctuation, unit_steps=self.unit_steps)
+
+        return info
 
+    def _prepare_lines(self, time_zone=None):
+        lines = []
+
+        for file_info in self._listed_files():
+            info = self._prepare_line(file_info)
+            info['date_time'] = self._format_date_time(file_info, time_zone)
             lines.append(info)
 
         return lines
@@ -151,14 +209,23 @@ class SezimalDirectoryList:
         user_padding = 0
         group_padding = 0
         size_padding = 0
-        lines = self._prepare_lines()
 
-        for info in lines:
+        #
+        # Only the widths of the user, group and size columns
+        # have to be known before the first line is written;
+        # the dates and times, the slowest part to format,
+        # are formatted as each line is written
+        #
+        lines = [(file_info, self._prepare_line(file_info)) for file_info in self._listed_files()]
+
+        for file_info, info in lines:
             user_padding = max(user_padding, len(info['user']))
             group_padding = max(group_padding, len(info['group']))
             size_padding = max(size_padding, len(info['size']))
 
-        for info in lines:
+        for file_info, info in lines:
+            info['date_time'] = self._format_date_time(file_info)
+
             if use_color:
                 line = f'''{info['permission']} {info['user'].ljust(user_padding)} {info['group'].ljust(group_padding)} {info['size'].rjust(size_padding)} {info['date_time']} {info['color']}{info['file_name']}{colorama.Style.RESET_ALL}{info['suffix_color']}{info['suffix']}{colorama.Style.RESET_ALL}{info['link_to_color']}{info['link_to']}{colorama.Style.RESET_ALL}{info['link_to_suffix']}\n'''
             else:
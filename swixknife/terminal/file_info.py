@@ -6,6 +6,8 @@ __all__ = ('SezimalFileInfo',)
 import stat, os, grp, pwd, time
 import colorama
 
+from functools import lru_cache
+
 from .. import Sezimal, SezimalInteger, SezimalDateTime, sezimal_locale, SezimalLocale
 
 from decimal import Decimal
@@ -36,8 +38,62 @@ LS_COLORS = _get_ls_colors()
 del _get_ls_colors
 
 
+@lru_cache(maxsize=1_296)
+def _user_name(uid: int) -> str:
+    try:
+        return pwd.getpwuid(uid)[0]
+    except KeyError:
+        return str(uid)
+
+
+@lru_cache(maxsize=1_296)
+def _group_name(gid: int) -> str:
+    try:
+        return grp.getgrgid(gid)[0]
+    except KeyError:
+        return str(gid)
+
+
+def _sezimal_integer(number: int) -> SezimalInteger:
+    return SezimalInteger._from_mantissa(number, 0)
+
+
+def _read_file_stat(file_name: str, dir_entry: os.DirEntry = None) -> tuple[os.stat_result | None, str, os.stat_result | None]:
+    #
+    # All the file system access a file’s information needs:
+    # the file’s own stat, and, for links, where they point to,
+    # and the stat of the file they point to (None when the link is broken);
+    # the stat cached by os.scandir is used when there is one,
+    # and it’s safe to call it from many threads at once
+    #
+    try:
+        if dir_entry is None:
+            stat_info = os.lstat(file_name)
+        else:
+            stat_info = dir_entry.stat(follow_symlinks=False)
+    except OSError:
+        return None, '', None
+
+    if not stat.S_ISLNK(stat_info.st_mode):
+        return stat_info, '', None
+
+    try:
+        link_to = os.readlink(file_name)
+    except OSError:
+        link_to = ''
+
+    try:
+        link_stat_info = os.stat(file_name)
+    except OSError:
+        link_stat_info = None
+
+    return stat_info, link_to, link_stat_info
+
+
 class SezimalFileInfo:
-    def __init__(self, file_name: str, locale: SezimalLocale = None):
+    def __init__(self, file_name: str, locale: SezimalLocale = None,
+        file_stat: tuple[os.stat_result | None, str, os.stat_result | None] = None,
+        date_time: SezimalDateTime = None):
         self._permission = '-'
         self._permission_simplified = ''
         self._itens_in_directory = SezimalInteger(0)
@@ -53,7 +109,12 @@ class SezimalFileInfo:
         self._link_to_color = ''
         self.locale = sezimal_locale(locale)
 
-        self.file_name = file_name
+        #
+        # The stat and the date and time can come already read
+        # and converted, in bulk, from SezimalDirectoryList
+        #
+        self._file_name = file_name
+        self._get_file_info(file_stat, date_time)
 
     @property
     def file_name(self) -> str:
@@ -156,26 +217,24 @@ class SezimalFileInfo:
         self._permission_simplified += _convert_permission(self._permission[4:7])
         self._permission_simplified += _convert_permission(self._permission[7:10])
 
-    def _get_file_info(self):
-        try:
-            stat_info = os.lstat(self.file_name)
-        except:
-            return
+    def _get_file_info(self, file_stat: tuple[os.stat_result | None, str, os.stat_result | None] = None, date_time: SezimalDateTime = None):
+        if file_stat is None:
+            file_stat = _read_file_stat(self._file_name)
 
-        self._itens_in_directory = SezimalInteger(Decimal(stat_info.st_nlink))
+        stat_info, link_to, link_stat_info = file_stat
+
+        if stat_info is None:
+            return
 
-        try:
-            self._user = pwd.getpwuid(stat_info.st_uid)[0]
-        except KeyError:
-            self._user = str(stat_info.st_uid)
+        self._itens_in_directory = _sezimal_integer(stat_info.st_nlink)
+        self._user = _user_name(stat_info.st_uid)
+        self._group = _group_name(stat_info.st_gid)
+        self._file_size = _sezimal_integer(stat_info.st_size)
 
-        try:
-            self._group = grp.getgrgid(stat_info.st_gid)[0]
-        except KeyError:
-            self._group = str(stat_info.st_gid)
+        if date_time is None:
+            date_time = SezimalDateTime.from_timestamp(Decimal(str(stat_info.st_mtime)))
 
-        self._file_size = SezimalInteger(Decimal(str(stat_info.st_size)))
-        self._date_time = SezimalDateTime.from_timestamp(Decimal(str(stat_info.st_mtime)))
+        self._date_time = date_time
 
         #
         # Now, let’s deal with the permissions, file type and color
@@ -187,18 +246,18 @@ class SezimalFileInfo:
         elif stat.S_ISLNK(stat_info.st_mode):
             self._permission = 'l'
             self._suffix, self._color = self._get_suffix_color(stat_info)
-            self._link_to = os.readlink(self.file_name)
+            self._link_to = link_to
 
-            if not os.path.exists(self.file_name):
+            if link_stat_info is None:
                 self._color = LS_COLORS['or'] if 'or' in LS_COLORS else ''
 
             else:
-                stat_info = os.lstat(self._link_to)
-                self._itens_in_directory = SezimalInteger(Decimal(stat_info.st_nlink))
-                self._file_size = SezimalInteger(Decimal(str(stat_info.st_size)))
+                stat_info = link_stat_info
+                self._itens_in_directory = _sezimal_integer(stat_info.st_nlink)
+                self._file_size = _sezimal_integer(stat_info.st_size)
                 self._link_to_suffix, self._link_to_color = self._get_suffix_color(stat_info)
 
-                if os.path.isdir(self.file_name):
+                if stat.S_ISDIR(stat_info.st_mode):
                     self._permission = 'd'
 
         elif stat.S_ISBLK(stat_info.st_mode):
@@ -4,22 +4,40 @@ from .. import Sezimal, SezimalInteger, SezimalDateTime, \
     sezimal_exponent_to_symbol, decimal_exponent_to_symbol
 
 from decimal import Decimal
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1_296)
+def _sezimal_prefix(power: int) -> str:
+    return sezimal_exponent_to_symbol(Decimal(power))
+
+
+def _shift_sezimal_point(value: Sezimal | SezimalInteger, power: int) -> Sezimal:
+    #
+    # The same as value / 10 ** power, but only moving
+    # the sezimal point, with no division
+    #
+    if type(value).__name__ not in ('Sezimal', 'SezimalInteger'):
+        return value / Sezimal(10) ** Sezimal(Decimal(power))
+
+    return Sezimal._from_mantissa(value._sign * value._mantissa, value._precision + power)
 
 
 def sezimal_format(value: Sezimal | SezimalInteger, unit: str, locale: SezimalLocale, sezimal_places: SezimalInteger = 0, use_prefixes: bool | int = True, sezimal_digits: bool = False, sezimal_punctuation: bool = False, unit_steps: int = 3) -> str:
     sezimal_places = SezimalInteger(sezimal_places)
+    size = len(str(value))
 
     if type(use_prefixes) == int and use_prefixes > 0:
-        if len(str(value)) <= use_prefixes:
+        if size <= use_prefixes:
             power = 0
         else:
-            power = (len(str(value)) // use_prefixes) * use_prefixes
+            power = (size // use_prefixes) * use_prefixes
 
-            if len(str(value)) == power:
+            if size == power:
                 power -= use_prefixes
 
     else:
-        power = len(str(value)) - 1
+        power = size - 1
 
     if not unit_steps:
         unit_steps = 1
@@ -27,8 +45,9 @@ def sezimal_format(value: Sezimal | SezimalInteger, unit: str, locale: SezimalLo
     if (not use_prefixes) or (power < unit_steps) or (not unit):
         return locale.format_number(value, sezimal_places=0, suffix=unit, sezimal_digits=sezimal_digits)
 
-    value = value / Sezimal(10) ** Sezimal(Decimal(power // unit_steps) * unit_steps)
-    unit = sezimal_exponent_to_symbol(Decimal(power // unit_steps) * unit_steps) + unit
+    power = (power // unit_steps) * unit_steps
+    value = _shift_sezimal_point(value, power)
+    unit = _sezimal_prefix(power) + unit
     # power = Sezimal(Decimal(power)).formatted_number
     # power = power.replace('0', '⁰').replace('1', '¹').replace('2', '²')
     # power = power.replace('3', '³').replace('4', '⁴').replace('5', '⁵')
@@ -1,3 +1,3 @@
 
 
-from .spellout import sezimal_spellout
+from .spellout import sezimal_spellout, spellout_many, preload_spellout_programs
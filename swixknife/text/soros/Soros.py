@@ -9,6 +9,16 @@ def soros_run(program, data, lang):
 def soros_compile(program, lang):
     return _Soros(program, lang)
 
+def soros_load(lines):
+    "program from the lines of soros_dump(), the regexes compiled on first use"
+    program = _Soros.__new__(_Soros)
+    program.lines = [list(line) for line in lines]
+    return program
+
+def soros_dump(program):
+    "the compiled lines, with the regexes as text, ready for json or pickle"
+    return [[i[0] if type(i[0]) == str else i[0].pattern, i[1], i[2], i[3]] for i in program.lines]
+
 # conversion function
 def _tr(text, chars, chars2, delim):
     for i in range(0, len(chars)):
@@ -93,6 +103,8 @@ class _Soros:
     def _run(self, data, begin, end):
         for i in self.lines:
             if not ((begin == False and i[2]) or (end == False and i[3])):
+                if type(i[0]) == str:
+                    i[0] = re.compile(i[0])
                 m = i[0].match(data)
                 if m:
                     try:
@@ -1,3 +1,3 @@
 
 
-from .Soros import soros_run, soros_compile
+from .Soros import soros_run, soros_compile, soros_load, soros_dump
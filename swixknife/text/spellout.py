@@ -1,18 +1,102 @@
 
 
-__all__ = ('sezimal_spellout',)
+__all__ = ('sezimal_spellout', 'spellout_many', 'preload_spellout_programs')
 
 import os
+import json
+import hashlib
+import pathlib
+import tempfile
+
+from functools import lru_cache
 
 CURDIR = os.path.dirname(os.path.abspath(__file__))
 
 from ..sezimal import Sezimal, SezimalInteger, SezimalFraction
 from decimal import Decimal
-from .soros import soros_compile
+from .soros import soros_compile, soros_load, soros_dump
 
 
 SPELLOUT_PROGRAMS = {}
 
+#
+# The compiled programs are kept on disk, as JSON,
+# named after a hash of the .sor files and the language,
+# so a changed .sor file is compiled again,
+# and new processes only read the program, instead of compiling it;
+# bump the version when soros_dump changes what it writes
+#
+SPELLOUT_CACHE_VERSION = 1
+SPELLOUT_CACHE_DIRECTORY = pathlib.Path.home().joinpath('.sezimal', 'spellout')
+
+
+def _read_sor_files(lang: str) -> str:
+    try:
+        lang_file = open(f'{CURDIR}/data/{lang}.sor', 'r').read()
+        units_and_prefixes = open(f'{CURDIR}/data/{lang}_units_and_prefixes.sor', 'r').read()
+    except:
+        try:
+            lang_file = open(f'{CURDIR}/data/{lang[:2]}.sor', 'r').read()
+            units_and_prefixes = open(f'{CURDIR}/data/{lang[:2]}_units_and_prefixes.sor', 'r').read()
+        except:
+            lang_file = open(f'{CURDIR}/data/en.sor', 'r').read()
+            units_and_prefixes = open(f'{CURDIR}/data/en_units_and_prefixes.sor', 'r').read()
+
+    return lang_file.replace('### UNITS_AND_PREFIXES ###', units_and_prefixes)
+
+
+def _spellout_program(lang: str):
+    if lang in SPELLOUT_PROGRAMS:
+        return SPELLOUT_PROGRAMS[lang]
+
+    program_text = _read_sor_files(lang)
+
+    program_hash = hashlib.sha256(f'{SPELLOUT_CACHE_VERSION}|{lang}|{program_text}'.encode('utf-8')).hexdigest()[:24]
+    file_path = SPELLOUT_CACHE_DIRECTORY.joinpath(f'{lang}.{program_hash}.json')
+
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            soros_program = soros_load(json.load(file))
+
+    except (OSError, ValueError, TypeError):
+        soros_program = soros_compile(program_text, lang)
+
+        try:
+            SPELLOUT_CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
+            handle, temporary_path = tempfile.mkstemp(dir=SPELLOUT_CACHE_DIRECTORY, prefix='.', suffix='.tmp')
+
+            with os.fdopen(handle, 'w', encoding='utf-8') as file:
+                json.dump(soros_dump(soros_program), file, ensure_ascii=False)
+
+            os.chmod(temporary_path, 0o644)
+            os.replace(temporary_path, file_path)
+
+        except OSError:
+            #
+            # Not being able to keep the program
+            # only means compiling it again next time
+            #
+            pass
+
+    SPELLOUT_PROGRAMS[lang] = soros_program
+
+    return soros_program
+
+
+def preload_spellout_programs(langs: list[str] = None) -> None:
+    #
+    # Loads, or compiles, the programs ahead of the first spellout,
+    # for all the languages by default
+    #
+    if langs is None:
+        langs = [
+            file_name[:-4] for file_name in sorted(os.listdir(f'{CURDIR}/data'))
+            if file_name.endswith('.sor') and not file_name.endswith('_units_and_prefixes.sor')
+        ]
+
+    for lang in langs:
+        _spellout_program(lang.replace('-', '_'))
+
 
 def sezimal_spellout(number: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction, lang: str = 'en', sezimal_punctuation: bool = False) -> str:
     number = str(number).replace('_', '')
@@ -20,8 +104,27 @@ def sezimal_spellout(number: str | int | float | Decimal | Sezimal | SezimalInte
     if not number:
         return ''
 
+    return _sezimal_spellout(number, lang.replace('-', '_'), bool(sezimal_punctuation))
+
+
+def spellout_many(numbers: list[str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction], lang: str = 'en', sezimal_punctuation: bool = False) -> list[str]:
     lang = lang.replace('-', '_')
+    sezimal_punctuation = bool(sezimal_punctuation)
+    texts = []
+
+    for number in numbers:
+        number = str(number).replace('_', '')
 
+        if number:
+            texts.append(_sezimal_spellout(number, lang, sezimal_punctuation))
+        else:
+            texts.append('')
+
+    return texts
+
+
+@lru_cache(maxsize=7_776)
+def _sezimal_spellout(number: str, lang: str, sezimal_punctuation: bool) -> str:
     if '..' in number:
         number, recurring = number.split('..')
     elif ',,' in number:
@@ -66,21 +169,7 @@ def sezimal_spellout(number: str | int | float | Decimal | Sezimal | SezimalInte
     elif number[-1] == '󱹿':
         number = 'SH-p/Xx ' + number[0:-1]
 
-    if lang not in SPELLOUT_PROGRAMS:
-        try:
-            lang_file = open(f'{CURDIR}/data/{lang}.sor', 'r').read()
-            units_and_prefixes = open(f'{CURDIR}/data/{lang}_units_and_prefixes.sor', 'r').read()
-        except:
-            try:
-                lang_file = open(f'{CURDIR}/data/{lang[:2]}.sor', 'r').read()
-                units_and_prefixes = open(f'{CURDIR}/data/{lang[:2]}_units_and_prefixes.sor', 'r').read()
-            except:
-                lang_file = open(f'{CURDIR}/data/en.sor', 'r').read()
-                units_and_prefixes = open(f'{CURDIR}/data/en_units_and_prefixes.sor', 'r').read()
-
-        SPELLOUT_PROGRAMS[lang] = soros_compile(lang_file.replace('### UNITS_AND_PREFIXES ###', units_and_prefixes), lang)
-
-    soros_program = SPELLOUT_PROGRAMS[lang]
+    soros_program = _spellout_program(lang)
 
     if sezimal_punctuation:
         number = number.replace('.', '󱹮').replace(',', '󱹮')
@@ -93,6 +182,4 @@ def sezimal_spellout(number: str | int | float | Decimal | Sezimal | SezimalInte
         for n in recurring:
             text += ' ' + soros_program.run(n).strip()
 
-    # del SPELLOUT_PROGRAMS[lang]
-
     return text
@@ -1,6 +1,6 @@
 #
 # This file is intended to be run from the terminal;
-# it creates/overwrite the conversion_factor.py file,
+# it creates/overwrite the conversion_table.py file,
 # containing the dictionaries with the conversion factors
 # between all related units
 #
@@ -1341,11 +1341,12 @@ def calculate_conversions():
 # If you need to change anything, change it there first,
 # then re-run the script to recreate this file.
 #
+# Each conversion factor is stored as a pair of plain integers,
+# (numerator, denominator); conversion.py only turns a factor into
+# a SezimalFraction the first time it’s used
+#
 
-from ..sezimal import Sezimal, SezimalInteger, SezimalFraction
-
-
-UNIT_CONVERSION = {
+UNIT_CONVERSION_TABLE = {
 '''
 
     for unit in unit_conversion:
@@ -1354,93 +1355,32 @@ UNIT_CONVERSION = {
         for key in unit_conversion[unit]:
             value = unit_conversion[unit][key]
 
-            if type(value) == SezimalFraction:
-                text += f"        '{key}': SezimalFraction(\n            '{value.formatted_number}',\n            _precalculated_value='{value.sezimal.formatted_number}',\n            _precalculated_reciprocal='{value.reciprocal.sezimal.formatted_number}',\n        ),\n"
-            elif type(value) == Sezimal:
-                text += f"        '{key}': Sezimal('{value.formatted_number}'),\n"
-            elif type(value) == SezimalInteger:
-                value = SezimalFraction(value, 1)
-                text += f"        '{key}': SezimalFraction(\n            '{value.formatted_number}',\n            _precalculated_value='{value.sezimal.formatted_number}',\n            _precalculated_reciprocal='{value.reciprocal.sezimal.formatted_number}',\n        ),\n"
-            elif type(value) == dict:
+            if type(value) == dict:
                 text += f"        '{key}': {{\n"
 
                 for skey in value:
-                    svalue = value[skey]
-
-                    if type(svalue) == SezimalFraction:
-                        text += f"            '{skey}': SezimalFraction(\n                '{svalue.formatted_number}',\n                _precalculated_value='{svalue.sezimal.formatted_number}',\n                _precalculated_reciprocal='{svalue.reciprocal.sezimal.formatted_number}',\n            ),\n"
-                    elif type(svalue) == Sezimal:
-                        text += f"            '{skey}': Sezimal('{svalue.formatted_number}'),\n"
-                    elif type(svalue) == SezimalInteger:
-                        svalue = SezimalFraction(svalue, 1)
-                        text += f"            '{skey}': SezimalFraction(\n                '{svalue.formatted_number}',\n                _precalculated_value='{svalue.sezimal.formatted_number}',\n                _precalculated_reciprocal='{svalue.reciprocal.sezimal.formatted_number}',\n            ),\n"
-                    else:
-                        text += f"            '{skey}': {svalue}),\n"
+                    text += f"            '{skey}': {_table_value(value[skey])},\n"
 
                 text += f"        }},\n"
             else:
-                text += f"        '{key}': {value},\n"
+                text += f"        '{key}': {_table_value(value)},\n"
 
         text += '    },\n'
 
     text += '}\n'
 
-    #
-    # Now, let’s pre-calculate de prefixes conversion
-    #
-    text += '''
-#
-# Pre-calculated sezimal exponents conversion
-#
-SEZIMAL_EXPONENT_FACTOR = {
-'''
-
-    for i in SezimalRange(-130, 131):
-        if i == 0:
-            continue
-
-        if i < 0:
-            spf = SezimalFraction(1, SezimalInteger(10) ** abs(i))
-        else:
-            spf = SezimalFraction(SezimalInteger(10) ** i, 1)
-
-        line = f"""    SezimalInteger('{i}'): SezimalFraction(
-            '{spf.formatted_number}',
-            _precalculated_value='{spf.sezimal.formatted_number}',
-            _precalculated_reciprocal='{spf.reciprocal.sezimal.formatted_number}',
-        ),
-"""
-        text += line
-
-    text += '''}
-
-#
-# Pre-calculated sezimal exponents conversion
-#
-DECIMAL_EXPONENT_FACTOR = {
-'''
+    open('conversion_table.py', 'w').write(text)
 
-    for i in SezimalRange(-102, 103):
-        if i == 0:
-            continue
-
-        if i < 0:
-            dpf = SezimalFraction(1, SezimalInteger(14) ** abs(i))
-        else:
-            dpf = SezimalFraction(SezimalInteger(14) ** i, 1)
-
-        line = f"""    SezimalInteger('{i}'): SezimalFraction(
-            '{dpf.formatted_number}',
-            _precalculated_value='{dpf.sezimal.formatted_number}',
-            _precalculated_reciprocal='{dpf.reciprocal.sezimal.formatted_number}',
-        ),
-"""
-        text += line
-
-    text += '}\n'
 
+def _table_value(value):
+    if type(value) == SezimalFraction:
+        return f'({int(value.numerator)}, {int(value.denominator)})'
+    elif type(value) == SezimalInteger:
+        return f'({int(value)}, 1)'
+    elif type(value) == Sezimal:
+        return f"'{value.formatted_number}'"
 
-    open('conversion_factor.py', 'w').write(text)
+    return repr(value)
 
 
 def _set_non_prefixed_units(unit_conversion):
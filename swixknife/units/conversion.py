@@ -20,7 +20,74 @@ from ..exponents import sezimal_symbol_to_exponent, sezimal_exponent_to_symbol,
 from decimal import Decimal
 
 
-from .conversion_factor import UNIT_CONVERSION
+from .conversion_table import UNIT_CONVERSION_TABLE
+
+
+#
+# The factors in the table were calculated with
+# ultra precision 300, i.e., 1_0000 (108_dec) sezimal places
+#
+_FACTOR_PLACES = 108
+
+
+def _factor_value(numerator: int, denominator: int) -> Sezimal:
+    negative = (numerator < 0) != (denominator < 0)
+    numerator = abs(numerator)
+    denominator = abs(denominator)
+
+    mantissa, remainder = divmod(numerator * 6 ** _FACTOR_PLACES, denominator)
+    places = _FACTOR_PLACES
+
+    if remainder * 2 >= denominator:
+        mantissa += 1
+
+    elif not remainder:
+        while places and not mantissa % 6:
+            mantissa //= 6
+            places -= 1
+
+    if negative:
+        mantissa *= -1
+
+    return Sezimal._from_mantissa(mantissa, places)
+
+
+def _factor_fraction(numerator: int, denominator: int) -> SezimalFraction:
+    return SezimalFraction(
+        Sezimal._from_mantissa(numerator, 0),
+        Sezimal._from_mantissa(denominator, 0),
+        _precalculated_value=_factor_value(numerator, denominator),
+        _precalculated_reciprocal=_factor_value(denominator, numerator) if numerator else None,
+    )
+
+
+class _UnitFactors(dict):
+    #
+    # The conversion factors of one unit, as they come from
+    # the table, (numerator, denominator) pairs of integers;
+    # each one becomes a SezimalFraction only the first time
+    # it’s used, and stays that way
+    #
+    def __getitem__(self, key: str):
+        value = super().__getitem__(key)
+
+        if type(value) == tuple and value and type(value[0]) == int:
+            value = _factor_fraction(*value)
+        elif type(value) == str:
+            value = Sezimal(value)
+        elif type(value) == dict:
+            value = _UnitFactors(value)
+        else:
+            return value
+
+        self[key] = value
+        return value
+
+
+UNIT_CONVERSION = {
+    unit: _UnitFactors(factors)
+    for unit, factors in UNIT_CONVERSION_TABLE.items()
+}
 
 
 def _identify_validate_sezimal_unit(sezimal_unit: str) -> (str, str, SezimalFraction):
@@ -192,14 +259,13 @@ def _identify_validate_prefix_unit(sezimal_unit: str, decimal_unit: str):
     sp, su, spf = _identify_validate_sezimal_unit(sezimal_unit)
     dp, du, dpf, da = _identify_validate_decimal_unit(decimal_unit, su)
 
-    sezimal_context.use_ultra_precision()
-
-    if UNIT_CONVERSION[su][du] > 0:
-        factor = spf * UNIT_CONVERSION[su][du] / dpf
-    else:
-        factor = (1 / spf) * UNIT_CONVERSION[su][du] / (1 / dpf)
+    with sezimal_context.local():
+        sezimal_context.use_ultra_precision()
 
-    sezimal_context.back_to_regular_precision()
+        if UNIT_CONVERSION[su][du] > 0:
+            factor = spf * UNIT_CONVERSION[su][du] / dpf
+        else:
+            factor = (1 / spf) * UNIT_CONVERSION[su][du] / (1 / dpf)
 
     return factor, da
 
@@ -207,26 +273,22 @@ def _identify_validate_prefix_unit(sezimal_unit: str, decimal_unit: str):
 def sezimal_to_decimal_unit(measure: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction, sezimal_unit: str, decimal_unit: str, return_fraction: bool = False, simplify_fraction: bool = True, precision: str | int | Decimal | Sezimal | SezimalInteger = None) -> Sezimal | SezimalInteger | SezimalFraction:
     factor, adjust = _identify_validate_prefix_unit(sezimal_unit, decimal_unit)
 
-    sezimal_context.use_ultra_precision()
-    original_fraction_simplify = sezimal_context.fractions_simplify
-    sezimal_context.fractions_simplify = False
+    with sezimal_context.local(fractions_simplify=False):
+        sezimal_context.use_ultra_precision()
 
-    if type(measure) in (str, int, float, Decimal):
-        measure = Sezimal(measure)
+        if type(measure) in (str, int, float, Decimal):
+            measure = Sezimal(measure)
 
-    if return_fraction and type(measure) != SezimalFraction:
-        measure = SezimalFraction(*measure.as_integer_ratio())
-
-    if factor >= 0:
-        measure *= factor
-    else:
-        measure = (1 / measure) * (factor * -1)
+        if return_fraction and type(measure) != SezimalFraction:
+            measure = SezimalFraction(*measure.as_integer_ratio())
 
-    if adjust:
-        measure += adjust
+        if factor >= 0:
+            measure *= factor
+        else:
+            measure = (1 / measure) * (factor * -1)
 
-    sezimal_context.back_to_regular_precision()
-    sezimal_context.fractions_simplify = original_fraction_simplify
+        if adjust:
+            measure += adjust
 
     if not return_fraction:
         if precision is not None:
@@ -259,40 +321,37 @@ def sezimal_to_sezimal_unit(measure: str | int | float | Decimal | Sezimal | Sez
         )):
         raise ValueError(f'Invalid conversion between units [{sezimal_unit_1}] and [{sezimal_unit_2}]')
 
-    sezimal_context.use_ultra_precision()
-    original_fraction_simplify = sezimal_context.fractions_simplify
-    sezimal_context.fractions_simplify = False
-
-    if type(measure) in (str, int, float, Decimal):
-        measure = Sezimal(measure)
+    with sezimal_context.local(fractions_simplify=False):
+        sezimal_context.use_ultra_precision()
 
-    if return_fraction and type(measure) != SezimalFraction:
-        measure = SezimalFraction(*measure.as_integer_ratio())
+        if type(measure) in (str, int, float, Decimal):
+            measure = Sezimal(measure)
 
-    measure *= spf_1
+        if return_fraction and type(measure) != SezimalFraction:
+            measure = SezimalFraction(*measure.as_integer_ratio())
 
-    if su_1 == 'tap' and su_2 == 'gtk':
-        measure *= SezimalInteger('100_000')
-        measure += SezimalInteger('240_234_312')
-    elif su_1 == 'gtk' and su_2 == 'tap':
-        measure -= SezimalInteger('240_234_312')
-        measure /= SezimalInteger('100_000')
+        measure *= spf_1
 
-    if su_1 in ('xad', 'nrd', 'srd', 'ard', 'nif', 'sez', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'ang', 'bod'):
-        measure /= UNIT_CONVERSION[su_1]['ang']
+        if su_1 == 'tap' and su_2 == 'gtk':
+            measure *= SezimalInteger('100_000')
+            measure += SezimalInteger('240_234_312')
+        elif su_1 == 'gtk' and su_2 == 'tap':
+            measure -= SezimalInteger('240_234_312')
+            measure /= SezimalInteger('100_000')
 
-    if su_2 in ('xad', 'nrd', 'srd', 'ard', 'nif', 'sez', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'ang', 'bod'):
-        measure *= UNIT_CONVERSION[su_2]['ang']
+        if su_1 in ('xad', 'nrd', 'srd', 'ard', 'nif', 'sez', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'ang', 'bod'):
+            measure /= UNIT_CONVERSION[su_1]['ang']
 
-    #
-    # Reciprocal conversion
-    #
-    if (su_1 == 'clt' and su_2 == 'pbt') or (su_1 == 'pbt' and su_2 == 'clt'):
-        measure = 1 / measure
+        if su_2 in ('xad', 'nrd', 'srd', 'ard', 'nif', 'sez', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'ang', 'bod'):
+            measure *= UNIT_CONVERSION[su_2]['ang']
 
-    measure /= spf_2
+        #
+        # Reciprocal conversion
+        #
+        if (su_1 == 'clt' and su_2 == 'pbt') or (su_1 == 'pbt' and su_2 == 'clt'):
+            measure = 1 / measure
 
-    sezimal_context.back_to_regular_precision()
+        measure /= spf_2
 
     if not return_fraction:
         if precision is not None:
@@ -309,23 +368,19 @@ def sezimal_to_sezimal_unit(measure: str | int | float | Decimal | Sezimal | Sez
 def decimal_to_sezimal_unit(measure: str | int | float | Decimal | Sezimal | SezimalInteger | SezimalFraction | Dozenal | DozenalInteger | DozenalFraction, decimal_unit: str, sezimal_unit: str, return_fraction: bool = False, simplify_fraction: bool = True, precision: str | int | Decimal | Sezimal | SezimalInteger = None) -> Sezimal | SezimalInteger | SezimalFraction:
     factor, adjust = _identify_validate_prefix_unit(sezimal_unit, decimal_unit)
 
-    sezimal_context.use_ultra_precision()
-    original_fraction_simplify = sezimal_context.fractions_simplify
-    sezimal_context.fractions_simplify = False
-
-    if type(measure) in (str, int, float, Decimal):
-        measure = Sezimal(measure)
+    with sezimal_context.local(fractions_simplify=False):
+        sezimal_context.use_ultra_precision()
 
-    if return_fraction and type(measure) != SezimalFraction:
-        measure = SezimalFraction(*measure.as_integer_ratio())
+        if type(measure) in (str, int, float, Decimal):
+            measure = Sezimal(measure)
 
-    if adjust:
-        measure -= adjust
+        if return_fraction and type(measure) != SezimalFraction:
+            measure = SezimalFraction(*measure.as_integer_ratio())
 
-    measure /= factor
+        if adjust:
+            measure -= adjust
 
-    sezimal_context.back_to_regular_precision()
-    sezimal_context.fractions_simplify = original_fraction_simplify
+        measure /= factor
 
     if not return_fraction:
         if precision is not None:
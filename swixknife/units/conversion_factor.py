@@ -1,6667 +0,0 @@
-#
-# DO NOT EDIT THIS FILE DIRECTLY!
-#
-# It’s automatically generated by the script:
-#       calculate_conversion.py
-#
-# If you need to change anything, change it there first,
-# then re-run the script to recreate this file.
-#
-
-from ..sezimal import Sezimal, SezimalInteger, SezimalFraction
-
-
-UNIT_CONVERSION = {
-    'xad': {
-        's': SezimalFraction(
-            '4_125_253_440_000_000_000 / 1205',
-            _precalculated_value='3_044_212_532_304_015.443_433_511_553_015_020_311_000_423_122_511_125_452_105_141_104_313_541_402_411_510_302_325_154_011_212_204_400_254_053_524_455_513_243_304_443',
-            _precalculated_reciprocal='0.000_000_000_000_000_152_551_324_253_301_550_410_020_020_040_400_433_243_221_300_341_415_453_105_340_501_215_423_430_452_033_051_011_351_541_223',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': SezimalFraction(
-            '4023 / 105_142',
-            _precalculated_value='0.033_142_345_031_121_535_410_151_415_423_340_403_022_402_220_105_134_432_004_502_155_552_302_350_130_203_505_325_005_510_021_354_354_303_042_515',
-            _precalculated_reciprocal='14.051_242_014_153_144_045_253_230_401_544_343_351_155_301_502_031_100_042_312_251_112_545_210_514_110_431_354_140_241_151_030_232_515_401_121_221',
-        ),
-        'min': SezimalFraction(
-            '23_142_544_000_000_000 / 1205',
-            _precalculated_value='15_134_540_535_244.555_132_433_044_430_103_450_414_451_242_014_153_144_045_253_230_401_544_343_351_155_301_502_031_100_042_312_251_112_545_210_514_110_431_354_140',
-            _precalculated_reciprocal='0.000_000_000_000_031_054_434_325_150_314_305_403_203_210_504_113_543_335_430_101_051_141_115_320_522_215_132_213_120_525_512_342_042_513_020_144',
-        ),
-        'h': SezimalFraction(
-            '131_014_400_000_000 / 1205',
-            _precalculated_value='104_325_452_105.141_104_313_541_402_411_510_302_325_154_011_212_204_400_254_053_524_455_513_243_304_443_010_345_041_445_124_201_415_314_404_525_323_040_154_435',
-            _precalculated_reciprocal='0.000_000_000_005_153_354_134_450_252_531_324_532_533_523_100_433_400_333_014_152_405_001_113_325_555_043_354_321_330_544_221_131_244_303_225_400',
-        ),
-        'day': SezimalFraction(
-            '2_143_240_000_000 / 1205',
-            _precalculated_value='1_405_124_201.415_314_404_525_323_040_154_434_335_115_530_150_203_110_004_231_225_111_254_521_051_411_043_135_414_024_115_103_023_251_540_112_122_044_002_541',
-            _precalculated_reciprocal='0.000_000_000_331_423_450_311_215_354_101_514_154_233_404_030_224_022_201_051_344_320_045_021_555_523_023_501_302_035_053_250_055_100_213_543_543',
-        ),
-        'week': SezimalFraction(
-            '154_440_000_000 / 1205',
-            _precalculated_value='124_102_200.125_024_542_225_534_421_432_221_303_152_320_522_342_100_505_435_202_242_441_320_055_215_145_335_543_053_101_333_002_113_412_333_425_240_323_504',
-            _precalculated_reciprocal='0.000_000_004_050_102_353_423_413_335_121_100_141_011_444_332_504_244_212_005_231_520_535_241_555_153_302_514_322_430_030_151_050_102_353_423_414',
-        ),
-        'month': SezimalFraction(
-            '134_130_414_400_000 / 4_504_321',
-            _precalculated_value='15_555_555.420_401_204_213_355_031_314_152_055_225_023_251_311_114_132_410_301_330_132_535_124_214_212_204_015_001_111_432_323_455_235_422_054_413_013_541',
-            _precalculated_reciprocal='0.000_000_030_000_000_224_553_551_245_245_200_011_451_305_402_032_053_330_004_052_255_350_210_112_501_410_412_133_103_431_014_153_305_451_220_214',
-        ),
-        'year': SezimalFraction(
-            '4_504_320_520_000 / 4_504_321',
-            _precalculated_value='555_555.551_020_040_210_445_531_343_505_402_541_231_142_343_333_504_420_313_044_304_424_534_210_510_410_200_530_033_351_414_152_541_551_102_520_430_455',
-            _precalculated_reciprocal='0.000_001_000_000_004_535_515_425_345_344_000_233_430_152_041_041_511_000_121_445_551_404_202_254_032_212_243_102_113_020_323_510_153_424_404_314',
-        ),
-        'decade': SezimalFraction(
-            '252_504_520_000 / 4_504_321',
-            _precalculated_value='33_333.333_034_451_123_025_220_432_441_433_521_201_532_355_054_330_250_015_414_015_135_143_234_141_511_500_031_450_544_212_122_032_333_041_253_401_515',
-            _precalculated_reciprocal='0.000_014_000_000_121_234_513_252_212_144_004_201_303_053_055_110_354_002_150_015_444_511_240_524_535_420_331_434_030_325_422_343_121_234_513_252',
-        ),
-        'century': SezimalFraction(
-            '14_252_520_000 / 4_504_321',
-            _precalculated_value='2054.320_524_403_042_412_534_513_140_102_104_533_443_133_303_243_014_112_212_112_154_421_313_232_330_441_113_103_032_500_453_450_505_413_425_433_442',
-            _precalculated_reciprocal='0.000_244_000_002_142_220_434_455_414_544_111_223_051_311_343_550_324_035_020_314_000_402_253_041_233_125_525_404_505_453_202_132_142_220_434_500',
-        ),
-        'millenium': SezimalFraction(
-            '5_124_240_000 / 40_134_445',
-            _precalculated_value='114.353_405_133_525_023_143_253_154_452_341_405_440_154_315_051_301_004_234_230_455_512_315_424_243_024_530_530_150_514_514_325_252_545_435_213_214',
-            _precalculated_reciprocal='0.004_344_000_034_515_531_420_153_101_350_002_011_243_204_143_425_425_022_325_244_010_440_511_102_152_255_052_520_334_113_234_334_515_531_420_153',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'nrd': {
-        's': SezimalFraction(
-            '412_525_344_000_000_000 / 1205',
-            _precalculated_value='304_421_253_230_401.544_343_351_155_301_502_031_100_042_312_251_112_545_210_514_110_431_354_140_241_151_030_232_515_401_121_220_440_025_405_352_445_551_324_330_445',
-            _precalculated_reciprocal='0.000_000_000_000_001_525_513_242_533_015_504_100_200_200_404_004_332_432_213_003_414_154_531_053_405_012_154_234_304_520_330_510_113_515_412_233',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': SezimalFraction(
-            '20_113 / 32_351',
-            _precalculated_value='0.331_423_450_311_215_354_101_514_154_233_404_030_224_022_201_051_344_320_045_021_555_523_023_501_302_035_053_250_055_100_213_543_543_030_425_151',
-            _precalculated_reciprocal='1.405_124_201_415_314_404_525_323_040_154_434_335_115_530_150_203_110_004_231_225_111_254_521_051_411_043_135_414_024_115_103_023_251_540_112_122',
-        ),
-        'min': SezimalFraction(
-            '2_314_254_400_000_000 / 1205',
-            _precalculated_value='1_513_454_053_524.455_513_243_304_443_010_345_041_445_124_201_415_314_404_525_323_040_154_434_335_115_530_150_203_110_004_231_225_111_254_521_051_411_043_135_414',
-            _precalculated_reciprocal='0.000_000_000_000_310_544_343_251_503_143_054_032_032_105_041_135_433_354_301_010_511_411_153_205_222_151_322_131_205_255_123_420_425_130_201_434',
-        ),
-        'h': SezimalFraction(
-            '13_101_440_000_000 / 1205',
-            _precalculated_value='10_432_545_210.514_110_431_354_140_241_151_030_232_515_401_121_220_440_025_405_352_445_551_324_330_444_301_034_504_144_512_420_141_531_440_452_532_304_015_444',
-            _precalculated_reciprocal='0.000_000_000_051_533_541_344_502_525_313_245_325_335_231_004_334_003_330_141_524_050_011_133_255_550_433_543_213_305_442_211_312_443_032_253_554',
-        ),
-        'day': SezimalFraction(
-            '214_324_000_000 / 1205',
-            _precalculated_value='140_512_420.141_531_440_452_532_304_015_443_433_511_553_015_020_311_000_423_122_511_125_452_105_141_104_313_541_402_411_510_302_325_154_011_212_204_400_254',
-            _precalculated_reciprocal='0.000_000_003_314_234_503_112_153_541_015_141_542_334_040_302_240_222_010_513_443_200_450_215_555_230_235_013_020_350_532_500_551_002_135_435_431',
-        ),
-        'week': SezimalFraction(
-            '15_444_000_000 / 1205',
-            _precalculated_value='12_410_220.012_502_454_222_553_442_143_222_130_315_232_052_234_210_050_543_520_224_244_132_005_521_514_533_554_305_310_133_300_211_341_233_342_524_032_351',
-            _precalculated_reciprocal='0.000_000_040_501_023_534_234_133_351_211_001_410_114_443_325_042_442_120_052_315_205_352_415_551_533_025_143_224_300_301_510_501_023_534_234_134',
-        ),
-        'month': SezimalFraction(
-            '13_413_041_440_000 / 4_504_321',
-            _precalculated_value='1_555_555.542_040_120_421_335_503_131_415_205_522_502_325_131_111_413_241_030_133_013_253_512_421_421_220_401_500_111_143_232_345_523_542_205_441_301_354',
-            _precalculated_reciprocal='0.000_000_300_000_002_245_535_512_452_452_000_114_513_054_020_320_533_300_040_522_553_502_101_125_014_104_121_331_034_310_141_533_054_512_202_135',
-        ),
-        'year': SezimalFraction(
-            '450_432_052_000 / 4_504_321',
-            _precalculated_value='55_555.555_102_004_021_044_553_134_350_540_254_123_114_234_333_350_442_031_304_430_442_453_421_051_041_020_053_003_335_141_415_254_155_110_252_043_050',
-            _precalculated_reciprocal='0.000_010_000_000_045_355_154_253_453_440_002_334_301_520_410_415_110_001_214_455_514_042_022_540_322_122_431_021_130_203_235_101_534_244_043_143',
-        ),
-        'decade': SezimalFraction(
-            '25_250_452_000 / 4_504_321',
-            _precalculated_value='3333.333_303_445_112_302_522_043_244_143_352_120_153_235_505_433_025_001_541_401_513_514_323_414_151_150_003_145_054_421_212_203_233_304_125_340_152',
-            _precalculated_reciprocal='0.000_140_000_001_212_345_132_522_121_440_042_013_030_530_551_103_540_021_500_154_445_112_405_245_354_203_314_340_303_254_223_431_212_345_132_522',
-        ),
-        'century': SezimalFraction(
-            '1_425_252_000 / 4_504_321',
-            _precalculated_value='205.432_052_440_304_241_253_451_314_010_210_453_344_313_330_324_301_411_221_211_215_442_131_323_233_044_111_310_303_250_045_345_050_541_342_543_344',
-            _precalculated_reciprocal='0.002_440_000_021_422_204_344_554_145_441_112_230_513_113_435_503_240_350_203_140_004_022_530_412_331_255_254_045_054_532_021_321_422_204_344_554',
-        ),
-        'millenium': SezimalFraction(
-            '512_424_000 / 40_134_445',
-            _precalculated_value='11.435_340_513_352_502_314_325_315_445_234_140_544_015_431_505_130_100_423_423_045_551_231_542_424_302_453_053_015_051_451_432_525_254_543_521_322',
-            _precalculated_reciprocal='0.043_440_000_345_155_314_201_531_013_500_020_112_432_041_434_254_250_223_252_440_104_405_111_021_522_550_525_203_341_132_343_345_155_314_201_531',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'srd': {
-        's': SezimalFraction(
-            '41_252_534_400_000_000 / 1205',
-            _precalculated_value='30_442_125_323_040.154_434_335_115_530_150_203_110_004_231_225_111_254_521_051_411_043_135_414_024_115_103_023_251_540_112_122_044_002_540_535_244_555_132_433_045',
-            _precalculated_reciprocal='0.000_000_000_000_015_255_132_425_330_155_041_002_002_004_040_043_324_322_130_034_141_545_310_534_050_121_542_343_045_203_305_101_135_154_122_325',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': SezimalFraction(
-            '201_130 / 32_351',
-            _precalculated_value='3.314_234_503_112_153_541_015_141_542_334_040_302_240_222_010_513_443_200_450_215_555_230_235_013_020_350_532_500_551_002_135_435_430_304_251_505',
-            _precalculated_reciprocal='0.140_512_420_141_531_440_452_532_304_015_443_433_511_553_015_020_311_000_423_122_511_125_452_105_141_104_313_541_402_411_510_302_325_154_011_212',
-        ),
-        'min': SezimalFraction(
-            '231_425_440_000_000 / 1205',
-            _precalculated_value='151_345_405_352.445_551_324_330_444_301_034_504_144_512_420_141_531_440_452_532_304_015_443_433_511_553_015_020_311_000_423_122_511_125_452_105_141_104_313_542',
-            _precalculated_reciprocal='0.000_000_000_003_105_443_432_515_031_430_540_320_321_050_411_354_333_543_010_105_114_111_532_052_221_513_221_312_052_551_234_204_251_302_014_333',
-        ),
-        'h': SezimalFraction(
-            '1_310_144_000_000 / 1205',
-            _precalculated_value='1_043_254_521.051_411_043_135_414_024_115_103_023_251_540_112_122_044_002_540_535_244_555_132_433_044_430_103_450_414_451_242_014_153_144_045_253_230_401_545',
-            _precalculated_reciprocal='0.000_000_000_515_335_413_445_025_253_132_453_253_352_310_043_340_033_301_415_240_500_111_332_555_504_335_432_133_054_422_113_124_430_322_535_535',
-        ),
-        'day': SezimalFraction(
-            '21_432_400_000 / 1205',
-            _precalculated_value='14_051_242.014_153_144_045_253_230_401_544_343_351_155_301_502_031_100_042_312_251_112_545_210_514_110_431_354_140_241_151_030_232_515_401_121_220_440_030',
-            _precalculated_reciprocal='0.000_000_033_142_345_031_121_535_410_151_415_423_340_403_022_402_220_105_134_432_004_502_155_552_302_350_130_203_505_325_005_510_021_354_354_303',
-        ),
-        'week': SezimalFraction(
-            '1_544_400_000 / 1205',
-            _precalculated_value='1_241_022.001_250_245_422_255_344_214_322_213_031_523_205_223_421_005_054_352_022_424_413_200_552_151_453_355_430_531_013_330_021_134_123_334_252_403_235',
-            _precalculated_reciprocal='0.000_000_405_010_235_342_341_333_512_110_014_101_144_433_250_424_421_200_523_152_053_524_155_515_330_251_432_243_003_015_105_010_235_342_341_334',
-        ),
-        'month': SezimalFraction(
-            '1_341_304_144_000 / 4_504_321',
-            _precalculated_value='155_555.554_204_012_042_133_550_313_141_520_552_250_232_513_111_141_324_103_013_301_325_351_242_142_122_040_150_011_114_323_234_552_354_220_544_130_140',
-            _precalculated_reciprocal='0.000_003_000_000_022_455_355_124_524_520_001_145_130_540_203_205_333_000_405_225_535_021_011_250_141_041_213_310_343_101_415_330_545_122_021_351',
-        ),
-        'year': SezimalFraction(
-            '45_043_205_200 / 4_504_321',
-            _precalculated_value='5555.555_510_200_402_104_455_313_435_054_025_412_311_423_433_335_044_203_130_443_044_245_342_105_104_102_005_300_333_514_141_525_415_511_025_204_305',
-            _precalculated_reciprocal='0.000_100_000_000_453_551_542_534_534_400_023_343_015_204_104_151_100_012_144_555_140_420_225_403_221_224_310_211_302_032_351_015_342_440_431_424',
-        ),
-        'decade': SezimalFraction(
-            '2_525_045_200 / 4_504_321',
-            _precalculated_value='333.333_330_344_511_230_252_204_324_414_335_212_015_323_550_543_302_500_154_140_151_351_432_341_415_115_000_314_505_442_121_220_323_330_412_534_015',
-            _precalculated_reciprocal='0.001_400_000_012_123_451_325_221_214_400_420_130_305_305_511_035_400_215_001_544_451_124_052_453_542_033_143_403_032_542_234_312_123_451_325_221',
-        ),
-        'century': SezimalFraction(
-            '142_525_200 / 4_504_321',
-            _precalculated_value='20.543_205_244_030_424_125_345_131_401_021_045_334_431_333_032_430_141_122_121_121_544_213_132_323_304_411_131_030_325_004_534_505_054_134_254_335',
-            _precalculated_reciprocal='0.024_400_000_214_222_043_445_541_454_411_122_305_131_134_355_032_403_502_031_400_040_225_304_123_312_552_540_450_545_320_213_214_222_043_445_542',
-        ),
-        'millenium': SezimalFraction(
-            '51_242_400 / 40_134_445',
-            _precalculated_value='1.143_534_051_335_250_231_432_531_544_523_414_054_401_543_150_513_010_042_342_304_555_123_154_242_430_245_305_301_505_145_143_252_525_454_352_132',
-            _precalculated_reciprocal='0.434_400_003_451_553_142_015_310_135_000_201_124_320_414_342_542_502_232_524_401_044_051_110_215_225_505_252_033_411_323_433_451_553_142_015_310',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'ard': {
-        's': SezimalFraction(
-            '4_125_253_440_000_000 / 1205',
-            _precalculated_value='3_044_212_532_304.015_443_433_511_553_015_020_311_000_423_122_511_125_452_105_141_104_313_541_402_411_510_302_325_154_011_212_204_400_254_053_524_455_513_243_305',
-            _precalculated_reciprocal='0.000_000_000_000_152_551_324_253_301_550_410_020_020_040_400_433_243_221_300_341_415_453_105_340_501_215_423_430_452_033_051_011_351_541_223_243',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': SezimalFraction(
-            '2_011_300 / 32_351',
-            _precalculated_value='33.142_345_031_121_535_410_151_415_423_340_403_022_402_220_105_134_432_004_502_155_552_302_350_130_203_505_325_005_510_021_354_354_303_042_515_052',
-            _precalculated_reciprocal='0.014_051_242_014_153_144_045_253_230_401_544_343_351_155_301_502_031_100_042_312_251_112_545_210_514_110_431_354_140_241_151_030_232_515_401_121',
-        ),
-        'min': SezimalFraction(
-            '23_142_544_000_000 / 1205',
-            _precalculated_value='15_134_540_535.244_555_132_433_044_430_103_450_414_451_242_014_153_144_045_253_230_401_544_343_351_155_301_502_031_100_042_312_251_112_545_210_514_110_431_354',
-            _precalculated_reciprocal='0.000_000_000_031_054_434_325_150_314_305_403_203_210_504_113_543_335_430_101_051_141_115_320_522_215_132_213_120_525_512_342_042_513_020_143_332',
-        ),
-        'h': SezimalFraction(
-            '131_014_400_000 / 1205',
-            _precalculated_value='104_325_452.105_141_104_313_541_402_411_510_302_325_154_011_212_204_400_254_053_524_455_513_243_304_443_010_345_041_445_124_201_415_314_404_525_323_040_155',
-            _precalculated_reciprocal='0.000_000_005_153_354_134_450_252_531_324_532_533_523_100_433_400_333_014_152_405_001_113_325_555_043_354_321_330_544_221_131_244_303_225_355_344',
-        ),
-        'day': SezimalFraction(
-            '2_143_240_000 / 1205',
-            _precalculated_value='1_405_124.201_415_314_404_525_323_040_154_434_335_115_530_150_203_110_004_231_225_111_254_521_051_411_043_135_414_024_115_103_023_251_540_112_122_044_003',
-            _precalculated_reciprocal='0.000_000_331_423_450_311_215_354_101_514_154_233_404_030_224_022_201_051_344_320_045_021_555_523_023_501_302_035_053_250_055_100_213_543_543_031',
-        ),
-        'week': SezimalFraction(
-            '154_440_000 / 1205',
-            _precalculated_value='124_102.200_125_024_542_225_534_421_432_221_303_152_320_522_342_100_505_435_202_242_441_320_055_215_145_335_543_053_101_333_002_113_412_333_425_240_324',
-            _precalculated_reciprocal='0.000_004_050_102_353_423_413_335_121_100_141_011_444_332_504_244_212_005_231_520_535_241_555_153_302_514_322_430_030_151_050_102_353_423_413_335',
-        ),
-        'month': SezimalFraction(
-            '134_130_414_400 / 4_504_321',
-            _precalculated_value='15_555.555_420_401_204_213_355_031_314_152_055_225_023_251_311_114_132_410_301_330_132_535_124_214_212_204_015_001_111_432_323_455_235_422_054_413_014',
-            _precalculated_reciprocal='0.000_030_000_000_224_553_551_245_245_200_011_451_305_402_032_053_330_004_052_255_350_210_112_501_410_412_133_103_431_014_153_305_451_220_213_512',
-        ),
-        'year': SezimalFraction(
-            '4_504_320_520 / 4_504_321',
-            _precalculated_value='555.555_551_020_040_210_445_531_343_505_402_541_231_142_343_333_504_420_313_044_304_424_534_210_510_410_200_530_033_351_414_152_541_551_102_520_431',
-            _precalculated_reciprocal='0.001_000_000_004_535_515_425_345_344_000_233_430_152_041_041_511_000_121_445_551_404_202_254_032_212_243_102_113_020_323_510_153_424_404_314_234',
-        ),
-        'decade': SezimalFraction(
-            '252_504_520 / 4_504_321',
-            _precalculated_value='33.333_333_034_451_123_025_220_432_441_433_521_201_532_355_054_330_250_015_414_015_135_143_234_141_511_500_031_450_544_212_122_032_333_041_253_402',
-            _precalculated_reciprocal='0.014_000_000_121_234_513_252_212_144_004_201_303_053_055_110_354_002_150_015_444_511_240_524_535_420_331_434_030_325_422_343_121_234_513_252_212',
-        ),
-        'century': SezimalFraction(
-            '14_252_520 / 4_504_321',
-            _precalculated_value='2.054_320_524_403_042_412_534_513_140_102_104_533_443_133_303_243_014_112_212_112_154_421_313_232_330_441_113_103_032_500_453_450_505_413_425_434',
-            _precalculated_reciprocal='0.244_000_002_142_220_434_455_414_544_111_223_051_311_343_550_324_035_020_314_000_402_253_041_233_125_525_404_505_453_202_132_142_220_434_455_415',
-        ),
-        'millenium': SezimalFraction(
-            '5_124_240 / 40_134_445',
-            _precalculated_value='0.114_353_405_133_525_023_143_253_154_452_341_405_440_154_315_051_301_004_234_230_455_512_315_424_243_024_530_530_150_514_514_325_252_545_435_213',
-            _precalculated_reciprocal='4.344_000_034_515_531_420_153_101_350_002_011_243_204_143_425_425_022_325_244_010_440_511_102_152_255_052_520_334_113_234_334_515_531_420_153_102',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'nif': {
-        's': SezimalFraction(
-            '412_525_344_000_000 / 1205',
-            _precalculated_value='304_421_253_230.401_544_343_351_155_301_502_031_100_042_312_251_112_545_210_514_110_431_354_140_241_151_030_232_515_401_121_220_440_025_405_352_445_551_324_331',
-            _precalculated_reciprocal='0.000_000_000_001_525_513_242_533_015_504_100_200_200_404_004_332_432_213_003_414_154_531_053_405_012_154_234_304_520_330_510_113_515_412_232_432',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': SezimalFraction(
-            '20_113_000 / 32_351',
-            _precalculated_value='331.423_450_311_215_354_101_514_154_233_404_030_224_022_201_051_344_320_045_021_555_523_023_501_302_035_053_250_055_100_213_543_543_030_425_150_522',
-            _precalculated_reciprocal='0.001_405_124_201_415_314_404_525_323_040_154_434_335_115_530_150_203_110_004_231_225_111_254_521_051_411_043_135_414_024_115_103_023_251_540_112',
-        ),
-        'min': SezimalFraction(
-            '2_314_254_400_000 / 1205',
-            _precalculated_value='1_513_454_053.524_455_513_243_304_443_010_345_041_445_124_201_415_314_404_525_323_040_154_434_335_115_530_150_203_110_004_231_225_111_254_521_051_411_043_140',
-            _precalculated_reciprocal='0.000_000_000_310_544_343_251_503_143_054_032_032_105_041_135_433_354_301_010_511_411_153_205_222_151_322_131_205_255_123_420_425_130_201_433_322',
-        ),
-        'h': SezimalFraction(
-            '13_101_440_000 / 1205',
-            _precalculated_value='10_432_545.210_514_110_431_354_140_241_151_030_232_515_401_121_220_440_025_405_352_445_551_324_330_444_301_034_504_144_512_420_141_531_440_452_532_304_020',
-            _precalculated_reciprocal='0.000_000_051_533_541_344_502_525_313_245_325_335_231_004_334_003_330_141_524_050_011_133_255_550_433_543_213_305_442_211_312_443_032_253_553_435',
-        ),
-        'day': SezimalFraction(
-            '214_324_000 / 1205',
-            _precalculated_value='140_512.420_141_531_440_452_532_304_015_443_433_511_553_015_020_311_000_423_122_511_125_452_105_141_104_313_541_402_411_510_302_325_154_011_212_204_400',
-            _precalculated_reciprocal='0.000_003_314_234_503_112_153_541_015_141_542_334_040_302_240_222_010_513_443_200_450_215_555_230_235_013_020_350_532_500_551_002_135_435_430_304',
-        ),
-        'week': SezimalFraction(
-            '15_444_000 / 1205',
-            _precalculated_value='12_410.220_012_502_454_222_553_442_143_222_130_315_232_052_234_210_050_543_520_224_244_132_005_521_514_533_554_305_310_133_300_211_341_233_342_524_033',
-            _precalculated_reciprocal='0.000_040_501_023_534_234_133_351_211_001_410_114_443_325_042_442_120_052_315_205_352_415_551_533_025_143_224_300_301_510_501_023_534_234_133_351',
-        ),
-        'month': SezimalFraction(
-            '13_413_041_440 / 4_504_321',
-            _precalculated_value='1555.555_542_040_120_421_335_503_131_415_205_522_502_325_131_111_413_241_030_133_013_253_512_421_421_220_401_500_111_143_232_345_523_542_205_441_302',
-            _precalculated_reciprocal='0.000_300_000_002_245_535_512_452_452_000_114_513_054_020_320_533_300_040_522_553_502_101_125_014_104_121_331_034_310_141_533_054_512_202_135_115',
-        ),
-        'year': SezimalFraction(
-            '450_432_052 / 4_504_321',
-            _precalculated_value='55.555_555_102_004_021_044_553_134_350_540_254_123_114_234_333_350_442_031_304_430_442_453_421_051_041_020_053_003_335_141_415_254_155_110_252_043',
-            _precalculated_reciprocal='0.010_000_000_045_355_154_253_453_440_002_334_301_520_410_415_110_001_214_455_514_042_022_540_322_122_431_021_130_203_235_101_534_244_043_142_343',
-        ),
-        'decade': SezimalFraction(
-            '25_250_452 / 4_504_321',
-            _precalculated_value='3.333_333_303_445_112_302_522_043_244_143_352_120_153_235_505_433_025_001_541_401_513_514_323_414_151_150_003_145_054_421_212_203_233_304_125_340',
-            _precalculated_reciprocal='0.140_000_001_212_345_132_522_121_440_042_013_030_530_551_103_540_021_500_154_445_112_405_245_354_203_314_340_303_254_223_431_212_345_132_522_122',
-        ),
-        'century': SezimalFraction(
-            '1_425_252 / 4_504_321',
-            _precalculated_value='0.205_432_052_440_304_241_253_451_314_010_210_453_344_313_330_324_301_411_221_211_215_442_131_323_233_044_111_310_303_250_045_345_050_541_342_544',
-            _precalculated_reciprocal='2.440_000_021_422_204_344_554_145_441_112_230_513_113_435_503_240_350_203_140_004_022_530_412_331_255_254_045_054_532_021_321_422_204_344_554_150',
-        ),
-        'millenium': SezimalFraction(
-            '512_424 / 40_134_445',
-            _precalculated_value='0.011_435_340_513_352_502_314_325_315_445_234_140_544_015_431_505_130_100_423_423_045_551_231_542_424_302_453_053_015_051_451_432_525_254_543_522',
-            _precalculated_reciprocal='43.440_000_345_155_314_201_531_013_500_020_112_432_041_434_254_250_223_252_440_104_405_111_021_522_550_525_203_341_132_343_345_155_314_201_531_014',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'sez': {
-        's': SezimalFraction(
-            '41_252_534_400_000 / 1205',
-            _precalculated_value='30_442_125_323.040_154_434_335_115_530_150_203_110_004_231_225_111_254_521_051_411_043_135_414_024_115_103_023_251_540_112_122_044_002_540_535_244_555_132_433',
-            _precalculated_reciprocal='0.000_000_000_015_255_132_425_330_155_041_002_002_004_040_043_324_322_130_034_141_545_310_534_050_121_542_343_045_203_305_101_135_154_122_324_320',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': SezimalFraction(
-            '201_130_000 / 32_351',
-            _precalculated_value='3314.234_503_112_153_541_015_141_542_334_040_302_240_222_010_513_443_200_450_215_555_230_235_013_020_350_532_500_551_002_135_435_430_304_251_505_215',
-            _precalculated_reciprocal='0.000_140_512_420_141_531_440_452_532_304_015_443_433_511_553_015_020_311_000_423_122_511_125_452_105_141_104_313_541_402_411_510_302_325_154_011',
-        ),
-        'min': SezimalFraction(
-            '231_425_440_000 / 1205',
-            _precalculated_value='151_345_405.352_445_551_324_330_444_301_034_504_144_512_420_141_531_440_452_532_304_015_443_433_511_553_015_020_311_000_423_122_511_125_452_105_141_104_314',
-            _precalculated_reciprocal='0.000_000_003_105_443_432_515_031_430_540_320_321_050_411_354_333_543_010_105_114_111_532_052_221_513_221_312_052_551_234_204_251_302_014_333_213',
-        ),
-        'h': SezimalFraction(
-            '1_310_144_000 / 1205',
-            _precalculated_value='1_043_254.521_051_411_043_135_414_024_115_103_023_251_540_112_122_044_002_540_535_244_555_132_433_044_430_103_450_414_451_242_014_153_144_045_253_230_402',
-            _precalculated_reciprocal='0.000_000_515_335_413_445_025_253_132_453_253_352_310_043_340_033_301_415_240_500_111_332_555_504_335_432_133_054_422_113_124_430_322_535_534_344',
-        ),
-        'day': SezimalFraction(
-            '21_432_400 / 1205',
-            _precalculated_value='14_051.242_014_153_144_045_253_230_401_544_343_351_155_301_502_031_100_042_312_251_112_545_210_514_110_431_354_140_241_151_030_232_515_401_121_220_440',
-            _precalculated_reciprocal='0.000_033_142_345_031_121_535_410_151_415_423_340_403_022_402_220_105_134_432_004_502_155_552_302_350_130_203_505_325_005_510_021_354_354_303_043',
-        ),
-        'week': SezimalFraction(
-            '1_544_400 / 1205',
-            _precalculated_value='1241.022_001_250_245_422_255_344_214_322_213_031_523_205_223_421_005_054_352_022_424_413_200_552_151_453_355_430_531_013_330_021_134_123_334_252_403',
-            _precalculated_reciprocal='0.000_405_010_235_342_341_333_512_110_014_101_144_433_250_424_421_200_523_152_053_524_155_515_330_251_432_243_003_015_105_010_235_342_341_333_512',
-        ),
-        'month': SezimalFraction(
-            '1_341_304_144 / 4_504_321',
-            _precalculated_value='155.555_554_204_012_042_133_550_313_141_520_552_250_232_513_111_141_324_103_013_301_325_351_242_142_122_040_150_011_114_323_234_552_354_220_544_130',
-            _precalculated_reciprocal='0.003_000_000_022_455_355_124_524_520_001_145_130_540_203_205_333_000_405_225_535_021_011_250_141_041_213_310_343_101_415_330_545_122_021_351_151',
-        ),
-        'year': SezimalFraction(
-            '223_214_024 / 22_321_403',
-            _precalculated_value='5.555_555_510_200_402_104_455_313_435_054_025_412_311_423_433_335_044_203_130_443_044_245_342_105_104_102_005_300_333_514_141_525_415_511_025_205',
-            _precalculated_reciprocal='0.100_000_000_453_551_542_534_534_400_023_343_015_204_104_151_100_012_144_555_140_420_225_403_221_224_310_211_302_032_351_015_342_440_431_423_423',
-        ),
-        'decade': SezimalFraction(
-            '12_423_224 / 22_321_403',
-            _precalculated_value='0.333_333_330_344_511_230_252_204_324_414_335_212_015_323_550_543_302_500_154_140_151_351_432_341_415_115_000_314_505_442_121_220_323_330_412_534',
-            _precalculated_reciprocal='1.400_000_012_123_451_325_221_214_400_420_130_305_305_511_035_400_215_001_544_451_124_052_453_542_033_143_403_032_542_234_312_123_451_325_221_215',
-        ),
-        'century': SezimalFraction(
-            '512_424 / 22_321_403',
-            _precalculated_value='0.020_543_205_244_030_424_125_345_131_401_021_045_334_431_333_032_430_141_122_121_121_544_213_132_323_304_411_131_030_325_004_534_505_054_134_255',
-            _precalculated_reciprocal='24.400_000_214_222_043_445_541_454_411_122_305_131_134_355_032_403_502_031_400_040_225_304_123_312_552_540_450_545_320_213_214_222_043_445_541_455',
-        ),
-        'millenium': SezimalFraction(
-            '234_212 / 200_452_223',
-            _precalculated_value='0.001_143_534_051_335_250_231_432_531_544_523_414_054_401_543_150_513_010_042_342_304_555_123_154_242_430_245_305_301_505_145_143_252_525_454_352',
-            _precalculated_reciprocal='434.400_003_451_553_142_015_310_135_000_201_124_320_414_342_542_502_232_524_401_044_051_110_215_225_505_252_033_411_323_433_451_553_142_015_310_135',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'vrx': {
-        's': SezimalFraction(
-            '4_125_253_440_000 / 1205',
-            _precalculated_value='3_044_212_532.304_015_443_433_511_553_015_020_311_000_423_122_511_125_452_105_141_104_313_541_402_411_510_302_325_154_011_212_204_400_254_053_524_455_513_244',
-            _precalculated_reciprocal='0.000_000_000_152_551_324_253_301_550_410_020_020_040_400_433_243_221_300_341_415_453_105_340_501_215_423_430_452_033_051_011_351_541_223_243_201',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': SezimalFraction(
-            '2_011_300_000 / 32_351',
-            _precalculated_value='33_142.345_031_121_535_410_151_415_423_340_403_022_402_220_105_134_432_004_502_155_552_302_350_130_203_505_325_005_510_021_354_354_303_042_515_052_151',
-            _precalculated_reciprocal='0.000_014_051_242_014_153_144_045_253_230_401_544_343_351_155_301_502_031_100_042_312_251_112_545_210_514_110_431_354_140_241_151_030_232_515_401',
-        ),
-        'min': SezimalFraction(
-            '23_142_544_000 / 1205',
-            _precalculated_value='15_134_540.535_244_555_132_433_044_430_103_450_414_451_242_014_153_144_045_253_230_401_544_343_351_155_301_502_031_100_042_312_251_112_545_210_514_110_432',
-            _precalculated_reciprocal='0.000_000_031_054_434_325_150_314_305_403_203_210_504_113_543_335_430_101_051_141_115_320_522_215_132_213_120_525_512_342_042_513_020_143_332_133',
-        ),
-        'h': SezimalFraction(
-            '131_014_400 / 1205',
-            _precalculated_value='104_325.452_105_141_104_313_541_402_411_510_302_325_154_011_212_204_400_254_053_524_455_513_243_304_443_010_345_041_445_124_201_415_314_404_525_323_040',
-            _precalculated_reciprocal='0.000_005_153_354_134_450_252_531_324_532_533_523_100_433_400_333_014_152_405_001_113_325_555_043_354_321_330_544_221_131_244_303_225_355_343_441',
-        ),
-        'day': SezimalFraction(
-            '2_143_240 / 1205',
-            _precalculated_value='1405.124_201_415_314_404_525_323_040_154_434_335_115_530_150_203_110_004_231_225_111_254_521_051_411_043_135_414_024_115_103_023_251_540_112_122_044',
-            _precalculated_reciprocal='0.000_331_423_450_311_215_354_101_514_154_233_404_030_224_022_201_051_344_320_045_021_555_523_023_501_302_035_053_250_055_100_213_543_543_030_425',
-        ),
-        'week': SezimalFraction(
-            '154_440 / 1205',
-            _precalculated_value='124.102_200_125_024_542_225_534_421_432_221_303_152_320_522_342_100_505_435_202_242_441_320_055_215_145_335_543_053_101_333_002_113_412_333_425_241',
-            _precalculated_reciprocal='0.004_050_102_353_423_413_335_121_100_141_011_444_332_504_244_212_005_231_520_535_241_555_153_302_514_322_430_030_151_050_102_353_423_413_335_121',
-        ),
-        'month': SezimalFraction(
-            '450_432_052 / 22_321_403',
-            _precalculated_value='15.555_555_420_401_204_213_355_031_314_152_055_225_023_251_311_114_132_410_301_330_132_535_124_214_212_204_015_001_111_432_323_455_235_422_054_413',
-            _precalculated_reciprocal='0.030_000_000_224_553_551_245_245_200_011_451_305_402_032_053_330_004_052_255_350_210_112_501_410_412_133_103_431_014_153_305_451_220_213_511_512',
-        ),
-        'year': SezimalFraction(
-            '111_405_012 / 111_405_013',
-            _precalculated_value='0.555_555_551_020_040_210_445_531_343_505_402_541_231_142_343_333_504_420_313_044_304_424_534_210_510_410_200_530_033_351_414_152_541_551_102_521',
-            _precalculated_reciprocal='1.000_000_004_535_515_425_345_344_000_233_430_152_041_041_511_000_121_445_551_404_202_254_032_212_243_102_113_020_323_510_153_424_404_314_234_233',
-        ),
-        'decade': SezimalFraction(
-            '4_211_412 / 111_405_013',
-            _precalculated_value='0.033_333_333_034_451_123_025_220_432_441_433_521_201_532_355_054_330_250_015_414_015_135_143_234_141_511_500_031_450_544_212_122_032_333_041_254',
-            _precalculated_reciprocal='14.000_000_121_234_513_252_212_144_004_201_303_053_055_110_354_002_150_015_444_511_240_524_535_420_331_434_030_325_422_343_121_234_513_252_212_144',
-        ),
-        'century': SezimalFraction(
-            '234_212 / 111_405_013',
-            _precalculated_value='0.002_054_320_524_403_042_412_534_513_140_102_104_533_443_133_303_243_014_112_212_112_154_421_313_232_330_441_113_103_032_500_453_450_505_413_430',
-            _precalculated_reciprocal='244.000_002_142_220_434_455_414_544_111_223_051_311_343_550_324_035_020_314_000_402_253_041_233_125_525_404_505_453_202_132_142_220_434_455_414_544',
-        ),
-        'millenium': SezimalFraction(
-            '115_104 / 1_002_241_113',
-            _precalculated_value='0.000_114_353_405_133_525_023_143_253_154_452_341_405_440_154_315_051_301_004_234_230_455_512_315_424_243_024_530_530_150_514_514_325_252_545_435',
-            _precalculated_reciprocal='4344.000_034_515_531_420_153_101_350_002_011_243_204_143_425_425_022_325_244_010_440_511_102_152_255_052_520_334_113_234_334_515_531_420_153_101_350',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'mas': {
-        's': SezimalFraction(
-            '204_242_452_000 / 1205',
-            _precalculated_value='132_210_424.413_200_552_151_453_355_430_531_013_330_021_134_123_334_252_403_235_033_213_455_050_120_353_313_114_235_500_340_410_220_012_502_454_222_553_442',
-            _precalculated_reciprocal='0.000_000_003_455_430_525_510_035_412_200_400_401_212_013_105_304_430_011_232_353_502_151_214_024_352_513_013_441_101_420_231_435_224_505_304_015',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': SezimalFraction(
-            '40_230_000_000 / 32_351',
-            _precalculated_value='1_103_251.341_022_435_152_203_432_352_511_212_100_452_044_402_143_133_040_134_043_555_450_051_403_004_114_150_540_154_200_431_531_530_101_254_341_443_421',
-            _precalculated_reciprocal='0.000_000_502_342_100_505_435_202_242_441_320_055_215_145_335_543_053_101_333_002_113_412_333_425_240_323_503_321_345_505_012_035_331_311_423_550',
-        ),
-        'min': SezimalFraction(
-            '1_135_125_200 / 1205',
-            _precalculated_value='534_525.024_542_225_534_421_432_221_303_152_320_522_342_100_505_435_202_242_441_320_055_215_145_335_543_053_101_333_002_113_412_333_425_240_323_503_322',
-            _precalculated_reciprocal='0.000_001_021_533_130_543_410_330_152_104_104_214_122_315_311_153_002_021_423_222_350_414_444_343_044_302_414_554_251_241_254_300_403_311_043_054',
-        ),
-        'h': SezimalFraction(
-            '4_330_520 / 1205',
-            _precalculated_value='3214.252_403_235_033_213_455_050_120_353_313_114_235_500_340_410_220_012_502_454_222_553_442_143_222_130_315_232_052_234_210_050_543_520_224_244_132',
-            _precalculated_reciprocal='0.000_143_511_523_133_405_455_030_535_055_114_502_013_112_011_100_323_452_140_022_310_555_541_311_530_431_015_324_423_025_330_104_551_551_313_213',
-        ),
-        'day': SezimalFraction(
-            '105_142 / 1205',
-            _precalculated_value='50.234_210_050_543_520_224_244_132_005_521_514_533_554_305_310_133_300_211_341_233_342_524_032_350_332_134_550_501_203_533_131_142_355_003_404_102',
-            _precalculated_reciprocal='0.011_032_513_410_224_351_522_034_323_525_112_121_004_520_444_021_431_330_401_340_435_554_500_514_030_041_141_505_401_542_004_315_315_301_012_544',
-        ),
-        'week': SezimalFraction(
-            '5522 / 1205',
-            _precalculated_value='4.203_110_004_231_225_111_254_521_051_411_043_135_414_024_115_103_023_251_540_112_122_044_002_540_535_244_555_132_433_044_430_103_450_414_451_242',
-            _precalculated_reciprocal='0.121_402_051_512_512_311_142_422_003_220_233_331_054_125_324_240_145_034_415_145_235_543_510_054_330_453_001_003_421_402_051_512_512_311_142_422',
-        ),
-        'month': SezimalFraction(
-            '111_405_012 / 111_405_013',
-            _precalculated_value='0.555_555_551_020_040_210_445_531_343_505_402_541_231_142_343_333_504_420_313_044_304_424_534_210_510_410_200_530_033_351_414_152_541_551_102_521',
-            _precalculated_reciprocal='1.000_000_004_535_515_425_345_344_000_233_430_152_041_041_511_000_121_445_551_404_202_254_032_212_243_102_113_020_323_510_153_424_404_314_234_233',
-        ),
-        'year': SezimalFraction(
-            '14_531_132 / 335_023_043',
-            _precalculated_value='0.025_555_555_331_002_010_322_254_345_153_250_125_041_335_115_144_453_221_013_432_213_221_224_510_323_320_310_024_301_445_350_505_425_055_333_124',
-            _precalculated_reciprocal='20.000_000_135_154_352_551_351_320_005_113_003_441_221_234_220_002_433_355_432_124_045_521_044_245_302_042_300_410_514_203_512_532_130_325_125_054',
-        ),
-        'decade': SezimalFraction(
-            '1_031_532 / 335_023_043',
-            _precalculated_value='0.001_444_444_431_522_334_131_241_021_422_051_454_040_054_415_532_514_312_300_550_500_534_535_141_505_053_353_001_352_325_210_404_101_414_432_043',
-            _precalculated_reciprocal='320.000_002_425_134_305_444_243_320_124_030_101_501_542_211_520_043_400_353_334_225_214_535_152_411_033_121_010_552_451_302_425_134_305_444_243_320',
-        ),
-        'century': SezimalFraction(
-            '35_332 / 335_023_043',
-            _precalculated_value='0.000_102_514_024_220_132_120_424_523_435_003_103_224_452_134_443_142_130_503_410_403_405_521_043_441_414_322_033_433_131_423_022_452_323_250_451',
-            _precalculated_reciprocal='5320.000_043_244_413_133_552_335_322_224_501_430_231_315_410_521_140_410_320_012_045_501_225_102_554_552_134_153_504_043_043_244_413_133_552_335_322',
-        ),
-        'millenium': SezimalFraction(
-            '15_444 / 3_011_203_343',
-            _precalculated_value='0.000_003_515_450_234_454_231_135_142_435_522_415_050_252_005_513_532_343_030_211_511_322_553_413_551_212_131_224_324_305_323_523_514_242_425_252',
-            _precalculated_reciprocal='131_320.001_134_355_032_403_502_031_400_040_225_304_123_312_552_540_450_545_320_213_214_222_043_445_541_454_411_122_305_131_134_355_032_403_502_031_400',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'spt': {
-        's': SezimalFraction(
-            '20_544_000 / 1',
-            _precalculated_value='20_544_000',
-            _precalculated_reciprocal='0.000_000_024_355_102_132_435_510_213_243_551_021_324_355_102_132_435_510_213_243_551_021_324_355_102_132_435_510_213_243_551_021_324_355_102_133',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': SezimalFraction(
-            '100_000_000 / 11',
-            _precalculated_value='5_050_505.050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505',
-            _precalculated_reciprocal='0.000_000_11',
-        ),
-        'min': SezimalFraction(
-            '114_400 / 1',
-            _precalculated_value='114_400',
-            _precalculated_reciprocal='0.000_004_343_434_343_434_343_434_343_434_343_434_343_434_343_434_343_434_343_434_343_434_343_434_343_434_343_434_343_434_343_434_343_434_343_435',
-        ),
-        'h': SezimalFraction(
-            '440 / 1',
-            _precalculated_value='440',
-            _precalculated_reciprocal='0.001_141_414_141_414_141_414_141_414_141_414_141_414_141_414_141_414_141_414_141_414_141_414_141_414_141_414_141_414_141_414_141_414_141_414_142',
-        ),
-        'day': SezimalFraction(
-            '11 / 1',
-            _precalculated_value='11',
-            _precalculated_reciprocal='0.050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505',
-        ),
-        'week': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'month': SezimalFraction(
-            '11_224 / 52_113',
-            _precalculated_value='0.121_402_050_423_135_304_015_102_140_525_500_443_002_303_114_034_525_140_024_433_231_212_431_104_303_434_453_054_211_530_041_052_045_021_044_441',
-            _precalculated_reciprocal='4.203_110_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304',
-        ),
-        'year': SezimalFraction(
-            '1504 / 240_343',
-            _precalculated_value='0.004_050_102_321_134_543_200_533_105_024_253_022_130_113_133_501_524_235_001_221_441_340_421_333_213_151_522_432_510_354_302_032_402_231_032_222',
-            _precalculated_reciprocal='124.102_201_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_124',
-        ),
-        'decade': SezimalFraction(
-            '104 / 240_343',
-            _precalculated_value='0.000_225_230_131_154_410_200_032_041_412_503_150_120_342_043_214_554_013_300_050_102_321_134_543_200_533_105_024_253_022_130_113_133_501_524_235',
-            _precalculated_reciprocal='2225.435_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-        ),
-        'century': SezimalFraction(
-            '4 / 240_343',
-            _precalculated_value='0.000_012_535_231_533_245_233_335_340_100_515_044_120_021_225_045_522_112_052_225_230_131_154_410_200_032_041_412_503_150_120_342_043_214_554_014',
-            _precalculated_reciprocal='40_053.43',
-        ),
-        'millenium': SezimalFraction(
-            '2 / 2_123_043',
-            _precalculated_value='0.000_000_521_050_443_202_535_432_210_003_404_414_004_450_050_302_553_453_114_235_201_454_155_511_500_002_002_323_141_310_342_243_451_312_144_335',
-            _precalculated_reciprocal='1_041_321.3',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'din': {
-        's': SezimalFraction(
-            '1_504_000 / 1',
-            _precalculated_value='1_504_000',
-            _precalculated_reciprocal='0.000_000_312_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': 100000000,
-        'min': SezimalFraction(
-            '10_400 / 1',
-            _precalculated_value='10_400',
-            _precalculated_reciprocal='0.000_052_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-        ),
-        'h': SezimalFraction(
-            '40 / 1',
-            _precalculated_value='40',
-            _precalculated_reciprocal='0.013',
-        ),
-        'day': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'week': SezimalFraction(
-            '1 / 11',
-            _precalculated_value='0.050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505',
-            _precalculated_reciprocal='11',
-        ),
-        'month': SezimalFraction(
-            '11_224 / 1_013_243',
-            _precalculated_value='0.011_032_513_311_154_114_510_423_430_553_223_313_000_205_334_003_135_012_325_453_530_110_221_005_442_130_404_423_110_135_054_241_055_001_513_131',
-            _precalculated_reciprocal='50.234_210_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350',
-        ),
-        'year': SezimalFraction(
-            '1504 / 3_044_213',
-            _precalculated_value='0.000_331_423_443_335_503_523_321_151_325_441_143_430_010_244_500_134_530_414_252_454_303_311_030_252_104_320_221_133_304_532_512_032_530_053_435',
-            _precalculated_reciprocal='1405.124_214_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_403',
-        ),
-        'decade': SezimalFraction(
-            '104 / 3_044_213',
-            _precalculated_value='0.000_020_435_102_432_215_105_053_421_542_551_155_101_445_240_252_232_143_023_240_514_352_430_413_014_230_242_234_532_052_520_515_335_405_225_440',
-            _precalculated_reciprocal='24_524.231_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_445',
-        ),
-        'century': SezimalFraction(
-            '4 / 3_044_213',
-            _precalculated_value='0.000_001_135_530_135_345_530_303_212_332_410_422_152_325_202_240_502_010_150_202_253_244_250_400_523_235_240_124_405_340_520_031_054_434_050_325',
-            _precalculated_reciprocal='441_032.13',
-        ),
-        'millenium': SezimalFraction(
-            '2 / 23_353_513',
-            _precalculated_value='0.000_000_043_331_454_432_554_130_200_505_400_401_233_131_422_351_141_223_010_345_014_314_014_133_405_051_051_120_245_210_031_113_041_024_340_354',
-            _precalculated_reciprocal='11_454_534.3',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'uta': {
-        's': SezimalFraction(
-            '15_040 / 1',
-            _precalculated_value='15_040',
-            _precalculated_reciprocal='0.000_031_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_124',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': 10000000000,
-        'min': SezimalFraction(
-            '104 / 1',
-            _precalculated_value='104',
-            _precalculated_reciprocal='0.005_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-        ),
-        'h': SezimalFraction(
-            '2 / 3',
-            _precalculated_value='0.4',
-            _precalculated_reciprocal='1.3',
-        ),
-        'day': SezimalFraction(
-            '1 / 100',
-            _precalculated_value='0.01',
-            _precalculated_reciprocal='100',
-        ),
-        'week': SezimalFraction(
-            '1 / 1100',
-            _precalculated_value='0.000_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505',
-            _precalculated_reciprocal='1100',
-        ),
-        'month': SezimalFraction(
-            '1504 / 13_221_043',
-            _precalculated_value='0.000_110_325_133_111_541_145_104_234_305_532_233_130_002_053_340_031_350_123_254_535_301_102_210_054_421_304_044_231_101_350_542_410_550_015_132',
-            _precalculated_reciprocal='5023.421_050_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_013',
-        ),
-        'year': SezimalFraction(
-            '244 / 44_103_213',
-            _precalculated_value='0.000_003_314_234_433_355_035_233_211_513_254_411_434_300_102_445_001_345_304_142_524_543_033_110_302_521_043_202_211_333_045_325_120_325_300_535',
-            _precalculated_reciprocal='140_512.421_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_252',
-        ),
-        'decade': SezimalFraction(
-            '14 / 44_103_213',
-            _precalculated_value='0.000_000_204_351_024_322_151_050_534_215_425_511_551_014_452_402_522_321_430_232_405_143_524_304_130_142_302_422_345_320_525_205_153_354_052_255',
-            _precalculated_reciprocal='2_452_423.144_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_445',
-        ),
-        'century': SezimalFraction(
-            '1 / 44_103_213',
-            _precalculated_value='0.000_000_011_355_301_353_455_303_032_123_324_104_221_523_252_022_405_020_101_502_022_532_442_504_005_232_352_401_244_053_405_200_310_544_340_503',
-            _precalculated_reciprocal='44_103_213',
-        ),
-        'millenium': SezimalFraction(
-            '1 / 1_145_453_430',
-            _precalculated_value='0.000_000_000_433_314_544_325_541_302_005_054_004_012_331_314_223_511_412_230_103_450_143_140_141_334_050_510_511_202_452_100_311_130_410_243_404',
-            _precalculated_reciprocal='1_145_453_430',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'pox': {
-        's': SezimalFraction(
-            '532 / 3',
-            _precalculated_value='150.4',
-            _precalculated_reciprocal='0.003_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': 1000000000000,
-        'min': SezimalFraction(
-            '14 / 13',
-            _precalculated_value='1.04',
-            _precalculated_reciprocal='0.522_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-        ),
-        'h': SezimalFraction(
-            '1 / 130',
-            _precalculated_value='0.004',
-            _precalculated_reciprocal='130',
-        ),
-        'day': SezimalFraction(
-            '1 / 10_000',
-            _precalculated_value='0.0001',
-            _precalculated_reciprocal='10_000',
-        ),
-        'week': SezimalFraction(
-            '1 / 110_000',
-            _precalculated_value='0.000_005_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505',
-            _precalculated_reciprocal='110_000',
-        ),
-        'month': SezimalFraction(
-            '244 / 220_314_043',
-            _precalculated_value='0.000_001_103_251_331_115_411_451_042_343_055_322_331_300_020_533_400_313_501_232_545_353_011_022_100_544_213_040_442_311_013_505_424_105_500_152',
-            _precalculated_reciprocal='502_342.105_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235',
-        ),
-        'year': SezimalFraction(
-            '41 / 1_101_350_213',
-            _precalculated_value='0.000_000_033_142_344_333_550_352_332_115_132_544_114_343_001_024_450_013_453_041_425_245_430_331_103_025_210_432_022_113_330_453_251_203_253_010',
-            _precalculated_reciprocal='14_051_242.140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140',
-        ),
-        'decade': SezimalFraction(
-            '5 / 2_203_140_430',
-            _precalculated_value='0.000_000_002_043_510_243_221_510_505_342_154_255_115_510_144_524_025_223_214_302_324_051_435_243_041_301_423_024_223_453_205_252_051_533_540_523',
-            _precalculated_reciprocal='245_242_314.444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_445',
-        ),
-        'century': SezimalFraction(
-            '1 / 4_410_321_300',
-            _precalculated_value='0.000_000_000_113_553_013_534_553_030_321_233_241_042_215_232_520_224_050_201_015_020_225_324_425_040_052_323_524_012_440_534_052_003_105_443_405',
-            _precalculated_reciprocal='4_410_321_300',
-        ),
-        'millenium': SezimalFraction(
-            '1 / 114_545_343_000',
-            _precalculated_value='0.000_000_000_004_333_145_443_255_413_020_050_540_040_123_313_142_235_114_122_301_034_501_431_401_413_340_505_105_112_024_521_003_111_304_102_434',
-            _precalculated_reciprocal='114_545_343_000',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'agm': {
-        's': SezimalFraction(
-            '122 / 43',
-            _precalculated_value='1.504',
-            _precalculated_reciprocal='0.312_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_013',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': 100000000000000,
-        'min': SezimalFraction(
-            '5 / 430',
-            _precalculated_value='0.0104',
-            _precalculated_reciprocal='52.222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-        ),
-        'h': SezimalFraction(
-            '1 / 13_000',
-            _precalculated_value='0.000_040_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='13_000',
-        ),
-        'day': SezimalFraction(
-            '1 / 1_000_000',
-            _precalculated_value='0.000_001',
-            _precalculated_reciprocal='1_000_000',
-        ),
-        'week': SezimalFraction(
-            '1 / 11_000_000',
-            _precalculated_value='0.000_000_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505',
-            _precalculated_reciprocal='11_000_000',
-        ),
-        'month': SezimalFraction(
-            '41 / 3_304_531_043',
-            _precalculated_value='0.000_000_011_032_513_311_154_114_510_423_430_553_223_313_000_205_334_003_135_012_325_453_530_110_221_005_442_130_404_423_110_135_054_241_055_002',
-            _precalculated_reciprocal='50_234_210.501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501',
-        ),
-        'year': SezimalFraction(
-            '41 / 110_135_021_300',
-            _precalculated_value='0.000_000_000_331_423_443_335_503_523_321_151_325_441_143_430_010_244_500_134_530_414_252_454_303_311_030_252_104_320_221_133_304_532_512_032_530',
-            _precalculated_reciprocal='1_405_124_214.025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025',
-        ),
-        'decade': SezimalFraction(
-            '5 / 220_314_043_000',
-            _precalculated_value='0.000_000_000_020_435_102_432_215_105_053_421_542_551_155_101_445_240_252_232_143_023_240_514_352_430_413_014_230_242_234_532_052_520_515_335_405',
-            _precalculated_reciprocal='24_524_231_444.444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_445',
-        ),
-        'century': SezimalFraction(
-            '1 / 441_032_130_000',
-            _precalculated_value='0.000_000_000_001_135_530_135_345_530_303_212_332_410_422_152_325_202_240_502_010_150_202_253_244_250_400_523_235_240_124_405_340_520_031_054_434',
-            _precalculated_reciprocal='441_032_130_000',
-        ),
-        'millenium': SezimalFraction(
-            '1 / 11_454_534_300_000',
-            _precalculated_value='0.000_000_000_000_043_331_454_432_554_130_200_505_400_401_233_131_422_351_141_223_010_345_014_314_014_133_405_051_051_120_245_210_031_113_041_025',
-            _precalculated_reciprocal='11_454_534_300_000',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'ang': {
-        's': SezimalFraction(
-            '41 / 2130',
-            _precalculated_value='0.015_04',
-            _precalculated_reciprocal='31.235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': 10000000000000000,
-        'min': SezimalFraction(
-            '5 / 43_000',
-            _precalculated_value='0.000_104_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='5222.222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-        ),
-        'h': SezimalFraction(
-            '1 / 1_300_000',
-            _precalculated_value='0.000_000_400_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='1_300_000',
-        ),
-        'day': SezimalFraction(
-            '1 / 100_000_000',
-            _precalculated_value='0.000_000_01',
-            _precalculated_reciprocal='100_000_000',
-        ),
-        'week': SezimalFraction(
-            '1 / 1_100_000_000',
-            _precalculated_value='0.000_000_000_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505',
-            _precalculated_reciprocal='1_100_000_000',
-        ),
-        'month': SezimalFraction(
-            '41 / 330_453_104_300',
-            _precalculated_value='0.000_000_000_110_325_133_111_541_145_104_234_305_532_233_130_002_053_340_031_350_123_254_535_301_102_210_054_421_304_044_231_101_350_542_410_550',
-            _precalculated_reciprocal='5_023_421_050.123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_124',
-        ),
-        'year': SezimalFraction(
-            '41 / 11_013_502_130_000',
-            _precalculated_value='0.000_000_000_003_314_234_433_355_035_233_211_513_254_411_434_300_102_445_001_345_304_142_524_543_033_110_302_521_043_202_211_333_045_325_120_330',
-            _precalculated_reciprocal='140_512_421_402.514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514',
-        ),
-        'decade': SezimalFraction(
-            '5 / 22_031_404_300_000',
-            _precalculated_value='0.000_000_000_000_204_351_024_322_151_050_534_215_425_511_551_014_452_402_522_321_430_232_405_143_524_304_130_142_302_422_345_320_525_205_153_354',
-            _precalculated_reciprocal='2_452_423_144_444.444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_445',
-        ),
-        'century': SezimalFraction(
-            '1 / 44_103_213_000_000',
-            _precalculated_value='0.000_000_000_000_011_355_301_353_455_303_032_123_324_104_221_523_252_022_405_020_101_502_022_532_442_504_005_232_352_401_244_053_405_200_310_545',
-            _precalculated_reciprocal='44_103_213_000_000',
-        ),
-        'millenium': SezimalFraction(
-            '1 / 1_145_453_430_000_000',
-            _precalculated_value='0.000_000_000_000_000_433_314_544_325_541_302_005_054_004_012_331_314_223_511_412_230_103_450_143_140_141_334_050_510_511_202_452_100_311_130_410',
-            _precalculated_reciprocal='1_145_453_430_000_000',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'bod': {
-        's': SezimalFraction(
-            '41 / 213_000',
-            _precalculated_value='0.000_150_400_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='3123.501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501',
-        ),
-        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
-        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
-        'ang': 1000000000000000000,
-        'min': SezimalFraction(
-            '5 / 4_300_000',
-            _precalculated_value='0.000_001_040_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='522_222.222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-        ),
-        'h': SezimalFraction(
-            '1 / 130_000_000',
-            _precalculated_value='0.000_000_004_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='130_000_000',
-        ),
-        'day': SezimalFraction(
-            '1 / 10_000_000_000',
-            _precalculated_value='0.000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000',
-        ),
-        'week': SezimalFraction(
-            '1 / 110_000_000_000',
-            _precalculated_value='0.000_000_000_005_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505_050_505',
-            _precalculated_reciprocal='110_000_000_000',
-        ),
-        'month': SezimalFraction(
-            '41 / 33_045_310_430_000',
-            _precalculated_value='0.000_000_000_001_103_251_331_115_411_451_042_343_055_322_331_300_020_533_400_313_501_232_545_353_011_022_100_544_213_040_442_311_013_505_424_110',
-            _precalculated_reciprocal='502_342_105_012.350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350',
-        ),
-        'year': SezimalFraction(
-            '41 / 1_101_350_213_000_000',
-            _precalculated_value='0.000_000_000_000_033_142_344_333_550_352_332_115_132_544_114_343_001_024_450_013_453_041_425_245_430_331_103_025_210_432_022_113_330_453_251_203',
-            _precalculated_reciprocal='14_051_242_140_251.402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_402_514_025_140_251_403',
-        ),
-        'decade': SezimalFraction(
-            '5 / 2_203_140_430_000_000',
-            _precalculated_value='0.000_000_000_000_002_043_510_243_221_510_505_342_154_255_115_510_144_524_025_223_214_302_324_051_435_243_041_301_423_024_223_453_205_252_051_534',
-            _precalculated_reciprocal='245_242_314_444_444.444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_444_445',
-        ),
-        'century': SezimalFraction(
-            '1 / 4_410_321_300_000_000',
-            _precalculated_value='0.000_000_000_000_000_113_553_013_534_553_030_321_233_241_042_215_232_520_224_050_201_015_020_225_324_425_040_052_323_524_012_440_534_052_003_110',
-            _precalculated_reciprocal='4_410_321_300_000_000',
-        ),
-        'millenium': SezimalFraction(
-            '1 / 114_545_343_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_004_333_145_443_255_413_020_050_540_040_123_313_142_235_114_122_301_034_501_431_401_413_340_505_105_112_024_521_003_111_304',
-            _precalculated_reciprocal='114_545_343_000_000_000',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
-    },
-    'avt': {
-        'Hz': SezimalFraction(
-            '2130 / 41',
-            _precalculated_value='31.235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235',
-            _precalculated_reciprocal='0.015_04',
-        ),
-        'Bq': SezimalFraction(
-            '2130 / 41',
-            _precalculated_value='31.235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235',
-            _precalculated_reciprocal='0.015_04',
-        ),
-        's-1': SezimalFraction(
-            '2130 / 41',
-            _precalculated_value='31.235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235',
-            _precalculated_reciprocal='0.015_04',
-        ),
-        'prefixed': ('Hz', 's-1', 'Bq'),
-        'comparable': ('avt', 'ang-1'),
-        'avt': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'brx': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'rpm': SezimalFraction(
-            '43_000 / 5',
-            _precalculated_value='5222.222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-            _precalculated_reciprocal='0.000_104_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'avt', 'brx', 'rpm'),
-    },
-    'brx': {
-        'Hz': SezimalFraction(
-            '2130 / 41',
-            _precalculated_value='31.235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235',
-            _precalculated_reciprocal='0.015_04',
-        ),
-        'Bq': SezimalFraction(
-            '2130 / 41',
-            _precalculated_value='31.235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235',
-            _precalculated_reciprocal='0.015_04',
-        ),
-        's-1': SezimalFraction(
-            '2130 / 41',
-            _precalculated_value='31.235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235',
-            _precalculated_reciprocal='0.015_04',
-        ),
-        'prefixed': ('Hz', 's-1', 'Bq'),
-        'comparable': ('avt', 'ang-1'),
-        'avt': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'brx': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'rpm': SezimalFraction(
-            '43_000 / 5',
-            _precalculated_value='5222.222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-            _precalculated_reciprocal='0.000_104_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'avt', 'brx', 'rpm'),
-    },
-    'pad': {
-        'm': SezimalFraction(
-            '1_415_503_524_325 / 150_223_042_430_000',
-            _precalculated_value='0.005_333_324_241_020_131_435_440_331_504_255_305_114_032_101_210_220_233_215_120_450_215_202_421_203_354_254_153_350_214_134_454_425_025_535_545',
-            _precalculated_reciprocal='102.323_332_014_301_032_531_122_041_554_212_120_003_103_434_144_051_511_443_400_115_212_051_123_244_310_420_255_112_041_253_323_541_105_402_325_153',
-        ),
-        'prefixed': ('m', 'au', 'parsec'),
-        'comparable': ('pad', 'vrp'),
-        'pad': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'twip': SezimalFraction(
-            '1_502_300_415_440_155_104 / 134_321_501_031_513',
-            _precalculated_value='10_445.442_020_052_411_232_422_500_102_223_035_023_030_240_000_533_512_125_131_144_020_325_525_003_333_341_330_014_443_524_104_122_133_313_032_413_315',
-            _precalculated_reciprocal='0.000_051_424_322_335_043_105_540_154_233_303_435_152_021_043_204_400_341_120_334_235_134_453_311_025_140_344_301_402_321_224_504_014_250_153_105',
-        ),
-        'mil': SezimalFraction(
-            '15_310_351_301_342_020_524 / 2_235_024_313_454_513',
-            _precalculated_value='4420.404_032_234_413_054_222_145_042_400_254_004_250_450_400_352_104_420_552_222_252_423_234_452_300_002_433_311_255_214_123_534_523_543_152_214_345',
-            _precalculated_reciprocal='0.000_113_413_242_443_312_530_350_413_132_523_303_200_030_522_524_445_404_351_035_401_455_424_335_053_305_121_405_144_100_331_540_314_432_342_105',
-        ),
-        'in': SezimalFraction(
-            '4_551_543_051_445_405 / 4_514_053_031_353_430',
-            _precalculated_value='1.004_245_035_231_145_525_302_120_343_205_511_021_021_322_222_312_403_011_553_254_450_404_253_052_535_013_123_150_230_330_343_345_050_121_544_150',
-            _precalculated_reciprocal='0.551_342_241_214_101_143_350_101_315_241_055_233_423_302_211_044_040_100_005_335_052_051_315_111_112_114_015_105_025_224_202_553_454_045_130_534',
-        ),
-        'li': SezimalFraction(
-            '324_310_550_403_034_125 / 4_250_150_200_003_534_300',
-            _precalculated_value='0.043_500_433_300_341_435_503_001_435_345_245_023_455_310_421_035_243_143_105_045_503_302_215_032_304_524_234_501_501_341_450_114_434_210_150_400',
-            _precalculated_reciprocal='11.432_014_434_241_503_015_314_003_354_304_522_123_113_030_424_052_322_140_404_031_102_332_533_005_115_434_002_120_513_415_220_054_340_040_200_115',
-        ),
-        'ft': SezimalFraction(
-            '4_551_543_051_445_405 / 134_321_501_031_513_000',
-            _precalculated_value='0.030_212_231_541_335_254_243_104_015_140_253_331_031_044_111_113_420_130_355_442_522_320_212_432_424_530_434_135_311_314_315_145_232_304_055_210',
-            _precalculated_reciprocal='15.431_245_224_322_023_311_402_030_345_221_545_112_510_044_221_321_202_000_151_141_441_430_342_222_242_320_342_140_544_524_055_513_521_343_015_124',
-        ),
-        'yd': SezimalFraction(
-            '4_551_543_051_445_405 / 451_405_303_135_343_000',
-            _precalculated_value='0.010_042_450_352_311_455_253_021_203_432_055_110_210_213_222_223_124_030_115_532_544_504_042_530_525_350_131_231_502_303_303_433_450_501_215_442',
-            _precalculated_reciprocal='55.134_224_121_410_114_335_010_131_524_105_523_342_330_221_104_404_010_000_533_505_205_131_511_111_211_401_510_502_522_420_255_345_404_513_053_420',
-        ),
-        'ftm': SezimalFraction(
-            '4_551_543_051_445_405 / 1_343_215_010_315_130_000',
-            _precalculated_value='0.003_021_223_154_133_525_424_310_401_514_025_333_103_104_411_111_342_013_035_544_252_232_021_243_242_453_043_413_531_131_431_514_523_230_405_521',
-            _precalculated_reciprocal='154.312_452_243_220_233_114_020_303_452_215_451_125_100_442_213_212_020_001_511_414_414_303_422_222_423_203_421_405_445_240_555_135_213_430_151_240',
-        ),
-        'rd': SezimalFraction(
-            '4_551_543_051_445_405 / 4_250_150_200_003_534_300',
-            _precalculated_value='0.001_040_302_144_454_052_344_530_442_510_534_432_443_201_413_055_255_352_433_445_554_411_143_445_342_041_045_414_053_103_525_014_302_200_130_301',
-            _precalculated_reciprocal='521.553_125_133_154_104_200_354_231_255_022_251_532_115_100_311_434_053_005_050_115_244_531_133_334_310_114_131_353_542_552_424_001_142_452_205_250',
-        ),
-        'ch': SezimalFraction(
-            '4_551_543_051_445_405 / 25_521_121_200_023_430_000',
-            _precalculated_value='0.000_140_043_324_112_312_054_121_410_414_422_405_110_500_232_142_512_525_105_241_255_401_453_541_223_310_141_232_312_143_551_132_343_330_021_343',
-            _precalculated_reciprocal='3331.540_553_021_144_425_202_345_405_552_133_531_412_512_402_051_024_340_032_320_513_511_405_022_230_040_505_010_343_455_534_544_005_055_133_233_520',
-        ),
-        'fur': SezimalFraction(
-            '555_105_232_432_201 / 55_442_242_400_051_300_000',
-            _precalculated_value='0.000_010_002_431_342_015_341_004_545_245_512_400_304_141_124_232_404_254_041_424_541_100_103_221_201_315_232_313_130_455_110_420_510_205_223_433',
-            _precalculated_reciprocal='55_531.253_510_340_555_245_242_212_535_454_403_125_024_422_433_234_434_040_541_332_442_404_522_400_101_052_322_150_142_155_221_344_123_344_354_202_513',
-        ),
-        'cb': SezimalFraction(
-            '555_105_232_432_201 / 103_013_120_421_130_000_000',
-            _precalculated_value='0.000_005_302_305_552_514_351_534_320_003_214_540_250_532_050_020_544_041_135_333_312_023_100_040_121_231_250_455_252_132_133_055_442_454_542_241',
-            _precalculated_reciprocal='103_104.522_011_114_523_441_330_542_041_554_321_205_312_234_353_112_250_401_012_141_541_502_024_000_104_310_023_335_120_205_515_332_553_230_101_245_153',
-        ),
-        'ml': SezimalFraction(
-            '555_105_232_432_201 / 1_154_151_353_201_100_000_000',
-            _precalculated_value='0.000_000_430_202_241_431_241_343_342_103_422_330_022_011_353_315_330_321_133_115_041_351_304_531_400_105_532_322_353_504_222_201_335_143_401_550',
-            _precalculated_reciprocal='1_155_215.530_524_531_551_431_350_555_314_341_241_544_341_514_043_302_052_531_340_434_153_303_113_201_213_112_310_242_150_351_101_013_525_021_134_434_555',
-        ),
-        'le': SezimalFraction(
-            '555_105_232_432_201 / 3_550_534_544_003_300_000_000',
-            _precalculated_value='0.000_000_130_040_452_330_252_313_112_421_124_510_004_402_315_103_510_104_231_023_412_314_301_350_320_021_550_504_515_141_244_440_311_433_120_354',
-            _precalculated_reciprocal='3_554_055.432_422_435_535_134_532_554_351_504_205_521_505_350_214_310_242_434_502_150_544_313_344_004_043_341_331_210_531_533_303_045_423_103_452_152_552',
-        ),
-        'nmi': SezimalFraction(
-            '1_415_503_524_325 / 2_345_203_001_205_000_000',
-            _precalculated_value='0.000_000_353_023_525_243_511_014_412_053_323_404_144_304_402_013_004_535_530_522_241_044_134_123_345_152_023_404_054_125_243_345_004_304_031_453',
-            _precalculated_reciprocal='1_310_415.405_522_023_223_220_121_422_510_011_455_403_144_553_502_001_130_055_520_314_055_055_501_133_543_353_451_102_134_313_110_431_201_204_442_300_311',
-        ),
-        'NM': SezimalFraction(
-            '1_415_503_524_325 / 2_345_203_001_205_000_000',
-            _precalculated_value='0.000_000_353_023_525_243_511_014_412_053_323_404_144_304_402_013_004_535_530_522_241_044_134_123_345_152_023_404_054_125_243_345_004_304_031_453',
-            _precalculated_reciprocal='1_310_415.405_522_023_223_220_121_422_510_011_455_403_144_553_502_001_130_055_520_314_055_055_501_133_543_353_451_102_134_313_110_431_201_204_442_300_311',
-        ),
-        'au': SezimalFraction(
-            '112_002_205 / 2_300_042_110_210_435_053_000_000',
-            _precalculated_value='0.000_000_000_000_000_025_333_404_435_214_331_044_313_052_450_004_430_153_435_034_550_532_231_025_501_401_011_521_003_022_535_505_112_154_001_135',
-            _precalculated_reciprocal='20_134_502_554_253_451.151_013_130_023_415_004_415_331_010_401_324_022_303_044_242_434_341_431_442_501_440_540_214_512_214_014_124_152_021_204_352_015_403_033_543_534',
-        ),
-        'parsec': SezimalFraction(
-            '112_002_205 / 15_015_510_151_253_201_321_143_413_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_003_551_530_531_025_302_000_133_414_113_343_243_524_252_234_332_204_430_011_534_251_340_035_201_113_405_543_555_255',
-            _precalculated_reciprocal='130_131_154_551_340_532_430_124.124_232_423_150_034_323_500_404_055_232_320_201_033_415_451_451_513_544_503_200_524_113_043_401_330_331_142_152_542_521_530_322_515_454_434_420',
-        ),
-        'ly': SezimalFraction(
-            '10_142_015 / 252_331_101_020_221_154_110_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_020_552_404_542_041_352_005_420_434_331_254_141_320_314_241_033_421_430_555_441_013_310_052_030_255_324_241_224_221',
-            _precalculated_reciprocal='24_345_054_211_250_000_000_000.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-        'sly': SezimalFraction(
-            '2 / 53_134_100_033_433_015_020_311',
-            _precalculated_value='0.000_000_000_000_000_000_000_020_552_425_405_202_130_045_123_234_425_104_322_243_434_430_333_454_415_045_221_201_010_003_203_315_105_412_024_313',
-            _precalculated_reciprocal='24_345_030_014_514_305_310_133.3',
-        ),
-        'px_72_dpi': SezimalFraction(
-            '31_531_500_331_114_432 / 134_321_501_031_513',
-            _precalculated_value='201.253_411_450_233_545_500_424_113_041_542_204_204_304_444_502_521_002_355_055_334_121_255_014_551_403_025_034_050_110_113_113_414_024_353_234_025',
-            _precalculated_reciprocal='0.002_534_511_204_050_303_514_530_304_354_203_254_145_114_311_033_220_200_300_024_453_240_234_353_333_340_350_053_323_124_121_012_545_250_223_433',
-        ),
-        'px_96_dpi': SezimalFraction(
-            '211_411_202_204_511_012 / 451_405_303_135_343',
-            _precalculated_value='241.552_534_224_325_143_440_553_340_054_335_045_450_010_222_243_505_203_314_515_245_345_554_422_350_124_034_445_304_132_140_140_541_234_112_325_234',
-            _precalculated_reciprocal='0.002_112_052_303_034_515_525_104_520_254_432_341_420_524_522_154_013_130_213_020_341_030_154_554_111_113_251_341_102_233_100_440_421_034_445_454',
-        ),
-        'px_150_dpi': SezimalFraction(
-            '324_310_550_403_034_125 / 451_405_303_135_343',
-            _precalculated_value='413.034_114_133_223_435_054_313_434_000_023_523_023_231_000_033_010_035_314_132_101_151_041_004_513_000_225_344_042_523_534_105_122_554_410_353_555',
-            _precalculated_reciprocal='0.001_224_423_014_343_335_244_140_421_431_211_234_120_330_003_224_005_530_543_221_500_114_142_414_211_254_511_135_151_443_540_551_355_425_250_335',
-        ),
-        'px_300_dpi': SezimalFraction(
-            '1_053_021_541_210_112_254 / 451_405_303_135_343',
-            _precalculated_value='1230.112_232_310_451_314_153_031_312_000_051_450_050_502_000_110_020_115_032_304_202_342_122_013_430_000_455_132_125_451_512_214_245_553_221_151_554',
-            _precalculated_reciprocal='0.000_412_211_305_151_445_422_050_210_513_403_415_040_143_001_412_002_543_251_410_530_035_051_205_103_425_233_345_353_521_550_253_455_512_423_145',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'pad', 'twip', 'mil', 'in', 'li', 'ft', 'yd', 'ftm', 'rd', 'ch', 'fur', 'cb', 'ml', 'le', 'nmi', 'NM', 'ly', 'sly', 'px_72_dpi', 'px_96_dpi', 'px_150_dpi', 'px_300_dpi'),
-    },
-    'vrp': {
-        'm': SezimalFraction(
-            '1_415_503_524_325 / 150_223_042_430_000',
-            _precalculated_value='0.005_333_324_241_020_131_435_440_331_504_255_305_114_032_101_210_220_233_215_120_450_215_202_421_203_354_254_153_350_214_134_454_425_025_535_545',
-            _precalculated_reciprocal='102.323_332_014_301_032_531_122_041_554_212_120_003_103_434_144_051_511_443_400_115_212_051_123_244_310_420_255_112_041_253_323_541_105_402_325_153',
-        ),
-        'prefixed': ('m', 'au', 'parsec'),
-        'comparable': ('pad', 'vrp'),
-        'pad': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'twip': SezimalFraction(
-            '1_502_300_415_440_155_104 / 134_321_501_031_513',
-            _precalculated_value='10_445.442_020_052_411_232_422_500_102_223_035_023_030_240_000_533_512_125_131_144_020_325_525_003_333_341_330_014_443_524_104_122_133_313_032_413_315',
-            _precalculated_reciprocal='0.000_051_424_322_335_043_105_540_154_233_303_435_152_021_043_204_400_341_120_334_235_134_453_311_025_140_344_301_402_321_224_504_014_250_153_105',
-        ),
-        'mil': SezimalFraction(
-            '15_310_351_301_342_020_524 / 2_235_024_313_454_513',
-            _precalculated_value='4420.404_032_234_413_054_222_145_042_400_254_004_250_450_400_352_104_420_552_222_252_423_234_452_300_002_433_311_255_214_123_534_523_543_152_214_345',
-            _precalculated_reciprocal='0.000_113_413_242_443_312_530_350_413_132_523_303_200_030_522_524_445_404_351_035_401_455_424_335_053_305_121_405_144_100_331_540_314_432_342_105',
-        ),
-        'in': SezimalFraction(
-            '4_551_543_051_445_405 / 4_514_053_031_353_430',
-            _precalculated_value='1.004_245_035_231_145_525_302_120_343_205_511_021_021_322_222_312_403_011_553_254_450_404_253_052_535_013_123_150_230_330_343_345_050_121_544_150',
-            _precalculated_reciprocal='0.551_342_241_214_101_143_350_101_315_241_055_233_423_302_211_044_040_100_005_335_052_051_315_111_112_114_015_105_025_224_202_553_454_045_130_534',
-        ),
-        'li': SezimalFraction(
-            '324_310_550_403_034_125 / 4_250_150_200_003_534_300',
-            _precalculated_value='0.043_500_433_300_341_435_503_001_435_345_245_023_455_310_421_035_243_143_105_045_503_302_215_032_304_524_234_501_501_341_450_114_434_210_150_400',
-            _precalculated_reciprocal='11.432_014_434_241_503_015_314_003_354_304_522_123_113_030_424_052_322_140_404_031_102_332_533_005_115_434_002_120_513_415_220_054_340_040_200_115',
-        ),
-        'ft': SezimalFraction(
-            '4_551_543_051_445_405 / 134_321_501_031_513_000',
-            _precalculated_value='0.030_212_231_541_335_254_243_104_015_140_253_331_031_044_111_113_420_130_355_442_522_320_212_432_424_530_434_135_311_314_315_145_232_304_055_210',
-            _precalculated_reciprocal='15.431_245_224_322_023_311_402_030_345_221_545_112_510_044_221_321_202_000_151_141_441_430_342_222_242_320_342_140_544_524_055_513_521_343_015_124',
-        ),
-        'yd': SezimalFraction(
-            '4_551_543_051_445_405 / 451_405_303_135_343_000',
-            _precalculated_value='0.010_042_450_352_311_455_253_021_203_432_055_110_210_213_222_223_124_030_115_532_544_504_042_530_525_350_131_231_502_303_303_433_450_501_215_442',
-            _precalculated_reciprocal='55.134_224_121_410_114_335_010_131_524_105_523_342_330_221_104_404_010_000_533_505_205_131_511_111_211_401_510_502_522_420_255_345_404_513_053_420',
-        ),
-        'ftm': SezimalFraction(
-            '4_551_543_051_445_405 / 1_343_215_010_315_130_000',
-            _precalculated_value='0.003_021_223_154_133_525_424_310_401_514_025_333_103_104_411_111_342_013_035_544_252_232_021_243_242_453_043_413_531_131_431_514_523_230_405_521',
-            _precalculated_reciprocal='154.312_452_243_220_233_114_020_303_452_215_451_125_100_442_213_212_020_001_511_414_414_303_422_222_423_203_421_405_445_240_555_135_213_430_151_240',
-        ),
-        'rd': SezimalFraction(
-            '4_551_543_051_445_405 / 4_250_150_200_003_534_300',
-            _precalculated_value='0.001_040_302_144_454_052_344_530_442_510_534_432_443_201_413_055_255_352_433_445_554_411_143_445_342_041_045_414_053_103_525_014_302_200_130_301',
-            _precalculated_reciprocal='521.553_125_133_154_104_200_354_231_255_022_251_532_115_100_311_434_053_005_050_115_244_531_133_334_310_114_131_353_542_552_424_001_142_452_205_250',
-        ),
-        'ch': SezimalFraction(
-            '4_551_543_051_445_405 / 25_521_121_200_023_430_000',
-            _precalculated_value='0.000_140_043_324_112_312_054_121_410_414_422_405_110_500_232_142_512_525_105_241_255_401_453_541_223_310_141_232_312_143_551_132_343_330_021_343',
-            _precalculated_reciprocal='3331.540_553_021_144_425_202_345_405_552_133_531_412_512_402_051_024_340_032_320_513_511_405_022_230_040_505_010_343_455_534_544_005_055_133_233_520',
-        ),
-        'fur': SezimalFraction(
-            '555_105_232_432_201 / 55_442_242_400_051_300_000',
-            _precalculated_value='0.000_010_002_431_342_015_341_004_545_245_512_400_304_141_124_232_404_254_041_424_541_100_103_221_201_315_232_313_130_455_110_420_510_205_223_433',
-            _precalculated_reciprocal='55_531.253_510_340_555_245_242_212_535_454_403_125_024_422_433_234_434_040_541_332_442_404_522_400_101_052_322_150_142_155_221_344_123_344_354_202_513',
-        ),
-        'cb': SezimalFraction(
-            '555_105_232_432_201 / 103_013_120_421_130_000_000',
-            _precalculated_value='0.000_005_302_305_552_514_351_534_320_003_214_540_250_532_050_020_544_041_135_333_312_023_100_040_121_231_250_455_252_132_133_055_442_454_542_241',
-            _precalculated_reciprocal='103_104.522_011_114_523_441_330_542_041_554_321_205_312_234_353_112_250_401_012_141_541_502_024_000_104_310_023_335_120_205_515_332_553_230_101_245_153',
-        ),
-        'ml': SezimalFraction(
-            '555_105_232_432_201 / 1_154_151_353_201_100_000_000',
-            _precalculated_value='0.000_000_430_202_241_431_241_343_342_103_422_330_022_011_353_315_330_321_133_115_041_351_304_531_400_105_532_322_353_504_222_201_335_143_401_550',
-            _precalculated_reciprocal='1_155_215.530_524_531_551_431_350_555_314_341_241_544_341_514_043_302_052_531_340_434_153_303_113_201_213_112_310_242_150_351_101_013_525_021_134_434_555',
-        ),
-        'le': SezimalFraction(
-            '555_105_232_432_201 / 3_550_534_544_003_300_000_000',
-            _precalculated_value='0.000_000_130_040_452_330_252_313_112_421_124_510_004_402_315_103_510_104_231_023_412_314_301_350_320_021_550_504_515_141_244_440_311_433_120_354',
-            _precalculated_reciprocal='3_554_055.432_422_435_535_134_532_554_351_504_205_521_505_350_214_310_242_434_502_150_544_313_344_004_043_341_331_210_531_533_303_045_423_103_452_152_552',
-        ),
-        'nmi': SezimalFraction(
-            '1_415_503_524_325 / 2_345_203_001_205_000_000',
-            _precalculated_value='0.000_000_353_023_525_243_511_014_412_053_323_404_144_304_402_013_004_535_530_522_241_044_134_123_345_152_023_404_054_125_243_345_004_304_031_453',
-            _precalculated_reciprocal='1_310_415.405_522_023_223_220_121_422_510_011_455_403_144_553_502_001_130_055_520_314_055_055_501_133_543_353_451_102_134_313_110_431_201_204_442_300_311',
-        ),
-        'NM': SezimalFraction(
-            '1_415_503_524_325 / 2_345_203_001_205_000_000',
-            _precalculated_value='0.000_000_353_023_525_243_511_014_412_053_323_404_144_304_402_013_004_535_530_522_241_044_134_123_345_152_023_404_054_125_243_345_004_304_031_453',
-            _precalculated_reciprocal='1_310_415.405_522_023_223_220_121_422_510_011_455_403_144_553_502_001_130_055_520_314_055_055_501_133_543_353_451_102_134_313_110_431_201_204_442_300_311',
-        ),
-        'au': SezimalFraction(
-            '112_002_205 / 2_300_042_110_210_435_053_000_000',
-            _precalculated_value='0.000_000_000_000_000_025_333_404_435_214_331_044_313_052_450_004_430_153_435_034_550_532_231_025_501_401_011_521_003_022_535_505_112_154_001_135',
-            _precalculated_reciprocal='20_134_502_554_253_451.151_013_130_023_415_004_415_331_010_401_324_022_303_044_242_434_341_431_442_501_440_540_214_512_214_014_124_152_021_204_352_015_403_033_543_534',
-        ),
-        'parsec': SezimalFraction(
-            '112_002_205 / 15_015_510_151_253_201_321_143_413_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_003_551_530_531_025_302_000_133_414_113_343_243_524_252_234_332_204_430_011_534_251_340_035_201_113_405_543_555_255',
-            _precalculated_reciprocal='130_131_154_551_340_532_430_124.124_232_423_150_034_323_500_404_055_232_320_201_033_415_451_451_513_544_503_200_524_113_043_401_330_331_142_152_542_521_530_322_515_454_434_420',
-        ),
-        'ly': SezimalFraction(
-            '10_142_015 / 252_331_101_020_221_154_110_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_020_552_404_542_041_352_005_420_434_331_254_141_320_314_241_033_421_430_555_441_013_310_052_030_255_324_241_224_221',
-            _precalculated_reciprocal='24_345_054_211_250_000_000_000.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-        'sly': SezimalFraction(
-            '2 / 53_134_100_033_433_015_020_311',
-            _precalculated_value='0.000_000_000_000_000_000_000_020_552_425_405_202_130_045_123_234_425_104_322_243_434_430_333_454_415_045_221_201_010_003_203_315_105_412_024_313',
-            _precalculated_reciprocal='24_345_030_014_514_305_310_133.3',
-        ),
-        'px_72_dpi': SezimalFraction(
-            '31_531_500_331_114_432 / 134_321_501_031_513',
-            _precalculated_value='201.253_411_450_233_545_500_424_113_041_542_204_204_304_444_502_521_002_355_055_334_121_255_014_551_403_025_034_050_110_113_113_414_024_353_234_025',
-            _precalculated_reciprocal='0.002_534_511_204_050_303_514_530_304_354_203_254_145_114_311_033_220_200_300_024_453_240_234_353_333_340_350_053_323_124_121_012_545_250_223_433',
-        ),
-        'px_96_dpi': SezimalFraction(
-            '211_411_202_204_511_012 / 451_405_303_135_343',
-            _precalculated_value='241.552_534_224_325_143_440_553_340_054_335_045_450_010_222_243_505_203_314_515_245_345_554_422_350_124_034_445_304_132_140_140_541_234_112_325_234',
-            _precalculated_reciprocal='0.002_112_052_303_034_515_525_104_520_254_432_341_420_524_522_154_013_130_213_020_341_030_154_554_111_113_251_341_102_233_100_440_421_034_445_454',
-        ),
-        'px_150_dpi': SezimalFraction(
-            '324_310_550_403_034_125 / 451_405_303_135_343',
-            _precalculated_value='413.034_114_133_223_435_054_313_434_000_023_523_023_231_000_033_010_035_314_132_101_151_041_004_513_000_225_344_042_523_534_105_122_554_410_353_555',
-            _precalculated_reciprocal='0.001_224_423_014_343_335_244_140_421_431_211_234_120_330_003_224_005_530_543_221_500_114_142_414_211_254_511_135_151_443_540_551_355_425_250_335',
-        ),
-        'px_300_dpi': SezimalFraction(
-            '1_053_021_541_210_112_254 / 451_405_303_135_343',
-            _precalculated_value='1230.112_232_310_451_314_153_031_312_000_051_450_050_502_000_110_020_115_032_304_202_342_122_013_430_000_455_132_125_451_512_214_245_553_221_151_554',
-            _precalculated_reciprocal='0.000_412_211_305_151_445_422_050_210_513_403_415_040_143_001_412_002_543_251_410_530_035_051_205_103_425_233_345_353_521_550_253_455_512_423_145',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'pad', 'twip', 'mil', 'in', 'li', 'ft', 'yd', 'ftm', 'rd', 'ch', 'fur', 'cb', 'ml', 'le', 'nmi', 'NM', 'ly', 'sly', 'px_72_dpi', 'px_96_dpi', 'px_150_dpi', 'px_300_dpi'),
-    },
-    'trg': {
-        'm-1': SezimalFraction(
-            '150_223_042_430_000 / 1_415_503_524_325',
-            _precalculated_value='102.323_332_014_301_032_531_122_041_554_212_120_003_103_434_144_051_511_443_400_115_212_051_123_244_310_420_255_112_041_253_323_541_105_402_325_153',
-            _precalculated_reciprocal='0.005_333_324_241_020_131_435_440_331_504_255_305_114_032_101_210_220_233_215_120_450_215_202_421_203_354_254_153_350_214_134_454_425_025_535_545',
-        ),
-        'prefixed': ('m-1',),
-        'comparable': ('trg', 'pad-1'),
-        'trg': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'trg'),
-    },
-    'pad-1': {
-        'm-1': SezimalFraction(
-            '150_223_042_430_000 / 1_415_503_524_325',
-            _precalculated_value='102.323_332_014_301_032_531_122_041_554_212_120_003_103_434_144_051_511_443_400_115_212_051_123_244_310_420_255_112_041_253_323_541_105_402_325_153',
-            _precalculated_reciprocal='0.005_333_324_241_020_131_435_440_331_504_255_305_114_032_101_210_220_233_215_120_450_215_202_421_203_354_254_153_350_214_134_454_425_025_535_545',
-        ),
-        'prefixed': ('m-1',),
-        'comparable': ('trg', 'pad-1'),
-        'trg': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'trg'),
-    },
-    'ktr': {
-        'm2': SezimalFraction(
-            '2_544_053_253_512_152_413_104_201 / 32_225_223_253_321_451_321_300_000_000',
-            _precalculated_value='0.000_051_205_254_250_110_510_024_132_415_440_340_040_524_243_342_402_135_242_325_530_511_201_403_301_032_434_023_502_412_224_215_523_505_545_504',
-            _precalculated_reciprocal='10_515.451_434_514_132_021_423_405_221_000_531_022_002_310_113_431_201_424_340_140_150_420_314_231_331_445_544_444_451_224_253_011_541_023_232_135_103',
-        ),
-        'a': SezimalFraction(
-            '41_334_534_542_130_331_030_521 / 213_353_341_542_131_130_130_000_000_000',
-            _precalculated_value='0.000_000_151_422_424_510_104_424_000_322_303_502_432_224_210_431_202_522_554_454_213_524_135_020_135_224_433_453_140_051_433_013_251_251_214_004',
-            _precalculated_reciprocal='3_104_445.213_132_025_542_205_533_055_204_232_054_253_100_513_103_342_050_205_123_530_520_250_454_223_100_312_400_001_112_544_343_402_535_050_415_221_500',
-        ),
-        'prefixed': ('m2', 'a'),
-        'comparable': ('ktr', 'pad2'),
-        'ktr': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'in2': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 35_452_342_544_522_220_033_511_305_021_300',
-            _precalculated_value='1.013_010_103_012_524_110_333_512_455_115_050_335_433_413_434_025_014_052_510_511_014_023_030_355_323_143_152_354_020_013_144_335_433_012_514_443',
-            _precalculated_reciprocal='0.543_200_021_535_322_415_315_400_150_453_321_355_534_431_335_540_300_524_422_513_253_135_252_340_140_213_332_120_514_415_224_131_540_043_341_045',
-        ),
-        'li2': SezimalFraction(
-            '155_444_143_032_122_150_455_214_202_232_505_001 / 32_002_525_224_311_201_400_213_023_300_502_130_000',
-            _precalculated_value='0.003_330_520_353_325_142_042_300_015_055_442_022_543_221_401_412_220_514_505_433_354_251_411_153_343_325_131_331_310_520_335_553_321_034_400_501',
-            _precalculated_reciprocal='140.113_143_051_350_242_014_422_111_332_551_225_355_420_415_554_422_450_345_213_143_121_533_342_500_353_520_123_304_224_155_231_124_105_515_534_003',
-        ),
-        'ft2': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 23_513_425_551_133_332_022_325_003_213_000_000',
-            _precalculated_value='0.001_321_313_134_321_210_143_522_451_124_454_413_525_352_322_353_041_323_121_144_144_323_034_343_555_204_534_550_553_030_021_540_525_351_321_154',
-            _precalculated_reciprocal='350.120_013_143_413_451_411_440_112_314_213_035_543_101_023_544_200_335_053_530_154_103_353_424_104_130_221_252_331_051_334_501_144_030_224_431_021',
-        ),
-        'yd2': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 354_523_425_445_222_200_335_113_050_213_000_000',
-            _precalculated_value='0.000_101_301_010_301_252_411_033_351_245_511_505_033_543_341_343_402_501_405_251_051_101_402_303_035_532_314_315_235_402_001_314_433_543_301_252',
-            _precalculated_reciprocal='5432.000_215_353_224_153_154_001_504_533_213_555_344_313_355_403_005_244_225_132_531_352_523_401_402_133_321_205_144_152_241_315_400_433_410_443_315',
-        ),
-        'ftm2': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 2_351_342_555_113_333_202_232_500_321_300_000_000',
-            _precalculated_value='0.000_013_213_131_343_212_101_435_224_511_244_544_135_253_523_223_530_413_231_211_441_443_230_343_435_552_045_345_505_530_300_215_405_253_513_212',
-            _precalculated_reciprocal='35_012.001_314_341_345_141_144_011_231_421_303_554_310_102_354_420_033_505_353_015_410_335_342_410_413_022_125_233_105_133_450_114_403_022_443_102_111',
-        ),
-        'rd2': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 32_002_525_224_311_201_400_213_023_300_502_130_000',
-            _precalculated_value='0.000_001_123_445_212_214_001_231_431_253_041_502_502_450_355_353_535_000_352_335_534_425_523_503_545_352_303_005_422_245_120_125_524_254_454_321',
-            _precalculated_reciprocal='450_115.015_414_315_341_413_015_432_052_111_422_240_512_251_212_201_303_151_300_115_543_252_223_052_422_321_125_024_131_330_355_002_005_112_211_305_211',
-        ),
-        'ch2': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 1_252_114_342_320_313_242_410_001_052_021_300_000_000',
-            _precalculated_value='0.000_000_024_423_200_305_043_031_122_415_023_040_532_231_525_551_212_104_312_442_125_101_041_423_555_334_140_534_505_223_154_303_211_440_402_055',
-            _precalculated_reciprocal='20_523_252.511_240_505_523_200_512_054_215_123_423_101_543_353_541_240_125_000_003_315_211_422_242_231_424_551_533_112_041_214_332_052_215_141_520_221_510',
-        ),
-        'fur2': SezimalFraction(
-            '554_215_302_335_315_314_141_114_544_401 / 5_532_510_254_122_101_454_440_004_332_130_000_000_000',
-            _precalculated_value='0.000_000_000_100_053_043_015_023_151_244_524_413_335_334_304_050_105_501_502_335_145_155_352_353_555_555_050_503_245_114_122_215_105_500_544_453',
-            _precalculated_reciprocal='5_550_300_314.440_502_022_233_423_035_530_311_541_405_324_045_415_040_320_312_001_351_132_525_205_322_250_310_041_052_231_430_123_154_554_320_353_023_430_140',
-        ),
-        'cb2': SezimalFraction(
-            '554_215_302_335_315_314_141_114_544_401 / 11_020_155_553_521_332_530_251_321_300_000_000_000_000',
-            _precalculated_value='0.000_000_000_050_213_500_121_445_211_105_143_143_024_030_101_121_212_054_144_535_155_221_412_405_152_555_140_231_055_314_203_200_523_353_321_245',
-            _precalculated_reciprocal='11_035_445_451.135_525_012_130_232_542_551_141_122_113_523_533_214_502_425_144_511_335_452_342_523_503_124_221_454_032_423_101_434_224_020_322_055_442_251_512',
-        ),
-        'ml2': SezimalFraction(
-            '554_215_302_335_315_314_141_114_544_401 / 1_431_303_131_250_511_112_545_441_210_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_322_003_444_144_210_402_411_323_522_233_055_300_245_523_114_421_145_051_254_453_415_125_553_035_041_112_333_012_014_440_111_433',
-            _precalculated_reciprocal='1_434_212_055_110.005_540_135_435_051_030_454_204_540_152_440_445_543_135_414_212_253_132_510_250_552_142_213_451_241_335_104_023_113_011_323_425_444_400_025_453',
-        ),
-        'nmi2': SezimalFraction(
-            '2_544_053_253_512_152_413_104_201 / 10_540_420_143_105_341_251_501_241_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_232_045_440_545_350_331_155_255_411_251_013_112_400_222_124_044_053_311_444_115_040_213_100_200_102_152_034_534_040_315_211_535',
-            _precalculated_reciprocal='2_202_212_130_125.335_342_404_225_033_023_354_254_111_530_254_342_511_200_231_522_034_012_210_454_445_105_233_344_530_431_014_242_014_502_023_031_135_303_341_034',
-        ),
-        'NM2': SezimalFraction(
-            '2_544_053_253_512_152_413_104_201 / 10_540_420_143_105_341_251_501_241_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_232_045_440_545_350_331_155_255_411_251_013_112_400_222_124_044_053_311_444_115_040_213_100_200_102_152_034_534_040_315_211_535',
-            _precalculated_reciprocal='2_202_212_130_125.335_342_404_225_033_023_354_254_111_530_254_342_511_200_231_522_034_012_210_454_445_105_233_344_530_431_014_242_014_502_023_031_135_303_341_034',
-        ),
-        'le2': SezimalFraction(
-            '554_215_302_335_315_314_141_114_544_401 / 23_451_345_151_141_444_512_424_020_130_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_021_320_231_051_052_424_144_501_433_334_203_540_015_153_405_105_251_123_255_511_425_125_555_402_322_444_542_200_521_110_404_510',
-            _precalculated_reciprocal='23_533_201_244_430.125_302_253_544_143_441_233_112_302_511_011_125_345_253_233_204_215_211_434_142_502_333_224_151_022_244_400_344_513_152_053_424_110_000_424_210',
-        ),
-        'ac': SezimalFraction(
-            '4_543_533_321_013_433_423_230_030_455_205 / 2_544_233_125_041_030_525_220_002_144_043_000_000_000',
-            _precalculated_value='0.000_000_001_401_311_130_302_413_042_401_035_040_032_013_105_221_534_230_242_025_005_152_302_323_555_543_232_254_404_050_155_503_534_213_400_115',
-            _precalculated_reciprocal='333_014_504.402_252_335_013_212_413_331_504_221_211_431_340_323_302_242_242_000_055_305_405_200_320_125_241_451_152_013_101_453_533_255_504_510_523_550_344',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ktr', 'in2', 'li2', 'ft2', 'yd2', 'ftm2', 'rd2', 'ch2', 'fur2', 'cb2', 'ml2', 'nmi2', 'NM2', 'le2', 'ac'),
-    },
-    'pad2': {
-        'm2': SezimalFraction(
-            '2_544_053_253_512_152_413_104_201 / 32_225_223_253_321_451_321_300_000_000',
-            _precalculated_value='0.000_051_205_254_250_110_510_024_132_415_440_340_040_524_243_342_402_135_242_325_530_511_201_403_301_032_434_023_502_412_224_215_523_505_545_504',
-            _precalculated_reciprocal='10_515.451_434_514_132_021_423_405_221_000_531_022_002_310_113_431_201_424_340_140_150_420_314_231_331_445_544_444_451_224_253_011_541_023_232_135_103',
-        ),
-        'a': SezimalFraction(
-            '41_334_534_542_130_331_030_521 / 213_353_341_542_131_130_130_000_000_000',
-            _precalculated_value='0.000_000_151_422_424_510_104_424_000_322_303_502_432_224_210_431_202_522_554_454_213_524_135_020_135_224_433_453_140_051_433_013_251_251_214_004',
-            _precalculated_reciprocal='3_104_445.213_132_025_542_205_533_055_204_232_054_253_100_513_103_342_050_205_123_530_520_250_454_223_100_312_400_001_112_544_343_402_535_050_415_221_500',
-        ),
-        'prefixed': ('m2', 'a'),
-        'comparable': ('ktr', 'pad2'),
-        'ktr': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'in2': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 35_452_342_544_522_220_033_511_305_021_300',
-            _precalculated_value='1.013_010_103_012_524_110_333_512_455_115_050_335_433_413_434_025_014_052_510_511_014_023_030_355_323_143_152_354_020_013_144_335_433_012_514_443',
-            _precalculated_reciprocal='0.543_200_021_535_322_415_315_400_150_453_321_355_534_431_335_540_300_524_422_513_253_135_252_340_140_213_332_120_514_415_224_131_540_043_341_045',
-        ),
-        'li2': SezimalFraction(
-            '155_444_143_032_122_150_455_214_202_232_505_001 / 32_002_525_224_311_201_400_213_023_300_502_130_000',
-            _precalculated_value='0.003_330_520_353_325_142_042_300_015_055_442_022_543_221_401_412_220_514_505_433_354_251_411_153_343_325_131_331_310_520_335_553_321_034_400_501',
-            _precalculated_reciprocal='140.113_143_051_350_242_014_422_111_332_551_225_355_420_415_554_422_450_345_213_143_121_533_342_500_353_520_123_304_224_155_231_124_105_515_534_003',
-        ),
-        'ft2': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 23_513_425_551_133_332_022_325_003_213_000_000',
-            _precalculated_value='0.001_321_313_134_321_210_143_522_451_124_454_413_525_352_322_353_041_323_121_144_144_323_034_343_555_204_534_550_553_030_021_540_525_351_321_154',
-            _precalculated_reciprocal='350.120_013_143_413_451_411_440_112_314_213_035_543_101_023_544_200_335_053_530_154_103_353_424_104_130_221_252_331_051_334_501_144_030_224_431_021',
-        ),
-        'yd2': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 354_523_425_445_222_200_335_113_050_213_000_000',
-            _precalculated_value='0.000_101_301_010_301_252_411_033_351_245_511_505_033_543_341_343_402_501_405_251_051_101_402_303_035_532_314_315_235_402_001_314_433_543_301_252',
-            _precalculated_reciprocal='5432.000_215_353_224_153_154_001_504_533_213_555_344_313_355_403_005_244_225_132_531_352_523_401_402_133_321_205_144_152_241_315_400_433_410_443_315',
-        ),
-        'ftm2': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 2_351_342_555_113_333_202_232_500_321_300_000_000',
-            _precalculated_value='0.000_013_213_131_343_212_101_435_224_511_244_544_135_253_523_223_530_413_231_211_441_443_230_343_435_552_045_345_505_530_300_215_405_253_513_212',
-            _precalculated_reciprocal='35_012.001_314_341_345_141_144_011_231_421_303_554_310_102_354_420_033_505_353_015_410_335_342_410_413_022_125_233_105_133_450_114_403_022_443_102_111',
-        ),
-        'rd2': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 32_002_525_224_311_201_400_213_023_300_502_130_000',
-            _precalculated_value='0.000_001_123_445_212_214_001_231_431_253_041_502_502_450_355_353_535_000_352_335_534_425_523_503_545_352_303_005_422_245_120_125_524_254_454_321',
-            _precalculated_reciprocal='450_115.015_414_315_341_413_015_432_052_111_422_240_512_251_212_201_303_151_300_115_543_252_223_052_422_321_125_024_131_330_355_002_005_112_211_305_211',
-        ),
-        'ch2': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 1_252_114_342_320_313_242_410_001_052_021_300_000_000',
-            _precalculated_value='0.000_000_024_423_200_305_043_031_122_415_023_040_532_231_525_551_212_104_312_442_125_101_041_423_555_334_140_534_505_223_154_303_211_440_402_055',
-            _precalculated_reciprocal='20_523_252.511_240_505_523_200_512_054_215_123_423_101_543_353_541_240_125_000_003_315_211_422_242_231_424_551_533_112_041_214_332_052_215_141_520_221_510',
-        ),
-        'fur2': SezimalFraction(
-            '554_215_302_335_315_314_141_114_544_401 / 5_532_510_254_122_101_454_440_004_332_130_000_000_000',
-            _precalculated_value='0.000_000_000_100_053_043_015_023_151_244_524_413_335_334_304_050_105_501_502_335_145_155_352_353_555_555_050_503_245_114_122_215_105_500_544_453',
-            _precalculated_reciprocal='5_550_300_314.440_502_022_233_423_035_530_311_541_405_324_045_415_040_320_312_001_351_132_525_205_322_250_310_041_052_231_430_123_154_554_320_353_023_430_140',
-        ),
-        'cb2': SezimalFraction(
-            '554_215_302_335_315_314_141_114_544_401 / 11_020_155_553_521_332_530_251_321_300_000_000_000_000',
-            _precalculated_value='0.000_000_000_050_213_500_121_445_211_105_143_143_024_030_101_121_212_054_144_535_155_221_412_405_152_555_140_231_055_314_203_200_523_353_321_245',
-            _precalculated_reciprocal='11_035_445_451.135_525_012_130_232_542_551_141_122_113_523_533_214_502_425_144_511_335_452_342_523_503_124_221_454_032_423_101_434_224_020_322_055_442_251_512',
-        ),
-        'ml2': SezimalFraction(
-            '554_215_302_335_315_314_141_114_544_401 / 1_431_303_131_250_511_112_545_441_210_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_322_003_444_144_210_402_411_323_522_233_055_300_245_523_114_421_145_051_254_453_415_125_553_035_041_112_333_012_014_440_111_433',
-            _precalculated_reciprocal='1_434_212_055_110.005_540_135_435_051_030_454_204_540_152_440_445_543_135_414_212_253_132_510_250_552_142_213_451_241_335_104_023_113_011_323_425_444_400_025_453',
-        ),
-        'nmi2': SezimalFraction(
-            '2_544_053_253_512_152_413_104_201 / 10_540_420_143_105_341_251_501_241_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_232_045_440_545_350_331_155_255_411_251_013_112_400_222_124_044_053_311_444_115_040_213_100_200_102_152_034_534_040_315_211_535',
-            _precalculated_reciprocal='2_202_212_130_125.335_342_404_225_033_023_354_254_111_530_254_342_511_200_231_522_034_012_210_454_445_105_233_344_530_431_014_242_014_502_023_031_135_303_341_034',
-        ),
-        'NM2': SezimalFraction(
-            '2_544_053_253_512_152_413_104_201 / 10_540_420_143_105_341_251_501_241_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_232_045_440_545_350_331_155_255_411_251_013_112_400_222_124_044_053_311_444_115_040_213_100_200_102_152_034_534_040_315_211_535',
-            _precalculated_reciprocal='2_202_212_130_125.335_342_404_225_033_023_354_254_111_530_254_342_511_200_231_522_034_012_210_454_445_105_233_344_530_431_014_242_014_502_023_031_135_303_341_034',
-        ),
-        'le2': SezimalFraction(
-            '554_215_302_335_315_314_141_114_544_401 / 23_451_345_151_141_444_512_424_020_130_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_021_320_231_051_052_424_144_501_433_334_203_540_015_153_405_105_251_123_255_511_425_125_555_402_322_444_542_200_521_110_404_510',
-            _precalculated_reciprocal='23_533_201_244_430.125_302_253_544_143_441_233_112_302_511_011_125_345_253_233_204_215_211_434_142_502_333_224_151_022_244_400_344_513_152_053_424_110_000_424_210',
-        ),
-        'ac': SezimalFraction(
-            '4_543_533_321_013_433_423_230_030_455_205 / 2_544_233_125_041_030_525_220_002_144_043_000_000_000',
-            _precalculated_value='0.000_000_001_401_311_130_302_413_042_401_035_040_032_013_105_221_534_230_242_025_005_152_302_323_555_543_232_254_404_050_155_503_534_213_400_115',
-            _precalculated_reciprocal='333_014_504.402_252_335_013_212_413_331_504_221_211_431_340_323_302_242_242_000_055_305_405_200_320_125_241_451_152_013_101_453_533_255_504_510_523_550_344',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'ktr', 'in2', 'li2', 'ft2', 'yd2', 'ftm2', 'rd2', 'ch2', 'fur2', 'cb2', 'ml2', 'nmi2', 'NM2', 'le2', 'ac'),
-    },
-    'ayt': {
-        'm3': SezimalFraction(
-            '5_034_014_323_452_000_002_250_221_154_033_330_125 / 10_135_315_134_322_154_010_401_232_444_043_000_000_000_000',
-            _precalculated_value='0.000_000_451_334_451_310_421_443_002_134_534_121_443_200_341_251_242_510_414_301_401_535_423_201_235_512_420_532_501_505_554_430_214_424_125_312',
-            _precalculated_reciprocal='1_121_404.122_242_004_410_343_430_330_401_245_230_144_130_015_153_213_333_522_333_250_124_355_155_045_325_043_523_134_332_052_234_250_334_435_212_543_532',
-        ),
-        'L': SezimalFraction(
-            '2_541_432_041_352_504_001_233_131_213_322_254_020_401 / 441_235_524_153_142_430_500_102_333_303_213_000_000_000',
-            _precalculated_value='0.003_432_553_340_351_054_303_414_304_504_130_305_120_105_542_545_412_231_151_431_355_121_404_003_505_422_305_453_541_030_115_435_021_515_504_002',
-            _precalculated_reciprocal='133.215_505_232_004_245_353_350_444_302_524_233_450_325_420_123_135_033_051_355_424_154_043_300_402_205_050_115_210_153_052_532_041_341_353_321_100',
-        ),
-        'l': SezimalFraction(
-            '2_541_432_041_352_504_001_233_131_213_322_254_020_401 / 441_235_524_153_142_430_500_102_333_303_213_000_000_000',
-            _precalculated_value='0.003_432_553_340_351_054_303_414_304_504_130_305_120_105_542_545_412_231_151_431_355_121_404_003_505_422_305_453_541_030_115_435_021_515_504_002',
-            _precalculated_reciprocal='133.215_505_232_004_245_353_350_444_302_524_233_450_325_420_123_135_033_051_355_424_154_043_300_402_205_050_115_210_153_052_532_041_341_353_321_100',
-        ),
-        'prefixed': ('m3', 'L', 'l'),
-        'comparable': ('ayt', 'pad3'),
-        'in3': SezimalFraction(
-            '323_334_020_403_032_302_141_030_100_015_024_342_442_242_545_325 / 312_123_302_424_050_255_010_125_203_544_554_453_045_035_343_000',
-            _precalculated_value='1.021_403_344_020_035_232_053_021_202_014_332_101_020_213_113_222_120_033_215_135_001_015_302_104_544_050_331_442_515_015_155_334_302_224_412_452',
-            _precalculated_reciprocal='0.535_044_241_444_424_330_120_454_401_521_554_555_141_244_453_210_403_040_121_321_025_342_201_553_310_143_015_155_322_235_424_034_124_154_451_221',
-        ),
-        'ft3': SezimalFraction(
-            '323_334_020_403_032_302_141_030_100_015_024_342_442_242_545_325 / 4_145_524_033_533_043_544_121_550_451_423_542_321_024_513_000_000_000',
-            _precalculated_value='0.000_044_413_242_001_302_532_304_044_400_131_154_004_344_314_052_401_440_002_401_224_213_044_234_435_042_003_453_550_205_514_225_541_151_445_031',
-            _precalculated_reciprocal='11_305.015_342_221_540_401_450_341_223_103_543_550_135_422_322_525_240_521_500_252_352_550_423_524_122_200_230_352_311_313_532_453_534_342_255_044_420',
-        ),
-        'yd3': SezimalFraction(
-            '323_334_020_403_032_302_141_030_100_015_024_342_442_242_545_325 / 312_123_302_424_050_255_010_125_203_544_554_453_045_035_343_000_000_000',
-            _precalculated_value='0.000_001_021_403_344_020_035_232_053_021_202_014_332_101_020_213_113_222_120_033_215_135_001_015_302_104_544_050_331_442_515_015_155_334_302_225',
-            _precalculated_reciprocal='535_044.241_444_424_330_120_454_401_521_554_555_141_244_453_210_403_040_121_321_025_342_201_553_310_143_015_155_322_235_424_034_124_154_451_220_331_304',
-        ),
-        'ml3': SezimalFraction(
-            '553_330_125_003_341_534_355_322_550_523_221_430_022_341_001 / 2_155_020_103_144_331_504_015_534_031_053_051_041_331_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_231_412_523_425_201_241_120_220_255_432_331_415_454_243_224_222_041_150_112_032_411_420_234_512_051_054_154_510_402_125',
-            _precalculated_reciprocal='2_204_425_023_404_242_021.514_531_204_322_221_223_225_001_433_123_245_444_532_550_544_242_334_105_115_051_345_220_232_243_255_031_025_055_101_532_330_301_224_541_243_234',
-        ),
-        'ac⋅ft': SezimalFraction(
-            '40_415_340_045_230_300_242_341_122_224_340_531_431_405_221_041 / 445_350_141_232_320_115_514_355_410_452_111_323_135_252_343_000_000_000_000',
-            _precalculated_value='0.000_000_000_050_430_115_045_040_111_222_103_553_230_152_323_254_342_223_042_312_223_042_051_034_553_545_404_352_404_200_031_355_430_520_423_532',
-            _precalculated_reciprocal='11_005_115_103.451_324_432_044_410_315_022_151_101_153_434_214_031_402_444_550_101_412_542_031_144_113_354_540_345_113_113_434_255_244_102_123_205_052_243_520',
-        ),
-        'US min': SezimalFraction(
-            '545_135_021_245_342_053_325_045_341_012_245_142_300_011_322_501_532 / 423_454_455_134_105_533_055_331_205_242_211_213_321_005_252_343',
-            _precalculated_value='1150.453_500_534_201_034_551_420_213_342_255_425_250_341_012_114_154_353_354_042_422_332_355_554_524_125_013_532_314_520_240_252_104_212_050_125_303',
-            _precalculated_reciprocal='0.000_432_544_251_215_300_250_302_004_412_022_205_554_053_043_242_250_544_022_005_052_032_550_535_204_444_415_354_534_152_245_514_504_442_123_434',
-        ),
-        'US fl dr': SezimalFraction(
-            '14_244_053_023_514_150_251_242_403_015_120_133_043_000_213_424_144 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='4.414_055_225_434_452_441_043_450_054_350_332_405_151_003_423_101_102_205_545_125_013_202_222_214_245_403_433_201_552_001_335_200_401_200_300_521',
-            _precalculated_reciprocal='0.113_453_524_415_110_044_250_321_150_123_553_355_253_111_343_204_333_443_521_232_525_454_332_253_155_551_123_412_111_004_145_003_155_142_214_102',
-        ),
-        'US tsp': SezimalFraction(
-            '2_341_012_133_545_324_341_510_400_432_450_022_140_430_032_234_024 / 423_454_455_134_105_533_055_331_205_242_211_213_321_005_252_343',
-            _precalculated_value='3.311_342_321_155_040_330_502_504_341_551_540_303_552_132_445_213_514_434_250_533_441_001_444_441_504_132_454_001_253_001_112_300_301_000_213_400',
-            _precalculated_reciprocal='0.141_033_114_142_532_101_544_425_424_153_152_515_152_134_100_250_045_021_105_523_515_434_043_152_235_545_352_534_533_205_422_404_235_015_101_322',
-        ),
-        'US tbsp': SezimalFraction(
-            '2_341_012_133_545_324_341_510_400_432_450_022_140_430_032_234_024 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='1.102_312_504_235_412_110_140_541_312_354_352_101_154_430_533_443_143_331_254_151_132_200_333_332_341_230_535_200_255_000_222_500_100_200_043_120',
-            _precalculated_reciprocal='0.503_143_350_512_440_305_522_125_120_543_542_353_540_450_301_230_223_103_325_415_355_150_213_541_155_524_542_452_444_025_112_021_153_053_304_411',
-        ),
-        'US fl oz': SezimalFraction(
-            '1_150_304_044_552_442_150_533_200_214_223_011_050_213_014_115_012 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='0.331_134_232_115_504_033_050_250_434_155_154_030_355_213_244_521_351_443_425_053_344_100_144_444_150_413_245_400_125_300_111_230_030_100_021_340',
-            _precalculated_reciprocal='1.410_331_141_425_321_015_444_254_241_531_525_151_521_341_002_500_450_211_055_235_154_340_431_522_355_453_525_345_332_054_224_042_350_151_013_223',
-        ),
-        'US jig': SezimalFraction(
-            '2_341_012_133_545_324_341_510_400_432_450_022_140_430_032_234_024 / 10_354_241_245_231_425_214_252_150_121_033_150_222_013_121_205_343',
-            _precalculated_value='0.220_502_541_251_522_422_032_152_302_515_314_420_235_330_151_133_033_110_255_234_230_440_111_110_512_250_151_440_055_400_044_540_020_040_013_024',
-            _precalculated_reciprocal='2.313_514_532_342_201_325_410_423_402_515_511_545_502_231_304_131_113_314_425_054_553_531_045_503_555_422_512_242_220_123_340_103_543_244_322_034',
-        ),
-        'US gi': SezimalFraction(
-            '154_344_011_125_110_324_422_200_032_333_431_441_332_132_315_432 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='0.051_452_335_015_544_005_141_341_405_325_455_304_355_502_211_120_224_540_534_142_224_013_024_111_024_402_211_230_021_213_014_504_304_313_003_223',
-            _precalculated_reciprocal='10.442_205_050_554_124_115_105_545_451_411_353_131_330_244_015_203_121_244_353_433_150_243_011_334_355_143_354_314_212_345_344_254_321_124_101_335',
-        ),
-        'US c': SezimalFraction(
-            '55_152_003_342_333_142_211_100_014_144_513_520_444_044_135_514 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='0.023_524_145_305_552_002_350_450_502_442_525_432_155_531_103_340_112_250_245_051_112_004_312_033_312_201_103_413_010_404_305_232_132_134_301_412',
-            _precalculated_reciprocal='21.324_414_141_552_252_234_215_535_343_223_150_303_100_532_034_410_242_533_151_310_340_530_023_113_154_331_153_032_425_135_132_553_042_252_203_115',
-        ),
-        'US cup': SezimalFraction(
-            '55_152_003_342_333_142_211_100_014_144_513_520_444_044_135_514 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='0.023_524_145_305_552_002_350_450_502_442_525_432_155_531_103_340_112_250_245_051_112_004_312_033_312_201_103_413_010_404_305_232_132_134_301_412',
-            _precalculated_reciprocal='21.324_414_141_552_252_234_215_535_343_223_150_303_100_532_034_410_242_533_151_310_340_530_023_113_154_331_153_032_425_135_132_553_042_252_203_115',
-        ),
-        'US pt': SezimalFraction(
-            '25_354_001_451_144_351_103_330_005_052_234_540_222_022_045_535 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='0.011_542_052_432_554_001_153_223_231_221_242_514_055_543_331_450_034_123_122_323_334_002_134_014_434_100_331_504_303_202_132_414_044_045_130_504',
-            _precalculated_reciprocal='43.053_232_323_544_544_512_435_515_130_450_341_010_201_504_113_220_525_510_343_021_121_500_050_230_353_102_350_105_254_314_305_550_124_544_410_234',
-        ),
-        'US pint': SezimalFraction(
-            '25_354_001_451_144_351_103_330_005_052_234_540_222_022_045_535 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='0.011_542_052_432_554_001_153_223_231_221_242_514_055_543_331_450_034_123_122_323_334_002_134_014_434_100_331_504_303_202_132_414_044_045_130_504',
-            _precalculated_reciprocal='43.053_232_323_544_544_512_435_515_130_450_341_010_201_504_113_220_525_510_343_021_121_500_050_230_353_102_350_105_254_314_305_550_124_544_410_234',
-        ),
-        'US qt': SezimalFraction(
-            '25_354_001_451_144_351_103_330_005_052_234_540_222_022_045_535 / 4_234_544_551_341_055_330_553_312_052_422_112_133_210_052_523_430',
-            _precalculated_value='0.003_551_024_214_255_000_354_411_413_410_421_235_025_551_443_523_015_041_341_141_445_001_045_005_215_030_143_532_131_401_044_205_022_022_343_232',
-            _precalculated_reciprocal='130.150_505_051_533_533_425_315_434_301_341_122_020_403_412_230_441_455_421_130_042_243_400_140_501_150_205_140_214_553_033_015_540_253_533_220_511',
-        ),
-        'US pot': SezimalFraction(
-            '25_354_001_451_144_351_103_330_005_052_234_540_222_022_045_535 / 12_513_533_543_122_155_101_551_024_145_244_224_310_420_145_451_300',
-            _precalculated_value='0.001_553_312_105_125_300_155_203_504_503_210_415_312_553_521_541_305_320_450_350_522_300_322_302_405_313_051_544_043_500_322_102_311_011_151_414',
-            _precalculated_reciprocal='300.341_414_143_511_511_255_035_313_003_122_244_041_211_224_501_323_355_242_300_124_531_200_321_402_340_414_320_433_550_110_035_520_551_510_441_422',
-        ),
-        'US gal': SezimalFraction(
-            '25_354_001_451_144_351_103_330_005_052_234_540_222_022_045_535 / 25_431_511_530_244_354_203_542_052_334_532_453_021_240_335_343_000',
-            _precalculated_value='0.000_554_434_032_342_430_055_401_532_231_403_205_434_254_540_550_432_440_223_153_241_130_141_131_202_434_323_552_021_530_141_031_133_303_353_505',
-            _precalculated_reciprocal='1001.123_232_331_423_422_554_115_030_010_244_532_122_422_453_403_051_154_525_000_253_502_401_043_205_121_233_041_311_540_220_115_441_543_421_323_244',
-        ),
-        'US bbl': SezimalFraction(
-            '2_304_505_222_431_304_242_120_505_513_435_503_252_511_055_045 / 211_525_225_345_032_544_325_443_402_421_103_404_440_302_424_151_300',
-            _precalculated_value='0.000_010_452_411_302_321_415_230_202_533_433_453_154_232_312_115_500_031_021_020_253_540_001_540_013_121_505_352_240_235_234_302_154_221_455_210',
-            _precalculated_reciprocal='51_403.000_000_343_443_404_123_511_043_535_415_111_222_054_524_543_022_501_421_323_234_050_055_253_432_413_025_120_224_150_140_545_141_443_251_301_050',
-        ),
-        'US bbl oil': SezimalFraction(
-            '2_304_505_222_431_304_242_120_505_513_435_503_252_511_055_045 / 254_315_115_302_443_542_035_420_523_345_324_530_212_403_353_430_000',
-            _precalculated_value='0.000_005_040_305_344_531_142_321_432_111_154_210_554_453_223_055_513_022_143_443_211_243_001_243_010_531_221_123_200_155_324_514_424_444_212_304',
-            _precalculated_reciprocal='110_124.000_000_501_020_525_353_053_301_131_342_533_510_514_314_340_031_442_150_032_325_304_115_153_003_340_034_544_313_424_213_143_014_220_350_001_304',
-        ),
-        'US hogshead': SezimalFraction(
-            '2_304_505_222_431_304_242_120_505_513_435_503_252_511_055_045 / 423_454_455_134_105_533_055_331_205_242_211_213_321_005_252_343_000',
-            _precalculated_value='0.000_003_224_203_431_140_505_413_101_244_514_524_355_114_134_035_530_013_310_310_124_550_000_550_004_340_532_454_120_115_415_131_055_110_525_403',
-            _precalculated_reciprocal='143_210.000_001_131_331_212_251_422_131_515_234_222_444_153_453_530_045_403_243_050_512_140_154_551_305_230_054_240_452_340_321_534_323_330_543_002_140',
-        ),
-        'US pt dry': SezimalFraction(
-            '1_020_520_503_252_221_552_121_041_350_432_302_441_335_355_140_035_252 / 53_252_403_433_003_103_303_220_025_235_312_333_412_323_220_345_541_513',
-            _precalculated_value='0.010_500_304_535_030_010_533_323_523_004_311_435_233_512_324_313_500_512_351_335_002_241_352_232_452_320_324_401_513_411_123_030_340_543_334_413',
-            _precalculated_reciprocal='51.333_142_305_155_354_500_233_525_245_431_352_502_101_311_320_424_504_535_012_310_322_212_025_005_044_415_452_314_302_300_455_124_211_123_032_325',
-        ),
-        'US qt dry': SezimalFraction(
-            '310_240_231_424_110_554_040_320_453_214_131_220_445_455_350_015_424 / 53_252_403_433_003_103_303_220_025_235_312_333_412_323_220_345_541_513',
-            _precalculated_value='0.003_230_132_245_313_003_244_441_541_302_133_515_414_534_142_134_530_234_153_445_301_120_454_114_224_140_142_200_534_503_341_313_150_251_445_205',
-            _precalculated_reciprocal='143.110_325_014_355_153_400_511_454_535_303_145_404_203_023_041_253_413_514_025_021_044_424_054_014_133_235_345_033_005_001_354_252_422_250_105_054',
-        ),
-        'US gal dry': SezimalFraction(
-            '44_340_034_534_014_425_310_050_112_202_321_503_111_242_524_302_534 / 53_252_403_433_003_103_303_220_025_235_312_333_412_323_220_345_541_513',
-            _precalculated_value='0.000_504_322_041_215_130_511_110_253_213_322_245_532_422_323_322_421_335_325_241_213_150_112_315_334_023_023_330_122_413_523_215_154_341_541_201',
-            _precalculated_reciprocal='1100.442_152_110_353_142_403_251_151_434_021_114_425_220_140_245_542_503_304_152_124_310_544_344_105_021_434_312_220_032_010_345_534_533_520_432_343',
-        ),
-        'US pk': SezimalFraction(
-            '22_150_015_245_005_212_433_023_034_101_140_531_333_421_242_131_245 / 53_252_403_433_003_103_303_220_025_235_312_333_412_323_220_345_541_513',
-            _precalculated_value='0.000_232_141_020_405_343_233_333_124_404_441_122_544_211_141_441_210_445_442_420_404_353_034_135_445_011_311_443_041_204_541_405_355_150_550_401',
-            _precalculated_reciprocal='2201.324_344_221_150_325_210_542_343_312_042_233_254_440_320_535_525_411_012_344_253_021_533_132_214_043_313_024_440_104_021_135_513_511_441_305_131',
-        ),
-        'US pk dry': SezimalFraction(
-            '22_150_015_245_005_212_433_023_034_101_140_531_333_421_242_131_245 / 53_252_403_433_003_103_303_220_025_235_312_333_412_323_220_345_541_513',
-            _precalculated_value='0.000_232_141_020_405_343_233_333_124_404_441_122_544_211_141_441_210_445_442_420_404_353_034_135_445_011_311_443_041_204_541_405_355_150_550_401',
-            _precalculated_reciprocal='2201.324_344_221_150_325_210_542_343_312_042_233_254_440_320_535_525_411_012_344_253_021_533_132_214_043_313_024_440_104_021_135_513_511_441_305_131',
-        ),
-        'US bu': SezimalFraction(
-            '22_150_015_245_005_212_433_023_034_101_140_531_333_421_242_131_245 / 341_534_423_020_020_422_021_320_153_434_054_222_454_141_322_315_451_300',
-            _precalculated_value='0.000_035_023_133_101_223_505_222_151_101_110_150_424_031_453_240_201_411_240_403_101_055_135_322_541_131_514_540_440_201_123_231_225_454_424_400',
-            _precalculated_reciprocal='13_210.150_305_325_122_153_243_454_302_052_253_421_551_042_123_435_354_444_054_305_540_131_421_013_304_302_100_151_040_424_125_035_303_251_050_033_003',
-        ),
-        'US bu dry': SezimalFraction(
-            '22_150_015_245_005_212_433_023_034_101_140_531_333_421_242_131_245 / 341_534_423_020_020_422_021_320_153_434_054_222_454_141_322_315_451_300',
-            _precalculated_value='0.000_035_023_133_101_223_505_222_151_101_110_150_424_031_453_240_201_411_240_403_101_055_135_322_541_131_514_540_440_201_123_231_225_454_424_400',
-            _precalculated_reciprocal='13_210.150_305_325_122_153_243_454_302_052_253_421_551_042_123_435_354_444_054_305_540_131_421_013_304_302_100_151_040_424_125_035_303_251_050_033_003',
-        ),
-        'US bbl dry': SezimalFraction(
-            '2_304_505_222_431_304_242_120_505_513_435_503_252_511_055_045 / 205_254_201_454_432_155_204_055_322_351_155_114_031_223_430_000_000',
-            _precalculated_value='0.000_011_010_420_125_134_005_005_230_435_323_430_341_213_532_504_154_544_353_414_344_131_045_001_100_304_100_111_330_242_230_414_135_033_002_415',
-            _precalculated_reciprocal='50_415.345_242_442_541_431_215_004_422_001_103_120_343_525_253_522_125_355_254_551_155_352_304_543_141_311_414_053_503_451_314_010_325_213_105_243_142',
-        ),
-        'imp min': SezimalFraction(
-            '1_244_231_010_313_210_232_124_410_104_241_251_012_033_353_013_252 / 1_024_102_125_040_233_021_402_004_525_211_001_122_131_133_213',
-            _precalculated_value='1210.212_525_150_323_202_150_121_012_414_322_213_144_412_410_124_442_320_230_551_111_451_044_001_231_335_304_521_324_301_033_042_312_345_414_424_154',
-            _precalculated_reciprocal='0.000_422_254_131_423_511_155_452_144_110_553_334_422_341_555_514_144_153_135_330_342_020_254_243_022_232_433_231_214_524_014_045_000_110_241_410',
-        ),
-        'imp fl s': SezimalFraction(
-            '23_453_203_532_133_531_002_345_035_342_250_204_001_025_504_024 / 1_024_102_125_040_233_021_402_004_525_211_001_122_131_133_213',
-            _precalculated_value='22.415_125_022_043_433_414_302_241_345_154_530_244_234_011_302_350_043_342_052_054_331_320_111_134_325_213_124_513_454_131_020_043_233_141_423_115',
-            _precalculated_reciprocal='0.022_401_501_054_445_202_352_153_535_551_440_034_404_223_553_341_542_225_303_420_225_053_505_101_200_331_152_243_402_052_534_404_003_533_013_504',
-        ),
-        'imp fl dr': SezimalFraction(
-            '23_453_203_532_133_531_002_345_035_342_250_204_001_025_504_024 / 3_120_310_423_201_143_105_010_022_424_033_003_410_433_444_043',
-            _precalculated_value='4.523_425_404_413_131_123_300_452_313_435_350_053_251_202_300_514_013_112_414_415_310_304_022_231_305_443_025_343_135_230_204_013_051_032_325_024',
-            _precalculated_reciprocal='0.112_005_303_252_224_011_540_545_455_535_200_152_021_115_544_505_511_124_315_101_123_245_323_304_001_433_541_215_010_242_452_020_015_443_045_315',
-        ),
-        'imp fl oz': SezimalFraction(
-            '1_551_100_254_011_123_513_155_045_541_450_443_300_045_122_002 / 3_120_310_423_201_143_105_010_022_424_033_003_410_433_444_043',
-            _precalculated_value='0.340_245_113_331_053_523_234_334_022_415_542_134_103_530_151_335_431_052_331_201_235_152_001_445_235_120_215_111_524_232_143_301_050_515_323_345',
-            _precalculated_reciprocal='1.344_112_043_511_132_143_331_434_355_310_402_304_253_435_422_514_533_540_225_213_523_432_324_052_022_051_335_024_123_354_304_240_234_201_032_221',
-        ),
-        'imp gi': SezimalFraction(
-            '221_233_410_450_125_324_133_232_220_210_054_144_454_351_334 / 3_120_310_423_201_143_105_010_022_424_033_003_410_433_444_043',
-            _precalculated_value='0.042_254_350_415_010_440_404_304_225_202_220_242_011_552_243_531_052_344_041_245_031_021_333_543_253_240_024_350_214_252_505_300_121_213_303_043',
-            _precalculated_reciprocal='12.053_004_351_200_145_245_542_505_153_353_220_334_240_514_402_230_401_422_022_521_310_450_512_424_154_422_011_213_110_144_334_122_103_405_245_543',
-        ),
-        'imp pt': SezimalFraction(
-            '110_414_503_223_042_442_044_414_110_103_025_052_225_153_445 / 10_241_021_250_402_330_214_020_045_252_110_011_221_311_332_130',
-            _precalculated_value='0.010_342_354_402_431_410_101_044_034_200_333_040_301_555_040_551_442_054_010_211_134_433_222_253_512_210_004_054_332_342_114_213_020_202_213_441',
-            _precalculated_reciprocal='52.340_030_325_201_113_515_455_233_142_341_322_225_443_310_413_402_410_532_135_330_043_123_254_545_150_532_045_300_441_110_224_532_422_433_515_454',
-        ),
-        'imp qt': SezimalFraction(
-            '110_414_503_223_042_442_044_414_110_103_025_052_225_153_445 / 20_522_042_541_205_100_432_040_134_544_220_022_443_023_104_300',
-            _precalculated_value='0.003_151_155_201_213_503_030_322_015_100_144_320_130_555_320_253_521_025_003_103_345_214_411_124_534_103_002_025_144_151_035_104_310_101_104_520',
-            _precalculated_reciprocal='145.120_101_054_402_231_435_354_510_325_123_044_455_331_021_231_205_221_504_315_100_130_250_553_534_341_504_135_001_322_220_453_505_245_311_435_352',
-        ),
-        'imp gal': SezimalFraction(
-            '110_414_503_223_042_442_044_414_110_103_025_052_225_153_445 / 123_332_255_445_232_403_012_241_031_505_320_135_100_140_430_000',
-            _precalculated_value='0.000_454_455_500_202_243_434_350_302_443_024_050_021_425_520_042_250_134_130_443_524_202_401_451_122_313_430_304_154_024_435_444_044_313_144_120',
-            _precalculated_reciprocal='1112.520_404_350_413_411_034_351_242_152_540_311_154_204_125_405_233_331_230_112_401_001_523_543_430_251_225_032_010_133_323_143_233_514_051_034_334',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'in3', 'ft3', 'yd3', 'ml3', 'ac⋅ft', 'US min', 'US fl dr', 'US tsp', 'US tbsp', 'US fl oz', 'US jig', 'US gi', 'US c', 'US cup', 'US pt', 'US pint', 'US qt', 'US pot', 'US gal', 'US bbl', 'US bbl oil', 'US hogshead', 'US pt dry', 'US qt dry', 'US gal dry', 'US pk', 'US pk dry', 'US bu', 'US bu dry', 'US bbl dry', 'imp min', 'imp fl s', 'imp fl dr', 'imp fl oz', 'imp gi', 'imp pt', 'imp qt', 'imp gal'),
-    },
-    'pad3': {
-        'm3': SezimalFraction(
-            '5_034_014_323_452_000_002_250_221_154_033_330_125 / 10_135_315_134_322_154_010_401_232_444_043_000_000_000_000',
-            _precalculated_value='0.000_000_451_334_451_310_421_443_002_134_534_121_443_200_341_251_242_510_414_301_401_535_423_201_235_512_420_532_501_505_554_430_214_424_125_312',
-            _precalculated_reciprocal='1_121_404.122_242_004_410_343_430_330_401_245_230_144_130_015_153_213_333_522_333_250_124_355_155_045_325_043_523_134_332_052_234_250_334_435_212_543_532',
-        ),
-        'L': SezimalFraction(
-            '2_541_432_041_352_504_001_233_131_213_322_254_020_401 / 441_235_524_153_142_430_500_102_333_303_213_000_000_000',
-            _precalculated_value='0.003_432_553_340_351_054_303_414_304_504_130_305_120_105_542_545_412_231_151_431_355_121_404_003_505_422_305_453_541_030_115_435_021_515_504_002',
-            _precalculated_reciprocal='133.215_505_232_004_245_353_350_444_302_524_233_450_325_420_123_135_033_051_355_424_154_043_300_402_205_050_115_210_153_052_532_041_341_353_321_100',
-        ),
-        'l': SezimalFraction(
-            '2_541_432_041_352_504_001_233_131_213_322_254_020_401 / 441_235_524_153_142_430_500_102_333_303_213_000_000_000',
-            _precalculated_value='0.003_432_553_340_351_054_303_414_304_504_130_305_120_105_542_545_412_231_151_431_355_121_404_003_505_422_305_453_541_030_115_435_021_515_504_002',
-            _precalculated_reciprocal='133.215_505_232_004_245_353_350_444_302_524_233_450_325_420_123_135_033_051_355_424_154_043_300_402_205_050_115_210_153_052_532_041_341_353_321_100',
-        ),
-        'prefixed': ('m3', 'L', 'l'),
-        'comparable': ('ayt', 'pad3'),
-        'in3': SezimalFraction(
-            '323_334_020_403_032_302_141_030_100_015_024_342_442_242_545_325 / 312_123_302_424_050_255_010_125_203_544_554_453_045_035_343_000',
-            _precalculated_value='1.021_403_344_020_035_232_053_021_202_014_332_101_020_213_113_222_120_033_215_135_001_015_302_104_544_050_331_442_515_015_155_334_302_224_412_452',
-            _precalculated_reciprocal='0.535_044_241_444_424_330_120_454_401_521_554_555_141_244_453_210_403_040_121_321_025_342_201_553_310_143_015_155_322_235_424_034_124_154_451_221',
-        ),
-        'ft3': SezimalFraction(
-            '323_334_020_403_032_302_141_030_100_015_024_342_442_242_545_325 / 4_145_524_033_533_043_544_121_550_451_423_542_321_024_513_000_000_000',
-            _precalculated_value='0.000_044_413_242_001_302_532_304_044_400_131_154_004_344_314_052_401_440_002_401_224_213_044_234_435_042_003_453_550_205_514_225_541_151_445_031',
-            _precalculated_reciprocal='11_305.015_342_221_540_401_450_341_223_103_543_550_135_422_322_525_240_521_500_252_352_550_423_524_122_200_230_352_311_313_532_453_534_342_255_044_420',
-        ),
-        'yd3': SezimalFraction(
-            '323_334_020_403_032_302_141_030_100_015_024_342_442_242_545_325 / 312_123_302_424_050_255_010_125_203_544_554_453_045_035_343_000_000_000',
-            _precalculated_value='0.000_001_021_403_344_020_035_232_053_021_202_014_332_101_020_213_113_222_120_033_215_135_001_015_302_104_544_050_331_442_515_015_155_334_302_225',
-            _precalculated_reciprocal='535_044.241_444_424_330_120_454_401_521_554_555_141_244_453_210_403_040_121_321_025_342_201_553_310_143_015_155_322_235_424_034_124_154_451_220_331_304',
-        ),
-        'ml3': SezimalFraction(
-            '553_330_125_003_341_534_355_322_550_523_221_430_022_341_001 / 2_155_020_103_144_331_504_015_534_031_053_051_041_331_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_231_412_523_425_201_241_120_220_255_432_331_415_454_243_224_222_041_150_112_032_411_420_234_512_051_054_154_510_402_125',
-            _precalculated_reciprocal='2_204_425_023_404_242_021.514_531_204_322_221_223_225_001_433_123_245_444_532_550_544_242_334_105_115_051_345_220_232_243_255_031_025_055_101_532_330_301_224_541_243_234',
-        ),
-        'ac⋅ft': SezimalFraction(
-            '40_415_340_045_230_300_242_341_122_224_340_531_431_405_221_041 / 445_350_141_232_320_115_514_355_410_452_111_323_135_252_343_000_000_000_000',
-            _precalculated_value='0.000_000_000_050_430_115_045_040_111_222_103_553_230_152_323_254_342_223_042_312_223_042_051_034_553_545_404_352_404_200_031_355_430_520_423_532',
-            _precalculated_reciprocal='11_005_115_103.451_324_432_044_410_315_022_151_101_153_434_214_031_402_444_550_101_412_542_031_144_113_354_540_345_113_113_434_255_244_102_123_205_052_243_520',
-        ),
-        'US min': SezimalFraction(
-            '545_135_021_245_342_053_325_045_341_012_245_142_300_011_322_501_532 / 423_454_455_134_105_533_055_331_205_242_211_213_321_005_252_343',
-            _precalculated_value='1150.453_500_534_201_034_551_420_213_342_255_425_250_341_012_114_154_353_354_042_422_332_355_554_524_125_013_532_314_520_240_252_104_212_050_125_303',
-            _precalculated_reciprocal='0.000_432_544_251_215_300_250_302_004_412_022_205_554_053_043_242_250_544_022_005_052_032_550_535_204_444_415_354_534_152_245_514_504_442_123_434',
-        ),
-        'US fl dr': SezimalFraction(
-            '14_244_053_023_514_150_251_242_403_015_120_133_043_000_213_424_144 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='4.414_055_225_434_452_441_043_450_054_350_332_405_151_003_423_101_102_205_545_125_013_202_222_214_245_403_433_201_552_001_335_200_401_200_300_521',
-            _precalculated_reciprocal='0.113_453_524_415_110_044_250_321_150_123_553_355_253_111_343_204_333_443_521_232_525_454_332_253_155_551_123_412_111_004_145_003_155_142_214_102',
-        ),
-        'US tsp': SezimalFraction(
-            '2_341_012_133_545_324_341_510_400_432_450_022_140_430_032_234_024 / 423_454_455_134_105_533_055_331_205_242_211_213_321_005_252_343',
-            _precalculated_value='3.311_342_321_155_040_330_502_504_341_551_540_303_552_132_445_213_514_434_250_533_441_001_444_441_504_132_454_001_253_001_112_300_301_000_213_400',
-            _precalculated_reciprocal='0.141_033_114_142_532_101_544_425_424_153_152_515_152_134_100_250_045_021_105_523_515_434_043_152_235_545_352_534_533_205_422_404_235_015_101_322',
-        ),
-        'US tbsp': SezimalFraction(
-            '2_341_012_133_545_324_341_510_400_432_450_022_140_430_032_234_024 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='1.102_312_504_235_412_110_140_541_312_354_352_101_154_430_533_443_143_331_254_151_132_200_333_332_341_230_535_200_255_000_222_500_100_200_043_120',
-            _precalculated_reciprocal='0.503_143_350_512_440_305_522_125_120_543_542_353_540_450_301_230_223_103_325_415_355_150_213_541_155_524_542_452_444_025_112_021_153_053_304_411',
-        ),
-        'US fl oz': SezimalFraction(
-            '1_150_304_044_552_442_150_533_200_214_223_011_050_213_014_115_012 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='0.331_134_232_115_504_033_050_250_434_155_154_030_355_213_244_521_351_443_425_053_344_100_144_444_150_413_245_400_125_300_111_230_030_100_021_340',
-            _precalculated_reciprocal='1.410_331_141_425_321_015_444_254_241_531_525_151_521_341_002_500_450_211_055_235_154_340_431_522_355_453_525_345_332_054_224_042_350_151_013_223',
-        ),
-        'US jig': SezimalFraction(
-            '2_341_012_133_545_324_341_510_400_432_450_022_140_430_032_234_024 / 10_354_241_245_231_425_214_252_150_121_033_150_222_013_121_205_343',
-            _precalculated_value='0.220_502_541_251_522_422_032_152_302_515_314_420_235_330_151_133_033_110_255_234_230_440_111_110_512_250_151_440_055_400_044_540_020_040_013_024',
-            _precalculated_reciprocal='2.313_514_532_342_201_325_410_423_402_515_511_545_502_231_304_131_113_314_425_054_553_531_045_503_555_422_512_242_220_123_340_103_543_244_322_034',
-        ),
-        'US gi': SezimalFraction(
-            '154_344_011_125_110_324_422_200_032_333_431_441_332_132_315_432 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='0.051_452_335_015_544_005_141_341_405_325_455_304_355_502_211_120_224_540_534_142_224_013_024_111_024_402_211_230_021_213_014_504_304_313_003_223',
-            _precalculated_reciprocal='10.442_205_050_554_124_115_105_545_451_411_353_131_330_244_015_203_121_244_353_433_150_243_011_334_355_143_354_314_212_345_344_254_321_124_101_335',
-        ),
-        'US c': SezimalFraction(
-            '55_152_003_342_333_142_211_100_014_144_513_520_444_044_135_514 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='0.023_524_145_305_552_002_350_450_502_442_525_432_155_531_103_340_112_250_245_051_112_004_312_033_312_201_103_413_010_404_305_232_132_134_301_412',
-            _precalculated_reciprocal='21.324_414_141_552_252_234_215_535_343_223_150_303_100_532_034_410_242_533_151_310_340_530_023_113_154_331_153_032_425_135_132_553_042_252_203_115',
-        ),
-        'US cup': SezimalFraction(
-            '55_152_003_342_333_142_211_100_014_144_513_520_444_044_135_514 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='0.023_524_145_305_552_002_350_450_502_442_525_432_155_531_103_340_112_250_245_051_112_004_312_033_312_201_103_413_010_404_305_232_132_134_301_412',
-            _precalculated_reciprocal='21.324_414_141_552_252_234_215_535_343_223_150_303_100_532_034_410_242_533_151_310_340_530_023_113_154_331_153_032_425_135_132_553_042_252_203_115',
-        ),
-        'US pt': SezimalFraction(
-            '25_354_001_451_144_351_103_330_005_052_234_540_222_022_045_535 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='0.011_542_052_432_554_001_153_223_231_221_242_514_055_543_331_450_034_123_122_323_334_002_134_014_434_100_331_504_303_202_132_414_044_045_130_504',
-            _precalculated_reciprocal='43.053_232_323_544_544_512_435_515_130_450_341_010_201_504_113_220_525_510_343_021_121_500_050_230_353_102_350_105_254_314_305_550_124_544_410_234',
-        ),
-        'US pint': SezimalFraction(
-            '25_354_001_451_144_351_103_330_005_052_234_540_222_022_045_535 / 2_115_252_253_450_325_443_254_434_024_211_034_044_403_024_241_513',
-            _precalculated_value='0.011_542_052_432_554_001_153_223_231_221_242_514_055_543_331_450_034_123_122_323_334_002_134_014_434_100_331_504_303_202_132_414_044_045_130_504',
-            _precalculated_reciprocal='43.053_232_323_544_544_512_435_515_130_450_341_010_201_504_113_220_525_510_343_021_121_500_050_230_353_102_350_105_254_314_305_550_124_544_410_234',
-        ),
-        'US qt': SezimalFraction(
-            '25_354_001_451_144_351_103_330_005_052_234_540_222_022_045_535 / 4_234_544_551_341_055_330_553_312_052_422_112_133_210_052_523_430',
-            _precalculated_value='0.003_551_024_214_255_000_354_411_413_410_421_235_025_551_443_523_015_041_341_141_445_001_045_005_215_030_143_532_131_401_044_205_022_022_343_232',
-            _precalculated_reciprocal='130.150_505_051_533_533_425_315_434_301_341_122_020_403_412_230_441_455_421_130_042_243_400_140_501_150_205_140_214_553_033_015_540_253_533_220_511',
-        ),
-        'US pot': SezimalFraction(
-            '25_354_001_451_144_351_103_330_005_052_234_540_222_022_045_535 / 12_513_533_543_122_155_101_551_024_145_244_224_310_420_145_451_300',
-            _precalculated_value='0.001_553_312_105_125_300_155_203_504_503_210_415_312_553_521_541_305_320_450_350_522_300_322_302_405_313_051_544_043_500_322_102_311_011_151_414',
-            _precalculated_reciprocal='300.341_414_143_511_511_255_035_313_003_122_244_041_211_224_501_323_355_242_300_124_531_200_321_402_340_414_320_433_550_110_035_520_551_510_441_422',
-        ),
-        'US gal': SezimalFraction(
-            '25_354_001_451_144_351_103_330_005_052_234_540_222_022_045_535 / 25_431_511_530_244_354_203_542_052_334_532_453_021_240_335_343_000',
-            _precalculated_value='0.000_554_434_032_342_430_055_401_532_231_403_205_434_254_540_550_432_440_223_153_241_130_141_131_202_434_323_552_021_530_141_031_133_303_353_505',
-            _precalculated_reciprocal='1001.123_232_331_423_422_554_115_030_010_244_532_122_422_453_403_051_154_525_000_253_502_401_043_205_121_233_041_311_540_220_115_441_543_421_323_244',
-        ),
-        'US bbl': SezimalFraction(
-            '2_304_505_222_431_304_242_120_505_513_435_503_252_511_055_045 / 211_525_225_345_032_544_325_443_402_421_103_404_440_302_424_151_300',
-            _precalculated_value='0.000_010_452_411_302_321_415_230_202_533_433_453_154_232_312_115_500_031_021_020_253_540_001_540_013_121_505_352_240_235_234_302_154_221_455_210',
-            _precalculated_reciprocal='51_403.000_000_343_443_404_123_511_043_535_415_111_222_054_524_543_022_501_421_323_234_050_055_253_432_413_025_120_224_150_140_545_141_443_251_301_050',
-        ),
-        'US bbl oil': SezimalFraction(
-            '2_304_505_222_431_304_242_120_505_513_435_503_252_511_055_045 / 254_315_115_302_443_542_035_420_523_345_324_530_212_403_353_430_000',
-            _precalculated_value='0.000_005_040_305_344_531_142_321_432_111_154_210_554_453_223_055_513_022_143_443_211_243_001_243_010_531_221_123_200_155_324_514_424_444_212_304',
-            _precalculated_reciprocal='110_124.000_000_501_020_525_353_053_301_131_342_533_510_514_314_340_031_442_150_032_325_304_115_153_003_340_034_544_313_424_213_143_014_220_350_001_304',
-        ),
-        'US hogshead': SezimalFraction(
-            '2_304_505_222_431_304_242_120_505_513_435_503_252_511_055_045 / 423_454_455_134_105_533_055_331_205_242_211_213_321_005_252_343_000',
-            _precalculated_value='0.000_003_224_203_431_140_505_413_101_244_514_524_355_114_134_035_530_013_310_310_124_550_000_550_004_340_532_454_120_115_415_131_055_110_525_403',
-            _precalculated_reciprocal='143_210.000_001_131_331_212_251_422_131_515_234_222_444_153_453_530_045_403_243_050_512_140_154_551_305_230_054_240_452_340_321_534_323_330_543_002_140',
-        ),
-        'US pt dry': SezimalFraction(
-            '1_020_520_503_252_221_552_121_041_350_432_302_441_335_355_140_035_252 / 53_252_403_433_003_103_303_220_025_235_312_333_412_323_220_345_541_513',
-            _precalculated_value='0.010_500_304_535_030_010_533_323_523_004_311_435_233_512_324_313_500_512_351_335_002_241_352_232_452_320_324_401_513_411_123_030_340_543_334_413',
-            _precalculated_reciprocal='51.333_142_305_155_354_500_233_525_245_431_352_502_101_311_320_424_504_535_012_310_322_212_025_005_044_415_452_314_302_300_455_124_211_123_032_325',
-        ),
-        'US qt dry': SezimalFraction(
-            '310_240_231_424_110_554_040_320_453_214_131_220_445_455_350_015_424 / 53_252_403_433_003_103_303_220_025_235_312_333_412_323_220_345_541_513',
-            _precalculated_value='0.003_230_132_245_313_003_244_441_541_302_133_515_414_534_142_134_530_234_153_445_301_120_454_114_224_140_142_200_534_503_341_313_150_251_445_205',
-            _precalculated_reciprocal='143.110_325_014_355_153_400_511_454_535_303_145_404_203_023_041_253_413_514_025_021_044_424_054_014_133_235_345_033_005_001_354_252_422_250_105_054',
-        ),
-        'US gal dry': SezimalFraction(
-            '44_340_034_534_014_425_310_050_112_202_321_503_111_242_524_302_534 / 53_252_403_433_003_103_303_220_025_235_312_333_412_323_220_345_541_513',
-            _precalculated_value='0.000_504_322_041_215_130_511_110_253_213_322_245_532_422_323_322_421_335_325_241_213_150_112_315_334_023_023_330_122_413_523_215_154_341_541_201',
-            _precalculated_reciprocal='1100.442_152_110_353_142_403_251_151_434_021_114_425_220_140_245_542_503_304_152_124_310_544_344_105_021_434_312_220_032_010_345_534_533_520_432_343',
-        ),
-        'US pk': SezimalFraction(
-            '22_150_015_245_005_212_433_023_034_101_140_531_333_421_242_131_245 / 53_252_403_433_003_103_303_220_025_235_312_333_412_323_220_345_541_513',
-            _precalculated_value='0.000_232_141_020_405_343_233_333_124_404_441_122_544_211_141_441_210_445_442_420_404_353_034_135_445_011_311_443_041_204_541_405_355_150_550_401',
-            _precalculated_reciprocal='2201.324_344_221_150_325_210_542_343_312_042_233_254_440_320_535_525_411_012_344_253_021_533_132_214_043_313_024_440_104_021_135_513_511_441_305_131',
-        ),
-        'US pk dry': SezimalFraction(
-            '22_150_015_245_005_212_433_023_034_101_140_531_333_421_242_131_245 / 53_252_403_433_003_103_303_220_025_235_312_333_412_323_220_345_541_513',
-            _precalculated_value='0.000_232_141_020_405_343_233_333_124_404_441_122_544_211_141_441_210_445_442_420_404_353_034_135_445_011_311_443_041_204_541_405_355_150_550_401',
-            _precalculated_reciprocal='2201.324_344_221_150_325_210_542_343_312_042_233_254_440_320_535_525_411_012_344_253_021_533_132_214_043_313_024_440_104_021_135_513_511_441_305_131',
-        ),
-        'US bu': SezimalFraction(
-            '22_150_015_245_005_212_433_023_034_101_140_531_333_421_242_131_245 / 341_534_423_020_020_422_021_320_153_434_054_222_454_141_322_315_451_300',
-            _precalculated_value='0.000_035_023_133_101_223_505_222_151_101_110_150_424_031_453_240_201_411_240_403_101_055_135_322_541_131_514_540_440_201_123_231_225_454_424_400',
-            _precalculated_reciprocal='13_210.150_305_325_122_153_243_454_302_052_253_421_551_042_123_435_354_444_054_305_540_131_421_013_304_302_100_151_040_424_125_035_303_251_050_033_003',
-        ),
-        'US bu dry': SezimalFraction(
-            '22_150_015_245_005_212_433_023_034_101_140_531_333_421_242_131_245 / 341_534_423_020_020_422_021_320_153_434_054_222_454_141_322_315_451_300',
-            _precalculated_value='0.000_035_023_133_101_223_505_222_151_101_110_150_424_031_453_240_201_411_240_403_101_055_135_322_541_131_514_540_440_201_123_231_225_454_424_400',
-            _precalculated_reciprocal='13_210.150_305_325_122_153_243_454_302_052_253_421_551_042_123_435_354_444_054_305_540_131_421_013_304_302_100_151_040_424_125_035_303_251_050_033_003',
-        ),
-        'US bbl dry': SezimalFraction(
-            '2_304_505_222_431_304_242_120_505_513_435_503_252_511_055_045 / 205_254_201_454_432_155_204_055_322_351_155_114_031_223_430_000_000',
-            _precalculated_value='0.000_011_010_420_125_134_005_005_230_435_323_430_341_213_532_504_154_544_353_414_344_131_045_001_100_304_100_111_330_242_230_414_135_033_002_415',
-            _precalculated_reciprocal='50_415.345_242_442_541_431_215_004_422_001_103_120_343_525_253_522_125_355_254_551_155_352_304_543_141_311_414_053_503_451_314_010_325_213_105_243_142',
-        ),
-        'imp min': SezimalFraction(
-            '1_244_231_010_313_210_232_124_410_104_241_251_012_033_353_013_252 / 1_024_102_125_040_233_021_402_004_525_211_001_122_131_133_213',
-            _precalculated_value='1210.212_525_150_323_202_150_121_012_414_322_213_144_412_410_124_442_320_230_551_111_451_044_001_231_335_304_521_324_301_033_042_312_345_414_424_154',
-            _precalculated_reciprocal='0.000_422_254_131_423_511_155_452_144_110_553_334_422_341_555_514_144_153_135_330_342_020_254_243_022_232_433_231_214_524_014_045_000_110_241_410',
-        ),
-        'imp fl s': SezimalFraction(
-            '23_453_203_532_133_531_002_345_035_342_250_204_001_025_504_024 / 1_024_102_125_040_233_021_402_004_525_211_001_122_131_133_213',
-            _precalculated_value='22.415_125_022_043_433_414_302_241_345_154_530_244_234_011_302_350_043_342_052_054_331_320_111_134_325_213_124_513_454_131_020_043_233_141_423_115',
-            _precalculated_reciprocal='0.022_401_501_054_445_202_352_153_535_551_440_034_404_223_553_341_542_225_303_420_225_053_505_101_200_331_152_243_402_052_534_404_003_533_013_504',
-        ),
-        'imp fl dr': SezimalFraction(
-            '23_453_203_532_133_531_002_345_035_342_250_204_001_025_504_024 / 3_120_310_423_201_143_105_010_022_424_033_003_410_433_444_043',
-            _precalculated_value='4.523_425_404_413_131_123_300_452_313_435_350_053_251_202_300_514_013_112_414_415_310_304_022_231_305_443_025_343_135_230_204_013_051_032_325_024',
-            _precalculated_reciprocal='0.112_005_303_252_224_011_540_545_455_535_200_152_021_115_544_505_511_124_315_101_123_245_323_304_001_433_541_215_010_242_452_020_015_443_045_315',
-        ),
-        'imp fl oz': SezimalFraction(
-            '1_551_100_254_011_123_513_155_045_541_450_443_300_045_122_002 / 3_120_310_423_201_143_105_010_022_424_033_003_410_433_444_043',
-            _precalculated_value='0.340_245_113_331_053_523_234_334_022_415_542_134_103_530_151_335_431_052_331_201_235_152_001_445_235_120_215_111_524_232_143_301_050_515_323_345',
-            _precalculated_reciprocal='1.344_112_043_511_132_143_331_434_355_310_402_304_253_435_422_514_533_540_225_213_523_432_324_052_022_051_335_024_123_354_304_240_234_201_032_221',
-        ),
-        'imp gi': SezimalFraction(
-            '221_233_410_450_125_324_133_232_220_210_054_144_454_351_334 / 3_120_310_423_201_143_105_010_022_424_033_003_410_433_444_043',
-            _precalculated_value='0.042_254_350_415_010_440_404_304_225_202_220_242_011_552_243_531_052_344_041_245_031_021_333_543_253_240_024_350_214_252_505_300_121_213_303_043',
-            _precalculated_reciprocal='12.053_004_351_200_145_245_542_505_153_353_220_334_240_514_402_230_401_422_022_521_310_450_512_424_154_422_011_213_110_144_334_122_103_405_245_543',
-        ),
-        'imp pt': SezimalFraction(
-            '110_414_503_223_042_442_044_414_110_103_025_052_225_153_445 / 10_241_021_250_402_330_214_020_045_252_110_011_221_311_332_130',
-            _precalculated_value='0.010_342_354_402_431_410_101_044_034_200_333_040_301_555_040_551_442_054_010_211_134_433_222_253_512_210_004_054_332_342_114_213_020_202_213_441',
-            _precalculated_reciprocal='52.340_030_325_201_113_515_455_233_142_341_322_225_443_310_413_402_410_532_135_330_043_123_254_545_150_532_045_300_441_110_224_532_422_433_515_454',
-        ),
-        'imp qt': SezimalFraction(
-            '110_414_503_223_042_442_044_414_110_103_025_052_225_153_445 / 20_522_042_541_205_100_432_040_134_544_220_022_443_023_104_300',
-            _precalculated_value='0.003_151_155_201_213_503_030_322_015_100_144_320_130_555_320_253_521_025_003_103_345_214_411_124_534_103_002_025_144_151_035_104_310_101_104_520',
-            _precalculated_reciprocal='145.120_101_054_402_231_435_354_510_325_123_044_455_331_021_231_205_221_504_315_100_130_250_553_534_341_504_135_001_322_220_453_505_245_311_435_352',
-        ),
-        'imp gal': SezimalFraction(
-            '110_414_503_223_042_442_044_414_110_103_025_052_225_153_445 / 123_332_255_445_232_403_012_241_031_505_320_135_100_140_430_000',
-            _precalculated_value='0.000_454_455_500_202_243_434_350_302_443_024_050_021_425_520_042_250_134_130_443_524_202_401_451_122_313_430_304_154_024_435_444_044_313_144_120',
-            _precalculated_reciprocal='1112.520_404_350_413_411_034_351_242_152_540_311_154_204_125_405_233_331_230_112_401_001_523_543_430_251_225_032_010_133_323_143_233_514_051_034_334',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'in3', 'ft3', 'yd3', 'ml3', 'ac⋅ft', 'US min', 'US fl dr', 'US tsp', 'US tbsp', 'US fl oz', 'US jig', 'US gi', 'US c', 'US cup', 'US pt', 'US pint', 'US qt', 'US pot', 'US gal', 'US bbl', 'US bbl oil', 'US hogshead', 'US pt dry', 'US qt dry', 'US gal dry', 'US pk', 'US pk dry', 'US bu', 'US bu dry', 'US bbl dry', 'imp min', 'imp fl s', 'imp fl dr', 'imp fl oz', 'imp gi', 'imp pt', 'imp qt', 'imp gal'),
-    },
-    'veg': {
-        'm/s': SezimalFraction(
-            '22_512_444_005 / 45_302_415_520',
-            _precalculated_value='0.300_510_054_353_300_411_102_533_330_433_110_331_133_550_420_032_320_420_310_315_212_535_141_403_113_120_240_553_200_112_101_404_230_101_444_102',
-            _precalculated_reciprocal='1.552_325_130_432_420_104_245_404_520_445_523_205_255_213_515_424_430_034_335_230_234_202_255_031_501_002_414_503_054_111_113_013_115_531_032_400',
-        ),
-        'm/h': SezimalFraction(
-            '14_155_035_243_250 / 1_121_340_255',
-            _precalculated_value='12_222.210_401_330_215_355_400_515_440_425_141_453_050_132_013_330_352_024_501_113_325_004_032_005_253_423_252_243_323_224_124_041_342_525_541_321_413',
-            _precalculated_reciprocal='0.000_041_414_221_211_000_421_540_453_225_154_525_252_002_042_302_510_433_125_110_240_051_325_232_454_151_004_252_155_245_224_554_214_344_443_442',
-        ),
-        'prefixed': ('m/s', 'm/h'),
-        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
-        'km/h': SezimalFraction(
-            '112_342_220_023 / 40_332_133_524',
-            _precalculated_value='1.451_522_551_054_113_415_240_543_151_315_302_042_055_525_000_202_002_335_301_553_425_442_121_130_430_450_225_542_223_045_232_250_145_232_511_454',
-            _precalculated_reciprocal='0.315_014_443_113_431_215_124_125_205_320_150_133_305_454_425_132_353_010_140_301_042_112_405_425_302_140_431_002_513_300_000_302_321_151_145_424',
-        ),
-        'ml/s': SezimalFraction(
-            '12_335_131_314_521 / 331_130_022_452_304_000',
-            _precalculated_value='0.000_022_335_551_501_010_343_154_221_353_413_523_355_125_440_235_344_105_511_501_331_012_000_405_020_225_155_304_043_221_310_342_534_142_452_313',
-            _precalculated_reciprocal='22_441.112_242_044_022_000_510_132_230_553_550_452_301_555_320_305_355_525_453_535_120_004_215_355_435_142_142_435_420_152_254_203_342_045_323_245_011',
-        ),
-        'ml/h': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'mph': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'kn': SezimalFraction(
-            '5_055_315_421_423 / 5_134_410_002_414',
-            _precalculated_value='0.551_335_512_105_444_324_020_122_205_310_240_441_003_021_311_225_514_203_401_410_223_205_241_550_035_310_123_212_105_241_310_440_045_421_525_020',
-            _precalculated_reciprocal='1.004_251_443_533_214_134_132_053_053_524_005_115_442_111_154_321_200_500_035_532_210_435_235_520_502_350_234_312_441_303_010_044_300_520_523_110',
-        ),
-        'c': SezimalFraction(
-            '1 / 135_005_235_440',
-            _precalculated_value='0.000_000_000_003_354_235_251_331_251_201_040_320_241_103_025_033_203_214_340_555_500_151_321_433_321_013_443_114_022_410_541_441_530_125_310_555',
-            _precalculated_reciprocal='135_005_235_440',
-        ),
-        'ft/s': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'fps': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
-    },
-    'pad/ang': {
-        'm/s': SezimalFraction(
-            '22_512_444_005 / 45_302_415_520',
-            _precalculated_value='0.300_510_054_353_300_411_102_533_330_433_110_331_133_550_420_032_320_420_310_315_212_535_141_403_113_120_240_553_200_112_101_404_230_101_444_102',
-            _precalculated_reciprocal='1.552_325_130_432_420_104_245_404_520_445_523_205_255_213_515_424_430_034_335_230_234_202_255_031_501_002_414_503_054_111_113_013_115_531_032_400',
-        ),
-        'm/h': SezimalFraction(
-            '14_155_035_243_250 / 1_121_340_255',
-            _precalculated_value='12_222.210_401_330_215_355_400_515_440_425_141_453_050_132_013_330_352_024_501_113_325_004_032_005_253_423_252_243_323_224_124_041_342_525_541_321_413',
-            _precalculated_reciprocal='0.000_041_414_221_211_000_421_540_453_225_154_525_252_002_042_302_510_433_125_110_240_051_325_232_454_151_004_252_155_245_224_554_214_344_443_442',
-        ),
-        'prefixed': ('m/s', 'm/h'),
-        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
-        'km/h': SezimalFraction(
-            '112_342_220_023 / 40_332_133_524',
-            _precalculated_value='1.451_522_551_054_113_415_240_543_151_315_302_042_055_525_000_202_002_335_301_553_425_442_121_130_430_450_225_542_223_045_232_250_145_232_511_454',
-            _precalculated_reciprocal='0.315_014_443_113_431_215_124_125_205_320_150_133_305_454_425_132_353_010_140_301_042_112_405_425_302_140_431_002_513_300_000_302_321_151_145_424',
-        ),
-        'ml/s': SezimalFraction(
-            '12_335_131_314_521 / 331_130_022_452_304_000',
-            _precalculated_value='0.000_022_335_551_501_010_343_154_221_353_413_523_355_125_440_235_344_105_511_501_331_012_000_405_020_225_155_304_043_221_310_342_534_142_452_313',
-            _precalculated_reciprocal='22_441.112_242_044_022_000_510_132_230_553_550_452_301_555_320_305_355_525_453_535_120_004_215_355_435_142_142_435_420_152_254_203_342_045_323_245_011',
-        ),
-        'ml/h': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'mph': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'kn': SezimalFraction(
-            '5_055_315_421_423 / 5_134_410_002_414',
-            _precalculated_value='0.551_335_512_105_444_324_020_122_205_310_240_441_003_021_311_225_514_203_401_410_223_205_241_550_035_310_123_212_105_241_310_440_045_421_525_020',
-            _precalculated_reciprocal='1.004_251_443_533_214_134_132_053_053_524_005_115_442_111_154_321_200_500_035_532_210_435_235_520_502_350_234_312_441_303_010_044_300_520_523_110',
-        ),
-        'c': SezimalFraction(
-            '1 / 135_005_235_440',
-            _precalculated_value='0.000_000_000_003_354_235_251_331_251_201_040_320_241_103_025_033_203_214_340_555_500_151_321_433_321_013_443_114_022_410_541_441_530_125_310_555',
-            _precalculated_reciprocal='135_005_235_440',
-        ),
-        'ft/s': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'fps': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
-    },
-    'XDpad/din': {
-        'm/s': SezimalFraction(
-            '22_512_444_005 / 45_302_415_520',
-            _precalculated_value='0.300_510_054_353_300_411_102_533_330_433_110_331_133_550_420_032_320_420_310_315_212_535_141_403_113_120_240_553_200_112_101_404_230_101_444_102',
-            _precalculated_reciprocal='1.552_325_130_432_420_104_245_404_520_445_523_205_255_213_515_424_430_034_335_230_234_202_255_031_501_002_414_503_054_111_113_013_115_531_032_400',
-        ),
-        'm/h': SezimalFraction(
-            '14_155_035_243_250 / 1_121_340_255',
-            _precalculated_value='12_222.210_401_330_215_355_400_515_440_425_141_453_050_132_013_330_352_024_501_113_325_004_032_005_253_423_252_243_323_224_124_041_342_525_541_321_413',
-            _precalculated_reciprocal='0.000_041_414_221_211_000_421_540_453_225_154_525_252_002_042_302_510_433_125_110_240_051_325_232_454_151_004_252_155_245_224_554_214_344_443_442',
-        ),
-        'prefixed': ('m/s', 'm/h'),
-        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
-        'km/h': SezimalFraction(
-            '112_342_220_023 / 40_332_133_524',
-            _precalculated_value='1.451_522_551_054_113_415_240_543_151_315_302_042_055_525_000_202_002_335_301_553_425_442_121_130_430_450_225_542_223_045_232_250_145_232_511_454',
-            _precalculated_reciprocal='0.315_014_443_113_431_215_124_125_205_320_150_133_305_454_425_132_353_010_140_301_042_112_405_425_302_140_431_002_513_300_000_302_321_151_145_424',
-        ),
-        'ml/s': SezimalFraction(
-            '12_335_131_314_521 / 331_130_022_452_304_000',
-            _precalculated_value='0.000_022_335_551_501_010_343_154_221_353_413_523_355_125_440_235_344_105_511_501_331_012_000_405_020_225_155_304_043_221_310_342_534_142_452_313',
-            _precalculated_reciprocal='22_441.112_242_044_022_000_510_132_230_553_550_452_301_555_320_305_355_525_453_535_120_004_215_355_435_142_142_435_420_152_254_203_342_045_323_245_011',
-        ),
-        'ml/h': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'mph': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'kn': SezimalFraction(
-            '5_055_315_421_423 / 5_134_410_002_414',
-            _precalculated_value='0.551_335_512_105_444_324_020_122_205_310_240_441_003_021_311_225_514_203_401_410_223_205_241_550_035_310_123_212_105_241_310_440_045_421_525_020',
-            _precalculated_reciprocal='1.004_251_443_533_214_134_132_053_053_524_005_115_442_111_154_321_200_500_035_532_210_435_235_520_502_350_234_312_441_303_010_044_300_520_523_110',
-        ),
-        'c': SezimalFraction(
-            '1 / 135_005_235_440',
-            _precalculated_value='0.000_000_000_003_354_235_251_331_251_201_040_320_241_103_025_033_203_214_340_555_500_151_321_433_321_013_443_114_022_410_541_441_530_125_310_555',
-            _precalculated_reciprocal='135_005_235_440',
-        ),
-        'ft/s': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'fps': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
-    },
-    'Xpad/uta': {
-        'm/s': SezimalFraction(
-            '22_512_444_005 / 45_302_415_520',
-            _precalculated_value='0.300_510_054_353_300_411_102_533_330_433_110_331_133_550_420_032_320_420_310_315_212_535_141_403_113_120_240_553_200_112_101_404_230_101_444_102',
-            _precalculated_reciprocal='1.552_325_130_432_420_104_245_404_520_445_523_205_255_213_515_424_430_034_335_230_234_202_255_031_501_002_414_503_054_111_113_013_115_531_032_400',
-        ),
-        'm/h': SezimalFraction(
-            '14_155_035_243_250 / 1_121_340_255',
-            _precalculated_value='12_222.210_401_330_215_355_400_515_440_425_141_453_050_132_013_330_352_024_501_113_325_004_032_005_253_423_252_243_323_224_124_041_342_525_541_321_413',
-            _precalculated_reciprocal='0.000_041_414_221_211_000_421_540_453_225_154_525_252_002_042_302_510_433_125_110_240_051_325_232_454_151_004_252_155_245_224_554_214_344_443_442',
-        ),
-        'prefixed': ('m/s', 'm/h'),
-        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
-        'km/h': SezimalFraction(
-            '112_342_220_023 / 40_332_133_524',
-            _precalculated_value='1.451_522_551_054_113_415_240_543_151_315_302_042_055_525_000_202_002_335_301_553_425_442_121_130_430_450_225_542_223_045_232_250_145_232_511_454',
-            _precalculated_reciprocal='0.315_014_443_113_431_215_124_125_205_320_150_133_305_454_425_132_353_010_140_301_042_112_405_425_302_140_431_002_513_300_000_302_321_151_145_424',
-        ),
-        'ml/s': SezimalFraction(
-            '12_335_131_314_521 / 331_130_022_452_304_000',
-            _precalculated_value='0.000_022_335_551_501_010_343_154_221_353_413_523_355_125_440_235_344_105_511_501_331_012_000_405_020_225_155_304_043_221_310_342_534_142_452_313',
-            _precalculated_reciprocal='22_441.112_242_044_022_000_510_132_230_553_550_452_301_555_320_305_355_525_453_535_120_004_215_355_435_142_142_435_420_152_254_203_342_045_323_245_011',
-        ),
-        'ml/h': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'mph': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'kn': SezimalFraction(
-            '5_055_315_421_423 / 5_134_410_002_414',
-            _precalculated_value='0.551_335_512_105_444_324_020_122_205_310_240_441_003_021_311_225_514_203_401_410_223_205_241_550_035_310_123_212_105_241_310_440_045_421_525_020',
-            _precalculated_reciprocal='1.004_251_443_533_214_134_132_053_053_524_005_115_442_111_154_321_200_500_035_532_210_435_235_520_502_350_234_312_441_303_010_044_300_520_523_110',
-        ),
-        'c': SezimalFraction(
-            '1 / 135_005_235_440',
-            _precalculated_value='0.000_000_000_003_354_235_251_331_251_201_040_320_241_103_025_033_203_214_340_555_500_151_321_433_321_013_443_114_022_410_541_441_530_125_310_555',
-            _precalculated_reciprocal='135_005_235_440',
-        ),
-        'ft/s': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'fps': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
-    },
-    'Cpad/pox': {
-        'm/s': SezimalFraction(
-            '22_512_444_005 / 45_302_415_520',
-            _precalculated_value='0.300_510_054_353_300_411_102_533_330_433_110_331_133_550_420_032_320_420_310_315_212_535_141_403_113_120_240_553_200_112_101_404_230_101_444_102',
-            _precalculated_reciprocal='1.552_325_130_432_420_104_245_404_520_445_523_205_255_213_515_424_430_034_335_230_234_202_255_031_501_002_414_503_054_111_113_013_115_531_032_400',
-        ),
-        'm/h': SezimalFraction(
-            '14_155_035_243_250 / 1_121_340_255',
-            _precalculated_value='12_222.210_401_330_215_355_400_515_440_425_141_453_050_132_013_330_352_024_501_113_325_004_032_005_253_423_252_243_323_224_124_041_342_525_541_321_413',
-            _precalculated_reciprocal='0.000_041_414_221_211_000_421_540_453_225_154_525_252_002_042_302_510_433_125_110_240_051_325_232_454_151_004_252_155_245_224_554_214_344_443_442',
-        ),
-        'prefixed': ('m/s', 'm/h'),
-        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
-        'km/h': SezimalFraction(
-            '112_342_220_023 / 40_332_133_524',
-            _precalculated_value='1.451_522_551_054_113_415_240_543_151_315_302_042_055_525_000_202_002_335_301_553_425_442_121_130_430_450_225_542_223_045_232_250_145_232_511_454',
-            _precalculated_reciprocal='0.315_014_443_113_431_215_124_125_205_320_150_133_305_454_425_132_353_010_140_301_042_112_405_425_302_140_431_002_513_300_000_302_321_151_145_424',
-        ),
-        'ml/s': SezimalFraction(
-            '12_335_131_314_521 / 331_130_022_452_304_000',
-            _precalculated_value='0.000_022_335_551_501_010_343_154_221_353_413_523_355_125_440_235_344_105_511_501_331_012_000_405_020_225_155_304_043_221_310_342_534_142_452_313',
-            _precalculated_reciprocal='22_441.112_242_044_022_000_510_132_230_553_550_452_301_555_320_305_355_525_453_535_120_004_215_355_435_142_142_435_420_152_254_203_342_045_323_245_011',
-        ),
-        'ml/h': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'mph': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'kn': SezimalFraction(
-            '5_055_315_421_423 / 5_134_410_002_414',
-            _precalculated_value='0.551_335_512_105_444_324_020_122_205_310_240_441_003_021_311_225_514_203_401_410_223_205_241_550_035_310_123_212_105_241_310_440_045_421_525_020',
-            _precalculated_reciprocal='1.004_251_443_533_214_134_132_053_053_524_005_115_442_111_154_321_200_500_035_532_210_435_235_520_502_350_234_312_441_303_010_044_300_520_523_110',
-        ),
-        'c': SezimalFraction(
-            '1 / 135_005_235_440',
-            _precalculated_value='0.000_000_000_003_354_235_251_331_251_201_040_320_241_103_025_033_203_214_340_555_500_151_321_433_321_013_443_114_022_410_541_441_530_125_310_555',
-            _precalculated_reciprocal='135_005_235_440',
-        ),
-        'ft/s': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'fps': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
-    },
-    'Dpad/agm': {
-        'm/s': SezimalFraction(
-            '22_512_444_005 / 45_302_415_520',
-            _precalculated_value='0.300_510_054_353_300_411_102_533_330_433_110_331_133_550_420_032_320_420_310_315_212_535_141_403_113_120_240_553_200_112_101_404_230_101_444_102',
-            _precalculated_reciprocal='1.552_325_130_432_420_104_245_404_520_445_523_205_255_213_515_424_430_034_335_230_234_202_255_031_501_002_414_503_054_111_113_013_115_531_032_400',
-        ),
-        'm/h': SezimalFraction(
-            '14_155_035_243_250 / 1_121_340_255',
-            _precalculated_value='12_222.210_401_330_215_355_400_515_440_425_141_453_050_132_013_330_352_024_501_113_325_004_032_005_253_423_252_243_323_224_124_041_342_525_541_321_413',
-            _precalculated_reciprocal='0.000_041_414_221_211_000_421_540_453_225_154_525_252_002_042_302_510_433_125_110_240_051_325_232_454_151_004_252_155_245_224_554_214_344_443_442',
-        ),
-        'prefixed': ('m/s', 'm/h'),
-        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
-        'km/h': SezimalFraction(
-            '112_342_220_023 / 40_332_133_524',
-            _precalculated_value='1.451_522_551_054_113_415_240_543_151_315_302_042_055_525_000_202_002_335_301_553_425_442_121_130_430_450_225_542_223_045_232_250_145_232_511_454',
-            _precalculated_reciprocal='0.315_014_443_113_431_215_124_125_205_320_150_133_305_454_425_132_353_010_140_301_042_112_405_425_302_140_431_002_513_300_000_302_321_151_145_424',
-        ),
-        'ml/s': SezimalFraction(
-            '12_335_131_314_521 / 331_130_022_452_304_000',
-            _precalculated_value='0.000_022_335_551_501_010_343_154_221_353_413_523_355_125_440_235_344_105_511_501_331_012_000_405_020_225_155_304_043_221_310_342_534_142_452_313',
-            _precalculated_reciprocal='22_441.112_242_044_022_000_510_132_230_553_550_452_301_555_320_305_355_525_453_535_120_004_215_355_435_142_142_435_420_152_254_203_342_045_323_245_011',
-        ),
-        'ml/h': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'mph': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'kn': SezimalFraction(
-            '5_055_315_421_423 / 5_134_410_002_414',
-            _precalculated_value='0.551_335_512_105_444_324_020_122_205_310_240_441_003_021_311_225_514_203_401_410_223_205_241_550_035_310_123_212_105_241_310_440_045_421_525_020',
-            _precalculated_reciprocal='1.004_251_443_533_214_134_132_053_053_524_005_115_442_111_154_321_200_500_035_532_210_435_235_520_502_350_234_312_441_303_010_044_300_520_523_110',
-        ),
-        'c': SezimalFraction(
-            '1 / 135_005_235_440',
-            _precalculated_value='0.000_000_000_003_354_235_251_331_251_201_040_320_241_103_025_033_203_214_340_555_500_151_321_433_321_013_443_114_022_410_541_441_530_125_310_555',
-            _precalculated_reciprocal='135_005_235_440',
-        ),
-        'ft/s': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'fps': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
-    },
-    'dpad/bod': {
-        'm/s': SezimalFraction(
-            '22_512_444_005 / 45_302_415_520',
-            _precalculated_value='0.300_510_054_353_300_411_102_533_330_433_110_331_133_550_420_032_320_420_310_315_212_535_141_403_113_120_240_553_200_112_101_404_230_101_444_102',
-            _precalculated_reciprocal='1.552_325_130_432_420_104_245_404_520_445_523_205_255_213_515_424_430_034_335_230_234_202_255_031_501_002_414_503_054_111_113_013_115_531_032_400',
-        ),
-        'm/h': SezimalFraction(
-            '14_155_035_243_250 / 1_121_340_255',
-            _precalculated_value='12_222.210_401_330_215_355_400_515_440_425_141_453_050_132_013_330_352_024_501_113_325_004_032_005_253_423_252_243_323_224_124_041_342_525_541_321_413',
-            _precalculated_reciprocal='0.000_041_414_221_211_000_421_540_453_225_154_525_252_002_042_302_510_433_125_110_240_051_325_232_454_151_004_252_155_245_224_554_214_344_443_442',
-        ),
-        'prefixed': ('m/s', 'm/h'),
-        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
-        'km/h': SezimalFraction(
-            '112_342_220_023 / 40_332_133_524',
-            _precalculated_value='1.451_522_551_054_113_415_240_543_151_315_302_042_055_525_000_202_002_335_301_553_425_442_121_130_430_450_225_542_223_045_232_250_145_232_511_454',
-            _precalculated_reciprocal='0.315_014_443_113_431_215_124_125_205_320_150_133_305_454_425_132_353_010_140_301_042_112_405_425_302_140_431_002_513_300_000_302_321_151_145_424',
-        ),
-        'ml/s': SezimalFraction(
-            '12_335_131_314_521 / 331_130_022_452_304_000',
-            _precalculated_value='0.000_022_335_551_501_010_343_154_221_353_413_523_355_125_440_235_344_105_511_501_331_012_000_405_020_225_155_304_043_221_310_342_534_142_452_313',
-            _precalculated_reciprocal='22_441.112_242_044_022_000_510_132_230_553_550_452_301_555_320_305_355_525_453_535_120_004_215_355_435_142_142_435_420_152_254_203_342_045_323_245_011',
-        ),
-        'ml/h': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'mph': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'kn': SezimalFraction(
-            '5_055_315_421_423 / 5_134_410_002_414',
-            _precalculated_value='0.551_335_512_105_444_324_020_122_205_310_240_441_003_021_311_225_514_203_401_410_223_205_241_550_035_310_123_212_105_241_310_440_045_421_525_020',
-            _precalculated_reciprocal='1.004_251_443_533_214_134_132_053_053_524_005_115_442_111_154_321_200_500_035_532_210_435_235_520_502_350_234_312_441_303_010_044_300_520_523_110',
-        ),
-        'c': SezimalFraction(
-            '1 / 135_005_235_440',
-            _precalculated_value='0.000_000_000_003_354_235_251_331_251_201_040_320_241_103_025_033_203_214_340_555_500_151_321_433_321_013_443_114_022_410_541_441_530_125_310_555',
-            _precalculated_reciprocal='135_005_235_440',
-        ),
-        'ft/s': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'fps': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
-    },
-    'XDpad/XDang': {
-        'm/s': SezimalFraction(
-            '22_512_444_005 / 45_302_415_520',
-            _precalculated_value='0.300_510_054_353_300_411_102_533_330_433_110_331_133_550_420_032_320_420_310_315_212_535_141_403_113_120_240_553_200_112_101_404_230_101_444_102',
-            _precalculated_reciprocal='1.552_325_130_432_420_104_245_404_520_445_523_205_255_213_515_424_430_034_335_230_234_202_255_031_501_002_414_503_054_111_113_013_115_531_032_400',
-        ),
-        'm/h': SezimalFraction(
-            '14_155_035_243_250 / 1_121_340_255',
-            _precalculated_value='12_222.210_401_330_215_355_400_515_440_425_141_453_050_132_013_330_352_024_501_113_325_004_032_005_253_423_252_243_323_224_124_041_342_525_541_321_413',
-            _precalculated_reciprocal='0.000_041_414_221_211_000_421_540_453_225_154_525_252_002_042_302_510_433_125_110_240_051_325_232_454_151_004_252_155_245_224_554_214_344_443_442',
-        ),
-        'prefixed': ('m/s', 'm/h'),
-        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
-        'km/h': SezimalFraction(
-            '112_342_220_023 / 40_332_133_524',
-            _precalculated_value='1.451_522_551_054_113_415_240_543_151_315_302_042_055_525_000_202_002_335_301_553_425_442_121_130_430_450_225_542_223_045_232_250_145_232_511_454',
-            _precalculated_reciprocal='0.315_014_443_113_431_215_124_125_205_320_150_133_305_454_425_132_353_010_140_301_042_112_405_425_302_140_431_002_513_300_000_302_321_151_145_424',
-        ),
-        'ml/s': SezimalFraction(
-            '12_335_131_314_521 / 331_130_022_452_304_000',
-            _precalculated_value='0.000_022_335_551_501_010_343_154_221_353_413_523_355_125_440_235_344_105_511_501_331_012_000_405_020_225_155_304_043_221_310_342_534_142_452_313',
-            _precalculated_reciprocal='22_441.112_242_044_022_000_510_132_230_553_550_452_301_555_320_305_355_525_453_535_120_004_215_355_435_142_142_435_420_152_254_203_342_045_323_245_011',
-        ),
-        'ml/h': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'mph': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'kn': SezimalFraction(
-            '5_055_315_421_423 / 5_134_410_002_414',
-            _precalculated_value='0.551_335_512_105_444_324_020_122_205_310_240_441_003_021_311_225_514_203_401_410_223_205_241_550_035_310_123_212_105_241_310_440_045_421_525_020',
-            _precalculated_reciprocal='1.004_251_443_533_214_134_132_053_053_524_005_115_442_111_154_321_200_500_035_532_210_435_235_520_502_350_234_312_441_303_010_044_300_520_523_110',
-        ),
-        'c': SezimalFraction(
-            '1 / 135_005_235_440',
-            _precalculated_value='0.000_000_000_003_354_235_251_331_251_201_040_320_241_103_025_033_203_214_340_555_500_151_321_433_321_013_443_114_022_410_541_441_530_125_310_555',
-            _precalculated_reciprocal='135_005_235_440',
-        ),
-        'ft/s': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'fps': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
-    },
-    'Xpad/Xang': {
-        'm/s': SezimalFraction(
-            '22_512_444_005 / 45_302_415_520',
-            _precalculated_value='0.300_510_054_353_300_411_102_533_330_433_110_331_133_550_420_032_320_420_310_315_212_535_141_403_113_120_240_553_200_112_101_404_230_101_444_102',
-            _precalculated_reciprocal='1.552_325_130_432_420_104_245_404_520_445_523_205_255_213_515_424_430_034_335_230_234_202_255_031_501_002_414_503_054_111_113_013_115_531_032_400',
-        ),
-        'm/h': SezimalFraction(
-            '14_155_035_243_250 / 1_121_340_255',
-            _precalculated_value='12_222.210_401_330_215_355_400_515_440_425_141_453_050_132_013_330_352_024_501_113_325_004_032_005_253_423_252_243_323_224_124_041_342_525_541_321_413',
-            _precalculated_reciprocal='0.000_041_414_221_211_000_421_540_453_225_154_525_252_002_042_302_510_433_125_110_240_051_325_232_454_151_004_252_155_245_224_554_214_344_443_442',
-        ),
-        'prefixed': ('m/s', 'm/h'),
-        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
-        'km/h': SezimalFraction(
-            '112_342_220_023 / 40_332_133_524',
-            _precalculated_value='1.451_522_551_054_113_415_240_543_151_315_302_042_055_525_000_202_002_335_301_553_425_442_121_130_430_450_225_542_223_045_232_250_145_232_511_454',
-            _precalculated_reciprocal='0.315_014_443_113_431_215_124_125_205_320_150_133_305_454_425_132_353_010_140_301_042_112_405_425_302_140_431_002_513_300_000_302_321_151_145_424',
-        ),
-        'ml/s': SezimalFraction(
-            '12_335_131_314_521 / 331_130_022_452_304_000',
-            _precalculated_value='0.000_022_335_551_501_010_343_154_221_353_413_523_355_125_440_235_344_105_511_501_331_012_000_405_020_225_155_304_043_221_310_342_534_142_452_313',
-            _precalculated_reciprocal='22_441.112_242_044_022_000_510_132_230_553_550_452_301_555_320_305_355_525_453_535_120_004_215_355_435_142_142_435_420_152_254_203_342_045_323_245_011',
-        ),
-        'ml/h': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'mph': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'kn': SezimalFraction(
-            '5_055_315_421_423 / 5_134_410_002_414',
-            _precalculated_value='0.551_335_512_105_444_324_020_122_205_310_240_441_003_021_311_225_514_203_401_410_223_205_241_550_035_310_123_212_105_241_310_440_045_421_525_020',
-            _precalculated_reciprocal='1.004_251_443_533_214_134_132_053_053_524_005_115_442_111_154_321_200_500_035_532_210_435_235_520_502_350_234_312_441_303_010_044_300_520_523_110',
-        ),
-        'c': SezimalFraction(
-            '1 / 135_005_235_440',
-            _precalculated_value='0.000_000_000_003_354_235_251_331_251_201_040_320_241_103_025_033_203_214_340_555_500_151_321_433_321_013_443_114_022_410_541_441_530_125_310_555',
-            _precalculated_reciprocal='135_005_235_440',
-        ),
-        'ft/s': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'fps': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
-    },
-    'Cpad/Cang': {
-        'm/s': SezimalFraction(
-            '22_512_444_005 / 45_302_415_520',
-            _precalculated_value='0.300_510_054_353_300_411_102_533_330_433_110_331_133_550_420_032_320_420_310_315_212_535_141_403_113_120_240_553_200_112_101_404_230_101_444_102',
-            _precalculated_reciprocal='1.552_325_130_432_420_104_245_404_520_445_523_205_255_213_515_424_430_034_335_230_234_202_255_031_501_002_414_503_054_111_113_013_115_531_032_400',
-        ),
-        'm/h': SezimalFraction(
-            '14_155_035_243_250 / 1_121_340_255',
-            _precalculated_value='12_222.210_401_330_215_355_400_515_440_425_141_453_050_132_013_330_352_024_501_113_325_004_032_005_253_423_252_243_323_224_124_041_342_525_541_321_413',
-            _precalculated_reciprocal='0.000_041_414_221_211_000_421_540_453_225_154_525_252_002_042_302_510_433_125_110_240_051_325_232_454_151_004_252_155_245_224_554_214_344_443_442',
-        ),
-        'prefixed': ('m/s', 'm/h'),
-        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
-        'km/h': SezimalFraction(
-            '112_342_220_023 / 40_332_133_524',
-            _precalculated_value='1.451_522_551_054_113_415_240_543_151_315_302_042_055_525_000_202_002_335_301_553_425_442_121_130_430_450_225_542_223_045_232_250_145_232_511_454',
-            _precalculated_reciprocal='0.315_014_443_113_431_215_124_125_205_320_150_133_305_454_425_132_353_010_140_301_042_112_405_425_302_140_431_002_513_300_000_302_321_151_145_424',
-        ),
-        'ml/s': SezimalFraction(
-            '12_335_131_314_521 / 331_130_022_452_304_000',
-            _precalculated_value='0.000_022_335_551_501_010_343_154_221_353_413_523_355_125_440_235_344_105_511_501_331_012_000_405_020_225_155_304_043_221_310_342_534_142_452_313',
-            _precalculated_reciprocal='22_441.112_242_044_022_000_510_132_230_553_550_452_301_555_320_305_355_525_453_535_120_004_215_355_435_142_142_435_420_152_254_203_342_045_323_245_011',
-        ),
-        'ml/h': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'mph': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'kn': SezimalFraction(
-            '5_055_315_421_423 / 5_134_410_002_414',
-            _precalculated_value='0.551_335_512_105_444_324_020_122_205_310_240_441_003_021_311_225_514_203_401_410_223_205_241_550_035_310_123_212_105_241_310_440_045_421_525_020',
-            _precalculated_reciprocal='1.004_251_443_533_214_134_132_053_053_524_005_115_442_111_154_321_200_500_035_532_210_435_235_520_502_350_234_312_441_303_010_044_300_520_523_110',
-        ),
-        'c': SezimalFraction(
-            '1 / 135_005_235_440',
-            _precalculated_value='0.000_000_000_003_354_235_251_331_251_201_040_320_241_103_025_033_203_214_340_555_500_151_321_433_321_013_443_114_022_410_541_441_530_125_310_555',
-            _precalculated_reciprocal='135_005_235_440',
-        ),
-        'ft/s': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'fps': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
-    },
-    'Dpad/Dang': {
-        'm/s': SezimalFraction(
-            '22_512_444_005 / 45_302_415_520',
-            _precalculated_value='0.300_510_054_353_300_411_102_533_330_433_110_331_133_550_420_032_320_420_310_315_212_535_141_403_113_120_240_553_200_112_101_404_230_101_444_102',
-            _precalculated_reciprocal='1.552_325_130_432_420_104_245_404_520_445_523_205_255_213_515_424_430_034_335_230_234_202_255_031_501_002_414_503_054_111_113_013_115_531_032_400',
-        ),
-        'm/h': SezimalFraction(
-            '14_155_035_243_250 / 1_121_340_255',
-            _precalculated_value='12_222.210_401_330_215_355_400_515_440_425_141_453_050_132_013_330_352_024_501_113_325_004_032_005_253_423_252_243_323_224_124_041_342_525_541_321_413',
-            _precalculated_reciprocal='0.000_041_414_221_211_000_421_540_453_225_154_525_252_002_042_302_510_433_125_110_240_051_325_232_454_151_004_252_155_245_224_554_214_344_443_442',
-        ),
-        'prefixed': ('m/s', 'm/h'),
-        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
-        'km/h': SezimalFraction(
-            '112_342_220_023 / 40_332_133_524',
-            _precalculated_value='1.451_522_551_054_113_415_240_543_151_315_302_042_055_525_000_202_002_335_301_553_425_442_121_130_430_450_225_542_223_045_232_250_145_232_511_454',
-            _precalculated_reciprocal='0.315_014_443_113_431_215_124_125_205_320_150_133_305_454_425_132_353_010_140_301_042_112_405_425_302_140_431_002_513_300_000_302_321_151_145_424',
-        ),
-        'ml/s': SezimalFraction(
-            '12_335_131_314_521 / 331_130_022_452_304_000',
-            _precalculated_value='0.000_022_335_551_501_010_343_154_221_353_413_523_355_125_440_235_344_105_511_501_331_012_000_405_020_225_155_304_043_221_310_342_534_142_452_313',
-            _precalculated_reciprocal='22_441.112_242_044_022_000_510_132_230_553_550_452_301_555_320_305_355_525_453_535_120_004_215_355_435_142_142_435_420_152_254_203_342_045_323_245_011',
-        ),
-        'ml/h': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'mph': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'kn': SezimalFraction(
-            '5_055_315_421_423 / 5_134_410_002_414',
-            _precalculated_value='0.551_335_512_105_444_324_020_122_205_310_240_441_003_021_311_225_514_203_401_410_223_205_241_550_035_310_123_212_105_241_310_440_045_421_525_020',
-            _precalculated_reciprocal='1.004_251_443_533_214_134_132_053_053_524_005_115_442_111_154_321_200_500_035_532_210_435_235_520_502_350_234_312_441_303_010_044_300_520_523_110',
-        ),
-        'c': SezimalFraction(
-            '1 / 135_005_235_440',
-            _precalculated_value='0.000_000_000_003_354_235_251_331_251_201_040_320_241_103_025_033_203_214_340_555_500_151_321_433_321_013_443_114_022_410_541_441_530_125_310_555',
-            _precalculated_reciprocal='135_005_235_440',
-        ),
-        'ft/s': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'fps': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
-    },
-    'dpad/dang': {
-        'm/s': SezimalFraction(
-            '22_512_444_005 / 45_302_415_520',
-            _precalculated_value='0.300_510_054_353_300_411_102_533_330_433_110_331_133_550_420_032_320_420_310_315_212_535_141_403_113_120_240_553_200_112_101_404_230_101_444_102',
-            _precalculated_reciprocal='1.552_325_130_432_420_104_245_404_520_445_523_205_255_213_515_424_430_034_335_230_234_202_255_031_501_002_414_503_054_111_113_013_115_531_032_400',
-        ),
-        'm/h': SezimalFraction(
-            '14_155_035_243_250 / 1_121_340_255',
-            _precalculated_value='12_222.210_401_330_215_355_400_515_440_425_141_453_050_132_013_330_352_024_501_113_325_004_032_005_253_423_252_243_323_224_124_041_342_525_541_321_413',
-            _precalculated_reciprocal='0.000_041_414_221_211_000_421_540_453_225_154_525_252_002_042_302_510_433_125_110_240_051_325_232_454_151_004_252_155_245_224_554_214_344_443_442',
-        ),
-        'prefixed': ('m/s', 'm/h'),
-        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
-        'km/h': SezimalFraction(
-            '112_342_220_023 / 40_332_133_524',
-            _precalculated_value='1.451_522_551_054_113_415_240_543_151_315_302_042_055_525_000_202_002_335_301_553_425_442_121_130_430_450_225_542_223_045_232_250_145_232_511_454',
-            _precalculated_reciprocal='0.315_014_443_113_431_215_124_125_205_320_150_133_305_454_425_132_353_010_140_301_042_112_405_425_302_140_431_002_513_300_000_302_321_151_145_424',
-        ),
-        'ml/s': SezimalFraction(
-            '12_335_131_314_521 / 331_130_022_452_304_000',
-            _precalculated_value='0.000_022_335_551_501_010_343_154_221_353_413_523_355_125_440_235_344_105_511_501_331_012_000_405_020_225_155_304_043_221_310_342_534_142_452_313',
-            _precalculated_reciprocal='22_441.112_242_044_022_000_510_132_230_553_550_452_301_555_320_305_355_525_453_535_120_004_215_355_435_142_142_435_420_152_254_203_342_045_323_245_011',
-        ),
-        'ml/h': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'mph': SezimalFraction(
-            '555_105_232_432_201 / 514_513_034_120_440',
-            _precalculated_value='1.043_303_402_345_102_235_233_135_333_513_033_015_252_155_213_501_521_454_402_245_141_215_300_142_520_503_552_440_333_302_224_535_302_542_215_443',
-            _precalculated_reciprocal='0.515_331_540_335_141_153_101_032_355_411_024_545_151_025_130_430_201_233_541_024_302_514_202_050_120_530_045_404_145_312_232_440_410_335_212_503',
-        ),
-        'kn': SezimalFraction(
-            '5_055_315_421_423 / 5_134_410_002_414',
-            _precalculated_value='0.551_335_512_105_444_324_020_122_205_310_240_441_003_021_311_225_514_203_401_410_223_205_241_550_035_310_123_212_105_241_310_440_045_421_525_020',
-            _precalculated_reciprocal='1.004_251_443_533_214_134_132_053_053_524_005_115_442_111_154_321_200_500_035_532_210_435_235_520_502_350_234_312_441_303_010_044_300_520_523_110',
-        ),
-        'c': SezimalFraction(
-            '1 / 135_005_235_440',
-            _precalculated_value='0.000_000_000_003_354_235_251_331_251_201_040_320_241_103_025_033_203_214_340_555_500_151_321_433_321_013_443_114_022_410_541_441_530_125_310_555',
-            _precalculated_reciprocal='135_005_235_440',
-        ),
-        'ft/s': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'fps': SezimalFraction(
-            '111_012_141_430_245 / 42_010_052_252_500',
-            _precalculated_value='1.353_054_110_133_105_551_544_445_452_030_050_513_350_341_253_345_103_251_354_453_203_344_511_343_235_352_124_513_402_425_534_240_515_311_300_255',
-            _precalculated_reciprocal='0.334_344_154_440_020_204_341_143_103_022_351_112_310_244_043_302_404_130_123_243_342_302_050_525_200_343_032_124_005_225_111_342_353_543_220_325',
-        ),
-        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
-    },
-    'tvr': {
-        'm/s2': SezimalFraction(
-            '5_324_444_301_513 / 322_545_201_312',
-            _precalculated_value='13.444_135_140_131_050_515_231_325_515_553_204_130_521_531_450_352_244_253_203_313_240_020_010_434_023_054_352_054_324_534_040_054_011_415_521_243',
-            _precalculated_reciprocal='0.034_013_555_412_250_131_225_401_514_210_140_134_353_025_033_510_254_041_055_112_112_504_135_421_524_231_130_104_311_032_000_032_250_244_244_102',
-        ),
-        'N/kg': SezimalFraction(
-            '5_324_444_301_513 / 322_545_201_312',
-            _precalculated_value='13.444_135_140_131_050_515_231_325_515_553_204_130_521_531_450_352_244_253_203_313_240_020_010_434_023_054_352_054_324_534_040_054_011_415_521_243',
-            _precalculated_reciprocal='0.034_013_555_412_250_131_225_401_514_210_140_134_353_025_033_510_254_041_055_112_112_504_135_421_524_231_130_104_311_032_000_032_250_244_244_102',
-        ),
-        'prefixed': ('m/s2', 'gal', 'Gal', 'g', 'N/kg'),
-        'gal': SezimalFraction(
-            '5_324_444_301_513 / 1_121_340_255',
-            _precalculated_value='4311.431_235_521_310_144_342_222_140_514_435_145_225_440_300_505_010_304_434_550_212_245_323_044_515_004_012_520_001_501_323_103_431_324_101_321_515',
-            _precalculated_reciprocal='0.000_115_341_530_030_145_204_255_144_313_231_153_412_335_533_033_145_510_002_302_334_014_252_135_522_112_040_145_112_203_444_445_001_005_154_042',
-        ),
-        'Gal': SezimalFraction(
-            '5_324_444_301_513 / 1_121_340_255',
-            _precalculated_value='4311.431_235_521_310_144_342_222_140_514_435_145_225_440_300_505_010_304_434_550_212_245_323_044_515_004_012_520_001_501_323_103_431_324_101_321_515',
-            _precalculated_reciprocal='0.000_115_341_530_030_145_204_255_144_313_231_153_412_335_533_033_145_510_002_302_334_014_252_135_522_112_040_145_112_203_444_445_001_005_154_042',
-        ),
-        'cm/s2': SezimalFraction(
-            '5_324_444_301_513 / 1_121_340_255',
-            _precalculated_value='4311.431_235_521_310_144_342_222_140_514_435_145_225_440_300_505_010_304_434_550_212_245_323_044_515_004_012_520_001_501_323_103_431_324_101_321_515',
-            _precalculated_reciprocal='0.000_115_341_530_030_145_204_255_144_313_231_153_412_335_533_033_145_510_002_302_334_014_252_135_522_112_040_145_112_203_444_445_001_005_154_042',
-        ),
-        'ft/s2': SezimalFraction(
-            '114_251_553_323_343 / 1_240_201_445_454',
-            _precalculated_value='52.051_054_013_244_551_152_250_013_211_220_505_314_152_101_330_454_302_503_254_403_112_415_043_150_532_313_025_023_211_212_505_501_221_554_544_213',
-            _precalculated_reciprocal='0.010_415_242_430_231_145_135_145_010_002_030_414_422_435_452_305_405_503_122_351_442_530_315_451_252_342_541_012_522_020_051_044_412_105_200_204',
-        ),
-        'g': SezimalFraction(
-            '423_210_452_453_000 / 423_302_421_551_441',
-            _precalculated_value='0.555_444_441_445_001_052_022_525_451_302_140_134_153_515_204_531_251_034_335_032_222_210_012_045_344_040_350_502_204_541_340_323_513_255_232_044',
-            _precalculated_reciprocal='1.000_111_130_504_055_445_545_155_023_122_201_331_332_355_001_151_201_534_521_152_145_544_000_121_231_420_443_205_411_530_520_304_353_530_334_510',
-        ),
-        'g0': SezimalFraction(
-            '423_210_452_453_000 / 423_302_421_551_441',
-            _precalculated_value='0.555_444_441_445_001_052_022_525_451_302_140_134_153_515_204_531_251_034_335_032_222_210_012_045_344_040_350_502_204_541_340_323_513_255_232_044',
-            _precalculated_reciprocal='1.000_111_130_504_055_445_545_155_023_122_201_331_332_355_001_151_201_534_521_152_145_544_000_121_231_420_443_205_411_530_520_304_353_530_334_510',
-        ),
-        'non_prefixed': ('prefixed', 'cm/s2', 'ft/s2', 'g0'),
-    },
-    'grt': {
-        'm/s2': SezimalFraction(
-            '5_324_444_301_513 / 322_545_201_312',
-            _precalculated_value='13.444_135_140_131_050_515_231_325_515_553_204_130_521_531_450_352_244_253_203_313_240_020_010_434_023_054_352_054_324_534_040_054_011_415_521_243',
-            _precalculated_reciprocal='0.034_013_555_412_250_131_225_401_514_210_140_134_353_025_033_510_254_041_055_112_112_504_135_421_524_231_130_104_311_032_000_032_250_244_244_102',
-        ),
-        'N/kg': SezimalFraction(
-            '5_324_444_301_513 / 322_545_201_312',
-            _precalculated_value='13.444_135_140_131_050_515_231_325_515_553_204_130_521_531_450_352_244_253_203_313_240_020_010_434_023_054_352_054_324_534_040_054_011_415_521_243',
-            _precalculated_reciprocal='0.034_013_555_412_250_131_225_401_514_210_140_134_353_025_033_510_254_041_055_112_112_504_135_421_524_231_130_104_311_032_000_032_250_244_244_102',
-        ),
-        'prefixed': ('m/s2', 'gal', 'Gal', 'g', 'N/kg'),
-        'gal': SezimalFraction(
-            '5_324_444_301_513 / 1_121_340_255',
-            _precalculated_value='4311.431_235_521_310_144_342_222_140_514_435_145_225_440_300_505_010_304_434_550_212_245_323_044_515_004_012_520_001_501_323_103_431_324_101_321_515',
-            _precalculated_reciprocal='0.000_115_341_530_030_145_204_255_144_313_231_153_412_335_533_033_145_510_002_302_334_014_252_135_522_112_040_145_112_203_444_445_001_005_154_042',
-        ),
-        'Gal': SezimalFraction(
-            '5_324_444_301_513 / 1_121_340_255',
-            _precalculated_value='4311.431_235_521_310_144_342_222_140_514_435_145_225_440_300_505_010_304_434_550_212_245_323_044_515_004_012_520_001_501_323_103_431_324_101_321_515',
-            _precalculated_reciprocal='0.000_115_341_530_030_145_204_255_144_313_231_153_412_335_533_033_145_510_002_302_334_014_252_135_522_112_040_145_112_203_444_445_001_005_154_042',
-        ),
-        'cm/s2': SezimalFraction(
-            '5_324_444_301_513 / 1_121_340_255',
-            _precalculated_value='4311.431_235_521_310_144_342_222_140_514_435_145_225_440_300_505_010_304_434_550_212_245_323_044_515_004_012_520_001_501_323_103_431_324_101_321_515',
-            _precalculated_reciprocal='0.000_115_341_530_030_145_204_255_144_313_231_153_412_335_533_033_145_510_002_302_334_014_252_135_522_112_040_145_112_203_444_445_001_005_154_042',
-        ),
-        'ft/s2': SezimalFraction(
-            '114_251_553_323_343 / 1_240_201_445_454',
-            _precalculated_value='52.051_054_013_244_551_152_250_013_211_220_505_314_152_101_330_454_302_503_254_403_112_415_043_150_532_313_025_023_211_212_505_501_221_554_544_213',
-            _precalculated_reciprocal='0.010_415_242_430_231_145_135_145_010_002_030_414_422_435_452_305_405_503_122_351_442_530_315_451_252_342_541_012_522_020_051_044_412_105_200_204',
-        ),
-        'g': SezimalFraction(
-            '423_210_452_453_000 / 423_302_421_551_441',
-            _precalculated_value='0.555_444_441_445_001_052_022_525_451_302_140_134_153_515_204_531_251_034_335_032_222_210_012_045_344_040_350_502_204_541_340_323_513_255_232_044',
-            _precalculated_reciprocal='1.000_111_130_504_055_445_545_155_023_122_201_331_332_355_001_151_201_534_521_152_145_544_000_121_231_420_443_205_411_530_520_304_353_530_334_510',
-        ),
-        'g0': SezimalFraction(
-            '423_210_452_453_000 / 423_302_421_551_441',
-            _precalculated_value='0.555_444_441_445_001_052_022_525_451_302_140_134_153_515_204_531_251_034_335_032_222_210_012_045_344_040_350_502_204_541_340_323_513_255_232_044',
-            _precalculated_reciprocal='1.000_111_130_504_055_445_545_155_023_122_201_331_332_355_001_151_201_534_521_152_145_544_000_121_231_420_443_205_411_530_520_304_353_530_334_510',
-        ),
-        'non_prefixed': ('prefixed', 'cm/s2', 'ft/s2', 'g0'),
-    },
-    'pad/ang2': {
-        'm/s2': SezimalFraction(
-            '5_324_444_301_513 / 322_545_201_312',
-            _precalculated_value='13.444_135_140_131_050_515_231_325_515_553_204_130_521_531_450_352_244_253_203_313_240_020_010_434_023_054_352_054_324_534_040_054_011_415_521_243',
-            _precalculated_reciprocal='0.034_013_555_412_250_131_225_401_514_210_140_134_353_025_033_510_254_041_055_112_112_504_135_421_524_231_130_104_311_032_000_032_250_244_244_102',
-        ),
-        'N/kg': SezimalFraction(
-            '5_324_444_301_513 / 322_545_201_312',
-            _precalculated_value='13.444_135_140_131_050_515_231_325_515_553_204_130_521_531_450_352_244_253_203_313_240_020_010_434_023_054_352_054_324_534_040_054_011_415_521_243',
-            _precalculated_reciprocal='0.034_013_555_412_250_131_225_401_514_210_140_134_353_025_033_510_254_041_055_112_112_504_135_421_524_231_130_104_311_032_000_032_250_244_244_102',
-        ),
-        'prefixed': ('m/s2', 'gal', 'Gal', 'g', 'N/kg'),
-        'gal': SezimalFraction(
-            '5_324_444_301_513 / 1_121_340_255',
-            _precalculated_value='4311.431_235_521_310_144_342_222_140_514_435_145_225_440_300_505_010_304_434_550_212_245_323_044_515_004_012_520_001_501_323_103_431_324_101_321_515',
-            _precalculated_reciprocal='0.000_115_341_530_030_145_204_255_144_313_231_153_412_335_533_033_145_510_002_302_334_014_252_135_522_112_040_145_112_203_444_445_001_005_154_042',
-        ),
-        'Gal': SezimalFraction(
-            '5_324_444_301_513 / 1_121_340_255',
-            _precalculated_value='4311.431_235_521_310_144_342_222_140_514_435_145_225_440_300_505_010_304_434_550_212_245_323_044_515_004_012_520_001_501_323_103_431_324_101_321_515',
-            _precalculated_reciprocal='0.000_115_341_530_030_145_204_255_144_313_231_153_412_335_533_033_145_510_002_302_334_014_252_135_522_112_040_145_112_203_444_445_001_005_154_042',
-        ),
-        'cm/s2': SezimalFraction(
-            '5_324_444_301_513 / 1_121_340_255',
-            _precalculated_value='4311.431_235_521_310_144_342_222_140_514_435_145_225_440_300_505_010_304_434_550_212_245_323_044_515_004_012_520_001_501_323_103_431_324_101_321_515',
-            _precalculated_reciprocal='0.000_115_341_530_030_145_204_255_144_313_231_153_412_335_533_033_145_510_002_302_334_014_252_135_522_112_040_145_112_203_444_445_001_005_154_042',
-        ),
-        'ft/s2': SezimalFraction(
-            '114_251_553_323_343 / 1_240_201_445_454',
-            _precalculated_value='52.051_054_013_244_551_152_250_013_211_220_505_314_152_101_330_454_302_503_254_403_112_415_043_150_532_313_025_023_211_212_505_501_221_554_544_213',
-            _precalculated_reciprocal='0.010_415_242_430_231_145_135_145_010_002_030_414_422_435_452_305_405_503_122_351_442_530_315_451_252_342_541_012_522_020_051_044_412_105_200_204',
-        ),
-        'g': SezimalFraction(
-            '423_210_452_453_000 / 423_302_421_551_441',
-            _precalculated_value='0.555_444_441_445_001_052_022_525_451_302_140_134_153_515_204_531_251_034_335_032_222_210_012_045_344_040_350_502_204_541_340_323_513_255_232_044',
-            _precalculated_reciprocal='1.000_111_130_504_055_445_545_155_023_122_201_331_332_355_001_151_201_534_521_152_145_544_000_121_231_420_443_205_411_530_520_304_353_530_334_510',
-        ),
-        'g0': SezimalFraction(
-            '423_210_452_453_000 / 423_302_421_551_441',
-            _precalculated_value='0.555_444_441_445_001_052_022_525_451_302_140_134_153_515_204_531_251_034_335_032_222_210_012_045_344_040_350_502_204_541_340_323_513_255_232_044',
-            _precalculated_reciprocal='1.000_111_130_504_055_445_545_155_023_122_201_331_332_355_001_151_201_534_521_152_145_544_000_121_231_420_443_205_411_530_520_304_353_530_334_510',
-        ),
-        'non_prefixed': ('prefixed', 'cm/s2', 'ft/s2', 'g0'),
-    },
-    'drv': {
-        'g': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 2_405_030_031_342_450_152_201_521_412_145_300_000_000_000_000_000',
-            _precalculated_value='25.221_031_220_042_551_351_355_414_134_110_033_331_020_041_504_204_304_452_420_215_210_202_031_310_312_003_500_115_345_113_301_244_234_452_010_442',
-            _precalculated_reciprocal='0.020_230_151_524_513_014_354_043_513_521_100_004_420_150_310_315_444_324_244_513_420_313_541_305_550_222_152_133_145_003_125_241_443_023_501_031',
-        ),
-        'prefixed': ('g', 'Da', 'ton', 't'),
-        'kg': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 20_242_111_430_504_035_004_222_040_441_035_124_000_000_000_000_000_000',
-            _precalculated_value='0.003_431_310_440_301_301_352_432_033_120_505_203_302_215_500_040_134_000_102_101_122_501_025_422_002_135_341_514_554_105_422_234_254_211_122_042',
-            _precalculated_reciprocal='133.254_042_223_243_121_202_001_023_050_142_433_511_352_002_202_342_544_123_010_204_430_023_303_354_023_340_013_140_555_011_244_424_001_154_212_034',
-        ),
-        't': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 133_354_350_321_540_202_324_210_402_422_523_332_424_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_451_142_450_345_411_320_132_103_051_142_255_521_104_323_324_250_214_552_052_122_420_341_232_514_323_245_254_530_155_120_014_013_052_400',
-            _precalculated_reciprocal='1_122_055.150_124_523_220_234_340_542_032_122_331_524_424_110_505_252_500_020_125_231_154_155_500_533_424_135_150_550_215_310_322_220_434_045_442_503_203',
-        ),
-        'ton': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 133_354_350_321_540_202_324_210_402_422_523_332_424_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_451_142_450_345_411_320_132_103_051_142_255_521_104_323_324_250_214_552_052_122_420_341_232_514_323_245_254_530_155_120_014_013_052_400',
-            _precalculated_reciprocal='1_122_055.150_124_523_220_234_340_542_032_122_331_524_424_110_505_252_500_020_125_231_154_155_500_533_424_135_150_550_215_310_322_220_434_045_442_503_203',
-        ),
-        'Da': SezimalFraction(
-            '350_240_503_130_543_353_221_232_020_254_440_152_435_114_321_220_234_030_302_335_231_423_404_503_115_232_110_413_252 / 2_531_051_413_431_523_354_324_135_000_550_113_351_423_101_413_415_401_043',
-            _precalculated_value='115_214_243_301_352_034_305_542_512_053_221.514_240_322_135_113_211_404_154_235_031_301_345_310_215_303_502_121_441_551_314_313_002_550_323_014_001_115_530_454_235_010_204_212_314_240_130',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_004_320_403_242_154_001_054_510_503_220_445_311_103_104_231_011_322_014_543_501_531_353_514_353_215_511',
-        ),
-        'dul': SezimalFraction(
-            '115_201_440_301_504_354_013_540_025_132_552 / 1',
-            _precalculated_value='115_201_440_301_504_354_013_540_025_132_552',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_004_321_304_001_232_422_332_512_425_445_420_512_503_001_034_211_141_433_311_043_330_344_334_320_203_025',
-        ),
-        'eV/c2': SezimalFraction(
-            '11_230_224_533_000_043_224_304_421_252_335_512_043_555_210_524_553_132_542_132_105_041_444_130_440_332_531_034_200_223_412 / 211_010_413_010_455_344_352_240_355_543_225_234_153_320_122_343',
-            _precalculated_value='32_135_320_021_121_432_233_223_341_502_352_521_321_355_235.451_025_403_405_132_424_035_012_404_345_322_133_512_355_154_451_542_421_241_552_554_011_100_133_512_034_534_104_514_030_125_523_025_514_535_110',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_014_353_024_400_524_403_243_400_540_143_441_010_104_551_501_510_052_241_054_302_403_210',
-        ),
-        'gr': SezimalFraction(
-            '20_150_412_131_304_311_403_010_453_442_324_254_515_402_105_350_551_155 / 13_523_224_142_150_154_553_003_410_105_520_253_520_213_000_000_000',
-            _precalculated_value='1124.232_431_114_504_302_352_415_200_201_031_521_501_533_214_352_232_321_302_051_310_503_301_335_035_422_200_255_124_040_553_324_244_032_514_203_323',
-            _precalculated_reciprocal='0.000_445_451_104_200_245_252_052_521_223_112_343_444_221_221_220_143_252_135_252_125_410_515_214_243_344_215_034_245_232_252_335_514_500_210_524',
-        ),
-        'dwt': SezimalFraction(
-            '20_150_412_131_304_311_403_010_453_442_324_254_515_402_105_350_551_155 / 1_033_413_450_531_211_515_400_224_404_353_215_433_213_000_000_000_000',
-            _precalculated_value='15.103_510_444_541_404_335_510_250_003_013_455_024_325_220_235_503_505_021_331_151_441_351_322_243_553_333_004_245_101_012_522_104_100_511_533_052',
-            _precalculated_reciprocal='0.031_151_244_252_015_135_323_353_253_404_543_031_053_253_253_211_015_330_335_325_544_433_133_055_023_053_122_255_134_135_342_353_112_012_433_500',
-        ),
-        'ozt': SezimalFraction(
-            '2_243_424_015_034_301_311_450_055_320_303_144_324_422_501_043_443_511 / 4_222_503_123_405_251_314_401_350_430_341_315_021_300_000_000_000_000',
-            _precalculated_value='0.320_443_201_240_403_455_220_531_300_052_520_315_343_511_453_331_554_241_513_544_331_140_551_153_444_402_503_453_505_241_351_150_450_350_555_132',
-            _precalculated_reciprocal='1.442_125_145_345_013_303_241_033_441_443_101_435_033_433_431_153_023_420_103_355_155_145_143_125_223_024_401_533_221_304_245_024_024_451_204_350',
-        ),
-        'lbt': SezimalFraction(
-            '2_243_424_015_034_301_311_450_055_320_303_144_324_422_501_043_443_511 / 124_454_102_512_145_430_332_031_413_011_230_340_430_000_000_000_000_000',
-            _precalculated_value='0.014_022_140_042_020_152_541_024_343_002_424_013_545_153_352_444_355_512_053_455_214_335_025_335_452_220_123_152_453_242_045_335_322_315_325_535',
-            _precalculated_reciprocal='33.242_543_351_340_310_105_221_113_233_302_033_141_113_113_023_500_512_402_111_543_543_343_302_544_500_532_035_104_430_125_340_520_533_424_131_402',
-        ),
-        'dr': SezimalFraction(
-            '3_012_153_103_343_055_115_521_552_552_533_320_234_414_030_401_221 / 150_505_001_540_323_415_053_510_535_450_433_150_432_310_430_000',
-            _precalculated_value='13.452_234_500_533_134_334_020_033_223_501_102_533_400_510_403_452_531_542_112_034_543_353_003_022_240_050_144_352_051_305_115_131_425_245_003_002',
-            _precalculated_reciprocal='0.034_000_351_302_401_332_523_055_252_214_450_022_121_404_010_050_054_505_010_251_144_153_012_332_314_444_004_213_052_532_041_240_104_521_210_404',
-        ),
-        'oz': SezimalFraction(
-            '3_012_153_103_343_055_115_521_552_552_533_320_234_414_030_401_221 / 4_541_412_051_053_055_254_301_503_032_540_124_540_104_300_000_000',
-            _precalculated_value='0.340_305_532_150_325_055_043_431_200_553_453_533_334_315_400_123_320_255_215_431_233_551_151_405_223_001_521_012_431_545_324_241_552_331_451_405',
-            _precalculated_reciprocal='1.344_014_200_110_441_314_242_343_422_044_521_015_402_544_242_122_325_412_251_352_433_040_345_304_444_424_154_002_234_453_515_043_010_153_454_551',
-        ),
-        'lb': SezimalFraction(
-            '3_012_153_103_343_055_115_521_552_552_533_320_234_414_030_401_221 / 211_123_134_150_242_343_520_045_321_315_043_531_043_000_000_000_000',
-            _precalculated_value='0.012_141_042_004_054_453_410_122_413_021_210_342_033_354_251_303_120_010_413_422_414_212_412_421_500_534_341_322_014_125_333_140_042_441_553_252',
-            _precalculated_reciprocal='42.024_433_203_100_320_435_150_015_414_050_144_510_515_235_135_425_151_143_402_232_121_454_104_204_443_513_104_103_005_102_054_000_245_101_131_355',
-        ),
-        'st': SezimalFraction(
-            '233_432_100_303_514_101_411_050_232_044_443_254_034_002_400_111 / 422_250_312_340_525_131_440_135_043_034_131_502_130_000_000_000_000',
-            _precalculated_value='0.000_331_443_323_420_434_551_145_200_351_451_155_143_132_243_544_303_233_014_551_524_100_342_200_553_255_013_312_415_003_454_540_511_020_050_402',
-            _precalculated_reciprocal='1405.030_414_512_211_454_502_140_431_553_544_112_040_224_101_512_242_210_043_253_551_121_314_340_551_050_132_334_310_200_250_112_010_320_225_335_131',
-        ),
-        'sl': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 501_432_314_110_253_503_212_520_215_505_434_133_130_000_000_000_000_000',
-            _precalculated_value='0.000_131_335_123_004_340_231_530_321_024_322_545_513_214_440_341_043_444_330_431_422_320_302_012_553_334_503_554_021_133_115_434_300_543_240_310',
-            _precalculated_reciprocal='3515.004_500_105_502_555_111_243_011_441_253_143_314_503_251_335_312_300_200_103_010_233_415_013_141_225_142_033_300_555_413_555_541_543_002_000_023',
-        ),
-        'imp qr': SezimalFraction(
-            '233_432_100_303_514_101_411_050_232_044_443_254_034_002_400_111 / 1_244_541_025_121_454_303_320_314_130_112_303_404_300_000_000_000_000',
-            _precalculated_value='0.000_143_521_441_510_215_253_352_400_153_523_355_351_344_121_552_131_414_305_253_542_030_151_100_254_425_304_434_205_301_525_250_233_310_023_201',
-            _precalculated_reciprocal='3214.101_233_424_423_353_404_321_303_551_532_224_120_452_203_424_524_420_130_551_542_243_033_121_542_140_305_113_020_400_540_224_021_040_455_114_302',
-        ),
-        'imp cwt': SezimalFraction(
-            '233_432_100_303_514_101_411_050_232_044_443_254_034_002_400_111 / 5_511_444_152_531_150_022_122_105_000_454_022_430_000_000_000_000_000',
-            _precalculated_value='0.000_023_550_240_244_332_512_225_100_025_250_525_524_524_020_255_021_532_344_212_253_304_324_443_042_404_214_105_331_213_251_211_335_214_303_500',
-            _precalculated_reciprocal='21_304.405_422_550_542_342_430_130_023_531_413_344_523_133_222_551_350_521_003_531_453_500_220_531_453_042_032_500_122_403_441_344_124_243_152_510_013',
-        ),
-        'imp ton': SezimalFraction(
-            '30_430_233_411_550_500_201_232_252_454_320_410_453_111_422_235 / 35_251_105_135_405_120_132_532_432_003_144_135_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_444_304_453_455_124_342_020_334_250_202_410_125_000_342_541_521_344_230_231_402_010_123_431_200_115_150_513_545_135_100_214_100_305_332',
-            _precalculated_reciprocal='1_130_233.510_415_311_044_251_005_001_250_254_120_402_025_152_015_332_505_512_210_300_244_411_510_300_222_225_532_404_405_403_412_340_505_110_213_120_504',
-        ),
-        'US qr': SezimalFraction(
-            '335_133_011_531_455_502_213_555_221_441_524_515_424_230_045_025 / 1_500_104_203_312_141_051_240_403_451_431_351_335_343_000_000_000_000',
-            _precalculated_value='0.000_155_322_000_055_541_454_450_454_531_130_552_420_215_243_103_001_530_553_302_010_101_442_134_053_054_005_202_000_224_313_254_030_203_530_342',
-            _precalculated_reciprocal='3003.535_045_411_121_551_210_351_204_501_301_301_344_054_005_525_400_442_211_540_401_433_342_400_515_520_521_352_303_333_225_534_015_413_151_235_310',
-        ),
-        'US cwt': SezimalFraction(
-            '335_133_011_531_455_502_213_555_221_441_524_515_424_230_045_025 / 11_200_425_222_053_044_325_442_423_131_010_330_234_300_000_000_000_000',
-            _precalculated_value='0.000_025_520_300_012_553_242_411_412_421_451_425_103_032_510_443_430_251_425_213_301_313_240_322_312_142_301_200_300_034_045_212_304_330_551_353',
-            _precalculated_reciprocal='20_023.432_314_444_531_525_242_325_231_210_010_010_304_344_035_354_403_053_251_442_411_022_254_403_315_323_330_334_022_221_355_424_114_501_125_434_040',
-        ),
-        'US ton': SezimalFraction(
-            '335_133_011_531_455_502_213_555_221_441_524_515_424_230_045_025 / 402_422_535_551_022_351_351_450_425_032_335_412_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_521_120_334_014_401_200_215_123_031_330_505_315_502_050_104_305_104_245_135_251_023_343_421_003_043_022_231_445_523_511_343_121_314_330',
-            _precalculated_reciprocal='1_041_243.123_000_002_302_141_043_340_243_120_320_334_232_334_105_113_343_033_335_445_553_201_513_355_023_235_420_013_155_533_150_500_200_440_551_214_105',
-        ),
-        'non_prefixed': ('prefixed', 'kg', 'dul', 'eV/c2', 'gr', 'dwt', 'ozt', 'lbt', 'dr', 'oz', 'lb', 'st', 'sl', 'imp qr', 'imp cwt', 'imp ton', 'US qr', 'US cwt', 'US ton'),
-    },
-    'dul': {
-        'g': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 331_205_230_412_322_352_025_051_430_010_204_505_453_405_055_550_015_032_431_544_142_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_211_210_013_353_312_431_223_223_211_403_441_013_350_153_110_130_051_541_004_551_412_454_540_003_425_051',
-            _precalculated_reciprocal='2_415_520_553_203_403_412_413_350_130_411.421_104_431_003_441_001_323_501_141_154_413_033_504_311_330_535_034_021_445_251_530_410_422_511_524_521_552_032_555_231_502_315_441_344_454_235',
-        ),
-        'prefixed': ('g', 'Da'),
-        'Da': SezimalFraction(
-            '54_340_113_451_423_525_203_205_003_042_410_025_105_445_350_203_035_304_343_352_504_533_531_113_445_505_014_402_212 / 54_325_512_045_453_310_453_430_111_425_110_543_033_401_434_011_300_000_554_553_123_313_040_421_454_312_215_035_343',
-            _precalculated_value='1.000_103_334_502_201_043_504_431_402_014_530_554_443_014_150_102_241_330_351_305_404_234_155_322_151_325_242_232_104_253_443_342_213_301_532_152',
-            _precalculated_reciprocal='0.555_452_232_224_540_333_111_411_303_231_542_514_315_242_302_240_500_541_504_115_142_553_042_302_305_012_540_035_332_222_443_145_520_002_525_455',
-        ),
-        'drv': SezimalFraction(
-            '1 / 115_201_440_301_504_354_013_540_025_132_552',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_004_321_304_001_232_422_332_512_425_445_420_512_503_001_034_211_141_433_311_043_330_344_334_320_203_025',
-            _precalculated_reciprocal='115_201_440_301_504_354_013_540_025_132_552',
-        ),
-        'non_prefixed': ('prefixed', 'drv'),
-    },
-    'gnt': {
-        'g/m3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 51_001_543_132',
-            _precalculated_value='33_221_155.053_030_114_042_054_313_051_505_320_035_224_204_434_312_412_550_524_122_534_123_213_500_453_030_353_344_130_211_451_333_343_202_002_230_220_050',
-            _precalculated_reciprocal='0.000_000_014_032_405_245_051_225_123_343_343_103_103_114_022_515_514_305_115_044_231_431_020_235_200_432_215_505_100_033_343_101_412_134_502_451',
-        ),
-        'g/L': SezimalFraction(
-            '3_023_235_045_222_024_505 / 355_321_023_311_132',
-            _precalculated_value='4342.112_424_534_353_142_401_411_240_423_151_225_421_154_052_303_335_312_223_152_005_400_053_121_231_452_455_111_130_535_510_312_043_301_144_243_003',
-            _precalculated_reciprocal='0.000_114_423_443_552_133_233_051_003_521_501_221_313_140_532_202_020_054_111_332_442_521_333_212_505_020_121_131_044_041_450_320_544_234_202_414',
-        ),
-        'g/l': SezimalFraction(
-            '3_023_235_045_222_024_505 / 355_321_023_311_132',
-            _precalculated_value='4342.112_424_534_353_142_401_411_240_423_151_225_421_154_052_303_335_312_223_152_005_400_053_121_231_452_455_111_130_535_510_312_043_301_144_243_003',
-            _precalculated_reciprocal='0.000_114_423_443_552_133_233_051_003_521_501_221_313_140_532_202_020_054_111_332_442_521_333_212_505_020_121_131_044_041_450_320_544_234_202_414',
-        ),
-        'kg/m3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 355_321_023_311_132',
-            _precalculated_value='4342.112_424_534_353_142_401_411_240_423_151_225_421_154_052_303_335_312_223_152_005_400_053_121_231_452_455_111_130_535_510_312_043_301_144_243_003',
-            _precalculated_reciprocal='0.000_114_423_443_552_133_233_051_003_521_501_221_313_140_532_202_020_054_111_332_442_521_333_212_505_020_121_131_044_041_450_320_544_234_202_414',
-        ),
-        'kg/L': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'kg/l': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'kg/dm3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'g/cm3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'g/mL': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'g/ml': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'ton/m3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'Mg/m3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'prefixed': ('g/m3', 'g/L', 'g/l'),
-        'oz/in3': SezimalFraction(
-            '20_131_545_200_025_404_134_113_141 / 33_125_110_520_214_004_553_050_544',
-            _precalculated_value='0.324_344_310_005_404_243_251_353_353_401_134_405_240_313_313_004_353_101_053_032_342_502_231_233_122_103_155_120_220_131_552_032_034_121_302_100',
-            _precalculated_reciprocal='1.422_203_323_154_423_030_115_141_354_153_412_554_010_320_142_201_423_110_121_253_113_453_422_124_541_252_441_211_231_001_455_325_222_003_323_245',
-        ),
-        'lb/in3': SezimalFraction(
-            '20_131_545_200_025_404_134_113_141 / 1_323_535_102_130_024_211_442_143_224',
-            _precalculated_value='0.011_442_311_043_204_440_114_551_204_204_325_100_201_311_202_451_442_453_453_322_442_232_222_414_154_345_242_541_305_133_255_431_131_220_032_215',
-            _precalculated_reciprocal='43.421_333_045_123_441_203_300_322_313_055_155_504_252_524_341_243_443_043_355_443_221_055_415_531_115_432_313_514_424_045_145_142_212_133_051_303',
-        ),
-        'lb/ft3': SezimalFraction(
-            '1_310_555_100_002_113_311_135_354_343 / 5_151_144_420_032_301_125_141_424',
-            _precalculated_value='142.152_133_002_502_121_423_454_454_500_345_202_420_134_434_302_154_330_324_314_151_231_113_414_341_031_355_340_110_043_554_014_015_040_431_030_032',
-            _precalculated_reciprocal='0.003_244_411_050_353_250_100_234_323_152_351_225_552_021_040_324_403_250_220_242_550_231_351_244_253_522_545_322_422_502_003_355_054_444_011_051',
-        ),
-        'lb/yd3': SezimalFraction(
-            '105_212_521_300_135_405_224_242_454_513 / 5_151_144_420_032_301_125_141_424',
-            _precalculated_value='11_442.311_043_204_440_114_551_204_204_325_100_201_311_202_451_442_453_453_322_442_232_222_414_154_345_242_541_305_133_255_431_131_220_032_215_132_242',
-            _precalculated_reciprocal='0.000_043_421_333_045_123_441_203_300_322_313_055_155_504_252_524_341_243_443_043_355_443_221_055_415_531_115_432_313_514_424_045_145_142_212_133',
-        ),
-        'sl/ft3': SezimalFraction(
-            '24_504_542_500_040_152_512_012_132_513 / 12_411_501_534_143_552_552_445_144_144',
-            _precalculated_value='1.534_205_145_042_502_251_404_404_443_405_114_354_242_304_301_120_034_013_331_404_131_051_120_343_335_241_320_224_443_255_420_103_303_450_503_533',
-            _precalculated_reciprocal='0.303_304_410_251_045_005_405_032_043_114_455_425_024_335_424_523_544_104_242_533_054_424_120_045_532_202_423_132_114_004_215_000_224_000_003_551',
-        ),
-        'lb/gal': SezimalFraction(
-            '1_512_314_552_002_411_352_520_530_153 / 120_321_332_520_511_251_545_245_344',
-            _precalculated_value='12.155_213_042_131_035_522_124_010_353_521_505_510_350_205_001_555_404_100_522_152_132_452_423_013_313_000_453_444_044_254_123_332_122_533_445_013',
-            _precalculated_reciprocal='0.041_532_355_105_211_140_100_534_300_550_313_105_535_210_243_410_013_053_440_533_440_402_543_154_020_210_153_412_150_051_530_303_313_121_450_021',
-        ),
-        'lb/bu': SezimalFraction(
-            '44_130_212_241_350_031_554_535_422_441_421 / 210_405_010_504_303_442_245_230_402_212',
-            _precalculated_value='205.314_412_333_403_055_040_354_501_354_152_434_311_012_211_235_040_053_422_314_342_501_123_020_412_220_240_005_404_410_505_234_453_521_401_331_321',
-            _precalculated_reciprocal='0.002_441_343_401_232_120_410_034_244_145_245_402_255_215_043_052_513_352_524_535_525_445_215_413_124_125_311_132_040_002_421_335_333_141_244_242',
-        ),
-        'non_prefixed': ('kg/m3', 'kg/L', 'kg/l', 'kg/dm3', 'g/cm3', 'g/mL', 'g/ml', 'ton/m3', 'Mg/m3', 'prefixed', 'oz/in3', 'lb/in3', 'lb/ft3', 'lb/yd3', 'sl/ft3', 'lb/gal', 'lb/bu'),
-    },
-    'drv/ayt': {
-        'g/m3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 51_001_543_132',
-            _precalculated_value='33_221_155.053_030_114_042_054_313_051_505_320_035_224_204_434_312_412_550_524_122_534_123_213_500_453_030_353_344_130_211_451_333_343_202_002_230_220_050',
-            _precalculated_reciprocal='0.000_000_014_032_405_245_051_225_123_343_343_103_103_114_022_515_514_305_115_044_231_431_020_235_200_432_215_505_100_033_343_101_412_134_502_451',
-        ),
-        'g/L': SezimalFraction(
-            '3_023_235_045_222_024_505 / 355_321_023_311_132',
-            _precalculated_value='4342.112_424_534_353_142_401_411_240_423_151_225_421_154_052_303_335_312_223_152_005_400_053_121_231_452_455_111_130_535_510_312_043_301_144_243_003',
-            _precalculated_reciprocal='0.000_114_423_443_552_133_233_051_003_521_501_221_313_140_532_202_020_054_111_332_442_521_333_212_505_020_121_131_044_041_450_320_544_234_202_414',
-        ),
-        'g/l': SezimalFraction(
-            '3_023_235_045_222_024_505 / 355_321_023_311_132',
-            _precalculated_value='4342.112_424_534_353_142_401_411_240_423_151_225_421_154_052_303_335_312_223_152_005_400_053_121_231_452_455_111_130_535_510_312_043_301_144_243_003',
-            _precalculated_reciprocal='0.000_114_423_443_552_133_233_051_003_521_501_221_313_140_532_202_020_054_111_332_442_521_333_212_505_020_121_131_044_041_450_320_544_234_202_414',
-        ),
-        'kg/m3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 355_321_023_311_132',
-            _precalculated_value='4342.112_424_534_353_142_401_411_240_423_151_225_421_154_052_303_335_312_223_152_005_400_053_121_231_452_455_111_130_535_510_312_043_301_144_243_003',
-            _precalculated_reciprocal='0.000_114_423_443_552_133_233_051_003_521_501_221_313_140_532_202_020_054_111_332_442_521_333_212_505_020_121_131_044_041_450_320_544_234_202_414',
-        ),
-        'kg/L': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'kg/l': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'kg/dm3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'g/cm3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'g/mL': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'g/ml': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'ton/m3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'Mg/m3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'prefixed': ('g/m3', 'g/L', 'g/l'),
-        'oz/in3': SezimalFraction(
-            '20_131_545_200_025_404_134_113_141 / 33_125_110_520_214_004_553_050_544',
-            _precalculated_value='0.324_344_310_005_404_243_251_353_353_401_134_405_240_313_313_004_353_101_053_032_342_502_231_233_122_103_155_120_220_131_552_032_034_121_302_100',
-            _precalculated_reciprocal='1.422_203_323_154_423_030_115_141_354_153_412_554_010_320_142_201_423_110_121_253_113_453_422_124_541_252_441_211_231_001_455_325_222_003_323_245',
-        ),
-        'lb/in3': SezimalFraction(
-            '20_131_545_200_025_404_134_113_141 / 1_323_535_102_130_024_211_442_143_224',
-            _precalculated_value='0.011_442_311_043_204_440_114_551_204_204_325_100_201_311_202_451_442_453_453_322_442_232_222_414_154_345_242_541_305_133_255_431_131_220_032_215',
-            _precalculated_reciprocal='43.421_333_045_123_441_203_300_322_313_055_155_504_252_524_341_243_443_043_355_443_221_055_415_531_115_432_313_514_424_045_145_142_212_133_051_303',
-        ),
-        'lb/ft3': SezimalFraction(
-            '1_310_555_100_002_113_311_135_354_343 / 5_151_144_420_032_301_125_141_424',
-            _precalculated_value='142.152_133_002_502_121_423_454_454_500_345_202_420_134_434_302_154_330_324_314_151_231_113_414_341_031_355_340_110_043_554_014_015_040_431_030_032',
-            _precalculated_reciprocal='0.003_244_411_050_353_250_100_234_323_152_351_225_552_021_040_324_403_250_220_242_550_231_351_244_253_522_545_322_422_502_003_355_054_444_011_051',
-        ),
-        'lb/yd3': SezimalFraction(
-            '105_212_521_300_135_405_224_242_454_513 / 5_151_144_420_032_301_125_141_424',
-            _precalculated_value='11_442.311_043_204_440_114_551_204_204_325_100_201_311_202_451_442_453_453_322_442_232_222_414_154_345_242_541_305_133_255_431_131_220_032_215_132_242',
-            _precalculated_reciprocal='0.000_043_421_333_045_123_441_203_300_322_313_055_155_504_252_524_341_243_443_043_355_443_221_055_415_531_115_432_313_514_424_045_145_142_212_133',
-        ),
-        'sl/ft3': SezimalFraction(
-            '24_504_542_500_040_152_512_012_132_513 / 12_411_501_534_143_552_552_445_144_144',
-            _precalculated_value='1.534_205_145_042_502_251_404_404_443_405_114_354_242_304_301_120_034_013_331_404_131_051_120_343_335_241_320_224_443_255_420_103_303_450_503_533',
-            _precalculated_reciprocal='0.303_304_410_251_045_005_405_032_043_114_455_425_024_335_424_523_544_104_242_533_054_424_120_045_532_202_423_132_114_004_215_000_224_000_003_551',
-        ),
-        'lb/gal': SezimalFraction(
-            '1_512_314_552_002_411_352_520_530_153 / 120_321_332_520_511_251_545_245_344',
-            _precalculated_value='12.155_213_042_131_035_522_124_010_353_521_505_510_350_205_001_555_404_100_522_152_132_452_423_013_313_000_453_444_044_254_123_332_122_533_445_013',
-            _precalculated_reciprocal='0.041_532_355_105_211_140_100_534_300_550_313_105_535_210_243_410_013_053_440_533_440_402_543_154_020_210_153_412_150_051_530_303_313_121_450_021',
-        ),
-        'lb/bu': SezimalFraction(
-            '44_130_212_241_350_031_554_535_422_441_421 / 210_405_010_504_303_442_245_230_402_212',
-            _precalculated_value='205.314_412_333_403_055_040_354_501_354_152_434_311_012_211_235_040_053_422_314_342_501_123_020_412_220_240_005_404_410_505_234_453_521_401_331_321',
-            _precalculated_reciprocal='0.002_441_343_401_232_120_410_034_244_145_245_402_255_215_043_052_513_352_524_535_525_445_215_413_124_125_311_132_040_002_421_335_333_141_244_242',
-        ),
-        'non_prefixed': ('kg/m3', 'kg/L', 'kg/l', 'kg/dm3', 'g/cm3', 'g/mL', 'g/ml', 'ton/m3', 'Mg/m3', 'prefixed', 'oz/in3', 'lb/in3', 'lb/ft3', 'lb/yd3', 'sl/ft3', 'lb/gal', 'lb/bu'),
-    },
-    'drv/pad3': {
-        'g/m3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 51_001_543_132',
-            _precalculated_value='33_221_155.053_030_114_042_054_313_051_505_320_035_224_204_434_312_412_550_524_122_534_123_213_500_453_030_353_344_130_211_451_333_343_202_002_230_220_050',
-            _precalculated_reciprocal='0.000_000_014_032_405_245_051_225_123_343_343_103_103_114_022_515_514_305_115_044_231_431_020_235_200_432_215_505_100_033_343_101_412_134_502_451',
-        ),
-        'g/L': SezimalFraction(
-            '3_023_235_045_222_024_505 / 355_321_023_311_132',
-            _precalculated_value='4342.112_424_534_353_142_401_411_240_423_151_225_421_154_052_303_335_312_223_152_005_400_053_121_231_452_455_111_130_535_510_312_043_301_144_243_003',
-            _precalculated_reciprocal='0.000_114_423_443_552_133_233_051_003_521_501_221_313_140_532_202_020_054_111_332_442_521_333_212_505_020_121_131_044_041_450_320_544_234_202_414',
-        ),
-        'g/l': SezimalFraction(
-            '3_023_235_045_222_024_505 / 355_321_023_311_132',
-            _precalculated_value='4342.112_424_534_353_142_401_411_240_423_151_225_421_154_052_303_335_312_223_152_005_400_053_121_231_452_455_111_130_535_510_312_043_301_144_243_003',
-            _precalculated_reciprocal='0.000_114_423_443_552_133_233_051_003_521_501_221_313_140_532_202_020_054_111_332_442_521_333_212_505_020_121_131_044_041_450_320_544_234_202_414',
-        ),
-        'kg/m3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 355_321_023_311_132',
-            _precalculated_value='4342.112_424_534_353_142_401_411_240_423_151_225_421_154_052_303_335_312_223_152_005_400_053_121_231_452_455_111_130_535_510_312_043_301_144_243_003',
-            _precalculated_reciprocal='0.000_114_423_443_552_133_233_051_003_521_501_221_313_140_532_202_020_054_111_332_442_521_333_212_505_020_121_131_044_041_450_320_544_234_202_414',
-        ),
-        'kg/L': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'kg/l': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'kg/dm3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'g/cm3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'g/mL': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'g/ml': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'ton/m3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'Mg/m3': SezimalFraction(
-            '3_023_235_045_222_024_505 / 3_024_344_303_525_335_132',
-            _precalculated_value='0.555_340_204_122_404_004_521_523_051_132_513_031_214_211_031_041_500_250_523_041_021_153_053_033_013_244_223_031_413_321_443_341_540_354_501_312',
-            _precalculated_reciprocal='1.000_215_444_114_413_515_115_334_013_223_444_010_550_023_302_504_142_201_500_131_104_142_542_200_424_340_011_122_103_252_052_004_552_441_515_535',
-        ),
-        'prefixed': ('g/m3', 'g/L', 'g/l'),
-        'oz/in3': SezimalFraction(
-            '20_131_545_200_025_404_134_113_141 / 33_125_110_520_214_004_553_050_544',
-            _precalculated_value='0.324_344_310_005_404_243_251_353_353_401_134_405_240_313_313_004_353_101_053_032_342_502_231_233_122_103_155_120_220_131_552_032_034_121_302_100',
-            _precalculated_reciprocal='1.422_203_323_154_423_030_115_141_354_153_412_554_010_320_142_201_423_110_121_253_113_453_422_124_541_252_441_211_231_001_455_325_222_003_323_245',
-        ),
-        'lb/in3': SezimalFraction(
-            '20_131_545_200_025_404_134_113_141 / 1_323_535_102_130_024_211_442_143_224',
-            _precalculated_value='0.011_442_311_043_204_440_114_551_204_204_325_100_201_311_202_451_442_453_453_322_442_232_222_414_154_345_242_541_305_133_255_431_131_220_032_215',
-            _precalculated_reciprocal='43.421_333_045_123_441_203_300_322_313_055_155_504_252_524_341_243_443_043_355_443_221_055_415_531_115_432_313_514_424_045_145_142_212_133_051_303',
-        ),
-        'lb/ft3': SezimalFraction(
-            '1_310_555_100_002_113_311_135_354_343 / 5_151_144_420_032_301_125_141_424',
-            _precalculated_value='142.152_133_002_502_121_423_454_454_500_345_202_420_134_434_302_154_330_324_314_151_231_113_414_341_031_355_340_110_043_554_014_015_040_431_030_032',
-            _precalculated_reciprocal='0.003_244_411_050_353_250_100_234_323_152_351_225_552_021_040_324_403_250_220_242_550_231_351_244_253_522_545_322_422_502_003_355_054_444_011_051',
-        ),
-        'lb/yd3': SezimalFraction(
-            '105_212_521_300_135_405_224_242_454_513 / 5_151_144_420_032_301_125_141_424',
-            _precalculated_value='11_442.311_043_204_440_114_551_204_204_325_100_201_311_202_451_442_453_453_322_442_232_222_414_154_345_242_541_305_133_255_431_131_220_032_215_132_242',
-            _precalculated_reciprocal='0.000_043_421_333_045_123_441_203_300_322_313_055_155_504_252_524_341_243_443_043_355_443_221_055_415_531_115_432_313_514_424_045_145_142_212_133',
-        ),
-        'sl/ft3': SezimalFraction(
-            '24_504_542_500_040_152_512_012_132_513 / 12_411_501_534_143_552_552_445_144_144',
-            _precalculated_value='1.534_205_145_042_502_251_404_404_443_405_114_354_242_304_301_120_034_013_331_404_131_051_120_343_335_241_320_224_443_255_420_103_303_450_503_533',
-            _precalculated_reciprocal='0.303_304_410_251_045_005_405_032_043_114_455_425_024_335_424_523_544_104_242_533_054_424_120_045_532_202_423_132_114_004_215_000_224_000_003_551',
-        ),
-        'lb/gal': SezimalFraction(
-            '1_512_314_552_002_411_352_520_530_153 / 120_321_332_520_511_251_545_245_344',
-            _precalculated_value='12.155_213_042_131_035_522_124_010_353_521_505_510_350_205_001_555_404_100_522_152_132_452_423_013_313_000_453_444_044_254_123_332_122_533_445_013',
-            _precalculated_reciprocal='0.041_532_355_105_211_140_100_534_300_550_313_105_535_210_243_410_013_053_440_533_440_402_543_154_020_210_153_412_150_051_530_303_313_121_450_021',
-        ),
-        'lb/bu': SezimalFraction(
-            '44_130_212_241_350_031_554_535_422_441_421 / 210_405_010_504_303_442_245_230_402_212',
-            _precalculated_value='205.314_412_333_403_055_040_354_501_354_152_434_311_012_211_235_040_053_422_314_342_501_123_020_412_220_240_005_404_410_505_234_453_521_401_331_321',
-            _precalculated_reciprocal='0.002_441_343_401_232_120_410_034_244_145_245_402_255_215_043_052_513_352_524_535_525_445_215_413_124_125_311_132_040_002_421_335_333_141_244_242',
-        ),
-        'non_prefixed': ('kg/m3', 'kg/L', 'kg/l', 'kg/dm3', 'g/cm3', 'g/mL', 'g/ml', 'ton/m3', 'Mg/m3', 'prefixed', 'oz/in3', 'lb/in3', 'lb/ft3', 'lb/yd3', 'sl/ft3', 'lb/gal', 'lb/bu'),
-    },
-    'bal': {
-        'N': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 30_524_033_132_304_121_450_300_043_042_321_000_503_544_051_445_200_000_000_000_000',
-            _precalculated_value='0.100_451_011_045_251_505_100_201_155_154_351_001_502_222_131_330_535_253_040_214_050_330_425_232_323_230_140_512_421_411_350_242_054_203_535_342',
-            _precalculated_reciprocal='5.511_245_305_115_532_354_133_413_515_212_102_055_034_024_131_112_042_242_320_133_533_304_355_200_514_123_355_243_511_313_551_025_334_431_515_011',
-        ),
-        'kg·m/s2': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 30_524_033_132_304_121_450_300_043_042_321_000_503_544_051_445_200_000_000_000_000',
-            _precalculated_value='0.100_451_011_045_251_505_100_201_155_154_351_001_502_222_131_330_535_253_040_214_050_330_425_232_323_230_140_512_421_411_350_242_054_203_535_342',
-            _precalculated_reciprocal='5.511_245_305_115_532_354_133_413_515_212_102_055_034_024_131_112_042_242_320_133_533_304_355_200_514_123_355_243_511_313_551_025_334_431_515_011',
-        ),
-        'g·m/s2': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 4_030_055_410_240_452_351_351_044_153_401_211_401_051_045_200_000_000_000_000',
-            _precalculated_value='442.230_201_012_252_453_132_123_254_115_015_320_312_235_201_203_410_022_344_512_141_334_443_204_323_213_545_453_430_034_012_554_235_011_330_405_404',
-            _precalculated_reciprocal='0.001_133_435_025_313_253_314_505_133_233_102_015_411_001_151_240_332_432_405_054_341_250_140_342_350_232_533_123_420_204_444_210_231_533_013_251',
-        ),
-        'prefixed': ('N', 'gf', 'g·m/s2'),
-        'bar': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'bal': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'gf': SezimalFraction(
-            '243_232_415_353_212_213_135_432_531_022_022_220_510_552_433_351_514_230_151_155 / 5_415_511_443_452_001_324_543_110_110_032_453_222_122_453_500_000_000_000_000',
-            _precalculated_value='25.213_335_421_403_131_250_534_101_211_001_231_051_505_013_342_431_453_151_305_515_145_211_240_521_154_150_240_121_012_345_522_244_222_223_352_313',
-            _precalculated_reciprocal='0.020_232_445_013_321_113_555_332_351_351_045_431_001_025_150_240_501_030_423_010_231_425_125_105_543_002_442_033_451_004_030_332_150_140_554_254',
-        ),
-        'lbf': SezimalFraction(
-            '2_434_541_413_402_452_033_243_132_154_033_015_455_524_041_134_550_552_254_511 / 200_213_422_135_553_150_441_342_102_221_342_554_512_522_305_200_000_000_000_000',
-            _precalculated_value='0.012_135_244_014_034_142_251_530_522_503_013_154_012_102_203_455_555_000_551_310_550_315_513_333_141_445_014_343_104_034_505_100_031_444_321_405',
-            _precalculated_reciprocal='42.033_553_225_132_451_050_134_004_101_315_223_523_514_521_553_233_414_523_001_141_011_322_301_143_432_040_532_403_403_013_330_551_254_541_302_022',
-        ),
-        'dyn': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 12_453_251_005_142_125_123_023_223_032_521_011_533_105_200_000_000_000_000',
-            _precalculated_value='210_521.453_451_532_310_022_011_501_101_441_203_445_524_045_543_013_250_435_211_100_304_315_155_241_041_541_050_143_014_112_055_135_555_302_353_144_345',
-            _precalculated_reciprocal='0.000_002_423_203_435_254_521_232_323_405_545_522_303_400_422_204_322_125_253_101_022_143_355_055_523_441_224_225_024_403_351_544_051_054_224_353',
-        ),
-        'pdl': SezimalFraction(
-            '5_121_513_350_552_153_000_404_541_003_531_042_033_500_455_132_102_142_430_134_105 / 4_124_345_014_304_250_555_053_422_003_253_202_245_050_352_541_430_000_000_000_000',
-            _precalculated_value='1.122_125_533_200_134_243_442_554_334_354_305_453_545_132_341_453_120_352_151_133_153_204_033_522_030_240_144_153_323_112_101_415_055_311_202_040',
-            _precalculated_reciprocal='0.451_122_313_542_323_352_050_544_101_005_430_043_320_445_152_503_303_050_543_455_311_040_411_453_554_430_135_423_025_243_051_555_340_401_033_343',
-        ),
-        'lb·ft/s2': SezimalFraction(
-            '5_121_513_350_552_153_000_404_541_003_531_042_033_500_455_132_102_142_430_134_105 / 4_124_345_014_304_250_555_053_422_003_253_202_245_050_352_541_430_000_000_000_000',
-            _precalculated_value='1.122_125_533_200_134_243_442_554_334_354_305_453_545_132_341_453_120_352_151_133_153_204_033_522_030_240_144_153_323_112_101_415_055_311_202_040',
-            _precalculated_reciprocal='0.451_122_313_542_323_352_050_544_101_005_430_043_320_445_152_503_303_050_543_455_311_040_411_453_554_430_135_423_025_243_051_555_340_401_033_343',
-        ),
-        'non_prefixed': ('kg·m/s2', 'prefixed', 'bar', 'bal', 'lbf', 'dyn', 'pdl', 'lb·ft/s2'),
-    },
-    'bar': {
-        'N': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 30_524_033_132_304_121_450_300_043_042_321_000_503_544_051_445_200_000_000_000_000',
-            _precalculated_value='0.100_451_011_045_251_505_100_201_155_154_351_001_502_222_131_330_535_253_040_214_050_330_425_232_323_230_140_512_421_411_350_242_054_203_535_342',
-            _precalculated_reciprocal='5.511_245_305_115_532_354_133_413_515_212_102_055_034_024_131_112_042_242_320_133_533_304_355_200_514_123_355_243_511_313_551_025_334_431_515_011',
-        ),
-        'kg·m/s2': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 30_524_033_132_304_121_450_300_043_042_321_000_503_544_051_445_200_000_000_000_000',
-            _precalculated_value='0.100_451_011_045_251_505_100_201_155_154_351_001_502_222_131_330_535_253_040_214_050_330_425_232_323_230_140_512_421_411_350_242_054_203_535_342',
-            _precalculated_reciprocal='5.511_245_305_115_532_354_133_413_515_212_102_055_034_024_131_112_042_242_320_133_533_304_355_200_514_123_355_243_511_313_551_025_334_431_515_011',
-        ),
-        'g·m/s2': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 4_030_055_410_240_452_351_351_044_153_401_211_401_051_045_200_000_000_000_000',
-            _precalculated_value='442.230_201_012_252_453_132_123_254_115_015_320_312_235_201_203_410_022_344_512_141_334_443_204_323_213_545_453_430_034_012_554_235_011_330_405_404',
-            _precalculated_reciprocal='0.001_133_435_025_313_253_314_505_133_233_102_015_411_001_151_240_332_432_405_054_341_250_140_342_350_232_533_123_420_204_444_210_231_533_013_251',
-        ),
-        'prefixed': ('N', 'gf', 'g·m/s2'),
-        'bar': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'bal': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'gf': SezimalFraction(
-            '243_232_415_353_212_213_135_432_531_022_022_220_510_552_433_351_514_230_151_155 / 5_415_511_443_452_001_324_543_110_110_032_453_222_122_453_500_000_000_000_000',
-            _precalculated_value='25.213_335_421_403_131_250_534_101_211_001_231_051_505_013_342_431_453_151_305_515_145_211_240_521_154_150_240_121_012_345_522_244_222_223_352_313',
-            _precalculated_reciprocal='0.020_232_445_013_321_113_555_332_351_351_045_431_001_025_150_240_501_030_423_010_231_425_125_105_543_002_442_033_451_004_030_332_150_140_554_254',
-        ),
-        'lbf': SezimalFraction(
-            '2_434_541_413_402_452_033_243_132_154_033_015_455_524_041_134_550_552_254_511 / 200_213_422_135_553_150_441_342_102_221_342_554_512_522_305_200_000_000_000_000',
-            _precalculated_value='0.012_135_244_014_034_142_251_530_522_503_013_154_012_102_203_455_555_000_551_310_550_315_513_333_141_445_014_343_104_034_505_100_031_444_321_405',
-            _precalculated_reciprocal='42.033_553_225_132_451_050_134_004_101_315_223_523_514_521_553_233_414_523_001_141_011_322_301_143_432_040_532_403_403_013_330_551_254_541_302_022',
-        ),
-        'dyn': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 12_453_251_005_142_125_123_023_223_032_521_011_533_105_200_000_000_000_000',
-            _precalculated_value='210_521.453_451_532_310_022_011_501_101_441_203_445_524_045_543_013_250_435_211_100_304_315_155_241_041_541_050_143_014_112_055_135_555_302_353_144_345',
-            _precalculated_reciprocal='0.000_002_423_203_435_254_521_232_323_405_545_522_303_400_422_204_322_125_253_101_022_143_355_055_523_441_224_225_024_403_351_544_051_054_224_353',
-        ),
-        'pdl': SezimalFraction(
-            '5_121_513_350_552_153_000_404_541_003_531_042_033_500_455_132_102_142_430_134_105 / 4_124_345_014_304_250_555_053_422_003_253_202_245_050_352_541_430_000_000_000_000',
-            _precalculated_value='1.122_125_533_200_134_243_442_554_334_354_305_453_545_132_341_453_120_352_151_133_153_204_033_522_030_240_144_153_323_112_101_415_055_311_202_040',
-            _precalculated_reciprocal='0.451_122_313_542_323_352_050_544_101_005_430_043_320_445_152_503_303_050_543_455_311_040_411_453_554_430_135_423_025_243_051_555_340_401_033_343',
-        ),
-        'lb·ft/s2': SezimalFraction(
-            '5_121_513_350_552_153_000_404_541_003_531_042_033_500_455_132_102_142_430_134_105 / 4_124_345_014_304_250_555_053_422_003_253_202_245_050_352_541_430_000_000_000_000',
-            _precalculated_value='1.122_125_533_200_134_243_442_554_334_354_305_453_545_132_341_453_120_352_151_133_153_204_033_522_030_240_144_153_323_112_101_415_055_311_202_040',
-            _precalculated_reciprocal='0.451_122_313_542_323_352_050_544_101_005_430_043_320_445_152_503_303_050_543_455_311_040_411_453_554_430_135_423_025_243_051_555_340_401_033_343',
-        ),
-        'non_prefixed': ('kg·m/s2', 'prefixed', 'bar', 'bal', 'lbf', 'dyn', 'pdl', 'lb·ft/s2'),
-    },
-    'drv·tvr': {
-        'N': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 30_524_033_132_304_121_450_300_043_042_321_000_503_544_051_445_200_000_000_000_000',
-            _precalculated_value='0.100_451_011_045_251_505_100_201_155_154_351_001_502_222_131_330_535_253_040_214_050_330_425_232_323_230_140_512_421_411_350_242_054_203_535_342',
-            _precalculated_reciprocal='5.511_245_305_115_532_354_133_413_515_212_102_055_034_024_131_112_042_242_320_133_533_304_355_200_514_123_355_243_511_313_551_025_334_431_515_011',
-        ),
-        'kg·m/s2': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 30_524_033_132_304_121_450_300_043_042_321_000_503_544_051_445_200_000_000_000_000',
-            _precalculated_value='0.100_451_011_045_251_505_100_201_155_154_351_001_502_222_131_330_535_253_040_214_050_330_425_232_323_230_140_512_421_411_350_242_054_203_535_342',
-            _precalculated_reciprocal='5.511_245_305_115_532_354_133_413_515_212_102_055_034_024_131_112_042_242_320_133_533_304_355_200_514_123_355_243_511_313_551_025_334_431_515_011',
-        ),
-        'g·m/s2': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 4_030_055_410_240_452_351_351_044_153_401_211_401_051_045_200_000_000_000_000',
-            _precalculated_value='442.230_201_012_252_453_132_123_254_115_015_320_312_235_201_203_410_022_344_512_141_334_443_204_323_213_545_453_430_034_012_554_235_011_330_405_404',
-            _precalculated_reciprocal='0.001_133_435_025_313_253_314_505_133_233_102_015_411_001_151_240_332_432_405_054_341_250_140_342_350_232_533_123_420_204_444_210_231_533_013_251',
-        ),
-        'prefixed': ('N', 'gf', 'g·m/s2'),
-        'bar': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'bal': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'gf': SezimalFraction(
-            '243_232_415_353_212_213_135_432_531_022_022_220_510_552_433_351_514_230_151_155 / 5_415_511_443_452_001_324_543_110_110_032_453_222_122_453_500_000_000_000_000',
-            _precalculated_value='25.213_335_421_403_131_250_534_101_211_001_231_051_505_013_342_431_453_151_305_515_145_211_240_521_154_150_240_121_012_345_522_244_222_223_352_313',
-            _precalculated_reciprocal='0.020_232_445_013_321_113_555_332_351_351_045_431_001_025_150_240_501_030_423_010_231_425_125_105_543_002_442_033_451_004_030_332_150_140_554_254',
-        ),
-        'lbf': SezimalFraction(
-            '2_434_541_413_402_452_033_243_132_154_033_015_455_524_041_134_550_552_254_511 / 200_213_422_135_553_150_441_342_102_221_342_554_512_522_305_200_000_000_000_000',
-            _precalculated_value='0.012_135_244_014_034_142_251_530_522_503_013_154_012_102_203_455_555_000_551_310_550_315_513_333_141_445_014_343_104_034_505_100_031_444_321_405',
-            _precalculated_reciprocal='42.033_553_225_132_451_050_134_004_101_315_223_523_514_521_553_233_414_523_001_141_011_322_301_143_432_040_532_403_403_013_330_551_254_541_302_022',
-        ),
-        'dyn': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 12_453_251_005_142_125_123_023_223_032_521_011_533_105_200_000_000_000_000',
-            _precalculated_value='210_521.453_451_532_310_022_011_501_101_441_203_445_524_045_543_013_250_435_211_100_304_315_155_241_041_541_050_143_014_112_055_135_555_302_353_144_345',
-            _precalculated_reciprocal='0.000_002_423_203_435_254_521_232_323_405_545_522_303_400_422_204_322_125_253_101_022_143_355_055_523_441_224_225_024_403_351_544_051_054_224_353',
-        ),
-        'pdl': SezimalFraction(
-            '5_121_513_350_552_153_000_404_541_003_531_042_033_500_455_132_102_142_430_134_105 / 4_124_345_014_304_250_555_053_422_003_253_202_245_050_352_541_430_000_000_000_000',
-            _precalculated_value='1.122_125_533_200_134_243_442_554_334_354_305_453_545_132_341_453_120_352_151_133_153_204_033_522_030_240_144_153_323_112_101_415_055_311_202_040',
-            _precalculated_reciprocal='0.451_122_313_542_323_352_050_544_101_005_430_043_320_445_152_503_303_050_543_455_311_040_411_453_554_430_135_423_025_243_051_555_340_401_033_343',
-        ),
-        'lb·ft/s2': SezimalFraction(
-            '5_121_513_350_552_153_000_404_541_003_531_042_033_500_455_132_102_142_430_134_105 / 4_124_345_014_304_250_555_053_422_003_253_202_245_050_352_541_430_000_000_000_000',
-            _precalculated_value='1.122_125_533_200_134_243_442_554_334_354_305_453_545_132_341_453_120_352_151_133_153_204_033_522_030_240_144_153_323_112_101_415_055_311_202_040',
-            _precalculated_reciprocal='0.451_122_313_542_323_352_050_544_101_005_430_043_320_445_152_503_303_050_543_455_311_040_411_453_554_430_135_423_025_243_051_555_340_401_033_343',
-        ),
-        'non_prefixed': ('kg·m/s2', 'prefixed', 'bar', 'bal', 'lbf', 'dyn', 'pdl', 'lb·ft/s2'),
-    },
-    'drv·pad/ang2': {
-        'N': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 30_524_033_132_304_121_450_300_043_042_321_000_503_544_051_445_200_000_000_000_000',
-            _precalculated_value='0.100_451_011_045_251_505_100_201_155_154_351_001_502_222_131_330_535_253_040_214_050_330_425_232_323_230_140_512_421_411_350_242_054_203_535_342',
-            _precalculated_reciprocal='5.511_245_305_115_532_354_133_413_515_212_102_055_034_024_131_112_042_242_320_133_533_304_355_200_514_123_355_243_511_313_551_025_334_431_515_011',
-        ),
-        'kg·m/s2': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 30_524_033_132_304_121_450_300_043_042_321_000_503_544_051_445_200_000_000_000_000',
-            _precalculated_value='0.100_451_011_045_251_505_100_201_155_154_351_001_502_222_131_330_535_253_040_214_050_330_425_232_323_230_140_512_421_411_350_242_054_203_535_342',
-            _precalculated_reciprocal='5.511_245_305_115_532_354_133_413_515_212_102_055_034_024_131_112_042_242_320_133_533_304_355_200_514_123_355_243_511_313_551_025_334_431_515_011',
-        ),
-        'g·m/s2': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 4_030_055_410_240_452_351_351_044_153_401_211_401_051_045_200_000_000_000_000',
-            _precalculated_value='442.230_201_012_252_453_132_123_254_115_015_320_312_235_201_203_410_022_344_512_141_334_443_204_323_213_545_453_430_034_012_554_235_011_330_405_404',
-            _precalculated_reciprocal='0.001_133_435_025_313_253_314_505_133_233_102_015_411_001_151_240_332_432_405_054_341_250_140_342_350_232_533_123_420_204_444_210_231_533_013_251',
-        ),
-        'prefixed': ('N', 'gf', 'g·m/s2'),
-        'bar': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'bal': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'gf': SezimalFraction(
-            '243_232_415_353_212_213_135_432_531_022_022_220_510_552_433_351_514_230_151_155 / 5_415_511_443_452_001_324_543_110_110_032_453_222_122_453_500_000_000_000_000',
-            _precalculated_value='25.213_335_421_403_131_250_534_101_211_001_231_051_505_013_342_431_453_151_305_515_145_211_240_521_154_150_240_121_012_345_522_244_222_223_352_313',
-            _precalculated_reciprocal='0.020_232_445_013_321_113_555_332_351_351_045_431_001_025_150_240_501_030_423_010_231_425_125_105_543_002_442_033_451_004_030_332_150_140_554_254',
-        ),
-        'lbf': SezimalFraction(
-            '2_434_541_413_402_452_033_243_132_154_033_015_455_524_041_134_550_552_254_511 / 200_213_422_135_553_150_441_342_102_221_342_554_512_522_305_200_000_000_000_000',
-            _precalculated_value='0.012_135_244_014_034_142_251_530_522_503_013_154_012_102_203_455_555_000_551_310_550_315_513_333_141_445_014_343_104_034_505_100_031_444_321_405',
-            _precalculated_reciprocal='42.033_553_225_132_451_050_134_004_101_315_223_523_514_521_553_233_414_523_001_141_011_322_301_143_432_040_532_403_403_013_330_551_254_541_302_022',
-        ),
-        'dyn': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 12_453_251_005_142_125_123_023_223_032_521_011_533_105_200_000_000_000_000',
-            _precalculated_value='210_521.453_451_532_310_022_011_501_101_441_203_445_524_045_543_013_250_435_211_100_304_315_155_241_041_541_050_143_014_112_055_135_555_302_353_144_345',
-            _precalculated_reciprocal='0.000_002_423_203_435_254_521_232_323_405_545_522_303_400_422_204_322_125_253_101_022_143_355_055_523_441_224_225_024_403_351_544_051_054_224_353',
-        ),
-        'pdl': SezimalFraction(
-            '5_121_513_350_552_153_000_404_541_003_531_042_033_500_455_132_102_142_430_134_105 / 4_124_345_014_304_250_555_053_422_003_253_202_245_050_352_541_430_000_000_000_000',
-            _precalculated_value='1.122_125_533_200_134_243_442_554_334_354_305_453_545_132_341_453_120_352_151_133_153_204_033_522_030_240_144_153_323_112_101_415_055_311_202_040',
-            _precalculated_reciprocal='0.451_122_313_542_323_352_050_544_101_005_430_043_320_445_152_503_303_050_543_455_311_040_411_453_554_430_135_423_025_243_051_555_340_401_033_343',
-        ),
-        'lb·ft/s2': SezimalFraction(
-            '5_121_513_350_552_153_000_404_541_003_531_042_033_500_455_132_102_142_430_134_105 / 4_124_345_014_304_250_555_053_422_003_253_202_245_050_352_541_430_000_000_000_000',
-            _precalculated_value='1.122_125_533_200_134_243_442_554_334_354_305_453_545_132_341_453_120_352_151_133_153_204_033_522_030_240_144_153_323_112_101_415_055_311_202_040',
-            _precalculated_reciprocal='0.451_122_313_542_323_352_050_544_101_005_430_043_320_445_152_503_303_050_543_455_311_040_411_453_554_430_135_423_025_243_051_555_340_401_033_343',
-        ),
-        'non_prefixed': ('kg·m/s2', 'prefixed', 'bar', 'bal', 'lbf', 'dyn', 'pdl', 'lb·ft/s2'),
-    },
-    'pdn': {
-        'Pa': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'J/m3': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'kg/m/s2': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
-        'atm': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'vay': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'psi': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 1_113_511_504_010_452_504_123_225_512_252_343_000_000_000_000_000',
-            _precalculated_value='0.000_000_002_332_300_000_254_535_231_553_200_500_533_410_511_244_042_254_423_021_011_130_003_544_521_521_403_454_253_045_053_520_204_332_144_023',
-            _precalculated_reciprocal='215_123_455.411_321_133_032_035_542_203_104_403_151_545_411_452_230_222_102_501_442_315_525_351_254_414_542_044_241_133_301_005_513_220_233_215_255_353_042',
-        ),
-        'bar': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 25_330_033_203_055_543_352_045_202_420_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_351_202_231_531_042_125_223_204_523_011_343_245_411_545_030_232_314_415_413_122_412_230_125_110_140_551_153_224_254_551_432_521',
-            _precalculated_reciprocal='5_331_143_232.020_440_012_513_444_255_244_442_510_120_200_131_515_340_034_252_021_210_425_045_551_531_420_343_020_030_403_513_152_132_314_204_305_005_131_420',
-        ),
-        'mmHg': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 420_130_143_121_252_121_225_423_140_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_144_335_513_450_021_223_120_205_451_532_054_041_125_223_401_500_045_422_340_131_253_115_351_520_145_411_231_443_350_400_213_204',
-            _precalculated_reciprocal='1_335_400.534_452_132_435_120_145_532_242_535_125_102_154_140_113_505_132_020_330_105_031_425_310_522_032_035_112_444_450_224_515_013_334_303_514_353_343',
-        ),
-        'inHg': SezimalFraction(
-            '21_511_245_114_531_520_433_044_401_230_321_154_545 / 2_342_545_430_344_515_315_255_034_010_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_005_141_104_502_505_521_034_124_212_012_040_403_545_204_105_205_105_350_524_224_030_533_202_123_254_024_414_142_005_554_133_252_302_533',
-            _precalculated_reciprocal='104_514_512.320_334_001_522_552_105_005_300_145_201_522_233_423_533_020_115_005_021_530_145_133_034_241_140_053_150_443_203_005_003_414_415_033_150_401_201',
-        ),
-        'Torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
-    },
-    'pbl': {
-        'Pa': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'J/m3': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'kg/m/s2': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
-        'atm': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'vay': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'psi': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 1_113_511_504_010_452_504_123_225_512_252_343_000_000_000_000_000',
-            _precalculated_value='0.000_000_002_332_300_000_254_535_231_553_200_500_533_410_511_244_042_254_423_021_011_130_003_544_521_521_403_454_253_045_053_520_204_332_144_023',
-            _precalculated_reciprocal='215_123_455.411_321_133_032_035_542_203_104_403_151_545_411_452_230_222_102_501_442_315_525_351_254_414_542_044_241_133_301_005_513_220_233_215_255_353_042',
-        ),
-        'bar': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 25_330_033_203_055_543_352_045_202_420_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_351_202_231_531_042_125_223_204_523_011_343_245_411_545_030_232_314_415_413_122_412_230_125_110_140_551_153_224_254_551_432_521',
-            _precalculated_reciprocal='5_331_143_232.020_440_012_513_444_255_244_442_510_120_200_131_515_340_034_252_021_210_425_045_551_531_420_343_020_030_403_513_152_132_314_204_305_005_131_420',
-        ),
-        'mmHg': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 420_130_143_121_252_121_225_423_140_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_144_335_513_450_021_223_120_205_451_532_054_041_125_223_401_500_045_422_340_131_253_115_351_520_145_411_231_443_350_400_213_204',
-            _precalculated_reciprocal='1_335_400.534_452_132_435_120_145_532_242_535_125_102_154_140_113_505_132_020_330_105_031_425_310_522_032_035_112_444_450_224_515_013_334_303_514_353_343',
-        ),
-        'inHg': SezimalFraction(
-            '21_511_245_114_531_520_433_044_401_230_321_154_545 / 2_342_545_430_344_515_315_255_034_010_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_005_141_104_502_505_521_034_124_212_012_040_403_545_204_105_205_105_350_524_224_030_533_202_123_254_024_414_142_005_554_133_252_302_533',
-            _precalculated_reciprocal='104_514_512.320_334_001_522_552_105_005_300_145_201_522_233_423_533_020_115_005_021_530_145_133_034_241_140_053_150_443_203_005_003_414_415_033_150_401_201',
-        ),
-        'Torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
-    },
-    'drv/pad/ang2': {
-        'Pa': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'J/m3': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'kg/m/s2': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
-        'atm': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'vay': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'psi': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 1_113_511_504_010_452_504_123_225_512_252_343_000_000_000_000_000',
-            _precalculated_value='0.000_000_002_332_300_000_254_535_231_553_200_500_533_410_511_244_042_254_423_021_011_130_003_544_521_521_403_454_253_045_053_520_204_332_144_023',
-            _precalculated_reciprocal='215_123_455.411_321_133_032_035_542_203_104_403_151_545_411_452_230_222_102_501_442_315_525_351_254_414_542_044_241_133_301_005_513_220_233_215_255_353_042',
-        ),
-        'bar': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 25_330_033_203_055_543_352_045_202_420_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_351_202_231_531_042_125_223_204_523_011_343_245_411_545_030_232_314_415_413_122_412_230_125_110_140_551_153_224_254_551_432_521',
-            _precalculated_reciprocal='5_331_143_232.020_440_012_513_444_255_244_442_510_120_200_131_515_340_034_252_021_210_425_045_551_531_420_343_020_030_403_513_152_132_314_204_305_005_131_420',
-        ),
-        'mmHg': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 420_130_143_121_252_121_225_423_140_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_144_335_513_450_021_223_120_205_451_532_054_041_125_223_401_500_045_422_340_131_253_115_351_520_145_411_231_443_350_400_213_204',
-            _precalculated_reciprocal='1_335_400.534_452_132_435_120_145_532_242_535_125_102_154_140_113_505_132_020_330_105_031_425_310_522_032_035_112_444_450_224_515_013_334_303_514_353_343',
-        ),
-        'inHg': SezimalFraction(
-            '21_511_245_114_531_520_433_044_401_230_321_154_545 / 2_342_545_430_344_515_315_255_034_010_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_005_141_104_502_505_521_034_124_212_012_040_403_545_204_105_205_105_350_524_224_030_533_202_123_254_024_414_142_005_554_133_252_302_533',
-            _precalculated_reciprocal='104_514_512.320_334_001_522_552_105_005_300_145_201_522_233_423_533_020_115_005_021_530_145_133_034_241_140_053_150_443_203_005_003_414_415_033_150_401_201',
-        ),
-        'Torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
-    },
-    'vrc/ayt': {
-        'Pa': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'J/m3': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'kg/m/s2': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
-        'atm': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'vay': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'psi': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 1_113_511_504_010_452_504_123_225_512_252_343_000_000_000_000_000',
-            _precalculated_value='0.000_000_002_332_300_000_254_535_231_553_200_500_533_410_511_244_042_254_423_021_011_130_003_544_521_521_403_454_253_045_053_520_204_332_144_023',
-            _precalculated_reciprocal='215_123_455.411_321_133_032_035_542_203_104_403_151_545_411_452_230_222_102_501_442_315_525_351_254_414_542_044_241_133_301_005_513_220_233_215_255_353_042',
-        ),
-        'bar': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 25_330_033_203_055_543_352_045_202_420_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_351_202_231_531_042_125_223_204_523_011_343_245_411_545_030_232_314_415_413_122_412_230_125_110_140_551_153_224_254_551_432_521',
-            _precalculated_reciprocal='5_331_143_232.020_440_012_513_444_255_244_442_510_120_200_131_515_340_034_252_021_210_425_045_551_531_420_343_020_030_403_513_152_132_314_204_305_005_131_420',
-        ),
-        'mmHg': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 420_130_143_121_252_121_225_423_140_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_144_335_513_450_021_223_120_205_451_532_054_041_125_223_401_500_045_422_340_131_253_115_351_520_145_411_231_443_350_400_213_204',
-            _precalculated_reciprocal='1_335_400.534_452_132_435_120_145_532_242_535_125_102_154_140_113_505_132_020_330_105_031_425_310_522_032_035_112_444_450_224_515_013_334_303_514_353_343',
-        ),
-        'inHg': SezimalFraction(
-            '21_511_245_114_531_520_433_044_401_230_321_154_545 / 2_342_545_430_344_515_315_255_034_010_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_005_141_104_502_505_521_034_124_212_012_040_403_545_204_105_205_105_350_524_224_030_533_202_123_254_024_414_142_005_554_133_252_302_533',
-            _precalculated_reciprocal='104_514_512.320_334_001_522_552_105_005_300_145_201_522_233_423_533_020_115_005_021_530_145_133_034_241_140_053_150_443_203_005_003_414_415_033_150_401_201',
-        ),
-        'Torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
-    },
-    'uxn/ayt': {
-        'Pa': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'J/m3': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'kg/m/s2': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
-        'atm': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'vay': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'psi': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 1_113_511_504_010_452_504_123_225_512_252_343_000_000_000_000_000',
-            _precalculated_value='0.000_000_002_332_300_000_254_535_231_553_200_500_533_410_511_244_042_254_423_021_011_130_003_544_521_521_403_454_253_045_053_520_204_332_144_023',
-            _precalculated_reciprocal='215_123_455.411_321_133_032_035_542_203_104_403_151_545_411_452_230_222_102_501_442_315_525_351_254_414_542_044_241_133_301_005_513_220_233_215_255_353_042',
-        ),
-        'bar': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 25_330_033_203_055_543_352_045_202_420_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_351_202_231_531_042_125_223_204_523_011_343_245_411_545_030_232_314_415_413_122_412_230_125_110_140_551_153_224_254_551_432_521',
-            _precalculated_reciprocal='5_331_143_232.020_440_012_513_444_255_244_442_510_120_200_131_515_340_034_252_021_210_425_045_551_531_420_343_020_030_403_513_152_132_314_204_305_005_131_420',
-        ),
-        'mmHg': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 420_130_143_121_252_121_225_423_140_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_144_335_513_450_021_223_120_205_451_532_054_041_125_223_401_500_045_422_340_131_253_115_351_520_145_411_231_443_350_400_213_204',
-            _precalculated_reciprocal='1_335_400.534_452_132_435_120_145_532_242_535_125_102_154_140_113_505_132_020_330_105_031_425_310_522_032_035_112_444_450_224_515_013_334_303_514_353_343',
-        ),
-        'inHg': SezimalFraction(
-            '21_511_245_114_531_520_433_044_401_230_321_154_545 / 2_342_545_430_344_515_315_255_034_010_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_005_141_104_502_505_521_034_124_212_012_040_403_545_204_105_205_105_350_524_224_030_533_202_123_254_024_414_142_005_554_133_252_302_533',
-            _precalculated_reciprocal='104_514_512.320_334_001_522_552_105_005_300_145_201_522_233_423_533_020_115_005_021_530_145_133_034_241_140_053_150_443_203_005_003_414_415_033_150_401_201',
-        ),
-        'Torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
-    },
-    'xrm/ayt': {
-        'Pa': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'J/m3': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'kg/m/s2': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
-        'atm': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'vay': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'psi': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 1_113_511_504_010_452_504_123_225_512_252_343_000_000_000_000_000',
-            _precalculated_value='0.000_000_002_332_300_000_254_535_231_553_200_500_533_410_511_244_042_254_423_021_011_130_003_544_521_521_403_454_253_045_053_520_204_332_144_023',
-            _precalculated_reciprocal='215_123_455.411_321_133_032_035_542_203_104_403_151_545_411_452_230_222_102_501_442_315_525_351_254_414_542_044_241_133_301_005_513_220_233_215_255_353_042',
-        ),
-        'bar': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 25_330_033_203_055_543_352_045_202_420_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_351_202_231_531_042_125_223_204_523_011_343_245_411_545_030_232_314_415_413_122_412_230_125_110_140_551_153_224_254_551_432_521',
-            _precalculated_reciprocal='5_331_143_232.020_440_012_513_444_255_244_442_510_120_200_131_515_340_034_252_021_210_425_045_551_531_420_343_020_030_403_513_152_132_314_204_305_005_131_420',
-        ),
-        'mmHg': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 420_130_143_121_252_121_225_423_140_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_144_335_513_450_021_223_120_205_451_532_054_041_125_223_401_500_045_422_340_131_253_115_351_520_145_411_231_443_350_400_213_204',
-            _precalculated_reciprocal='1_335_400.534_452_132_435_120_145_532_242_535_125_102_154_140_113_505_132_020_330_105_031_425_310_522_032_035_112_444_450_224_515_013_334_303_514_353_343',
-        ),
-        'inHg': SezimalFraction(
-            '21_511_245_114_531_520_433_044_401_230_321_154_545 / 2_342_545_430_344_515_315_255_034_010_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_005_141_104_502_505_521_034_124_212_012_040_403_545_204_105_205_105_350_524_224_030_533_202_123_254_024_414_142_005_554_133_252_302_533',
-            _precalculated_reciprocal='104_514_512.320_334_001_522_552_105_005_300_145_201_522_233_423_533_020_115_005_021_530_145_133_034_241_140_053_150_443_203_005_003_414_415_033_150_401_201',
-        ),
-        'Torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
-    },
-    'xky/ayt': {
-        'Pa': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'J/m3': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'kg/m/s2': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
-        'atm': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'vay': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'psi': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 1_113_511_504_010_452_504_123_225_512_252_343_000_000_000_000_000',
-            _precalculated_value='0.000_000_002_332_300_000_254_535_231_553_200_500_533_410_511_244_042_254_423_021_011_130_003_544_521_521_403_454_253_045_053_520_204_332_144_023',
-            _precalculated_reciprocal='215_123_455.411_321_133_032_035_542_203_104_403_151_545_411_452_230_222_102_501_442_315_525_351_254_414_542_044_241_133_301_005_513_220_233_215_255_353_042',
-        ),
-        'bar': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 25_330_033_203_055_543_352_045_202_420_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_351_202_231_531_042_125_223_204_523_011_343_245_411_545_030_232_314_415_413_122_412_230_125_110_140_551_153_224_254_551_432_521',
-            _precalculated_reciprocal='5_331_143_232.020_440_012_513_444_255_244_442_510_120_200_131_515_340_034_252_021_210_425_045_551_531_420_343_020_030_403_513_152_132_314_204_305_005_131_420',
-        ),
-        'mmHg': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 420_130_143_121_252_121_225_423_140_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_144_335_513_450_021_223_120_205_451_532_054_041_125_223_401_500_045_422_340_131_253_115_351_520_145_411_231_443_350_400_213_204',
-            _precalculated_reciprocal='1_335_400.534_452_132_435_120_145_532_242_535_125_102_154_140_113_505_132_020_330_105_031_425_310_522_032_035_112_444_450_224_515_013_334_303_514_353_343',
-        ),
-        'inHg': SezimalFraction(
-            '21_511_245_114_531_520_433_044_401_230_321_154_545 / 2_342_545_430_344_515_315_255_034_010_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_005_141_104_502_505_521_034_124_212_012_040_403_545_204_105_205_105_350_524_224_030_533_202_123_254_024_414_142_005_554_133_252_302_533',
-            _precalculated_reciprocal='104_514_512.320_334_001_522_552_105_005_300_145_201_522_233_423_533_020_115_005_021_530_145_133_034_241_140_053_150_443_203_005_003_414_415_033_150_401_201',
-        ),
-        'Torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
-    },
-    'vrc/pad3': {
-        'Pa': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'J/m3': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'kg/m/s2': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
-        'atm': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'vay': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'psi': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 1_113_511_504_010_452_504_123_225_512_252_343_000_000_000_000_000',
-            _precalculated_value='0.000_000_002_332_300_000_254_535_231_553_200_500_533_410_511_244_042_254_423_021_011_130_003_544_521_521_403_454_253_045_053_520_204_332_144_023',
-            _precalculated_reciprocal='215_123_455.411_321_133_032_035_542_203_104_403_151_545_411_452_230_222_102_501_442_315_525_351_254_414_542_044_241_133_301_005_513_220_233_215_255_353_042',
-        ),
-        'bar': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 25_330_033_203_055_543_352_045_202_420_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_351_202_231_531_042_125_223_204_523_011_343_245_411_545_030_232_314_415_413_122_412_230_125_110_140_551_153_224_254_551_432_521',
-            _precalculated_reciprocal='5_331_143_232.020_440_012_513_444_255_244_442_510_120_200_131_515_340_034_252_021_210_425_045_551_531_420_343_020_030_403_513_152_132_314_204_305_005_131_420',
-        ),
-        'mmHg': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 420_130_143_121_252_121_225_423_140_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_144_335_513_450_021_223_120_205_451_532_054_041_125_223_401_500_045_422_340_131_253_115_351_520_145_411_231_443_350_400_213_204',
-            _precalculated_reciprocal='1_335_400.534_452_132_435_120_145_532_242_535_125_102_154_140_113_505_132_020_330_105_031_425_310_522_032_035_112_444_450_224_515_013_334_303_514_353_343',
-        ),
-        'inHg': SezimalFraction(
-            '21_511_245_114_531_520_433_044_401_230_321_154_545 / 2_342_545_430_344_515_315_255_034_010_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_005_141_104_502_505_521_034_124_212_012_040_403_545_204_105_205_105_350_524_224_030_533_202_123_254_024_414_142_005_554_133_252_302_533',
-            _precalculated_reciprocal='104_514_512.320_334_001_522_552_105_005_300_145_201_522_233_423_533_020_115_005_021_530_145_133_034_241_140_053_150_443_203_005_003_414_415_033_150_401_201',
-        ),
-        'Torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
-    },
-    'uxn/pad3': {
-        'Pa': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'J/m3': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'kg/m/s2': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
-        'atm': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'vay': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'psi': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 1_113_511_504_010_452_504_123_225_512_252_343_000_000_000_000_000',
-            _precalculated_value='0.000_000_002_332_300_000_254_535_231_553_200_500_533_410_511_244_042_254_423_021_011_130_003_544_521_521_403_454_253_045_053_520_204_332_144_023',
-            _precalculated_reciprocal='215_123_455.411_321_133_032_035_542_203_104_403_151_545_411_452_230_222_102_501_442_315_525_351_254_414_542_044_241_133_301_005_513_220_233_215_255_353_042',
-        ),
-        'bar': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 25_330_033_203_055_543_352_045_202_420_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_351_202_231_531_042_125_223_204_523_011_343_245_411_545_030_232_314_415_413_122_412_230_125_110_140_551_153_224_254_551_432_521',
-            _precalculated_reciprocal='5_331_143_232.020_440_012_513_444_255_244_442_510_120_200_131_515_340_034_252_021_210_425_045_551_531_420_343_020_030_403_513_152_132_314_204_305_005_131_420',
-        ),
-        'mmHg': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 420_130_143_121_252_121_225_423_140_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_144_335_513_450_021_223_120_205_451_532_054_041_125_223_401_500_045_422_340_131_253_115_351_520_145_411_231_443_350_400_213_204',
-            _precalculated_reciprocal='1_335_400.534_452_132_435_120_145_532_242_535_125_102_154_140_113_505_132_020_330_105_031_425_310_522_032_035_112_444_450_224_515_013_334_303_514_353_343',
-        ),
-        'inHg': SezimalFraction(
-            '21_511_245_114_531_520_433_044_401_230_321_154_545 / 2_342_545_430_344_515_315_255_034_010_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_005_141_104_502_505_521_034_124_212_012_040_403_545_204_105_205_105_350_524_224_030_533_202_123_254_024_414_142_005_554_133_252_302_533',
-            _precalculated_reciprocal='104_514_512.320_334_001_522_552_105_005_300_145_201_522_233_423_533_020_115_005_021_530_145_133_034_241_140_053_150_443_203_005_003_414_415_033_150_401_201',
-        ),
-        'Torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
-    },
-    'xrm/pad3': {
-        'Pa': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'J/m3': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'kg/m/s2': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
-        'atm': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'vay': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'psi': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 1_113_511_504_010_452_504_123_225_512_252_343_000_000_000_000_000',
-            _precalculated_value='0.000_000_002_332_300_000_254_535_231_553_200_500_533_410_511_244_042_254_423_021_011_130_003_544_521_521_403_454_253_045_053_520_204_332_144_023',
-            _precalculated_reciprocal='215_123_455.411_321_133_032_035_542_203_104_403_151_545_411_452_230_222_102_501_442_315_525_351_254_414_542_044_241_133_301_005_513_220_233_215_255_353_042',
-        ),
-        'bar': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 25_330_033_203_055_543_352_045_202_420_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_351_202_231_531_042_125_223_204_523_011_343_245_411_545_030_232_314_415_413_122_412_230_125_110_140_551_153_224_254_551_432_521',
-            _precalculated_reciprocal='5_331_143_232.020_440_012_513_444_255_244_442_510_120_200_131_515_340_034_252_021_210_425_045_551_531_420_343_020_030_403_513_152_132_314_204_305_005_131_420',
-        ),
-        'mmHg': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 420_130_143_121_252_121_225_423_140_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_144_335_513_450_021_223_120_205_451_532_054_041_125_223_401_500_045_422_340_131_253_115_351_520_145_411_231_443_350_400_213_204',
-            _precalculated_reciprocal='1_335_400.534_452_132_435_120_145_532_242_535_125_102_154_140_113_505_132_020_330_105_031_425_310_522_032_035_112_444_450_224_515_013_334_303_514_353_343',
-        ),
-        'inHg': SezimalFraction(
-            '21_511_245_114_531_520_433_044_401_230_321_154_545 / 2_342_545_430_344_515_315_255_034_010_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_005_141_104_502_505_521_034_124_212_012_040_403_545_204_105_205_105_350_524_224_030_533_202_123_254_024_414_142_005_554_133_252_302_533',
-            _precalculated_reciprocal='104_514_512.320_334_001_522_552_105_005_300_145_201_522_233_423_533_020_115_005_021_530_145_133_034_241_140_053_150_443_203_005_003_414_415_033_150_401_201',
-        ),
-        'Torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
-    },
-    'xky/pad3': {
-        'Pa': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'J/m3': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'kg/m/s2': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 12_112_012_504_301_312_005_444_513_000_000_000_000_000_000',
-            _precalculated_value='0.000_214_455_131_212_140_225_515_300_134_335_114_043_033_552_551_314_431_411_015_211_410_002_455_444_403_355_050_413_542_042_011_542_334_503_533',
-            _precalculated_reciprocal='2335.135_214_410_051_312_104_100_214_253_210_133_234_530_344_445_510_221_315_312_022_252_203_301_011_453_123_335_031_502_410_131_522_454_535_535_113',
-        ),
-        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
-        'atm': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'vay': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-            _precalculated_reciprocal='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-        ),
-        'psi': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 1_113_511_504_010_452_504_123_225_512_252_343_000_000_000_000_000',
-            _precalculated_value='0.000_000_002_332_300_000_254_535_231_553_200_500_533_410_511_244_042_254_423_021_011_130_003_544_521_521_403_454_253_045_053_520_204_332_144_023',
-            _precalculated_reciprocal='215_123_455.411_321_133_032_035_542_203_104_403_151_545_411_452_230_222_102_501_442_315_525_351_254_414_542_044_241_133_301_005_513_220_233_215_255_353_042',
-        ),
-        'bar': SezimalFraction(
-            '3_051_305_543_351_202_421_243_300_553_313_305_033_225 / 25_330_033_203_055_543_352_045_202_420_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_102_351_202_231_531_042_125_223_204_523_011_343_245_411_545_030_232_314_415_413_122_412_230_125_110_140_551_153_224_254_551_432_521',
-            _precalculated_reciprocal='5_331_143_232.020_440_012_513_444_255_244_442_510_120_200_131_515_340_034_252_021_210_425_045_551_531_420_343_020_030_403_513_152_132_314_204_305_005_131_420',
-        ),
-        'mmHg': SezimalFraction(
-            '241_024_140_304_251_125_203_532_413_533_533_144_435 / 420_130_143_121_252_121_225_423_140_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_144_335_513_450_021_223_120_205_451_532_054_041_125_223_401_500_045_422_340_131_253_115_351_520_145_411_231_443_350_400_213_204',
-            _precalculated_reciprocal='1_335_400.534_452_132_435_120_145_532_242_535_125_102_154_140_113_505_132_020_330_105_031_425_310_522_032_035_112_444_450_224_515_013_334_303_514_353_343',
-        ),
-        'inHg': SezimalFraction(
-            '21_511_245_114_531_520_433_044_401_230_321_154_545 / 2_342_545_430_344_515_315_255_034_010_430_000_000_000_000_000',
-            _precalculated_value='0.000_000_005_141_104_502_505_521_034_124_212_012_040_403_545_204_105_205_105_350_524_224_030_533_202_123_254_024_414_142_005_554_133_252_302_533',
-            _precalculated_reciprocal='104_514_512.320_334_001_522_552_105_005_300_145_201_522_233_423_533_020_115_005_021_530_145_133_034_241_140_053_150_443_203_005_003_414_415_033_150_401_201',
-        ),
-        'Torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'torr': SezimalFraction(
-            '12_312_233_153_521_025_405_402_353_312_432_412_410_405 / 21_424_441_200_040_302_432_115_000_050_213_000_000_000_000_000',
-            _precalculated_value='0.000_000_342_110_115_150_415_125_300_544_444_112_351_022_111_424_154_451_242_304_442_514_324_005_252_331_150_222_401_211_250_004_000_423_430_551',
-            _precalculated_reciprocal='1_335_401.051_350_231_453_235_531_434_421_402_230_431_155_252_405_053_414_143_201_443_003_550_201_345_234_451_234_455_001_151_210_234_435_130_343_511_122',
-        ),
-        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
-    },
-    'vay': {
-        'Pa': SezimalFraction(
-            '2_101_033 / 1',
-            _precalculated_value='2_101_033',
-            _precalculated_reciprocal='0.000_000_243_243_101_002_005_521_343_535_531_543_301_310_501_214_335_124_340_330_411_500_351_425_502_300_203_141_322_303_011_244_022_222_505_510',
-        ),
-        'J/m3': SezimalFraction(
-            '2_101_033 / 1',
-            _precalculated_value='2_101_033',
-            _precalculated_reciprocal='0.000_000_243_243_101_002_005_521_343_535_531_543_301_310_501_214_335_124_340_330_411_500_351_425_502_300_203_141_322_303_011_244_022_222_505_510',
-        ),
-        'kg/m/s2': SezimalFraction(
-            '2_101_033 / 1',
-            _precalculated_value='2_101_033',
-            _precalculated_reciprocal='0.000_000_243_243_101_002_005_521_343_535_531_543_301_310_501_214_335_124_340_330_411_500_351_425_502_300_203_141_322_303_011_244_022_222_505_510',
-        ),
-        'prefixed': ('Pa', 'J/m3', 'psi', 'bar'),
-        'atm': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'pdn': SezimalFraction(
-            '2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000 / 241_024_140_304_251_125_203_532_413_533_533_144_435',
-            _precalculated_value='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-            _precalculated_reciprocal='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-        ),
-        'pbl': SezimalFraction(
-            '2_313_435_205_204_312_302_224_412_005_343_000_000_000_000_000_000 / 241_024_140_304_251_125_203_532_413_533_533_144_435',
-            _precalculated_value='5_355_142_411.155_015_024_201_302_522_350_443_103_154_403_304_204_450_342_514_511_345_421_552_031_031_325_333_141_353_500_341_003_553_244_252_114_014_440_500',
-            _precalculated_reciprocal='0.000_000_000_102_050_104_421_353_520_315_350_531_001_153_025_402_325_051_254_413_015_332_051_232_031_425_333_223_025_451_243_520_411_111_224_334',
-        ),
-        'psi': SezimalFraction(
-            '14_015_425_120 / 403_440_101',
-            _precalculated_value='22.410_154_114_253_305_031_015_250_325_133_150_025_153_211_244_213_141_034_503_153_444_212_440_242_353_355_513_144_455_252_432_123_515_433_551_401',
-            _precalculated_reciprocal='0.022_410_430_301_551_003_335_323_252_312_323_054_430_313_413_532_515_421_313_111_051_004_412_141_233_132_332_315_430_031_504_513_151_533_522_352',
-        ),
-        'bar': SezimalFraction(
-            '30_433 / 30_304',
-            _precalculated_value='1.002_510_105_245_541_344_302_331_512_204_010_524_554_134_430_233_151_220_401_052_455_413_443_023_315_122_040_105_245_541_344_302_331_512_204_011',
-            _precalculated_reciprocal='0.553_101_520_353_550_321_455_121_030_022_220_033_034_313_204_132_530_130_402_434_332_510_424_111_253_210_103_155_244_515_115_055_353_101_520_354',
-        ),
-        'mmHg': SezimalFraction(
-            '415_042_540 / 112_031',
-            _precalculated_value='3304.000_241_552_543_254_432_553_252_102_245_112_354_414_212_340_033_300_311_044_455_001_125_243_350_335_333_415_024_253_442_152_452_244_305_403_135',
-            _precalculated_reciprocal='0.000_141_220_031_211_440_432_524_054_201_150_311_154_022_501_114_121_102_113_531_450_554_531_024_444_424_422_101_502_344_540_520_145_551_011_211',
-        ),
-        'inHg': SezimalFraction(
-            '51_005_220 / 1_011_545',
-            _precalculated_value='45.530_553_312_333_544_253_500_422_545_221_340_504_250_105_433_122_252_431_202_311_052_305_500_552_551_030_100_125_112_031_411_013_312_550_551_005',
-            _precalculated_reciprocal='0.011_115_143_220_332_044_453_411_013_424_255_545_341_255_124_545_300_204_435_451_553_355_344_241_235_152_551_210_340_134_144_104_413_542_134_113',
-        ),
-        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'pdn', 'pbl', 'mmHg', 'inHg'),
-    },
-    'vrc': {
-        'J': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'N·m': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'Pa·m3': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'C·V': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'prefixed': ('J', 'Wh', 'W·h', 'BTU', 'cal', 'erg', 'eV', 'TNT', 'N·m', 'Pa·m3', 'C·V'),
-        'vrc': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'uxn': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'xrm': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'xky': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'Wh': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_513_010_314_225_043_240_504_154_444_342_004_205_205_411_320_311_100_251_040_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_020_211_254_444_211_251_421_503_503_441_303_530_351_044_200_554_425_323_332_305_133_525_314_012_004_454_500_534_351_124_201_422_351_232',
-            _precalculated_reciprocal='25_244_150.115_055_103_155_353_435_550_313_431_013_432_501_440_040_403_341_044_050_302_225_234_212_325_303_005_305_134_423_421_552_342_403_531_545_155_012',
-        ),
-        'W·h': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_513_010_314_225_043_240_504_154_444_342_004_205_205_411_320_311_100_251_040_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_020_211_254_444_211_251_421_503_503_441_303_530_351_044_200_554_425_323_332_305_133_525_314_012_004_454_500_534_351_124_201_422_351_232',
-            _precalculated_reciprocal='25_244_150.115_055_103_155_353_435_550_313_431_013_432_501_440_040_403_341_044_050_302_225_234_212_325_303_005_305_134_423_421_552_342_403_531_545_155_012',
-        ),
-        'ft⋅lbf': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 152_031_443_501_423_223_315_434_400_442_335_305_233_545_452_001_530_015_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_412_011_515_100_204_312_302_145_053_110_240_504_511_323_115_330_045_323_453_154_401_551_440_335_131_120_051_115_205_100_504_014_315_410_112',
-            _precalculated_reciprocal='1230.512_413_515_042_202_412_214_255_510_025_324_130_211_452_225_322_014_323_331_425_555_430_154_011_325_120_233_454_345_035_105_504_133_342_130_113',
-        ),
-        'ftlbf': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 152_031_443_501_423_223_315_434_400_442_335_305_233_545_452_001_530_015_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_412_011_515_100_204_312_302_145_053_110_240_504_511_323_115_330_045_323_453_154_401_551_440_335_131_120_051_115_205_100_504_014_315_410_112',
-            _precalculated_reciprocal='1230.512_413_515_042_202_412_214_255_510_025_324_130_211_452_225_322_014_323_331_425_555_430_154_011_325_120_233_454_345_035_105_504_133_342_130_113',
-        ),
-        'BTU': SezimalFraction(
-            '3_040_122_414_414_340_242_223_223_015_222_332_245_445_501_240_241_405_135_500_123_331_402_501 / 23_532_411_452_310_101_351_512_540_051_303_451_531_202_213_403_554_011_320_030_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_110_111_303_431_040_210_545_531_002_535_511_141_510_341_053_214_130_221_142_532_444_153_111_211_024_115_024_232_052_030_020_203_011_154',
-            _precalculated_reciprocal='5_041_315.351_445_535_142_245_024_154_234_030_534_525_441_402_333_555_540_044_133_034_405_411_540_055_353_414_322_424_230_534_125_241_035_145_134_350_422',
-        ),
-        'cal': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 550_043_400_104_455_101_112_134_050_044_400_124_103_330_253_002_324_405_200_000_000_000_000_000_000',
-            _precalculated_value='0.000_121_133_412_551_215_450_343_220_025_333_404_333_353_344_051_541_440_444_041_241_310_032_214_125_053_543_500_404_023_001_150_411_434_114_230',
-            _precalculated_reciprocal='4214.555_544_315_535_325_503_403_110_214_504_103_154_303_234_051_434_304_103_330_250_553_502_344_410_221_225_251_424_140_024_043_001_400_454_012_050',
-        ),
-        'erg': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_340_110_303_333_240_451_200_525_013_515_345_231_544_112_530_000_000_000_000_000_000',
-            _precalculated_value='540_313.344_510_430_422_532_334_202_142_424_022_552_152_300_250_042_440_141_233_205_332_215_114_233_504_445_033_055_513_121_133_015_432_505_213_453_302',
-            _precalculated_reciprocal='0.000_001_020_032_535_232_315_312_430_023_210_410_542_505_523_321_041_305_423_255_250_555_322_524_132_301_355_054_211_204_121_144_403_345_422_410',
-        ),
-        'eV': SezimalFraction(
-            '2_030_015_511_323_005_521_252_233_134_344_133_543_501_310_001_452_513_324_030_031_331_324_021_452_250_021_321_054_424_054 / 1_354_004_513_334_420_145_555_154_254_101_443_452_401_105_320_404_202_401_540_444_525_505_343',
-            _precalculated_value='1_131_305_134_334_005_054_423.502_432_102_330_512_120_103_532_101_542_401_522_133_323_121_422_405_354_333_015_524_502_201_350_014_244_134_043_531_250_042_051_044_130_202_400',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_443_455_125_515_252_412_412_201_204_245_324_554_135_511_443_134_534_155_000_110_525_114_550_204_055_404_303_221_022',
-        ),
-        'TNT': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 240_310_450_121_355_120_324_114_522_043_011_151_003_251_101_105_023_251_015_445_400_405_200_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_255_124_403_231_101_045_555_332_113_230_543_140_001_444_423_325_500_450_023_403_441_214_505_515_041_043_440_353_451_332_400',
-            _precalculated_reciprocal='2_003_013_513_052_310.003_132_241_054_540_022_413_122_310_232_055_231_414_154_243_130_012_235_001_530_552_101_440_251_340_424_141_013_131_312_123_520_101_231_421_310',
-        ),
-        'non_prefixed': ('prefixed', 'vrc', 'uxn', 'xrm', 'xky', 'ft⋅lbf', 'ftlbf'),
-    },
-    'uxn': {
-        'J': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'N·m': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'Pa·m3': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'C·V': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'prefixed': ('J', 'Wh', 'W·h', 'BTU', 'cal', 'erg', 'eV', 'TNT', 'N·m', 'Pa·m3', 'C·V'),
-        'vrc': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'uxn': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'xrm': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'xky': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'Wh': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_513_010_314_225_043_240_504_154_444_342_004_205_205_411_320_311_100_251_040_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_020_211_254_444_211_251_421_503_503_441_303_530_351_044_200_554_425_323_332_305_133_525_314_012_004_454_500_534_351_124_201_422_351_232',
-            _precalculated_reciprocal='25_244_150.115_055_103_155_353_435_550_313_431_013_432_501_440_040_403_341_044_050_302_225_234_212_325_303_005_305_134_423_421_552_342_403_531_545_155_012',
-        ),
-        'W·h': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_513_010_314_225_043_240_504_154_444_342_004_205_205_411_320_311_100_251_040_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_020_211_254_444_211_251_421_503_503_441_303_530_351_044_200_554_425_323_332_305_133_525_314_012_004_454_500_534_351_124_201_422_351_232',
-            _precalculated_reciprocal='25_244_150.115_055_103_155_353_435_550_313_431_013_432_501_440_040_403_341_044_050_302_225_234_212_325_303_005_305_134_423_421_552_342_403_531_545_155_012',
-        ),
-        'ft⋅lbf': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 152_031_443_501_423_223_315_434_400_442_335_305_233_545_452_001_530_015_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_412_011_515_100_204_312_302_145_053_110_240_504_511_323_115_330_045_323_453_154_401_551_440_335_131_120_051_115_205_100_504_014_315_410_112',
-            _precalculated_reciprocal='1230.512_413_515_042_202_412_214_255_510_025_324_130_211_452_225_322_014_323_331_425_555_430_154_011_325_120_233_454_345_035_105_504_133_342_130_113',
-        ),
-        'ftlbf': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 152_031_443_501_423_223_315_434_400_442_335_305_233_545_452_001_530_015_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_412_011_515_100_204_312_302_145_053_110_240_504_511_323_115_330_045_323_453_154_401_551_440_335_131_120_051_115_205_100_504_014_315_410_112',
-            _precalculated_reciprocal='1230.512_413_515_042_202_412_214_255_510_025_324_130_211_452_225_322_014_323_331_425_555_430_154_011_325_120_233_454_345_035_105_504_133_342_130_113',
-        ),
-        'BTU': SezimalFraction(
-            '3_040_122_414_414_340_242_223_223_015_222_332_245_445_501_240_241_405_135_500_123_331_402_501 / 23_532_411_452_310_101_351_512_540_051_303_451_531_202_213_403_554_011_320_030_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_110_111_303_431_040_210_545_531_002_535_511_141_510_341_053_214_130_221_142_532_444_153_111_211_024_115_024_232_052_030_020_203_011_154',
-            _precalculated_reciprocal='5_041_315.351_445_535_142_245_024_154_234_030_534_525_441_402_333_555_540_044_133_034_405_411_540_055_353_414_322_424_230_534_125_241_035_145_134_350_422',
-        ),
-        'cal': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 550_043_400_104_455_101_112_134_050_044_400_124_103_330_253_002_324_405_200_000_000_000_000_000_000',
-            _precalculated_value='0.000_121_133_412_551_215_450_343_220_025_333_404_333_353_344_051_541_440_444_041_241_310_032_214_125_053_543_500_404_023_001_150_411_434_114_230',
-            _precalculated_reciprocal='4214.555_544_315_535_325_503_403_110_214_504_103_154_303_234_051_434_304_103_330_250_553_502_344_410_221_225_251_424_140_024_043_001_400_454_012_050',
-        ),
-        'erg': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_340_110_303_333_240_451_200_525_013_515_345_231_544_112_530_000_000_000_000_000_000',
-            _precalculated_value='540_313.344_510_430_422_532_334_202_142_424_022_552_152_300_250_042_440_141_233_205_332_215_114_233_504_445_033_055_513_121_133_015_432_505_213_453_302',
-            _precalculated_reciprocal='0.000_001_020_032_535_232_315_312_430_023_210_410_542_505_523_321_041_305_423_255_250_555_322_524_132_301_355_054_211_204_121_144_403_345_422_410',
-        ),
-        'eV': SezimalFraction(
-            '2_030_015_511_323_005_521_252_233_134_344_133_543_501_310_001_452_513_324_030_031_331_324_021_452_250_021_321_054_424_054 / 1_354_004_513_334_420_145_555_154_254_101_443_452_401_105_320_404_202_401_540_444_525_505_343',
-            _precalculated_value='1_131_305_134_334_005_054_423.502_432_102_330_512_120_103_532_101_542_401_522_133_323_121_422_405_354_333_015_524_502_201_350_014_244_134_043_531_250_042_051_044_130_202_400',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_443_455_125_515_252_412_412_201_204_245_324_554_135_511_443_134_534_155_000_110_525_114_550_204_055_404_303_221_022',
-        ),
-        'TNT': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 240_310_450_121_355_120_324_114_522_043_011_151_003_251_101_105_023_251_015_445_400_405_200_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_255_124_403_231_101_045_555_332_113_230_543_140_001_444_423_325_500_450_023_403_441_214_505_515_041_043_440_353_451_332_400',
-            _precalculated_reciprocal='2_003_013_513_052_310.003_132_241_054_540_022_413_122_310_232_055_231_414_154_243_130_012_235_001_530_552_101_440_251_340_424_141_013_131_312_123_520_101_231_421_310',
-        ),
-        'non_prefixed': ('prefixed', 'vrc', 'uxn', 'xrm', 'xky', 'ft⋅lbf', 'ftlbf'),
-    },
-    'xrm': {
-        'J': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'N·m': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'Pa·m3': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'C·V': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'prefixed': ('J', 'Wh', 'W·h', 'BTU', 'cal', 'erg', 'eV', 'TNT', 'N·m', 'Pa·m3', 'C·V'),
-        'vrc': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'uxn': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'xrm': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'xky': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'Wh': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_513_010_314_225_043_240_504_154_444_342_004_205_205_411_320_311_100_251_040_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_020_211_254_444_211_251_421_503_503_441_303_530_351_044_200_554_425_323_332_305_133_525_314_012_004_454_500_534_351_124_201_422_351_232',
-            _precalculated_reciprocal='25_244_150.115_055_103_155_353_435_550_313_431_013_432_501_440_040_403_341_044_050_302_225_234_212_325_303_005_305_134_423_421_552_342_403_531_545_155_012',
-        ),
-        'W·h': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_513_010_314_225_043_240_504_154_444_342_004_205_205_411_320_311_100_251_040_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_020_211_254_444_211_251_421_503_503_441_303_530_351_044_200_554_425_323_332_305_133_525_314_012_004_454_500_534_351_124_201_422_351_232',
-            _precalculated_reciprocal='25_244_150.115_055_103_155_353_435_550_313_431_013_432_501_440_040_403_341_044_050_302_225_234_212_325_303_005_305_134_423_421_552_342_403_531_545_155_012',
-        ),
-        'ft⋅lbf': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 152_031_443_501_423_223_315_434_400_442_335_305_233_545_452_001_530_015_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_412_011_515_100_204_312_302_145_053_110_240_504_511_323_115_330_045_323_453_154_401_551_440_335_131_120_051_115_205_100_504_014_315_410_112',
-            _precalculated_reciprocal='1230.512_413_515_042_202_412_214_255_510_025_324_130_211_452_225_322_014_323_331_425_555_430_154_011_325_120_233_454_345_035_105_504_133_342_130_113',
-        ),
-        'ftlbf': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 152_031_443_501_423_223_315_434_400_442_335_305_233_545_452_001_530_015_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_412_011_515_100_204_312_302_145_053_110_240_504_511_323_115_330_045_323_453_154_401_551_440_335_131_120_051_115_205_100_504_014_315_410_112',
-            _precalculated_reciprocal='1230.512_413_515_042_202_412_214_255_510_025_324_130_211_452_225_322_014_323_331_425_555_430_154_011_325_120_233_454_345_035_105_504_133_342_130_113',
-        ),
-        'BTU': SezimalFraction(
-            '3_040_122_414_414_340_242_223_223_015_222_332_245_445_501_240_241_405_135_500_123_331_402_501 / 23_532_411_452_310_101_351_512_540_051_303_451_531_202_213_403_554_011_320_030_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_110_111_303_431_040_210_545_531_002_535_511_141_510_341_053_214_130_221_142_532_444_153_111_211_024_115_024_232_052_030_020_203_011_154',
-            _precalculated_reciprocal='5_041_315.351_445_535_142_245_024_154_234_030_534_525_441_402_333_555_540_044_133_034_405_411_540_055_353_414_322_424_230_534_125_241_035_145_134_350_422',
-        ),
-        'cal': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 550_043_400_104_455_101_112_134_050_044_400_124_103_330_253_002_324_405_200_000_000_000_000_000_000',
-            _precalculated_value='0.000_121_133_412_551_215_450_343_220_025_333_404_333_353_344_051_541_440_444_041_241_310_032_214_125_053_543_500_404_023_001_150_411_434_114_230',
-            _precalculated_reciprocal='4214.555_544_315_535_325_503_403_110_214_504_103_154_303_234_051_434_304_103_330_250_553_502_344_410_221_225_251_424_140_024_043_001_400_454_012_050',
-        ),
-        'erg': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_340_110_303_333_240_451_200_525_013_515_345_231_544_112_530_000_000_000_000_000_000',
-            _precalculated_value='540_313.344_510_430_422_532_334_202_142_424_022_552_152_300_250_042_440_141_233_205_332_215_114_233_504_445_033_055_513_121_133_015_432_505_213_453_302',
-            _precalculated_reciprocal='0.000_001_020_032_535_232_315_312_430_023_210_410_542_505_523_321_041_305_423_255_250_555_322_524_132_301_355_054_211_204_121_144_403_345_422_410',
-        ),
-        'eV': SezimalFraction(
-            '2_030_015_511_323_005_521_252_233_134_344_133_543_501_310_001_452_513_324_030_031_331_324_021_452_250_021_321_054_424_054 / 1_354_004_513_334_420_145_555_154_254_101_443_452_401_105_320_404_202_401_540_444_525_505_343',
-            _precalculated_value='1_131_305_134_334_005_054_423.502_432_102_330_512_120_103_532_101_542_401_522_133_323_121_422_405_354_333_015_524_502_201_350_014_244_134_043_531_250_042_051_044_130_202_400',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_443_455_125_515_252_412_412_201_204_245_324_554_135_511_443_134_534_155_000_110_525_114_550_204_055_404_303_221_022',
-        ),
-        'TNT': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 240_310_450_121_355_120_324_114_522_043_011_151_003_251_101_105_023_251_015_445_400_405_200_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_255_124_403_231_101_045_555_332_113_230_543_140_001_444_423_325_500_450_023_403_441_214_505_515_041_043_440_353_451_332_400',
-            _precalculated_reciprocal='2_003_013_513_052_310.003_132_241_054_540_022_413_122_310_232_055_231_414_154_243_130_012_235_001_530_552_101_440_251_340_424_141_013_131_312_123_520_101_231_421_310',
-        ),
-        'non_prefixed': ('prefixed', 'vrc', 'uxn', 'xrm', 'xky', 'ft⋅lbf', 'ftlbf'),
-    },
-    'xky': {
-        'J': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'N·m': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'Pa·m3': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'C·V': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'prefixed': ('J', 'Wh', 'W·h', 'BTU', 'cal', 'erg', 'eV', 'TNT', 'N·m', 'Pa·m3', 'C·V'),
-        'vrc': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'uxn': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'xrm': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'xky': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'Wh': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_513_010_314_225_043_240_504_154_444_342_004_205_205_411_320_311_100_251_040_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_020_211_254_444_211_251_421_503_503_441_303_530_351_044_200_554_425_323_332_305_133_525_314_012_004_454_500_534_351_124_201_422_351_232',
-            _precalculated_reciprocal='25_244_150.115_055_103_155_353_435_550_313_431_013_432_501_440_040_403_341_044_050_302_225_234_212_325_303_005_305_134_423_421_552_342_403_531_545_155_012',
-        ),
-        'W·h': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_513_010_314_225_043_240_504_154_444_342_004_205_205_411_320_311_100_251_040_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_020_211_254_444_211_251_421_503_503_441_303_530_351_044_200_554_425_323_332_305_133_525_314_012_004_454_500_534_351_124_201_422_351_232',
-            _precalculated_reciprocal='25_244_150.115_055_103_155_353_435_550_313_431_013_432_501_440_040_403_341_044_050_302_225_234_212_325_303_005_305_134_423_421_552_342_403_531_545_155_012',
-        ),
-        'ft⋅lbf': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 152_031_443_501_423_223_315_434_400_442_335_305_233_545_452_001_530_015_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_412_011_515_100_204_312_302_145_053_110_240_504_511_323_115_330_045_323_453_154_401_551_440_335_131_120_051_115_205_100_504_014_315_410_112',
-            _precalculated_reciprocal='1230.512_413_515_042_202_412_214_255_510_025_324_130_211_452_225_322_014_323_331_425_555_430_154_011_325_120_233_454_345_035_105_504_133_342_130_113',
-        ),
-        'ftlbf': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 152_031_443_501_423_223_315_434_400_442_335_305_233_545_452_001_530_015_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_412_011_515_100_204_312_302_145_053_110_240_504_511_323_115_330_045_323_453_154_401_551_440_335_131_120_051_115_205_100_504_014_315_410_112',
-            _precalculated_reciprocal='1230.512_413_515_042_202_412_214_255_510_025_324_130_211_452_225_322_014_323_331_425_555_430_154_011_325_120_233_454_345_035_105_504_133_342_130_113',
-        ),
-        'BTU': SezimalFraction(
-            '3_040_122_414_414_340_242_223_223_015_222_332_245_445_501_240_241_405_135_500_123_331_402_501 / 23_532_411_452_310_101_351_512_540_051_303_451_531_202_213_403_554_011_320_030_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_110_111_303_431_040_210_545_531_002_535_511_141_510_341_053_214_130_221_142_532_444_153_111_211_024_115_024_232_052_030_020_203_011_154',
-            _precalculated_reciprocal='5_041_315.351_445_535_142_245_024_154_234_030_534_525_441_402_333_555_540_044_133_034_405_411_540_055_353_414_322_424_230_534_125_241_035_145_134_350_422',
-        ),
-        'cal': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 550_043_400_104_455_101_112_134_050_044_400_124_103_330_253_002_324_405_200_000_000_000_000_000_000',
-            _precalculated_value='0.000_121_133_412_551_215_450_343_220_025_333_404_333_353_344_051_541_440_444_041_241_310_032_214_125_053_543_500_404_023_001_150_411_434_114_230',
-            _precalculated_reciprocal='4214.555_544_315_535_325_503_403_110_214_504_103_154_303_234_051_434_304_103_330_250_553_502_344_410_221_225_251_424_140_024_043_001_400_454_012_050',
-        ),
-        'erg': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_340_110_303_333_240_451_200_525_013_515_345_231_544_112_530_000_000_000_000_000_000',
-            _precalculated_value='540_313.344_510_430_422_532_334_202_142_424_022_552_152_300_250_042_440_141_233_205_332_215_114_233_504_445_033_055_513_121_133_015_432_505_213_453_302',
-            _precalculated_reciprocal='0.000_001_020_032_535_232_315_312_430_023_210_410_542_505_523_321_041_305_423_255_250_555_322_524_132_301_355_054_211_204_121_144_403_345_422_410',
-        ),
-        'eV': SezimalFraction(
-            '2_030_015_511_323_005_521_252_233_134_344_133_543_501_310_001_452_513_324_030_031_331_324_021_452_250_021_321_054_424_054 / 1_354_004_513_334_420_145_555_154_254_101_443_452_401_105_320_404_202_401_540_444_525_505_343',
-            _precalculated_value='1_131_305_134_334_005_054_423.502_432_102_330_512_120_103_532_101_542_401_522_133_323_121_422_405_354_333_015_524_502_201_350_014_244_134_043_531_250_042_051_044_130_202_400',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_443_455_125_515_252_412_412_201_204_245_324_554_135_511_443_134_534_155_000_110_525_114_550_204_055_404_303_221_022',
-        ),
-        'TNT': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 240_310_450_121_355_120_324_114_522_043_011_151_003_251_101_105_023_251_015_445_400_405_200_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_255_124_403_231_101_045_555_332_113_230_543_140_001_444_423_325_500_450_023_403_441_214_505_515_041_043_440_353_451_332_400',
-            _precalculated_reciprocal='2_003_013_513_052_310.003_132_241_054_540_022_413_122_310_232_055_231_414_154_243_130_012_235_001_530_552_101_440_251_340_424_141_013_131_312_123_520_101_231_421_310',
-        ),
-        'non_prefixed': ('prefixed', 'vrc', 'uxn', 'xrm', 'xky', 'ft⋅lbf', 'ftlbf'),
-    },
-    'drv·pad2/ang2': {
-        'J': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'N·m': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'Pa·m3': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'C·V': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_115_525_103_524_014_044_201_211_251_025_312_543_411_353_052_455_150_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_542_044_523_544_444_400_502_504_103_025_145_154_422_504_144_323_044_511_530_023_445_124_235_141_412_244_343_345_224_412_204_524_031_443_430',
-            _precalculated_reciprocal='1014.201_032_035_413_320_534_523_501_040_202_325_511_002_133_335_025_255_203_043_430_051_141_453_345_044_132_254_053_433_034_234_500_514_152_054_055',
-        ),
-        'prefixed': ('J', 'Wh', 'W·h', 'BTU', 'cal', 'erg', 'eV', 'TNT', 'N·m', 'Pa·m3', 'C·V'),
-        'vrc': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'uxn': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'xrm': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'xky': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'Wh': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_513_010_314_225_043_240_504_154_444_342_004_205_205_411_320_311_100_251_040_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_020_211_254_444_211_251_421_503_503_441_303_530_351_044_200_554_425_323_332_305_133_525_314_012_004_454_500_534_351_124_201_422_351_232',
-            _precalculated_reciprocal='25_244_150.115_055_103_155_353_435_550_313_431_013_432_501_440_040_403_341_044_050_302_225_234_212_325_303_005_305_134_423_421_552_342_403_531_545_155_012',
-        ),
-        'W·h': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_513_010_314_225_043_240_504_154_444_342_004_205_205_411_320_311_100_251_040_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_020_211_254_444_211_251_421_503_503_441_303_530_351_044_200_554_425_323_332_305_133_525_314_012_004_454_500_534_351_124_201_422_351_232',
-            _precalculated_reciprocal='25_244_150.115_055_103_155_353_435_550_313_431_013_432_501_440_040_403_341_044_050_302_225_234_212_325_303_005_305_134_423_421_552_342_403_531_545_155_012',
-        ),
-        'ft⋅lbf': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 152_031_443_501_423_223_315_434_400_442_335_305_233_545_452_001_530_015_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_412_011_515_100_204_312_302_145_053_110_240_504_511_323_115_330_045_323_453_154_401_551_440_335_131_120_051_115_205_100_504_014_315_410_112',
-            _precalculated_reciprocal='1230.512_413_515_042_202_412_214_255_510_025_324_130_211_452_225_322_014_323_331_425_555_430_154_011_325_120_233_454_345_035_105_504_133_342_130_113',
-        ),
-        'ftlbf': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 152_031_443_501_423_223_315_434_400_442_335_305_233_545_452_001_530_015_400_000_000_000_000_000_000',
-            _precalculated_value='0.000_412_011_515_100_204_312_302_145_053_110_240_504_511_323_115_330_045_323_453_154_401_551_440_335_131_120_051_115_205_100_504_014_315_410_112',
-            _precalculated_reciprocal='1230.512_413_515_042_202_412_214_255_510_025_324_130_211_452_225_322_014_323_331_425_555_430_154_011_325_120_233_454_345_035_105_504_133_342_130_113',
-        ),
-        'BTU': SezimalFraction(
-            '3_040_122_414_414_340_242_223_223_015_222_332_245_445_501_240_241_405_135_500_123_331_402_501 / 23_532_411_452_310_101_351_512_540_051_303_451_531_202_213_403_554_011_320_030_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_110_111_303_431_040_210_545_531_002_535_511_141_510_341_053_214_130_221_142_532_444_153_111_211_024_115_024_232_052_030_020_203_011_154',
-            _precalculated_reciprocal='5_041_315.351_445_535_142_245_024_154_234_030_534_525_441_402_333_555_540_044_133_034_405_411_540_055_353_414_322_424_230_534_125_241_035_145_134_350_422',
-        ),
-        'cal': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 550_043_400_104_455_101_112_134_050_044_400_124_103_330_253_002_324_405_200_000_000_000_000_000_000',
-            _precalculated_value='0.000_121_133_412_551_215_450_343_220_025_333_404_333_353_344_051_541_440_444_041_241_310_032_214_125_053_543_500_404_023_001_150_411_434_114_230',
-            _precalculated_reciprocal='4214.555_544_315_535_325_503_403_110_214_504_103_154_303_234_051_434_304_103_330_250_553_502_344_410_221_225_251_424_140_024_043_001_400_454_012_050',
-        ),
-        'erg': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 122_340_110_303_333_240_451_200_525_013_515_345_231_544_112_530_000_000_000_000_000_000',
-            _precalculated_value='540_313.344_510_430_422_532_334_202_142_424_022_552_152_300_250_042_440_141_233_205_332_215_114_233_504_445_033_055_513_121_133_015_432_505_213_453_302',
-            _precalculated_reciprocal='0.000_001_020_032_535_232_315_312_430_023_210_410_542_505_523_321_041_305_423_255_250_555_322_524_132_301_355_054_211_204_121_144_403_345_422_410',
-        ),
-        'eV': SezimalFraction(
-            '2_030_015_511_323_005_521_252_233_134_344_133_543_501_310_001_452_513_324_030_031_331_324_021_452_250_021_321_054_424_054 / 1_354_004_513_334_420_145_555_154_254_101_443_452_401_105_320_404_202_401_540_444_525_505_343',
-            _precalculated_value='1_131_305_134_334_005_054_423.502_432_102_330_512_120_103_532_101_542_401_522_133_323_121_422_405_354_333_015_524_502_201_350_014_244_134_043_531_250_042_051_044_130_202_400',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_443_455_125_515_252_412_412_201_204_245_324_554_135_511_443_134_534_155_000_110_525_114_550_204_055_404_303_221_022',
-        ),
-        'TNT': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 240_310_450_121_355_120_324_114_522_043_011_151_003_251_101_105_023_251_015_445_400_405_200_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_255_124_403_231_101_045_555_332_113_230_543_140_001_444_423_325_500_450_023_403_441_214_505_515_041_043_440_353_451_332_400',
-            _precalculated_reciprocal='2_003_013_513_052_310.003_132_241_054_540_022_413_122_310_232_055_231_414_154_243_130_012_235_001_530_552_101_440_251_340_424_141_013_131_312_123_520_101_231_421_310',
-        ),
-        'non_prefixed': ('prefixed', 'vrc', 'uxn', 'xrm', 'xky', 'ft⋅lbf', 'ftlbf'),
-    },
-    'xkt': {
-        'W': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 2_330_004_210_535_230_144_322_515_111_025_202_523_323_445_012_204_440_152_424_000_000_000_000_000',
-            _precalculated_value='0.030_315_124_110_315_115_332_435_435_402_135_513_544_410_301_254_042_205_220_441_522_512_153_020_011_124_131_223_544_510_302_333_545_050_324_415',
-            _precalculated_reciprocal='15.350_512_051_235_242_115_434_303_552_210_300_410_301_521_104_024_242_224_430_432_201_335_342_525_415_402_003_403_303_054_253_153_425_442_341_152',
-        ),
-        'J/s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 2_330_004_210_535_230_144_322_515_111_025_202_523_323_445_012_204_440_152_424_000_000_000_000_000',
-            _precalculated_value='0.030_315_124_110_315_115_332_435_435_402_135_513_544_410_301_254_042_205_220_441_522_512_153_020_011_124_131_223_544_510_302_333_545_050_324_415',
-            _precalculated_reciprocal='15.350_512_051_235_242_115_434_303_552_210_300_410_301_521_104_024_242_224_430_432_201_335_342_525_415_402_003_403_303_054_253_153_425_442_341_152',
-        ),
-        'N·m/s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 2_330_004_210_535_230_144_322_515_111_025_202_523_323_445_012_204_440_152_424_000_000_000_000_000',
-            _precalculated_value='0.030_315_124_110_315_115_332_435_435_402_135_513_544_410_301_254_042_205_220_441_522_512_153_020_011_124_131_223_544_510_302_333_545_050_324_415',
-            _precalculated_reciprocal='15.350_512_051_235_242_115_434_303_552_210_300_410_301_521_104_024_242_224_430_432_201_335_342_525_415_402_003_403_303_054_253_153_425_442_341_152',
-        ),
-        'kg·m2/s3': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 2_330_004_210_535_230_144_322_515_111_025_202_523_323_445_012_204_440_152_424_000_000_000_000_000',
-            _precalculated_value='0.030_315_124_110_315_115_332_435_435_402_135_513_544_410_301_254_042_205_220_441_522_512_153_020_011_124_131_223_544_510_302_333_545_050_324_415',
-            _precalculated_reciprocal='15.350_512_051_235_242_115_434_303_552_210_300_410_301_521_104_024_242_224_430_432_201_335_342_525_415_402_003_403_303_054_253_153_425_442_341_152',
-        ),
-        'prefixed': ('W', 'J/s', 'N·m/s'),
-        'cv': SezimalFraction(
-            '10_502_525_550_435_203_222_520_141_525_514_301_500_434_240_440_554_530_450_500_305_300_032_351 / 1_131_235_514_145_553_253_331_431_214_005_204_003_542_435_314_042_022_451_211_320_000_000_000_000_000',
-            _precalculated_value='0.000_005_240_501_221_222_350_122_115_515_315_311_254_050_254_554_423_315_145_240_243_321_023_121_435_055_120_213_325_533_123_113_141_151_301_315',
-            _precalculated_reciprocal='103_351.204_302_014_130_342_310_455_254_521_443_441_243_241_414_533_122_135_545_420_315_132_235_244_222_042_444_052_003_311_244_201_405_031_542_144_324',
-        ),
-        'ft⋅lbf/s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_300_323_541_203_151_100_454_443_520_435_353_220_220_043_135_353_144_333_344_000_000_000_000_000',
-            _precalculated_value='0.021_403_331_210_512_154_544_351_441_150_243_234_222_000_142_334_052_522_424_402_432_201_021_003_101_211_533_310_231_104_011_531_400_405_333_112',
-            _precalculated_reciprocal='23.441_412_445_455_324_422_021_044_354_243_323_140_324_034_504_055_100_033_245_123_235_553_123_334_100_115_214_054_304_455_225_413_011_224_123_402',
-        ),
-        'ft⋅lbf/min': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 20_335_355_453_353_304_114_102_510_451_332_205_001_222_504_332_204_402_054_400_000_000_000_000',
-            _precalculated_value='3.444_555_213_524_151_413_542_455_010_243_342_115_520_025_220_053_050_032_344_433_352_143_340_514_214_111_551_441_155_042_111_244_105_315_520_200',
-            _precalculated_reciprocal='0.132_454_540_255_220_513_500_115_135_550_243_131_002_022_440_400_330_333_542_515_353_555_542_020_545_223_104_545_213_025_220_143_430_042_400_510',
-        ),
-        'ft⋅lbf/h': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 113_221_110_321_054_134_211_503_040_305_423_403_342_351_513_201_140_011_440_000_000_000_000',
-            _precalculated_value='1020.015_454_430_310_450_433_241_421_443_401_141_145_204_455_213_112_205_421_554_002_545_400_524_514_500_114_455_011_431_140_023_455_313_145_231_523',
-            _precalculated_reciprocal='0.000_540_325_450_331_225_321_445_330_555_524_015_414_500_125_113_335_413_211_014_221_055_555_500_114_405_015_252_142_315_031_223_243_522_502_230',
-        ),
-        'hp': SezimalFraction(
-            '4_205_043_445_222_505_234_322_210_401_321_122_132_043_213_120_344_433_442_100_200_121_052_435 / 451_044_405_311_233_314_305_215_442_342_450_421_311_250_151_450_412_542_001_252_000_000_000_000_000',
-            _precalculated_value='0.000_005_212_423_552_225_400_523_014_043_115_150_313_104_502_201_141_154_132_020_500_100_132_545_155_052_424_112_330_342_440_033_544_003_225_215',
-            _precalculated_reciprocal='104_110.043_030_343_131_334_245_234_550_425_311_524_124_002_104_533_313_530_355_440_554_224_545_221_240_120_351_111_523_144_502_231_400_510_403_330_333',
-        ),
-        'BTU/h': SezimalFraction(
-            '3_040_122_414_414_340_242_223_223_015_222_332_245_445_501_240_241_405_135_500_123_331_402_501 / 14_341_445_113_404_041_033_125_544_033_002_313_140_521_330_242_354_405_012_020_000_000_000_000',
-            _precalculated_value='0.143_145_135_344_400_314_242_514_304_225_444_532_443_531_422_023_213_331_534_221_110_251_445_014_340_154_340_350_120_043_030_304_314_553_021_440',
-            _precalculated_reciprocal='3.225_011_433_111_543_305_351_214_514_542_420_343_135_505_041_422_355_544_030_502_023_043_445_144_035_434_251_013_454_540_342_455_344_423_311_303',
-        ),
-        'cal/s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 14_450_431_230_033_354_445_215_513_554_450_310_403_451_501_222_444_345_243_132_000_000_000_000_000',
-            _precalculated_value='0.004_233_430_450_313_411_444_005_223_552_315_114_121_244_451_401_543_233_130_044_114_553_303_025_424_423_034_424_112_314_530_124_312_251_312_043',
-            _precalculated_reciprocal='120.414_115_341_140_410_010_200_523_302_532_330_244_543_302_102_025_002_114_251_501_144_200_021_130_503_021_014_120_404_511_255_100_030_321_054_110',
-        ),
-        'kcal/h': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_000_313_221_010_003_400_055_144_435_400_251_505_020_502_220_035_542_103_323_320_000_000_000_000',
-            _precalculated_value='0.023_543_525_150_432_310_244_520_133_313_104_212_005_140_310_011_020_204_300_245_325_543_015_032_402_352_440_134_201_552_034_250_424_043_045_131',
-            _precalculated_reciprocal='21.310_501_121_004_505_401_432_130_150_451_415_044_013_350_334_324_420_340_524_502_205_512_003_403_122_503_342_501_305_204_025_434_005_053_353_300',
-        ),
-        'non_prefixed': ('kg·m2/s3', 'prefixed', 'cv', 'ft⋅lbf/s', 'ft⋅lbf/min', 'ft⋅lbf/h', 'hp', 'BTU/h', 'cal/s', 'kcal/h'),
-    },
-    'drv·pad2/ang3': {
-        'W': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 2_330_004_210_535_230_144_322_515_111_025_202_523_323_445_012_204_440_152_424_000_000_000_000_000',
-            _precalculated_value='0.030_315_124_110_315_115_332_435_435_402_135_513_544_410_301_254_042_205_220_441_522_512_153_020_011_124_131_223_544_510_302_333_545_050_324_415',
-            _precalculated_reciprocal='15.350_512_051_235_242_115_434_303_552_210_300_410_301_521_104_024_242_224_430_432_201_335_342_525_415_402_003_403_303_054_253_153_425_442_341_152',
-        ),
-        'J/s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 2_330_004_210_535_230_144_322_515_111_025_202_523_323_445_012_204_440_152_424_000_000_000_000_000',
-            _precalculated_value='0.030_315_124_110_315_115_332_435_435_402_135_513_544_410_301_254_042_205_220_441_522_512_153_020_011_124_131_223_544_510_302_333_545_050_324_415',
-            _precalculated_reciprocal='15.350_512_051_235_242_115_434_303_552_210_300_410_301_521_104_024_242_224_430_432_201_335_342_525_415_402_003_403_303_054_253_153_425_442_341_152',
-        ),
-        'N·m/s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 2_330_004_210_535_230_144_322_515_111_025_202_523_323_445_012_204_440_152_424_000_000_000_000_000',
-            _precalculated_value='0.030_315_124_110_315_115_332_435_435_402_135_513_544_410_301_254_042_205_220_441_522_512_153_020_011_124_131_223_544_510_302_333_545_050_324_415',
-            _precalculated_reciprocal='15.350_512_051_235_242_115_434_303_552_210_300_410_301_521_104_024_242_224_430_432_201_335_342_525_415_402_003_403_303_054_253_153_425_442_341_152',
-        ),
-        'kg·m2/s3': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 2_330_004_210_535_230_144_322_515_111_025_202_523_323_445_012_204_440_152_424_000_000_000_000_000',
-            _precalculated_value='0.030_315_124_110_315_115_332_435_435_402_135_513_544_410_301_254_042_205_220_441_522_512_153_020_011_124_131_223_544_510_302_333_545_050_324_415',
-            _precalculated_reciprocal='15.350_512_051_235_242_115_434_303_552_210_300_410_301_521_104_024_242_224_430_432_201_335_342_525_415_402_003_403_303_054_253_153_425_442_341_152',
-        ),
-        'prefixed': ('W', 'J/s', 'N·m/s'),
-        'cv': SezimalFraction(
-            '10_502_525_550_435_203_222_520_141_525_514_301_500_434_240_440_554_530_450_500_305_300_032_351 / 1_131_235_514_145_553_253_331_431_214_005_204_003_542_435_314_042_022_451_211_320_000_000_000_000_000',
-            _precalculated_value='0.000_005_240_501_221_222_350_122_115_515_315_311_254_050_254_554_423_315_145_240_243_321_023_121_435_055_120_213_325_533_123_113_141_151_301_315',
-            _precalculated_reciprocal='103_351.204_302_014_130_342_310_455_254_521_443_441_243_241_414_533_122_135_545_420_315_132_235_244_222_042_444_052_003_311_244_201_405_031_542_144_324',
-        ),
-        'ft⋅lbf/s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_300_323_541_203_151_100_454_443_520_435_353_220_220_043_135_353_144_333_344_000_000_000_000_000',
-            _precalculated_value='0.021_403_331_210_512_154_544_351_441_150_243_234_222_000_142_334_052_522_424_402_432_201_021_003_101_211_533_310_231_104_011_531_400_405_333_112',
-            _precalculated_reciprocal='23.441_412_445_455_324_422_021_044_354_243_323_140_324_034_504_055_100_033_245_123_235_553_123_334_100_115_214_054_304_455_225_413_011_224_123_402',
-        ),
-        'ft⋅lbf/min': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 20_335_355_453_353_304_114_102_510_451_332_205_001_222_504_332_204_402_054_400_000_000_000_000',
-            _precalculated_value='3.444_555_213_524_151_413_542_455_010_243_342_115_520_025_220_053_050_032_344_433_352_143_340_514_214_111_551_441_155_042_111_244_105_315_520_200',
-            _precalculated_reciprocal='0.132_454_540_255_220_513_500_115_135_550_243_131_002_022_440_400_330_333_542_515_353_555_542_020_545_223_104_545_213_025_220_143_430_042_400_510',
-        ),
-        'ft⋅lbf/h': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 113_221_110_321_054_134_211_503_040_305_423_403_342_351_513_201_140_011_440_000_000_000_000',
-            _precalculated_value='1020.015_454_430_310_450_433_241_421_443_401_141_145_204_455_213_112_205_421_554_002_545_400_524_514_500_114_455_011_431_140_023_455_313_145_231_523',
-            _precalculated_reciprocal='0.000_540_325_450_331_225_321_445_330_555_524_015_414_500_125_113_335_413_211_014_221_055_555_500_114_405_015_252_142_315_031_223_243_522_502_230',
-        ),
-        'hp': SezimalFraction(
-            '4_205_043_445_222_505_234_322_210_401_321_122_132_043_213_120_344_433_442_100_200_121_052_435 / 451_044_405_311_233_314_305_215_442_342_450_421_311_250_151_450_412_542_001_252_000_000_000_000_000',
-            _precalculated_value='0.000_005_212_423_552_225_400_523_014_043_115_150_313_104_502_201_141_154_132_020_500_100_132_545_155_052_424_112_330_342_440_033_544_003_225_215',
-            _precalculated_reciprocal='104_110.043_030_343_131_334_245_234_550_425_311_524_124_002_104_533_313_530_355_440_554_224_545_221_240_120_351_111_523_144_502_231_400_510_403_330_333',
-        ),
-        'BTU/h': SezimalFraction(
-            '3_040_122_414_414_340_242_223_223_015_222_332_245_445_501_240_241_405_135_500_123_331_402_501 / 14_341_445_113_404_041_033_125_544_033_002_313_140_521_330_242_354_405_012_020_000_000_000_000',
-            _precalculated_value='0.143_145_135_344_400_314_242_514_304_225_444_532_443_531_422_023_213_331_534_221_110_251_445_014_340_154_340_350_120_043_030_304_314_553_021_440',
-            _precalculated_reciprocal='3.225_011_433_111_543_305_351_214_514_542_420_343_135_505_041_422_355_544_030_502_023_043_445_144_035_434_251_013_454_540_342_455_344_423_311_303',
-        ),
-        'cal/s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 14_450_431_230_033_354_445_215_513_554_450_310_403_451_501_222_444_345_243_132_000_000_000_000_000',
-            _precalculated_value='0.004_233_430_450_313_411_444_005_223_552_315_114_121_244_451_401_543_233_130_044_114_553_303_025_424_423_034_424_112_314_530_124_312_251_312_043',
-            _precalculated_reciprocal='120.414_115_341_140_410_010_200_523_302_532_330_244_543_302_102_025_002_114_251_501_144_200_021_130_503_021_014_120_404_511_255_100_030_321_054_110',
-        ),
-        'kcal/h': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 3_000_313_221_010_003_400_055_144_435_400_251_505_020_502_220_035_542_103_323_320_000_000_000_000',
-            _precalculated_value='0.023_543_525_150_432_310_244_520_133_313_104_212_005_140_310_011_020_204_300_245_325_543_015_032_402_352_440_134_201_552_034_250_424_043_045_131',
-            _precalculated_reciprocal='21.310_501_121_004_505_401_432_130_150_451_415_044_013_350_334_324_420_340_524_502_205_512_003_403_122_503_342_501_305_204_025_434_005_053_353_300',
-        ),
-        'non_prefixed': ('kg·m2/s3', 'prefixed', 'cv', 'ft⋅lbf/s', 'ft⋅lbf/min', 'ft⋅lbf/h', 'hp', 'BTU/h', 'cal/s', 'kcal/h'),
-    },
-    'svg': {
-        'g·m/s': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 211_221_143_115_332_115_043_350_343_512_013_155_214_420_000_000_000_000_000_000',
-            _precalculated_value='12.433_311_431_314_140_401_320_512_044_110_452_231_153_443_155_001_015_230_332_444_020_301_131_534_442_514_443_211_001_044_523_530_355_540_143_411',
-            _precalculated_reciprocal='0.040_350_053_551_242_020_505_053_125_425_034_353_010_333_105_032_121_214_313_332_352_544_255_054_020_403_413_410_052_455_401_144_233_405_520_525',
-        ),
-        'gm/s': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 211_221_143_115_332_115_043_350_343_512_013_155_214_420_000_000_000_000_000_000',
-            _precalculated_value='12.433_311_431_314_140_401_320_512_044_110_452_231_153_443_155_001_015_230_332_444_020_301_131_534_442_514_443_211_001_044_523_530_355_540_143_411',
-            _precalculated_reciprocal='0.040_350_053_551_242_020_505_053_125_425_034_353_010_333_105_032_121_214_313_332_352_544_255_054_020_403_413_410_052_455_401_144_233_405_520_525',
-        ),
-        'N·s': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 1_411_322_512_404_201_334_103_545_445_010_323_110_250_550_120_000_000_000_000_000_000',
-            _precalculated_value='0.001_521_000_451_143_321_545_231_434_440_304_532_312_254_354_225_350_244_543_530_520_403_504_145_352_323_151_044_213_000_124_522_214_353_403_450',
-            _precalculated_reciprocal='310.023_341_150_541_551_305_105_532_453_504_512_530_314_034_125_352_342_052_231_340_341_132_033_402_415_503_315_051_555_452_402_145_433_541_040_211',
-        ),
-        'prefixed': ('g·m/s', 'gm/s', 'N·s'),
-        'svg': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'jut': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'lb·ft/s': SezimalFraction(
-            '334_434_541_030_323_553_025_123_421_242_014_004_305_532_425_300_233_132_440_422_425 / 13_314_232_205_401_023_424_033_521_311_503_005_315_322_545_050_534_300_000_000_000_000',
-            _precalculated_value='0.021_410_155_125_015_001_324_443_532_255_435_344_413_233_045_034_521_100_315_003_220_522_325_323_152_300_541_550_405_000_534_455_032_014_453_331',
-            _precalculated_reciprocal='23.434_314_341_023_240_504_120_550_405_320_233_111_134_444_303_320_055_104_145_501_000_021_355_243_125_252_423_012_015_025_555_544_300_033_215_225',
-        ),
-        'sl·ft/s': SezimalFraction(
-            '24_040_005_115_524_005_100_403_420_131_140_155_430_144_250_501_355_504_344_524_301 / 101_503_045_335_151_335_525_444_411_532_210_510_054_351_410_313_000_000_000_000_000_000',
-            _precalculated_value='0.000_231_540_412_510_521_542_335_130_005_305_302_321_525_005_301_003_300_320_532_354_442_105_041_212_444_225_200_231_004_405_422_322_405_453_545',
-            _precalculated_reciprocal='2203.230_242_231_000_344_154_550_054_302_121_121_303_335_221_140_010_514_333_125_155_034_414_431_203_401_235_524_155_345_511_335_404_215_444_212_030',
-        ),
-        'non_prefixed': ('prefixed', 'svg', 'jut', 'lb·ft/s', 'sl·ft/s'),
-    },
-    'jut': {
-        'g·m/s': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 211_221_143_115_332_115_043_350_343_512_013_155_214_420_000_000_000_000_000_000',
-            _precalculated_value='12.433_311_431_314_140_401_320_512_044_110_452_231_153_443_155_001_015_230_332_444_020_301_131_534_442_514_443_211_001_044_523_530_355_540_143_411',
-            _precalculated_reciprocal='0.040_350_053_551_242_020_505_053_125_425_034_353_010_333_105_032_121_214_313_332_352_544_255_054_020_403_413_410_052_455_401_144_233_405_520_525',
-        ),
-        'gm/s': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 211_221_143_115_332_115_043_350_343_512_013_155_214_420_000_000_000_000_000_000',
-            _precalculated_value='12.433_311_431_314_140_401_320_512_044_110_452_231_153_443_155_001_015_230_332_444_020_301_131_534_442_514_443_211_001_044_523_530_355_540_143_411',
-            _precalculated_reciprocal='0.040_350_053_551_242_020_505_053_125_425_034_353_010_333_105_032_121_214_313_332_352_544_255_054_020_403_413_410_052_455_401_144_233_405_520_525',
-        ),
-        'N·s': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 1_411_322_512_404_201_334_103_545_445_010_323_110_250_550_120_000_000_000_000_000_000',
-            _precalculated_value='0.001_521_000_451_143_321_545_231_434_440_304_532_312_254_354_225_350_244_543_530_520_403_504_145_352_323_151_044_213_000_124_522_214_353_403_450',
-            _precalculated_reciprocal='310.023_341_150_541_551_305_105_532_453_504_512_530_314_034_125_352_342_052_231_340_341_132_033_402_415_503_315_051_555_452_402_145_433_541_040_211',
-        ),
-        'prefixed': ('g·m/s', 'gm/s', 'N·s'),
-        'svg': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'jut': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'lb·ft/s': SezimalFraction(
-            '334_434_541_030_323_553_025_123_421_242_014_004_305_532_425_300_233_132_440_422_425 / 13_314_232_205_401_023_424_033_521_311_503_005_315_322_545_050_534_300_000_000_000_000',
-            _precalculated_value='0.021_410_155_125_015_001_324_443_532_255_435_344_413_233_045_034_521_100_315_003_220_522_325_323_152_300_541_550_405_000_534_455_032_014_453_331',
-            _precalculated_reciprocal='23.434_314_341_023_240_504_120_550_405_320_233_111_134_444_303_320_055_104_145_501_000_021_355_243_125_252_423_012_015_025_555_544_300_033_215_225',
-        ),
-        'sl·ft/s': SezimalFraction(
-            '24_040_005_115_524_005_100_403_420_131_140_155_430_144_250_501_355_504_344_524_301 / 101_503_045_335_151_335_525_444_411_532_210_510_054_351_410_313_000_000_000_000_000_000',
-            _precalculated_value='0.000_231_540_412_510_521_542_335_130_005_305_302_321_525_005_301_003_300_320_532_354_442_105_041_212_444_225_200_231_004_405_422_322_405_453_545',
-            _precalculated_reciprocal='2203.230_242_231_000_344_154_550_054_302_121_121_303_335_221_140_010_514_333_125_155_034_414_431_203_401_235_524_155_345_511_335_404_215_444_212_030',
-        ),
-        'non_prefixed': ('prefixed', 'svg', 'jut', 'lb·ft/s', 'sl·ft/s'),
-    },
-    'drv·veg': {
-        'g·m/s': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 211_221_143_115_332_115_043_350_343_512_013_155_214_420_000_000_000_000_000_000',
-            _precalculated_value='12.433_311_431_314_140_401_320_512_044_110_452_231_153_443_155_001_015_230_332_444_020_301_131_534_442_514_443_211_001_044_523_530_355_540_143_411',
-            _precalculated_reciprocal='0.040_350_053_551_242_020_505_053_125_425_034_353_010_333_105_032_121_214_313_332_352_544_255_054_020_403_413_410_052_455_401_144_233_405_520_525',
-        ),
-        'gm/s': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 211_221_143_115_332_115_043_350_343_512_013_155_214_420_000_000_000_000_000_000',
-            _precalculated_value='12.433_311_431_314_140_401_320_512_044_110_452_231_153_443_155_001_015_230_332_444_020_301_131_534_442_514_443_211_001_044_523_530_355_540_143_411',
-            _precalculated_reciprocal='0.040_350_053_551_242_020_505_053_125_425_034_353_010_333_105_032_121_214_313_332_352_544_255_054_020_403_413_410_052_455_401_144_233_405_520_525',
-        ),
-        'N·s': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 1_411_322_512_404_201_334_103_545_445_010_323_110_250_550_120_000_000_000_000_000_000',
-            _precalculated_value='0.001_521_000_451_143_321_545_231_434_440_304_532_312_254_354_225_350_244_543_530_520_403_504_145_352_323_151_044_213_000_124_522_214_353_403_450',
-            _precalculated_reciprocal='310.023_341_150_541_551_305_105_532_453_504_512_530_314_034_125_352_342_052_231_340_341_132_033_402_415_503_315_051_555_452_402_145_433_541_040_211',
-        ),
-        'prefixed': ('g·m/s', 'gm/s', 'N·s'),
-        'svg': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'jut': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'lb·ft/s': SezimalFraction(
-            '334_434_541_030_323_553_025_123_421_242_014_004_305_532_425_300_233_132_440_422_425 / 13_314_232_205_401_023_424_033_521_311_503_005_315_322_545_050_534_300_000_000_000_000',
-            _precalculated_value='0.021_410_155_125_015_001_324_443_532_255_435_344_413_233_045_034_521_100_315_003_220_522_325_323_152_300_541_550_405_000_534_455_032_014_453_331',
-            _precalculated_reciprocal='23.434_314_341_023_240_504_120_550_405_320_233_111_134_444_303_320_055_104_145_501_000_021_355_243_125_252_423_012_015_025_555_544_300_033_215_225',
-        ),
-        'sl·ft/s': SezimalFraction(
-            '24_040_005_115_524_005_100_403_420_131_140_155_430_144_250_501_355_504_344_524_301 / 101_503_045_335_151_335_525_444_411_532_210_510_054_351_410_313_000_000_000_000_000_000',
-            _precalculated_value='0.000_231_540_412_510_521_542_335_130_005_305_302_321_525_005_301_003_300_320_532_354_442_105_041_212_444_225_200_231_004_405_422_322_405_453_545',
-            _precalculated_reciprocal='2203.230_242_231_000_344_154_550_054_302_121_121_303_335_221_140_010_514_333_125_155_034_414_431_203_401_235_524_155_345_511_335_404_215_444_212_030',
-        ),
-        'non_prefixed': ('prefixed', 'svg', 'jut', 'lb·ft/s', 'sl·ft/s'),
-    },
-    'drv·pad/ang': {
-        'g·m/s': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 211_221_143_115_332_115_043_350_343_512_013_155_214_420_000_000_000_000_000_000',
-            _precalculated_value='12.433_311_431_314_140_401_320_512_044_110_452_231_153_443_155_001_015_230_332_444_020_301_131_534_442_514_443_211_001_044_523_530_355_540_143_411',
-            _precalculated_reciprocal='0.040_350_053_551_242_020_505_053_125_425_034_353_010_333_105_032_121_214_313_332_352_544_255_054_020_403_413_410_052_455_401_144_233_405_520_525',
-        ),
-        'gm/s': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 211_221_143_115_332_115_043_350_343_512_013_155_214_420_000_000_000_000_000_000',
-            _precalculated_value='12.433_311_431_314_140_401_320_512_044_110_452_231_153_443_155_001_015_230_332_444_020_301_131_534_442_514_443_211_001_044_523_530_355_540_143_411',
-            _precalculated_reciprocal='0.040_350_053_551_242_020_505_053_125_425_034_353_010_333_105_032_121_214_313_332_352_544_255_054_020_403_413_410_052_455_401_144_233_405_520_525',
-        ),
-        'N·s': SezimalFraction(
-            '3_120_001_013_325_334_344_534_202_241_242_244_430_020_521_211_311_100_532_103_145 / 1_411_322_512_404_201_334_103_545_445_010_323_110_250_550_120_000_000_000_000_000_000',
-            _precalculated_value='0.001_521_000_451_143_321_545_231_434_440_304_532_312_254_354_225_350_244_543_530_520_403_504_145_352_323_151_044_213_000_124_522_214_353_403_450',
-            _precalculated_reciprocal='310.023_341_150_541_551_305_105_532_453_504_512_530_314_034_125_352_342_052_231_340_341_132_033_402_415_503_315_051_555_452_402_145_433_541_040_211',
-        ),
-        'prefixed': ('g·m/s', 'gm/s', 'N·s'),
-        'svg': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'jut': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'lb·ft/s': SezimalFraction(
-            '334_434_541_030_323_553_025_123_421_242_014_004_305_532_425_300_233_132_440_422_425 / 13_314_232_205_401_023_424_033_521_311_503_005_315_322_545_050_534_300_000_000_000_000',
-            _precalculated_value='0.021_410_155_125_015_001_324_443_532_255_435_344_413_233_045_034_521_100_315_003_220_522_325_323_152_300_541_550_405_000_534_455_032_014_453_331',
-            _precalculated_reciprocal='23.434_314_341_023_240_504_120_550_405_320_233_111_134_444_303_320_055_104_145_501_000_021_355_243_125_252_423_012_015_025_555_544_300_033_215_225',
-        ),
-        'sl·ft/s': SezimalFraction(
-            '24_040_005_115_524_005_100_403_420_131_140_155_430_144_250_501_355_504_344_524_301 / 101_503_045_335_151_335_525_444_411_532_210_510_054_351_410_313_000_000_000_000_000_000',
-            _precalculated_value='0.000_231_540_412_510_521_542_335_130_005_305_302_321_525_005_301_003_300_320_532_354_442_105_041_212_444_225_200_231_004_405_422_322_405_453_545',
-            _precalculated_reciprocal='2203.230_242_231_000_344_154_550_054_302_121_121_303_335_221_140_010_514_333_125_155_034_414_431_203_401_235_524_155_345_511_335_404_215_444_212_030',
-        ),
-        'non_prefixed': ('prefixed', 'svg', 'jut', 'lb·ft/s', 'sl·ft/s'),
-    },
-    'agh': {
-        'kg·m2/s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 4_304_151_232_052_433_023_302_141_053_012_020_404_143_155_005_040_440_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_014_334_213_105_223_554_321_223_410_242_120_125_505_541_011_433_240_052_435_544_451_324_530_402_421_342_022_031_022_441_340_502_310_443_540',
-            _precalculated_reciprocal='32_212.003_545_254_411_141_243_412_214_035_554_211_245_420_215_024_410_021_124_102_204_131_124_412_424_120_141_221_041_354_230_340_530_322_435_122_343',
-        ),
-        'J·s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 4_304_151_232_052_433_023_302_141_053_012_020_404_143_155_005_040_440_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_014_334_213_105_223_554_321_223_410_242_120_125_505_541_011_433_240_052_435_544_451_324_530_402_421_342_022_031_022_441_340_502_310_443_540',
-            _precalculated_reciprocal='32_212.003_545_254_411_141_243_412_214_035_554_211_245_420_215_024_410_021_124_102_204_131_124_412_424_120_141_221_041_354_230_340_530_322_435_122_343',
-        ),
-        'J/Hz': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 4_304_151_232_052_433_023_302_141_053_012_020_404_143_155_005_040_440_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_014_334_213_105_223_554_321_223_410_242_120_125_505_541_011_433_240_052_435_544_451_324_530_402_421_342_022_031_022_441_340_502_310_443_540',
-            _precalculated_reciprocal='32_212.003_545_254_411_141_243_412_214_035_554_211_245_420_215_024_410_021_124_102_204_131_124_412_424_120_141_221_041_354_230_340_530_322_435_122_343',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg·m2/s', 'J·s', 'J/Hz', 'prefixed'),
-    },
-    'svg·pad': {
-        'kg·m2/s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 4_304_151_232_052_433_023_302_141_053_012_020_404_143_155_005_040_440_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_014_334_213_105_223_554_321_223_410_242_120_125_505_541_011_433_240_052_435_544_451_324_530_402_421_342_022_031_022_441_340_502_310_443_540',
-            _precalculated_reciprocal='32_212.003_545_254_411_141_243_412_214_035_554_211_245_420_215_024_410_021_124_102_204_131_124_412_424_120_141_221_041_354_230_340_530_322_435_122_343',
-        ),
-        'J·s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 4_304_151_232_052_433_023_302_141_053_012_020_404_143_155_005_040_440_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_014_334_213_105_223_554_321_223_410_242_120_125_505_541_011_433_240_052_435_544_451_324_530_402_421_342_022_031_022_441_340_502_310_443_540',
-            _precalculated_reciprocal='32_212.003_545_254_411_141_243_412_214_035_554_211_245_420_215_024_410_021_124_102_204_131_124_412_424_120_141_221_041_354_230_340_530_322_435_122_343',
-        ),
-        'J/Hz': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 4_304_151_232_052_433_023_302_141_053_012_020_404_143_155_005_040_440_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_014_334_213_105_223_554_321_223_410_242_120_125_505_541_011_433_240_052_435_544_451_324_530_402_421_342_022_031_022_441_340_502_310_443_540',
-            _precalculated_reciprocal='32_212.003_545_254_411_141_243_412_214_035_554_211_245_420_215_024_410_021_124_102_204_131_124_412_424_120_141_221_041_354_230_340_530_322_435_122_343',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg·m2/s', 'J·s', 'J/Hz', 'prefixed'),
-    },
-    'drv·pad2/ang': {
-        'kg·m2/s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 4_304_151_232_052_433_023_302_141_053_012_020_404_143_155_005_040_440_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_014_334_213_105_223_554_321_223_410_242_120_125_505_541_011_433_240_052_435_544_451_324_530_402_421_342_022_031_022_441_340_502_310_443_540',
-            _precalculated_reciprocal='32_212.003_545_254_411_141_243_412_214_035_554_211_245_420_215_024_410_021_124_102_204_131_124_412_424_120_141_221_041_354_230_340_530_322_435_122_343',
-        ),
-        'J·s': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 4_304_151_232_052_433_023_302_141_053_012_020_404_143_155_005_040_440_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_014_334_213_105_223_554_321_223_410_242_120_125_505_541_011_433_240_052_435_544_451_324_530_402_421_342_022_031_022_441_340_502_310_443_540',
-            _precalculated_reciprocal='32_212.003_545_254_411_141_243_412_214_035_554_211_245_420_215_024_410_021_124_102_204_131_124_412_424_120_141_221_041_354_230_340_530_322_435_122_343',
-        ),
-        'J/Hz': SezimalFraction(
-            '115_532_225_455_231_235_452_122_001_225_101_320_505_221_045_250_544_235_355_503_402_300_400_301 / 4_304_151_232_052_433_023_302_141_053_012_020_404_143_155_005_040_440_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_014_334_213_105_223_554_321_223_410_242_120_125_505_541_011_433_240_052_435_544_451_324_530_402_421_342_022_031_022_441_340_502_310_443_540',
-            _precalculated_reciprocal='32_212.003_545_254_411_141_243_412_214_035_554_211_245_420_215_024_410_021_124_102_204_131_124_412_424_120_141_221_041_354_230_340_530_322_435_122_343',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg·m2/s', 'J·s', 'J/Hz', 'prefixed'),
-    },
-    'pbv': {
-        'kg·m3/s2': SezimalFraction(
-            '3_144_514_232_303_132_430_442_013_055_524_155_322_102_553_234_225_323_143_542_040_043_051_505_432_242_050_305 / 341_221_302_153_313_524_323_141_122_300_452_512_304_142_251_041_104_550_514_325_200_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_005_202_154_322_030_513_102_554_522_404_304_220_135_512_120_431_222_431_315_145_355_011_545_523_123_143_224_212_241_434_024_232_244_410_445',
-            _precalculated_reciprocal='104_230.211_200_540_045_302_202_243_331_411_423_020_352_242_200_334_134_340_330_134_132_224_314_315_515_402_251_023_030_041_453_400_413_223_255_203_432',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg·m3/s2', 'prefixed'),
-    },
-    'bal·ktr': {
-        'kg·m3/s2': SezimalFraction(
-            '3_144_514_232_303_132_430_442_013_055_524_155_322_102_553_234_225_323_143_542_040_043_051_505_432_242_050_305 / 341_221_302_153_313_524_323_141_122_300_452_512_304_142_251_041_104_550_514_325_200_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_005_202_154_322_030_513_102_554_522_404_304_220_135_512_120_431_222_431_315_145_355_011_545_523_123_143_224_212_241_434_024_232_244_410_445',
-            _precalculated_reciprocal='104_230.211_200_540_045_302_202_243_331_411_423_020_352_242_200_334_134_340_330_134_132_224_314_315_515_402_251_023_030_041_453_400_413_223_255_203_432',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg·m3/s2', 'prefixed'),
-    },
-    'drv·ayt/ang2': {
-        'kg·m3/s2': SezimalFraction(
-            '3_144_514_232_303_132_430_442_013_055_524_155_322_102_553_234_225_323_143_542_040_043_051_505_432_242_050_305 / 341_221_302_153_313_524_323_141_122_300_452_512_304_142_251_041_104_550_514_325_200_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_005_202_154_322_030_513_102_554_522_404_304_220_135_512_120_431_222_431_315_145_355_011_545_523_123_143_224_212_241_434_024_232_244_410_445',
-            _precalculated_reciprocal='104_230.211_200_540_045_302_202_243_331_411_423_020_352_242_200_334_134_340_330_134_132_224_314_315_515_402_251_023_030_041_453_400_413_223_255_203_432',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg·m3/s2', 'prefixed'),
-    },
-    'drv·pad3/ang2': {
-        'kg·m3/s2': SezimalFraction(
-            '3_144_514_232_303_132_430_442_013_055_524_155_322_102_553_234_225_323_143_542_040_043_051_505_432_242_050_305 / 341_221_302_153_313_524_323_141_122_300_452_512_304_142_251_041_104_550_514_325_200_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_005_202_154_322_030_513_102_554_522_404_304_220_135_512_120_431_222_431_315_145_355_011_545_523_123_143_224_212_241_434_024_232_244_410_445',
-            _precalculated_reciprocal='104_230.211_200_540_045_302_202_243_331_411_423_020_352_242_200_334_134_340_330_134_132_224_314_315_515_402_251_023_030_041_453_400_413_223_255_203_432',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg·m3/s2', 'prefixed'),
-    },
-    'tnv': {
-        'kg/s2': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 11_041_335_435_015_521_112_404_214_040_541_251_521_030_400_000_000',
-            _precalculated_value='10.323_504_425_432_552_224_301_245_023_502_125_051_115_500_100_123_413_431_113_034_023_445_325_540_232_523_413_123_134_300_213_202_042_555_012_541',
-            _precalculated_reciprocal='0.052_505_405_302_310_442_231_403_025_235_455_325_042_542_235_542_522_135_321_302_332_335_203_311_400_523_441_553_333_550_151_251_035_444_302_202',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg/s2', 'prefixed'),
-    },
-    'bal/pad': {
-        'kg/s2': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 11_041_335_435_015_521_112_404_214_040_541_251_521_030_400_000_000',
-            _precalculated_value='10.323_504_425_432_552_224_301_245_023_502_125_051_115_500_100_123_413_431_113_034_023_445_325_540_232_523_413_123_134_300_213_202_042_555_012_541',
-            _precalculated_reciprocal='0.052_505_405_302_310_442_231_403_025_235_455_325_042_542_235_542_522_135_321_302_332_335_203_311_400_523_441_553_333_550_151_251_035_444_302_202',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg/s2', 'prefixed'),
-    },
-    'drv/ang2': {
-        'kg/s2': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 11_041_335_435_015_521_112_404_214_040_541_251_521_030_400_000_000',
-            _precalculated_value='10.323_504_425_432_552_224_301_245_023_502_125_051_115_500_100_123_413_431_113_034_023_445_325_540_232_523_413_123_134_300_213_202_042_555_012_541',
-            _precalculated_reciprocal='0.052_505_405_302_310_442_231_403_025_235_455_325_042_542_235_542_522_135_321_302_332_335_203_311_400_523_441_553_333_550_151_251_035_444_302_202',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg/s2', 'prefixed'),
-    },
-    'upr': {
-        'kg/s3': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 211_032_320_052_100_054_424_304_400_221_123_042_213_223_224_000',
-            _precalculated_value='331.441_553_140_113_011_544_323_324_313_531_103_310_244_242_145_044_542_532_341_425_132_355_032_320_403_114_105_200_120_344_530_524_455_105_502_334',
-            _precalculated_reciprocal='0.001_405_035_125_124_043_233_334_402_121_452_443_154_135_301_454_110_514_341_450_044_500_551_235_141_122_023_224_433_204_052_445_425_400_232_442',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg/s3', 'prefixed'),
-    },
-    'xkt/ktr': {
-        'kg/s3': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 211_032_320_052_100_054_424_304_400_221_123_042_213_223_224_000',
-            _precalculated_value='331.441_553_140_113_011_544_323_324_313_531_103_310_244_242_145_044_542_532_341_425_132_355_032_320_403_114_105_200_120_344_530_524_455_105_502_334',
-            _precalculated_reciprocal='0.001_405_035_125_124_043_233_334_402_121_452_443_154_135_301_454_110_514_341_450_044_500_551_235_141_122_023_224_433_204_052_445_425_400_232_442',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg/s3', 'prefixed'),
-    },
-    'tnv/ang': {
-        'kg/s3': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 211_032_320_052_100_054_424_304_400_221_123_042_213_223_224_000',
-            _precalculated_value='331.441_553_140_113_011_544_323_324_313_531_103_310_244_242_145_044_542_532_341_425_132_355_032_320_403_114_105_200_120_344_530_524_455_105_502_334',
-            _precalculated_reciprocal='0.001_405_035_125_124_043_233_334_402_121_452_443_154_135_301_454_110_514_341_450_044_500_551_235_141_122_023_224_433_204_052_445_425_400_232_442',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg/s3', 'prefixed'),
-    },
-    'drv/ang3': {
-        'kg/s3': SezimalFraction(
-            '114_443_155_454_123_040_003_121_441_325_323_104_204_104_044_211_021 / 211_032_320_052_100_054_424_304_400_221_123_042_213_223_224_000',
-            _precalculated_value='331.441_553_140_113_011_544_323_324_313_531_103_310_244_242_145_044_542_532_341_425_132_355_032_320_403_114_105_200_120_344_530_524_455_105_502_334',
-            _precalculated_reciprocal='0.001_405_035_125_124_043_233_334_402_121_452_443_154_135_301_454_110_514_341_450_044_500_551_235_141_122_023_224_433_204_052_445_425_400_232_442',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('kg/s3', 'prefixed'),
-    },
-    'gtk': {
-        'K': SezimalFraction(
-            '41_143 / 12_532_430_424',
-            _precalculated_value='0.000_002_455_444_231_451_053_242_255_010_330_042_540_340_253_233_024_211_223_511_524_421_113_430_045_505_125_233_423_314_224_100_553_350_303_042',
-            _precalculated_reciprocal='204_132.130_415_510_035_252_550_355_015_010_432_222_454_345_205_115_154_451_442_241_300_311_143_410_305_054_303_423_021_513_400_041_342_053_241_051_401',
-        ),
-        'C': SezimalFraction(
-            '41_143 / 12_532_430_424',
-            _precalculated_value='0.000_002_455_444_231_451_053_242_255_010_330_042_540_340_253_233_024_211_223_511_524_421_113_430_045_505_125_233_423_314_224_100_553_350_303_042',
-            _precalculated_reciprocal='204_132.130_415_510_035_252_550_355_015_010_432_222_454_345_205_115_154_451_442_241_300_311_143_410_305_054_303_423_021_513_400_041_342_053_241_051_401',
-        ),
-        '°C': SezimalFraction(
-            '41_143 / 12_532_430_424',
-            _precalculated_value='0.000_002_455_444_231_451_053_242_255_010_330_042_540_340_253_233_024_211_223_511_524_421_113_430_045_505_125_233_423_314_224_100_553_350_303_042',
-            _precalculated_reciprocal='204_132.130_415_510_035_252_550_355_015_010_432_222_454_345_205_115_154_451_442_241_300_311_143_410_305_054_303_423_021_513_400_041_342_053_241_051_401',
-        ),
-        'prefixed': ('K',),
-        'F': SezimalFraction(
-            '1_015_343 / 112_351_433_412',
-            _precalculated_value='0.000_005_033_123_055_354_251_230_520_353_241_231_412_145_402_324_200_354_533_211_012_302_103_052_352_051_013_440_421_330_422_412_551_430_532_004',
-            _precalculated_reciprocal='110_211.130_222_331_221_014_153_011_250_043_431_200_123_124_150_522_143_201_354_410_100_144_015_215_342_511_102_024_211_413_212_022_122_310_325_545_332',
-        ),
-        '°F': SezimalFraction(
-            '1_015_343 / 112_351_433_412',
-            _precalculated_value='0.000_005_033_123_055_354_251_230_520_353_241_231_412_145_402_324_200_354_533_211_012_302_103_052_352_051_013_440_421_330_422_412_551_430_532_004',
-            _precalculated_reciprocal='110_211.130_222_331_221_014_153_011_250_043_431_200_123_124_150_522_143_201_354_410_100_144_015_215_342_511_102_024_211_413_212_022_122_310_325_545_332',
-        ),
-        'R': SezimalFraction(
-            '1_015_343 / 112_351_433_412',
-            _precalculated_value='0.000_005_033_123_055_354_251_230_520_353_241_231_412_145_402_324_200_354_533_211_012_302_103_052_352_051_013_440_421_330_422_412_551_430_532_004',
-            _precalculated_reciprocal='110_211.130_222_331_221_014_153_011_250_043_431_200_123_124_150_522_143_201_354_410_100_144_015_215_342_511_102_024_211_413_212_022_122_310_325_545_332',
-        ),
-        '°R': SezimalFraction(
-            '1_015_343 / 112_351_433_412',
-            _precalculated_value='0.000_005_033_123_055_354_251_230_520_353_241_231_412_145_402_324_200_354_533_211_012_302_103_052_352_051_013_440_421_330_422_412_551_430_532_004',
-            _precalculated_reciprocal='110_211.130_222_331_221_014_153_011_250_043_431_200_123_124_150_522_143_201_354_410_100_144_015_215_342_511_102_024_211_413_212_022_122_310_325_545_332',
-        ),
-        'adjust': {
-            'C': SezimalFraction(
-                '-330_243 / 244',
-                _precalculated_value='-1133.052_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-                _precalculated_reciprocal='-0.000_442_450_210_555_351_045_311_352_320_553_301_542_425_315_530_530_321_411_122_515_240_233_535_522_352_112_043_013_335_150_313_232_513_151_131',
-            ),
-            '°C': SezimalFraction(
-                '-330_243 / 244',
-                _precalculated_value='-1133.052_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-                _precalculated_reciprocal='-0.000_442_450_210_555_351_045_311_352_320_553_301_542_425_315_530_530_321_411_122_515_240_233_535_522_352_112_043_013_335_150_313_232_513_151_131',
-            ),
-            'F': SezimalFraction(
-                '-552_451 / 244',
-                _precalculated_value='-2043.400_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530',
-                _precalculated_reciprocal='-0.000_245_255_432_424_255_544_215_415_013_321_300_323_153_212_141_030_505_052_332_551_230_215_151_431_043_202_115_430_152_433_203_233_341_343_124',
-            ),
-            '°F': SezimalFraction(
-                '-552_451 / 244',
-                _precalculated_value='-2043.400_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530',
-                _precalculated_reciprocal='-0.000_245_255_432_424_255_544_215_415_013_321_300_323_153_212_141_030_505_052_332_551_230_215_151_431_043_202_115_430_152_433_203_233_341_343_124',
-            ),
-        },
-        'non_prefixed': ('C', '°C', 'prefixed', 'F', '°F', 'R', '°R', 'adjust'),
-    },
-    'tap': {
-        'C': SezimalFraction(
-            '132_523_430 / 320_314_101',
-            _precalculated_value='0.245_544_423_145_105_324_225_501_033_004_254_034_025_323_302_421_122_351_152_442_111_343_004_550_512_523_342_331_422_410_055_335_030_304_211_554',
-            _precalculated_reciprocal='2.041_321_304_155_100_352_525_503_550_150_104_322_224_543_452_051_151_544_514_422_413_003_111_434_103_050_543_034_230_215_134_000_413_420_532_411',
-        ),
-        '°C': SezimalFraction(
-            '132_523_430 / 320_314_101',
-            _precalculated_value='0.245_544_423_145_105_324_225_501_033_004_254_034_025_323_302_421_122_351_152_442_111_343_004_550_512_523_342_331_422_410_055_335_030_304_211_554',
-            _precalculated_reciprocal='2.041_321_304_155_100_352_525_503_550_150_104_322_224_543_452_051_151_544_514_422_413_003_111_434_103_050_543_034_230_215_134_000_413_420_532_411',
-        ),
-        'K': SezimalFraction(
-            '132_523_430 / 320_314_101',
-            _precalculated_value='0.245_544_423_145_105_324_225_501_033_004_254_034_025_323_302_421_122_351_152_442_111_343_004_550_512_523_342_331_422_410_055_335_030_304_211_554',
-            _precalculated_reciprocal='2.041_321_304_155_100_352_525_503_550_150_104_322_224_543_452_051_151_544_514_422_413_003_111_434_103_050_543_034_230_215_134_000_413_420_532_411',
-        ),
-        'prefixed': ('K',),
-        'F': SezimalFraction(
-            '2_212_053_430 / 2_442_422_505',
-            _precalculated_value='0.503_312_305_535_425_123_052_035_324_123_141_214_540_232_420_035_453_321_101_230_210_305_235_205_101_344_042_133_042_241_255_143_053_200_355_553',
-            _precalculated_reciprocal='1.102_111_302_223_312_210_141_530_112_500_434_312_001_231_241_505_221_432_013_544_101_001_440_152_153_425_111_020_242_114_132_120_221_223_103_300',
-        ),
-        '°F': SezimalFraction(
-            '2_212_053_430 / 2_442_422_505',
-            _precalculated_value='0.503_312_305_535_425_123_052_035_324_123_141_214_540_232_420_035_453_321_101_230_210_305_235_205_101_344_042_133_042_241_255_143_053_200_355_553',
-            _precalculated_reciprocal='1.102_111_302_223_312_210_141_530_112_500_434_312_001_231_241_505_221_432_013_544_101_001_440_152_153_425_111_020_242_114_132_120_221_223_103_300',
-        ),
-        'R': SezimalFraction(
-            '2_212_053_430 / 2_442_422_505',
-            _precalculated_value='0.503_312_305_535_425_123_052_035_324_123_141_214_540_232_420_035_453_321_101_230_210_305_235_205_101_344_042_133_042_241_255_143_053_200_355_553',
-            _precalculated_reciprocal='1.102_111_302_223_312_210_141_530_112_500_434_312_001_231_241_505_221_432_013_544_101_001_440_152_153_425_111_020_242_114_132_120_221_223_103_300',
-        ),
-        '°R': SezimalFraction(
-            '2_212_053_430 / 2_442_422_505',
-            _precalculated_value='0.503_312_305_535_425_123_052_035_324_123_141_214_540_232_420_035_453_321_101_230_210_305_235_205_101_344_042_133_042_241_255_143_053_200_355_553',
-            _precalculated_reciprocal='1.102_111_302_223_312_210_141_530_112_500_434_312_001_231_241_505_221_432_013_544_101_001_440_152_153_425_111_020_242_114_132_120_221_223_103_300',
-        ),
-        'adjust': {
-            'K': SezimalFraction(
-                '330_243 / 244',
-                _precalculated_value='1133.052_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-                _precalculated_reciprocal='0.000_442_450_210_555_351_045_311_352_320_553_301_542_425_315_530_530_321_411_122_515_240_233_535_522_352_112_043_013_335_150_313_232_513_151_131',
-            ),
-            'F': Sezimal('52'),
-            '°F': Sezimal('52'),
-            'R': SezimalFraction(
-                '552_451 / 244',
-                _precalculated_value='2043.400_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_531',
-                _precalculated_reciprocal='0.000_245_255_432_424_255_544_215_415_013_321_300_323_153_212_141_030_505_052_332_551_230_215_151_431_043_202_115_430_152_433_203_233_341_343_124',
-            ),
-            '°R': SezimalFraction(
-                '552_451 / 244',
-                _precalculated_value='2043.400_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_531',
-                _precalculated_reciprocal='0.000_245_255_432_424_255_544_215_415_013_321_300_323_153_212_141_030_505_052_332_551_230_215_151_431_043_202_115_430_152_433_203_233_341_343_124',
-            ),
-        },
-        'non_prefixed': ('C', '°C', 'prefixed', 'F', '°F', 'R', '°R', 'adjust'),
-    },
-    'agn': {
-        'J/K': SezimalFraction(
-            '5_203_302_415_341_124_103_441_032_131_435_321_553_142_504_532_324_453_044_213_223_024_101_314_231_132_045 / 23_513_304_503_542_031_504_122_351_151_445_020_321_525_242_423_114_442_050_000_000_000_000_000_000_000',
-            _precalculated_value='200.435_504_400_124_121_505_521_542_015_152_030_442_150_211_350_202_543_232_225_245_045_334_211_012_544_341_044_050_520_350_350_201_200_013_313_111',
-            _precalculated_reciprocal='0.002_545_025_234_143_230_001_012_320_432_033_150_505_404_200_032_541_453_110_230_550_551_555_435_323_131_110_530_132_542_224_010_402_205_151_035',
-        ),
-        'prefixed': ('J/K',),
-        'BTU/°R': SezimalFraction(
-            '12_403_455_424_015_304_433_323_004_500_151_124_054_513_000_015_233_121_035_342_541_512_542_454_115_055_005 / 1_014_341_212_500_542_450_245_342_504_013_345_444_201_314_112_550_201_143_341_534_024_513_000_000_000_000_000',
-            _precalculated_value='0.012_135_540_135_215_314_424_330_145_155_404_141_045_344_440_301_215_330_553_513_301_221_524_332_413_423_420_505_125_010_441_335_513_454_133_550',
-            _precalculated_reciprocal='42.032_244_425_215_132_532_434_455_215_432_441_033_455_103_021_245_211_235_303_532_112_042_334_140_250_404_315_505_112_150_132_440_033_010_151_244',
-        ),
-        'non_prefixed': ('prefixed', 'BTU/°R'),
-    },
-    'prv': {
-        'J/K': SezimalFraction(
-            '5_203_302_415_341_124_103_441_032_131_435_321_553_142_504_532_324_453_044_213_223_024_101_314_231_132_045 / 23_513_304_503_542_031_504_122_351_151_445_020_321_525_242_423_114_442_050_000_000_000_000_000_000_000',
-            _precalculated_value='200.435_504_400_124_121_505_521_542_015_152_030_442_150_211_350_202_543_232_225_245_045_334_211_012_544_341_044_050_520_350_350_201_200_013_313_111',
-            _precalculated_reciprocal='0.002_545_025_234_143_230_001_012_320_432_033_150_505_404_200_032_541_453_110_230_550_551_555_435_323_131_110_530_132_542_224_010_402_205_151_035',
-        ),
-        'prefixed': ('J/K',),
-        'BTU/°R': SezimalFraction(
-            '12_403_455_424_015_304_433_323_004_500_151_124_054_513_000_015_233_121_035_342_541_512_542_454_115_055_005 / 1_014_341_212_500_542_450_245_342_504_013_345_444_201_314_112_550_201_143_341_534_024_513_000_000_000_000_000',
-            _precalculated_value='0.012_135_540_135_215_314_424_330_145_155_404_141_045_344_440_301_215_330_553_513_301_221_524_332_413_423_420_505_125_010_441_335_513_454_133_550',
-            _precalculated_reciprocal='42.032_244_425_215_132_532_434_455_215_432_441_033_455_103_021_245_211_235_303_532_112_042_334_140_250_404_315_505_112_150_132_440_033_010_151_244',
-        ),
-        'non_prefixed': ('prefixed', 'BTU/°R'),
-    },
-    'vrc/gtk': {
-        'J/K': SezimalFraction(
-            '5_203_302_415_341_124_103_441_032_131_435_321_553_142_504_532_324_453_044_213_223_024_101_314_231_132_045 / 23_513_304_503_542_031_504_122_351_151_445_020_321_525_242_423_114_442_050_000_000_000_000_000_000_000',
-            _precalculated_value='200.435_504_400_124_121_505_521_542_015_152_030_442_150_211_350_202_543_232_225_245_045_334_211_012_544_341_044_050_520_350_350_201_200_013_313_111',
-            _precalculated_reciprocal='0.002_545_025_234_143_230_001_012_320_432_033_150_505_404_200_032_541_453_110_230_550_551_555_435_323_131_110_530_132_542_224_010_402_205_151_035',
-        ),
-        'prefixed': ('J/K',),
-        'BTU/°R': SezimalFraction(
-            '12_403_455_424_015_304_433_323_004_500_151_124_054_513_000_015_233_121_035_342_541_512_542_454_115_055_005 / 1_014_341_212_500_542_450_245_342_504_013_345_444_201_314_112_550_201_143_341_534_024_513_000_000_000_000_000',
-            _precalculated_value='0.012_135_540_135_215_314_424_330_145_155_404_141_045_344_440_301_215_330_553_513_301_221_524_332_413_423_420_505_125_010_441_335_513_454_133_550',
-            _precalculated_reciprocal='42.032_244_425_215_132_532_434_455_215_432_441_033_455_103_021_245_211_235_303_532_112_042_334_140_250_404_315_505_112_150_132_440_033_010_151_244',
-        ),
-        'non_prefixed': ('prefixed', 'BTU/°R'),
-    },
-    'kdn': {
-        'J/kg': SezimalFraction(
-            '33_454_031_343_202_035_351_443_134_553_043_031_223_452_041_215_301_154_323_224_452_404_050_345_254_111_315_000_212_102_312_024_505_300 / 221_530_550_415_142_042_053_322_511_250_503_233_034_110_003_140_145_513_004_414_052_432_242_512_214_142_554_525_042_025_554_440_150_005',
-            _precalculated_value='0.130_510_523_033_113_543_210_115_222_135_250_533_101_512_245_413_343_043_502_552_551_555_050_502_021_204_345_140_142_223_333_102_213_315_022_015',
-            _precalculated_reciprocal='3.534_212_413_353_123_300_033_313_403_351_404_235_524_301_305_320_525_334_451_205_233_313_342_540_130_141_040_011_041_254_102_522_101_244_445_553',
-        ),
-        'J/g': SezimalFraction(
-            '223_144_210_301_212_234_331_101_031_540_300_205_343_132_245_314_005_150_141_351_134_424_322_313_544_450_112_001_252_414_052_151_234_001 / 11_211_044_422_111_410_220_205_351_155_440_340_512_043_002_020_420_431_524_223_142_354_405_302_544_311_530_323_510_215_005_121_220_434_352_332',
-            _precalculated_value='0.000_015_503_443_424_034_005_013_552_225_252_233_025_311_152_205_133_213_010_003_123_104_335_050_504_251_035_244_300_021_251_332_043_144_134_404',
-            _precalculated_reciprocal='30_120.525_355_205_514_232_243_424_455_314_411_124_005_431_021_423_442_501_335_502_253_024_320_425_335_150_531_132_542_003_324_030_541_125_332_233_521',
-        ),
-        'cal': SezimalFraction(
-            '230_534_013_435_532_442_310_245_345_440_004_512_505_521_453_435_535_310_014_114_024_105_131_352_514_301_243_501_314_024_323_354_124_531 / 52_034_404_343_033_124_241_400_000_353_502_140_410_151_152_212_355_112_434_332_234_521_300_010_342_512_225_352_122_531_502_553_245_132_415_412',
-            _precalculated_value='0.000_002_455_450_011_142_400_533_012_350_402_443_430_441_115_420_453_401_424_504_550_021_231_121_300_034_554_101_352_121_251_121_342_050_350_430',
-            _precalculated_reciprocal='204_132.015_224_155_501_325_533_155_323_545_443_225_450_225_315_410_055_405_512_431_523_554_233_540_231_251_425_305_513_440_425_253_112_523_511_011_114',
-        ),
-        'Cal': SezimalFraction(
-            '230_534_013_435_532_442_310_245_345_440_004_512_505_521_453_435_535_310_014_114_024_105_131_352_514_301_243_501_314_024_323_354_124_531 / 52_034_404_343_033_124_241_400_000_353_502_140_410_151_152_212_355_112_434_332_234_521_300_010_342_512_225_352_122_531_502_553_245_132_415_412',
-            _precalculated_value='0.000_002_455_450_011_142_400_533_012_350_402_443_430_441_115_420_453_401_424_504_550_021_231_121_300_034_554_101_352_121_251_121_342_050_350_430',
-            _precalculated_reciprocal='204_132.015_224_155_501_325_533_155_323_545_443_225_450_225_315_410_055_405_512_431_523_554_233_540_231_251_425_305_513_440_425_253_112_523_511_011_114',
-        ),
-        'prefixed': ('J/g', 'J/kg', 'cal', 'Cal'),
-        'non_prefixed': ('prefixed',),
-    },
-    'vrc/drv': {
-        'J/kg': SezimalFraction(
-            '33_454_031_343_202_035_351_443_134_553_043_031_223_452_041_215_301_154_323_224_452_404_050_345_254_111_315_000_212_102_312_024_505_300 / 221_530_550_415_142_042_053_322_511_250_503_233_034_110_003_140_145_513_004_414_052_432_242_512_214_142_554_525_042_025_554_440_150_005',
-            _precalculated_value='0.130_510_523_033_113_543_210_115_222_135_250_533_101_512_245_413_343_043_502_552_551_555_050_502_021_204_345_140_142_223_333_102_213_315_022_015',
-            _precalculated_reciprocal='3.534_212_413_353_123_300_033_313_403_351_404_235_524_301_305_320_525_334_451_205_233_313_342_540_130_141_040_011_041_254_102_522_101_244_445_553',
-        ),
-        'J/g': SezimalFraction(
-            '223_144_210_301_212_234_331_101_031_540_300_205_343_132_245_314_005_150_141_351_134_424_322_313_544_450_112_001_252_414_052_151_234_001 / 11_211_044_422_111_410_220_205_351_155_440_340_512_043_002_020_420_431_524_223_142_354_405_302_544_311_530_323_510_215_005_121_220_434_352_332',
-            _precalculated_value='0.000_015_503_443_424_034_005_013_552_225_252_233_025_311_152_205_133_213_010_003_123_104_335_050_504_251_035_244_300_021_251_332_043_144_134_404',
-            _precalculated_reciprocal='30_120.525_355_205_514_232_243_424_455_314_411_124_005_431_021_423_442_501_335_502_253_024_320_425_335_150_531_132_542_003_324_030_541_125_332_233_521',
-        ),
-        'cal': SezimalFraction(
-            '230_534_013_435_532_442_310_245_345_440_004_512_505_521_453_435_535_310_014_114_024_105_131_352_514_301_243_501_314_024_323_354_124_531 / 52_034_404_343_033_124_241_400_000_353_502_140_410_151_152_212_355_112_434_332_234_521_300_010_342_512_225_352_122_531_502_553_245_132_415_412',
-            _precalculated_value='0.000_002_455_450_011_142_400_533_012_350_402_443_430_441_115_420_453_401_424_504_550_021_231_121_300_034_554_101_352_121_251_121_342_050_350_430',
-            _precalculated_reciprocal='204_132.015_224_155_501_325_533_155_323_545_443_225_450_225_315_410_055_405_512_431_523_554_233_540_231_251_425_305_513_440_425_253_112_523_511_011_114',
-        ),
-        'Cal': SezimalFraction(
-            '230_534_013_435_532_442_310_245_345_440_004_512_505_521_453_435_535_310_014_114_024_105_131_352_514_301_243_501_314_024_323_354_124_531 / 52_034_404_343_033_124_241_400_000_353_502_140_410_151_152_212_355_112_434_332_234_521_300_010_342_512_225_352_122_531_502_553_245_132_415_412',
-            _precalculated_value='0.000_002_455_450_011_142_400_533_012_350_402_443_430_441_115_420_453_401_424_504_550_021_231_121_300_034_554_101_352_121_251_121_342_050_350_430',
-            _precalculated_reciprocal='204_132.015_224_155_501_325_533_155_323_545_443_225_450_225_315_410_055_405_512_431_523_554_233_540_231_251_425_305_513_440_425_253_112_523_511_011_114',
-        ),
-        'prefixed': ('J/g', 'J/kg', 'cal', 'Cal'),
-        'non_prefixed': ('prefixed',),
-    },
-    'idn': {
-        'J/K/kg': SezimalFraction(
-            '304_430_231_540_240_533_511_410_151_225_100_132_205_223_411_233_243_032_405_423_024_502_224_220_455_115_105_000_031_420_454_233_001_220_002_252 / 5_453_142_052_502_050_535_213_111_042_432_021_025_325_534_251_525_120_133_400_433_523_522_020_414_101_001_035_123_223_103_552_223_551_355',
-            _precalculated_value='31_212.015_000_205_501_031_321_152_453_054_445_503_215_405_215_454_441_020_023_213_314_505_133_302_311_224_345_011_412_443_000_403_545_355_001_432_050',
-            _precalculated_reciprocal='0.000_015_052_333_044_210_240_552_514_340_301_511_005_203_230_043_223_451_155_100_032_552_545_002_342_324_124_234_045_141_233_112_412_541_453_021',
-        ),
-        'prefixed': ('J/K/kg',),
-        'BTU/°R/lb': SezimalFraction(
-            '52_334_535_004_045_330_333_034_235_214_153_042_105_222_301_434_315_251_314_435_253_425_111_404_202_125_211_435_304_200_450_120_241_535_451 / 52_343_322_314_410_214_244_305_231_443_303_551_505_340_343_415_424_554_540_525_502_550_511_241_405_132_032_412_502_102_114_012_253_032_444',
-            _precalculated_value='0.555_505_210_541_414_221_155_024_423_112_410_510_351_053_304_550_315_013_204_002_415_454_431_021_404_440_002_340_132_525_304_222_214_301_255_150',
-            _precalculated_reciprocal='1.000_050_353_221_212_334_145_323_305_131_544_432_515_012_054_232_514_511_504_514_440_004_541_350_525_501_103_021_121_314_132_331_534_134_512_554',
-        ),
-        'non_prefixed': ('prefixed', 'BTU/°R/lb'),
-    },
-    'agn/drv': {
-        'J/K/kg': SezimalFraction(
-            '304_430_231_540_240_533_511_410_151_225_100_132_205_223_411_233_243_032_405_423_024_502_224_220_455_115_105_000_031_420_454_233_001_220_002_252 / 5_453_142_052_502_050_535_213_111_042_432_021_025_325_534_251_525_120_133_400_433_523_522_020_414_101_001_035_123_223_103_552_223_551_355',
-            _precalculated_value='31_212.015_000_205_501_031_321_152_453_054_445_503_215_405_215_454_441_020_023_213_314_505_133_302_311_224_345_011_412_443_000_403_545_355_001_432_050',
-            _precalculated_reciprocal='0.000_015_052_333_044_210_240_552_514_340_301_511_005_203_230_043_223_451_155_100_032_552_545_002_342_324_124_234_045_141_233_112_412_541_453_021',
-        ),
-        'prefixed': ('J/K/kg',),
-        'BTU/°R/lb': SezimalFraction(
-            '52_334_535_004_045_330_333_034_235_214_153_042_105_222_301_434_315_251_314_435_253_425_111_404_202_125_211_435_304_200_450_120_241_535_451 / 52_343_322_314_410_214_244_305_231_443_303_551_505_340_343_415_424_554_540_525_502_550_511_241_405_132_032_412_502_102_114_012_253_032_444',
-            _precalculated_value='0.555_505_210_541_414_221_155_024_423_112_410_510_351_053_304_550_315_013_204_002_415_454_431_021_404_440_002_340_132_525_304_222_214_301_255_150',
-            _precalculated_reciprocal='1.000_050_353_221_212_334_145_323_305_131_544_432_515_012_054_232_514_511_504_514_440_004_541_350_525_501_103_021_121_314_132_331_534_134_512_554',
-        ),
-        'non_prefixed': ('prefixed', 'BTU/°R/lb'),
-    },
-    'prv/drv': {
-        'J/K/kg': SezimalFraction(
-            '304_430_231_540_240_533_511_410_151_225_100_132_205_223_411_233_243_032_405_423_024_502_224_220_455_115_105_000_031_420_454_233_001_220_002_252 / 5_453_142_052_502_050_535_213_111_042_432_021_025_325_534_251_525_120_133_400_433_523_522_020_414_101_001_035_123_223_103_552_223_551_355',
-            _precalculated_value='31_212.015_000_205_501_031_321_152_453_054_445_503_215_405_215_454_441_020_023_213_314_505_133_302_311_224_345_011_412_443_000_403_545_355_001_432_050',
-            _precalculated_reciprocal='0.000_015_052_333_044_210_240_552_514_340_301_511_005_203_230_043_223_451_155_100_032_552_545_002_342_324_124_234_045_141_233_112_412_541_453_021',
-        ),
-        'prefixed': ('J/K/kg',),
-        'BTU/°R/lb': SezimalFraction(
-            '52_334_535_004_045_330_333_034_235_214_153_042_105_222_301_434_315_251_314_435_253_425_111_404_202_125_211_435_304_200_450_120_241_535_451 / 52_343_322_314_410_214_244_305_231_443_303_551_505_340_343_415_424_554_540_525_502_550_511_241_405_132_032_412_502_102_114_012_253_032_444',
-            _precalculated_value='0.555_505_210_541_414_221_155_024_423_112_410_510_351_053_304_550_315_013_204_002_415_454_431_021_404_440_002_340_132_525_304_222_214_301_255_150',
-            _precalculated_reciprocal='1.000_050_353_221_212_334_145_323_305_131_544_432_515_012_054_232_514_511_504_514_440_004_541_350_525_501_103_021_121_314_132_331_534_134_512_554',
-        ),
-        'non_prefixed': ('prefixed', 'BTU/°R/lb'),
-    },
-    'kdn/gtk': {
-        'J/K/kg': SezimalFraction(
-            '304_430_231_540_240_533_511_410_151_225_100_132_205_223_411_233_243_032_405_423_024_502_224_220_455_115_105_000_031_420_454_233_001_220_002_252 / 5_453_142_052_502_050_535_213_111_042_432_021_025_325_534_251_525_120_133_400_433_523_522_020_414_101_001_035_123_223_103_552_223_551_355',
-            _precalculated_value='31_212.015_000_205_501_031_321_152_453_054_445_503_215_405_215_454_441_020_023_213_314_505_133_302_311_224_345_011_412_443_000_403_545_355_001_432_050',
-            _precalculated_reciprocal='0.000_015_052_333_044_210_240_552_514_340_301_511_005_203_230_043_223_451_155_100_032_552_545_002_342_324_124_234_045_141_233_112_412_541_453_021',
-        ),
-        'prefixed': ('J/K/kg',),
-        'BTU/°R/lb': SezimalFraction(
-            '52_334_535_004_045_330_333_034_235_214_153_042_105_222_301_434_315_251_314_435_253_425_111_404_202_125_211_435_304_200_450_120_241_535_451 / 52_343_322_314_410_214_244_305_231_443_303_551_505_340_343_415_424_554_540_525_502_550_511_241_405_132_032_412_502_102_114_012_253_032_444',
-            _precalculated_value='0.555_505_210_541_414_221_155_024_423_112_410_510_351_053_304_550_315_013_204_002_415_454_431_021_404_440_002_340_132_525_304_222_214_301_255_150',
-            _precalculated_reciprocal='1.000_050_353_221_212_334_145_323_305_131_544_432_515_012_054_232_514_511_504_514_440_004_541_350_525_501_103_021_121_314_132_331_534_134_512_554',
-        ),
-        'non_prefixed': ('prefixed', 'BTU/°R/lb'),
-    },
-    'vrc/gtk/drv': {
-        'J/K/kg': SezimalFraction(
-            '304_430_231_540_240_533_511_410_151_225_100_132_205_223_411_233_243_032_405_423_024_502_224_220_455_115_105_000_031_420_454_233_001_220_002_252 / 5_453_142_052_502_050_535_213_111_042_432_021_025_325_534_251_525_120_133_400_433_523_522_020_414_101_001_035_123_223_103_552_223_551_355',
-            _precalculated_value='31_212.015_000_205_501_031_321_152_453_054_445_503_215_405_215_454_441_020_023_213_314_505_133_302_311_224_345_011_412_443_000_403_545_355_001_432_050',
-            _precalculated_reciprocal='0.000_015_052_333_044_210_240_552_514_340_301_511_005_203_230_043_223_451_155_100_032_552_545_002_342_324_124_234_045_141_233_112_412_541_453_021',
-        ),
-        'prefixed': ('J/K/kg',),
-        'BTU/°R/lb': SezimalFraction(
-            '52_334_535_004_045_330_333_034_235_214_153_042_105_222_301_434_315_251_314_435_253_425_111_404_202_125_211_435_304_200_450_120_241_535_451 / 52_343_322_314_410_214_244_305_231_443_303_551_505_340_343_415_424_554_540_525_502_550_511_241_405_132_032_412_502_102_114_012_253_032_444',
-            _precalculated_value='0.555_505_210_541_414_221_155_024_423_112_410_510_351_053_304_550_315_013_204_002_415_454_431_021_404_440_002_340_132_525_304_222_214_301_255_150',
-            _precalculated_reciprocal='1.000_050_353_221_212_334_145_323_305_131_544_432_515_012_054_232_514_511_504_514_440_004_541_350_525_501_103_021_121_314_132_331_534_134_512_554',
-        ),
-        'non_prefixed': ('prefixed', 'BTU/°R/lb'),
-    },
-    'tln': {
-        'J/K/m3': SezimalFraction(
-            '530_451_151_442_540_231_243_031_021_541_414_425_031_121_420_451_212_221_505_320_530_550_314_455_315_223_341_043_254_110_002_304_505_455 / 2_115_414_540_115_041_300_333_051_035_240_524_220_231_133_423_541_242_533_155_040_504_232_150_531_551_231_314_043_000_000_000',
-            _precalculated_value='225_303_513.323_213_221_554_254_100_245_025_240_504_010_442_232_002_411_132_313_532_344_224_550_135_244_114_302_015_234_220_124_130_110_525_314_304_110_053',
-            _precalculated_reciprocal='0.000_000_002_225_105_212_505_435_001_215_012_054_301_220_124_150_433_015_221_001_344_225_515_131_103_021_522_434_124_010_014_141_444_145_042_450',
-        ),
-        'prefixed': ('J/K/m3',),
-        'non_prefixed': ('prefixed',),
-    },
-    'agn/ayt': {
-        'J/K/m3': SezimalFraction(
-            '530_451_151_442_540_231_243_031_021_541_414_425_031_121_420_451_212_221_505_320_530_550_314_455_315_223_341_043_254_110_002_304_505_455 / 2_115_414_540_115_041_300_333_051_035_240_524_220_231_133_423_541_242_533_155_040_504_232_150_531_551_231_314_043_000_000_000',
-            _precalculated_value='225_303_513.323_213_221_554_254_100_245_025_240_504_010_442_232_002_411_132_313_532_344_224_550_135_244_114_302_015_234_220_124_130_110_525_314_304_110_053',
-            _precalculated_reciprocal='0.000_000_002_225_105_212_505_435_001_215_012_054_301_220_124_150_433_015_221_001_344_225_515_131_103_021_522_434_124_010_014_141_444_145_042_450',
-        ),
-        'prefixed': ('J/K/m3',),
-        'non_prefixed': ('prefixed',),
-    },
-    'prv/ayt': {
-        'J/K/m3': SezimalFraction(
-            '530_451_151_442_540_231_243_031_021_541_414_425_031_121_420_451_212_221_505_320_530_550_314_455_315_223_341_043_254_110_002_304_505_455 / 2_115_414_540_115_041_300_333_051_035_240_524_220_231_133_423_541_242_533_155_040_504_232_150_531_551_231_314_043_000_000_000',
-            _precalculated_value='225_303_513.323_213_221_554_254_100_245_025_240_504_010_442_232_002_411_132_313_532_344_224_550_135_244_114_302_015_234_220_124_130_110_525_314_304_110_053',
-            _precalculated_reciprocal='0.000_000_002_225_105_212_505_435_001_215_012_054_301_220_124_150_433_015_221_001_344_225_515_131_103_021_522_434_124_010_014_141_444_145_042_450',
-        ),
-        'prefixed': ('J/K/m3',),
-        'non_prefixed': ('prefixed',),
-    },
-    'vrc/gtk/ayt': {
-        'J/K/m3': SezimalFraction(
-            '530_451_151_442_540_231_243_031_021_541_414_425_031_121_420_451_212_221_505_320_530_550_314_455_315_223_341_043_254_110_002_304_505_455 / 2_115_414_540_115_041_300_333_051_035_240_524_220_231_133_423_541_242_533_155_040_504_232_150_531_551_231_314_043_000_000_000',
-            _precalculated_value='225_303_513.323_213_221_554_254_100_245_025_240_504_010_442_232_002_411_132_313_532_344_224_550_135_244_114_302_015_234_220_124_130_110_525_314_304_110_053',
-            _precalculated_reciprocal='0.000_000_002_225_105_212_505_435_001_215_012_054_301_220_124_150_433_015_221_001_344_225_515_131_103_021_522_434_124_010_014_141_444_145_042_450',
-        ),
-        'prefixed': ('J/K/m3',),
-        'non_prefixed': ('prefixed',),
-    },
-    'agn/pad3': {
-        'J/K/m3': SezimalFraction(
-            '530_451_151_442_540_231_243_031_021_541_414_425_031_121_420_451_212_221_505_320_530_550_314_455_315_223_341_043_254_110_002_304_505_455 / 2_115_414_540_115_041_300_333_051_035_240_524_220_231_133_423_541_242_533_155_040_504_232_150_531_551_231_314_043_000_000_000',
-            _precalculated_value='225_303_513.323_213_221_554_254_100_245_025_240_504_010_442_232_002_411_132_313_532_344_224_550_135_244_114_302_015_234_220_124_130_110_525_314_304_110_053',
-            _precalculated_reciprocal='0.000_000_002_225_105_212_505_435_001_215_012_054_301_220_124_150_433_015_221_001_344_225_515_131_103_021_522_434_124_010_014_141_444_145_042_450',
-        ),
-        'prefixed': ('J/K/m3',),
-        'non_prefixed': ('prefixed',),
-    },
-    'prv/pad3': {
-        'J/K/m3': SezimalFraction(
-            '530_451_151_442_540_231_243_031_021_541_414_425_031_121_420_451_212_221_505_320_530_550_314_455_315_223_341_043_254_110_002_304_505_455 / 2_115_414_540_115_041_300_333_051_035_240_524_220_231_133_423_541_242_533_155_040_504_232_150_531_551_231_314_043_000_000_000',
-            _precalculated_value='225_303_513.323_213_221_554_254_100_245_025_240_504_010_442_232_002_411_132_313_532_344_224_550_135_244_114_302_015_234_220_124_130_110_525_314_304_110_053',
-            _precalculated_reciprocal='0.000_000_002_225_105_212_505_435_001_215_012_054_301_220_124_150_433_015_221_001_344_225_515_131_103_021_522_434_124_010_014_141_444_145_042_450',
-        ),
-        'prefixed': ('J/K/m3',),
-        'non_prefixed': ('prefixed',),
-    },
-    'vrc/gtk/pad3': {
-        'J/K/m3': SezimalFraction(
-            '530_451_151_442_540_231_243_031_021_541_414_425_031_121_420_451_212_221_505_320_530_550_314_455_315_223_341_043_254_110_002_304_505_455 / 2_115_414_540_115_041_300_333_051_035_240_524_220_231_133_423_541_242_533_155_040_504_232_150_531_551_231_314_043_000_000_000',
-            _precalculated_value='225_303_513.323_213_221_554_254_100_245_025_240_504_010_442_232_002_411_132_313_532_344_224_550_135_244_114_302_015_234_220_124_130_110_525_314_304_110_053',
-            _precalculated_reciprocal='0.000_000_002_225_105_212_505_435_001_215_012_054_301_220_124_150_433_015_221_001_344_225_515_131_103_021_522_434_124_010_014_141_444_145_042_450',
-        ),
-        'prefixed': ('J/K/m3',),
-        'non_prefixed': ('prefixed',),
-    },
-    'vdt': {
-        'C': SezimalFraction(
-            '25_322_223_312_241_020_233_104_322_521_413 / 252_412_511_453_013_134_321_101_511_222_244_052',
-            _precalculated_value='0.000_100_123_231_020_435_140_213_554_413_011_430_554_240_512_053_432_554_345_450_523_103_323_151_234_335_310_203_454_025_002_413_344_031_255_544',
-            _precalculated_reciprocal='5543.252_552_402_245_222_451_524_403_320_034_132_142_434_533_022_520_114_203_540_304_244_423_512_014_440_032_005_444_055_000_015_325_433_153_050_511',
-        ),
-        'Ah': SezimalFraction(
-            '1_541_333_420_534_441_214_204_301_353_305 / 521_523_031_451_505_100_240_222_043_012_041_243_132',
-            _precalculated_value='0.000_000_002_101_351_214_502_500_424_234_543_522_510_522_150_143_043_540_144_415_052_032_203_451_513_450_053_451_201_400_334_342_025_505_141_352',
-            _precalculated_reciprocal='243_202_033.424_345_054_010_523_502_015_133_415_002_102_114_103_052_055_324_305_440_402_235_000_302_055_345_313_440_341_211_200_521_012_031_200_214_225_414',
-        ),
-        'A·h': SezimalFraction(
-            '1_541_333_420_534_441_214_204_301_353_305 / 521_523_031_451_505_100_240_222_043_012_041_243_132',
-            _precalculated_value='0.000_000_002_101_351_214_502_500_424_234_543_522_510_522_150_143_043_540_144_415_052_032_203_451_513_450_053_451_201_400_334_342_025_505_141_352',
-            _precalculated_reciprocal='243_202_033.424_345_054_010_523_502_015_133_415_002_102_114_103_052_055_324_305_440_402_235_000_302_055_345_313_440_341_211_200_521_012_031_200_214_225_414',
-        ),
-        'As': SezimalFraction(
-            '1_541_333_420_534_441_214_204_301_353_305 / 22_543_415_310_122_542_051_234_351_230_343_144_154_153_200',
-            _precalculated_value='0.000_000_000_000_044_102_334_130_100_433_051_341_233_434_422_312_144_133_500_423_223_022_515_145_010_122_133_545_215_543_243_221_333_001_023_234',
-            _precalculated_reciprocal='11_355_415_002_221.125_543_111_040_014_111_441_543_300_140_521_404_252_024_535_240_203_144_355_212_300_025_540_231_002_142_442_142_521_142_454_130_205_331_111_051',
-        ),
-        'A·s': SezimalFraction(
-            '1_541_333_420_534_441_214_204_301_353_305 / 22_543_415_310_122_542_051_234_351_230_343_144_154_153_200',
-            _precalculated_value='0.000_000_000_000_044_102_334_130_100_433_051_341_233_434_422_312_144_133_500_423_223_022_515_145_010_122_133_545_215_543_243_221_333_001_023_234',
-            _precalculated_reciprocal='11_355_415_002_221.125_543_111_040_014_111_441_543_300_140_521_404_252_024_535_240_203_144_355_212_300_025_540_231_002_142_442_142_521_142_454_130_205_331_111_051',
-        ),
-        'e': SezimalFraction(
-            '115_422_244_443_055_421_554 / 1',
-            _precalculated_value='115_422_244_443_055_421_554',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_004_305_231_315_104_502_443_125_014_201_050_255_521_430_004_403_204_533_214_235_220_350_223_441_053_354_552_242_215_110',
-        ),
-        'F': SezimalFraction(
-            '5_255_312_545_030_054_302_243 / 2_354_124_142_045_012',
-            _precalculated_value='2_022_405.155_423_313_430_342_155_333_024_402_045_425_215_402_450_103_010_153_224_421_024_554_555_341_405_533_102_552_311_102_551_154_115_220_305_322_244',
-            _precalculated_reciprocal='0.000_000_252_240_431_545_104_553_403_340_341_004_455_430_133_431_312_245_213_210_232_001_433_100_514_234_040_534_515_420_503_244_235_030_434_043',
-        ),
-        'prefixed': ('C', 'e', 'Ah', 'A·h', 'As', 'A·s', 'F'),
-        'non_prefixed': ('prefixed',),
-    },
-    'dar': {
-        'A': SezimalFraction(
-            '31_432_412_252_001_104_552_500_350_131_531_043 / 10_020_502_511_425_011_520_002_405_202_300_443_504',
-            _precalculated_value='0.003_132_245_024_134_131_040_354_235_504_144_203_243_234_405_530_241_024_420_050_305_415_452_413_122_415_002_300_523_533_042_441_532_250_332_531',
-            _precalculated_reciprocal='150.121_222_255_031_234_404_334_321_211_302_251_201_241_250_442_033_235_415_003_504_241_343_200_201_235_431_410_304_224_524_520_332_405_220_520_131',
-        ),
-        'prefixed': ('A',),
-        'non_prefixed': ('prefixed',),
-    },
-    'atr': {
-        'V': SezimalFraction(
-            '2_030_015_511_323_005_521_252_233_134_344_133_543_501_310_001_452_513_324_030_031_331_324_021_452_250_021_321_054_424_054 / 211_041_415_521_241_542_232_030_104_135_215_020_442_543_204_031_501_254_434_521_254_222_143_524_025_011_412_242_144_043',
-            _precalculated_value='5.404_402_232_303_334_001_534_510_034_332_010_342_524_232_053_221_403_035_535_155_244_453_135_323_200_502_351_215_332_001_013_402_501_420_231_315',
-            _precalculated_reciprocal='0.101_550_022_005_514_002_145_053_202_131_250_152_052_313_144_305_342_522_213_243_400_102_420_101_223_110_304_342_242_032_250_120_321_451_354_045',
-        ),
-        'prefixed': ('V',),
-        'non_prefixed': ('prefixed',),
-    },
-    'vrd': {
-        'Ω': SezimalFraction(
-            '111_133_351_303_201 / 40_450_211_224',
-            _precalculated_value='1424.421_425_300_314_552_511_012_552_401_414_321_541_435_540_510_221_251_320_215_514_504_431_411_113_233_350_042_440_455_211_351_040_324_510_424_544',
-            _precalculated_reciprocal='0.000_323_502_231_445_305_102_211_332_032_052_022_145_010_434_354_413_512_553_112_140_123_040_450_002_250_111_210_523_252_313_332_233_352_005_122',
-        ),
-        'ohm': SezimalFraction(
-            '111_133_351_303_201 / 40_450_211_224',
-            _precalculated_value='1424.421_425_300_314_552_511_012_552_401_414_321_541_435_540_510_221_251_320_215_514_504_431_411_113_233_350_042_440_455_211_351_040_324_510_424_544',
-            _precalculated_reciprocal='0.000_323_502_231_445_305_102_211_332_032_052_022_145_010_434_354_413_512_553_112_140_123_040_450_002_250_111_210_523_252_313_332_233_352_005_122',
-        ),
-        'prefixed': ('Ω', 'ohm'),
-        'non_prefixed': ('prefixed',),
-    },
-    'bad': {
-        'Ω': SezimalFraction(
-            '111_133_351_303_201 / 40_450_211_224',
-            _precalculated_value='1424.421_425_300_314_552_511_012_552_401_414_321_541_435_540_510_221_251_320_215_514_504_431_411_113_233_350_042_440_455_211_351_040_324_510_424_544',
-            _precalculated_reciprocal='0.000_323_502_231_445_305_102_211_332_032_052_022_145_010_434_354_413_512_553_112_140_123_040_450_002_250_111_210_523_252_313_332_233_352_005_122',
-        ),
-        'ohm': SezimalFraction(
-            '111_133_351_303_201 / 40_450_211_224',
-            _precalculated_value='1424.421_425_300_314_552_511_012_552_401_414_321_541_435_540_510_221_251_320_215_514_504_431_411_113_233_350_042_440_455_211_351_040_324_510_424_544',
-            _precalculated_reciprocal='0.000_323_502_231_445_305_102_211_332_032_052_022_145_010_434_354_413_512_553_112_140_123_040_450_002_250_111_210_523_252_313_332_233_352_005_122',
-        ),
-        'prefixed': ('Ω', 'ohm'),
-        'non_prefixed': ('prefixed',),
-    },
-    'gat': {
-        'Ω': SezimalFraction(
-            '111_133_351_303_201 / 40_450_211_224',
-            _precalculated_value='1424.421_425_300_314_552_511_012_552_401_414_321_541_435_540_510_221_251_320_215_514_504_431_411_113_233_350_042_440_455_211_351_040_324_510_424_544',
-            _precalculated_reciprocal='0.000_323_502_231_445_305_102_211_332_032_052_022_145_010_434_354_413_512_553_112_140_123_040_450_002_250_111_210_523_252_313_332_233_352_005_122',
-        ),
-        'ohm': SezimalFraction(
-            '111_133_351_303_201 / 40_450_211_224',
-            _precalculated_value='1424.421_425_300_314_552_511_012_552_401_414_321_541_435_540_510_221_251_320_215_514_504_431_411_113_233_350_042_440_455_211_351_040_324_510_424_544',
-            _precalculated_reciprocal='0.000_323_502_231_445_305_102_211_332_032_052_022_145_010_434_354_413_512_553_112_140_123_040_450_002_250_111_210_523_252_313_332_233_352_005_122',
-        ),
-        'prefixed': ('Ω', 'ohm'),
-        'non_prefixed': ('prefixed',),
-    },
-    'vht': {
-        'S': SezimalFraction(
-            '40_450_211_224 / 111_133_351_303_201',
-            _precalculated_value='0.000_323_502_231_445_305_102_211_332_032_052_022_145_010_434_354_413_512_553_112_140_123_040_450_002_250_111_210_523_252_313_332_233_352_005_122',
-            _precalculated_reciprocal='1424.421_425_300_314_552_511_012_552_401_414_321_541_435_540_510_221_251_320_215_514_504_431_411_113_233_350_042_440_455_211_351_040_324_510_424_544',
-        ),
-        'prefixed': ('S',),
-        'non_prefixed': ('prefixed',),
-    },
-    'upp': {
-        'H': SezimalFraction(
-            '111_133_351_303_201 / 2_122_130_400_000',
-            _precalculated_value='31.213_520_430_250_042_021_102_123_455_015_021_215_010_230_032_131_021_434_345_352_012_340_510_520_040_452_234_413_323_520_552_533_413_031_214_541',
-            _precalculated_reciprocal='0.015_051_312_132_353_540_155_544_031_032_055_502_550_043_543_124_421_224_150_343_004_333_401_132_214_345_453_424_053_100_300_431_540_501_524_430',
-        ),
-        'prefixed': ('H',),
-        'non_prefixed': ('prefixed',),
-    },
-    'dry': {
-        'F': SezimalFraction(
-            '215_310_552_224_410_234_223_555_201_220_302_223_524_334_004_013_255_343_045_425_452_302_030_301_544_223_432_320_541_413_243_012_323 / 21_040_120_253_550_024_145_050_440_551_410_103_104_052_011_245_013_302_241_154_501_100_203_510_230_313_145_001_054_004_211_352_551_550_024',
-            _precalculated_value='0.000_010_212_014_540_012_013_310_220_232_352_133_435_512_312_422_523_302_105_525_051_221_302_324_455_123_443_415_531_133_154_240_340_222_443_315',
-            _precalculated_reciprocal='53_523.345_353_310_215_542_303_514_440_011_214_125_430_030_431_422_040_535_044_431_553_510_043_454_454_122_304_513_520_215_335_353_354_325_430_331_535',
-        ),
-        'prefixed': ('F',),
-        'non_prefixed': ('prefixed',),
-    },
-    'pvh': {
-        'Wb': SezimalFraction(
-            '42_013_404_204_341_501_410_313_221_520_515_204_310_001_033_034_422_545_403_014_044_514_402_444_413_523_441_302_302_133_545 / 225_001_534_214_345_111_121_332_243_150_450_235_220_155_134_334_153_103_041_431_402_411_025_521_331_055_400_302_330_050_213',
-            _precalculated_value='0.143_111_550_551_544_004_313_314_003_455_010_321_334_554_303_535_024_002_322_003_122_024_121_421_522_225_221_220_424_450_135_335_315_323_054_013',
-            _precalculated_reciprocal='3.230_104_050_434_050_240_330_042_042_332_001_451_421_234_211_202_440_405_520_323_045_223_255_014_001_400_020_033_442_153_402_533_013_155_040_123',
-        ),
-        'prefixed': ('Wb',),
-        'non_prefixed': ('prefixed',),
-    },
-    'vtr': {
-        'T': SezimalFraction(
-            '15_323_511_050_504_245_525_102_354_512_230_215_122_503_414_323_042_125_133_011_132_440_210_501_035_053_212_535_300_515_014_305_201_313_352_144 / 5_424_153_123_455_224_051_450_230_024_221_433_555_515_341_253_115_533_030_354_045_252_555_430_014_533_504_124_433_011_351_121_502_515_105',
-            _precalculated_value='2003.203_102_524_340_010_420_142_524_302_310_202_552_231_155_544_305_411_322_210_204_315_145_254_130_230_424_131_531_405_140_201_005_115_454_422_153',
-            _precalculated_reciprocal='0.000_255_100_332_333_440_044_300_020_034_404_315_035_442_212_002_511_405_005_024_541_042_032_332_322_443_032_543_525_352_100_350_350_214_305_305',
-        ),
-        'prefixed': ('T',),
-        'non_prefixed': ('prefixed',),
-    },
-    'mdl': {
-        'rad': SezimalFraction(
-            '10_141_100_143_234_252_214_513_232_150_255_042_205_002_433_324_012_234_545_551_032_411_103_023_155_143_025_113_551_122_003_435_313_320_251_315_334_410_013_400_524_513_032_054_302_334_422_004_054_210_202_141_122_115_431_551_014_154_105_551_001_043_323_450_352_530_321_400_020_230_152_314_515_544_354_311_413_031_134_444_335_014_404_342_014_323_524_425_550_454_052_432_021_411_555_554_124 / 1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='10.141_100_143_234_252_214_513_232_150_255_042_205_002_433_324_012_234_545_551_032_411_103_023_155_143_025_113_551_122_003_435_313_320_251_315_334_410_013_400_524_513_032_054_302_334_422_004_054_210_202_141_122_115_431_551_014_154_105_551_001_043_323_450_352_530_321_400_020_230_152_314_515_544_354_311_413_031_134_444_335_014_404_342_014_323_524_425_550_454_052_432_021_411_555_554_124',
-            _precalculated_reciprocal='0.054_213_311_044_450_505_034_340_500_425_254_510_345_422_220_053_350_144_551_124_422_204_453_052_554_240_132_434_221_322_313_405_215_150_133_134_121_244_102_203_245_343_113_104_540_304_410_233_421_421_203_335_504_400_034_302_041_255_315_454_300_301_444_220_040_134_310_021_313_541_050_000_322_135_041_141_034_231_451_552_331_421_225_254_023_310_422_415_021_340_344_232_254_544_513_104',
-        ),
-        'tau_rad': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'pi_rad': SezimalFraction(
-            '2 / 1',
-            _precalculated_value='2',
-            _precalculated_reciprocal='0.3',
-        ),
-        'deg': SezimalFraction(
-            '1400 / 1',
-            _precalculated_value='1400',
-            _precalculated_reciprocal='0.000_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_334',
-        ),
-        'turn': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'gon': SezimalFraction(
-            '1504 / 1',
-            _precalculated_value='1504',
-            _precalculated_reciprocal='0.000_312_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235',
-        ),
-        'arcmin': SezimalFraction(
-            '244_000 / 1',
-            _precalculated_value='244_000',
-            _precalculated_reciprocal='0.000_002_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_210',
-        ),
-        'arcsec': SezimalFraction(
-            '43_440_000 / 1',
-            _precalculated_value='43_440_000',
-            _precalculated_reciprocal='0.000_000_011_435_341_020_032_422_550_452_131_143_534_102_003_242_255_045_213_114_353_410_200_324_225_504_521_311_435_341_020_032_422_550_452_131',
-        ),
-        'prefixed': ('rad', 'tau_rad', 'pi_rad', 'turn', 'gon', 'arcmin', 'arcsec'),
-        'non_prefixed': ('deg', 'prefixed'),
-    },
-    'kvg': {
-        'rad/s': SezimalFraction(
-            '2_322_223_322_254_321_114_402_452_204_521_002_253_014_055_232_544_152_401_100_413_011_552_253_020_012_351_554_454_220_101_222_353_455_511_424 / 4_312_223_133_122_100_045_332_020_302_123_014_122_340_003_053_205_334_452_434_554_443_222_425_232_042_424_313_344_001_133_105_411_415_425',
-            _precalculated_value='322.051_202_455_050_554_452_515_524_021_543_323_323_211_411_321_415_232_200_555_411_502_444_004_131_205_052_115_031_342_132_041_411_124_302_500_432',
-            _precalculated_reciprocal='0.001_433_545_531_132_034_504_415_135_544_150_215_213_430_211_515_021_440_401_551_053_531_301_320_210_330_421_330_440_502_425_335_403_501_344_145',
-        ),
-        'prefixed': ('rad/s',),
-        'non_prefixed': ('prefixed',),
-    },
-    'ktv': {
-        'rad/s2': SezimalFraction(
-            '1_422_120_150_252_155_004_301_522_350_145_252_140_035_021_040_541_225_315_331_213_411_104_454_525_043_234_255_112_451_341_125_032_045_340_014_052 / 54_013_010_253_124_131_005_540_233_454_434_504_431_330_035_354_110_013_045_444_242_541_302_334_410_532_324_030_120_013_252_540_433_524_031',
-            _precalculated_value='14_554.300_131_000_343_550_153_040_043_102_042_124_050_533_321_040_442_151_014_435_005_352_432_313_145_132_522_152_420_445_310_344_422_030_140_505_045',
-            _precalculated_reciprocal='0.000_031_352_044_245_555_221_540_233_150_134_305_342_232_204_035_334_533_042_101_550_104_532_425_145_213_104_034_544_404_022_311_355_054_402_043',
-        ),
-        'prefixed': ('rad/s2',),
-        'non_prefixed': ('prefixed',),
-    },
-    'grn': {
-        'J/rad': SezimalFraction(
-            '10_232_335_541_013_345_455_040_443_004_245_030_211_220_325_513_453_004_115_352_342_521_131_033_002_332_501_114_215_331_534_523_025_211_011 / 110_154_255_421_433_511_133_421_404_212_525_520_112_150_155_334_251_200_225_200_222_054_104_450_101_355_433_513_031_103_455_020_520_351_542_212',
-            _precalculated_value='0.000_052_450_205_321_123_233_020_144_452_220_535_455_305_541_422_343_320_534_054_411_553_234_443_213_023_510_045_335_544_353_415_553_112_135_210',
-            _precalculated_reciprocal='10_330.043_121_554_345_422_030_532_553_341_550_413_201_503_020_253_314_112_141_145_033_242_442_300_252_152_302_301_544_135_121_402_121_213_043_250_142',
-        ),
-        'N·m': SezimalFraction(
-            '10_232_335_541_013_345_455_040_443_004_245_030_211_220_325_513_453_004_115_352_342_521_131_033_002_332_501_114_215_331_534_523_025_211_011 / 110_154_255_421_433_511_133_421_404_212_525_520_112_150_155_334_251_200_225_200_222_054_104_450_101_355_433_513_031_103_455_020_520_351_542_212',
-            _precalculated_value='0.000_052_450_205_321_123_233_020_144_452_220_535_455_305_541_422_343_320_534_054_411_553_234_443_213_023_510_045_335_544_353_415_553_112_135_210',
-            _precalculated_reciprocal='10_330.043_121_554_345_422_030_532_553_341_550_413_201_503_020_253_314_112_141_145_033_242_442_300_252_152_302_301_544_135_121_402_121_213_043_250_142',
-        ),
-        'Nm': SezimalFraction(
-            '10_232_335_541_013_345_455_040_443_004_245_030_211_220_325_513_453_004_115_352_342_521_131_033_002_332_501_114_215_331_534_523_025_211_011 / 110_154_255_421_433_511_133_421_404_212_525_520_112_150_155_334_251_200_225_200_222_054_104_450_101_355_433_513_031_103_455_020_520_351_542_212',
-            _precalculated_value='0.000_052_450_205_321_123_233_020_144_452_220_535_455_305_541_422_343_320_534_054_411_553_234_443_213_023_510_045_335_544_353_415_553_112_135_210',
-            _precalculated_reciprocal='10_330.043_121_554_345_422_030_532_553_341_550_413_201_503_020_253_314_112_141_145_033_242_442_300_252_152_302_301_544_135_121_402_121_213_043_250_142',
-        ),
-        'prefixed': ('J/rad', 'N·m', 'Nm'),
-        'non_prefixed': ('prefixed',),
-    },
-    'kpd': {
-        'm/rad': SezimalFraction(
-            '4_025_430_404_152_533_041_203_510_055_541_202_555_133_401_550_424_103_355_231_310_403_333_511_153_405_423_342_224_233_010_202_344_520_141 / 4_325_202_205_353_034_553_452_443_235_205_442_352_033_104_035_514_022_131_202_025_340_434_211_424_425_032_313_543_411_034_453_220_543_501_304',
-            _precalculated_value='0.000_520_302_055_402_525_210_130_053_242_010_330_410_115_113_121_341_040_423_420_034_311_302_524_355_405_425_323_541_025_513_415_314_105_411_415',
-            _precalculated_reciprocal='1042.204_535_214_131_525_415_533_542_534_311_545_355_552_053_054_413_134_430_542_320_131_523_405_330_341_335_445_352_431_355_215_443_212_140_125_304',
-        ),
-        'prefixed': ('m/rad',),
-        'non_prefixed': ('prefixed',),
-    },
-    'gol': {
-        'sr': SezimalFraction(
-            '20_322_200_330_512_544_433_430_504_340_554_124_414_005_311_052_024_513_535_542_105_222_210_050_354_330_054_231_542_244_011_315_031_040_543_035_113_220_031_201_453_430_104_153_005_113_244_012_152_420_404_322_244_235_303_542_032_352_215_542_002_131_051_341_145_501_043_200_040_500_345_033_435_533_153_023_230_102_313_333_114_033_213_124_033_051_453_255_541_352_145_304_043_223_555_552_252 / 1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='20.322_200_330_512_544_433_430_504_340_554_124_414_005_311_052_024_513_535_542_105_222_210_050_354_330_054_231_542_244_011_315_031_040_543_035_113_220_031_201_453_430_104_153_005_113_244_012_152_420_404_322_244_235_303_542_032_352_215_542_002_131_051_341_145_501_043_200_040_500_345_033_435_533_153_023_230_102_313_333_114_033_213_124_033_051_453_255_541_352_145_304_043_223_555_552_252',
-            _precalculated_reciprocal='0.025_104_433_322_223_232_315_150_230_212_425_233_152_511_110_024_453_052_253_342_211_102_224_324_255_120_044_215_110_441_134_502_405_353_044_345_040_422_031_101_422_451_334_332_250_132_203_114_510_510_401_445_532_200_015_131_020_425_435_525_130_130_522_110_020_045_133_010_434_550_323_000_141_045_320_350_315_113_523_554_143_510_412_425_011_433_211_205_310_450_152_114_125_252_234_332',
-        ),
-        'prefixed': ('sr', 'spat'),
-        'spat': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'deg2': SezimalFraction(
-            '1_445_014_343_504_251_252_151_543_130_010_313_112_030_033_453_450_443_525_001_042_541_054_231_253_043_431_045_311_403_532_551_551_021_445_325_132 / 2_012_000_532_024_000_111_523_213_402_424_012_455_212_022_223_255_013_532_532_321_242_524_022_450_043_233_544_113_325_031_221_530_140_245',
-            _precalculated_value='514_552.543_344_015_232_205_345_552_053_105_404_513_103_535_310_520_200_553_324_543_430_440_103_143_210_443_220_231_212_445_501_530_452_050_003_155_314',
-            _precalculated_reciprocal='0.000_001_044_142_405_354_141_553_345_435_452_043_531_051_050_423_223_043_234_504_401_555_223_405_332_012_302_414_144_234_103_124_304_123_222_253',
-        ),
-        'non_prefixed': ('prefixed', 'deg2'),
-    },
-    'pkx': {
-        'cd': SezimalFraction(
-            '223_452_231_412_425_521_343_301_410_120_023_411_312_450_432_145_422_421_002_525_130_103_120_245_133_022_354_332_112_331_352_435_501_020_320 / 30_451_153_125_214_342_102_045_320_531_111_001_333_551_052_310_044_110_500_440_041_314_032_031_343_035_555_053_453_323_553_242_002_011_351',
-            _precalculated_value='4.400_155_522_201_314_411_225_251_000_100_533_443_525_422_313_333_113_222_031_152_135_011_131_400_325_413_122_005_411_100_403_405_100_534_013_221',
-            _precalculated_reciprocal='0.114_134_225_220_535_253_525_155_222_500_231_445_302_122_334_133_120_042_454_422_542_222_023_403_130_125_531_243_243_355_354_014_312_432_444_243',
-        ),
-        'prefixed': ('cd',),
-        'non_prefixed': ('prefixed',),
-    },
-    'dpk': {
-        'lm': SezimalFraction(
-            '10_313_400_155_000_110_532_255_311_205_244_410_350_515_034_410_530_013_333_012_023_153_543_014_323_415_205_322_024_540_333_531_405_400_140_304 / 40_033_124_551_520_211_133_131_013_031_051_002_350_332_135_052_455_023_134_404_412_445_003_301_014_305_002_242_043_153_444_313_434_351_153',
-            _precalculated_value='134.355_030_132_032_554_253_042_143_402_442_205_100_024_513_403_021_042_555_241_414_410_521_313_322_142_113_044_445_325_331_210_211_441_345_005_041',
-            _precalculated_reciprocal='0.003_403_155_153_025_430_430_001_411_114_205_225_521_030_511_422_542_015_141_345_320_002_310_053_023_315_330_504_301_555_100_114_435_445_104_201',
-        ),
-        'prefixed': ('lm',),
-        'non_prefixed': ('prefixed',),
-    },
-    'bam': {
-        'cd/m2': SezimalFraction(
-            '3_533_235_252_525_304_531_241_005_401_231_104_142_500_401_034_105_401_032_355_234_014_543_025_422_412_401_314_040_425_525_030_405_024_331_332_520 / 42_230_050_303_431_112_252_142_440_324_213_334_045_234_250_221_100_544_154_140_042_052_104_250_335_412_150_444_123_150_544_024_111_304_555',
-            _precalculated_value='52_053.231_304_102_114_023_443_432_240_130_244_014_320_515_104_340_015_530_134_035_413_545_334_301_230_133_050_341_302_554_253_501_401_403_023_223_112',
-            _precalculated_reciprocal='0.000_010_414_552_243_341_041_505_114_344_341_222_213_033_355_454_234_514_003_053_133_303_200_110_243_050_331_501_451_532_220_045_525_103_400_411',
-        ),
-        'prefixed': ('cd/m2',),
-        'non_prefixed': ('prefixed',),
-    },
-    'dxt': {
-        'lm/W': SezimalFraction(
-            '151_435_021_012 / 33_233_341',
-            _precalculated_value='3055.000_235_333_132_215_344_302_204_234_004_400_552_524_005_105_444_503_300_344_055_502_150_111_350_151_352_552_153_402_413_314_453_511_424_524_344',
-            _precalculated_reciprocal='0.000_152_151_000_124_215_453_225_435_010_031_023_055_052_521_025_310_443_000_424_451_010_204_025_044_452_521_000_115_134_544_044_152_550_220_133',
-        ),
-        'prefixed': ('lm/W',),
-        'non_prefixed': ('prefixed',),
-    },
-    'bvr': {
-        'lx': SezimalFraction(
-            '540_032_101_034_204_035_421_303_242_253_022_422_042_052_451_505_150_250_304_231_051_320_522_010_512_001_303_334_343_533_111_440_350_201_431_040 / 301_033_433_401_255_020_520_405_512_221_131_324_133_113_420_341_213_411_320_443_231_142_343_421_130_401_523_040_554_024_051_142_024_301',
-            _precalculated_value='1_512_022.433_541_341_031_331_353_011_110_041_201_144_223_541_321_400_110_311_523_405_321_454_011_252_502_341_322_301_025_433_535_215_405_344_300_140_114',
-            _precalculated_reciprocal='0.000_000_311_244_323_214_251_030_340_550_424_011_312_353_250_405_220_514_304_042_222_023_421_404_515_552_324_020_411_153_032_100_505_450_231_003',
-        ),
-        'lm/m2': SezimalFraction(
-            '540_032_101_034_204_035_421_303_242_253_022_422_042_052_451_505_150_250_304_231_051_320_522_010_512_001_303_334_343_533_111_440_350_201_431_040 / 301_033_433_401_255_020_520_405_512_221_131_324_133_113_420_341_213_411_320_443_231_142_343_421_130_401_523_040_554_024_051_142_024_301',
-            _precalculated_value='1_512_022.433_541_341_031_331_353_011_110_041_201_144_223_541_321_400_110_311_523_405_321_454_011_252_502_341_322_301_025_433_535_215_405_344_300_140_114',
-            _precalculated_reciprocal='0.000_000_311_244_323_214_251_030_340_550_424_011_312_353_250_405_220_514_304_042_222_023_421_404_515_552_324_020_411_153_032_100_505_450_231_003',
-        ),
-        'prefixed': ('lx', 'lm/m2'),
-        'non_prefixed': ('prefixed',),
-    },
-    'dpn': {
-        'lx': SezimalFraction(
-            '540_032_101_034_204_035_421_303_242_253_022_422_042_052_451_505_150_250_304_231_051_320_522_010_512_001_303_334_343_533_111_440_350_201_431_040 / 301_033_433_401_255_020_520_405_512_221_131_324_133_113_420_341_213_411_320_443_231_142_343_421_130_401_523_040_554_024_051_142_024_301',
-            _precalculated_value='1_512_022.433_541_341_031_331_353_011_110_041_201_144_223_541_321_400_110_311_523_405_321_454_011_252_502_341_322_301_025_433_535_215_405_344_300_140_114',
-            _precalculated_reciprocal='0.000_000_311_244_323_214_251_030_340_550_424_011_312_353_250_405_220_514_304_042_222_023_421_404_515_552_324_020_411_153_032_100_505_450_231_003',
-        ),
-        'lm/m2': SezimalFraction(
-            '540_032_101_034_204_035_421_303_242_253_022_422_042_052_451_505_150_250_304_231_051_320_522_010_512_001_303_334_343_533_111_440_350_201_431_040 / 301_033_433_401_255_020_520_405_512_221_131_324_133_113_420_341_213_411_320_443_231_142_343_421_130_401_523_040_554_024_051_142_024_301',
-            _precalculated_value='1_512_022.433_541_341_031_331_353_011_110_041_201_144_223_541_321_400_110_311_523_405_321_454_011_252_502_341_322_301_025_433_535_215_405_344_300_140_114',
-            _precalculated_reciprocal='0.000_000_311_244_323_214_251_030_340_550_424_011_312_353_250_405_220_514_304_042_222_023_421_404_515_552_324_020_411_153_032_100_505_450_231_003',
-        ),
-        'prefixed': ('lx', 'lm/m2'),
-        'non_prefixed': ('prefixed',),
-    },
-    'bht': {
-        'mol': SezimalFraction(
-            '15_500_240_043_244_055_302_253_004_152_125 / 403_033_110_200_415_452_441_032_023_224',
-            _precalculated_value='25.213_523_023_430_522_454_121_151_113_324_144_331_235_431_152_142_133_231_424_302_340_452_224_304_140_310_145_425_443_144_550_350_234_154_504_124',
-            _precalculated_reciprocal='0.020_232_331_424_035_145_554_214_033_131_034_501_215_013_510_300_454_250_452_410_442_223_252_243_144_124_351_354_243_542_451_531_401_244_030_331',
-        ),
-        'prefixed': ('mol',),
-        'non_prefixed': ('prefixed',),
-    },
-    'spn': {
-        'prefixed': (),
-        '%': SezimalFraction(
-            '244 / 1',
-            _precalculated_value='244',
-            _precalculated_reciprocal='0.002_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432',
-        ),
-        '‰': SezimalFraction(
-            '4344 / 1',
-            _precalculated_value='4344',
-            _precalculated_reciprocal='0.000_114_353_410_200_324_225_504_521_311_435_341_020_032_422_550_452_131_143_534_102_003_242_255_045_213_114_353_410_200_324_225_504_521_311_440',
-        ),
-        '‱': SezimalFraction(
-            '114_144 / 1',
-            _precalculated_value='114_144',
-            _precalculated_reciprocal='0.000_004_355_434_122_242_501_441_404_541_551_054_523_335_401_255_252_005_310_221_003_445_051_241_040_312_042_133_211_500_020_235_215_142_315_325',
-        ),
-        'pcm': SezimalFraction(
-            '2_050_544 / 1',
-            _precalculated_value='2_050_544',
-            _precalculated_reciprocal='0.000_000_244_435_453_502_403_440_100_254_555_303_253_543_322_314_425_334_053_012_300_214_040_424_524_504_225_005_423_103_334_502_201_043_504_432',
-        ),
-        'ppm': SezimalFraction(
-            '33_233_344 / 1',
-            _precalculated_value='33_233_344',
-            _precalculated_reciprocal='0.000_000_014_024_440_552_400_213_341_125_522_203_540_555_053_504_401_432_114_300_503_345_451_135_142_515_124_034_101_303_543_252_344_525_104_024',
-        ),
-        'ppb': SezimalFraction(
-            '243_121_245_344 / 1',
-            _precalculated_value='243_121_245_344',
-            _precalculated_reciprocal='0.000_000_000_002_102_103_542_350_153_245_205_150_101_050_242_151_443_115_011_453_354_424_343_101_505_335_030_502_154_241_543_203_530_505_032_044',
-        ),
-        'ppt': SezimalFraction(
-            '2_043_221_010_301_344 / 1',
-            _precalculated_value='2_043_221_010_301_344',
-            _precalculated_reciprocal='0.000_000_000_000_000_245_320_541_201_024_422_223_313_550_110_511_042_423_400_535_510_552_134_515_344_014_414_243_035_455_213_350_033_325_521_435',
-        ),
-        'ppq': SezimalFraction(
-            '13_502_453_354_043_313_344 / 1',
-            _precalculated_value='13_502_453_354_043_313_344',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_033_534_214_211_415_402_311_402_235_303_113_334_105_222_334_233_542_315_504_452_133_335_505_322_352_410_405_021_145_113',
-        ),
-        'non_prefixed': ('prefixed', '%', '‰', '‱', 'pcm', 'ppm', 'ppb', 'ppt', 'ppq'),
-    },
-    'atk': {
-        'prefixed': ('bit', 'b', 'B'),
-        'bit': SezimalFraction(
-            '12 / 1',
-            _precalculated_value='12',
-            _precalculated_reciprocal='0.043',
-        ),
-        'b': SezimalFraction(
-            '12 / 1',
-            _precalculated_value='12',
-            _precalculated_reciprocal='0.043',
-        ),
-        'byte': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'B': SezimalFraction(
-            '1 / 1',
-            _precalculated_value='1',
-            _precalculated_reciprocal='1',
-        ),
-        'non_prefixed': ('prefixed', 'byte'),
-    },
-    'pvn': {
-        'prefixed': ('bit/s', 'bps', 'bit/min', 'bpm', 'B/s', 'Bps', 'B/min', 'Bpm'),
-        'bit/s': SezimalFraction(
-            '30_000 / 41',
-            _precalculated_value='415.304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304',
-            _precalculated_reciprocal='0.001_220_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-        'bps': SezimalFraction(
-            '30_000 / 41',
-            _precalculated_value='415.304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304_153_041_530_415_304',
-            _precalculated_reciprocal='0.001_220_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-        'bit/min': SezimalFraction(
-            '1_000_000 / 5',
-            _precalculated_value='111_111.111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111',
-            _precalculated_reciprocal='0.000_005',
-        ),
-        'bpm': SezimalFraction(
-            '1_000_000 / 5',
-            _precalculated_value='111_111.111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111_111',
-            _precalculated_reciprocal='0.000_005',
-        ),
-        'B/s': SezimalFraction(
-            '2130 / 41',
-            _precalculated_value='31.235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235',
-            _precalculated_reciprocal='0.015_04',
-        ),
-        'Bps': SezimalFraction(
-            '2130 / 41',
-            _precalculated_value='31.235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235_012_350_123_501_235',
-            _precalculated_reciprocal='0.015_04',
-        ),
-        'B/min': SezimalFraction(
-            '43_000 / 5',
-            _precalculated_value='5222.222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-            _precalculated_reciprocal='0.000_104_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-        'Bpm': SezimalFraction(
-            '43_000 / 5',
-            _precalculated_value='5222.222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222_222',
-            _precalculated_reciprocal='0.000_104_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-        'non_prefixed': ('prefixed',),
-    },
-    'clt': {
-        'km/L': SezimalFraction(
-            '152_521_424_135_140_041_305_021_300 / 554_215_302_335_315_314_141_114_544_401',
-            _precalculated_value='0.000_153_225_422_414_425_251_530_425_211_555_320_440_024_242_530_034_232_032_140_345_502_511_103_134_121_155_003_224_350_503_125_044_343_244_001',
-            _precalculated_reciprocal='3040.043_243_323_112_520_403_401_450_102_305_245_001_542_403_533_320_141_042_342_042_012_004_301_510_440_042_052_243_130_101_453_123_443_212_330_134',
-        ),
-        'km/20L': SezimalFraction(
-            '1_135_330_545_033_040_250_032_130_000 / 110_513_300_304_413_302_020_124_332_045',
-            _precalculated_value='0.010_232_150_410_154_541_342_222_535_223_543_103_321_305_054_202_024_305_513_340_432_533_155_345_220_322_324_152_112_504_544_530_352_313_132_024',
-            _precalculated_reciprocal='53.334_550_102_321_013_344_552_253_524_154_250_130_033_044_555_140_003_020_044_150_034_000_120_405_423_334_524_004_543_524_142_510_104_545_121_303',
-        ),
-        'US mpg': SezimalFraction(
-            '1_552_415_125_224_111_001_453_343_231_043 / 2_343_054_351_250_151_042_021_213_544_012_424',
-            _precalculated_value='0.000_431_135_241_214_002_050_410_534_424_342_233_040_130_212_124_335_202_544_532_414_342_112_051_025_434_203_015_513_410_105_215_000_505_014_541',
-            _precalculated_reciprocal='1153.430_045_001_005_413_305_254_023_001_324_330_102_555_500_011_533_244_004_051_445_532_512_134_514_503_132_154_401_324_541_250_102_051_503_553_313',
-        ),
-        'US ml/gal': SezimalFraction(
-            '1_552_415_125_224_111_001_453_343_231_043 / 2_343_054_351_250_151_042_021_213_544_012_424',
-            _precalculated_value='0.000_431_135_241_214_002_050_410_534_424_342_233_040_130_212_124_335_202_544_532_414_342_112_051_025_434_203_015_513_410_105_215_000_505_014_541',
-            _precalculated_reciprocal='1153.430_045_001_005_413_305_254_023_001_324_330_102_555_500_011_533_244_004_051_445_532_512_134_514_503_132_154_401_324_541_250_102_051_503_553_313',
-        ),
-        'imp mpg': SezimalFraction(
-            '30_351_532_351_300_012_155_502_402_220_213 / 32_313_001_553_555_245_220_454_550_231_304_544',
-            _precalculated_value='0.000_524_030_235_322_524_512_441_411_525_551_044_255_522_554_354_203_130_104_430_325_434_353_330_155_454_003_555_435_301_541_035_055_024_000_121',
-            _precalculated_reciprocal='1033.534_232_225_043_125_354_224_141_100_012_000_111_533_402_450_354_014_230_155_400_522_220_501_042_425_351_400_420_452_523_433_203_144_202_513_424',
-        ),
-        'imp ml/gal': SezimalFraction(
-            '30_351_532_351_300_012_155_502_402_220_213 / 32_313_001_553_555_245_220_454_550_231_304_544',
-            _precalculated_value='0.000_524_030_235_322_524_512_441_411_525_551_044_255_522_554_354_203_130_104_430_325_434_353_330_155_454_003_555_435_301_541_035_055_024_000_121',
-            _precalculated_reciprocal='1033.534_232_225_043_125_354_224_141_100_012_000_111_533_402_450_354_014_230_155_400_522_220_501_042_425_351_400_420_452_523_433_203_144_202_513_424',
-        ),
-        'L/100km': SezimalFraction(
-            '-40_451_355_445_120_500_405_030_234_052_441 / 25_120_234_022_453_010_214_133_213',
-            _precalculated_value='-1_235_100.414_033_012_441_112_211_300_345_500_310_432_523_404_253_151_404_144_154_032_015_414_030_510_245_500_035_005_541_025_302_015_551_201_150_242_342',
-            _precalculated_reciprocal='-0.000_000_405_534_244_524_003_111_005_533_402_513_043_333_433_052_115_424_432_210_211_045_524_134_413_535_311_105_024_001_215_525_031_420_512_530',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('km/L', 'km/20L', 'US mpg', 'US ml/gal', 'imp mpg', 'imp ml/gal', 'L/100km', 'prefixed'),
-    },
-    'pbt': {
-        'L/100km': SezimalFraction(
-            '40_451_355_445_120_500_405_030_234_052_441 / 25_120_234_022_453_010_214_133_213',
-            _precalculated_value='1_235_100.414_033_012_441_112_211_300_345_500_310_432_523_404_253_151_404_144_154_032_015_414_030_510_245_500_035_005_541_025_302_015_551_201_150_242_343',
-            _precalculated_reciprocal='0.000_000_405_534_244_524_003_111_005_533_402_513_043_333_433_052_115_424_432_210_211_045_524_134_413_535_311_105_024_001_215_525_031_420_512_531',
-        ),
-        'km/L': SezimalFraction(
-            '-152_521_424_135_140_041_305_021_300 / 554_215_302_335_315_314_141_114_544_401',
-            _precalculated_value='-0.000_153_225_422_414_425_251_530_425_211_555_320_440_024_242_530_034_232_032_140_345_502_511_103_134_121_155_003_224_350_503_125_044_343_244_000',
-            _precalculated_reciprocal='-3040.043_243_323_112_520_403_401_450_102_305_245_001_542_403_533_320_141_042_342_042_012_004_301_510_440_042_052_243_130_101_453_123_443_212_330_133',
-        ),
-        'km/20L': SezimalFraction(
-            '-1_135_330_545_033_040_250_032_130_000 / 110_513_300_304_413_302_020_124_332_045',
-            _precalculated_value='-0.010_232_150_410_154_541_342_222_535_223_543_103_321_305_054_202_024_305_513_340_432_533_155_345_220_322_324_152_112_504_544_530_352_313_132_024',
-            _precalculated_reciprocal='-53.334_550_102_321_013_344_552_253_524_154_250_130_033_044_555_140_003_020_044_150_034_000_120_405_423_334_524_004_543_524_142_510_104_545_121_302',
-        ),
-        'US mpg': SezimalFraction(
-            '-1_552_415_125_224_111_001_453_343_231_043 / 2_343_054_351_250_151_042_021_213_544_012_424',
-            _precalculated_value='-0.000_431_135_241_214_002_050_410_534_424_342_233_040_130_212_124_335_202_544_532_414_342_112_051_025_434_203_015_513_410_105_215_000_505_014_540',
-            _precalculated_reciprocal='-1153.430_045_001_005_413_305_254_023_001_324_330_102_555_500_011_533_244_004_051_445_532_512_134_514_503_132_154_401_324_541_250_102_051_503_553_313',
-        ),
-        'US ml/gal': SezimalFraction(
-            '-1_552_415_125_224_111_001_453_343_231_043 / 2_343_054_351_250_151_042_021_213_544_012_424',
-            _precalculated_value='-0.000_431_135_241_214_002_050_410_534_424_342_233_040_130_212_124_335_202_544_532_414_342_112_051_025_434_203_015_513_410_105_215_000_505_014_540',
-            _precalculated_reciprocal='-1153.430_045_001_005_413_305_254_023_001_324_330_102_555_500_011_533_244_004_051_445_532_512_134_514_503_132_154_401_324_541_250_102_051_503_553_313',
-        ),
-        'imp mpg': SezimalFraction(
-            '-30_351_532_351_300_012_155_502_402_220_213 / 32_313_001_553_555_245_220_454_550_231_304_544',
-            _precalculated_value='-0.000_524_030_235_322_524_512_441_411_525_551_044_255_522_554_354_203_130_104_430_325_434_353_330_155_454_003_555_435_301_541_035_055_024_000_120',
-            _precalculated_reciprocal='-1033.534_232_225_043_125_354_224_141_100_012_000_111_533_402_450_354_014_230_155_400_522_220_501_042_425_351_400_420_452_523_433_203_144_202_513_423',
-        ),
-        'imp ml/gal': SezimalFraction(
-            '-30_351_532_351_300_012_155_502_402_220_213 / 32_313_001_553_555_245_220_454_550_231_304_544',
-            _precalculated_value='-0.000_524_030_235_322_524_512_441_411_525_551_044_255_522_554_354_203_130_104_430_325_434_353_330_155_454_003_555_435_301_541_035_055_024_000_120',
-            _precalculated_reciprocal='-1033.534_232_225_043_125_354_224_141_100_012_000_111_533_402_450_354_014_230_155_400_522_220_501_042_425_351_400_420_452_523_433_203_144_202_513_423',
-        ),
-        'prefixed': [],
-        'non_prefixed': ('L/100km', 'km/L', 'km/20L', 'US mpg', 'US ml/gal', 'imp mpg', 'imp ml/gal', 'prefixed'),
-    },
-}
-
-#
-# Pre-calculated sezimal exponents conversion
-#
-SEZIMAL_EXPONENT_FACTOR = {
-    SezimalInteger('-130'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-125'): SezimalFraction(
-            '1 / 100_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-124'): SezimalFraction(
-            '1 / 10_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-123'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-122'): SezimalFraction(
-            '1 / 100_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-121'): SezimalFraction(
-            '1 / 10_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-120'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-115'): SezimalFraction(
-            '1 / 100_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-114'): SezimalFraction(
-            '1 / 10_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-113'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-112'): SezimalFraction(
-            '1 / 100_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-111'): SezimalFraction(
-            '1 / 10_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-110'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-105'): SezimalFraction(
-            '1 / 100_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-104'): SezimalFraction(
-            '1 / 10_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-103'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-102'): SezimalFraction(
-            '1 / 100_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-101'): SezimalFraction(
-            '1 / 10_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-100'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-55'): SezimalFraction(
-            '1 / 100_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-54'): SezimalFraction(
-            '1 / 10_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-53'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-52'): SezimalFraction(
-            '1 / 100_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-51'): SezimalFraction(
-            '1 / 10_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-50'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-45'): SezimalFraction(
-            '1 / 100_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-44'): SezimalFraction(
-            '1 / 10_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-43'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-42'): SezimalFraction(
-            '1 / 100_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-41'): SezimalFraction(
-            '1 / 10_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-40'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-35'): SezimalFraction(
-            '1 / 100_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-34'): SezimalFraction(
-            '1 / 10_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-33'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-32'): SezimalFraction(
-            '1 / 100_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-31'): SezimalFraction(
-            '1 / 10_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-30'): SezimalFraction(
-            '1 / 1_000_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000_000',
-        ),
-    SezimalInteger('-25'): SezimalFraction(
-            '1 / 100_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000_000',
-        ),
-    SezimalInteger('-24'): SezimalFraction(
-            '1 / 10_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000_000',
-        ),
-    SezimalInteger('-23'): SezimalFraction(
-            '1 / 1_000_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000_000',
-        ),
-    SezimalInteger('-22'): SezimalFraction(
-            '1 / 100_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000_000',
-        ),
-    SezimalInteger('-21'): SezimalFraction(
-            '1 / 10_000_000_000_000',
-            _precalculated_value='0.000_000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000_000',
-        ),
-    SezimalInteger('-20'): SezimalFraction(
-            '1 / 1_000_000_000_000',
-            _precalculated_value='0.000_000_000_001',
-            _precalculated_reciprocal='1_000_000_000_000',
-        ),
-    SezimalInteger('-15'): SezimalFraction(
-            '1 / 100_000_000_000',
-            _precalculated_value='0.000_000_000_01',
-            _precalculated_reciprocal='100_000_000_000',
-        ),
-    SezimalInteger('-14'): SezimalFraction(
-            '1 / 10_000_000_000',
-            _precalculated_value='0.000_000_000_1',
-            _precalculated_reciprocal='10_000_000_000',
-        ),
-    SezimalInteger('-13'): SezimalFraction(
-            '1 / 1_000_000_000',
-            _precalculated_value='0.000_000_001',
-            _precalculated_reciprocal='1_000_000_000',
-        ),
-    SezimalInteger('-12'): SezimalFraction(
-            '1 / 100_000_000',
-            _precalculated_value='0.000_000_01',
-            _precalculated_reciprocal='100_000_000',
-        ),
-    SezimalInteger('-11'): SezimalFraction(
-            '1 / 10_000_000',
-            _precalculated_value='0.000_000_1',
-            _precalculated_reciprocal='10_000_000',
-        ),
-    SezimalInteger('-10'): SezimalFraction(
-            '1 / 1_000_000',
-            _precalculated_value='0.000_001',
-            _precalculated_reciprocal='1_000_000',
-        ),
-    SezimalInteger('-5'): SezimalFraction(
-            '1 / 100_000',
-            _precalculated_value='0.000_01',
-            _precalculated_reciprocal='100_000',
-        ),
-    SezimalInteger('-4'): SezimalFraction(
-            '1 / 10_000',
-            _precalculated_value='0.0001',
-            _precalculated_reciprocal='10_000',
-        ),
-    SezimalInteger('-3'): SezimalFraction(
-            '1 / 1000',
-            _precalculated_value='0.001',
-            _precalculated_reciprocal='1000',
-        ),
-    SezimalInteger('-2'): SezimalFraction(
-            '1 / 100',
-            _precalculated_value='0.01',
-            _precalculated_reciprocal='100',
-        ),
-    SezimalInteger('-1'): SezimalFraction(
-            '1 / 10',
-            _precalculated_value='0.1',
-            _precalculated_reciprocal='10',
-        ),
-    SezimalInteger('1'): SezimalFraction(
-            '10 / 1',
-            _precalculated_value='10',
-            _precalculated_reciprocal='0.1',
-        ),
-    SezimalInteger('2'): SezimalFraction(
-            '100 / 1',
-            _precalculated_value='100',
-            _precalculated_reciprocal='0.01',
-        ),
-    SezimalInteger('3'): SezimalFraction(
-            '1000 / 1',
-            _precalculated_value='1000',
-            _precalculated_reciprocal='0.001',
-        ),
-    SezimalInteger('4'): SezimalFraction(
-            '10_000 / 1',
-            _precalculated_value='10_000',
-            _precalculated_reciprocal='0.0001',
-        ),
-    SezimalInteger('5'): SezimalFraction(
-            '100_000 / 1',
-            _precalculated_value='100_000',
-            _precalculated_reciprocal='0.000_01',
-        ),
-    SezimalInteger('10'): SezimalFraction(
-            '1_000_000 / 1',
-            _precalculated_value='1_000_000',
-            _precalculated_reciprocal='0.000_001',
-        ),
-    SezimalInteger('11'): SezimalFraction(
-            '10_000_000 / 1',
-            _precalculated_value='10_000_000',
-            _precalculated_reciprocal='0.000_000_1',
-        ),
-    SezimalInteger('12'): SezimalFraction(
-            '100_000_000 / 1',
-            _precalculated_value='100_000_000',
-            _precalculated_reciprocal='0.000_000_01',
-        ),
-    SezimalInteger('13'): SezimalFraction(
-            '1_000_000_000 / 1',
-            _precalculated_value='1_000_000_000',
-            _precalculated_reciprocal='0.000_000_001',
-        ),
-    SezimalInteger('14'): SezimalFraction(
-            '10_000_000_000 / 1',
-            _precalculated_value='10_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_1',
-        ),
-    SezimalInteger('15'): SezimalFraction(
-            '100_000_000_000 / 1',
-            _precalculated_value='100_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_01',
-        ),
-    SezimalInteger('20'): SezimalFraction(
-            '1_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_001',
-        ),
-    SezimalInteger('21'): SezimalFraction(
-            '10_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_1',
-        ),
-    SezimalInteger('22'): SezimalFraction(
-            '100_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_01',
-        ),
-    SezimalInteger('23'): SezimalFraction(
-            '1_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_001',
-        ),
-    SezimalInteger('24'): SezimalFraction(
-            '10_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_1',
-        ),
-    SezimalInteger('25'): SezimalFraction(
-            '100_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_01',
-        ),
-    SezimalInteger('30'): SezimalFraction(
-            '1_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_001',
-        ),
-    SezimalInteger('31'): SezimalFraction(
-            '10_000_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_1',
-        ),
-    SezimalInteger('32'): SezimalFraction(
-            '100_000_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_01',
-        ),
-    SezimalInteger('33'): SezimalFraction(
-            '1_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_001',
-        ),
-    SezimalInteger('34'): SezimalFraction(
-            '10_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_1',
-        ),
-    SezimalInteger('35'): SezimalFraction(
-            '100_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_01',
-        ),
-    SezimalInteger('40'): SezimalFraction(
-            '1_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_001',
-        ),
-    SezimalInteger('41'): SezimalFraction(
-            '10_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_1',
-        ),
-    SezimalInteger('42'): SezimalFraction(
-            '100_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_01',
-        ),
-    SezimalInteger('43'): SezimalFraction(
-            '1_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_001',
-        ),
-    SezimalInteger('44'): SezimalFraction(
-            '10_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_1',
-        ),
-    SezimalInteger('45'): SezimalFraction(
-            '100_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_01',
-        ),
-    SezimalInteger('50'): SezimalFraction(
-            '1_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_001',
-        ),
-    SezimalInteger('51'): SezimalFraction(
-            '10_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_1',
-        ),
-    SezimalInteger('52'): SezimalFraction(
-            '100_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_01',
-        ),
-    SezimalInteger('53'): SezimalFraction(
-            '1_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_001',
-        ),
-    SezimalInteger('54'): SezimalFraction(
-            '10_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_1',
-        ),
-    SezimalInteger('55'): SezimalFraction(
-            '100_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_01',
-        ),
-    SezimalInteger('100'): SezimalFraction(
-            '1_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_001',
-        ),
-    SezimalInteger('101'): SezimalFraction(
-            '10_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_1',
-        ),
-    SezimalInteger('102'): SezimalFraction(
-            '100_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_01',
-        ),
-    SezimalInteger('103'): SezimalFraction(
-            '1_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_001',
-        ),
-    SezimalInteger('104'): SezimalFraction(
-            '10_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_1',
-        ),
-    SezimalInteger('105'): SezimalFraction(
-            '100_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_01',
-        ),
-    SezimalInteger('110'): SezimalFraction(
-            '1_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_001',
-        ),
-    SezimalInteger('111'): SezimalFraction(
-            '10_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_1',
-        ),
-    SezimalInteger('112'): SezimalFraction(
-            '100_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_01',
-        ),
-    SezimalInteger('113'): SezimalFraction(
-            '1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_001',
-        ),
-    SezimalInteger('114'): SezimalFraction(
-            '10_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_1',
-        ),
-    SezimalInteger('115'): SezimalFraction(
-            '100_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_01',
-        ),
-    SezimalInteger('120'): SezimalFraction(
-            '1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_001',
-        ),
-    SezimalInteger('121'): SezimalFraction(
-            '10_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_1',
-        ),
-    SezimalInteger('122'): SezimalFraction(
-            '100_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_01',
-        ),
-    SezimalInteger('123'): SezimalFraction(
-            '1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_001',
-        ),
-    SezimalInteger('124'): SezimalFraction(
-            '10_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='10_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_1',
-        ),
-    SezimalInteger('125'): SezimalFraction(
-            '100_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='100_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_01',
-        ),
-    SezimalInteger('130'): SezimalFraction(
-            '1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000 / 1',
-            _precalculated_value='1_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_001',
-        ),
-}
-
-#
-# Pre-calculated sezimal exponents conversion
-#
-DECIMAL_EXPONENT_FACTOR = {
-    SezimalInteger('-102'): SezimalFraction(
-            '1 / 4_242_012_532_323_105_415_404_333_144_142_511_412_054_320_214_544',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_120_255_154_135_450_142_214_024_024_354_444_345_400_543_253_302_505_523_422_532',
-            _precalculated_reciprocal='4_242_012_532_323_105_415_404_333_144_142_511_412_054_320_214_544',
-        ),
-    SezimalInteger('-101'): SezimalFraction(
-            '1 / 240_112_032_020_152_545_545_132_044_010_141_545_341_020_012_144',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_002_124_545_130_434_022_515_444_424_434_335_554_212_413_334_515_044_335_021_205_133',
-            _precalculated_reciprocal='240_112_032_020_152_545_545_132_044_010_141_545_341_020_012_144',
-        ),
-    SezimalInteger('-100'): SezimalFraction(
-            '1 / 13_342_002_001_122_032_555_154_225_111_454_555_210_034_445_344',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_034_241_404_311_404_404_513_555_235_414_035_531_423_040_020_503_154_022_341_324_350',
-            _precalculated_reciprocal='13_342_002_001_122_032_555_154_225_111_454_555_210_034_445_344',
-        ),
-    SezimalInteger('-55'): SezimalFraction(
-            '1 / 543_445_000_042_335_411_044_350_304_214_411_045_224_402_544',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_001_012_304_513_204_514_520_443_550_233_045_035_125_211_040_332_253_124_402_103_434_213',
-            _precalculated_reciprocal='543_445_000_042_335_411_044_350_304_214_411_045_224_402_544',
-        ),
-    SezimalInteger('-54'): SezimalFraction(
-            '1 / 32_440_300_002_354_434_151_355_241_345_511_525_201_400_144',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_014_221_120_433_320_500_531_543_424_151_203_024_245_355_045_540_512_234_433_501_411_434',
-            _precalculated_reciprocal='32_440_300_002_354_434_151_355_241_345_511_525_201_400_144',
-        ),
-    SezimalInteger('-53'): SezimalFraction(
-            '1 / 2_024_503_333_511_024_344_211_051_210_330_442_533_433_344',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_251_540_131_355_332_213_131_341_231_041_250_432_412_343_215_252_420_215_402_225_005_411',
-            _precalculated_reciprocal='2_024_503_333_511_024_344_211_051_210_330_442_533_433_344',
-        ),
-    SezimalInteger('-52'): SezimalFraction(
-            '1 / 112_515_054_330_412_510_234_151_534_131_513_520_550_544',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_004_451_242_324_351_535_432_324_102_115_102_431_343_022_133_510_503_123_512_440_042_132_550',
-            _precalculated_reciprocal='112_515_054_330_412_510_234_151_534_131_513_520_550_544',
-        ),
-    SezimalInteger('-51'): SezimalFraction(
-            '1 / 4_253_303_243_023_141_502_121_554_343_104_331_144_144',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_000_120_042_321_434_251_233_341_425_434_103_443_324_130_354_402_352_252_222_423_441_114_345_413',
-            _precalculated_reciprocal='4_253_303_243_023_141_502_121_554_343_104_331_144_144',
-        ),
-    SezimalInteger('-50'): SezimalFraction(
-            '1 / 240_541_313_523_532_330_120_111_021_304_020_421_344',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_002_121_121_345_412_442_200_105_253_405_501_535_430_310_334_442_300_500_003_221_500_054_213_030',
-            _precalculated_reciprocal='240_541_313_523_532_330_120_111_021_304_020_421_344',
-        ),
-    SezimalInteger('-45'): SezimalFraction(
-            '1 / 13_410_053_220_220_505_231_115_301_204_001_134_544',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_000_034_140_144_213_023_515_201_530_520_534_231_233_305_150_015_521_012_200_053_550_201_331_430_451',
-            _precalculated_reciprocal='13_410_053_220_220_505_231_115_301_204_001_134_544',
-        ),
-    SezimalInteger('-44'): SezimalFraction(
-            '1 / 545_225_423_350_030_313_042_203_422_444_532_144',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_001_010_442_551_430_422_505_231_112_533_212_122_155_125_020_314_534_215_201_323_423_223_525_312_040',
-            _precalculated_reciprocal='545_225_423_350_030_313_042_203_422_444_532_144',
-        ),
-    SezimalInteger('-43'): SezimalFraction(
-            '1 / 32_535_212_433_001_504_302_345_101_251_405_344',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_014_151_525_445_311_204_330_120_025_153_414_155_144_242_325_301_211_505_223_421_214_023_051_213_042',
-            _precalculated_reciprocal='32_535_212_433_001_504_302_345_101_251_405_344',
-        ),
-    SezimalInteger('-42'): SezimalFraction(
-            '1 / 2_032_200_513_144_552_503_510_303_425_322_544',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_000_251_051_054_011_201_313_502_120_445_121_051_144_552_321_451_021_410_330_021_141_444_411_241_431_105',
-            _precalculated_reciprocal='2_032_200_513_144_552_503_510_303_425_322_544',
-        ),
-    SezimalInteger('-41'): SezimalFraction(
-            '1 / 113_122_253_155_144_252_441_503_550_320_144',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_004_435_235_324_201_223_242_234_132_004_135_241_001_501_350_034_344_545_500_340_505_555_002_305_315_521',
-            _precalculated_reciprocal='113_122_253_155_144_252_441_503_550_320_144',
-        ),
-    SezimalInteger('-40'): SezimalFraction(
-            '1 / 4_305_014_311_044_014_251_215_110_353_344',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_000_115_430_231_431_222_014_320_210_332_110_430_254_030_224_221_014_201_414_210_052_335_542_041_131_314_532',
-            _precalculated_reciprocal='4_305_014_311_044_014_251_215_110_353_344',
-        ),
-    SezimalInteger('-35'): SezimalFraction(
-            '1 / 241_412_130_414_001_014_201_041_510_544',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_002_113_304_125_321_552_253_323_345_533_551_304_524_504_031_534_251_225_051_341_302_035_313_100_323_301_140',
-            _precalculated_reciprocal='241_412_130_414_001_014_201_041_510_544',
-        ),
-    SezimalInteger('-34'): SezimalFraction(
-            '1 / 13_434_231_512_111_145_500_040_104_144',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_000_034_035_110_251_351_500_515_420_215_203_443_121_040_304_531_212_442_043_244_103_033_031_231_405_415_020_432',
-            _precalculated_reciprocal='13_434_231_512_111_145_500_040_104_144',
-        ),
-    SezimalInteger('-33'): SezimalFraction(
-            '1 / 551_013_104_230_421_441_113_341_344',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_001_005_023_544_444_250_212_513_123_505_301_532_135_045_121_121_423_513_134_345_450_550_522_124_533_102_331_340',
-            _precalculated_reciprocal='551_013_104_230_421_441_113_341_344',
-        ),
-    SezimalInteger('-32'): SezimalFraction(
-            '1 / 33_034_304_013_023_440_042_054_544',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_014_122_423_355_552_423_424_432_222_331_031_134_423_204_140_145_222_432_414_214_033_432_554_241_151_441_524_035',
-            _precalculated_reciprocal='33_034_304_013_023_440_042_054_544',
-        ),
-    SezimalInteger('-31'): SezimalFraction(
-            '1 / 2_035_504_000_523_551_113_452_144',
-            _precalculated_value='0.000_000_000_000_000_000_000_000_250_203_220_355_503_221_235_340_001_514_520_415_213_310_443_010_003_343_051_445_001_345_532_301_045_511_025_015',
-            _precalculated_reciprocal='2_035_504_000_523_551_113_452_144',
-        ),
-    SezimalInteger('-30'): SezimalFraction(
-            '1 / 113_330_222_253_555_304_325_344',
-            _precalculated_value='0.000_000_000_000_000_000_000_004_423_253_530_354_253_542_232_040_030_500_531_105_435_151_530_140_100_131_250_002_024_215_141_015_214_354_442_254',
-            _precalculated_reciprocal='113_330_222_253_555_304_325_344',
-        ),
-    SezimalInteger('-25'): SezimalFraction(
-            '1 / 4_320_350_125_444_430_242_544',
-            _precalculated_value='0.000_000_000_000_000_000_000_115_214_523_110_332_523_320_133_040_512_213_115_533_425_051_102_441_402_322_420_032_431_504_454_305_454_335_520_521',
-            _precalculated_reciprocal='4_320_350_125_444_430_242_544',
-        ),
-    SezimalInteger('-24'): SezimalFraction(
-            '1 / 242_244_120_325_135_240_144',
-            _precalculated_value='0.000_000_000_000_000_000_002_105_501_011_545_545_015_322_351_052_415_432_115_201_243_235_443_504_441_403_120_543_330_320_133_134_134_034_532_531',
-            _precalculated_reciprocal='242_244_120_325_135_240_144',
-        ),
-    SezimalInteger('-23'): SezimalFraction(
-            '1 / 13_502_453_354_043_313_344',
-            _precalculated_value='0.000_000_000_000_000_000_033_534_214_211_415_402_311_402_235_303_113_334_105_222_334_233_542_315_504_452_133_335_505_322_352_410_405_021_145_113',
-            _precalculated_reciprocal='13_502_453_354_043_313_344',
-        ),
-    SezimalInteger('-22'): SezimalFraction(
-            '1 / 552_403_211_002_430_544',
-            _precalculated_value='0.000_000_000_000_000_001_003_211_451_405_112_441_204_440_231_052_040_005_530_002_012_203_321_314_320_054_400_034_331_402_302_550_522_341_004_033',
-            _precalculated_reciprocal='552_403_211_002_430_544',
-        ),
-    SezimalInteger('-21'): SezimalFraction(
-            '1 / 33_133_534_145_024_144',
-            _precalculated_value='0.000_000_000_000_000_014_053_410_044_524_023_501_315_444_115_253_040_135_100_032_215_255_343_253_321_334_401_013_524_441_045_433_002_054_104_551',
-            _precalculated_reciprocal='33_133_534_145_024_144',
-        ),
-    SezimalInteger('-20'): SezimalFraction(
-            '1 / 2_043_221_010_301_344',
-            _precalculated_value='0.000_000_000_000_000_245_320_541_201_024_422_223_313_550_110_511_042_423_400_535_510_552_134_515_344_014_414_243_035_455_213_350_033_325_521_435',
-            _precalculated_reciprocal='2_043_221_010_301_344',
-        ),
-    SezimalInteger('-15'): SezimalFraction(
-            '1 / 113_534_523_014_544',
-            _precalculated_value='0.000_000_000_000_004_411_333_301_214_435_200_015_243_421_552_355_123_220_413_234_353_454_420_512_144_255_052_331_034_145_440_220_555_454_545_420',
-            _precalculated_reciprocal='113_534_523_014_544',
-        ),
-    SezimalInteger('-14'): SezimalFraction(
-            '1 / 4_332_142_412_144',
-            _precalculated_value='0.000_000_000_000_115_003_555_021_455_425_200_310_341_151_502_344_213_531_034_214_322_135_132_414_552_543_301_515_011_013_443_533_554_141_413_114',
-            _precalculated_reciprocal='4_332_142_412_144',
-        ),
-    SezimalInteger('-13'): SezimalFraction(
-            '1 / 243_121_245_344',
-            _precalculated_value='0.000_000_000_002_102_103_542_350_153_245_205_150_101_050_242_151_443_115_011_453_354_424_343_101_505_335_030_502_154_241_543_203_530_505_032_044',
-            _precalculated_reciprocal='243_121_245_344',
-        ),
-    SezimalInteger('-12'): SezimalFraction(
-            '1 / 13_531_202_544',
-            _precalculated_value='0.000_000_000_033_433_503_322_223_114_405_325_021_415_224_315_045_532_102_210_120_335_234_131_430_332_022_512_235_132_311_333_303_112_322_533_141',
-            _precalculated_reciprocal='13_531_202_544',
-        ),
-    SezimalInteger('-11'): SezimalFraction(
-            '1 / 554_200_144',
-            _precalculated_value='0.000_000_001_001_402_255_400_012_054_531_442_345_110_033_303_215_133_435_342_130_030_210_325_305_532_404_420_224_341_203_555_052_021_405_152_450',
-            _precalculated_reciprocal='554_200_144',
-        ),
-    SezimalInteger('-10'): SezimalFraction(
-            '1 / 33_233_344',
-            _precalculated_value='0.000_000_014_024_440_552_400_213_341_125_522_203_540_555_053_504_401_432_114_300_503_345_451_135_142_515_124_034_101_303_543_252_344_525_104_024',
-            _precalculated_reciprocal='33_233_344',
-        ),
-    SezimalInteger('-5'): SezimalFraction(
-            '1 / 2_050_544',
-            _precalculated_value='0.000_000_244_435_453_502_403_440_100_254_555_303_253_543_322_314_425_334_053_012_300_214_040_424_524_504_225_005_423_103_334_502_201_043_504_432',
-            _precalculated_reciprocal='2_050_544',
-        ),
-    SezimalInteger('-4'): SezimalFraction(
-            '1 / 114_144',
-            _precalculated_value='0.000_004_355_434_122_242_501_441_404_541_551_054_523_335_401_255_252_005_310_221_003_445_051_241_040_312_042_133_211_500_020_235_215_142_315_325',
-            _precalculated_reciprocal='114_144',
-        ),
-    SezimalInteger('-3'): SezimalFraction(
-            '1 / 4344',
-            _precalculated_value='0.000_114_353_410_200_324_225_504_521_311_435_341_020_032_422_550_452_131_143_534_102_003_242_255_045_213_114_353_410_200_324_225_504_521_311_440',
-            _precalculated_reciprocal='4344',
-        ),
-    SezimalInteger('-2'): SezimalFraction(
-            '1 / 244',
-            _precalculated_value='0.002_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432',
-            _precalculated_reciprocal='244',
-        ),
-    SezimalInteger('-1'): SezimalFraction(
-            '1 / 14',
-            _precalculated_value='0.033_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_334',
-            _precalculated_reciprocal='14',
-        ),
-    SezimalInteger('1'): SezimalFraction(
-            '14 / 1',
-            _precalculated_value='14',
-            _precalculated_reciprocal='0.033_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_333_334',
-        ),
-    SezimalInteger('2'): SezimalFraction(
-            '244 / 1',
-            _precalculated_value='244',
-            _precalculated_reciprocal='0.002_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432_054_320_543_205_432',
-        ),
-    SezimalInteger('3'): SezimalFraction(
-            '4344 / 1',
-            _precalculated_value='4344',
-            _precalculated_reciprocal='0.000_114_353_410_200_324_225_504_521_311_435_341_020_032_422_550_452_131_143_534_102_003_242_255_045_213_114_353_410_200_324_225_504_521_311_440',
-        ),
-    SezimalInteger('4'): SezimalFraction(
-            '114_144 / 1',
-            _precalculated_value='114_144',
-            _precalculated_reciprocal='0.000_004_355_434_122_242_501_441_404_541_551_054_523_335_401_255_252_005_310_221_003_445_051_241_040_312_042_133_211_500_020_235_215_142_315_325',
-        ),
-    SezimalInteger('5'): SezimalFraction(
-            '2_050_544 / 1',
-            _precalculated_value='2_050_544',
-            _precalculated_reciprocal='0.000_000_244_435_453_502_403_440_100_254_555_303_253_543_322_314_425_334_053_012_300_214_040_424_524_504_225_005_423_103_334_502_201_043_504_432',
-        ),
-    SezimalInteger('10'): SezimalFraction(
-            '33_233_344 / 1',
-            _precalculated_value='33_233_344',
-            _precalculated_reciprocal='0.000_000_014_024_440_552_400_213_341_125_522_203_540_555_053_504_401_432_114_300_503_345_451_135_142_515_124_034_101_303_543_252_344_525_104_024',
-        ),
-    SezimalInteger('11'): SezimalFraction(
-            '554_200_144 / 1',
-            _precalculated_value='554_200_144',
-            _precalculated_reciprocal='0.000_000_001_001_402_255_400_012_054_531_442_345_110_033_303_215_133_435_342_130_030_210_325_305_532_404_420_224_341_203_555_052_021_405_152_450',
-        ),
-    SezimalInteger('12'): SezimalFraction(
-            '13_531_202_544 / 1',
-            _precalculated_value='13_531_202_544',
-            _precalculated_reciprocal='0.000_000_000_033_433_503_322_223_114_405_325_021_415_224_315_045_532_102_210_120_335_234_131_430_332_022_512_235_132_311_333_303_112_322_533_141',
-        ),
-    SezimalInteger('13'): SezimalFraction(
-            '243_121_245_344 / 1',
-            _precalculated_value='243_121_245_344',
-            _precalculated_reciprocal='0.000_000_000_002_102_103_542_350_153_245_205_150_101_050_242_151_443_115_011_453_354_424_343_101_505_335_030_502_154_241_543_203_530_505_032_044',
-        ),
-    SezimalInteger('14'): SezimalFraction(
-            '4_332_142_412_144 / 1',
-            _precalculated_value='4_332_142_412_144',
-            _precalculated_reciprocal='0.000_000_000_000_115_003_555_021_455_425_200_310_341_151_502_344_213_531_034_214_322_135_132_414_552_543_301_515_011_013_443_533_554_141_413_114',
-        ),
-    SezimalInteger('15'): SezimalFraction(
-            '113_534_523_014_544 / 1',
-            _precalculated_value='113_534_523_014_544',
-            _precalculated_reciprocal='0.000_000_000_000_004_411_333_301_214_435_200_015_243_421_552_355_123_220_413_234_353_454_420_512_144_255_052_331_034_145_440_220_555_454_545_420',
-        ),
-    SezimalInteger('20'): SezimalFraction(
-            '2_043_221_010_301_344 / 1',
-            _precalculated_value='2_043_221_010_301_344',
-            _precalculated_reciprocal='0.000_000_000_000_000_245_320_541_201_024_422_223_313_550_110_511_042_423_400_535_510_552_134_515_344_014_414_243_035_455_213_350_033_325_521_435',
-        ),
-    SezimalInteger('21'): SezimalFraction(
-            '33_133_534_145_024_144 / 1',
-            _precalculated_value='33_133_534_145_024_144',
-            _precalculated_reciprocal='0.000_000_000_000_000_014_053_410_044_524_023_501_315_444_115_253_040_135_100_032_215_255_343_253_321_334_401_013_524_441_045_433_002_054_104_551',
-        ),
-    SezimalInteger('22'): SezimalFraction(
-            '552_403_211_002_430_544 / 1',
-            _precalculated_value='552_403_211_002_430_544',
-            _precalculated_reciprocal='0.000_000_000_000_000_001_003_211_451_405_112_441_204_440_231_052_040_005_530_002_012_203_321_314_320_054_400_034_331_402_302_550_522_341_004_033',
-        ),
-    SezimalInteger('23'): SezimalFraction(
-            '13_502_453_354_043_313_344 / 1',
-            _precalculated_value='13_502_453_354_043_313_344',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_033_534_214_211_415_402_311_402_235_303_113_334_105_222_334_233_542_315_504_452_133_335_505_322_352_410_405_021_145_113',
-        ),
-    SezimalInteger('24'): SezimalFraction(
-            '242_244_120_325_135_240_144 / 1',
-            _precalculated_value='242_244_120_325_135_240_144',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_002_105_501_011_545_545_015_322_351_052_415_432_115_201_243_235_443_504_441_403_120_543_330_320_133_134_134_034_532_531',
-        ),
-    SezimalInteger('25'): SezimalFraction(
-            '4_320_350_125_444_430_242_544 / 1',
-            _precalculated_value='4_320_350_125_444_430_242_544',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_115_214_523_110_332_523_320_133_040_512_213_115_533_425_051_102_441_402_322_420_032_431_504_454_305_454_335_520_521',
-        ),
-    SezimalInteger('30'): SezimalFraction(
-            '113_330_222_253_555_304_325_344 / 1',
-            _precalculated_value='113_330_222_253_555_304_325_344',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_004_423_253_530_354_253_542_232_040_030_500_531_105_435_151_530_140_100_131_250_002_024_215_141_015_214_354_442_254',
-        ),
-    SezimalInteger('31'): SezimalFraction(
-            '2_035_504_000_523_551_113_452_144 / 1',
-            _precalculated_value='2_035_504_000_523_551_113_452_144',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_250_203_220_355_503_221_235_340_001_514_520_415_213_310_443_010_003_343_051_445_001_345_532_301_045_511_025_015',
-        ),
-    SezimalInteger('32'): SezimalFraction(
-            '33_034_304_013_023_440_042_054_544 / 1',
-            _precalculated_value='33_034_304_013_023_440_042_054_544',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_014_122_423_355_552_423_424_432_222_331_031_134_423_204_140_145_222_432_414_214_033_432_554_241_151_441_524_035',
-        ),
-    SezimalInteger('33'): SezimalFraction(
-            '551_013_104_230_421_441_113_341_344 / 1',
-            _precalculated_value='551_013_104_230_421_441_113_341_344',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_001_005_023_544_444_250_212_513_123_505_301_532_135_045_121_121_423_513_134_345_450_550_522_124_533_102_331_340',
-        ),
-    SezimalInteger('34'): SezimalFraction(
-            '13_434_231_512_111_145_500_040_104_144 / 1',
-            _precalculated_value='13_434_231_512_111_145_500_040_104_144',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_034_035_110_251_351_500_515_420_215_203_443_121_040_304_531_212_442_043_244_103_033_031_231_405_415_020_432',
-        ),
-    SezimalInteger('35'): SezimalFraction(
-            '241_412_130_414_001_014_201_041_510_544 / 1',
-            _precalculated_value='241_412_130_414_001_014_201_041_510_544',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_002_113_304_125_321_552_253_323_345_533_551_304_524_504_031_534_251_225_051_341_302_035_313_100_323_301_140',
-        ),
-    SezimalInteger('40'): SezimalFraction(
-            '4_305_014_311_044_014_251_215_110_353_344 / 1',
-            _precalculated_value='4_305_014_311_044_014_251_215_110_353_344',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_115_430_231_431_222_014_320_210_332_110_430_254_030_224_221_014_201_414_210_052_335_542_041_131_314_532',
-        ),
-    SezimalInteger('41'): SezimalFraction(
-            '113_122_253_155_144_252_441_503_550_320_144 / 1',
-            _precalculated_value='113_122_253_155_144_252_441_503_550_320_144',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_004_435_235_324_201_223_242_234_132_004_135_241_001_501_350_034_344_545_500_340_505_555_002_305_315_521',
-        ),
-    SezimalInteger('42'): SezimalFraction(
-            '2_032_200_513_144_552_503_510_303_425_322_544 / 1',
-            _precalculated_value='2_032_200_513_144_552_503_510_303_425_322_544',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_251_051_054_011_201_313_502_120_445_121_051_144_552_321_451_021_410_330_021_141_444_411_241_431_105',
-        ),
-    SezimalInteger('43'): SezimalFraction(
-            '32_535_212_433_001_504_302_345_101_251_405_344 / 1',
-            _precalculated_value='32_535_212_433_001_504_302_345_101_251_405_344',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_014_151_525_445_311_204_330_120_025_153_414_155_144_242_325_301_211_505_223_421_214_023_051_213_042',
-        ),
-    SezimalInteger('44'): SezimalFraction(
-            '545_225_423_350_030_313_042_203_422_444_532_144 / 1',
-            _precalculated_value='545_225_423_350_030_313_042_203_422_444_532_144',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_001_010_442_551_430_422_505_231_112_533_212_122_155_125_020_314_534_215_201_323_423_223_525_312_040',
-        ),
-    SezimalInteger('45'): SezimalFraction(
-            '13_410_053_220_220_505_231_115_301_204_001_134_544 / 1',
-            _precalculated_value='13_410_053_220_220_505_231_115_301_204_001_134_544',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_034_140_144_213_023_515_201_530_520_534_231_233_305_150_015_521_012_200_053_550_201_331_430_451',
-        ),
-    SezimalInteger('50'): SezimalFraction(
-            '240_541_313_523_532_330_120_111_021_304_020_421_344 / 1',
-            _precalculated_value='240_541_313_523_532_330_120_111_021_304_020_421_344',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_002_121_121_345_412_442_200_105_253_405_501_535_430_310_334_442_300_500_003_221_500_054_213_030',
-        ),
-    SezimalInteger('51'): SezimalFraction(
-            '4_253_303_243_023_141_502_121_554_343_104_331_144_144 / 1',
-            _precalculated_value='4_253_303_243_023_141_502_121_554_343_104_331_144_144',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_120_042_321_434_251_233_341_425_434_103_443_324_130_354_402_352_252_222_423_441_114_345_413',
-        ),
-    SezimalInteger('52'): SezimalFraction(
-            '112_515_054_330_412_510_234_151_534_131_513_520_550_544 / 1',
-            _precalculated_value='112_515_054_330_412_510_234_151_534_131_513_520_550_544',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_004_451_242_324_351_535_432_324_102_115_102_431_343_022_133_510_503_123_512_440_042_132_550',
-        ),
-    SezimalInteger('53'): SezimalFraction(
-            '2_024_503_333_511_024_344_211_051_210_330_442_533_433_344 / 1',
-            _precalculated_value='2_024_503_333_511_024_344_211_051_210_330_442_533_433_344',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_251_540_131_355_332_213_131_341_231_041_250_432_412_343_215_252_420_215_402_225_005_411',
-        ),
-    SezimalInteger('54'): SezimalFraction(
-            '32_440_300_002_354_434_151_355_241_345_511_525_201_400_144 / 1',
-            _precalculated_value='32_440_300_002_354_434_151_355_241_345_511_525_201_400_144',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_014_221_120_433_320_500_531_543_424_151_203_024_245_355_045_540_512_234_433_501_411_434',
-        ),
-    SezimalInteger('55'): SezimalFraction(
-            '543_445_000_042_335_411_044_350_304_214_411_045_224_402_544 / 1',
-            _precalculated_value='543_445_000_042_335_411_044_350_304_214_411_045_224_402_544',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_001_012_304_513_204_514_520_443_550_233_045_035_125_211_040_332_253_124_402_103_434_213',
-        ),
-    SezimalInteger('100'): SezimalFraction(
-            '13_342_002_001_122_032_555_154_225_111_454_555_210_034_445_344 / 1',
-            _precalculated_value='13_342_002_001_122_032_555_154_225_111_454_555_210_034_445_344',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_034_241_404_311_404_404_513_555_235_414_035_531_423_040_020_503_154_022_341_324_350',
-        ),
-    SezimalInteger('101'): SezimalFraction(
-            '240_112_032_020_152_545_545_132_044_010_141_545_341_020_012_144 / 1',
-            _precalculated_value='240_112_032_020_152_545_545_132_044_010_141_545_341_020_012_144',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_002_124_545_130_434_022_515_444_424_434_335_554_212_413_334_515_044_335_021_205_133',
-        ),
-    SezimalInteger('102'): SezimalFraction(
-            '4_242_012_532_323_105_415_404_333_144_142_511_412_054_320_214_544 / 1',
-            _precalculated_value='4_242_012_532_323_105_415_404_333_144_142_511_412_054_320_214_544',
-            _precalculated_reciprocal='0.000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_000_120_255_154_135_450_142_214_024_024_354_444_345_400_543_253_302_505_523_422_532',
-        ),
-}
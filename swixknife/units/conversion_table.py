@@ -0,0 +1,1628 @@
+#
+# DO NOT EDIT THIS FILE DIRECTLY!
+#
+# It’s automatically generated by the script:
+#       calculate_conversion.py
+#
+# If you need to change anything, change it there first,
+# then re-run the script to recreate this file.
+#
+# Each conversion factor is stored as a pair of plain integers,
+# (numerator, denominator); conversion.py only turns a factor into
+# a SezimalFraction the first time it’s used
+#
+
+UNIT_CONVERSION_TABLE = {
+    'xad': {
+        's': (431389886054400, 293),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': (879, 8918),
+        'min': (7189831434240, 293),
+        'h': (119830523904, 293),
+        'day': (4992938496, 293),
+        'week': (713276928, 293),
+        'month': (126804787200, 226489),
+        'year': (10567065600, 226489),
+        'decade': (1056706560, 226489),
+        'century': (105670656, 226489),
+        'millenium': (52835328, 1132445),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'nrd': {
+        's': (71898314342400, 293),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': (2637, 4459),
+        'min': (1198305239040, 293),
+        'h': (19971753984, 293),
+        'day': (832156416, 293),
+        'week': (118879488, 293),
+        'month': (21134131200, 226489),
+        'year': (1761177600, 226489),
+        'decade': (176117760, 226489),
+        'century': (17611776, 226489),
+        'millenium': (8805888, 1132445),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'srd': {
+        's': (11983052390400, 293),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': (15822, 4459),
+        'min': (199717539840, 293),
+        'h': (3328625664, 293),
+        'day': (138692736, 293),
+        'week': (19813248, 293),
+        'month': (3522355200, 226489),
+        'year': (293529600, 226489),
+        'decade': (29352960, 226489),
+        'century': (2935296, 226489),
+        'millenium': (1467648, 1132445),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'ard': {
+        's': (1997175398400, 293),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': (94932, 4459),
+        'min': (33286256640, 293),
+        'h': (554770944, 293),
+        'day': (23115456, 293),
+        'week': (3302208, 293),
+        'month': (587059200, 226489),
+        'year': (48921600, 226489),
+        'decade': (4892160, 226489),
+        'century': (489216, 226489),
+        'millenium': (244608, 1132445),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'nif': {
+        's': (332862566400, 293),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': (569592, 4459),
+        'min': (5547709440, 293),
+        'h': (92461824, 293),
+        'day': (3852576, 293),
+        'week': (550368, 293),
+        'month': (97843200, 226489),
+        'year': (8153600, 226489),
+        'decade': (815360, 226489),
+        'century': (81536, 226489),
+        'millenium': (40768, 1132445),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'sez': {
+        's': (55477094400, 293),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': (3417552, 4459),
+        'min': (924618240, 293),
+        'h': (15410304, 293),
+        'day': (642096, 293),
+        'week': (91728, 293),
+        'month': (16307200, 226489),
+        'year': (4076800, 679467),
+        'decade': (407680, 679467),
+        'century': (40768, 679467),
+        'millenium': (20384, 3397335),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'vrx': {
+        's': (9246182400, 293),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': (20505312, 4459),
+        'min': (154103040, 293),
+        'h': (2568384, 293),
+        'day': (107016, 293),
+        'week': (15288, 293),
+        'month': (8153600, 679467),
+        'year': (2038400, 2038401),
+        'decade': (203840, 2038401),
+        'century': (20384, 2038401),
+        'millenium': (10192, 10192005),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'mas': {
+        's': (770515200, 293),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': (246063744, 4459),
+        'min': (12841920, 293),
+        'h': (214032, 293),
+        'day': (8918, 293),
+        'week': (1274, 293),
+        'month': (2038400, 2038401),
+        'year': (509600, 6115203),
+        'decade': (50960, 6115203),
+        'century': (5096, 6115203),
+        'millenium': (2548, 30576015),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'spt': {
+        's': (604800, 1),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': (1679616, 7),
+        'min': (10080, 1),
+        'h': (168, 1),
+        'day': (7, 1),
+        'week': (1, 1),
+        'month': (1600, 6957),
+        'year': (400, 20871),
+        'decade': (40, 20871),
+        'century': (4, 20871),
+        'millenium': (2, 104355),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'din': {
+        's': (86400, 1),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': 100000000,
+        'min': (1440, 1),
+        'h': (24, 1),
+        'day': (1, 1),
+        'week': (1, 7),
+        'month': (1600, 48699),
+        'year': (400, 146097),
+        'decade': (40, 146097),
+        'century': (4, 146097),
+        'millenium': (2, 730485),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'uta': {
+        's': (2400, 1),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': 10000000000,
+        'min': (40, 1),
+        'h': (2, 3),
+        'day': (1, 36),
+        'week': (1, 252),
+        'month': (400, 438291),
+        'year': (100, 1314873),
+        'decade': (10, 1314873),
+        'century': (1, 1314873),
+        'millenium': (1, 13148730),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'pox': {
+        's': (200, 3),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': 1000000000000,
+        'min': (10, 9),
+        'h': (1, 54),
+        'day': (1, 1296),
+        'week': (1, 9072),
+        'month': (100, 3944619),
+        'year': (25, 11833857),
+        'decade': (5, 23667714),
+        'century': (1, 47335428),
+        'millenium': (1, 473354280),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'agm': {
+        's': (50, 27),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': 100000000000000,
+        'min': (5, 162),
+        'h': (1, 1944),
+        'day': (1, 46656),
+        'week': (1, 326592),
+        'month': (25, 35501571),
+        'year': (25, 426018852),
+        'decade': (5, 852037704),
+        'century': (1, 1704075408),
+        'millenium': (1, 17040754080),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'ang': {
+        's': (25, 486),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': 10000000000000000,
+        'min': (5, 5832),
+        'h': (1, 69984),
+        'day': (1, 1679616),
+        'week': (1, 11757312),
+        'month': (25, 1278056556),
+        'year': (25, 15336678672),
+        'decade': (5, 30673357344),
+        'century': (1, 61346714688),
+        'millenium': (1, 613467146880),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'bod': {
+        's': (25, 17496),
+        'prefixed': ('s', 'min', 'h', 'day', 'week', 'month', 'year'),
+        'comparable': ('ang', 'vrx', 'mas', 'spt', 'din', 'uta', 'pox', 'agm', 'bod'),
+        'ang': 1000000000000000000,
+        'min': (5, 209952),
+        'h': (1, 2519424),
+        'day': (1, 60466176),
+        'week': (1, 423263232),
+        'month': (25, 46010036016),
+        'year': (25, 552120432192),
+        'decade': (5, 1104240864384),
+        'century': (1, 2208481728768),
+        'millenium': (1, 22084817287680),
+        'non_prefixed': ('prefixed', 'comparable', 'ang', 'decade', 'century', 'millenium'),
+    },
+    'avt': {
+        'Hz': (486, 25),
+        'Bq': (486, 25),
+        's-1': (486, 25),
+        'prefixed': ('Hz', 's-1', 'Bq'),
+        'comparable': ('avt', 'ang-1'),
+        'avt': (1, 1),
+        'brx': (1, 1),
+        'rpm': (5832, 5),
+        'non_prefixed': ('prefixed', 'comparable', 'avt', 'brx', 'rpm'),
+    },
+    'brx': {
+        'Hz': (486, 25),
+        'Bq': (486, 25),
+        's-1': (486, 25),
+        'prefixed': ('Hz', 's-1', 'Bq'),
+        'comparable': ('avt', 'ang-1'),
+        'avt': (1, 1),
+        'brx': (1, 1),
+        'rpm': (5832, 5),
+        'non_prefixed': ('prefixed', 'comparable', 'avt', 'brx', 'rpm'),
+    },
+    'pad': {
+        'm': (3747405725, 144545641776),
+        'prefixed': ('m', 'au', 'parsec'),
+        'comparable': ('pad', 'vrp'),
+        'pad': (1, 1),
+        'twip': (187370286250000, 127481225733),
+        'mil': (1171064289062500, 1147331031597),
+        'in': (2342128578125, 2294662063194),
+        'li': (58553214453125, 454343088512412),
+        'ft': (2342128578125, 27535944758328),
+        'yd': (2342128578125, 82607834274984),
+        'ftm': (2342128578125, 165215668549968),
+        'rd': (2342128578125, 454343088512412),
+        'ch': (2342128578125, 1817372354049648),
+        'fur': (468425715625, 3634744708099296),
+        'cb': (468425715625, 3965176045199232),
+        'ml': (468425715625, 29077957664794368),
+        'le': (468425715625, 87233872994383104),
+        'nmi': (3747405725, 267698528569152),
+        'NM': (3747405725, 267698528569152),
+        'au': (2053373, 11848613823920310336),
+        'parsec': (2053373, 2443954330390922811455040),
+        'ly': (293339, 107045585740035343014912),
+        'sly': (2, 729826822654446931),
+        'px_72_dpi': (9368514312500, 127481225733),
+        'px_96_dpi': (37474057250000, 382443677199),
+        'px_150_dpi': (58553214453125, 382443677199),
+        'px_300_dpi': (117106428906250, 382443677199),
+        'non_prefixed': ('prefixed', 'comparable', 'pad', 'twip', 'mil', 'in', 'li', 'ft', 'yd', 'ftm', 'rd', 'ch', 'fur', 'cb', 'ml', 'le', 'nmi', 'NM', 'ly', 'sly', 'px_72_dpi', 'px_96_dpi', 'px_150_dpi', 'px_300_dpi'),
+    },
+    'vrp': {
+        'm': (3747405725, 144545641776),
+        'prefixed': ('m', 'au', 'parsec'),
+        'comparable': ('pad', 'vrp'),
+        'pad': (1, 1),
+        'twip': (187370286250000, 127481225733),
+        'mil': (1171064289062500, 1147331031597),
+        'in': (2342128578125, 2294662063194),
+        'li': (58553214453125, 454343088512412),
+        'ft': (2342128578125, 27535944758328),
+        'yd': (2342128578125, 82607834274984),
+        'ftm': (2342128578125, 165215668549968),
+        'rd': (2342128578125, 454343088512412),
+        'ch': (2342128578125, 1817372354049648),
+        'fur': (468425715625, 3634744708099296),
+        'cb': (468425715625, 3965176045199232),
+        'ml': (468425715625, 29077957664794368),
+        'le': (468425715625, 87233872994383104),
+        'nmi': (3747405725, 267698528569152),
+        'NM': (3747405725, 267698528569152),
+        'au': (2053373, 11848613823920310336),
+        'parsec': (2053373, 2443954330390922811455040),
+        'ly': (293339, 107045585740035343014912),
+        'sly': (2, 729826822654446931),
+        'px_72_dpi': (9368514312500, 127481225733),
+        'px_96_dpi': (37474057250000, 382443677199),
+        'px_150_dpi': (58553214453125, 382443677199),
+        'px_300_dpi': (117106428906250, 382443677199),
+        'non_prefixed': ('prefixed', 'comparable', 'pad', 'twip', 'mil', 'in', 'li', 'ft', 'yd', 'ftm', 'rd', 'ch', 'fur', 'cb', 'ml', 'le', 'nmi', 'NM', 'ly', 'sly', 'px_72_dpi', 'px_96_dpi', 'px_150_dpi', 'px_300_dpi'),
+    },
+    'trg': {
+        'm-1': (144545641776, 3747405725),
+        'prefixed': ('m-1',),
+        'comparable': ('trg', 'pad-1'),
+        'trg': (1, 1),
+        'non_prefixed': ('prefixed', 'comparable', 'trg'),
+    },
+    'pad-1': {
+        'm-1': (144545641776, 3747405725),
+        'prefixed': ('m-1',),
+        'comparable': ('trg', 'pad-1'),
+        'trg': (1, 1),
+        'non_prefixed': ('prefixed', 'comparable', 'trg'),
+    },
+    'ktr': {
+        'm2': (14043049667762775625, 20893442556435716434176),
+        'a': (561721986710511025, 83573770225742865736704),
+        'prefixed': ('m2', 'a'),
+        'comparable': ('ktr', 'pad2'),
+        'ktr': (1, 1),
+        'in2': (5485566276469834228515625, 5265473984261744849481636),
+        'li2': (3428478922793646392822265625, 206427642078997445079078057744),
+        'ft2': (5485566276469834228515625, 758228253733691258325355584),
+        'yd2': (5485566276469834228515625, 6824054283603221324928200256),
+        'ftm2': (5485566276469834228515625, 27296217134412885299712801024),
+        'rd2': (5485566276469834228515625, 206427642078997445079078057744),
+        'ch2': (5485566276469834228515625, 3302842273263959121265248923904),
+        'fur2': (219422651058793369140625, 13211369093055836485060995695616),
+        'cb2': (219422651058793369140625, 15722621069421821932634573389824),
+        'ml2': (219422651058793369140625, 845527621955573535043903724519424),
+        'nmi2': (14043049667762775625, 71662502198089089540445999104),
+        'NM2': (14043049667762775625, 71662502198089089540445999104),
+        'le2': (219422651058793369140625, 7609748597600161815395133520674816),
+        'ac': (1097113255293966845703125, 6605684546527918242530497847808),
+        'non_prefixed': ('prefixed', 'comparable', 'ktr', 'in2', 'li2', 'ft2', 'yd2', 'ftm2', 'rd2', 'ch2', 'fur2', 'cb2', 'ml2', 'nmi2', 'NM2', 'le2', 'ac'),
+    },
+    'pad2': {
+        'm2': (14043049667762775625, 20893442556435716434176),
+        'a': (561721986710511025, 83573770225742865736704),
+        'prefixed': ('m2', 'a'),
+        'comparable': ('ktr', 'pad2'),
+        'ktr': (1, 1),
+        'in2': (5485566276469834228515625, 5265473984261744849481636),
+        'li2': (3428478922793646392822265625, 206427642078997445079078057744),
+        'ft2': (5485566276469834228515625, 758228253733691258325355584),
+        'yd2': (5485566276469834228515625, 6824054283603221324928200256),
+        'ftm2': (5485566276469834228515625, 27296217134412885299712801024),
+        'rd2': (5485566276469834228515625, 206427642078997445079078057744),
+        'ch2': (5485566276469834228515625, 3302842273263959121265248923904),
+        'fur2': (219422651058793369140625, 13211369093055836485060995695616),
+        'cb2': (219422651058793369140625, 15722621069421821932634573389824),
+        'ml2': (219422651058793369140625, 845527621955573535043903724519424),
+        'nmi2': (14043049667762775625, 71662502198089089540445999104),
+        'NM2': (14043049667762775625, 71662502198089089540445999104),
+        'le2': (219422651058793369140625, 7609748597600161815395133520674816),
+        'ac': (1097113255293966845703125, 6605684546527918242530497847808),
+        'non_prefixed': ('prefixed', 'comparable', 'ktr', 'in2', 'li2', 'ft2', 'yd2', 'ftm2', 'rd2', 'ch2', 'fur2', 'cb2', 'ml2', 'nmi2', 'NM2', 'le2', 'ac'),
+    },
+    'ayt': {
+        'm3': (52625004721433573319015453125, 3020056063229990731066320179736576),
+        'L': (6578125590179196664876931640625, 377507007903748841383290022467072),
+        'l': (6578125590179196664876931640625, 377507007903748841383290022467072),
+        'prefixed': ('m3', 'L', 'l'),
+        'comparable': ('ayt', 'pad3'),
+        'in3': (12847901543318743486087757110595703125, 12082483396420386921237933845174505384),
+        'ft3': (12847901543318743486087757110595703125, 20878531309014428599899149684461545303552),
+        'yd3': (12847901543318743486087757110595703125, 563720345343389572197277041480461723195904),
+        'ml3': (102783212346549947888702056884765625, 24586216395638424226843057920753485531504581804032),
+        'ac⋅ft': (2569580308663748697217551422119140625, 181893764764133701962321392051028982684545024),
+        'US min': (4698661135842283332054951171875000000000, 16613414670078032016702159037114944903),
+        'US fl dr': (234933056792114166602747558593750000000, 49840244010234096050106477111344834709),
+        'US tsp': (58733264198028541650686889648437500000, 16613414670078032016702159037114944903),
+        'US tbsp': (58733264198028541650686889648437500000, 49840244010234096050106477111344834709),
+        'US fl oz': (29366632099014270825343444824218750000, 49840244010234096050106477111344834709),
+        'US jig': (58733264198028541650686889648437500000, 149520732030702288150319431334034504127),
+        'US gi': (7341658024753567706335861206054687500, 49840244010234096050106477111344834709),
+        'US c': (3670829012376783853167930603027343750, 49840244010234096050106477111344834709),
+        'US cup': (3670829012376783853167930603027343750, 49840244010234096050106477111344834709),
+        'US pt': (1835414506188391926583965301513671875, 49840244010234096050106477111344834709),
+        'US pint': (1835414506188391926583965301513671875, 49840244010234096050106477111344834709),
+        'US qt': (1835414506188391926583965301513671875, 99680488020468192100212954222689669418),
+        'US pot': (1835414506188391926583965301513671875, 199360976040936384200425908445379338836),
+        'US gal': (1835414506188391926583965301513671875, 398721952081872768400851816890758677672),
+        'US bbl': (262202072312627418083423614501953125, 1794248784368427457803833176008414049524),
+        'US bbl oil': (262202072312627418083423614501953125, 2392331712491236610405110901344552066032),
+        'US hogshead': (262202072312627418083423614501953125, 3588497568736854915607666352016828099048),
+        'US pt dry': (5139160617327497394435102844238281250000, 162390087158314552769802985620875999174133),
+        'US qt dry': (2569580308663748697217551422119140625000, 162390087158314552769802985620875999174133),
+        'US gal dry': (642395077165937174304387855529785156250, 162390087158314552769802985620875999174133),
+        'US pk': (321197538582968587152193927764892578125, 162390087158314552769802985620875999174133),
+        'US pk dry': (321197538582968587152193927764892578125, 162390087158314552769802985620875999174133),
+        'US bu': (321197538582968587152193927764892578125, 649560348633258211079211942483503996696532),
+        'US bu dry': (321197538582968587152193927764892578125, 649560348633258211079211942483503996696532),
+        'US bbl dry': (262202072312627418083423614501953125, 1739877609084535716658262473705128775296),
+        'imp min': (32890627950895983324384658203125000000, 111730523018304268901312561083159593),
+        'imp fl s': (1644531397544799166219232910156250000, 111730523018304268901312561083159593),
+        'imp fl dr': (1644531397544799166219232910156250000, 335191569054912806703937683249478779),
+        'imp fl oz': (205566424693099895777404113769531250, 335191569054912806703937683249478779),
+        'imp gi': (41113284938619979155480822753906250, 335191569054912806703937683249478779),
+        'imp pt': (20556642469309989577740411376953125, 670383138109825613407875366498957558),
+        'imp qt': (20556642469309989577740411376953125, 1340766276219651226815750732997915116),
+        'imp gal': (20556642469309989577740411376953125, 5363065104878604907263002931991660464),
+        'non_prefixed': ('prefixed', 'comparable', 'in3', 'ft3', 'yd3', 'ml3', 'ac⋅ft', 'US min', 'US fl dr', 'US tsp', 'US tbsp', 'US fl oz', 'US jig', 'US gi', 'US c', 'US cup', 'US pt', 'US pint', 'US qt', 'US pot', 'US gal', 'US bbl', 'US bbl oil', 'US hogshead', 'US pt dry', 'US qt dry', 'US gal dry', 'US pk', 'US pk dry', 'US bu', 'US bu dry', 'US bbl dry', 'imp min', 'imp fl s', 'imp fl dr', 'imp fl oz', 'imp gi', 'imp pt', 'imp qt', 'imp gal'),
+    },
+    'pad3': {
+        'm3': (52625004721433573319015453125, 3020056063229990731066320179736576),
+        'L': (6578125590179196664876931640625, 377507007903748841383290022467072),
+        'l': (6578125590179196664876931640625, 377507007903748841383290022467072),
+        'prefixed': ('m3', 'L', 'l'),
+        'comparable': ('ayt', 'pad3'),
+        'in3': (12847901543318743486087757110595703125, 12082483396420386921237933845174505384),
+        'ft3': (12847901543318743486087757110595703125, 20878531309014428599899149684461545303552),
+        'yd3': (12847901543318743486087757110595703125, 563720345343389572197277041480461723195904),
+        'ml3': (102783212346549947888702056884765625, 24586216395638424226843057920753485531504581804032),
+        'ac⋅ft': (2569580308663748697217551422119140625, 181893764764133701962321392051028982684545024),
+        'US min': (4698661135842283332054951171875000000000, 16613414670078032016702159037114944903),
+        'US fl dr': (234933056792114166602747558593750000000, 49840244010234096050106477111344834709),
+        'US tsp': (58733264198028541650686889648437500000, 16613414670078032016702159037114944903),
+        'US tbsp': (58733264198028541650686889648437500000, 49840244010234096050106477111344834709),
+        'US fl oz': (29366632099014270825343444824218750000, 49840244010234096050106477111344834709),
+        'US jig': (58733264198028541650686889648437500000, 149520732030702288150319431334034504127),
+        'US gi': (7341658024753567706335861206054687500, 49840244010234096050106477111344834709),
+        'US c': (3670829012376783853167930603027343750, 49840244010234096050106477111344834709),
+        'US cup': (3670829012376783853167930603027343750, 49840244010234096050106477111344834709),
+        'US pt': (1835414506188391926583965301513671875, 49840244010234096050106477111344834709),
+        'US pint': (1835414506188391926583965301513671875, 49840244010234096050106477111344834709),
+        'US qt': (1835414506188391926583965301513671875, 99680488020468192100212954222689669418),
+        'US pot': (1835414506188391926583965301513671875, 199360976040936384200425908445379338836),
+        'US gal': (1835414506188391926583965301513671875, 398721952081872768400851816890758677672),
+        'US bbl': (262202072312627418083423614501953125, 1794248784368427457803833176008414049524),
+        'US bbl oil': (262202072312627418083423614501953125, 2392331712491236610405110901344552066032),
+        'US hogshead': (262202072312627418083423614501953125, 3588497568736854915607666352016828099048),
+        'US pt dry': (5139160617327497394435102844238281250000, 162390087158314552769802985620875999174133),
+        'US qt dry': (2569580308663748697217551422119140625000, 162390087158314552769802985620875999174133),
+        'US gal dry': (642395077165937174304387855529785156250, 162390087158314552769802985620875999174133),
+        'US pk': (321197538582968587152193927764892578125, 162390087158314552769802985620875999174133),
+        'US pk dry': (321197538582968587152193927764892578125, 162390087158314552769802985620875999174133),
+        'US bu': (321197538582968587152193927764892578125, 649560348633258211079211942483503996696532),
+        'US bu dry': (321197538582968587152193927764892578125, 649560348633258211079211942483503996696532),
+        'US bbl dry': (262202072312627418083423614501953125, 1739877609084535716658262473705128775296),
+        'imp min': (32890627950895983324384658203125000000, 111730523018304268901312561083159593),
+        'imp fl s': (1644531397544799166219232910156250000, 111730523018304268901312561083159593),
+        'imp fl dr': (1644531397544799166219232910156250000, 335191569054912806703937683249478779),
+        'imp fl oz': (205566424693099895777404113769531250, 335191569054912806703937683249478779),
+        'imp gi': (41113284938619979155480822753906250, 335191569054912806703937683249478779),
+        'imp pt': (20556642469309989577740411376953125, 670383138109825613407875366498957558),
+        'imp qt': (20556642469309989577740411376953125, 1340766276219651226815750732997915116),
+        'imp gal': (20556642469309989577740411376953125, 5363065104878604907263002931991660464),
+        'non_prefixed': ('prefixed', 'comparable', 'in3', 'ft3', 'yd3', 'ml3', 'ac⋅ft', 'US min', 'US fl dr', 'US tsp', 'US tbsp', 'US fl oz', 'US jig', 'US gi', 'US c', 'US cup', 'US pt', 'US pint', 'US qt', 'US pot', 'US gal', 'US bbl', 'US bbl oil', 'US hogshead', 'US pt dry', 'US qt dry', 'US gal dry', 'US pk', 'US pk dry', 'US bu', 'US bu dry', 'US bbl dry', 'imp min', 'imp fl s', 'imp fl dr', 'imp fl oz', 'imp gi', 'imp pt', 'imp qt', 'imp gal'),
+    },
+    'veg': {
+        'm/s': (149896229, 297419016),
+        'm/h': (22484434350, 12392459),
+        'prefixed': ('m/s', 'm/h'),
+        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
+        'km/h': (449688687, 247849180),
+        'ml/s': (18737028625, 59831188610688),
+        'ml/h': (468425715625, 415494365352),
+        'mph': (468425715625, 415494365352),
+        'kn': (11242217175, 11475417034),
+        'c': (1, 594838032),
+        'ft/s': (93685143125, 56658322548),
+        'fps': (93685143125, 56658322548),
+        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
+    },
+    'pad/ang': {
+        'm/s': (149896229, 297419016),
+        'm/h': (22484434350, 12392459),
+        'prefixed': ('m/s', 'm/h'),
+        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
+        'km/h': (449688687, 247849180),
+        'ml/s': (18737028625, 59831188610688),
+        'ml/h': (468425715625, 415494365352),
+        'mph': (468425715625, 415494365352),
+        'kn': (11242217175, 11475417034),
+        'c': (1, 594838032),
+        'ft/s': (93685143125, 56658322548),
+        'fps': (93685143125, 56658322548),
+        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
+    },
+    'XDpad/din': {
+        'm/s': (149896229, 297419016),
+        'm/h': (22484434350, 12392459),
+        'prefixed': ('m/s', 'm/h'),
+        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
+        'km/h': (449688687, 247849180),
+        'ml/s': (18737028625, 59831188610688),
+        'ml/h': (468425715625, 415494365352),
+        'mph': (468425715625, 415494365352),
+        'kn': (11242217175, 11475417034),
+        'c': (1, 594838032),
+        'ft/s': (93685143125, 56658322548),
+        'fps': (93685143125, 56658322548),
+        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
+    },
+    'Xpad/uta': {
+        'm/s': (149896229, 297419016),
+        'm/h': (22484434350, 12392459),
+        'prefixed': ('m/s', 'm/h'),
+        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
+        'km/h': (449688687, 247849180),
+        'ml/s': (18737028625, 59831188610688),
+        'ml/h': (468425715625, 415494365352),
+        'mph': (468425715625, 415494365352),
+        'kn': (11242217175, 11475417034),
+        'c': (1, 594838032),
+        'ft/s': (93685143125, 56658322548),
+        'fps': (93685143125, 56658322548),
+        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
+    },
+    'Cpad/pox': {
+        'm/s': (149896229, 297419016),
+        'm/h': (22484434350, 12392459),
+        'prefixed': ('m/s', 'm/h'),
+        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
+        'km/h': (449688687, 247849180),
+        'ml/s': (18737028625, 59831188610688),
+        'ml/h': (468425715625, 415494365352),
+        'mph': (468425715625, 415494365352),
+        'kn': (11242217175, 11475417034),
+        'c': (1, 594838032),
+        'ft/s': (93685143125, 56658322548),
+        'fps': (93685143125, 56658322548),
+        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
+    },
+    'Dpad/agm': {
+        'm/s': (149896229, 297419016),
+        'm/h': (22484434350, 12392459),
+        'prefixed': ('m/s', 'm/h'),
+        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
+        'km/h': (449688687, 247849180),
+        'ml/s': (18737028625, 59831188610688),
+        'ml/h': (468425715625, 415494365352),
+        'mph': (468425715625, 415494365352),
+        'kn': (11242217175, 11475417034),
+        'c': (1, 594838032),
+        'ft/s': (93685143125, 56658322548),
+        'fps': (93685143125, 56658322548),
+        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
+    },
+    'dpad/bod': {
+        'm/s': (149896229, 297419016),
+        'm/h': (22484434350, 12392459),
+        'prefixed': ('m/s', 'm/h'),
+        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
+        'km/h': (449688687, 247849180),
+        'ml/s': (18737028625, 59831188610688),
+        'ml/h': (468425715625, 415494365352),
+        'mph': (468425715625, 415494365352),
+        'kn': (11242217175, 11475417034),
+        'c': (1, 594838032),
+        'ft/s': (93685143125, 56658322548),
+        'fps': (93685143125, 56658322548),
+        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
+    },
+    'XDpad/XDang': {
+        'm/s': (149896229, 297419016),
+        'm/h': (22484434350, 12392459),
+        'prefixed': ('m/s', 'm/h'),
+        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
+        'km/h': (449688687, 247849180),
+        'ml/s': (18737028625, 59831188610688),
+        'ml/h': (468425715625, 415494365352),
+        'mph': (468425715625, 415494365352),
+        'kn': (11242217175, 11475417034),
+        'c': (1, 594838032),
+        'ft/s': (93685143125, 56658322548),
+        'fps': (93685143125, 56658322548),
+        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
+    },
+    'Xpad/Xang': {
+        'm/s': (149896229, 297419016),
+        'm/h': (22484434350, 12392459),
+        'prefixed': ('m/s', 'm/h'),
+        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
+        'km/h': (449688687, 247849180),
+        'ml/s': (18737028625, 59831188610688),
+        'ml/h': (468425715625, 415494365352),
+        'mph': (468425715625, 415494365352),
+        'kn': (11242217175, 11475417034),
+        'c': (1, 594838032),
+        'ft/s': (93685143125, 56658322548),
+        'fps': (93685143125, 56658322548),
+        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
+    },
+    'Cpad/Cang': {
+        'm/s': (149896229, 297419016),
+        'm/h': (22484434350, 12392459),
+        'prefixed': ('m/s', 'm/h'),
+        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
+        'km/h': (449688687, 247849180),
+        'ml/s': (18737028625, 59831188610688),
+        'ml/h': (468425715625, 415494365352),
+        'mph': (468425715625, 415494365352),
+        'kn': (11242217175, 11475417034),
+        'c': (1, 594838032),
+        'ft/s': (93685143125, 56658322548),
+        'fps': (93685143125, 56658322548),
+        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
+    },
+    'Dpad/Dang': {
+        'm/s': (149896229, 297419016),
+        'm/h': (22484434350, 12392459),
+        'prefixed': ('m/s', 'm/h'),
+        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
+        'km/h': (449688687, 247849180),
+        'ml/s': (18737028625, 59831188610688),
+        'ml/h': (468425715625, 415494365352),
+        'mph': (468425715625, 415494365352),
+        'kn': (11242217175, 11475417034),
+        'c': (1, 594838032),
+        'ft/s': (93685143125, 56658322548),
+        'fps': (93685143125, 56658322548),
+        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
+    },
+    'dpad/dang': {
+        'm/s': (149896229, 297419016),
+        'm/h': (22484434350, 12392459),
+        'prefixed': ('m/s', 'm/h'),
+        'comparable': ('veg', 'pad/ang', 'XDpad/day', 'Xpad/uta', 'Cpad/pox', 'Dpad/agm', 'dpad/bod', 'XDpad/XDang', 'Xpad/Xang', 'Cpad/Cang', 'Dpad/Dang', 'dpad/dang'),
+        'km/h': (449688687, 247849180),
+        'ml/s': (18737028625, 59831188610688),
+        'ml/h': (468425715625, 415494365352),
+        'mph': (468425715625, 415494365352),
+        'kn': (11242217175, 11475417034),
+        'c': (1, 594838032),
+        'ft/s': (93685143125, 56658322548),
+        'fps': (93685143125, 56658322548),
+        'non_prefixed': ('prefixed', 'comparable', 'km/h', 'ml/s', 'ml/h', 'mph', 'kn', 'c', 'ft/s', 'fps'),
+    },
+    'tvr': {
+        'm/s2': (12141594549, 1239245900),
+        'N/kg': (12141594549, 1239245900),
+        'prefixed': ('m/s2', 'gal', 'Gal', 'g', 'N/kg'),
+        'gal': (12141594549, 12392459),
+        'Gal': (12141594549, 12392459),
+        'cm/s2': (12141594549, 12392459),
+        'ft/s2': (101179954575, 3147684586),
+        'g': (346902701400, 347224308721),
+        'g0': (346902701400, 347224308721),
+        'non_prefixed': ('prefixed', 'cm/s2', 'ft/s2', 'g0'),
+    },
+    'grt': {
+        'm/s2': (12141594549, 1239245900),
+        'N/kg': (12141594549, 1239245900),
+        'prefixed': ('m/s2', 'gal', 'Gal', 'g', 'N/kg'),
+        'gal': (12141594549, 12392459),
+        'Gal': (12141594549, 12392459),
+        'cm/s2': (12141594549, 12392459),
+        'ft/s2': (101179954575, 3147684586),
+        'g': (346902701400, 347224308721),
+        'g0': (346902701400, 347224308721),
+        'non_prefixed': ('prefixed', 'cm/s2', 'ft/s2', 'g0'),
+    },
+    'pad/ang2': {
+        'm/s2': (12141594549, 1239245900),
+        'N/kg': (12141594549, 1239245900),
+        'prefixed': ('m/s2', 'gal', 'Gal', 'g', 'N/kg'),
+        'gal': (12141594549, 12392459),
+        'Gal': (12141594549, 12392459),
+        'cm/s2': (12141594549, 12392459),
+        'ft/s2': (101179954575, 3147684586),
+        'g': (346902701400, 347224308721),
+        'g0': (346902701400, 347224308721),
+        'non_prefixed': ('prefixed', 'cm/s2', 'ft/s2', 'g0'),
+    },
+    'drv': {
+        'g': (1050613122968860353906646746576044417461, 60401121264599814621326403594731520000),
+        'prefixed': ('g', 'Da', 'ton', 't'),
+        'kg': (1050613122968860353906646746576044417461, 60401121264599814621326403594731520000000),
+        't': (1050613122968860353906646746576044417461, 60401121264599814621326403594731520000000000),
+        'ton': (1050613122968860353906646746576044417461, 60401121264599814621326403594731520000000000),
+        'Da': (32062168059352427792561241045411511763336181640625000000000000000000, 3060864919029439543404475941059525040798003),
+        'dul': (10465987481763400851825236, 1),
+        'eV/c2': (80155420148381069481403102613528779408340454101562500000000000000000000, 8214933685585352597389053312597579447),
+        'gr': (59693927441412520108332201510002523719375, 222382205722948271230909869724925240832),
+        'dwt': (59693927441412520108332201510002523719375, 5337172937350758509541836873398205779968),
+        'ozt': (11938785488282504021666440302000504743875, 21348691749403034038167347493592823119872),
+        'lbt': (11938785488282504021666440302000504743875, 256184300992836408458008169923113877438464),
+        'dr': (68221631361614308695236801725717169965, 6949443928842133475965933428903913776),
+        'oz': (68221631361614308695236801725717169965, 111191102861474135615454934862462620416),
+        'lb': (68221631361614308695236801725717169965, 1779057645783586169847278957799401926656),
+        'st': (9745947337373472670748114532245309995, 3558115291567172339694557915598803853312),
+        'sl': (1050613122968860353906646746576044417461, 881487923623443234602175401421152329728000),
+        'imp qr': (9745947337373472670748114532245309995, 7116230583134344679389115831197607706624),
+        'imp cwt': (9745947337373472670748114532245309995, 28464922332537378717556463324790430826496),
+        'imp ton': (1949189467474694534149622906449061999, 113859689330149514870225853299161723305984),
+        'US qr': (13644326272322861739047360345143433993, 8895288228917930849236394788997009633280),
+        'US cwt': (13644326272322861739047360345143433993, 35581152915671723396945579155988038533120),
+        'US ton': (13644326272322861739047360345143433993, 711623058313434467938911583119760770662400),
+        'non_prefixed': ('prefixed', 'kg', 'dul', 'eV/c2', 'gr', 'dwt', 'ozt', 'lbt', 'dr', 'oz', 'lb', 'st', 'sl', 'imp qr', 'imp cwt', 'imp ton', 'US qr', 'US cwt', 'US ton'),
+    },
+    'dul': {
+        'g': (1050613122968860353906646746576044417461, 632157379039774815726317770001489597747933537481425380638720000),
+        'prefixed': ('g', 'Da'),
+        'Da': (8015542014838106948140310261352877940834045410156250000000000000000, 8008743481482714954556664370575722473613179253324411603967133450927),
+        'drv': (1, 10465987481763400851825236),
+        'non_prefixed': ('prefixed', 'drv'),
+    },
+    'gnt': {
+        'g/m3': (311939735365049, 312500000),
+        'g/L': (311939735365049, 312500000000),
+        'g/l': (311939735365049, 312500000000),
+        'kg/m3': (311939735365049, 312500000000),
+        'kg/L': (311939735365049, 312500000000000),
+        'kg/l': (311939735365049, 312500000000000),
+        'kg/dm3': (311939735365049, 312500000000000),
+        'g/cm3': (311939735365049, 312500000000000),
+        'g/mL': (311939735365049, 312500000000000),
+        'g/ml': (311939735365049, 312500000000000),
+        'ton/m3': (311939735365049, 312500000000000),
+        'Mg/m3': (311939735365049, 312500000000000),
+        'prefixed': ('g/m3', 'g/L', 'g/l'),
+        'oz/in3': (58088368267842287797, 100673022460937500000),
+        'lb/in3': (58088368267842287797, 1610768359375000000000),
+        'lb/ft3': (1568385943231741770519, 25168255615234375000),
+        'lb/yd3': (42346420467257027804013, 25168255615234375000),
+        'sl/ft3': (17252245375549159475709, 8907409667968750000000),
+        'lb/gal': (1916916152838795497301, 230109765625000000000),
+        'lb/bu': (6245719444526670626221237, 80538417968750000000000),
+        'non_prefixed': ('kg/m3', 'kg/L', 'kg/l', 'kg/dm3', 'g/cm3', 'g/mL', 'g/ml', 'ton/m3', 'Mg/m3', 'prefixed', 'oz/in3', 'lb/in3', 'lb/ft3', 'lb/yd3', 'sl/ft3', 'lb/gal', 'lb/bu'),
+    },
+    'drv/ayt': {
+        'g/m3': (311939735365049, 312500000),
+        'g/L': (311939735365049, 312500000000),
+        'g/l': (311939735365049, 312500000000),
+        'kg/m3': (311939735365049, 312500000000),
+        'kg/L': (311939735365049, 312500000000000),
+        'kg/l': (311939735365049, 312500000000000),
+        'kg/dm3': (311939735365049, 312500000000000),
+        'g/cm3': (311939735365049, 312500000000000),
+        'g/mL': (311939735365049, 312500000000000),
+        'g/ml': (311939735365049, 312500000000000),
+        'ton/m3': (311939735365049, 312500000000000),
+        'Mg/m3': (311939735365049, 312500000000000),
+        'prefixed': ('g/m3', 'g/L', 'g/l'),
+        'oz/in3': (58088368267842287797, 100673022460937500000),
+        'lb/in3': (58088368267842287797, 1610768359375000000000),
+        'lb/ft3': (1568385943231741770519, 25168255615234375000),
+        'lb/yd3': (42346420467257027804013, 25168255615234375000),
+        'sl/ft3': (17252245375549159475709, 8907409667968750000000),
+        'lb/gal': (1916916152838795497301, 230109765625000000000),
+        'lb/bu': (6245719444526670626221237, 80538417968750000000000),
+        'non_prefixed': ('kg/m3', 'kg/L', 'kg/l', 'kg/dm3', 'g/cm3', 'g/mL', 'g/ml', 'ton/m3', 'Mg/m3', 'prefixed', 'oz/in3', 'lb/in3', 'lb/ft3', 'lb/yd3', 'sl/ft3', 'lb/gal', 'lb/bu'),
+    },
+    'drv/pad3': {
+        'g/m3': (311939735365049, 312500000),
+        'g/L': (311939735365049, 312500000000),
+        'g/l': (311939735365049, 312500000000),
+        'kg/m3': (311939735365049, 312500000000),
+        'kg/L': (311939735365049, 312500000000000),
+        'kg/l': (311939735365049, 312500000000000),
+        'kg/dm3': (311939735365049, 312500000000000),
+        'g/cm3': (311939735365049, 312500000000000),
+        'g/mL': (311939735365049, 312500000000000),
+        'g/ml': (311939735365049, 312500000000000),
+        'ton/m3': (311939735365049, 312500000000000),
+        'Mg/m3': (311939735365049, 312500000000000),
+        'prefixed': ('g/m3', 'g/L', 'g/l'),
+        'oz/in3': (58088368267842287797, 100673022460937500000),
+        'lb/in3': (58088368267842287797, 1610768359375000000000),
+        'lb/ft3': (1568385943231741770519, 25168255615234375000),
+        'lb/yd3': (42346420467257027804013, 25168255615234375000),
+        'sl/ft3': (17252245375549159475709, 8907409667968750000000),
+        'lb/gal': (1916916152838795497301, 230109765625000000000),
+        'lb/bu': (6245719444526670626221237, 80538417968750000000000),
+        'non_prefixed': ('kg/m3', 'kg/L', 'kg/l', 'kg/dm3', 'g/cm3', 'g/mL', 'g/ml', 'ton/m3', 'Mg/m3', 'prefixed', 'oz/in3', 'lb/in3', 'lb/ft3', 'lb/yd3', 'sl/ft3', 'lb/gal', 'lb/bu'),
+    },
+    'bal': {
+        'N': (157482945270945451478211765346867719913905654569, 924096813364915251978256768105139478528000000000),
+        'kg·m/s2': (157482945270945451478211765346867719913905654569, 924096813364915251978256768105139478528000000000),
+        'g·m/s2': (157482945270945451478211765346867719913905654569, 924096813364915251978256768105139478528000000),
+        'prefixed': ('N', 'gf', 'g·m/s2'),
+        'bar': (1, 1),
+        'bal': (1, 1),
+        'gf': (22497563610135064496887395049552531416272236367, 1294613430683578022258938819276895152443801600),
+        'lbf': (627422092712930085570564802178755856230699819, 16376843726453028095558666444359281838473216000),
+        'dyn': (157482945270945451478211765346867719913905654569, 9240968133649152519782567681051394785280000),
+        'pdl': (255654131933353005646447671017642402457639049625, 207404160342164521430779924055826737946436804608),
+        'lb·ft/s2': (255654131933353005646447671017642402457639049625, 207404160342164521430779924055826737946436804608),
+        'non_prefixed': ('kg·m/s2', 'prefixed', 'bar', 'bal', 'lbf', 'dyn', 'pdl', 'lb·ft/s2'),
+    },
+    'bar': {
+        'N': (157482945270945451478211765346867719913905654569, 924096813364915251978256768105139478528000000000),
+        'kg·m/s2': (157482945270945451478211765346867719913905654569, 924096813364915251978256768105139478528000000000),
+        'g·m/s2': (157482945270945451478211765346867719913905654569, 924096813364915251978256768105139478528000000),
+        'prefixed': ('N', 'gf', 'g·m/s2'),
+        'bar': (1, 1),
+        'bal': (1, 1),
+        'gf': (22497563610135064496887395049552531416272236367, 1294613430683578022258938819276895152443801600),
+        'lbf': (627422092712930085570564802178755856230699819, 16376843726453028095558666444359281838473216000),
+        'dyn': (157482945270945451478211765346867719913905654569, 9240968133649152519782567681051394785280000),
+        'pdl': (255654131933353005646447671017642402457639049625, 207404160342164521430779924055826737946436804608),
+        'lb·ft/s2': (255654131933353005646447671017642402457639049625, 207404160342164521430779924055826737946436804608),
+        'non_prefixed': ('kg·m/s2', 'prefixed', 'bar', 'bal', 'lbf', 'dyn', 'pdl', 'lb·ft/s2'),
+    },
+    'drv·tvr': {
+        'N': (157482945270945451478211765346867719913905654569, 924096813364915251978256768105139478528000000000),
+        'kg·m/s2': (157482945270945451478211765346867719913905654569, 924096813364915251978256768105139478528000000000),
+        'g·m/s2': (157482945270945451478211765346867719913905654569, 924096813364915251978256768105139478528000000),
+        'prefixed': ('N', 'gf', 'g·m/s2'),
+        'bar': (1, 1),
+        'bal': (1, 1),
+        'gf': (22497563610135064496887395049552531416272236367, 1294613430683578022258938819276895152443801600),
+        'lbf': (627422092712930085570564802178755856230699819, 16376843726453028095558666444359281838473216000),
+        'dyn': (157482945270945451478211765346867719913905654569, 9240968133649152519782567681051394785280000),
+        'pdl': (255654131933353005646447671017642402457639049625, 207404160342164521430779924055826737946436804608),
+        'lb·ft/s2': (255654131933353005646447671017642402457639049625, 207404160342164521430779924055826737946436804608),
+        'non_prefixed': ('kg·m/s2', 'prefixed', 'bar', 'bal', 'lbf', 'dyn', 'pdl', 'lb·ft/s2'),
+    },
+    'drv·pad/ang2': {
+        'N': (157482945270945451478211765346867719913905654569, 924096813364915251978256768105139478528000000000),
+        'kg·m/s2': (157482945270945451478211765346867719913905654569, 924096813364915251978256768105139478528000000000),
+        'g·m/s2': (157482945270945451478211765346867719913905654569, 924096813364915251978256768105139478528000000),
+        'prefixed': ('N', 'gf', 'g·m/s2'),
+        'bar': (1, 1),
+        'bal': (1, 1),
+        'gf': (22497563610135064496887395049552531416272236367, 1294613430683578022258938819276895152443801600),
+        'lbf': (627422092712930085570564802178755856230699819, 16376843726453028095558666444359281838473216000),
+        'dyn': (157482945270945451478211765346867719913905654569, 9240968133649152519782567681051394785280000),
+        'pdl': (255654131933353005646447671017642402457639049625, 207404160342164521430779924055826737946436804608),
+        'lb·ft/s2': (255654131933353005646447671017642402457639049625, 207404160342164521430779924055826737946436804608),
+        'non_prefixed': ('kg·m/s2', 'prefixed', 'bar', 'bal', 'lbf', 'dyn', 'pdl', 'lb·ft/s2'),
+    },
+    'pdn': {
+        'Pa': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'J/m3': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'kg/m/s2': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
+        'atm': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'vay': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'psi': (7008936315328255215190548566609, 27220211376453069038829580318189977600),
+        'bar': (7008936315328255215190548566609, 394795804644791238310930759680000000000),
+        'mmHg': (1001276616475465030741506938087, 75192808952646939248699872488652800),
+        'inHg': (143039516639352147248786705441, 272843380590015224796684248014848000),
+        'Torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
+    },
+    'pbl': {
+        'Pa': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'J/m3': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'kg/m/s2': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
+        'atm': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'vay': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'psi': (7008936315328255215190548566609, 27220211376453069038829580318189977600),
+        'bar': (7008936315328255215190548566609, 394795804644791238310930759680000000000),
+        'mmHg': (1001276616475465030741506938087, 75192808952646939248699872488652800),
+        'inHg': (143039516639352147248786705441, 272843380590015224796684248014848000),
+        'Torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
+    },
+    'drv/pad/ang2': {
+        'Pa': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'J/m3': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'kg/m/s2': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
+        'atm': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'vay': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'psi': (7008936315328255215190548566609, 27220211376453069038829580318189977600),
+        'bar': (7008936315328255215190548566609, 394795804644791238310930759680000000000),
+        'mmHg': (1001276616475465030741506938087, 75192808952646939248699872488652800),
+        'inHg': (143039516639352147248786705441, 272843380590015224796684248014848000),
+        'Torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
+    },
+    'vrc/ayt': {
+        'Pa': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'J/m3': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'kg/m/s2': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
+        'atm': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'vay': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'psi': (7008936315328255215190548566609, 27220211376453069038829580318189977600),
+        'bar': (7008936315328255215190548566609, 394795804644791238310930759680000000000),
+        'mmHg': (1001276616475465030741506938087, 75192808952646939248699872488652800),
+        'inHg': (143039516639352147248786705441, 272843380590015224796684248014848000),
+        'Torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
+    },
+    'uxn/ayt': {
+        'Pa': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'J/m3': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'kg/m/s2': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
+        'atm': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'vay': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'psi': (7008936315328255215190548566609, 27220211376453069038829580318189977600),
+        'bar': (7008936315328255215190548566609, 394795804644791238310930759680000000000),
+        'mmHg': (1001276616475465030741506938087, 75192808952646939248699872488652800),
+        'inHg': (143039516639352147248786705441, 272843380590015224796684248014848000),
+        'Torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
+    },
+    'xrm/ayt': {
+        'Pa': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'J/m3': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'kg/m/s2': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
+        'atm': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'vay': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'psi': (7008936315328255215190548566609, 27220211376453069038829580318189977600),
+        'bar': (7008936315328255215190548566609, 394795804644791238310930759680000000000),
+        'mmHg': (1001276616475465030741506938087, 75192808952646939248699872488652800),
+        'inHg': (143039516639352147248786705441, 272843380590015224796684248014848000),
+        'Torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
+    },
+    'xky/ayt': {
+        'Pa': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'J/m3': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'kg/m/s2': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
+        'atm': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'vay': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'psi': (7008936315328255215190548566609, 27220211376453069038829580318189977600),
+        'bar': (7008936315328255215190548566609, 394795804644791238310930759680000000000),
+        'mmHg': (1001276616475465030741506938087, 75192808952646939248699872488652800),
+        'inHg': (143039516639352147248786705441, 272843380590015224796684248014848000),
+        'Torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
+    },
+    'vrc/pad3': {
+        'Pa': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'J/m3': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'kg/m/s2': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
+        'atm': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'vay': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'psi': (7008936315328255215190548566609, 27220211376453069038829580318189977600),
+        'bar': (7008936315328255215190548566609, 394795804644791238310930759680000000000),
+        'mmHg': (1001276616475465030741506938087, 75192808952646939248699872488652800),
+        'inHg': (143039516639352147248786705441, 272843380590015224796684248014848000),
+        'Torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
+    },
+    'uxn/pad3': {
+        'Pa': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'J/m3': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'kg/m/s2': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
+        'atm': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'vay': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'psi': (7008936315328255215190548566609, 27220211376453069038829580318189977600),
+        'bar': (7008936315328255215190548566609, 394795804644791238310930759680000000000),
+        'mmHg': (1001276616475465030741506938087, 75192808952646939248699872488652800),
+        'inHg': (143039516639352147248786705441, 272843380590015224796684248014848000),
+        'Torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
+    },
+    'xrm/pad3': {
+        'Pa': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'J/m3': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'kg/m/s2': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
+        'atm': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'vay': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'psi': (7008936315328255215190548566609, 27220211376453069038829580318189977600),
+        'bar': (7008936315328255215190548566609, 394795804644791238310930759680000000000),
+        'mmHg': (1001276616475465030741506938087, 75192808952646939248699872488652800),
+        'inHg': (143039516639352147248786705441, 272843380590015224796684248014848000),
+        'Torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
+    },
+    'xky/pad3': {
+        'Pa': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'J/m3': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'kg/m/s2': (7008936315328255215190548566609, 3947958046447912383109307596800000),
+        'prefixed': ('Pa', 'J/m3', 'psi', 'bar', 'Torr', 'torr'),
+        'atm': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'vay': (1001276616475465030741506938087, 57146692722333531745507227463680000000),
+        'psi': (7008936315328255215190548566609, 27220211376453069038829580318189977600),
+        'bar': (7008936315328255215190548566609, 394795804644791238310930759680000000000),
+        'mmHg': (1001276616475465030741506938087, 75192808952646939248699872488652800),
+        'inHg': (143039516639352147248786705441, 272843380590015224796684248014848000),
+        'Torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'torr': (19024255713033835584088631823653, 1428667318058338293637680686592000000),
+        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'vay', 'mmHg', 'inHg'),
+    },
+    'vay': {
+        'Pa': (101325, 1),
+        'J/m3': (101325, 1),
+        'kg/m/s2': (101325, 1),
+        'prefixed': ('Pa', 'J/m3', 'psi', 'bar'),
+        'atm': (1, 1),
+        'pdn': (57146692722333531745507227463680000000, 1001276616475465030741506938087),
+        'pbl': (57146692722333531745507227463680000000, 1001276616475465030741506938087),
+        'psi': (101325000, 6894757),
+        'bar': (4053, 4000),
+        'mmHg': (7237500, 9523),
+        'inHg': (1447500, 48377),
+        'non_prefixed': ('kg/m/s2', 'prefixed', 'atm', 'pdn', 'pbl', 'mmHg', 'inHg'),
+    },
+    'vrc': {
+        'J': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'N·m': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'Pa·m3': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'C·V': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'prefixed': ('J', 'Wh', 'W·h', 'BTU', 'cal', 'erg', 'eV', 'TNT', 'N·m', 'Pa·m3', 'C·V'),
+        'vrc': (1, 1),
+        'uxn': (1, 1),
+        'xrm': (1, 1),
+        'xky': (1, 1),
+        'Wh': (23606099627928106441286419288928348176922662281669720301, 19234680040942296361782894452660111044966617377144832000000000),
+        'W·h': (23606099627928106441286419288928348176922662281669720301, 19234680040942296361782894452660111044966617377144832000000000),
+        'ft⋅lbf': (23606099627928106441286419288928348176922662281669720301, 7244090395486195102399933441949090676879041455290486620160),
+        'ftlbf': (23606099627928106441286419288928348176922662281669720301, 7244090395486195102399933441949090676879041455290486620160),
+        'BTU': (1532863612203123794888728525255087543956017031277254565, 366047289871379346973332894842763017417228240553406364123136),
+        'cal': (23606099627928106441286419288928348176922662281669720301, 22354972580917379993805452886091640170038979751659438080000),
+        'erg': (23606099627928106441286419288928348176922662281669720301, 534296667803952676716191512573891973471294927142912),
+        'eV': (22512530925682169381414813317230556656763708383245201397895812988281250, 816381108073762008167684451022154730163437463751893983),
+        'TNT': (23606099627928106441286419288928348176922662281669720301, 22354972580917379993805452886091640170038979751659438080000000000000),
+        'non_prefixed': ('prefixed', 'vrc', 'uxn', 'xrm', 'xky', 'ft⋅lbf', 'ftlbf'),
+    },
+    'uxn': {
+        'J': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'N·m': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'Pa·m3': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'C·V': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'prefixed': ('J', 'Wh', 'W·h', 'BTU', 'cal', 'erg', 'eV', 'TNT', 'N·m', 'Pa·m3', 'C·V'),
+        'vrc': (1, 1),
+        'uxn': (1, 1),
+        'xrm': (1, 1),
+        'xky': (1, 1),
+        'Wh': (23606099627928106441286419288928348176922662281669720301, 19234680040942296361782894452660111044966617377144832000000000),
+        'W·h': (23606099627928106441286419288928348176922662281669720301, 19234680040942296361782894452660111044966617377144832000000000),
+        'ft⋅lbf': (23606099627928106441286419288928348176922662281669720301, 7244090395486195102399933441949090676879041455290486620160),
+        'ftlbf': (23606099627928106441286419288928348176922662281669720301, 7244090395486195102399933441949090676879041455290486620160),
+        'BTU': (1532863612203123794888728525255087543956017031277254565, 366047289871379346973332894842763017417228240553406364123136),
+        'cal': (23606099627928106441286419288928348176922662281669720301, 22354972580917379993805452886091640170038979751659438080000),
+        'erg': (23606099627928106441286419288928348176922662281669720301, 534296667803952676716191512573891973471294927142912),
+        'eV': (22512530925682169381414813317230556656763708383245201397895812988281250, 816381108073762008167684451022154730163437463751893983),
+        'TNT': (23606099627928106441286419288928348176922662281669720301, 22354972580917379993805452886091640170038979751659438080000000000000),
+        'non_prefixed': ('prefixed', 'vrc', 'uxn', 'xrm', 'xky', 'ft⋅lbf', 'ftlbf'),
+    },
+    'xrm': {
+        'J': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'N·m': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'Pa·m3': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'C·V': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'prefixed': ('J', 'Wh', 'W·h', 'BTU', 'cal', 'erg', 'eV', 'TNT', 'N·m', 'Pa·m3', 'C·V'),
+        'vrc': (1, 1),
+        'uxn': (1, 1),
+        'xrm': (1, 1),
+        'xky': (1, 1),
+        'Wh': (23606099627928106441286419288928348176922662281669720301, 19234680040942296361782894452660111044966617377144832000000000),
+        'W·h': (23606099627928106441286419288928348176922662281669720301, 19234680040942296361782894452660111044966617377144832000000000),
+        'ft⋅lbf': (23606099627928106441286419288928348176922662281669720301, 7244090395486195102399933441949090676879041455290486620160),
+        'ftlbf': (23606099627928106441286419288928348176922662281669720301, 7244090395486195102399933441949090676879041455290486620160),
+        'BTU': (1532863612203123794888728525255087543956017031277254565, 366047289871379346973332894842763017417228240553406364123136),
+        'cal': (23606099627928106441286419288928348176922662281669720301, 22354972580917379993805452886091640170038979751659438080000),
+        'erg': (23606099627928106441286419288928348176922662281669720301, 534296667803952676716191512573891973471294927142912),
+        'eV': (22512530925682169381414813317230556656763708383245201397895812988281250, 816381108073762008167684451022154730163437463751893983),
+        'TNT': (23606099627928106441286419288928348176922662281669720301, 22354972580917379993805452886091640170038979751659438080000000000000),
+        'non_prefixed': ('prefixed', 'vrc', 'uxn', 'xrm', 'xky', 'ft⋅lbf', 'ftlbf'),
+    },
+    'xky': {
+        'J': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'N·m': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'Pa·m3': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'C·V': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'prefixed': ('J', 'Wh', 'W·h', 'BTU', 'cal', 'erg', 'eV', 'TNT', 'N·m', 'Pa·m3', 'C·V'),
+        'vrc': (1, 1),
+        'uxn': (1, 1),
+        'xrm': (1, 1),
+        'xky': (1, 1),
+        'Wh': (23606099627928106441286419288928348176922662281669720301, 19234680040942296361782894452660111044966617377144832000000000),
+        'W·h': (23606099627928106441286419288928348176922662281669720301, 19234680040942296361782894452660111044966617377144832000000000),
+        'ft⋅lbf': (23606099627928106441286419288928348176922662281669720301, 7244090395486195102399933441949090676879041455290486620160),
+        'ftlbf': (23606099627928106441286419288928348176922662281669720301, 7244090395486195102399933441949090676879041455290486620160),
+        'BTU': (1532863612203123794888728525255087543956017031277254565, 366047289871379346973332894842763017417228240553406364123136),
+        'cal': (23606099627928106441286419288928348176922662281669720301, 22354972580917379993805452886091640170038979751659438080000),
+        'erg': (23606099627928106441286419288928348176922662281669720301, 534296667803952676716191512573891973471294927142912),
+        'eV': (22512530925682169381414813317230556656763708383245201397895812988281250, 816381108073762008167684451022154730163437463751893983),
+        'TNT': (23606099627928106441286419288928348176922662281669720301, 22354972580917379993805452886091640170038979751659438080000000000000),
+        'non_prefixed': ('prefixed', 'vrc', 'uxn', 'xrm', 'xky', 'ft⋅lbf', 'ftlbf'),
+    },
+    'drv·pad2/ang2': {
+        'J': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'N·m': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'Pa·m3': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'C·V': (23606099627928106441286419288928348176922662281669720301, 5342966678039526767161915125738919734712949271429120000000),
+        'prefixed': ('J', 'Wh', 'W·h', 'BTU', 'cal', 'erg', 'eV', 'TNT', 'N·m', 'Pa·m3', 'C·V'),
+        'vrc': (1, 1),
+        'uxn': (1, 1),
+        'xrm': (1, 1),
+        'xky': (1, 1),
+        'Wh': (23606099627928106441286419288928348176922662281669720301, 19234680040942296361782894452660111044966617377144832000000000),
+        'W·h': (23606099627928106441286419288928348176922662281669720301, 19234680040942296361782894452660111044966617377144832000000000),
+        'ft⋅lbf': (23606099627928106441286419288928348176922662281669720301, 7244090395486195102399933441949090676879041455290486620160),
+        'ftlbf': (23606099627928106441286419288928348176922662281669720301, 7244090395486195102399933441949090676879041455290486620160),
+        'BTU': (1532863612203123794888728525255087543956017031277254565, 366047289871379346973332894842763017417228240553406364123136),
+        'cal': (23606099627928106441286419288928348176922662281669720301, 22354972580917379993805452886091640170038979751659438080000),
+        'erg': (23606099627928106441286419288928348176922662281669720301, 534296667803952676716191512573891973471294927142912),
+        'eV': (22512530925682169381414813317230556656763708383245201397895812988281250, 816381108073762008167684451022154730163437463751893983),
+        'TNT': (23606099627928106441286419288928348176922662281669720301, 22354972580917379993805452886091640170038979751659438080000000000000),
+        'non_prefixed': ('prefixed', 'vrc', 'uxn', 'xrm', 'xky', 'ft⋅lbf', 'ftlbf'),
+    },
+    'xkt': {
+        'W': (23606099627928106441286419288928348176922662281669720301, 274843964919728743166765181365170768246550888448000000000),
+        'J/s': (23606099627928106441286419288928348176922662281669720301, 274843964919728743166765181365170768246550888448000000000),
+        'N·m/s': (23606099627928106441286419288928348176922662281669720301, 274843964919728743166765181365170768246550888448000000000),
+        'kg·m2/s3': (23606099627928106441286419288928348176922662281669720301, 274843964919728743166765181365170768246550888448000000000),
+        'prefixed': ('W', 'J/s', 'N·m/s'),
+        'cv': (3372299946846872348755202755561192596703237468809960043, 28878198949072048705460976062515199083125410037841920000000),
+        'ft⋅lbf/s': (23606099627928106441286419288928348176922662281669720301, 372638394829536785102877234668163100662502132473790464000),
+        'ft⋅lbf/min': (23606099627928106441286419288928348176922662281669720301, 6210639913825613085047953911136051677708368874563174400),
+        'ft⋅lbf/h': (23606099627928106441286419288928348176922662281669720301, 103510665230426884750799231852267527961806147909386240),
+        'hp': (2146009057084373312844219935357122561538423843788156391, 18631919741476839255143861733408155033125106623689523200000),
+        'BTU/h': (1532863612203123794888728525255087543956017031277254565, 5230442527883221121589690426994213211837394841012322304),
+        'cal/s': (23606099627928106441286419288928348176922662281669720301, 1149947149224145061409745518831874494343568917266432000000),
+        'kcal/h': (23606099627928106441286419288928348176922662281669720301, 319429763673373628169373755231076248428769143685120000000),
+        'non_prefixed': ('kg·m2/s3', 'prefixed', 'cv', 'ft⋅lbf/s', 'ft⋅lbf/min', 'ft⋅lbf/h', 'hp', 'BTU/h', 'cal/s', 'kcal/h'),
+    },
+    'drv·pad2/ang3': {
+        'W': (23606099627928106441286419288928348176922662281669720301, 274843964919728743166765181365170768246550888448000000000),
+        'J/s': (23606099627928106441286419288928348176922662281669720301, 274843964919728743166765181365170768246550888448000000000),
+        'N·m/s': (23606099627928106441286419288928348176922662281669720301, 274843964919728743166765181365170768246550888448000000000),
+        'kg·m2/s3': (23606099627928106441286419288928348176922662281669720301, 274843964919728743166765181365170768246550888448000000000),
+        'prefixed': ('W', 'J/s', 'N·m/s'),
+        'cv': (3372299946846872348755202755561192596703237468809960043, 28878198949072048705460976062515199083125410037841920000000),
+        'ft⋅lbf/s': (23606099627928106441286419288928348176922662281669720301, 372638394829536785102877234668163100662502132473790464000),
+        'ft⋅lbf/min': (23606099627928106441286419288928348176922662281669720301, 6210639913825613085047953911136051677708368874563174400),
+        'ft⋅lbf/h': (23606099627928106441286419288928348176922662281669720301, 103510665230426884750799231852267527961806147909386240),
+        'hp': (2146009057084373312844219935357122561538423843788156391, 18631919741476839255143861733408155033125106623689523200000),
+        'BTU/h': (1532863612203123794888728525255087543956017031277254565, 5230442527883221121589690426994213211837394841012322304),
+        'cal/s': (23606099627928106441286419288928348176922662281669720301, 1149947149224145061409745518831874494343568917266432000000),
+        'kcal/h': (23606099627928106441286419288928348176922662281669720301, 319429763673373628169373755231076248428769143685120000000),
+        'non_prefixed': ('kg·m2/s3', 'prefixed', 'cv', 'ft⋅lbf/s', 'ft⋅lbf/min', 'ft⋅lbf/h', 'hp', 'BTU/h', 'cal/s', 'kcal/h'),
+    },
+    'svg': {
+        'g·m/s': (157482945270945451478211765346867719913905654569, 17964442051813952498457311571963911462584320000),
+        'gm/s': (157482945270945451478211765346867719913905654569, 17964442051813952498457311571963911462584320000),
+        'N·s': (157482945270945451478211765346867719913905654569, 17964442051813952498457311571963911462584320000000),
+        'prefixed': ('g·m/s', 'gm/s', 'N·s'),
+        'svg': (1, 1),
+        'jut': (1, 1),
+        'lb·ft/s': (6391353298333825141161191775441060061440976240625, 100798421926291957415359043091131794641968287039488),
+        'sl·ft/s': (787414726354727257391058826734338599569528272845, 399549016790590685443667906849528210300565384855552),
+        'non_prefixed': ('prefixed', 'svg', 'jut', 'lb·ft/s', 'sl·ft/s'),
+    },
+    'jut': {
+        'g·m/s': (157482945270945451478211765346867719913905654569, 17964442051813952498457311571963911462584320000),
+        'gm/s': (157482945270945451478211765346867719913905654569, 17964442051813952498457311571963911462584320000),
+        'N·s': (157482945270945451478211765346867719913905654569, 17964442051813952498457311571963911462584320000000),
+        'prefixed': ('g·m/s', 'gm/s', 'N·s'),
+        'svg': (1, 1),
+        'jut': (1, 1),
+        'lb·ft/s': (6391353298333825141161191775441060061440976240625, 100798421926291957415359043091131794641968287039488),
+        'sl·ft/s': (787414726354727257391058826734338599569528272845, 399549016790590685443667906849528210300565384855552),
+        'non_prefixed': ('prefixed', 'svg', 'jut', 'lb·ft/s', 'sl·ft/s'),
+    },
+    'drv·veg': {
+        'g·m/s': (157482945270945451478211765346867719913905654569, 17964442051813952498457311571963911462584320000),
+        'gm/s': (157482945270945451478211765346867719913905654569, 17964442051813952498457311571963911462584320000),
+        'N·s': (157482945270945451478211765346867719913905654569, 17964442051813952498457311571963911462584320000000),
+        'prefixed': ('g·m/s', 'gm/s', 'N·s'),
+        'svg': (1, 1),
+        'jut': (1, 1),
+        'lb·ft/s': (6391353298333825141161191775441060061440976240625, 100798421926291957415359043091131794641968287039488),
+        'sl·ft/s': (787414726354727257391058826734338599569528272845, 399549016790590685443667906849528210300565384855552),
+        'non_prefixed': ('prefixed', 'svg', 'jut', 'lb·ft/s', 'sl·ft/s'),
+    },
+    'drv·pad/ang': {
+        'g·m/s': (157482945270945451478211765346867719913905654569, 17964442051813952498457311571963911462584320000),
+        'gm/s': (157482945270945451478211765346867719913905654569, 17964442051813952498457311571963911462584320000),
+        'N·s': (157482945270945451478211765346867719913905654569, 17964442051813952498457311571963911462584320000000),
+        'prefixed': ('g·m/s', 'gm/s', 'N·s'),
+        'svg': (1, 1),
+        'jut': (1, 1),
+        'lb·ft/s': (6391353298333825141161191775441060061440976240625, 100798421926291957415359043091131794641968287039488),
+        'sl·ft/s': (787414726354727257391058826734338599569528272845, 399549016790590685443667906849528210300565384855552),
+        'non_prefixed': ('prefixed', 'svg', 'jut', 'lb·ft/s', 'sl·ft/s'),
+    },
+    'agh': {
+        'kg·m2/s': (23606099627928106441286419288928348176922662281669720301, 103867272221088400353627630044364599642819733836582092800000),
+        'J·s': (23606099627928106441286419288928348176922662281669720301, 103867272221088400353627630044364599642819733836582092800000),
+        'J/Hz': (23606099627928106441286419288928348176922662281669720301, 103867272221088400353627630044364599642819733836582092800000),
+        'prefixed': [],
+        'non_prefixed': ('kg·m2/s', 'J·s', 'J/Hz', 'prefixed'),
+    },
+    'svg·pad': {
+        'kg·m2/s': (23606099627928106441286419288928348176922662281669720301, 103867272221088400353627630044364599642819733836582092800000),
+        'J·s': (23606099627928106441286419288928348176922662281669720301, 103867272221088400353627630044364599642819733836582092800000),
+        'J/Hz': (23606099627928106441286419288928348176922662281669720301, 103867272221088400353627630044364599642819733836582092800000),
+        'prefixed': [],
+        'non_prefixed': ('kg·m2/s', 'J·s', 'J/Hz', 'prefixed'),
+    },
+    'drv·pad2/ang': {
+        'kg·m2/s': (23606099627928106441286419288928348176922662281669720301, 103867272221088400353627630044364599642819733836582092800000),
+        'J·s': (23606099627928106441286419288928348176922662281669720301, 103867272221088400353627630044364599642819733836582092800000),
+        'J/Hz': (23606099627928106441286419288928348176922662281669720301, 103867272221088400353627630044364599642819733836582092800000),
+        'prefixed': [],
+        'non_prefixed': ('kg·m2/s', 'J·s', 'J/Hz', 'prefixed'),
+    },
+    'pbv': {
+        'kg·m3/s2': (3538465315624726238659444160323220842919731900662826896604644929, 30892101898600246482189981758206955571001396703058150843796684800000),
+        'prefixed': [],
+        'non_prefixed': ('kg·m3/s2', 'prefixed'),
+    },
+    'bal·ktr': {
+        'kg·m3/s2': (3538465315624726238659444160323220842919731900662826896604644929, 30892101898600246482189981758206955571001396703058150843796684800000),
+        'prefixed': [],
+        'non_prefixed': ('kg·m3/s2', 'prefixed'),
+    },
+    'drv·ayt/ang2': {
+        'kg·m3/s2': (3538465315624726238659444160323220842919731900662826896604644929, 30892101898600246482189981758206955571001396703058150843796684800000),
+        'prefixed': [],
+        'non_prefixed': ('kg·m3/s2', 'prefixed'),
+    },
+    'drv·pad3/ang2': {
+        'kg·m3/s2': (3538465315624726238659444160323220842919731900662826896604644929, 30892101898600246482189981758206955571001396703058150843796684800000),
+        'prefixed': [],
+        'non_prefixed': ('kg·m3/s2', 'prefixed'),
+    },
+    'tnv': {
+        'kg/s2': (1050613122968860353906646746576044417461, 159827858178694322250711283200000000000),
+        'prefixed': [],
+        'non_prefixed': ('kg/s2', 'prefixed'),
+    },
+    'bal/pad': {
+        'kg/s2': (1050613122968860353906646746576044417461, 159827858178694322250711283200000000000),
+        'prefixed': [],
+        'non_prefixed': ('kg/s2', 'prefixed'),
+    },
+    'drv/ang2': {
+        'kg/s2': (1050613122968860353906646746576044417461, 159827858178694322250711283200000000000),
+        'prefixed': [],
+        'non_prefixed': ('kg/s2', 'prefixed'),
+    },
+    'upr': {
+        'kg/s3': (1050613122968860353906646746576044417461, 8221597642936950733061280000000000000),
+        'prefixed': [],
+        'non_prefixed': ('kg/s3', 'prefixed'),
+    },
+    'xkt/ktr': {
+        'kg/s3': (1050613122968860353906646746576044417461, 8221597642936950733061280000000000000),
+        'prefixed': [],
+        'non_prefixed': ('kg/s3', 'prefixed'),
+    },
+    'tnv/ang': {
+        'kg/s3': (1050613122968860353906646746576044417461, 8221597642936950733061280000000000000),
+        'prefixed': [],
+        'non_prefixed': ('kg/s3', 'prefixed'),
+    },
+    'drv/ang3': {
+        'kg/s3': (1050613122968860353906646746576044417461, 8221597642936950733061280000000000000),
+        'prefixed': [],
+        'non_prefixed': ('kg/s3', 'prefixed'),
+    },
+    'gtk': {
+        'K': (5463, 89987920),
+        'C': (5463, 89987920),
+        '°C': (5463, 89987920),
+        'prefixed': ('K',),
+        'F': (49167, 449939600),
+        '°F': (49167, 449939600),
+        'R': (49167, 449939600),
+        '°R': (49167, 449939600),
+        'adjust': {
+            'C': (-27315, 100),
+            '°C': (-27315, 100),
+            'F': (-45967, 100),
+            '°F': (-45967, 100),
+        },
+        'non_prefixed': ('C', '°C', 'prefixed', 'F', '°F', 'R', '°R', 'adjust'),
+    },
+    'tap': {
+        'C': (2655018, 5624245),
+        '°C': (2655018, 5624245),
+        'K': (2655018, 5624245),
+        'prefixed': ('K',),
+        'F': (23895162, 28121225),
+        '°F': (23895162, 28121225),
+        'R': (23895162, 28121225),
+        '°R': (23895162, 28121225),
+        'adjust': {
+            'K': (27315, 100),
+            'F': '52',
+            '°F': '52',
+            'R': (45967, 100),
+            '°R': (45967, 100),
+        },
+        'non_prefixed': ('C', '°C', 'prefixed', 'F', '°F', 'R', '°R', 'adjust'),
+    },
+    'agn': {
+        'J/K': (26553297560375302602374587450731763518463279744873903210859549, 364857837026624184112569279148896481384210523372716032000000),
+        'prefixed': ('J/K',),
+        'BTU/°R': (43106002533076789938919784822616499218284545040379713004642125, 1124840443819131772039866152545883079834553806455583169052639232),
+        'non_prefixed': ('prefixed', 'BTU/°R'),
+    },
+    'prv': {
+        'J/K': (26553297560375302602374587450731763518463279744873903210859549, 364857837026624184112569279148896481384210523372716032000000),
+        'prefixed': ('J/K',),
+        'BTU/°R': (43106002533076789938919784822616499218284545040379713004642125, 1124840443819131772039866152545883079834553806455583169052639232),
+        'non_prefixed': ('prefixed', 'BTU/°R'),
+    },
+    'vrc/gtk': {
+        'J/K': (26553297560375302602374587450731763518463279744873903210859549, 364857837026624184112569279148896481384210523372716032000000),
+        'prefixed': ('J/K',),
+        'BTU/°R': (43106002533076789938919784822616499218284545040379713004642125, 1124840443819131772039866152545883079834553806455583169052639232),
+        'non_prefixed': ('prefixed', 'BTU/°R'),
+    },
+    'kdn': {
+        'J/kg': (2376391477017850203238932602638973023159378505243292644353536781801146706434180, 9355651512556107738078905561742972744442826849829503259341048840736333234595253),
+        'J/g': (9505565908071400812955730410555892092637514020973170577414147127204586825736721, 37422606050224430952315622246971890977771307399318013037364195362945332938381012000),
+        'cal': (9901631154241042513495552510995720929830743771847052684806403257504777943475751, 163100191368894811567175586959719158178119948082027673487845618123503409389777244000),
+        'Cal': (9901631154241042513495552510995720929830743771847052684806403257504777943475751, 163100191368894811567175586959719158178119948082027673487845618123503409389777244000),
+        'prefixed': ('J/g', 'J/kg', 'cal', 'Cal'),
+        'non_prefixed': ('prefixed',),
+    },
+    'vrc/drv': {
+        'J/kg': (2376391477017850203238932602638973023159378505243292644353536781801146706434180, 9355651512556107738078905561742972744442826849829503259341048840736333234595253),
+        'J/g': (9505565908071400812955730410555892092637514020973170577414147127204586825736721, 37422606050224430952315622246971890977771307399318013037364195362945332938381012000),
+        'cal': (9901631154241042513495552510995720929830743771847052684806403257504777943475751, 163100191368894811567175586959719158178119948082027673487845618123503409389777244000),
+        'Cal': (9901631154241042513495552510995720929830743771847052684806403257504777943475751, 163100191368894811567175586959719158178119948082027673487845618123503409389777244000),
+        'prefixed': ('J/g', 'J/kg', 'cal', 'Cal'),
+        'non_prefixed': ('prefixed',),
+    },
+    'idn': {
+        'J/K/kg': (572803194971153953556380735531252749884529375480945533080378177601193872482667423000, 136901582713644687249442127903040696704172758251656900819053972723953361948019287),
+        'prefixed': ('J/K/kg',),
+        'BTU/°R/lb': (766880633856368959352150727426104320806201020540206535392096039180656562718095927, 767384500988634379765785514679343125481710932893040795863154598469078833343947212),
+        'non_prefixed': ('prefixed', 'BTU/°R/lb'),
+    },
+    'agn/drv': {
+        'J/K/kg': (572803194971153953556380735531252749884529375480945533080378177601193872482667423000, 136901582713644687249442127903040696704172758251656900819053972723953361948019287),
+        'prefixed': ('J/K/kg',),
+        'BTU/°R/lb': (766880633856368959352150727426104320806201020540206535392096039180656562718095927, 767384500988634379765785514679343125481710932893040795863154598469078833343947212),
+        'non_prefixed': ('prefixed', 'BTU/°R/lb'),
+    },
+    'prv/drv': {
+        'J/K/kg': (572803194971153953556380735531252749884529375480945533080378177601193872482667423000, 136901582713644687249442127903040696704172758251656900819053972723953361948019287),
+        'prefixed': ('J/K/kg',),
+        'BTU/°R/lb': (766880633856368959352150727426104320806201020540206535392096039180656562718095927, 767384500988634379765785514679343125481710932893040795863154598469078833343947212),
+        'non_prefixed': ('prefixed', 'BTU/°R/lb'),
+    },
+    'kdn/gtk': {
+        'J/K/kg': (572803194971153953556380735531252749884529375480945533080378177601193872482667423000, 136901582713644687249442127903040696704172758251656900819053972723953361948019287),
+        'prefixed': ('J/K/kg',),
+        'BTU/°R/lb': (766880633856368959352150727426104320806201020540206535392096039180656562718095927, 767384500988634379765785514679343125481710932893040795863154598469078833343947212),
+        'non_prefixed': ('prefixed', 'BTU/°R/lb'),
+    },
+    'vrc/gtk/drv': {
+        'J/K/kg': (572803194971153953556380735531252749884529375480945533080378177601193872482667423000, 136901582713644687249442127903040696704172758251656900819053972723953361948019287),
+        'prefixed': ('J/K/kg',),
+        'BTU/°R/lb': (766880633856368959352150727426104320806201020540206535392096039180656562718095927, 767384500988634379765785514679343125481710932893040795863154598469078833343947212),
+        'non_prefixed': ('prefixed', 'BTU/°R/lb'),
+    },
+    'tln': {
+        'J/K/m3': (21647890966407934752697684638369340509619401945613965724882017294073842497455307, 5183199815402801780311295822072238413402307120481072154288066357381153280),
+        'prefixed': ('J/K/m3',),
+        'non_prefixed': ('prefixed',),
+    },
+    'agn/ayt': {
+        'J/K/m3': (21647890966407934752697684638369340509619401945613965724882017294073842497455307, 5183199815402801780311295822072238413402307120481072154288066357381153280),
+        'prefixed': ('J/K/m3',),
+        'non_prefixed': ('prefixed',),
+    },
+    'prv/ayt': {
+        'J/K/m3': (21647890966407934752697684638369340509619401945613965724882017294073842497455307, 5183199815402801780311295822072238413402307120481072154288066357381153280),
+        'prefixed': ('J/K/m3',),
+        'non_prefixed': ('prefixed',),
+    },
+    'vrc/gtk/ayt': {
+        'J/K/m3': (21647890966407934752697684638369340509619401945613965724882017294073842497455307, 5183199815402801780311295822072238413402307120481072154288066357381153280),
+        'prefixed': ('J/K/m3',),
+        'non_prefixed': ('prefixed',),
+    },
+    'agn/pad3': {
+        'J/K/m3': (21647890966407934752697684638369340509619401945613965724882017294073842497455307, 5183199815402801780311295822072238413402307120481072154288066357381153280),
+        'prefixed': ('J/K/m3',),
+        'non_prefixed': ('prefixed',),
+    },
+    'prv/pad3': {
+        'J/K/m3': (21647890966407934752697684638369340509619401945613965724882017294073842497455307, 5183199815402801780311295822072238413402307120481072154288066357381153280),
+        'prefixed': ('J/K/m3',),
+        'non_prefixed': ('prefixed',),
+    },
+    'vrc/gtk/pad3': {
+        'J/K/m3': (21647890966407934752697684638369340509619401945613965724882017294073842497455307, 5183199815402801780311295822072238413402307120481072154288066357381153280),
+        'prefixed': ('J/K/m3',),
+        'non_prefixed': ('prefixed',),
+    },
+    'vdt': {
+        'C': (3883537253999787463491057, 5000000000000000000000000000),
+        'Ah': (431504139333309718165673, 2000000000000000000000000000000),
+        'A·h': (431504139333309718165673, 2000000000000000000000000000000),
+        'As': (431504139333309718165673, 7200000000000000000000000000000000),
+        'A·s': (431504139333309718165673, 7200000000000000000000000000000000),
+        'e': (4847826594165262, 1),
+        'F': (120606665154137523, 1250000000000),
+        'prefixed': ('C', 'e', 'Ah', 'A·h', 'As', 'A·s', 'F'),
+        'non_prefixed': ('prefixed',),
+    },
+    'dar': {
+        'A': (943699552721948353628326851, 62500000000000000000000000000),
+        'prefixed': ('A',),
+        'non_prefixed': ('prefixed',),
+    },
+    'atr': {
+        'V': (22512530925682169381414813317230556656763708383245201397895812988281250, 3957674053391645490516344440824648412937294936165516922475073814297243),
+        'prefixed': ('V',),
+        'non_prefixed': ('prefixed',),
+    },
+    'vrd': {
+        'Ω': (94182578353, 250000000),
+        'ohm': (94182578353, 250000000),
+        'prefixed': ('Ω', 'ohm'),
+        'non_prefixed': ('prefixed',),
+    },
+    'bad': {
+        'Ω': (94182578353, 250000000),
+        'ohm': (94182578353, 250000000),
+        'prefixed': ('Ω', 'ohm'),
+        'non_prefixed': ('prefixed',),
+    },
+    'gat': {
+        'Ω': (94182578353, 250000000),
+        'ohm': (94182578353, 250000000),
+        'prefixed': ('Ω', 'ohm'),
+        'non_prefixed': ('prefixed',),
+    },
+    'vht': {
+        'S': (250000000, 94182578353),
+        'prefixed': ('S',),
+        'non_prefixed': ('prefixed',),
+    },
+    'upp': {
+        'H': (94182578353, 4860000000),
+        'prefixed': ('H',),
+        'non_prefixed': ('prefixed',),
+    },
+    'dry': {
+        'F': (42108971576807668943984890902238476658717877957157878905362412255401915557883, 308390834598385881937189223523706255572105594291030156135559082031250000000000000),
+        'prefixed': ('F',),
+        'non_prefixed': ('prefixed',),
+    },
+    'pvh': {
+        'Wb': (281406636571027117267685166465381958209546354790565017473697662353515625, 961714794974169854195471699120389564343762669488220612161442936874230049),
+        'prefixed': ('Wb',),
+        'non_prefixed': ('prefixed',),
+    },
+    'vtr': {
+        'T': (58795533961965373847908451919274318832560545752127733904817623139965891528961181600, 135054086320445618483693266666306206619343185294693788131068332924904855475669201),
+        'prefixed': ('T',),
+        'non_prefixed': ('prefixed',),
+    },
+    'mdl': {
+        'rad': (804896388672411675839233536642254858692481282514905811728764965574138547415985543124904772242281112196811487646025008712166694906664806129177479250139025004827190185529174070298356443426999594095567320351740298042678889111172, 128103238934029749836940931344534183754199669969472205791269885844699893185494577121924405294778252957991317901430263514406346645255544376848612042512085704627516186215567543824883745312734650121676450216294832384401804886016),
+        'tau_rad': (1, 1),
+        'pi_rad': (2, 1),
+        'deg': (360, 1),
+        'turn': (1, 1),
+        'gon': (400, 1),
+        'arcmin': (21600, 1),
+        'arcsec': (1296000, 1),
+        'prefixed': ('rad', 'tau_rad', 'pi_rad', 'turn', 'gon', 'arcmin', 'arcsec'),
+        'non_prefixed': ('deg', 'prefixed'),
+    },
+    'kvg': {
+        'rad/s': (13039321496493069148595583293604528710818196776741474150005992442301044468138965800, 106752699111691458197450776120445153128499724974560171492724904870583244321245481),
+        'prefixed': ('rad/s',),
+        'non_prefixed': ('prefixed',),
+    },
+    'ktv': {
+        'rad/s2': (1901133074188689481865236044207540286037293090048906931070873698087492283454661210000, 800645243337685936480880820903338648463747937309201286195436786529374332409341107),
+        'prefixed': ('rad/s2',),
+        'non_prefixed': ('prefixed',),
+    },
+    'grn': {
+        'J/rad': (151200891046849249821852042687371383498378636100280161244763395709048610313686767, 215026729197552359702584161347866628838658441614458528523818022972569229394053260000),
+        'N·m': (151200891046849249821852042687371383498378636100280161244763395709048610313686767, 215026729197552359702584161347866628838658441614458528523818022972569229394053260000),
+        'Nm': (151200891046849249821852042687371383498378636100280161244763395709048610313686767, 215026729197552359702584161347866628838658441614458528523818022972569229394053260000),
+        'prefixed': ('J/rad', 'N·m', 'Nm'),
+        'non_prefixed': ('prefixed',),
+    },
+    'kpd': {
+        'm/rad': (96010962194485196371854052521467869531737967207342143842116585046904968126042173, 23268853012767696461971536990779388133891779841396925568505311997755680528916807400),
+        'prefixed': ('m/rad',),
+        'non_prefixed': ('prefixed',),
+    },
+    'gol': {
+        'sr': (1609792777344823351678467073284509717384962565029811623457529931148277094831971086249809544484562224393622975292050017424333389813329612258354958500278050009654380371058348140596712886853999188191134640703480596085357778222344, 128103238934029749836940931344534183754199669969472205791269885844699893185494577121924405294778252957991317901430263514406346645255544376848612042512085704627516186215567543824883745312734650121676450216294832384401804886016),
+        'prefixed': ('sr', 'spat'),
+        'spat': (1, 1),
+        'deg2': (1976449972125030426055660083601384549350509193814714032208163953032512637719059190000, 47910499325738790228525805752515170160266743006839631650521724141317770679522949),
+        'non_prefixed': ('prefixed', 'deg2'),
+    },
+    'pkx': {
+        'cd': (2065404171699960752566498903109493098587852169129827002603467985385604016884961240, 442440502299104458941368423035766636293769394319205113473729324112140559025442547),
+        'prefixed': ('cd',),
+        'non_prefixed': ('prefixed',),
+    },
+    'dpk': {
+        'lm': (33248727179004642197213027031954361955308613310105147977813419335036710777047344400, 566780613801143173707903739103786534582833275553225792983776867097858734439031053),
+        'prefixed': ('lm',),
+        'non_prefixed': ('prefixed',),
+    },
+    'bam': {
+        'cd/m2': (4315340341723582139202801615342262817600321766654561715331709588541730637523238160000, 621321394881623443720131234624602692813129970042223269382965492815425035435990039),
+        'prefixed': ('cd/m2',),
+        'non_prefixed': ('prefixed',),
+    },
+    'dxt': {
+        'lm/W': (683000000, 999997),
+        'prefixed': ('lm/W',),
+        'non_prefixed': ('prefixed',),
+    },
+    'bvr': {
+        'lx': (1036836375207666325152433674534528417657150153501843623372272397831407335829147500000, 11879594493036605502519628908550767484995923176055599222339623425239118465280877),
+        'lm/m2': (1036836375207666325152433674534528417657150153501843623372272397831407335829147500000, 11879594493036605502519628908550767484995923176055599222339623425239118465280877),
+        'prefixed': ('lx', 'lm/m2'),
+        'non_prefixed': ('prefixed',),
+    },
+    'dpn': {
+        'lx': (1036836375207666325152433674534528417657150153501843623372272397831407335829147500000, 11879594493036605502519628908550767484995923176055599222339623425239118465280877),
+        'lm/m2': (1036836375207666325152433674534528417657150153501843623372272397831407335829147500000, 11879594493036605502519628908550767484995923176055599222339623425239118465280877),
+        'prefixed': ('lx', 'lm/m2'),
+        'non_prefixed': ('prefixed',),
+    },
+    'bht': {
+        'mol': (2616496870440850212956309, 150553519000000000000000),
+        'prefixed': ('mol',),
+        'non_prefixed': ('prefixed',),
+    },
+    'spn': {
+        'prefixed': (),
+        '%': (100, 1),
+        '‰': (1000, 1),
+        '‱': (10000, 1),
+        'pcm': (100000, 1),
+        'ppm': (1000000, 1),
+        'ppb': (1000000000, 1),
+        'ppt': (1000000000000, 1),
+        'ppq': (1000000000000000, 1),
+        'non_prefixed': ('prefixed', '%', '‰', '‱', 'pcm', 'ppm', 'ppb', 'ppt', 'ppq'),
+    },
+    'atk': {
+        'prefixed': ('bit', 'b', 'B'),
+        'bit': (8, 1),
+        'b': (8, 1),
+        'byte': (1, 1),
+        'B': (1, 1),
+        'non_prefixed': ('prefixed', 'byte'),
+    },
+    'pvn': {
+        'prefixed': ('bit/s', 'bps', 'bit/min', 'bpm', 'B/s', 'Bps', 'B/min', 'Bpm'),
+        'bit/s': (3888, 25),
+        'bps': (3888, 25),
+        'bit/min': (46656, 5),
+        'bpm': (46656, 5),
+        'B/s': (486, 25),
+        'Bps': (486, 25),
+        'B/min': (5832, 5),
+        'Bpm': (5832, 5),
+        'non_prefixed': ('prefixed',),
+    },
+    'clt': {
+        'km/L': (326460039944308069284, 219422651058793369140625),
+        'km/20L': (1305840159777232277136, 43884530211758673828125),
+        'US mpg': (438789498688478737456803, 125384372033596210937500000),
+        'US ml/gal': (438789498688478737456803, 125384372033596210937500000),
+        'imp mpg': (4122546452751165196364721, 980907019293229877406250000),
+        'imp ml/gal': (4122546452751165196364721, 980907019293229877406250000),
+        'L/100km': (-5485566276469834228515625, 81615009986077017321),
+        'prefixed': [],
+        'non_prefixed': ('km/L', 'km/20L', 'US mpg', 'US ml/gal', 'imp mpg', 'imp ml/gal', 'L/100km', 'prefixed'),
+    },
+    'pbt': {
+        'L/100km': (5485566276469834228515625, 81615009986077017321),
+        'km/L': (-326460039944308069284, 219422651058793369140625),
+        'km/20L': (-1305840159777232277136, 43884530211758673828125),
+        'US mpg': (-438789498688478737456803, 125384372033596210937500000),
+        'US ml/gal': (-438789498688478737456803, 125384372033596210937500000),
+        'imp mpg': (-4122546452751165196364721, 980907019293229877406250000),
+        'imp ml/gal': (-4122546452751165196364721, 980907019293229877406250000),
+        'prefixed': [],
+        'non_prefixed': ('L/100km', 'km/L', 'km/20L', 'US mpg', 'US ml/gal', 'imp mpg', 'imp ml/gal', 'prefixed'),
+    },
+}
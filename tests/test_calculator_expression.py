@@ -0,0 +1,34 @@
+
+import pytest
+
+from swixknife.calculator.calculator import SezimalCalculator
+from swixknife.calculator.expression import compile_expression
+
+
+def _calculate(expression: str, debug: bool) -> str:
+    calculator = SezimalCalculator()
+    calculator.debug = debug
+    calculator.expression = expression
+    calculator.eval_expression()
+    return calculator.expression
+
+
+@pytest.mark.parametrize('debug', (False, True))
+@pytest.mark.parametrize('expression, result', (
+    ('23 mod 4', '3'),
+    ('23mod4', '3'),
+    ('-23 mod 4', ' - 3'),
+    ('2 + 23 mod 4 * 2', '12'),
+))
+def test_mod(expression, result, debug):
+    assert _calculate(expression, debug) == result
+
+
+@pytest.mark.parametrize('prepared_expression', (
+    "__import__('os')",
+    "Sezimal('1').__class__",
+    "self.quit(Sezimal('1'))",
+))
+def test_only_the_calculator_subset_compiles(prepared_expression):
+    with pytest.raises(ValueError):
+        compile_expression(prepared_expression)
@@ -0,0 +1,88 @@
+import pytest
+numpy = pytest.importorskip('numpy')
+
+from decimal import Decimal
+from fractions import Fraction
+
+import swixknife.sezimal_array
+
+from swixknife import SezimalArray
+from swixknife.base.formatting import sezimal_format
+
+
+VALUES = (
+    0, 1, -1, 5, 6, 35, 36, 1_295, 1_296, 7_775, 7_776, 46_656, -46_656,
+    0.1, -0.1, 0.5, 2.5, 1e-05, -0.0001, 123.456, -9_876.543_21, 1e12,
+    '1_000.5', '-0.000_1',
+)
+
+
+def _without_numpy(monkeypatch, array: SezimalArray) -> SezimalArray:
+    monkeypatch.setattr(swixknife.sezimal_array, 'numpy', None)
+    return SezimalArray._from_mantissas([int(mantissa) for mantissa in array._mantissas], array._places)
+
+
+@pytest.mark.parametrize('sezimal_places', ('0', '4', '30', '50'))
+def test_decimal_to_sezimal_is_exact(sezimal_places):
+    array = SezimalArray.decimal_to_sezimal(VALUES, sezimal_places)
+
+    for mantissa, value in zip(array._mantissas, VALUES):
+        if type(value) == float:
+            value = repr(value)
+
+        assert mantissa == round(Fraction(Decimal(str(value).replace('_', ''))) * 6 ** int(sezimal_places, 6))
+
+
+@pytest.mark.parametrize('sezimal_places', ('0', '4', '30', '50'))
+def test_decimal_to_sezimal_of_ndarrays(sezimal_places):
+    generator = numpy.random.default_rng(6)
+
+    floats = numpy.concatenate((
+        generator.uniform(-10_000, 10_000, 2_000),
+        numpy.round(generator.uniform(-10_000, 10_000, 2_000), 3),
+        generator.uniform(-1, 1, 500) * 10.0 ** generator.integers(-30, 30, 500),
+        [0.0, -0.0, 0.1, 0.5, 2.5, 1e-05, 5e-324, 1e22, 1e23, 2.0 ** 53, 2.0 ** 53 + 2, 9_007_199_254_740_993.0],
+    ))
+    integers = generator.integers(-2 ** 62, 2 ** 62, 2_000)
+
+    for numbers in (floats, integers, floats.astype(numpy.float32)):
+        array = SezimalArray.decimal_to_sezimal(numbers, sezimal_places)
+
+        assert list(array._mantissas) == list(SezimalArray.decimal_to_sezimal(numbers.tolist(), sezimal_places)._mantissas)
+
+
+def test_places_are_sezimal():
+    array = SezimalArray(('1.234_5', '-0.000_1'), '3')
+
+    assert array.sezimal_places == 3
+    assert round(SezimalArray(('1.234_5', '-0.000_1'), '10'), '3')._mantissas.tolist() == array._mantissas.tolist()
+    assert SezimalArray.decimal_to_sezimal((0.5,), '10').sezimal_places == 10
+
+
+@pytest.mark.parametrize('sezimal_places', ('0', '2', '5', '30'))
+@pytest.mark.parametrize('group_separator, fraction_group_separator', (('_', '_'), ('', ''), ('.', ' ')))
+@pytest.mark.parametrize('grouping_digits', (2, 3, 4))
+@pytest.mark.parametrize('sezimal_digits', (False, True))
+def test_sezimal_format_matches_scalar(monkeypatch, sezimal_places, group_separator, fraction_group_separator, grouping_digits, sezimal_digits):
+    array = SezimalArray.decimal_to_sezimal(VALUES, '30')
+    options = dict(
+        sezimal_places=sezimal_places,
+        group_separator=group_separator,
+        fraction_group_separator=fraction_group_separator,
+        grouping_digits=grouping_digits,
+        sezimal_digits=sezimal_digits,
+    )
+
+    formatted_numbers = array.sezimal_format(**options)
+
+    assert formatted_numbers == [sezimal_format(str(number), **options) for number in array]
+    assert formatted_numbers == _without_numpy(monkeypatch, array).sezimal_format(**options)
+
+
+@pytest.mark.parametrize('sezimal_places', ('0', '5', '30', '104'))
+@pytest.mark.parametrize('decimal_places', (None, 0, 3, 17, 25))
+def test_sezimal_to_decimal_matches_without_numpy(monkeypatch, sezimal_places, decimal_places):
+    array = SezimalArray.decimal_to_sezimal(VALUES, sezimal_places)
+    decimals = [str(decimal) for decimal in array.sezimal_to_decimal(decimal_places)]
+
+    assert decimals == [str(decimal) for decimal in _without_numpy(monkeypatch, array).sezimal_to_decimal(decimal_places)]
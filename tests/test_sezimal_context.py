@@ -0,0 +1,22 @@
+import threading
+
+from decimal import Decimal, getcontext
+
+from swixknife import Sezimal
+from swixknife.base import sezimal_context
+
+
+def _in_thread(function):
+    results = []
+    thread = threading.Thread(target=lambda: results.append(function()))
+    thread.start()
+    thread.join()
+    return results[0]
+
+
+def test_decimal_precision_is_the_same_in_every_thread():
+    def quotient():
+        return Sezimal('12345.54321').decimal / Decimal(7), getcontext().prec
+
+    assert getcontext().prec == sezimal_context.decimal_precision + 1
+    assert _in_thread(quotient) == quotient()
@@ -0,0 +1,187 @@
+
+#
+# Differential tests of the Sezimal engine: the results of parsing,
+# arithmetic, rounding, formatting and precision changes are compared against
+# the ones given by the previous, digit string based engine,
+# kept in sezimal_engine_reference.json;
+# to make the reference file again, run this file directly,
+# with that engine in the path:
+#
+#   PYTHONPATH=<old tree> python tests/test_sezimal_engine.py
+#
+import json
+import pathlib
+import re
+import sys
+
+import pytest
+
+from swixknife import Sezimal
+from swixknife.base import sezimal_context, sezimal_format, decimal_format
+
+
+REFERENCE_FILE = pathlib.Path(__file__).parent.joinpath('sezimal_engine_reference.json')
+
+OPERANDS = (
+    '0', '1', '-1', '5', '10', '-14', '0.1', '0.3', '-0.05',
+    '2.5', '-3.14', '55.55', '1_000', '-123.45', '0.01',
+    '12_345.012_345', '-5_555_555.5', '100_000_000_000', '0.555_555_555_555',
+    '3.050_330_051', '-0.002_1', '21_212.3',
+)
+
+#
+# Recurring digits, as decimal_to_sezimal returns them, among others
+#
+PARSED = (
+    '0.1..23', '-12.3..4', '5.5..5', '0.00', '-1_000.000_10', '+3.2',
+)
+
+PRECISIONS = ('0', '1', '2', '5', '12')
+
+CONTEXT_PRECISIONS = ('10', '20', '50', '144')
+
+OPERATIONS = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b,
+    '/': lambda a, b: a / b,
+}
+
+
+def _operation_cases():
+    for a in OPERANDS:
+        for b in OPERANDS:
+            for operation in OPERATIONS:
+                if operation == '/' and Sezimal(b) == 0:
+                    continue
+
+                yield f'{a} {operation} {b}', a, operation, b
+
+
+NEGATIVE_ZERO = re.compile(r'^-[0.]+$')
+
+
+def _expected(reference_value: str, negative: bool = False) -> str:
+    #
+    # The two ways the new engine knowingly differs from the old one:
+    # it makes no negative zeros, where the old one gave -0 for 0 / -1,
+    # or for -0.01 truncated to 0; and it keeps the sign of
+    # the results whose trailing fives are cleaned up,
+    # -1 * 0.555_555_555_555 being -1.000000000000, not 1.000000000000
+    #
+    if NEGATIVE_ZERO.match(reference_value):
+        return reference_value[1:]
+
+    if negative and not reference_value.startswith('-'):
+        return '-' + reference_value
+
+    return reference_value
+
+
+def _operation(a: str, operation: str, b: str) -> str:
+    return str(OPERATIONS[operation](Sezimal(a), Sezimal(b)))
+
+
+def _parsing(number: str) -> list[str]:
+    number = Sezimal(number)
+    return [str(number), str(number + Sezimal('1')), str(number * Sezimal('2'))]
+
+
+def _rounding(number: str, precision: str) -> list[str]:
+    return [
+        str(round(Sezimal(number), int(precision))),
+        str(Sezimal(number).trunc(int(precision))),
+    ]
+
+
+def _formatting(number: str) -> list[str]:
+    number = Sezimal(number)
+
+    return [
+        str(number),
+        number.formatted_number,
+        sezimal_format(number, sezimal_places=4),
+        sezimal_format(number, sezimal_places=0, sezimal_separator=',', group_separator='.'),
+        decimal_format(number.decimal, decimal_places=6),
+    ]
+
+
+def _context_precision(precision: str) -> list[str]:
+    regular_precision = sezimal_context.sezimal_precision
+
+    try:
+        sezimal_context.sezimal_precision = precision
+
+        return [
+            str(Sezimal('1') / Sezimal('5')),
+            str(Sezimal('2') / Sezimal('11')),
+            str(Sezimal('-12_345.012_345') / Sezimal('0.3')),
+            str(Sezimal('0.555_555_555_555') * Sezimal('3.050_330_051')),
+            str(round(Sezimal('1') / Sezimal('5'))),
+        ]
+
+    finally:
+        sezimal_context.sezimal_precision = regular_precision
+
+
+def _results() -> dict:
+    return {
+        'operations': {
+            case: _operation(a, operation, b)
+            for case, a, operation, b in _operation_cases()
+        },
+        'parsing': {
+            number: _parsing(number)
+            for number in PARSED
+        },
+        'rounding': {
+            f'{number} {precision}': _rounding(number, precision)
+            for number in OPERANDS
+            for precision in PRECISIONS
+        },
+        'formatting': {
+            number: _formatting(number)
+            for number in OPERANDS
+        },
+        'context_precision': {
+            precision: _context_precision(precision)
+            for precision in CONTEXT_PRECISIONS
+        },
+    }
+
+
+@pytest.fixture(scope='module')
+def reference() -> dict:
+    return json.loads(REFERENCE_FILE.read_text())
+
+
+@pytest.mark.parametrize('case, a, operation, b', list(_operation_cases()))
+def test_operation(reference, case, a, operation, b):
+    negative = operation in ('*', '/') and a.startswith('-') != b.startswith('-')
+    assert _operation(a, operation, b) == _expected(reference['operations'][case], negative)
+
+
+@pytest.mark.parametrize('number', PARSED)
+def test_parsing(reference, number):
+    assert _parsing(number) == reference['parsing'][number]
+
+
+@pytest.mark.parametrize('number', OPERANDS)
+@pytest.mark.parametrize('precision', PRECISIONS)
+def test_rounding(reference, number, precision):
+    assert _rounding(number, precision) == [_expected(value) for value in reference['rounding'][f'{number} {precision}']]
+
+
+@pytest.mark.parametrize('number', OPERANDS)
+def test_formatting(reference, number):
+    assert _formatting(number) == reference['formatting'][number]
+
+
+@pytest.mark.parametrize('precision', CONTEXT_PRECISIONS)
+def test_context_precision(reference, precision):
+    assert _context_precision(precision) == reference['context_precision'][precision]
+
+
+if __name__ == '__main__':
+    json.dump(_results(), sys.stdout, ensure_ascii=False, indent=1, sort_keys=True)
+    sys.stdout.write('\n')
@@ -0,0 +1,61 @@
+import pytest
+
+from swixknife import SezimalInteger, Sezimal
+from swixknife.date_time import SezimalDate, SezimalDateTime
+from swixknife.date_time.sun_moon_store import SunMoonStore, SunMoonCache
+
+
+#
+# 0 CE and 10368 CE, out of the range of datetime,
+# and, for the second one, the days key too large
+# for an sqlite integer
+#
+YEARS = ('200000', '320000')
+
+
+def _year_days(year: str) -> tuple[Sezimal, Sezimal]:
+    start = SezimalDate(SezimalInteger(year), 1, 1)
+    end = SezimalDate(SezimalInteger(year) + 1, 1, 1)
+    return start.as_days, end.as_days - Sezimal('0.000_001')
+
+
+@pytest.mark.parametrize('year', YEARS)
+def test_years_out_of_datetime_range(tmp_path, year):
+    start, end = _year_days(year)
+    events = SunMoonStore(cache_name=tmp_path / 'sun_moon_cache.db').events(start, end)
+
+    assert len([name for sun_moon, name, days in events if sun_moon == 'sun']) == 8
+    assert len([name for sun_moon, name, days in events if sun_moon == 'moon']) > 90
+
+    for sun_moon, name, days in events:
+        assert SezimalDateTime.from_days(Sezimal(days), 'UTC').year == SezimalInteger(year)
+
+    #
+    # A new store reads the year back from the cache
+    #
+    cached_events = SunMoonStore(cache_name=tmp_path / 'sun_moon_cache.db').events(start, end)
+
+    assert cached_events == events
+
+
+def test_cache_failures_are_not_fatal(tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OverflowError('Python int too large to convert to SQLite INTEGER')
+
+    monkeypatch.setattr(SunMoonCache, 'write', fail)
+
+    start, end = _year_days(YEARS[1])
+
+    assert SunMoonStore(cache_name=tmp_path / 'sun_moon_cache.db').events(start, end)
+
+
+@pytest.mark.parametrize('year', ('213212', YEARS[1]))
+def test_latest_at_the_start_of_a_year(tmp_path, year):
+    start, end = _year_days(year)
+    store = SunMoonStore(cache_name=tmp_path / 'sun_moon_cache.db')
+
+    for event in ('december_solstice', 'november_cross_quarter', 'september_equinox'):
+        sun_moon, name, days = store.latest(start, event=event)
+
+        assert name == event
+        assert Sezimal(days) < start